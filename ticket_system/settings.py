@@ -71,12 +71,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
-                'tickets.context_processors.system_config',
-                'tickets.context_processors.time_status',
-                'tickets.context_processors.blog_categories',
-                'tickets.context_processors.crm_counters',
-                'tickets.context_processors.active_chatbot',
-                'tickets.context_processors.cart_context',
+                'tickets.context_processors.global_context',
             ],
         },
     },
@@ -212,6 +207,74 @@ LOGGING = {
     },
 }
 
+# Caché (tickets/page_cache.py, tickets/crm_analytics.py, búsqueda...)
+# Con CACHE_REDIS_URL se usa Redis, compartido por todos los procesos de gunicorn;
+# sin él, cada proceso tiene su propia caché en memoria y las invalidaciones
+# solo alcanzan al proceso que guarda el objeto
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL', '')
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+            'KEY_PREFIX': 'ticketproo',
+            'TIMEOUT': 300,
+        },
+        # Sesiones en su propio espacio: vaciar la caché de páginas no cierra sesiones
+        'sessions': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+            'KEY_PREFIX': 'ticketproo-sessions',
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'ticketproo',
+            'TIMEOUT': 300,
+            'OPTIONS': {'MAX_ENTRIES': 5000},
+        }
+    }
+
+# Sesiones
+# SESSION_BACKEND=cached_db (por defecto con Redis): se leen de Redis y se escriben también
+# en la base de datos, que sirve de respaldo si Redis se vacía o cae.
+# SESSION_BACKEND=cache: solo Redis. SESSION_BACKEND=db (por defecto sin Redis): solo la base
+# de datos; una caché en memoria por proceso serviría sesiones desactualizadas entre workers.
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'cached_db' if CACHE_REDIS_URL else 'db')
+SESSION_ENGINE = f'django.contrib.sessions.backends.{SESSION_BACKEND}'
+SESSION_CACHE_ALIAS = 'sessions' if CACHE_REDIS_URL else 'default'
+
+# Contadores de los menús de navegación (tickets/nav_counters.py), en segundos
+NAV_COUNTERS_CACHE_TTL = 60
+
+# Estadísticas por clase de los cursos (tickets/course_stats.py), en segundos
+COURSE_STATS_CACHE_TTL = 300
+
+# Estadísticas de URLs cortas y chatbots leídas de sus agregados (tickets/activity_rollup.py), en segundos
+ACTIVITY_STATS_CACHE_TTL = 60
+
+# Cotizaciones del ticker financiero (tickets/financial_api.py)
+MARKET_DATA_MAX_WORKERS = 8   # peticiones simultáneas como máximo entre todos los proveedores
+MARKET_DATA_QUOTE_TTL = 60    # segundos que se reutiliza una cotización obtenida
+
+# Seguimiento de los contadores web (tickets/web_counter_ingest.py)
+WEB_COUNTER_SESSION_TIMEOUT = 30 * 60   # segundos sin páginas vistas tras los que empieza una visita nueva
+WEB_COUNTER_TOKEN_CACHE_TTL = 300       # segundos que se reutiliza el contador de un token
+WEB_COUNTER_FLUSH_INTERVAL = int(os.environ.get('WEB_COUNTER_FLUSH_INTERVAL', '2'))  # 0: guardar en la petición
+WEB_COUNTER_BATCH_SIZE = 200            # visitas en cola que fuerzan un guardado
+
+# Rastreador web (tickets/web_tracker_utils.py)
+WEB_TRACKER_MAX_WORKERS = 8       # objetivos que se rastrean a la vez
+WEB_TRACKER_DNS_CACHE_TTL = 300   # segundos que se reutilizan los registros DNS de un dominio
+WEB_TRACKER_SSL_CACHE_TTL = 3600  # segundos que se reutiliza un certificado SSL válido
+
+# Páginas públicas (portada, blog, landing pages, sitemap) para visitantes anónimos
+PUBLIC_PAGE_CACHE_TIMEOUT = int(os.environ.get('PUBLIC_PAGE_CACHE_TIMEOUT', '300'))  # 0 = sin caché
+# Fragmentos pesados de la portada (alcances, blog, catálogos)
+PUBLIC_FRAGMENT_CACHE_TIMEOUT = int(os.environ.get('PUBLIC_FRAGMENT_CACHE_TIMEOUT', '900'))
+
 # Configuración de Celery
 CELERY_BROKER_URL = 'redis://localhost:6379'
 CELERY_RESULT_BACKEND = 'redis://localhost:6379'
@@ -241,6 +304,36 @@ DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', EMAIL_HOST_USER)
 if DEBUG and not EMAIL_HOST_USER:
     EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
+# Cola de notificaciones (tickets/notification_utils.py)
+# Con True cada proceso web envía sus notificaciones en un hilo propio; con False
+# se envían desde el comando `python manage.py dispatch_notifications`
+NOTIFICATION_INLINE_DISPATCH = os.environ.get('NOTIFICATION_INLINE_DISPATCH', 'True').lower() == 'true'
+# Segundos que se esperan para agrupar ráfagas de mensajes al mismo chat de Telegram
+NOTIFICATION_COALESCE_SECONDS = int(os.environ.get('NOTIFICATION_COALESCE_SECONDS', '2'))
+
+# Entrega de archivos subidos (tickets/media_delivery.py)
+# 'django' los envía el propio proceso (con Range y ETag); 'x-accel-redirect' los envía
+# nginx desde MEDIA_ACCEL_REDIRECT_PREFIX (location interna) y 'x-sendfile' Apache
+MEDIA_DELIVERY_MODE = os.environ.get('MEDIA_DELIVERY_MODE', 'django')
+MEDIA_ACCEL_REDIRECT_PREFIX = os.environ.get('MEDIA_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+
+# Generación de PDF (tickets/pdf_service.py)
+# Los PDF se guardan en MEDIA_ROOT/pdf_cache/ por hash de contenido; se purgan con
+# `python manage.py purge_pdf_cache`
+PDF_CACHE_ENABLED = os.environ.get('PDF_CACHE_ENABLED', 'True').lower() == 'true'
+# Exportaciones de más tickets que este límite se generan en segundo plano
+PDF_EXPORT_SYNC_LIMIT = int(os.environ.get('PDF_EXPORT_SYNC_LIMIT', '50'))
+# Con True cada proceso web genera sus exportaciones en un hilo propio; con False
+# las genera el comando `python manage.py run_pdf_exports`
+PDF_EXPORT_INLINE = os.environ.get('PDF_EXPORT_INLINE', 'True').lower() == 'true'
+
+# Mensajes de los chatbots (tickets/chatbot_pipeline.py): geolocalización, datos del
+# usuario y respuestas de la IA en segundo plano. Con True cada proceso web los procesa
+# en un hilo propio; con False los procesa `python manage.py run_chatbot_pipeline`
+CHATBOT_PIPELINE_INLINE = os.environ.get('CHATBOT_PIPELINE_INLINE', 'True').lower() == 'true'
+CHATBOT_PIPELINE_WORKERS = int(os.environ.get('CHATBOT_PIPELINE_WORKERS', '4'))  # mensajes a la vez
+CHATBOT_GEO_CACHE_TTL = 24 * 3600  # segundos que se reutiliza la geolocalización de una IP
+
 # Configuración del dominio del sitio para URLs absolutas
 SITE_DOMAIN = os.environ.get('SITE_DOMAIN', 'ticketproo.com')
 
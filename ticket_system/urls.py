@@ -21,13 +21,16 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib.sitemaps.views import sitemap
 from tickets.sitemaps import sitemaps
-from tickets.views import CustomLoginView
+from tickets.lazy_views import lazy_views
+from tickets.page_cache import cache_public_page
+
+tickets_views = lazy_views('tickets.views')
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('tickets.urls')),
-    path('login/', CustomLoginView.as_view(), name='login'),
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
+    path('login/', tickets_views.CustomLoginView.as_view(), name='login'),
+    path('sitemap.xml', cache_public_page('sitemap')(sitemap), {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
 ]
 
 # Servir archivos media en desarrollo
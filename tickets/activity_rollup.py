@@ -0,0 +1,292 @@
+"""
+Agregados de los clics de URLs cortas y de la actividad de los chatbots.
+
+Al guardar un ``ShortUrlClick`` se suma a:
+
+- ``ShortUrlClickRollup``: clics por día y hora (gráficos por día, mes,
+  hora del día y el de actividad de un año);
+- ``ShortUrlClickBreakdown``: clics por día, país, ciudad y dominio de
+  referencia;
+- ``ShortUrlClickSketch``: boceto HyperLogLog de las IPs del día (IPs únicas
+  sin recorrer los clics, ver ``visit_rollup.HyperLogLog``).
+
+Las conversaciones, mensajes y clicks de un chatbot se suman a
+``ChatbotActivityRollup`` por día y hora.
+
+Las estadísticas leen estas tablas y se guardan en la caché durante
+``ACTIVITY_STATS_CACHE_TTL`` segundos. Los agregados conservan el histórico
+aunque se borren los clics o las conversaciones. Para (re)construirlos:
+``python manage.py rebuild_activity_rollups``.
+"""
+import logging
+from collections import Counter, defaultdict
+from datetime import timedelta
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import ExtractHour, TruncDate
+from django.utils import timezone
+
+from .models import (
+    ChatbotActivityRollup, ChatbotClick, ChatbotConversation, ChatbotMessage,
+    ShortUrlClick, ShortUrlClickBreakdown, ShortUrlClickRollup, ShortUrlClickSketch,
+)
+from .visit_rollup import HyperLogLog
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = getattr(settings, 'ACTIVITY_STATS_CACHE_TTL', 60)
+
+DOMAIN_MAX_LENGTH = ShortUrlClickBreakdown._meta.get_field('referrer_domain').max_length
+
+
+def _bucket(moment):
+    local = timezone.localtime(moment)
+    return local.date(), local.hour
+
+
+def referrer_domain(url):
+    """Dominio (sin ``www.``) de la URL de referencia, o ``''``"""
+    try:
+        host = (urlparse(url or '').hostname or '').lower()
+    except ValueError:
+        return ''
+    return host[4:] if host.startswith('www.') else host
+
+
+def _add(model, key, **deltas):
+    """Suma ``deltas`` a la fila ``key`` (creándola si no existe)"""
+    updates = {field: F(field) + delta for field, delta in deltas.items()}
+    rows = model.objects.filter(**key)
+    if not rows.update(**updates):
+        model.objects.get_or_create(**key)
+        rows.update(**updates)
+
+
+# ------------------------------------------------------------- URLs cortas
+
+def record_short_url_click(click):
+    """Suma el clic a los agregados de su URL corta"""
+    day, hour = _bucket(click.clicked_at)
+    _add(ShortUrlClickRollup, {'short_url_id': click.short_url_id, 'day': day, 'hour': hour}, clicks=1)
+    _add(
+        ShortUrlClickBreakdown,
+        {
+            'short_url_id': click.short_url_id,
+            'day': day,
+            'country': click.country or '',
+            'city': click.city or '',
+            'referrer_domain': referrer_domain(click.referer)[:DOMAIN_MAX_LENGTH],
+        },
+        clicks=1,
+    )
+    if click.ip_address:
+        sketch_row, _ = ShortUrlClickSketch.objects.select_for_update().get_or_create(
+            short_url_id=click.short_url_id, day=day,
+        )
+        sketch = HyperLogLog.from_bytes(sketch_row.ip_sketch)
+        if sketch.add(click.ip_address):
+            sketch_row.ip_sketch = sketch.to_bytes()
+            sketch_row.save(update_fields=['ip_sketch'])
+
+
+def rebuild_short_url(short_url, batch_size=2000):
+    """
+    Recalcula los agregados de la URL corta a partir de sus clics. Los
+    recuentos se agrupan en la base de datos; solo las IPs se leen fila a
+    fila para los bocetos. Devuelve el número de clics.
+    """
+    clicks = ShortUrlClick.objects.filter(short_url=short_url).order_by()
+    hourly = (
+        clicks.annotate(day=TruncDate('clicked_at'), hour=ExtractHour('clicked_at'))
+        .values_list('day', 'hour').annotate(total=Count('pk'))
+    )
+    breakdowns = Counter()
+    grouped = (
+        clicks.annotate(day=TruncDate('clicked_at'))
+        .values_list('day', 'country', 'city', 'referer').annotate(total=Count('pk'))
+    )
+    for day, country, city, referer, total in grouped:
+        breakdowns[(day, country or '', city or '', referrer_domain(referer)[:DOMAIN_MAX_LENGTH])] += total
+    sketches = defaultdict(HyperLogLog)
+    ip_rows = clicks.exclude(ip_address=None).values_list('clicked_at', 'ip_address')
+    for clicked_at, ip_address in ip_rows.iterator(chunk_size=batch_size):
+        sketches[_bucket(clicked_at)[0]].add(ip_address)
+
+    ShortUrlClickRollup.objects.filter(short_url=short_url).delete()
+    ShortUrlClickBreakdown.objects.filter(short_url=short_url).delete()
+    ShortUrlClickSketch.objects.filter(short_url=short_url).delete()
+    rollups = [ShortUrlClickRollup(short_url=short_url, day=day, hour=hour, clicks=total) for day, hour, total in hourly]
+    ShortUrlClickRollup.objects.bulk_create(rollups, batch_size=1000)
+    ShortUrlClickBreakdown.objects.bulk_create(
+        [
+            ShortUrlClickBreakdown(
+                short_url=short_url, day=day, country=country, city=city,
+                referrer_domain=domain, clicks=total,
+            )
+            for (day, country, city, domain), total in breakdowns.items()
+        ],
+        batch_size=1000,
+    )
+    ShortUrlClickSketch.objects.bulk_create(
+        [ShortUrlClickSketch(short_url=short_url, day=day, ip_sketch=sketch.to_bytes()) for day, sketch in sketches.items()],
+        batch_size=1000,
+    )
+    cache.delete(_short_url_key(short_url.pk))
+    return sum(rollup.clicks for rollup in rollups)
+
+
+def _short_url_key(short_url_id):
+    return f'short_url_stats:{short_url_id}'
+
+
+def short_url_summary(short_url):
+    """
+    Estadísticas agregadas de la URL corta (en caché ``CACHE_TTL`` segundos):
+    ``by_day`` (``{día: clics}``), ``by_hour`` (``{hora: clics}``),
+    ``countries``, ``cities`` y ``referrers`` (los 10 primeros),
+    ``recorded_clicks`` (clics con registro detallado), ``unique_countries``
+    y ``unique_ips`` (estimación).
+    """
+    key = _short_url_key(short_url.pk)
+    summary = cache.get(key)
+    if summary is not None:
+        return summary
+
+    rollups = short_url.click_rollups.order_by()
+    by_day = dict(rollups.values_list('day').annotate(total=Sum('clicks')))
+    by_hour = dict(rollups.values_list('hour').annotate(total=Sum('clicks')))
+    breakdowns = short_url.click_breakdowns.all()
+    countries = list(
+        breakdowns.exclude(country='').values('country').annotate(count=Sum('clicks')).order_by('-count', 'country')
+    )
+    cities = list(
+        breakdowns.exclude(city='').values('city', 'country').annotate(count=Sum('clicks'))
+        .order_by('-count', 'city')[:10]
+    )
+    referrers = list(
+        breakdowns.exclude(referrer_domain='').values('referrer_domain').annotate(count=Sum('clicks'))
+        .order_by('-count', 'referrer_domain')[:10]
+    )
+    unique_ips = HyperLogLog()
+    for data in short_url.click_sketches.values_list('ip_sketch', flat=True):
+        unique_ips.merge_bytes(data)
+
+    summary = {
+        'by_day': by_day,
+        'by_hour': by_hour,
+        'countries': countries[:10],
+        'cities': cities,
+        'referrers': referrers,
+        'recorded_clicks': sum(by_day.values()),
+        'unique_countries': len(countries),
+        'unique_ips': unique_ips.count(),
+    }
+    cache.set(key, summary, CACHE_TTL)
+    return summary
+
+
+def clicks_today(short_url_ids):
+    """``{id: clics de hoy}`` de las URLs cortas, en una consulta"""
+    return dict(
+        ShortUrlClickRollup.objects.filter(short_url_id__in=short_url_ids, day=timezone.localdate())
+        .values_list('short_url_id').annotate(total=Sum('clicks')).order_by()
+    )
+
+
+# ---------------------------------------------------------------- chatbots
+
+def record_chatbot_activity(chatbot_id, moment, **deltas):
+    """Suma ``deltas`` (``conversations``, ``messages``, ``clicks``) a la hora de ``moment``"""
+    day, hour = _bucket(moment)
+    _add(ChatbotActivityRollup, {'chatbot_id': chatbot_id, 'day': day, 'hour': hour}, **deltas)
+
+
+def rebuild_chatbot(chatbot):
+    """Recalcula la actividad por hora del chatbot. Devuelve el número de filas"""
+    rows = defaultdict(Counter)
+    sources = [
+        ('conversations', ChatbotConversation.objects.filter(chatbot=chatbot), 'started_at'),
+        ('messages', ChatbotMessage.objects.filter(conversation__chatbot=chatbot), 'timestamp'),
+        ('clicks', ChatbotClick.objects.filter(chatbot=chatbot), 'clicked_at'),
+    ]
+    for field, queryset, date_field in sources:
+        grouped = (
+            queryset.order_by().annotate(day=TruncDate(date_field), hour=ExtractHour(date_field))
+            .values_list('day', 'hour').annotate(total=Count('pk'))
+        )
+        for day, hour, total in grouped:
+            rows[(day, hour)][field] += total
+
+    ChatbotActivityRollup.objects.filter(chatbot=chatbot).delete()
+    ChatbotActivityRollup.objects.bulk_create(
+        [ChatbotActivityRollup(chatbot=chatbot, day=day, hour=hour, **totals) for (day, hour), totals in rows.items()],
+        batch_size=1000,
+    )
+    cache.delete(_chatbot_key(chatbot.pk))
+    return len(rows)
+
+
+def _chatbot_key(chatbot_id):
+    return f'chatbot_stats:{chatbot_id}'
+
+
+def chatbot_daily_activity(chatbot, days=30):
+    """
+    ``[(día, conversaciones, mensajes, clicks)]`` de los últimos ``days``
+    días, hoy incluido (en caché ``CACHE_TTL`` segundos).
+    """
+    key = _chatbot_key(chatbot.pk)
+    cached = cache.get(key)
+    if cached is not None and len(cached) == days and cached[-1][0] == timezone.localdate():
+        return cached
+
+    end_date = timezone.localdate()
+    start_date = end_date - timedelta(days=days - 1)
+    per_day = {
+        row['day']: row
+        for row in chatbot.activity_rollups.filter(day__gte=start_date, day__lte=end_date)
+        .values('day').annotate(
+            total_conversations=Sum('conversations'),
+            total_messages=Sum('messages'),
+            total_clicks=Sum('clicks'),
+        ).order_by()
+    }
+    activity = []
+    for i in range(days):
+        day = start_date + timedelta(days=i)
+        row = per_day.get(day, {})
+        activity.append((
+            day,
+            row.get('total_conversations', 0),
+            row.get('total_messages', 0),
+            row.get('total_clicks', 0),
+        ))
+    cache.set(key, activity, CACHE_TTL)
+    return activity
+
+
+# ------------------------------------------------------------------ señales
+
+def handle_save(instance):
+    """
+    Receptor de ``post_save`` (solo altas) de ``ShortUrlClick``,
+    ``ChatbotConversation``, ``ChatbotMessage`` y ``ChatbotClick``. Un fallo
+    de los agregados no debe impedir registrar el clic o el mensaje, por eso
+    se aísla en un savepoint y solo se registra el error.
+    """
+    try:
+        with transaction.atomic():
+            if isinstance(instance, ShortUrlClick):
+                record_short_url_click(instance)
+            elif isinstance(instance, ChatbotConversation):
+                record_chatbot_activity(instance.chatbot_id, instance.started_at, conversations=1)
+            elif isinstance(instance, ChatbotMessage):
+                record_chatbot_activity(instance.conversation.chatbot_id, instance.timestamp, messages=1)
+            elif isinstance(instance, ChatbotClick):
+                record_chatbot_activity(instance.chatbot_id, instance.clicked_at, clicks=1)
+    except DatabaseError as e:
+        logger.error(f'Error al agregar {instance.__class__.__name__} {instance.pk}: {e}')
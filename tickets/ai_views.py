@@ -0,0 +1,5499 @@
+"""
+Vistas de herramientas de IA: chat, generadores, tutores y gerentes IA.
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib.auth.models import User
+from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db.models import Q, Sum
+from django.db import models
+from django.http import HttpResponse, JsonResponse
+from .models import (
+    Ticket, Company, SystemConfiguration, Contact, AIChatSession, AIChatMessage,
+    PublicAIMessageShare, ImagePrompt, AIManager, AIManagerMeeting, AIManagerSummary,
+    CompanyAISummary, UserAIPerformanceEvaluation, AITutor, AITutorProgressReport, QuoteGenerator,
+)
+from .forms import (
+    AIChatSessionForm, AIChatMessageForm, AITutorForm, AITutorProgressReportForm,
+    AITutorAttachmentForm, QuoteGeneratorForm,
+)
+from .utils import is_agent
+import importlib.util
+
+
+# OpenAI se importa dentro de cada vista; aquí solo se comprueba si está instalado
+OPENAI_AVAILABLE = importlib.util.find_spec('openai') is not None
+
+
+# ===========================================
+# VISTAS PARA CHAT CON IA
+# ===========================================
+
+@login_required
+def get_or_create_user_chat_session(request):
+    """Obtiene o crea la sesión persistente de chat para el usuario"""
+    config = SystemConfiguration.get_config()
+    
+    # Verificar si el chat IA está habilitado
+    if not config.ai_chat_enabled or not config.openai_api_key:
+        return JsonResponse({'error': 'Chat IA no disponible'}, status=400)
+    
+    # Buscar sesión persistente del usuario o crearla
+    session, created = AIChatSession.objects.get_or_create(
+        user=request.user,
+        title='Chat Persistente',
+        is_active=True,
+        defaults={
+            'ai_model': config.openai_model or 'gpt-4o-mini'
+        }
+    )
+    
+    # Si no es nueva, verificar que sea la única sesión persistente activa
+    if not created:
+        # Actualizar fecha de última actualización
+        session.save()
+    
+    # Retornar el ID de la sesión
+    return JsonResponse({
+        'session_id': session.id,
+        'created': created
+    })
+
+@login_required
+def ai_chat_list_view(request):
+    """Vista principal del chat con IA - lista de sesiones"""
+    config = SystemConfiguration.get_config()
+    
+    # Verificar si el chat IA está habilitado
+    if not config.ai_chat_enabled:
+        messages.warning(request, 'El chat con IA no está habilitado en el sistema.')
+        return redirect('dashboard')
+    
+    # Verificar si hay API key configurada
+    if not config.openai_api_key:
+        messages.warning(request, 'El chat con IA no está configurado. Contacta al administrador.')
+        return redirect('dashboard')
+    
+    # Obtener sesiones del usuario
+    sessions = AIChatSession.objects.filter(user=request.user, is_active=True)
+    
+    # Formulario para nueva sesión
+    if request.method == 'POST':
+        form = AIChatSessionForm(request.POST)
+        if form.is_valid():
+            session = form.save(commit=False)
+            session.user = request.user
+            session.save()
+            messages.success(request, f'Nueva conversación creada: {session.title}')
+            return redirect('ai_chat_live', session_id=session.id)
+    else:
+        form = AIChatSessionForm(initial={'ai_model': config.openai_model})
+    
+    context = {
+        'sessions': sessions,
+        'form': form,
+        'config': config,
+    }
+    
+    return render(request, 'tickets/ai_chat_list.html', context)
+
+
+@login_required
+def ai_chat_session_view(request, session_id):
+    """Vista para una sesión específica de chat con IA"""
+    config = SystemConfiguration.get_config()
+    
+    # Verificar si el chat IA está habilitado
+    if not config.ai_chat_enabled or not config.openai_api_key:
+        messages.warning(request, 'El chat con IA no está disponible.')
+        return redirect('dashboard')
+    
+    # Obtener la sesión
+    session = get_object_or_404(AIChatSession, id=session_id, user=request.user, is_active=True)
+    
+    # Obtener mensajes de la sesión
+    messages_list = session.messages.all()
+    
+    # Formulario para nuevo mensaje
+    if request.method == 'POST':
+        print(f"DEBUG: POST recibido para sesión {session_id}")
+        print(f"DEBUG: request.POST completo: {dict(request.POST)}")
+        print(f"DEBUG: request.POST.get('message'): '{request.POST.get('message', 'NO_ENCONTRADO')}'")
+        print(f"DEBUG: Content-Type: {request.content_type}")
+        print(f"DEBUG: POST keys: {list(request.POST.keys())}")
+        
+        form = AIChatMessageForm(request.POST)
+        print(f"DEBUG: Formulario creado con datos: {form.data}")
+        print(f"DEBUG: Formulario es válido: {form.is_valid()}")
+        
+        if form.is_valid():
+            user_message = form.cleaned_data['message']
+            print(f"DEBUG: Mensaje del usuario: {user_message}")
+            
+            # Guardar mensaje del usuario
+            user_msg = AIChatMessage.objects.create(
+                session=session,
+                role='user',
+                content=user_message
+            )
+            print(f"DEBUG: Mensaje del usuario guardado con ID: {user_msg.id}")
+            
+            # Llamar a la API de OpenAI
+            try:
+                print("DEBUG: Llamando a OpenAI API...")
+                ai_response = call_openai_api(session, user_message)
+                print(f"DEBUG: Respuesta de OpenAI recibida: {ai_response['content'][:50]}...")
+                
+                # Guardar respuesta de la IA
+                ai_msg = AIChatMessage.objects.create(
+                    session=session,
+                    role='assistant',
+                    content=ai_response['content'],
+                    tokens_used=ai_response.get('tokens_used', 0)
+                )
+                print(f"DEBUG: Respuesta de IA guardada con ID: {ai_msg.id}")
+                
+                messages.success(request, 'Mensaje enviado correctamente.')
+                
+            except Exception as e:
+                print(f"DEBUG: Error en OpenAI API: {str(e)}")
+                messages.error(request, f'Error al comunicarse con la IA: {str(e)}')
+            
+            return redirect('ai_chat_session', session_id=session.id)
+        else:
+            print(f"DEBUG: Formulario no válido. Errores: {form.errors}")
+            print(f"DEBUG: Errores por campo: {dict(form.errors)}")
+            for field, errors in form.errors.items():
+                print(f"DEBUG: Campo '{field}': {errors}")
+    else:
+        form = AIChatMessageForm()
+    
+    context = {
+        'session': session,
+        'messages_list': messages_list,
+        'form': form,
+        'config': config,
+    }
+    
+    return render(request, 'tickets/ai_chat_session.html', context)
+
+
+@login_required
+def ai_chat_delete_session_view(request, session_id):
+    """Vista para eliminar una sesión de chat"""
+    session = get_object_or_404(AIChatSession, id=session_id, user=request.user)
+    
+    if request.method == 'POST':
+        session.is_active = False
+        session.save()
+        messages.success(request, f'Conversación "{session.title}" eliminada.')
+        return redirect('ai_chat_list')
+    
+    context = {
+        'session': session,
+    }
+    
+    return render(request, 'tickets/ai_chat_delete_session.html', context)
+
+
+@login_required
+def ai_chat_debug_view(request, session_id):
+    """Vista de debug para chat IA"""
+    config = SystemConfiguration.get_config()
+    
+    # Obtener la sesión
+    session = get_object_or_404(AIChatSession, id=session_id, user=request.user, is_active=True)
+    
+    # Obtener mensajes de la sesión
+    messages_list = session.messages.all()
+    
+    # Formulario para nuevo mensaje
+    if request.method == 'POST':
+        print(f"DEBUG: POST recibido para sesión {session_id}")
+        print(f"DEBUG: Datos POST: {request.POST}")
+        
+        form = AIChatMessageForm(request.POST)
+        if form.is_valid():
+            user_message = form.cleaned_data['message']
+            print(f"DEBUG: Mensaje del usuario: {user_message}")
+            
+            # Guardar mensaje del usuario
+            user_msg = AIChatMessage.objects.create(
+                session=session,
+                role='user',
+                content=user_message
+            )
+            print(f"DEBUG: Mensaje del usuario guardado con ID: {user_msg.id}")
+            
+            # Llamar a la API de OpenAI
+            try:
+                print("DEBUG: Llamando a OpenAI API...")
+                ai_response = call_openai_api(session, user_message)
+                print(f"DEBUG: Respuesta de OpenAI recibida: {ai_response['content'][:50]}...")
+                
+                # Guardar respuesta de la IA
+                ai_msg = AIChatMessage.objects.create(
+                    session=session,
+                    role='assistant',
+                    content=ai_response['content'],
+                    tokens_used=ai_response.get('tokens_used', 0)
+                )
+                print(f"DEBUG: Respuesta de IA guardada con ID: {ai_msg.id}")
+                
+                messages.success(request, 'Mensaje enviado correctamente.')
+                
+            except Exception as e:
+                print(f"DEBUG: Error en OpenAI API: {str(e)}")
+                messages.error(request, f'Error al comunicarse con la IA: {str(e)}')
+            
+            return redirect('ai_chat_debug', session_id=session.id)
+        else:
+            print(f"DEBUG: Formulario no válido: {form.errors}")
+    else:
+        form = AIChatMessageForm()
+    
+    context = {
+        'session': session,
+        'messages_list': messages_list,
+        'form': form,
+        'page_title': f'Debug Chat IA - {session.title}',
+    }
+    
+    return render(request, 'tickets/ai_chat_debug.html', context)
+
+
+@login_required
+def ai_chat_simple_view(request, session_id):
+    """Vista simple del chat IA para debugging"""
+    config = SystemConfiguration.get_config()
+    
+    # Verificar configuración
+    if not config.ai_chat_enabled or not config.openai_api_key:
+        messages.warning(request, 'El chat con IA no está disponible.')
+        return redirect('dashboard')
+    
+    # Obtener sesión
+    session = get_object_or_404(AIChatSession, id=session_id, user=request.user, is_active=True)
+    messages_list = session.messages.all()
+    
+    # Procesar formulario
+    if request.method == 'POST':
+        print(f"=== POST SIMPLE RECIBIDO ===")
+        print(f"request.POST: {dict(request.POST)}")
+        print(f"message value: '{request.POST.get('message', 'NO_ENCONTRADO')}'")
+        
+        message_content = request.POST.get('message', '').strip()
+        
+        if len(message_content) >= 5:
+            try:
+                # Guardar mensaje del usuario
+                user_msg = AIChatMessage.objects.create(
+                    session=session,
+                    role='user',
+                    content=message_content
+                )
+                print(f"Usuario mensaje guardado: {user_msg.id}")
+                
+                # Llamar a OpenAI
+                ai_response = call_openai_api(session, message_content)
+                
+                # Guardar respuesta IA
+                ai_msg = AIChatMessage.objects.create(
+                    session=session,
+                    role='assistant',
+                    content=ai_response['content'],
+                    tokens_used=ai_response.get('tokens_used', 0)
+                )
+                print(f"IA mensaje guardado: {ai_msg.id}")
+                
+                messages.success(request, 'Mensaje enviado correctamente.')
+                return redirect('ai_chat_simple', session_id=session.id)
+                
+            except Exception as e:
+                print(f"Error: {e}")
+                messages.error(request, f'Error: {str(e)}')
+        else:
+            messages.error(request, 'El mensaje debe tener al menos 5 caracteres.')
+    
+    # Crear formulario vacío para los errores
+    form = AIChatMessageForm()
+    
+    context = {
+        'session': session,
+        'messages_list': messages_list,
+        'form': form,
+        'page_title': f'Chat Simple - {session.title}',
+    }
+    
+    return render(request, 'tickets/ai_chat_simple.html', context)
+
+
+@login_required
+def ai_chat_get_messages(request, session_id):
+    """Vista AJAX para obtener mensajes del chat IA"""
+    try:
+        # Obtener sesión
+        session = get_object_or_404(AIChatSession, id=session_id, user=request.user, is_active=True)
+        
+        # Obtener mensajes
+        messages = session.messages.all().order_by('created_at')
+        
+        messages_data = [{
+            'id': msg.id,
+            'role': msg.role,
+            'content': msg.content,
+            'created_at': msg.created_at.isoformat(),
+            'tokens_used': msg.tokens_used
+        } for msg in messages]
+        
+        return JsonResponse({
+            'status': 'success',
+            'messages': messages_data,
+            'session_id': session.id,
+            'session_title': session.title
+        })
+        
+    except Exception as e:
+        return JsonResponse({'status': 'error', 'error': str(e)}, status=500)
+
+@login_required
+def ai_chat_ajax_send_message(request, session_id):
+    """Vista AJAX para enviar mensajes al chat IA"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        config = SystemConfiguration.get_config()
+        
+        # Verificar configuración
+        if not config.ai_chat_enabled or not config.openai_api_key:
+            return JsonResponse({'error': 'Chat IA no disponible'}, status=400)
+        
+        # Obtener sesión
+        try:
+            session = AIChatSession.objects.get(id=session_id, user=request.user, is_active=True)
+        except AIChatSession.DoesNotExist:
+            return JsonResponse({'error': 'Sesión no encontrada'}, status=404)
+        
+        # Obtener mensaje desde JSON body
+        import json
+        try:
+            data = json.loads(request.body)
+            message_content = data.get('message', '').strip()
+        except json.JSONDecodeError:
+            message_content = request.POST.get('message', '').strip()
+        
+        if len(message_content) < 5:
+            return JsonResponse({'error': 'El mensaje debe tener al menos 5 caracteres'}, status=400)
+        
+        # Guardar mensaje del usuario
+        user_msg = AIChatMessage.objects.create(
+            session=session,
+            role='user',
+            content=message_content
+        )
+        
+        # Llamar a OpenAI
+        ai_response = call_openai_api(session, message_content)
+        
+        # Guardar respuesta IA
+        ai_msg = AIChatMessage.objects.create(
+            session=session,
+            role='assistant',
+            content=ai_response['content'],
+            tokens_used=ai_response.get('tokens_used', 0)
+        )
+        
+        return JsonResponse({
+            'status': 'success',
+            'response': ai_response['content'],
+            'user_message': {
+                'id': user_msg.id,
+                'content': user_msg.content,
+                'created_at': user_msg.created_at.isoformat()
+            },
+            'ai_message': {
+                'id': ai_msg.id,
+                'content': ai_msg.content,
+                'created_at': ai_msg.created_at.isoformat(),
+                'tokens_used': ai_msg.tokens_used
+            }
+        })
+        
+    except Exception as e:
+        import traceback
+        print(f"Error completo: {traceback.format_exc()}")
+        return JsonResponse({'status': 'error', 'error': f'Error al procesar mensaje: {str(e)}'}, status=500)
+
+
+@login_required
+def ai_chat_live_view(request, session_id):
+    """Vista mejorada del chat IA con AJAX y UX mejorada"""
+    config = SystemConfiguration.get_config()
+    
+    # Verificar configuración
+    if not config.ai_chat_enabled:
+        messages.warning(request, 'El chat con IA no está habilitado en el sistema.')
+        return redirect('dashboard')
+    
+    if not config.openai_api_key:
+        messages.warning(request, 'El chat con IA no está configurado. Contacta al administrador.')
+        return redirect('dashboard')
+    
+    # Obtener sesión
+    session = get_object_or_404(AIChatSession, id=session_id, user=request.user, is_active=True)
+    
+    # Obtener mensajes
+    messages_list = session.messages.all()
+    
+    context = {
+        'session': session,
+        'messages_list': messages_list,
+        'page_title': f'{session.title} - Chat IA',
+    }
+    
+    return render(request, 'tickets/ai_chat_live.html', context)
+
+
+@login_required
+def ai_chat_modern_view(request, session_id):
+    """Vista del chat IA con diseño moderno (Telegram/Discord style)"""
+    config = SystemConfiguration.get_config()
+    
+    # Verificar configuración
+    if not config.ai_chat_enabled:
+        messages.warning(request, 'El chat con IA no está habilitado en el sistema.')
+        return redirect('dashboard')
+    
+    if not config.openai_api_key:
+        messages.warning(request, 'El chat con IA no está configurado. Contacta al administrador.')
+        return redirect('dashboard')
+    
+    # Obtener sesión
+    session = get_object_or_404(AIChatSession, id=session_id, user=request.user, is_active=True)
+    
+    # Obtener mensajes
+    messages_list = session.messages.all()
+    
+    context = {
+        'session': session,
+        'messages': messages_list,  # Cambio de nombre para el template moderno
+        'page_title': f'{session.title} - Chat IA',
+    }
+    
+    return render(request, 'tickets/ai_chat_modern.html', context)
+
+
+@login_required
+def share_ai_chat_session(request, session_id):
+    """Vista AJAX para compartir una sesión de chat (DEPRECATED - usar share_ai_chat_message)"""
+    # Esta funcionalidad ha sido reemplazada por el compartir mensajes individuales
+    return JsonResponse({
+        'status': 'error', 
+        'error': 'Esta funcionalidad ha sido desactivada. Ahora se comparten mensajes individuales.'
+    }, status=410)  # 410 Gone - recurso ya no disponible
+
+
+def shared_ai_chat_view(request, share_token):
+    """Vista pública para ver una conversación compartida (DEPRECATED - usar shared_ai_message_view)"""
+    # Esta funcionalidad ha sido reemplazada por el compartir mensajes individuales
+    from django.http import HttpResponseNotFound
+    return HttpResponseNotFound('<h1>Esta funcionalidad ha sido desactivada</h1><p>Ahora se comparten mensajes individuales en lugar de conversaciones completas.</p>')
+
+
+@login_required
+def share_ai_chat_message(request, message_id):
+    """Vista AJAX para compartir un mensaje individual del chat IA"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        # Obtener el mensaje
+        message = get_object_or_404(AIChatMessage, id=message_id, session__user=request.user)
+        
+        # Verificar si ya está compartido
+        existing_share = PublicAIMessageShare.objects.filter(
+            chat_message=message,
+            shared_by=request.user,
+            is_active=True
+        ).first()
+        
+        if existing_share:
+            return JsonResponse({
+                'status': 'success',
+                'share_url': request.build_absolute_uri(existing_share.get_public_url()),
+                'share_token': existing_share.token,
+                'message': 'Este mensaje ya estaba compartido'
+            })
+        
+        # Crear nuevo share
+        import secrets
+        share_token = secrets.token_urlsafe(24)
+        
+        shared_message = PublicAIMessageShare.objects.create(
+            chat_message=message,
+            shared_by=request.user,
+            token=share_token,
+            public_title=''
+        )
+        
+        return JsonResponse({
+            'status': 'success',
+            'share_url': request.build_absolute_uri(shared_message.get_public_url()),
+            'share_token': shared_message.token,
+            'message': 'Mensaje compartido exitosamente'
+        })
+        
+    except Exception as e:
+        import traceback
+        print(f"❌ Error al compartir mensaje: {str(e)}")
+        print(f"Traceback completo: {traceback.format_exc()}")
+        return JsonResponse({'status': 'error', 'message': str(e)}, status=500)
+
+
+def shared_ai_message_view(request, token):
+    """Vista pública para ver un mensaje compartido"""
+    import traceback
+    
+    try:
+        # Intentar obtener el mensaje compartido del nuevo modelo
+        try:
+            shared = PublicAIMessageShare.objects.select_related('chat_message', 'chat_message__session').get(
+                token=token, 
+                is_active=True
+            )
+        except PublicAIMessageShare.DoesNotExist:
+            print(f"❌ Token no encontrado en PublicAIMessageShare: {token}")
+            
+            # Verificar si existe pero está inactivo
+            inactive = PublicAIMessageShare.objects.filter(token=token, is_active=False).exists()
+            if inactive:
+                print(f"ℹ️ El token existe pero está inactivo")
+            
+            raise
+        
+        # Verificar que el mensaje relacionado exista
+        if not hasattr(shared, 'chat_message') or shared.chat_message is None:
+            print(f"❌ El mensaje relacionado no existe para token: {token}")
+            raise Exception("El mensaje original fue eliminado")
+        
+        # Verificar si ha expirado
+        if shared.is_expired():
+            return render(request, 'tickets/shared_ai_message_expired.html', {
+                'shared': shared
+            })
+        
+        # Incrementar vistas
+        shared.increment_views()
+        
+        # Obtener mensaje previo del usuario (contexto)
+        user_message = None
+        if shared.chat_message.role == 'assistant':
+            user_message = shared.chat_message.session.messages.filter(
+                role='user',
+                created_at__lt=shared.chat_message.created_at
+            ).order_by('-created_at').first()
+        
+        context = {
+            'shared': shared,
+            'message': shared.chat_message,
+            'user_message': user_message,
+            'page_title': shared.public_title or 'Mensaje compartido'
+        }
+        
+        return render(request, 'tickets/shared_ai_message_public.html', context)
+        
+    except PublicAIMessageShare.DoesNotExist:
+        print(f"❌ No se encontró mensaje compartido con token: {token}")
+        print(f"Traceback: {traceback.format_exc()}")
+        
+        return render(request, 'tickets/shared_ai_message_error.html', {
+            'error_message': 'Token no encontrado en la base de datos' if request.user.is_authenticated and request.user.is_staff else None
+        })
+        
+    except Exception as e:
+        print(f"❌ Error en shared_ai_message_view: {str(e)}")
+        print(f"Token recibido: {token}")
+        print(f"Traceback: {traceback.format_exc()}")
+        
+        return render(request, 'tickets/shared_ai_message_error.html', {
+            'error_message': str(e) if request.user.is_authenticated and request.user.is_staff else None
+        })
+
+
+@login_required
+def unshare_ai_chat_message(request, message_id):
+    """Vista AJAX para dejar de compartir un mensaje"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        # Obtener el share
+        shared = get_object_or_404(
+            PublicAIMessageShare, 
+            chat_message_id=message_id, 
+            shared_by=request.user,
+            is_active=True
+        )
+        
+        # Desactivar el share
+        shared.is_active = False
+        shared.save()
+        
+        return JsonResponse({
+            'status': 'success',
+            'message': 'Compartición desactivada'
+        })
+        
+    except Exception as e:
+        return JsonResponse({'status': 'error', 'error': str(e)}, status=500)
+
+
+# Helper function for AI analysis
+def call_openai_api(session, message_content):
+    """
+    Función auxiliar para llamar a la API de OpenAI
+    """
+    config = SystemConfiguration.get_config()
+    
+    if not config.openai_api_key:
+        raise Exception('API key de OpenAI no configurada')
+    
+    from openai import OpenAI
+    client = OpenAI(api_key=config.openai_api_key)
+    
+    # Obtener historial de mensajes para contexto
+    previous_messages = session.messages.order_by('created_at')[:10]  # Últimos 10 mensajes
+    messages = [{"role": "system", "content": "Eres un asistente IA útil y conversacional."}]
+    
+    # Agregar mensajes previos para contexto
+    for msg in previous_messages:
+        messages.append({
+            "role": msg.role,
+            "content": msg.content
+        })
+    
+    # Agregar mensaje actual
+    messages.append({
+        "role": "user",
+        "content": message_content
+    })
+    
+    response = client.chat.completions.create(
+        model=config.openai_model or 'gpt-4o-mini',
+        messages=messages,
+        max_tokens=2000,
+        temperature=0.7
+    )
+    
+    return {
+        'content': response.choices[0].message.content,
+        'tokens_used': response.usage.total_tokens
+    }
+
+
+@login_required
+def improve_ticket_with_ai(request, ticket_id):
+    """Vista AJAX para mejorar el título y descripción de un ticket usando IA"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        # Verificar permisos del ticket
+        if is_agent(request.user):
+            ticket = get_object_or_404(Ticket, pk=ticket_id)
+        else:
+            # Los usuarios pueden solo editar sus propios tickets o tickets de su empresa/proyectos
+            user_projects = request.user.assigned_projects.all()
+            user_company = None
+            
+            try:
+                user_company = request.user.profile.company
+            except:
+                pass
+            
+            query_conditions = Q(created_by=request.user)
+            if user_projects.exists():
+                query_conditions |= Q(project__in=user_projects)
+            if user_company:
+                query_conditions |= Q(company=user_company)
+            
+            ticket = get_object_or_404(Ticket, pk=ticket_id)
+            if not Ticket.objects.filter(pk=ticket_id).filter(query_conditions).exists():
+                return JsonResponse({'error': 'No tienes permisos para mejorar este ticket'}, status=403)
+        
+        # Verificar configuración de OpenAI
+        config = SystemConfiguration.get_config()
+        if not config.openai_api_key:
+            return JsonResponse({'error': 'API key de OpenAI no configurada'}, status=500)
+        
+        # Obtener tipo de mejora solicitada
+        improvement_type = request.POST.get('type', 'both')  # 'title', 'description', 'both'
+        
+        # Preparar el prompt según el tipo de mejora
+        if improvement_type == 'title':
+            prompt = f"""
+            Mejora el siguiente título de ticket de soporte técnico para que sea más claro, específico y profesional:
+
+            Título actual: "{ticket.title}"
+            Descripción del problema: "{ticket.description}"
+            
+            Proporciona ÚNICAMENTE un título mejorado, sin explicaciones adicionales.
+            El título debe ser:
+            - Claro y específico
+            - Profesional pero comprensible
+            - Máximo 100 caracteres
+            - Debe reflejar exactamente el problema descrito
+            """
+        elif improvement_type == 'description':
+            prompt = f"""
+            Mejora la siguiente descripción de ticket de soporte técnico para que sea más clara, detallada y estructurada:
+
+            Título: "{ticket.title}"
+            Descripción actual: "{ticket.description}"
+            
+            Proporciona ÚNICAMENTE una descripción mejorada, sin explicaciones adicionales.
+            La descripción debe ser:
+            - Clara y bien estructurada
+            - Incluir pasos para reproducir si es relevante
+            - Mencionar el impacto del problema
+            - Ser específica y detallada
+            - Mantener el contenido original pero mejor organizado
+            """
+        else:  # both
+            prompt = f"""
+            Mejora el siguiente ticket de soporte técnico para que el título y descripción sean más claros, específicos y profesionales:
+
+            Título actual: "{ticket.title}"
+            Descripción actual: "{ticket.description}"
+            
+            Responde ÚNICAMENTE con el siguiente formato JSON sin texto adicional:
+            {{
+                "title": "título mejorado aquí",
+                "description": "descripción mejorada aquí"
+            }}
+            
+            Criterios:
+            - Título: Claro, específico, profesional, máximo 100 caracteres
+            - Descripción: Clara, estructurada, detallada, bien organizada
+            - Mantener el contenido original pero mejorado
+            """
+        
+        # Llamar a OpenAI
+        try:
+            from openai import OpenAI
+            client = OpenAI(api_key=config.openai_api_key)
+        except Exception as e:
+            return JsonResponse({'error': f'Error al inicializar cliente OpenAI: {str(e)}'}, status=500)
+        
+        try:
+            response = client.chat.completions.create(
+                model=config.openai_model or 'gpt-4o-mini',
+                messages=[
+                    {"role": "system", "content": "Eres un experto en soporte técnico que mejora la comunicación de tickets para hacerlos más claros y profesionales."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=1000,
+                temperature=0.3
+            )
+            
+            ai_response = response.choices[0].message.content.strip()
+        except Exception as e:
+            return JsonResponse({'error': f'Error al llamar a OpenAI: {str(e)}'}, status=500)
+        
+        # Procesar respuesta según el tipo
+        if improvement_type == 'both':
+            try:
+                import json
+                # Limpiar respuesta si tiene marcadores de código
+                if ai_response.startswith('```json'):
+                    ai_response = ai_response.replace('```json', '').replace('```', '').strip()
+                elif ai_response.startswith('```'):
+                    ai_response = ai_response.replace('```', '').strip()
+                
+                result = json.loads(ai_response)
+                return JsonResponse({
+                    'success': True,
+                    'title': result.get('title', ''),
+                    'description': result.get('description', ''),
+                    'tokens_used': response.usage.total_tokens
+                })
+            except json.JSONDecodeError:
+                return JsonResponse({'error': 'Error al procesar la respuesta de IA'}, status=500)
+        else:
+            return JsonResponse({
+                'success': True,
+                improvement_type: ai_response,
+                'tokens_used': response.usage.total_tokens
+            })
+            
+    except Exception as e:
+        return JsonResponse({'error': f'Error al mejorar ticket: {str(e)}'}, status=500)
+
+
+@login_required
+def improve_ticket_text_with_ai(request):
+    """Vista AJAX para mejorar texto de ticket durante la creación (sin ticket existente)"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        # Verificar configuración de OpenAI
+        config = SystemConfiguration.get_config()
+        if not config.openai_api_key:
+            return JsonResponse({'error': 'API key de OpenAI no configurada'}, status=500)
+        
+        # Obtener datos del request
+        improvement_type = request.POST.get('type', 'both')
+        current_text = request.POST.get('text', '')
+        current_title = request.POST.get('title', '')
+        current_description = request.POST.get('description', '')
+        
+        # Preparar el prompt según el tipo de mejora
+        if improvement_type == 'title':
+            if not current_text:
+                return JsonResponse({'error': 'No se proporcionó texto para mejorar'}, status=400)
+            
+            prompt = f"""
+            Mejora el siguiente título de ticket de soporte técnico para que sea más claro, específico y profesional:
+
+            Título actual: "{current_text}"
+            
+            Proporciona ÚNICAMENTE un título mejorado, sin explicaciones adicionales.
+            El título debe ser:
+            - Claro y específico
+            - Profesional pero comprensible
+            - Máximo 100 caracteres
+            - Debe reflejar exactamente el problema
+            """
+            
+        elif improvement_type == 'description':
+            if not current_text:
+                return JsonResponse({'error': 'No se proporcionó texto para mejorar'}, status=400)
+            
+            prompt = f"""
+            Mejora la siguiente descripción de ticket de soporte técnico para que sea más clara, detallada y estructurada:
+
+            Descripción actual: "{current_text}"
+            
+            Proporciona ÚNICAMENTE una descripción mejorada, sin explicaciones adicionales.
+            La descripción debe ser:
+            - Clara y bien estructurada
+            - Incluir pasos para reproducir si es relevante
+            - Mencionar el impacto del problema
+            - Ser específica y detallada
+            - Mantener el contenido original pero mejor organizado
+            """
+            
+        else:  # both
+            if not current_title or not current_description:
+                return JsonResponse({'error': 'Se requiere título y descripción para mejorar ambos'}, status=400)
+            
+            prompt = f"""
+            Mejora el siguiente ticket de soporte técnico para que el título y descripción sean más claros, específicos y profesionales:
+
+            Título actual: "{current_title}"
+            Descripción actual: "{current_description}"
+            
+            Responde ÚNICAMENTE con el siguiente formato JSON sin texto adicional:
+            {{
+                "title": "título mejorado aquí",
+                "description": "descripción mejorada aquí"
+            }}
+            
+            Criterios:
+            - Título: Claro, específico, profesional, máximo 100 caracteres
+            - Descripción: Clara, estructurada, detallada, bien organizada
+            - Mantener el contenido original pero mejorado
+            """
+        
+        # Llamar a OpenAI
+        try:
+            from openai import OpenAI
+            client = OpenAI(api_key=config.openai_api_key)
+        except Exception as e:
+            return JsonResponse({'error': f'Error al inicializar cliente OpenAI: {str(e)}'}, status=500)
+        
+        try:
+            response = client.chat.completions.create(
+                model=config.openai_model or 'gpt-4o-mini',
+                messages=[
+                    {"role": "system", "content": "Eres un experto en soporte técnico que mejora la comunicación de tickets para hacerlos más claros y profesionales."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=1000,
+                temperature=0.3
+            )
+            
+            ai_response = response.choices[0].message.content.strip()
+        except Exception as e:
+            return JsonResponse({'error': f'Error al llamar a OpenAI: {str(e)}'}, status=500)
+        
+        # Procesar respuesta según el tipo
+        if improvement_type == 'both':
+            try:
+                import json
+                # Limpiar respuesta si tiene marcadores de código
+                if ai_response.startswith('```json'):
+                    ai_response = ai_response.replace('```json', '').replace('```', '').strip()
+                elif ai_response.startswith('```'):
+                    ai_response = ai_response.replace('```', '').strip()
+                
+                result = json.loads(ai_response)
+                return JsonResponse({
+                    'success': True,
+                    'improved_title': result.get('title', ''),
+                    'improved_description': result.get('description', ''),
+                    'tokens_used': response.usage.total_tokens
+                })
+            except json.JSONDecodeError:
+                return JsonResponse({'error': 'Error al procesar la respuesta de IA'}, status=500)
+        else:
+            return JsonResponse({
+                'success': True,
+                'improved_text': ai_response,
+                'tokens_used': response.usage.total_tokens
+            })
+            
+    except Exception as e:
+        return JsonResponse({'error': f'Error al mejorar texto: {str(e)}'}, status=500)
+
+
+@login_required
+def improve_alcance_text_with_ai(request):
+    """Vista AJAX para mejorar texto de alcance usando IA"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        # Verificar configuración de OpenAI
+        config = SystemConfiguration.get_config()
+        if not config.openai_api_key:
+            return JsonResponse({'error': 'API key de OpenAI no configurada'}, status=500)
+        
+        # Obtener datos del request
+        improvement_type = request.POST.get('type', 'all')
+        current_text = request.POST.get('text', '')
+        current_title = request.POST.get('title', '')
+        current_category = request.POST.get('category', '')
+        current_description = request.POST.get('description', '')
+        
+        # Preparar el prompt según el tipo de mejora
+        if improvement_type == 'title':
+            if not current_text:
+                return JsonResponse({'error': 'No se proporcionó texto para mejorar'}, status=400)
+            
+            prompt = f"""
+            Mejora el siguiente título de alcance de servicios para que sea más claro, profesional y atractivo:
+
+            Título actual: "{current_text}"
+            
+            Proporciona ÚNICAMENTE un título mejorado, sin explicaciones adicionales.
+            El título debe ser:
+            - Claro y específico
+            - Profesional y atractivo
+            - Máximo 100 caracteres
+            - Que transmita valor y profesionalismo
+            """
+            
+        elif improvement_type == 'category':
+            if not current_text:
+                return JsonResponse({'error': 'No se proporcionó texto para mejorar'}, status=400)
+            
+            prompt = f"""
+            Mejora la siguiente categoría de alcance de servicios para que sea más clara y profesional:
+
+            Categoría actual: "{current_text}"
+            
+            Proporciona ÚNICAMENTE una categoría mejorada, sin explicaciones adicionales.
+            La categoría debe ser:
+            - Clara y concisa
+            - Profesional
+            - Máximo 50 caracteres
+            - Usar terminología estándar de la industria
+            """
+            
+        elif improvement_type == 'description':
+            if not current_text:
+                return JsonResponse({'error': 'No se proporcionó texto para mejorar'}, status=400)
+            
+            prompt = f"""
+            Mejora la siguiente descripción de alcance de servicios para que sea más clara, detallada y profesional:
+
+            Descripción actual: "{current_text}"
+            
+            Proporciona ÚNICAMENTE una descripción mejorada, sin explicaciones adicionales.
+            La descripción debe ser:
+            - Clara y bien estructurada
+            - Profesional y persuasiva
+            - Detallada pero concisa
+            - Destacar beneficios y valor
+            - Usar viñetas o párrafos cortos si es apropiado
+            """
+            
+        else:  # all
+            if not current_title or not current_category or not current_description:
+                return JsonResponse({'error': 'Se requiere título, categoría y descripción para mejorar todo'}, status=400)
+            
+            prompt = f"""
+            Mejora el siguiente alcance de servicios para que el título, categoría y descripción sean más claros, profesionales y atractivos:
+
+            Título actual: "{current_title}"
+            Categoría actual: "{current_category}"
+            Descripción actual: "{current_description}"
+            
+            Responde ÚNICAMENTE con el siguiente formato JSON sin texto adicional:
+            {{
+                "title": "título mejorado aquí",
+                "category": "categoría mejorada aquí",
+                "description": "descripción mejorada aquí"
+            }}
+            
+            Criterios:
+            - Título: Claro, específico, profesional, máximo 100 caracteres, atractivo
+            - Categoría: Clara, concisa, profesional, máximo 50 caracteres, terminología estándar
+            - Descripción: Clara, estructurada, detallada, profesional, persuasiva, destacar valor
+            - Mantener el contenido original pero mejorado significativamente
+            """
+        
+        # Llamar a OpenAI
+        try:
+            from openai import OpenAI
+            client = OpenAI(api_key=config.openai_api_key)
+        except Exception as e:
+            return JsonResponse({'error': f'Error al inicializar cliente OpenAI: {str(e)}'}, status=500)
+        
+        try:
+            response = client.chat.completions.create(
+                model=config.openai_model or 'gpt-4o-mini',
+                messages=[
+                    {"role": "system", "content": "Eres un experto en marketing y comunicación de servicios profesionales que mejora textos para hacerlos más claros, profesionales y persuasivos."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=1000,
+                temperature=0.3
+            )
+            
+            ai_response = response.choices[0].message.content.strip()
+        except Exception as e:
+            return JsonResponse({'error': f'Error al llamar a OpenAI: {str(e)}'}, status=500)
+        
+        # Procesar respuesta según el tipo
+        if improvement_type == 'all':
+            try:
+                import json
+                # Limpiar respuesta si tiene marcadores de código
+                if ai_response.startswith('```json'):
+                    ai_response = ai_response.replace('```json', '').replace('```', '').strip()
+                elif ai_response.startswith('```'):
+                    ai_response = ai_response.replace('```', '').strip()
+                
+                result = json.loads(ai_response)
+                return JsonResponse({
+                    'success': True,
+                    'improved_title': result.get('title', ''),
+                    'improved_category': result.get('category', ''),
+                    'improved_description': result.get('description', ''),
+                    'tokens_used': response.usage.total_tokens
+                })
+            except json.JSONDecodeError:
+                return JsonResponse({'error': 'Error al procesar la respuesta de IA'}, status=500)
+        else:
+            return JsonResponse({
+                'success': True,
+                'improved_text': ai_response,
+                'tokens_used': response.usage.total_tokens
+            })
+            
+    except Exception as e:
+        return JsonResponse({'error': f'Error al mejorar texto: {str(e)}'}, status=500)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def search_company_info_with_ai(request, company_id):
+    """Vista AJAX para buscar información de una empresa en la web usando IA"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        company = get_object_or_404(Company, pk=company_id)
+        
+        # Verificar configuración de OpenAI
+        config = SystemConfiguration.get_config()
+        if not config.openai_api_key:
+            return JsonResponse({'error': 'API key de OpenAI no configurada'}, status=500)
+        
+        # Obtener nombre de la empresa del request o usar el actual
+        company_name = request.POST.get('company_name', company.name).strip()
+        
+        if not company_name:
+            return JsonResponse({'error': 'Nombre de empresa requerido'}, status=400)
+        
+        # Prompt para buscar información de la empresa
+        prompt = f"""
+        Busca información detallada sobre la empresa "{company_name}". 
+        
+        Proporciona la información en el siguiente formato JSON exacto (sin texto adicional):
+        {{
+            "name": "nombre oficial completo de la empresa",
+            "website": "sitio web principal (con https://)",
+            "email": "email principal de contacto",
+            "phone": "teléfono principal",
+            "address": "dirección completa de la sede principal",
+            "description": "descripción detallada de la empresa, sus servicios y actividades",
+            "industry": "sector o industria principal",
+            "founded": "año de fundación si está disponible",
+            "employees": "número aproximado de empleados si está disponible",
+            "social_media": {{
+                "linkedin": "URL de LinkedIn",
+                "twitter": "URL de Twitter",
+                "facebook": "URL de Facebook"
+            }},
+            "additional_info": "información adicional relevante como premios, certificaciones, etc."
+        }}
+        
+        IMPORTANTE:
+        - Si no encuentras información específica, usa "No disponible" para ese campo
+        - Asegúrate de que el website tenga formato completo (https://)
+        - La descripción debe ser informativa y profesional
+        - Incluye solo información verificable y actualizada
+        """
+        
+        # Llamar a OpenAI
+        from openai import OpenAI
+        client = OpenAI(api_key=config.openai_api_key)
+        
+        response = client.chat.completions.create(
+            model=config.openai_model or 'gpt-4o-mini',
+            messages=[
+                {"role": "system", "content": "Eres un experto investigador de empresas que busca información precisa y actualizada sobre compañías usando fuentes públicas disponibles. Respondes únicamente con JSON válido."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1500,
+            temperature=0.3
+        )
+        
+        ai_response = response.choices[0].message.content.strip()
+        
+        # Limpiar respuesta si tiene marcadores de código
+        if ai_response.startswith('```json'):
+            ai_response = ai_response.replace('```json', '').replace('```', '').strip()
+        elif ai_response.startswith('```'):
+            ai_response = ai_response.replace('```', '').strip()
+        
+        try:
+            import json
+            result = json.loads(ai_response)
+            
+            # Validar que los campos requeridos estén presentes
+            required_fields = ['name', 'website', 'email', 'phone', 'address', 'description']
+            for field in required_fields:
+                if field not in result:
+                    result[field] = 'No disponible'
+            
+            return JsonResponse({
+                'success': True,
+                'data': result,
+                'tokens_used': response.usage.total_tokens
+            })
+            
+        except json.JSONDecodeError:
+            return JsonResponse({'error': 'Error al procesar la respuesta de IA'}, status=500)
+            
+    except Exception as e:
+        return JsonResponse({'error': f'Error al buscar información: {str(e)}'}, status=500)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def search_company_info_general(request):
+    """Vista AJAX para buscar información de una empresa sin requerir ID específico"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        # Verificar configuración de OpenAI
+        config = SystemConfiguration.get_config()
+        if not config.openai_api_key:
+            return JsonResponse({'error': 'API key de OpenAI no configurada'}, status=500)
+        
+        # Obtener nombre de la empresa del request
+        company_name = request.POST.get('company_name', '').strip()
+        
+        if not company_name:
+            return JsonResponse({'error': 'Nombre de empresa requerido'}, status=400)
+        
+        # Prompt para buscar información de la empresa
+        prompt = f"""
+        Busca información detallada sobre la empresa "{company_name}". 
+        
+        Proporciona la información en el siguiente formato JSON exacto (sin texto adicional):
+        {{
+            "name": "nombre oficial completo de la empresa",
+            "website": "sitio web principal (con https://)",
+            "email": "email principal de contacto",
+            "phone": "teléfono principal",
+            "address": "dirección completa de la sede principal",
+            "description": "descripción detallada de la empresa, sus servicios y actividades",
+            "industry": "sector o industria principal",
+            "founded": "año de fundación si está disponible",
+            "employees": "número aproximado de empleados si está disponible",
+            "social_media": {{
+                "linkedin": "URL de LinkedIn",
+                "twitter": "URL de Twitter",
+                "facebook": "URL de Facebook"
+            }},
+            "additional_info": "información adicional relevante como premios, certificaciones, etc."
+        }}
+        
+        IMPORTANTE:
+        - Si no encuentras información específica, usa "No disponible" para ese campo
+        - Asegúrate de que el website tenga formato completo (https://)
+        - La descripción debe ser informativa y profesional
+        - Incluye solo información verificable y actualizada
+        """
+        
+        # Llamar a OpenAI
+        from openai import OpenAI
+        client = OpenAI(api_key=config.openai_api_key)
+        
+        response = client.chat.completions.create(
+            model=config.openai_model or 'gpt-4o-mini',
+            messages=[
+                {"role": "system", "content": "Eres un experto investigador de empresas que busca información precisa y actualizada sobre compañías usando fuentes públicas disponibles. Respondes únicamente con JSON válido."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1500,
+            temperature=0.3
+        )
+        
+        ai_response = response.choices[0].message.content.strip()
+        
+        # Limpiar respuesta si tiene marcadores de código
+        if ai_response.startswith('```json'):
+            ai_response = ai_response.replace('```json', '').replace('```', '').strip()
+        elif ai_response.startswith('```'):
+            ai_response = ai_response.replace('```', '').strip()
+        
+        try:
+            import json
+            result = json.loads(ai_response)
+            
+            # Validar que los campos requeridos estén presentes
+            required_fields = ['name', 'website', 'email', 'phone', 'address', 'description']
+            for field in required_fields:
+                if field not in result:
+                    result[field] = 'No disponible'
+            
+            return JsonResponse({
+                'success': True,
+                'data': result,
+                'tokens_used': response.usage.total_tokens
+            })
+            
+        except json.JSONDecodeError:
+            return JsonResponse({'error': 'Error al procesar la respuesta de IA'}, status=500)
+            
+    except Exception as e:
+        return JsonResponse({'error': f'Error al buscar información: {str(e)}'}, status=500)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def enhance_contact_with_ai(request, contact_id):
+    """Vista AJAX para mejorar información de un contacto usando IA"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        contact = get_object_or_404(Contact, pk=contact_id)
+        
+        # Verificar configuración de OpenAI
+        config = SystemConfiguration.get_config()
+        if not config.openai_api_key:
+            return JsonResponse({'error': 'API key de OpenAI no configurada'}, status=500)
+        
+        # Obtener datos actuales del contacto del request
+        import json
+        contact_data = json.loads(request.body)
+        
+        # Construir información existente
+        existing_info = []
+        if contact_data.get('name'):
+            existing_info.append(f"Nombre: {contact_data['name']}")
+        if contact_data.get('email'):
+            existing_info.append(f"Email: {contact_data['email']}")
+        if contact_data.get('phone'):
+            existing_info.append(f"Teléfono: {contact_data['phone']}")
+        if contact_data.get('position'):
+            existing_info.append(f"Posición: {contact_data['position']}")
+        if contact_data.get('company'):
+            existing_info.append(f"Empresa: {contact_data['company']}")
+        if contact_data.get('notes'):
+            existing_info.append(f"Notas actuales: {contact_data['notes']}")
+        
+        if not existing_info:
+            return JsonResponse({'error': 'No hay información suficiente para mejorar'}, status=400)
+        
+        existing_info_text = "\n".join(existing_info)
+        
+        # Prompt para mejorar información del contacto
+        prompt = f"""
+        Tienes la siguiente información parcial de un contacto profesional:
+        
+        {existing_info_text}
+        
+        Basándote en esta información, busca y proporciona datos adicionales que podrían ser útiles para completar el perfil del contacto. 
+        
+        Proporciona la respuesta en el siguiente formato JSON exacto (sin texto adicional):
+        {{
+            "full_name": "nombre completo si es diferente o más completo que el actual",
+            "position": "título o posición profesional más específica o completa",
+            "professional_title": "título profesional o especialización",
+            "email": "email profesional si no está disponible",
+            "phone": "teléfono profesional si no está disponible",
+            "linkedin": "URL del perfil de LinkedIn si está disponible",
+            "company_info": {{
+                "name": "nombre completo y correcto de la empresa",
+                "industry": "industria o sector de la empresa", 
+                "size": "tamaño aproximado de la empresa",
+                "location": "ubicación principal de la empresa"
+            }},
+            "additional_info": "información adicional relevante sobre el contacto, su rol, experiencia, etc.",
+            "suggested_notes": "sugerencias de notas profesionales para agregar al contacto basadas en la información encontrada"
+        }}
+        
+        IMPORTANTE:
+        - Si no encuentras información específica o no puedes mejorar un campo, usa "No disponible"
+        - Proporciona solo información que sea profesionalmente relevante
+        - Las sugerencias de notas deben ser útiles para seguimiento comercial o profesional
+        - Usa fuentes públicas y profesionales para la información
+        - Sé preciso y evita especulaciones
+        """
+        
+        # Llamar a OpenAI
+        from openai import OpenAI
+        client = OpenAI(api_key=config.openai_api_key)
+        
+        response = client.chat.completions.create(
+            model=config.openai_model or 'gpt-4o-mini',
+            messages=[
+                {"role": "system", "content": "Eres un experto asistente de CRM que ayuda a completar información de contactos profesionales usando fuentes públicas y conocimiento general del mundo empresarial. Respondes únicamente con JSON válido."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1200,
+            temperature=0.3
+        )
+        
+        ai_response = response.choices[0].message.content.strip()
+        
+        # Limpiar respuesta si tiene marcadores de código
+        if ai_response.startswith('```json'):
+            ai_response = ai_response.replace('```json', '').replace('```', '').strip()
+        elif ai_response.startswith('```'):
+            ai_response = ai_response.replace('```', '').strip()
+        
+        try:
+            result = json.loads(ai_response)
+            
+            # Validar que los campos requeridos estén presentes
+            required_fields = ['full_name', 'position', 'email', 'phone', 'additional_info', 'suggested_notes']
+            for field in required_fields:
+                if field not in result:
+                    result[field] = 'No disponible'
+            
+            return JsonResponse({
+                'success': True,
+                'data': result,
+                'tokens_used': response.usage.total_tokens
+            })
+            
+        except json.JSONDecodeError:
+            return JsonResponse({'error': 'Error al procesar la respuesta de IA'}, status=500)
+            
+    except Exception as e:
+        return JsonResponse({'error': f'Error al mejorar contacto: {str(e)}'}, status=500)
+
+
+@login_required
+def voice_command_create_ticket_view(request):
+    """Vista para procesar comandos de voz y crear tickets automáticamente"""
+    from .ai_utils import VoiceCommandProcessor
+    import tempfile
+    import os
+    import logging
+    
+    logger = logging.getLogger(__name__)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'})
+    
+    try:
+        # Verificar que se envió un archivo de audio
+        if 'audio' not in request.FILES:
+            return JsonResponse({'success': False, 'error': 'No se envió archivo de audio'})
+        
+        audio_file = request.FILES['audio']
+        
+        # Validar formato de audio
+        allowed_formats = ['.wav', '.mp3', '.m4a', '.webm', '.ogg']
+        file_extension = os.path.splitext(audio_file.name)[1].lower()
+        
+        if file_extension not in allowed_formats:
+            return JsonResponse({
+                'success': False, 
+                'error': f'Formato de audio no soportado. Use: {", ".join(allowed_formats)}'
+            })
+        
+        # Crear archivo temporal para procesar el audio
+        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
+            # Escribir el contenido del archivo subido al archivo temporal
+            for chunk in audio_file.chunks():
+                temp_file.write(chunk)
+            temp_file_path = temp_file.name
+        
+        try:
+            # Procesar el comando de voz
+            processor = VoiceCommandProcessor()
+            result = processor.process_voice_command(temp_file_path, request.user)
+            
+            if result['success']:
+                # Comando procesado exitosamente
+                ticket_number = result["ticket"].get("ticket_number", result["ticket"].get("ticket_id", "Sin número"))
+                return JsonResponse({
+                    'success': True,
+                    'message': f'Ticket creado exitosamente: #{ticket_number}',
+                    'ticket': result['ticket'],
+                    'transcription': result['transcription'],
+                    'ticket_info': result['ticket_info']
+                })
+            else:
+                # Error procesando el comando
+                return JsonResponse({
+                    'success': False,
+                    'error': result.get('error', 'Error desconocido procesando comando')
+                })
+        
+        finally:
+            # Limpiar archivo temporal
+            try:
+                os.unlink(temp_file_path)
+            except OSError:
+                pass  # Ignorar errores al eliminar archivo temporal
+    
+    except Exception as e:
+        logger.error(f"Error en comando de voz: {str(e)}")
+        return JsonResponse({'success': False, 'error': f'Error interno del servidor: {str(e)}'})
+
+
+@login_required 
+def voice_command_interface_view(request):
+    """Vista para mostrar la interfaz de comandos de voz"""
+    from .models import Ticket
+    
+    # Obtener estadísticas de tickets recientes del usuario
+    recent_tickets = Ticket.objects.filter(
+        created_by=request.user
+    ).order_by('-created_at')[:5]
+    
+    # Obtener estadísticas generales
+    total_tickets = Ticket.objects.filter(created_by=request.user).count()
+    open_tickets = Ticket.objects.filter(created_by=request.user, status='open').count()
+    
+    context = {
+        'page_title': 'Comandos de Voz IA - TicketProo',
+        'recent_tickets': recent_tickets,
+        'total_tickets': total_tickets,
+        'open_tickets': open_tickets,
+    }
+    
+    return render(request, 'tickets/voice_command_interface.html', context)
+
+
+# ==================== VISTAS DE IMAGE TO PROMPT ====================
+
+@login_required
+def image_prompt_list(request):
+    """Lista de todas las imágenes y prompts del usuario"""
+    prompts = ImagePrompt.objects.filter(user=request.user).order_by('-created_at')
+    
+    # Filtros
+    search = request.GET.get('search', '')
+    if search:
+        prompts = prompts.filter(
+            Q(title__icontains=search) | 
+            Q(generated_prompt__icontains=search) | 
+            Q(custom_prompt__icontains=search) |
+            Q(tags__icontains=search)
+        )
+    
+    # Paginación
+    paginator = Paginator(prompts, 12)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'page_obj': page_obj,
+        'search': search,
+        'total_prompts': ImagePrompt.objects.filter(user=request.user).count(),
+        'page_title': 'Mis Prompts de Imágenes'
+    }
+    return render(request, 'tickets/image_prompt_list.html', context)
+
+
+@login_required
+def image_prompt_create(request):
+    """Crear un nuevo prompt desde una imagen"""
+    if request.method == 'POST':
+        title = request.POST.get('title')
+        tags = request.POST.get('tags', '')
+        is_public = request.POST.get('is_public') == 'on'
+        image_file = request.FILES.get('image')
+        
+        if not title or not image_file:
+            messages.error(request, 'Por favor completa todos los campos requeridos')
+            return render(request, 'tickets/image_prompt_create.html')
+        
+        # Crear el objeto ImagePrompt
+        image_prompt = ImagePrompt.objects.create(
+            user=request.user,
+            title=title,
+            image=image_file,
+            tags=tags,
+            is_public=is_public
+        )
+        
+        # Generar prompt con IA
+        try:
+            from .models import SystemConfiguration
+            config = SystemConfiguration.get_config()
+            
+            if not config.openai_api_key:
+                messages.warning(request, 'Imagen guardada, pero no se pudo generar el prompt (API key no configurada)')
+                return redirect('image_prompt_detail', pk=image_prompt.pk)
+            
+            # Usar OpenAI Vision para analizar la imagen
+            from openai import OpenAI
+            import base64
+            
+            client = OpenAI(api_key=config.openai_api_key)
+            
+            # Leer y codificar la imagen
+            image_prompt.image.seek(0)
+            image_data = base64.b64encode(image_prompt.image.read()).decode('utf-8')
+            
+            # Llamar a la API con vision
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "Eres un experto en generar prompts detallados para DALL-E, Midjourney y Stable Diffusion. Analiza la imagen y genera un prompt descriptivo que capture todos los detalles visuales, estilo, composición, colores, iluminación y atmósfera. IMPORTANTE: Genera SOLO texto plano, sin usar formato Markdown, sin asteriscos, sin guiones, sin numeración. Todo debe ser texto corrido separado por comas o puntos."
+                    },
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": "Analiza esta imagen y genera un prompt detallado en texto plano (sin formato Markdown) que describa el sujeto principal y elementos secundarios, el estilo artístico, los colores dominantes, la iluminación y atmósfera, la composición y perspectiva, y detalles técnicos de calidad. Genera un prompt optimizado para generadores de imágenes por IA, todo en texto corrido sin formato especial."
+                            },
+                            {
+                                "type": "image_url",
+                                "image_url": {
+                                    "url": f"data:image/jpeg;base64,{image_data}"
+                                }
+                            }
+                        ]
+                    }
+                ],
+                max_tokens=800
+            )
+            
+            generated_prompt = response.choices[0].message.content.strip()
+            tokens_used = response.usage.total_tokens
+            
+            # Actualizar el objeto
+            image_prompt.generated_prompt = generated_prompt
+            image_prompt.tokens_used = tokens_used
+            image_prompt.save()
+            
+            messages.success(request, 'Imagen subida y prompt generado exitosamente!')
+            return redirect('image_prompt_detail', pk=image_prompt.pk)
+            
+        except Exception as e:
+            messages.warning(request, f'Imagen guardada, pero hubo un error al generar el prompt: {str(e)}')
+            return redirect('image_prompt_detail', pk=image_prompt.pk)
+    
+    context = {
+        'page_title': 'Generar Prompt desde Imagen'
+    }
+    return render(request, 'tickets/image_prompt_create.html', context)
+
+
+@login_required
+def image_prompt_detail(request, pk):
+    """Ver detalle de un prompt de imagen"""
+    image_prompt = get_object_or_404(ImagePrompt, pk=pk, user=request.user)
+    
+    context = {
+        'image_prompt': image_prompt,
+        'page_title': f'Prompt: {image_prompt.title}'
+    }
+    return render(request, 'tickets/image_prompt_detail.html', context)
+
+
+@login_required
+def image_prompt_edit(request, pk):
+    """Editar un prompt de imagen"""
+    image_prompt = get_object_or_404(ImagePrompt, pk=pk, user=request.user)
+    
+    if request.method == 'POST':
+        image_prompt.title = request.POST.get('title')
+        image_prompt.custom_prompt = request.POST.get('custom_prompt')
+        image_prompt.tags = request.POST.get('tags', '')
+        image_prompt.is_public = request.POST.get('is_public') == 'on'
+        image_prompt.save()
+        
+        messages.success(request, 'Prompt actualizado exitosamente')
+        return redirect('image_prompt_detail', pk=image_prompt.pk)
+    
+    context = {
+        'image_prompt': image_prompt,
+        'page_title': f'Editar: {image_prompt.title}'
+    }
+    return render(request, 'tickets/image_prompt_edit.html', context)
+
+
+@login_required
+def image_prompt_delete(request, pk):
+    """Eliminar un prompt de imagen"""
+    image_prompt = get_object_or_404(ImagePrompt, pk=pk, user=request.user)
+    
+    if request.method == 'POST':
+        title = image_prompt.title
+        image_prompt.delete()
+        messages.success(request, f'Prompt "{title}" eliminado exitosamente')
+        return redirect('image_prompt_list')
+    
+    context = {
+        'image_prompt': image_prompt,
+        'page_title': f'Eliminar: {image_prompt.title}'
+    }
+    return render(request, 'tickets/image_prompt_delete.html', context)
+
+
+def public_image_prompts(request):
+    """Vista pública de prompts de imágenes"""
+    prompts = ImagePrompt.objects.filter(is_public=True).order_by('-created_at')
+    
+    # Filtros
+    search = request.GET.get('search', '')
+    if search:
+        prompts = prompts.filter(
+            Q(title__icontains=search) | 
+            Q(generated_prompt__icontains=search) | 
+            Q(custom_prompt__icontains=search) |
+            Q(tags__icontains=search)
+        )
+    
+    # Paginación
+    paginator = Paginator(prompts, 12)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'page_obj': page_obj,
+        'search': search,
+        'total_prompts': ImagePrompt.objects.filter(is_public=True).count(),
+        'page_title': 'Prompts Públicos'
+    }
+    return render(request, 'tickets/public_image_prompts.html', context)
+
+
+def public_image_prompt_detail(request, pk):
+    """Vista pública del detalle de un prompt de imagen"""
+    image_prompt = get_object_or_404(ImagePrompt, pk=pk, is_public=True)
+    
+    context = {
+        'image_prompt': image_prompt,
+        'page_title': f'Prompt: {image_prompt.title}'
+    }
+    return render(request, 'tickets/public_image_prompt_detail.html', context)
+
+
+# ==================== GERENTES IA ====================
+
+def get_user_companies(user):
+    """Función auxiliar para obtener empresas del usuario"""
+    # Si es staff, puede ver todas las empresas
+    if user.is_staff:
+        return Company.objects.all()
+    else:
+        # Para usuarios normales, buscar empresas donde tiene proyectos o tickets
+        # O simplemente retornar todas (ya que Company no tiene created_by)
+        # Por ahora retornamos todas las empresas
+        return Company.objects.all()
+
+@login_required
+def ai_manager_list(request):
+    """Lista de gerentes IA de la empresa del usuario"""
+    user_companies = get_user_companies(request.user)
+    
+    if not user_companies.exists():
+        messages.warning(request, 'No tienes una empresa asignada. Por favor crea una empresa primero.')
+        return redirect('dashboard')
+    
+    # Obtener TODOS los gerentes de TODAS las empresas del usuario
+    managers = AIManager.objects.filter(
+        company__in=user_companies, 
+        is_active=True
+    ).select_related('company').order_by('company', 'category', 'name')
+    
+    context = {
+        'managers': managers,
+        'companies': user_companies,
+        'total_companies': user_companies.count(),
+        'page_title': 'Gerentes IA'
+    }
+    return render(request, 'tickets/ai_manager_list.html', context)
+
+
+@login_required
+def ai_manager_create(request):
+    """Crear un nuevo gerente IA"""
+    user_companies = get_user_companies(request.user)
+    
+    if not user_companies.exists():
+        messages.warning(request, 'No tienes una empresa asignada.')
+        return redirect('dashboard')
+    
+    if request.method == 'POST':
+        company_id = request.POST.get('company')
+        name = request.POST.get('name')
+        category = request.POST.get('category')
+        description = request.POST.get('description', '')
+        instructions = request.POST.get('instructions')
+        telegram_enabled = request.POST.get('telegram_enabled') == 'on'
+        telegram_bot_token = request.POST.get('telegram_bot_token', '').strip()
+        telegram_chat_id = request.POST.get('telegram_chat_id', '').strip()
+        
+        if not all([company_id, name, category, instructions]):
+            messages.error(request, 'Por favor completa todos los campos requeridos')
+        else:
+            company = get_object_or_404(Company, pk=company_id)
+            AIManager.objects.create(
+                company=company,
+                name=name,
+                category=category,
+                description=description,
+                instructions=instructions,
+                telegram_enabled=telegram_enabled,
+                telegram_bot_token=telegram_bot_token,
+                telegram_chat_id=telegram_chat_id,
+                created_by=request.user
+            )
+            messages.success(request, f'Gerente IA "{name}" creado exitosamente')
+            return redirect('ai_manager_list')
+    
+    context = {
+        'companies': user_companies,
+        'page_title': 'Crear Gerente IA'
+    }
+    return render(request, 'tickets/ai_manager_form.html', context)
+
+
+@login_required
+def ai_manager_detail(request, pk):
+    """Detalle de un gerente IA"""
+    manager = get_object_or_404(AIManager, pk=pk)
+    
+    # Verificar que el usuario pertenece a la empresa
+    user_companies = get_user_companies(request.user)
+    
+    if manager.company not in user_companies:
+        messages.error(request, 'No tienes permiso para ver este gerente IA')
+        return redirect('ai_manager_list')
+    
+    # Obtener últimas reuniones
+    recent_meetings = manager.meetings.select_related('user').order_by('-created_at')[:10]
+    
+    # Obtener resúmenes
+    summaries = manager.summaries.order_by('-created_at')[:5]
+    
+    # Estadísticas dinámicas (se actualizan en tiempo real)
+    meetings = manager.meetings.all()
+    total_meetings = meetings.count()
+    active_users = meetings.values('user').distinct().count()
+    total_summaries = manager.summaries.count()
+    total_tokens = meetings.aggregate(total=Sum('tokens_used'))['total'] or 0
+    
+    stats = {
+        'total_meetings': total_meetings,
+        'active_users': active_users,
+        'total_summaries': total_summaries,
+        'total_tokens': total_tokens,
+    }
+    
+    context = {
+        'manager': manager,
+        'recent_meetings': recent_meetings,
+        'summaries': summaries,
+        'stats': stats,
+        'page_title': manager.name
+    }
+    return render(request, 'tickets/ai_manager_detail.html', context)
+
+
+@login_required
+def ai_manager_edit(request, pk):
+    """Editar un gerente IA"""
+    manager = get_object_or_404(AIManager, pk=pk)
+    
+    # Verificar permisos
+    user_companies = get_user_companies(request.user)
+    
+    if manager.company not in user_companies:
+        messages.error(request, 'No tienes permiso para editar este gerente IA')
+        return redirect('ai_manager_list')
+    
+    if request.method == 'POST':
+        manager.name = request.POST.get('name')
+        manager.category = request.POST.get('category')
+        manager.description = request.POST.get('description', '')
+        manager.instructions = request.POST.get('instructions')
+        manager.is_active = request.POST.get('is_active') == 'on'
+        
+        # Telegram integration
+        manager.telegram_enabled = request.POST.get('telegram_enabled') == 'on'
+        manager.telegram_bot_token = request.POST.get('telegram_bot_token', '').strip()
+        manager.telegram_chat_id = request.POST.get('telegram_chat_id', '').strip()
+        
+        manager.save()
+        
+        messages.success(request, 'Gerente IA actualizado exitosamente')
+        return redirect('ai_manager_detail', pk=manager.pk)
+    
+    context = {
+        'manager': manager,
+        'page_title': f'Editar: {manager.name}'
+    }
+    return render(request, 'tickets/ai_manager_edit.html', context)
+
+
+@login_required
+def ai_manager_delete(request, pk):
+    """Eliminar un gerente IA"""
+    manager = get_object_or_404(AIManager, pk=pk)
+    
+    # Verificar permisos
+    user_companies = get_user_companies(request.user)
+    
+    if manager.company not in user_companies:
+        messages.error(request, 'No tienes permiso para eliminar este gerente IA')
+        return redirect('ai_manager_list')
+    
+    if request.method == 'POST':
+        name = manager.name
+        manager.delete()
+        messages.success(request, f'Gerente IA "{name}" eliminado exitosamente')
+        return redirect('ai_manager_list')
+    
+    # Estadísticas para la página de confirmación
+    meetings = manager.meetings.all()
+    stats = {
+        'total_meetings': meetings.count(),
+        'total_summaries': manager.summaries.count(),
+        'total_participants': meetings.values('user').distinct().count(),
+    }
+    
+    context = {
+        'manager': manager,
+        'stats': stats,
+        'page_title': f'Eliminar: {manager.name}'
+    }
+    return render(request, 'tickets/ai_manager_delete.html', context)
+
+
+@login_required
+def ai_manager_meeting_create(request, pk):
+    """Crear una reunión con un gerente IA"""
+    manager = get_object_or_404(AIManager, pk=pk, is_active=True)
+    
+    # Verificar permisos
+    user_companies = get_user_companies(request.user)
+    
+    if manager.company not in user_companies:
+        messages.error(request, 'No tienes permiso para reunirte con este gerente IA')
+        return redirect('ai_manager_list')
+    
+    if request.method == 'POST':
+        title = request.POST.get('title')
+        input_type = request.POST.get('input_type', 'text')
+        user_input = request.POST.get('user_input')
+        audio_file = request.FILES.get('audio_file')
+        attachments = request.FILES.getlist('attachments')
+        
+        # Si está en modo audio y hay archivo pero no texto, transcribir
+        if input_type == 'audio' and audio_file and not user_input:
+            try:
+                from .models import SystemConfiguration
+                config = SystemConfiguration.get_config()
+                
+                if config.openai_api_key:
+                    from openai import OpenAI
+                    client = OpenAI(api_key=config.openai_api_key)
+                    
+                    # Transcribir audio con Whisper
+                    audio_file.seek(0)
+                    transcription = client.audio.transcriptions.create(
+                        model="whisper-1",
+                        file=audio_file
+                    )
+                    user_input = transcription.text
+            except Exception as e:
+                messages.error(request, f'Error al transcribir audio: {str(e)}')
+                return render(request, 'tickets/ai_manager_meeting_form.html', {
+                    'manager': manager,
+                    'page_title': f'Nueva Reunión con {manager.name}'
+                })
+        
+        if not title or not user_input:
+            messages.error(request, 'Por favor completa todos los campos requeridos')
+            return render(request, 'tickets/ai_manager_meeting_form.html', {
+                'manager': manager,
+                'page_title': f'Nueva Reunión con {manager.name}'
+            })
+        
+        # Procesar archivos adjuntos para incluir en el contexto de IA
+        attachments_context = ""
+        if attachments:
+            attachments_context = f"\n\nArchivos adjuntos proporcionados ({len(attachments)}):\n"
+            for att in attachments:
+                file_size_kb = att.size / 1024
+                attachments_context += f"- {att.name} ({file_size_kb:.1f} KB, tipo: {att.content_type})\n"
+            attachments_context += "\nNOTA: Considera que el usuario ha compartido estos archivos como contexto adicional para su reunión."
+        
+        # Procesar con IA
+        try:
+            from .models import SystemConfiguration
+            config = SystemConfiguration.get_config()
+            
+            if not config.openai_api_key:
+                messages.warning(request, 'Reunión guardada, pero no se pudo generar respuesta IA (API key no configurada)')
+                meeting = AIManagerMeeting.objects.create(
+                    ai_manager=manager,
+                    user=request.user,
+                    title=title,
+                    input_type=input_type,
+                    user_input=user_input,
+                    audio_file=audio_file,
+                    ai_response='No disponible',
+                    ai_summary='No disponible'
+                )
+                return redirect('ai_manager_meeting_detail', pk=meeting.pk)
+            
+            from openai import OpenAI
+            client = OpenAI(api_key=config.openai_api_key)
+            
+            # Obtener historial de reuniones previas del usuario con este gerente
+            previous_meetings = AIManagerMeeting.objects.filter(
+                ai_manager=manager,
+                user=request.user
+            ).order_by('-created_at')[:5]
+            
+            context_history = ""
+            if previous_meetings.exists():
+                context_history = "\n\nHistorial reciente de reuniones:\n"
+                for i, meeting in enumerate(previous_meetings, 1):
+                    context_history += f"\n{i}. {meeting.title}\n"
+                    context_history += f"   Usuario dijo: {meeting.user_input[:200]}...\n"
+                    context_history += f"   Resumen: {meeting.ai_summary[:200]}...\n"
+            
+            # Llamar a la IA
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"""{manager.instructions}
+
+Información de la empresa: {manager.company.name}
+Tu rol: {manager.name} - {manager.get_category_display()}
+Descripción: {manager.description}
+
+{context_history}
+{attachments_context}
+
+Tu objetivo es:
+1. Escuchar atentamente lo que el usuario comparte
+2. Proporcionar un análisis constructivo y empático
+3. Identificar áreas de mejora específicas y accionables
+4. Dar recomendaciones prácticas basadas en el contexto de la empresa
+5. Motivar y apoyar al usuario en su crecimiento
+
+IMPORTANTE: 
+- NO uses formato Markdown (nada de **, ##, ###, -, *, etc.)
+- Para resaltar texto importante usa HTML: <strong>texto</strong>
+- Escribe párrafos normales separados por saltos de línea
+- Usa listas simples con números o guiones HTML si es necesario
+- Responde de manera profesional pero cercana
+- Sé específico en tus recomendaciones"""
+                    },
+                    {
+                        "role": "user",
+                        "content": f"Tema: {title}\n\n{user_input}"
+                    }
+                ],
+                max_tokens=1000
+            )
+            
+            ai_response = response.choices[0].message.content.strip()
+            tokens_used = response.usage.total_tokens
+            
+            # Generar resumen corto
+            summary_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "Resume en 2-3 líneas lo más importante de esta reunión. NO uses Markdown. Usa <strong>texto</strong> para resaltar palabras clave."
+                    },
+                    {
+                        "role": "user",
+                        "content": f"Usuario dijo: {user_input}\n\nRespuesta: {ai_response}"
+                    }
+                ],
+                max_tokens=150
+            )
+            
+            ai_summary = summary_response.choices[0].message.content.strip()
+            tokens_used += summary_response.usage.total_tokens
+            
+            # Identificar áreas de mejora
+            improvements_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "Lista 3-5 áreas de mejora específicas basadas en lo discutido. NO uses Markdown. Usa <strong>texto</strong> para resaltar. Formato: lista simple con números, cada área en una línea."
+                    },
+                    {
+                        "role": "user",
+                        "content": f"Contexto: {title}\n\n{user_input}"
+                    }
+                ],
+                max_tokens=200
+            )
+            
+            improvement_areas = improvements_response.choices[0].message.content.strip()
+            tokens_used += improvements_response.usage.total_tokens
+            
+            # Crear la reunión
+            meeting = AIManagerMeeting.objects.create(
+                ai_manager=manager,
+                user=request.user,
+                title=title,
+                input_type=input_type,
+                user_input=user_input,
+                audio_file=audio_file,
+                ai_response=ai_response,
+                ai_summary=ai_summary,
+                improvement_areas=improvement_areas,
+                tokens_used=tokens_used
+            )
+            
+            # Guardar los archivos adjuntos
+            from .models import AIManagerMeetingAttachment
+            for attachment_file in attachments:
+                AIManagerMeetingAttachment.objects.create(
+                    meeting=meeting,
+                    file=attachment_file
+                )
+            
+            # Enviar por Telegram si está habilitado
+            if manager.telegram_enabled and manager.telegram_bot_token and manager.telegram_chat_id:
+                try:
+                    from .notification_utils import queue_telegram
+                    from django.utils import timezone
+                    
+                    # Formatear mensaje para Telegram (solo lo compartido y respuesta)
+                    telegram_message = f"""
+📝 *Nueva Reunión con {manager.name}*
+🏢 {manager.company.name}
+👤 {request.user.get_full_name() or request.user.username}
+📅 {timezone.now().strftime('%d/%m/%Y %H:%M')}
+
+━━━━━━━━━━━━━━━━
+
+*📌 TEMA*
+{title}
+
+━━━━━━━━━━━━━━━━
+
+*💬 LO QUE COMPARTIÓ*
+{user_input}
+
+━━━━━━━━━━━━━━━━
+
+*🤖 RESPUESTA DEL GERENTE IA*
+{ai_response}
+"""
+                    
+                    queue_telegram(
+                        bot_token=manager.telegram_bot_token,
+                        chat_id=manager.telegram_chat_id,
+                        text=telegram_message,
+                        parse_mode='Markdown'
+                    )
+                    
+                    messages.success(request, 'Reunión registrada y análisis generado; se enviará por Telegram en unos segundos')
+                except Exception as telegram_error:
+                    messages.success(request, f'Reunión registrada exitosamente (Telegram: {str(telegram_error)})')
+            else:
+                messages.success(request, 'Reunión registrada y análisis generado exitosamente')
+            
+            return redirect('ai_manager_meeting_detail', pk=meeting.pk)
+            
+        except Exception as e:
+            messages.error(request, f'Error al procesar la reunión: {str(e)}')
+            return render(request, 'tickets/ai_manager_meeting_form.html', {
+                'manager': manager,
+                'page_title': f'Nueva Reunión con {manager.name}'
+            })
+    
+    context = {
+        'manager': manager,
+        'page_title': f'Nueva Reunión con {manager.name}'
+    }
+    return render(request, 'tickets/ai_manager_meeting_form.html', context)
+
+
+@login_required
+def ai_manager_meetings(request, pk):
+    """Lista de reuniones de un gerente IA"""
+    manager = get_object_or_404(AIManager, pk=pk)
+    
+    # Verificar permisos
+    user_companies = get_user_companies(request.user)
+    
+    if manager.company not in user_companies:
+        messages.error(request, 'No tienes permiso para ver estas reuniones')
+        return redirect('ai_manager_list')
+    
+    # Si es admin/gerente, ver todas. Si no, solo las suyas
+    if request.user.is_staff or request.user == manager.created_by:
+        meetings = manager.meetings.select_related('user').order_by('-created_at')
+    else:
+        meetings = manager.meetings.filter(user=request.user).order_by('-created_at')
+    
+    # Filtros
+    search = request.GET.get('search', '')
+    input_type = request.GET.get('input_type', '')
+    user_filter = request.GET.get('user', '')
+    
+    if search:
+        meetings = meetings.filter(
+            Q(title__icontains=search) | 
+            Q(user_input__icontains=search) |
+            Q(ai_summary__icontains=search)
+        )
+    
+    if input_type:
+        meetings = meetings.filter(input_type=input_type)
+    
+    if user_filter:
+        meetings = meetings.filter(user_id=user_filter)
+    
+    # Estadísticas dinámicas
+    all_meetings = manager.meetings.all()
+    stats = {
+        'total_meetings': all_meetings.count(),
+        'text_meetings': all_meetings.filter(input_type='text').count(),
+        'audio_meetings': all_meetings.filter(input_type='audio').count(),
+        'unique_users': all_meetings.values('user').distinct().count(),
+    }
+    
+    # Usuarios únicos para el filtro
+    users = User.objects.filter(
+        id__in=manager.meetings.values_list('user_id', flat=True).distinct()
+    ).order_by('first_name', 'last_name')
+    
+    # Paginación
+    paginator = Paginator(meetings, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'manager': manager,
+        'meetings': page_obj,
+        'page_obj': page_obj,
+        'is_paginated': page_obj.has_other_pages(),
+        'stats': stats,
+        'users': users,
+        'page_title': f'Reuniones - {manager.name}'
+    }
+    return render(request, 'tickets/ai_manager_meetings.html', context)
+
+
+@login_required
+def ai_manager_meeting_detail(request, pk):
+    """Detalle de una reunión"""
+    meeting = get_object_or_404(AIManagerMeeting, pk=pk)
+    
+    # Verificar permisos
+    if meeting.user != request.user and not request.user.is_staff:
+        messages.error(request, 'No tienes permiso para ver esta reunión')
+        return redirect('ai_manager_list')
+    
+    context = {
+        'meeting': meeting,
+        'page_title': meeting.title
+    }
+    return render(request, 'tickets/ai_manager_meeting_detail.html', context)
+
+
+@login_required
+def ai_manager_generate_summary(request, pk):
+    """Generar resumen general del gerente IA"""
+    manager = get_object_or_404(AIManager, pk=pk)
+    
+    # Verificar permisos (solo admin o creador)
+    if not request.user.is_staff and request.user != manager.created_by:
+        messages.error(request, 'No tienes permiso para generar resúmenes')
+        return redirect('ai_manager_detail', pk=pk)
+    
+    if request.method == 'POST':
+        period_start = request.POST.get('period_start')
+        period_end = request.POST.get('period_end')
+        
+        if not period_start or not period_end:
+            messages.error(request, 'Por favor selecciona las fechas')
+            return redirect('ai_manager_detail', pk=pk)
+        
+        try:
+            from datetime import datetime
+            start_date = datetime.strptime(period_start, '%Y-%m-%d').date()
+            end_date = datetime.strptime(period_end, '%Y-%m-%d').date()
+            
+            # Obtener reuniones del período
+            meetings = manager.meetings.filter(
+                created_at__date__gte=start_date,
+                created_at__date__lte=end_date
+            ).select_related('user')
+            
+            if not meetings.exists():
+                messages.warning(request, 'No hay reuniones en este período')
+                return redirect('ai_manager_detail', pk=pk)
+            
+            # Generar resumen con IA
+            from .models import SystemConfiguration
+            config = SystemConfiguration.get_config()
+            
+            if not config.openai_api_key:
+                messages.warning(request, 'No se puede generar resumen (API key no configurada)')
+                return redirect('ai_manager_detail', pk=pk)
+            
+            from openai import OpenAI
+            client = OpenAI(api_key=config.openai_api_key)
+            
+            # Preparar contexto de todas las reuniones
+            meetings_context = ""
+            for i, meeting in enumerate(meetings, 1):
+                meetings_context += f"\n\n=== Reunión {i}: {meeting.title} ===\n"
+                meetings_context += f"Usuario: {meeting.user.username}\n"
+                meetings_context += f"Fecha: {meeting.created_at.strftime('%d/%m/%Y')}\n"
+                meetings_context += f"Entrada: {meeting.user_input[:500]}...\n"
+                meetings_context += f"Resumen: {meeting.ai_summary}\n"
+                meetings_context += f"Áreas de mejora: {meeting.improvement_areas}\n"
+            
+            # Generar resumen
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"""Eres {manager.name}, {manager.get_category_display()} de {manager.company.name}.
+
+Analiza todas las reuniones del período y genera un resumen ejecutivo completo que incluya:
+1. Resumen general de lo discutido
+2. Patrones y tendencias identificadas
+3. Logros y progreso del equipo
+4. Desafíos principales
+5. Recomendaciones estratégicas para la empresa
+
+IMPORTANTE:
+- NO uses formato Markdown (nada de **, ##, ###, -, *, etc.)
+- Para resaltar texto importante usa HTML: <strong>texto</strong>
+- Escribe párrafos normales separados por saltos de línea doble
+- Usa números simples (1., 2., 3.) para las listas
+- Sé específico, profesional y orientado a la acción"""
+                    },
+                    {
+                        "role": "user",
+                        "content": f"""Período: {start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')}
+Total de reuniones: {meetings.count()}
+Participantes únicos: {meetings.values('user').distinct().count()}
+
+{meetings_context}
+
+Por favor genera el resumen ejecutivo completo."""
+                    }
+                ],
+                max_tokens=2000
+            )
+            
+            summary_text = response.choices[0].message.content.strip()
+            tokens_used = response.usage.total_tokens
+            
+            # Generar insights clave
+            insights_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "Extrae 5-7 insights clave más importantes del resumen. NO uses Markdown. Usa <strong>texto</strong> para resaltar conceptos clave. Formato: lista numerada simple (1., 2., 3., etc.)."
+                    },
+                    {
+                        "role": "user",
+                        "content": summary_text
+                    }
+                ],
+                max_tokens=500
+            )
+            
+            key_insights = insights_response.choices[0].message.content.strip()
+            tokens_used += insights_response.usage.total_tokens
+            
+            # Generar recomendaciones
+            recommendations_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "Genera 5-7 recomendaciones estratégicas específicas y accionables para la empresa. NO uses Markdown. Usa <strong>texto</strong> para resaltar acciones clave. Formato: lista numerada simple (1., 2., 3., etc.)."
+                    },
+                    {
+                        "role": "user",
+                        "content": summary_text
+                    }
+                ],
+                max_tokens=500
+            )
+            
+            recommendations = recommendations_response.choices[0].message.content.strip()
+            tokens_used += recommendations_response.usage.total_tokens
+            
+            # Crear el resumen
+            summary = AIManagerSummary.objects.create(
+                ai_manager=manager,
+                period_start=start_date,
+                period_end=end_date,
+                summary_text=summary_text,
+                key_insights=key_insights,
+                recommendations=recommendations,
+                total_meetings=meetings.count(),
+                participants_count=meetings.values('user').distinct().count(),
+                tokens_used=tokens_used
+            )
+            
+            # Enviar por Telegram si está habilitado
+            if manager.telegram_enabled and manager.telegram_chat_id and manager.telegram_bot_token:
+                try:
+                    from .notification_utils import queue_telegram
+                    
+                    # Formatear mensaje para Telegram
+                    telegram_message = f"""
+📊 *Resumen Ejecutivo - {manager.name}*
+🏢 {manager.company.name}
+
+📅 *Período:* {start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')}
+👥 *Participantes:* {summary.participants_count}
+📝 *Reuniones:* {summary.total_meetings}
+
+━━━━━━━━━━━━━━━━
+
+*📝 RESUMEN*
+{summary_text}
+
+━━━━━━━━━━━━━━━━
+
+*💡 INSIGHTS CLAVE*
+{key_insights}
+
+━━━━━━━━━━━━━━━━
+
+*🎯 RECOMENDACIONES*
+{recommendations}
+"""
+                    
+                    queue_telegram(
+                        bot_token=manager.telegram_bot_token,
+                        chat_id=manager.telegram_chat_id,
+                        text=telegram_message,
+                        parse_mode='Markdown'
+                    )
+                    
+                    messages.success(request, 'Resumen ejecutivo generado; se enviará por Telegram en unos segundos')
+                    
+                except Exception as telegram_error:
+                    messages.warning(request, f'Resumen generado pero error al enviar por Telegram: {str(telegram_error)}')
+            else:
+                messages.success(request, 'Resumen ejecutivo generado exitosamente')
+            
+            return redirect('ai_manager_detail', pk=pk)
+            
+        except Exception as e:
+            messages.error(request, f'Error al generar resumen: {str(e)}')
+            return redirect('ai_manager_detail', pk=pk)
+    
+    # GET: Mostrar formulario
+    from datetime import date
+    meetings = manager.meetings.all()
+    stats = {
+        'total_meetings': meetings.count(),
+        'active_users': meetings.values('user').distinct().count(),
+        'total_summaries': manager.summaries.count(),
+    }
+    
+    context = {
+        'manager': manager,
+        'stats': stats,
+        'today': date.today().isoformat(),
+        'page_title': f'Generar Resumen - {manager.name}'
+    }
+    return render(request, 'tickets/ai_manager_summary_form.html', context)
+
+
+@login_required
+def ai_manager_summary_detail(request, pk):
+    """Ver detalle de un resumen ejecutivo"""
+    summary = get_object_or_404(AIManagerSummary, pk=pk)
+    
+    # Verificar permisos
+    user_companies = get_user_companies(request.user)
+    
+    if summary.ai_manager.company not in user_companies:
+        messages.error(request, 'No tienes permiso para ver este resumen')
+        return redirect('ai_manager_list')
+    
+    context = {
+        'summary': summary,
+        'page_title': f'Resumen Ejecutivo - {summary.ai_manager.name}'
+    }
+    return render(request, 'tickets/ai_manager_summary_detail.html', context)
+
+
+# ==================== COMPANY AI DASHBOARD ====================
+
+def clean_markdown_to_html(text):
+    """Convierte Markdown a HTML y limpia formato"""
+    import re
+    
+    # Reemplazar **texto** con <strong>texto</strong>
+    text = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', text)
+    
+    # Reemplazar *texto* con <em>texto</em>
+    text = re.sub(r'\*(.*?)\*', r'<em>\1</em>', text)
+    
+    # Reemplazar ### título con <strong>título</strong>
+    text = re.sub(r'###\s+(.*?)(\n|$)', r'<strong>\1</strong><br><br>', text)
+    text = re.sub(r'##\s+(.*?)(\n|$)', r'<strong>\1</strong><br><br>', text)
+    text = re.sub(r'#\s+(.*?)(\n|$)', r'<strong>\1</strong><br><br>', text)
+    
+    # Reemplazar saltos de línea dobles con <br><br>
+    text = re.sub(r'\n\n+', '<br><br>', text)
+    
+    # Reemplazar saltos de línea simples con <br>
+    text = re.sub(r'\n', '<br>', text)
+    
+    # Limpiar listas con - o *
+    text = re.sub(r'<br>\s*[-*]\s+', '<br>• ', text)
+    
+    return text.strip()
+
+
+@login_required
+def company_ai_dashboard_list(request):
+    """Lista de empresas con gerentes IA"""
+    user_companies = get_user_companies(request.user)
+    
+    # Obtener estadísticas de cada empresa
+    companies_data = []
+    for company in user_companies:
+        managers = AIManager.objects.filter(company=company)
+        meetings = AIManagerMeeting.objects.filter(ai_manager__company=company)
+        
+        # Solo incluir empresas que tengan al menos un gerente O al menos una reunión
+        total_managers = managers.count()
+        total_meetings = meetings.count()
+        
+        if total_managers > 0 or total_meetings > 0:
+            companies_data.append({
+                'company': company,
+                'total_managers': total_managers,
+                'active_managers': managers.filter(is_active=True).count(),
+                'total_meetings': total_meetings,
+                'total_participants': meetings.values('user').distinct().count(),
+                'total_summaries': CompanyAISummary.objects.filter(company=company).count(),
+            })
+    
+    context = {
+        'companies_data': companies_data,
+        'page_title': 'Dashboard Empresarial IA'
+    }
+    return render(request, 'tickets/company_ai_dashboard_list.html', context)
+
+
+@login_required
+def company_ai_dashboard_detail(request, pk):
+    """Dashboard detallado de una empresa con sus gerentes IA"""
+    company = get_object_or_404(Company, pk=pk)
+    
+    # Verificar permisos
+    user_companies = get_user_companies(request.user)
+    
+    if company not in user_companies:
+        messages.error(request, 'No tienes permiso para ver este dashboard')
+        return redirect('company_ai_dashboard_list')
+    
+    # Obtener todos los gerentes de la empresa
+    managers = AIManager.objects.filter(company=company).prefetch_related('meetings')
+    
+    # Obtener todas las reuniones
+    all_meetings = AIManagerMeeting.objects.filter(ai_manager__company=company)
+    
+    # Estadísticas generales
+    total_meetings = all_meetings.count()
+    total_participants = all_meetings.values('user').distinct().count()
+    total_tokens = all_meetings.aggregate(total=Sum('tokens_used'))['total'] or 0
+    
+    # Estadísticas por gerente
+    managers_stats = []
+    for manager in managers:
+        manager_meetings = all_meetings.filter(ai_manager=manager)
+        managers_stats.append({
+            'manager': manager,
+            'total_meetings': manager_meetings.count(),
+            'active_users': manager_meetings.values('user').distinct().count(),
+            'total_tokens': manager_meetings.aggregate(total=Sum('tokens_used'))['total'] or 0,
+        })
+    
+    # Usuarios participantes con conteo de reuniones
+    from django.db.models import Count
+    participants = User.objects.filter(
+        id__in=all_meetings.values_list('user_id', flat=True).distinct()
+    ).annotate(
+        meeting_count=Count('ai_manager_meetings', filter=Q(ai_manager_meetings__ai_manager__company=company))
+    ).order_by('first_name', 'last_name')
+    
+    # Resúmenes empresariales
+    company_summaries = CompanyAISummary.objects.filter(company=company).order_by('-created_at')[:5]
+    
+    # Reuniones recientes
+    recent_meetings = all_meetings.select_related('ai_manager', 'user').order_by('-created_at')[:10]
+    
+    context = {
+        'company': company,
+        'managers': managers,
+        'managers_stats': managers_stats,
+        'participants': participants,
+        'company_summaries': company_summaries,
+        'recent_meetings': recent_meetings,
+        'total_meetings': total_meetings,
+        'total_participants': total_participants,
+        'total_tokens': total_tokens,
+        'page_title': f'Dashboard - {company.name}'
+    }
+    return render(request, 'tickets/company_ai_dashboard_detail.html', context)
+
+
+@login_required
+def company_ai_generate_summary(request, pk):
+    """Generar resumen empresarial general"""
+    
+    company = get_object_or_404(Company, pk=pk)
+    
+    # Verificar permisos (solo admin o staff)
+    user_companies = get_user_companies(request.user)
+    
+    if company not in user_companies:
+        messages.error(request, 'No tienes permiso para generar resúmenes')
+        return redirect('company_ai_dashboard_list')
+    
+    if not request.user.is_staff:
+        messages.error(request, 'Solo administradores pueden generar resúmenes empresariales')
+        return redirect('company_ai_dashboard_detail', pk=pk)
+    
+    if request.method == 'POST':
+        period_start = request.POST.get('period_start')
+        period_end = request.POST.get('period_end')
+        
+        if not period_start or not period_end:
+            messages.error(request, 'Por favor selecciona las fechas')
+            return redirect('company_ai_dashboard_detail', pk=pk)
+        
+        try:
+            from datetime import datetime
+            start_date = datetime.strptime(period_start, '%Y-%m-%d').date()
+            end_date = datetime.strptime(period_end, '%Y-%m-%d').date()
+            
+            # Obtener todos los gerentes y reuniones del período
+            managers = AIManager.objects.filter(company=company)
+            meetings = AIManagerMeeting.objects.filter(
+                ai_manager__company=company,
+                created_at__date__gte=start_date,
+                created_at__date__lte=end_date
+            ).select_related('ai_manager', 'user')
+            
+            if not meetings.exists():
+                messages.warning(request, 'No hay reuniones en este período')
+                return redirect('company_ai_dashboard_detail', pk=pk)
+            
+            # Generar resumen con IA
+            from .models import SystemConfiguration
+            config = SystemConfiguration.get_config()
+            
+            if not config.openai_api_key:
+                messages.warning(request, 'No se puede generar resumen (API key no configurada)')
+                return redirect('company_ai_dashboard_detail', pk=pk)
+            
+            from openai import OpenAI
+            client = OpenAI(api_key=config.openai_api_key)
+            
+            # Preparar contexto agrupado por gerente
+            managers_context = ""
+            for manager in managers:
+                manager_meetings = meetings.filter(ai_manager=manager)
+                if manager_meetings.exists():
+                    managers_context += f"\n\n{'='*60}\n"
+                    managers_context += f"GERENTE: {manager.name} ({manager.get_category_display()})\n"
+                    managers_context += f"Total de reuniones: {manager_meetings.count()}\n"
+                    managers_context += f"{'='*60}\n"
+                    
+                    for i, meeting in enumerate(manager_meetings[:10], 1):  # Max 10 por gerente
+                        managers_context += f"\nReunión {i}: {meeting.title}\n"
+                        managers_context += f"Usuario: {meeting.user.get_full_name() or meeting.user.username}\n"
+                        managers_context += f"Fecha: {meeting.created_at.strftime('%d/%m/%Y')}\n"
+                        managers_context += f"Resumen: {meeting.ai_summary[:300]}...\n"
+            
+            # Generar resumen ejecutivo
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"""Eres un analista ejecutivo de {company.name}.
+
+Analiza toda la información de los diferentes gerentes IA y genera un resumen ejecutivo empresarial completo.
+
+{f"OBJETIVOS EMPRESARIALES A CONSIDERAR:{chr(10)}{company.business_objectives}{chr(10)}{chr(10)}" if company.business_objectives else ""}Incluye:
+1. Visión general del desempeño de la empresa
+2. Análisis transversal de todas las áreas
+3. Patrones y tendencias identificadas a nivel empresa
+4. Sinergias y áreas de oportunidad entre departamentos
+{f"5. Evaluación del progreso hacia los objetivos empresariales definidos" if company.business_objectives else ""}
+
+IMPORTANTE SOBRE EL FORMATO:
+- NO uses formato Markdown (nada de **, ##, ###, -, *, etc.)
+- Para resaltar texto importante usa HTML: <strong>texto</strong>
+- Para saltos de línea usa <br> o <br><br> para doble espacio
+- Escribe en párrafos claros separados con <br><br>
+- Usa listas con números seguidos de punto y <br> entre items
+- Enfoque estratégico para la dirección"""
+                    },
+                    {
+                        "role": "user",
+                        "content": f"""Período: {start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')}
+Empresa: {company.name}
+Total de gerentes activos: {managers.filter(is_active=True).count()}
+Total de reuniones: {meetings.count()}
+Participantes únicos: {meetings.values('user').distinct().count()}
+
+{managers_context}
+
+Genera el resumen ejecutivo empresarial."""
+                    }
+                ],
+                max_tokens=2500
+            )
+            
+            executive_summary = response.choices[0].message.content.strip()
+            executive_summary = clean_markdown_to_html(executive_summary)
+            tokens_used = response.usage.total_tokens
+            
+            # Generar métricas clave
+            metrics_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"""Extrae 5-7 métricas y KPIs clave del resumen.
+
+{f"OBJETIVOS EMPRESARIALES:{chr(10)}{company.business_objectives}{chr(10)}{chr(10)}Prioriza métricas relacionadas con estos objetivos.{chr(10)}{chr(10)}" if company.business_objectives else ""}FORMATO:
+- NO uses formato Markdown (nada de **, ##, ###, -, *, etc.)
+- Usa <strong>texto</strong> para resaltar números y métricas importantes
+- Usa <br> para separar cada métrica
+- Lista numerada simple: 1. Métrica<br>2. Métrica<br>etc.
+- Cada métrica debe tener el valor destacado con <strong>"""
+                    },
+                    {
+                        "role": "user",
+                        "content": executive_summary
+                    }
+                ],
+                max_tokens=500
+            )
+            
+            key_metrics = metrics_response.choices[0].message.content.strip()
+            key_metrics = clean_markdown_to_html(key_metrics)
+            tokens_used += metrics_response.usage.total_tokens
+            
+            # Generar destacados por departamento
+            highlights_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": """Resume los logros más importantes de cada departamento/gerente.
+
+FORMATO:
+- NO uses formato Markdown (nada de **, ##, ###, -, *, etc.)
+- Usa <strong>texto</strong> para resaltar logros importantes
+- Usa <br><br> para separar departamentos
+- Usa <br> para separar logros dentro de un departamento
+- Organiza por departamento con el nombre del departamento en <strong>Departamento:</strong>"""
+                    },
+                    {
+                        "role": "user",
+                        "content": managers_context
+                    }
+                ],
+                max_tokens=800
+            )
+            
+            department_highlights = highlights_response.choices[0].message.content.strip()
+            department_highlights = clean_markdown_to_html(department_highlights)
+            tokens_used += highlights_response.usage.total_tokens
+            
+            # Generar desafíos
+            challenges_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": """Identifica los 5-7 desafíos más importantes que enfrenta la empresa.
+
+FORMATO:
+- NO uses formato Markdown (nada de **, ##, ###, -, *, etc.)
+- Usa <strong>texto</strong> para resaltar desafíos críticos
+- Usa <br> para separar cada desafío
+- Lista numerada simple: 1. Desafío<br>2. Desafío<br>etc.
+- Cada desafío debe ser claro y accionable"""
+                    },
+                    {
+                        "role": "user",
+                        "content": executive_summary
+                    }
+                ],
+                max_tokens=600
+            )
+            
+            challenges = challenges_response.choices[0].message.content.strip()
+            challenges = clean_markdown_to_html(challenges)
+            tokens_used += challenges_response.usage.total_tokens
+            
+            # Generar recomendaciones estratégicas
+            recommendations_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"""Genera 7-10 recomendaciones estratégicas para la dirección.
+
+{f"OBJETIVOS EMPRESARIALES:{chr(10)}{company.business_objectives}{chr(10)}{chr(10)}Las recomendaciones deben estar alineadas con estos objetivos.{chr(10)}{chr(10)}" if company.business_objectives else ""}FORMATO:
+- NO uses formato Markdown (nada de **, ##, ###, -, *, etc.)
+- Usa <strong>texto</strong> para resaltar acciones clave y prioridades
+- Usa <br> para separar cada recomendación
+- Lista numerada con prioridades: 1. [ALTA] Recomendación<br>2. [MEDIA] Recomendación<br>etc.
+- Cada recomendación debe ser específica y accionable"""
+                    },
+                    {
+                        "role": "user",
+                        "content": executive_summary
+                    }
+                ],
+                max_tokens=800
+            )
+            
+            strategic_recommendations = recommendations_response.choices[0].message.content.strip()
+            strategic_recommendations = clean_markdown_to_html(strategic_recommendations)
+            tokens_used += recommendations_response.usage.total_tokens
+            
+            # Crear el resumen empresarial
+            summary = CompanyAISummary.objects.create(
+                company=company,
+                period_start=start_date,
+                period_end=end_date,
+                executive_summary=executive_summary,
+                key_metrics=key_metrics,
+                department_highlights=department_highlights,
+                challenges=challenges,
+                strategic_recommendations=strategic_recommendations,
+                total_managers=managers.count(),
+                total_meetings=meetings.count(),
+                total_participants=meetings.values('user').distinct().count(),
+                tokens_used=tokens_used,
+                generated_by=request.user
+            )
+            
+            messages.success(request, 'Resumen empresarial generado exitosamente')
+            return redirect('company_ai_summary_detail', pk=summary.pk)
+            
+        except Exception as e:
+            messages.error(request, f'Error al generar resumen: {str(e)}')
+            return redirect('company_ai_dashboard_detail', pk=pk)
+    
+    # GET: Mostrar formulario
+    from datetime import date
+    managers = AIManager.objects.filter(company=company)
+    meetings = AIManagerMeeting.objects.filter(ai_manager__company=company)
+    
+    stats = {
+        'total_managers': managers.count(),
+        'total_meetings': meetings.count(),
+        'total_participants': meetings.values('user').distinct().count(),
+        'total_summaries': CompanyAISummary.objects.filter(company=company).count(),
+    }
+    
+    context = {
+        'company': company,
+        'stats': stats,
+        'today': date.today().isoformat(),
+        'page_title': f'Generar Resumen Empresarial - {company.name}'
+    }
+    return render(request, 'tickets/company_ai_summary_form.html', context)
+
+
+@login_required
+def company_ai_summary_detail(request, pk):
+    """Ver detalle de un resumen empresarial"""
+    summary = get_object_or_404(CompanyAISummary, pk=pk)
+    
+    # Verificar permisos
+    user_companies = get_user_companies(request.user)
+    
+    if summary.company not in user_companies:
+        messages.error(request, 'No tienes permiso para ver este resumen')
+        return redirect('company_ai_dashboard_list')
+    
+    context = {
+        'summary': summary,
+        'page_title': f'Resumen Empresarial - {summary.company.name}'
+    }
+    return render(request, 'tickets/company_ai_summary_detail.html', context)
+
+
+# =============================================================================
+# VISTAS PARA DASHBOARD DE DESEMPEÑO DE USUARIOS IA
+# =============================================================================
+
+@login_required
+def user_ai_performance_dashboard(request):
+    """Dashboard principal de desempeño de usuarios con IA"""
+    user_companies = get_user_companies(request.user)
+    
+    # Obtener usuarios con reuniones de IA
+    from django.db.models import Count, Avg, Max
+    users_with_meetings = User.objects.filter(
+        ai_manager_meetings__ai_manager__company__in=user_companies
+    ).annotate(
+        meeting_count=Count('ai_manager_meetings'),
+        last_meeting=Max('ai_manager_meetings__created_at'),
+        avg_score=Avg('ai_performance_evaluations__overall_score')
+    ).filter(meeting_count__gt=0).distinct().order_by('-meeting_count')
+    
+    # Preparar datos
+    users_data = []
+    for user in users_with_meetings:
+        latest_evaluation = user.ai_performance_evaluations.order_by('-evaluation_date').first()
+        
+        users_data.append({
+            'user': user,
+            'meeting_count': user.meeting_count,
+            'last_meeting': user.last_meeting,
+            'avg_score': user.avg_score or 0,
+            'latest_evaluation': latest_evaluation,
+            'has_evaluation': latest_evaluation is not None
+        })
+    
+    context = {
+        'users_data': users_data,
+        'total_users': len(users_data),
+        'page_title': 'Dashboard de Desempeño de Usuarios IA'
+    }
+    return render(request, 'tickets/user_ai_performance_dashboard.html', context)
+
+
+@login_required
+def user_ai_performance_detail(request, user_id):
+    """Detalle de desempeño de un usuario específico"""
+    user = get_object_or_404(User, pk=user_id)
+    user_companies = get_user_companies(request.user)
+    
+    # Verificar que el usuario tiene reuniones en empresas accesibles
+    user_meetings = AIManagerMeeting.objects.filter(
+        user=user,
+        ai_manager__company__in=user_companies
+    )
+    
+    if not user_meetings.exists():
+        messages.error(request, 'Este usuario no tiene reuniones registradas')
+        return redirect('user_ai_performance_dashboard')
+    
+    # Obtener evaluaciones
+    evaluations = UserAIPerformanceEvaluation.objects.filter(user=user).order_by('-evaluation_date')
+    
+    # Estadísticas
+    from django.db.models import Avg, Count
+    stats = {
+        'total_meetings': user_meetings.count(),
+        'total_evaluations': evaluations.count(),
+        'avg_score': evaluations.aggregate(Avg('overall_score'))['overall_score__avg'] or 0,
+        'latest_score': evaluations.first().overall_score if evaluations.exists() else 0,
+    }
+    
+    # Datos para gráfico de progreso
+    chart_data = {
+        'labels': [eval.evaluation_date.strftime('%d/%m/%Y') for eval in evaluations[:10][::-1]],
+        'overall_scores': [eval.overall_score for eval in evaluations[:10][::-1]],
+        'productivity_scores': [eval.productivity_score for eval in evaluations[:10][::-1]],
+        'communication_scores': [eval.communication_score for eval in evaluations[:10][::-1]],
+    }
+    
+    context = {
+        'evaluated_user': user,
+        'evaluations': evaluations,
+        'stats': stats,
+        'chart_data': chart_data,
+        'page_title': f'Desempeño de {user.get_full_name()}'
+    }
+    return render(request, 'tickets/user_ai_performance_detail.html', context)
+
+
+@login_required
+def user_ai_performance_generate(request, user_id):
+    """Generar nueva evaluación de desempeño para un usuario"""
+    user = get_object_or_404(User, pk=user_id)
+    user_companies = get_user_companies(request.user)
+    
+    if request.method == 'POST':
+        period_start = request.POST.get('period_start')
+        period_end = request.POST.get('period_end')
+        
+        if not period_start or not period_end:
+            messages.error(request, 'Por favor selecciona las fechas del período')
+            return redirect('user_ai_performance_detail', user_id=user_id)
+        
+        try:
+            from datetime import datetime
+            start_date = datetime.strptime(period_start, '%Y-%m-%d').date()
+            end_date = datetime.strptime(period_end, '%Y-%m-%d').date()
+            
+            # Obtener reuniones del período
+            meetings = AIManagerMeeting.objects.filter(
+                user=user,
+                ai_manager__company__in=user_companies,
+                created_at__date__gte=start_date,
+                created_at__date__lte=end_date
+            ).select_related('ai_manager')
+            
+            if not meetings.exists():
+                messages.warning(request, 'No hay reuniones en este período')
+                return redirect('user_ai_performance_detail', user_id=user_id)
+            
+            # Generar evaluación con IA
+            from .models import SystemConfiguration
+            config = SystemConfiguration.get_config()
+            
+            if not config.openai_api_key:
+                messages.error(request, 'No hay API key configurada')
+                return redirect('user_ai_performance_detail', user_id=user_id)
+            
+            from openai import OpenAI
+            client = OpenAI(api_key=config.openai_api_key)
+            
+            # Preparar contexto de reuniones
+            meetings_context = ""
+            for i, meeting in enumerate(meetings[:20], 1):  # Limitar a 20 reuniones
+                meetings_context += f"\nReunión {i} - {meeting.created_at.strftime('%d/%m/%Y')}:\n"
+                meetings_context += f"Gerente: {meeting.ai_manager.name}\n"
+                meetings_context += f"Tema: {meeting.title}\n"
+                meetings_context += f"Input del usuario: {meeting.user_input[:300]}...\n"
+                meetings_context += f"Resumen: {meeting.ai_summary[:200]}...\n"
+                meetings_context += f"Áreas de mejora: {meeting.improvement_areas[:150]}...\n\n"
+            
+            # Llamada 1: Evaluación general y puntuaciones
+            evaluation_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"""Eres un evaluador de desempeño experto. Analiza las reuniones del usuario y genera una evaluación completa.
+
+Usuario: {user.get_full_name()}
+Período: {start_date} a {end_date}
+Total de reuniones: {meetings.count()}
+
+{meetings_context}
+
+Genera una evaluación con:
+1. Puntuación general (1-100)
+2. Productividad (1-100)
+3. Comunicación (1-100)
+4. Logro de objetivos (1-100)
+5. Consistencia (1-100)
+
+FORMATO DE RESPUESTA (EXACTAMENTE ASÍ):
+OVERALL: [número]
+PRODUCTIVITY: [número]
+COMMUNICATION: [número]
+GOALS: [número]
+CONSISTENCY: [número]
+
+Luego agrega un análisis de 2-3 párrafos explicando las puntuaciones. NO uses Markdown, usa <strong>texto</strong> para resaltar."""
+                    }
+                ],
+                max_tokens=600
+            )
+            
+            eval_text = evaluation_response.choices[0].message.content.strip()
+            tokens_used = evaluation_response.usage.total_tokens
+            
+            # Parsear puntuaciones
+            import re
+            overall_match = re.search(r'OVERALL:\s*(\d+)', eval_text)
+            productivity_match = re.search(r'PRODUCTIVITY:\s*(\d+)', eval_text)
+            communication_match = re.search(r'COMMUNICATION:\s*(\d+)', eval_text)
+            goals_match = re.search(r'GOALS:\s*(\d+)', eval_text)
+            consistency_match = re.search(r'CONSISTENCY:\s*(\d+)', eval_text)
+            
+            overall_score = int(overall_match.group(1)) if overall_match else 75
+            productivity_score = int(productivity_match.group(1)) if productivity_match else 75
+            communication_score = int(communication_match.group(1)) if communication_match else 75
+            goal_achievement_score = int(goals_match.group(1)) if goals_match else 75
+            consistency_score = int(consistency_match.group(1)) if consistency_match else 75
+            
+            # Extraer resumen (después de las puntuaciones)
+            summary_parts = eval_text.split('CONSISTENCY:')
+            ai_summary = summary_parts[1].strip() if len(summary_parts) > 1 else eval_text
+            ai_summary = clean_markdown_to_html(ai_summary)
+            
+            # Llamada 2: Fortalezas
+            strengths_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"""Identifica las 3-5 principales fortalezas del usuario basándote en sus reuniones.
+
+{meetings_context[:2000]}
+
+Lista las fortalezas de forma concreta y específica. NO uses Markdown, usa <strong>texto</strong> para resaltar. Formato: lista numerada simple."""
+                    }
+                ],
+                max_tokens=300
+            )
+            
+            strengths = strengths_response.choices[0].message.content.strip()
+            strengths = clean_markdown_to_html(strengths)
+            tokens_used += strengths_response.usage.total_tokens
+            
+            # Llamada 3: Áreas de mejora
+            improvement_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"""Identifica las 3-5 principales áreas de mejora del usuario.
+
+{meetings_context[:2000]}
+
+Lista las áreas que necesitan trabajo. Sé constructivo. NO uses Markdown, usa <strong>texto</strong> para resaltar."""
+                    }
+                ],
+                max_tokens=300
+            )
+            
+            improvement_areas = improvement_response.choices[0].message.content.strip()
+            improvement_areas = clean_markdown_to_html(improvement_areas)
+            tokens_used += improvement_response.usage.total_tokens
+            
+            # Llamada 4: Recomendaciones de capacitación
+            training_response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"""Sugiere 3-5 cursos, entrenamientos o recursos específicos que ayudarían al usuario a mejorar.
+
+Áreas de mejora identificadas:
+{improvement_areas}
+
+Proporciona recomendaciones concretas (nombres de cursos, temas, plataformas). NO uses Markdown, usa <strong>texto</strong> para resaltar."""
+                    }
+                ],
+                max_tokens=300
+            )
+            
+            training_recommendations = training_response.choices[0].message.content.strip()
+            training_recommendations = clean_markdown_to_html(training_recommendations)
+            tokens_used += training_response.usage.total_tokens
+            
+            # Crear la evaluación
+            evaluation = UserAIPerformanceEvaluation.objects.create(
+                user=user,
+                company=meetings.first().ai_manager.company,
+                evaluation_date=end_date,
+                overall_score=overall_score,
+                productivity_score=productivity_score,
+                communication_score=communication_score,
+                goal_achievement_score=goal_achievement_score,
+                consistency_score=consistency_score,
+                improvement_areas=improvement_areas,
+                training_recommendations=training_recommendations,
+                strengths=strengths,
+                meetings_analyzed=meetings.count(),
+                period_start=start_date,
+                period_end=end_date,
+                ai_summary=ai_summary,
+                tokens_used=tokens_used,
+                generated_by=request.user
+            )
+            
+            messages.success(request, f'Evaluación generada exitosamente. Puntuación: {overall_score}/100')
+            return redirect('user_ai_performance_detail', user_id=user_id)
+            
+        except Exception as e:
+            messages.error(request, f'Error al generar evaluación: {str(e)}')
+            return redirect('user_ai_performance_detail', user_id=user_id)
+    
+    return redirect('user_ai_performance_detail', user_id=user_id)
+
+
+# ============================================
+# VISTAS PARA GENERADOR DE LIBROS CON IA
+# ============================================
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_list(request):
+    """Lista de libros generados con IA"""
+    from .models import AIBook, AIBookChapter
+    from django.db.models import Count, Sum, Q, Avg
+    
+    books = AIBook.objects.all().select_related('created_by', 'company').prefetch_related('chapters')
+    
+    # Filtros
+    status_filter = request.GET.get('status')
+    if status_filter:
+        books = books.filter(status=status_filter)
+    
+    # Calcular estadísticas generales
+    stats = AIBookChapter.objects.all().aggregate(
+        total_chapters=Count('id'),
+        completed_chapters=Count('id', filter=Q(status__in=['content_generated', 'completed'])),
+        total_words=Sum('word_count'),
+        avg_words=Avg('word_count', filter=Q(status__in=['content_generated', 'completed']))
+    )
+    
+    total_chapters = stats['total_chapters'] or 0
+    completed_chapters = stats['completed_chapters'] or 0
+    total_words = (stats['total_words'] or 0) / 1000  # Convertir a miles
+    avg_words_per_chapter = stats['avg_words'] or 0
+    
+    completion_percentage = int((completed_chapters / total_chapters * 100)) if total_chapters > 0 else 0
+    
+    # Paginación
+    paginator = Paginator(books, 20)
+    page_number = request.GET.get('page')
+    books_page = paginator.get_page(page_number)
+    
+    context = {
+        'books': books_page,
+        'status_filter': status_filter,
+        'total_books': books.count(),
+        'total_chapters': total_chapters,
+        'completed_chapters': completed_chapters,
+        'completion_percentage': completion_percentage,
+        'total_words': total_words,
+        'avg_words_per_chapter': avg_words_per_chapter,
+    }
+    return render(request, 'tickets/ai_book_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_create(request):
+    """Crear nuevo libro con IA - Paso 1: Título y tema"""
+    from .models import AIBook
+    
+    if request.method == 'POST':
+        title = request.POST.get('title', '').strip()
+        author = request.POST.get('author', '').strip()
+        topic = request.POST.get('topic', '').strip()
+        company_id = request.POST.get('company')
+        
+        if not title or not topic:
+            messages.error(request, 'El título y el tema son obligatorios')
+            return redirect('ai_book_create')
+        
+        # Crear el libro
+        book = AIBook.objects.create(
+            title=title,
+            author=author,
+            topic=topic,
+            created_by=request.user,
+            company_id=company_id if company_id else None,
+            status='draft'
+        )
+        
+        messages.success(request, f'Libro "{book.title}" creado exitosamente')
+        return redirect('ai_book_propose_chapters', pk=book.pk)
+    
+    companies = Company.objects.filter(is_active=True)
+    context = {
+        'companies': companies,
+    }
+    return render(request, 'tickets/ai_book_create.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_propose_chapters(request, pk):
+    """Paso 2: Proponer capítulos con IA"""
+    from .models import AIBook
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    
+    context = {
+        'book': book,
+    }
+    return render(request, 'tickets/ai_book_propose_chapters.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_generate_chapters_ai(request, pk):
+    """AJAX: Generar propuesta de capítulos con IA"""
+    from openai import OpenAI
+    from .models import AIBook, AIBookChapter
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    # Verificar que OpenAI esté disponible
+    if not OPENAI_AVAILABLE:
+        return JsonResponse({
+            'success': False,
+            'error': 'OpenAI no está disponible'
+        })
+    
+    try:
+        config = SystemConfiguration.objects.first()
+        if not config or not config.openai_api_key:
+            return JsonResponse({
+                'success': False,
+                'error': 'API Key de OpenAI no configurada'
+            })
+        
+        client = OpenAI(api_key=config.openai_api_key)
+        
+        # Prompt para generar capítulos
+        prompt = f"""Eres un experto en estructura de libros y contenido editorial.
+
+Genera una estructura de capítulos para un libro con las siguientes características:
+
+TÍTULO: {book.title}
+TEMA/DESCRIPCIÓN: {book.topic}
+
+INSTRUCCIONES:
+1. Genera entre 8 y 15 capítulos lógicamente estructurados
+2. Cada título de capítulo debe ser claro, específico y atractivo
+3. Los capítulos deben seguir una progresión lógica del conocimiento
+4. Usa títulos profesionales y descriptivos
+5. Máximo 100 caracteres por título
+6. NO uses numeración, solo los títulos
+7. Cubre todos los aspectos importantes del tema
+
+Responde SOLO con los títulos de los capítulos, uno por línea, sin numeración, sin explicaciones adicionales."""
+
+        response = client.chat.completions.create(
+            model=config.openai_model or "gpt-4o-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Eres un experto editor y estructurador de libros que crea índices de contenido profesionales y bien organizados."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.8,
+            max_tokens=1000
+        )
+        
+        ai_response = response.choices[0].message.content.strip()
+        
+        # Procesar capítulos
+        chapter_titles = [line.strip() for line in ai_response.split('\n') if line.strip()]
+        chapter_titles = [title for title in chapter_titles if len(title) > 5]
+        
+        # Limpiar numeración
+        import re
+        chapter_titles = [re.sub(r'^[\d\.\-\*\•\)]+\s*', '', title) for title in chapter_titles]
+        chapter_titles = [title[:100] for title in chapter_titles]
+        
+        # Crear capítulos
+        chapters_data = []
+        for i, title in enumerate(chapter_titles, start=1):
+            chapter = AIBookChapter.objects.create(
+                book=book,
+                title=title,
+                order=i,
+                status='proposed'
+            )
+            chapters_data.append({
+                'id': chapter.id,
+                'order': chapter.order,
+                'title': chapter.title,
+                'status': chapter.status
+            })
+        
+        # Actualizar estado del libro
+        book.status = 'chapters_proposed'
+        book.save()
+        
+        return JsonResponse({
+            'success': True,
+            'chapters': chapters_data,
+            'count': len(chapters_data),
+            'message': f'Se generaron {len(chapters_data)} capítulos'
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'error': f'Error: {str(e)}'
+        })
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_chapter_edit_title(request, pk, chapter_id):
+    """AJAX: Editar título de capítulo"""
+    from .models import AIBook, AIBookChapter
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    chapter = get_object_or_404(AIBookChapter, pk=chapter_id, book=book)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    new_title = request.POST.get('title', '').strip()
+    
+    if not new_title:
+        return JsonResponse({'success': False, 'error': 'El título no puede estar vacío'})
+    
+    if len(new_title) > 100:
+        return JsonResponse({'success': False, 'error': 'El título no puede exceder 100 caracteres'})
+    
+    chapter.title = new_title
+    chapter.save()
+    
+    return JsonResponse({
+        'success': True,
+        'title': chapter.title
+    })
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_chapter_delete(request, pk, chapter_id):
+    """AJAX: Eliminar capítulo"""
+    from .models import AIBook, AIBookChapter
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    chapter = get_object_or_404(AIBookChapter, pk=chapter_id, book=book)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    chapter.delete()
+    
+    # Reordenar capítulos restantes
+    remaining_chapters = book.chapters.order_by('order')
+    for i, ch in enumerate(remaining_chapters, start=1):
+        if ch.order != i:
+            ch.order = i
+            ch.save()
+    
+    return JsonResponse({'success': True})
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_detail(request, pk):
+    """Vista detallada del libro con todos sus capítulos"""
+    from .models import AIBook
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    chapters = book.chapters.all().order_by('order')
+    
+    context = {
+        'book': book,
+        'chapters': chapters,
+    }
+    return render(request, 'tickets/ai_book_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_edit(request, pk):
+    """Editar información del libro"""
+    from .models import AIBook, Company
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    
+    if request.method == 'POST':
+        title = request.POST.get('title', '').strip()
+        author = request.POST.get('author', '').strip()
+        topic = request.POST.get('topic', '').strip()
+        company_id = request.POST.get('company', None)
+        
+        if not title:
+            messages.error(request, 'El título es obligatorio')
+        elif not topic:
+            messages.error(request, 'El tema/descripción es obligatorio')
+        else:
+            book.title = title
+            book.author = author
+            book.topic = topic
+            
+            if company_id:
+                try:
+                    book.company = Company.objects.get(pk=company_id)
+                except Company.DoesNotExist:
+                    book.company = None
+            else:
+                book.company = None
+            
+            book.save()
+            messages.success(request, f'Libro "{book.title}" actualizado exitosamente')
+            return redirect('ai_book_detail', pk=book.pk)
+    
+    companies = Company.objects.all().order_by('name')
+    
+    context = {
+        'book': book,
+        'companies': companies,
+    }
+    return render(request, 'tickets/ai_book_edit.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_chapter_detail(request, pk, chapter_id):
+    """Vista detallada de un capítulo - Editar resumen y generar contenido"""
+    from .models import AIBook, AIBookChapter
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    chapter = get_object_or_404(AIBookChapter, pk=chapter_id, book=book)
+    
+    if request.method == 'POST':
+        # Guardar resumen editado
+        summary = request.POST.get('summary', '').strip()
+        chapter.summary = summary
+        if summary:
+            chapter.status = 'summary_created'
+        chapter.save()
+        messages.success(request, 'Resumen guardado exitosamente')
+        return redirect('ai_book_chapter_detail', pk=pk, chapter_id=chapter_id)
+    
+    context = {
+        'book': book,
+        'chapter': chapter,
+    }
+    return render(request, 'tickets/ai_book_chapter_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_chapter_generate_summary(request, pk, chapter_id):
+    """AJAX: Generar resumen del capítulo con IA"""
+    from openai import OpenAI
+    from .models import AIBook, AIBookChapter
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    chapter = get_object_or_404(AIBookChapter, pk=chapter_id, book=book)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    if not OPENAI_AVAILABLE:
+        return JsonResponse({'success': False, 'error': 'OpenAI no está disponible'})
+    
+    try:
+        config = SystemConfiguration.objects.first()
+        if not config or not config.openai_api_key:
+            return JsonResponse({'success': False, 'error': 'API Key no configurada'})
+        
+        client = OpenAI(api_key=config.openai_api_key)
+        
+        # Obtener contexto de otros capítulos
+        all_chapters = book.chapters.order_by('order')
+        chapters_context = "\n".join([f"{ch.order}. {ch.title}" for ch in all_chapters])
+        
+        prompt = f"""Genera un resumen detallado para el siguiente capítulo de un libro.
+
+LIBRO: {book.title}
+TEMA DEL LIBRO: {book.topic}
+
+ESTRUCTURA COMPLETA DEL LIBRO:
+{chapters_context}
+
+CAPÍTULO A RESUMIR: Capítulo {chapter.order} - {chapter.title}
+
+INSTRUCCIONES:
+1. Genera un resumen de 200-300 palabras describiendo lo que tratará este capítulo
+2. El resumen debe ser detallado y específico
+3. Debe conectar con el flujo lógico del libro
+4. Menciona los subtemas principales que se cubrirán
+5. Usa un tono profesional pero accesible
+6. Enfócate en el valor y aprendizaje que aportará el capítulo
+
+Responde SOLO con el resumen, sin títulos ni encabezados adicionales."""
+
+        response = client.chat.completions.create(
+            model=config.openai_model or "gpt-4o-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Eres un experto escritor y editor de libros que crea resúmenes de capítulos detallados y bien estructurados."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.7,
+            max_tokens=500
+        )
+        
+        summary = response.choices[0].message.content.strip()
+        
+        chapter.summary = summary
+        chapter.status = 'summary_created'
+        chapter.save()
+        
+        return JsonResponse({
+            'success': True,
+            'summary': summary
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': f'Error: {str(e)}'})
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_chapter_generate_content(request, pk, chapter_id):
+    """AJAX: Generar contenido completo del capítulo basado en el resumen"""
+    from openai import OpenAI
+    from .models import AIBook, AIBookChapter
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    chapter = get_object_or_404(AIBookChapter, pk=chapter_id, book=book)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    if not chapter.summary:
+        return JsonResponse({'success': False, 'error': 'Primero debes crear un resumen'})
+    
+    if not OPENAI_AVAILABLE:
+        return JsonResponse({'success': False, 'error': 'OpenAI no está disponible'})
+    
+    try:
+        config = SystemConfiguration.objects.first()
+        if not config or not config.openai_api_key:
+            return JsonResponse({'success': False, 'error': 'API Key no configurada'})
+        
+        client = OpenAI(api_key=config.openai_api_key)
+        
+        # Obtener contexto
+        all_chapters = book.chapters.order_by('order')
+        chapters_context = "\n".join([f"{ch.order}. {ch.title}" for ch in all_chapters])
+        
+        prompt = f"""Escribe el contenido completo y detallado para el siguiente capítulo de un libro.
+
+LIBRO: {book.title}
+TEMA DEL LIBRO: {book.topic}
+
+ESTRUCTURA DEL LIBRO:
+{chapters_context}
+
+CAPÍTULO ACTUAL: Capítulo {chapter.order} - {chapter.title}
+
+RESUMEN DEL CAPÍTULO:
+{chapter.summary}
+
+INSTRUCCIONES:
+1. Escribe un capítulo completo y bien estructurado de aproximadamente 1500-2500 palabras
+2. Incluye una introducción atractiva que enganche al lector
+3. Desarrolla el contenido en secciones lógicas con subtítulos claros
+4. Incluye ejemplos prácticos, casos de uso o analogías cuando sea apropiado
+5. Mantén un tono profesional pero accesible y claro
+6. Incluye una conclusión que resuma los puntos clave
+7. USA TEXTO PLANO sin formato Markdown (sin **, ##, -, etc.)
+8. Separa párrafos con doble salto de línea
+9. Los subtítulos deben ir en MAYÚSCULAS en su propia línea
+10. Asegúrate de que el contenido fluya naturalmente y sea educativo
+
+Responde SOLO con el contenido del capítulo en texto plano."""
+
+        response = client.chat.completions.create(
+            model=config.openai_model or "gpt-4o-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Eres un escritor profesional experto en crear contenido educativo de alta calidad, bien estructurado y fácil de entender."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.7,
+            max_tokens=4000
+        )
+        
+        content = response.choices[0].message.content.strip()
+        
+        chapter.content = content
+        chapter.status = 'content_generated'
+        chapter.save()  # Esto actualizará automáticamente el word_count
+        
+        # Actualizar el estado del libro si hay capítulos completados
+        if book.get_completed_chapters() > 0 and book.status == 'chapters_proposed':
+            book.status = 'in_progress'
+            book.save()
+        
+        return JsonResponse({
+            'success': True,
+            'content': content,
+            'word_count': chapter.word_count
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': f'Error: {str(e)}'})
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_chapter_save_content(request, pk, chapter_id):
+    """AJAX: Guardar contenido editado del capítulo"""
+    import json
+    from .models import AIBook, AIBookChapter
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    chapter = get_object_or_404(AIBookChapter, pk=chapter_id, book=book)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+        content = data.get('content', '').strip()
+        
+        if not content:
+            return JsonResponse({'success': False, 'error': 'El contenido no puede estar vacío'})
+        
+        chapter.content = content
+        if chapter.status == 'proposed':
+            chapter.status = 'content_generated'
+        chapter.save()  # Esto actualizará automáticamente el word_count
+        
+        return JsonResponse({
+            'success': True,
+            'word_count': chapter.word_count,
+            'message': 'Contenido guardado exitosamente'
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'error': 'Datos JSON inválidos'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': f'Error: {str(e)}'})
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_chapter_save_summary(request, pk, chapter_id):
+    """AJAX: Guardar resumen editado del capítulo"""
+    import json
+    from .models import AIBook, AIBookChapter
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    chapter = get_object_or_404(AIBookChapter, pk=chapter_id, book=book)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+        summary = data.get('summary', '').strip()
+        
+        if not summary:
+            return JsonResponse({'success': False, 'error': 'El resumen no puede estar vacío'})
+        
+        chapter.summary = summary
+        if chapter.status == 'proposed':
+            chapter.status = 'summary_created'
+        chapter.save()
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Resumen guardado exitosamente'
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'error': 'Datos JSON inválidos'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': f'Error: {str(e)}'})
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_export(request, pk):
+    """Exportar libro completo en formato Markdown, DOCX o PDF"""
+    from .models import AIBook
+    from docx import Document
+    from docx.shared import Pt, Inches, RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml.ns import qn
+    from docx.oxml import OxmlElement
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
+    from reportlab.lib import colors
+    from io import BytesIO
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    chapters = book.chapters.filter(status__in=['content_generated', 'completed']).order_by('order')
+    
+    if not chapters.exists():
+        messages.error(request, 'No hay capítulos con contenido generado para exportar')
+        return redirect('ai_book_detail', pk=pk)
+    
+    # Formato para exportar
+    export_format = request.GET.get('format', 'docx')
+    
+    if export_format == 'docx':
+        # Crear documento Word
+        doc = Document()
+        
+        # Configurar márgenes
+        sections = doc.sections
+        for section in sections:
+            section.top_margin = Inches(1)
+            section.bottom_margin = Inches(1)
+            section.left_margin = Inches(1.25)
+            section.right_margin = Inches(1.25)
+        
+        # Portada
+        title = doc.add_heading(book.title, 0)
+        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        for run in title.runs:
+            run.font.size = Pt(28)
+            run.font.color.rgb = RGBColor(44, 62, 80)
+        
+        doc.add_paragraph()  # Espacio
+        
+        # Autor (si existe)
+        if book.author:
+            author_para = doc.add_paragraph(book.author)
+            author_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            author_format = author_para.runs[0].font
+            author_format.size = Pt(16)
+            author_format.bold = True
+            author_format.color.rgb = RGBColor(52, 73, 94)
+            doc.add_paragraph()
+        
+        subtitle = doc.add_paragraph(book.topic)
+        subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        subtitle_format = subtitle.runs[0].font
+        subtitle_format.italic = True
+        subtitle_format.size = Pt(12)
+        subtitle_format.color.rgb = RGBColor(127, 140, 141)
+        
+        doc.add_page_break()
+        
+        # Índice
+        toc_title = doc.add_heading('Índice', 1)
+        for run in toc_title.runs:
+            run.font.color.rgb = RGBColor(41, 128, 185)
+        
+        # Crear tabla para el índice con números de página
+        toc_table_data = []
+        page_num = 3  # Empieza después de portada e índice
+        
+        for chapter in chapters:
+            toc_table_data.append([
+                f'Capítulo {chapter.order}',
+                chapter.title,
+                str(page_num)
+            ])
+            # Estimar páginas por capítulo (aprox. 500 palabras por página)
+            words_in_chapter = len(chapter.content.split()) if chapter.content else 0
+            pages_in_chapter = max(1, words_in_chapter // 500)
+            page_num += pages_in_chapter
+        
+        # Agregar tabla al documento
+        table = doc.add_table(rows=len(toc_table_data), cols=3)
+        table.style = 'Light Grid Accent 1'
+        
+        for i, (num, title, page) in enumerate(toc_table_data):
+            row = table.rows[i]
+            row.cells[0].text = num
+            row.cells[1].text = title
+            row.cells[2].text = page
+            
+            # Formatear celdas
+            for cell in row.cells:
+                for paragraph in cell.paragraphs:
+                    for run in paragraph.runs:
+                        run.font.size = Pt(11)
+        
+        doc.add_page_break()
+        
+        # Contenido de capítulos
+        for chapter in chapters:
+            # Título del capítulo
+            chapter_heading = doc.add_heading(f'Capítulo {chapter.order}', 1)
+            for run in chapter_heading.runs:
+                run.font.color.rgb = RGBColor(41, 128, 185)
+            
+            chapter_title = doc.add_heading(chapter.title, 2)
+            for run in chapter_title.runs:
+                run.font.color.rgb = RGBColor(52, 73, 94)
+            
+            if chapter.content:
+                # Dividir contenido en párrafos
+                paragraphs = chapter.content.split('\n\n')
+                for para in paragraphs:
+                    if para.strip():
+                        # Detectar si es un subtítulo (texto en mayúsculas)
+                        if para.strip().isupper() and len(para.strip()) < 100:
+                            subtitle = doc.add_heading(para.strip(), 3)
+                            for run in subtitle.runs:
+                                run.font.color.rgb = RGBColor(52, 152, 219)
+                        else:
+                            p = doc.add_paragraph(para.strip())
+                            p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+                            for run in p.runs:
+                                run.font.size = Pt(11)
+            
+            doc.add_page_break()
+        
+        # Agregar números de página
+        for section in doc.sections:
+            footer = section.footer
+            footer_para = footer.paragraphs[0]
+            footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            run = footer_para.add_run()
+            fldChar1 = OxmlElement('w:fldChar')
+            fldChar1.set(qn('w:fldCharType'), 'begin')
+            
+            instrText = OxmlElement('w:instrText')
+            instrText.set(qn('xml:space'), 'preserve')
+            instrText.text = "PAGE"
+            
+            fldChar2 = OxmlElement('w:fldChar')
+            fldChar2.set(qn('w:fldCharType'), 'end')
+            
+            run._r.append(fldChar1)
+            run._r.append(instrText)
+            run._r.append(fldChar2)
+        
+        # Guardar en memoria
+        buffer = BytesIO()
+        doc.save(buffer)
+        buffer.seek(0)
+        
+        response = HttpResponse(
+            buffer.getvalue(),
+            content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+        )
+        response['Content-Disposition'] = f'attachment; filename="{book.title}.docx"'
+        return response
+    
+    elif export_format == 'pdf':
+        # Crear PDF con numeración de páginas
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.utils import simpleSplit
+        
+        buffer = BytesIO()
+        
+        # Función para agregar números de página
+        def add_page_number(canvas_obj, doc_obj):
+            canvas_obj.saveState()
+            canvas_obj.setFont('Helvetica', 9)
+            page_num = canvas_obj.getPageNumber()
+            text = f"Página {page_num}"
+            canvas_obj.drawCentredString(letter[0]/2, 0.5*inch, text)
+            canvas_obj.restoreState()
+        
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=letter,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=50,
+        )
+        
+        # Estilos
+        styles = getSampleStyleSheet()
+        
+        # Estilo personalizado para título
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=28,
+            textColor=colors.HexColor('#2c3e50'),
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold',
+        )
+        
+        # Estilo para subtítulo
+        subtitle_style = ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Normal'],
+            fontSize=12,
+            textColor=colors.HexColor('#7f8c8d'),
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Oblique',
+        )
+        
+        # Estilo para títulos de capítulos
+        chapter_style = ParagraphStyle(
+            'ChapterTitle',
+            parent=styles['Heading1'],
+            fontSize=20,
+            textColor=colors.HexColor('#2980b9'),
+            spaceAfter=20,
+            spaceBefore=20,
+            fontName='Helvetica-Bold',
+        )
+        
+        # Estilo para subtítulos de capítulos
+        chapter_subtitle_style = ParagraphStyle(
+            'ChapterSubtitle',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#34495e'),
+            spaceAfter=15,
+            fontName='Helvetica-Bold',
+        )
+        
+        # Estilo para secciones
+        section_style = ParagraphStyle(
+            'SectionTitle',
+            parent=styles['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor('#3498db'),
+            spaceAfter=12,
+            spaceBefore=12,
+            fontName='Helvetica-Bold',
+        )
+        
+        # Estilo para autor
+        author_style = ParagraphStyle(
+            'AuthorStyle',
+            parent=styles['Normal'],
+            fontSize=16,
+            textColor=colors.HexColor('#34495e'),
+            spaceAfter=20,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold',
+        )
+        
+        # Estilo para texto normal
+        normal_style = ParagraphStyle(
+            'CustomNormal',
+            parent=styles['Normal'],
+            fontSize=11,
+            alignment=TA_JUSTIFY,
+            spaceAfter=12,
+            leading=14,
+        )
+        
+        # Estilo para índice
+        toc_style = ParagraphStyle(
+            'TOCStyle',
+            parent=styles['Normal'],
+            fontSize=11,
+            spaceAfter=8,
+            leftIndent=0,
+        )
+        
+        toc_title_style = ParagraphStyle(
+            'TOCTitle',
+            parent=styles['Heading1'],
+            fontSize=22,
+            textColor=colors.HexColor('#2980b9'),
+            spaceAfter=20,
+            fontName='Helvetica-Bold',
+        )
+        
+        # Contenido del PDF
+        story = []
+        
+        # Portada
+        story.append(Spacer(1, 2.5*inch))
+        story.append(Paragraph(book.title, title_style))
+        story.append(Spacer(1, 0.3*inch))
+        
+        # Autor (si existe)
+        if book.author:
+            story.append(Paragraph(book.author, author_style))
+            story.append(Spacer(1, 0.3*inch))
+        
+        story.append(Paragraph(book.topic, subtitle_style))
+        story.append(PageBreak())
+        
+        # Índice con números de página
+        story.append(Paragraph('Índice', toc_title_style))
+        story.append(Spacer(1, 0.3*inch))
+        
+        # Crear tabla para índice con dots leaders
+        toc_data = []
+        for chapter in chapters:
+            chapter_text = f'Capítulo {chapter.order}: {chapter.title}'
+            toc_data.append([chapter_text, ''])
+        
+        if toc_data:
+            toc_table = Table(toc_data, colWidths=[5*inch, 0.5*inch])
+            toc_table.setStyle(TableStyle([
+                ('FONT', (0, 0), (-1, -1), 'Helvetica', 11),
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#34495e')),
+                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+                ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ]))
+            story.append(toc_table)
+        
+        story.append(PageBreak())
+        
+        # Contenido de capítulos
+        for chapter in chapters:
+            # Título del capítulo
+            story.append(Paragraph(f'Capítulo {chapter.order}', chapter_style))
+            story.append(Spacer(1, 0.1*inch))
+            story.append(Paragraph(chapter.title, chapter_subtitle_style))
+            story.append(Spacer(1, 0.2*inch))
+            
+            if chapter.content:
+                # Dividir contenido en párrafos
+                paragraphs = chapter.content.split('\n\n')
+                for para in paragraphs:
+                    if para.strip():
+                        # Detectar si es un subtítulo (texto en mayúsculas)
+                        if para.strip().isupper() and len(para.strip()) < 100:
+                            story.append(Paragraph(para.strip(), section_style))
+                        else:
+                            # Escapar caracteres especiales para XML
+                            safe_para = para.strip().replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                            story.append(Paragraph(safe_para, normal_style))
+            
+            story.append(PageBreak())
+        
+        # Generar PDF con numeración de páginas
+        doc.build(story, onFirstPage=add_page_number, onLaterPages=add_page_number)
+        buffer.seek(0)
+        
+        response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
+        response['Content-Disposition'] = f'attachment; filename="{book.title}.pdf"'
+        return response
+    
+    elif export_format == 'html':
+        # Convertir a HTML (mantenemos esta opción)
+        content = f"<h1>{book.title}</h1>\n"
+        if book.author:
+            content += f"<p class='author'><strong>{book.author}</strong></p>\n"
+        content += f"<p><em>{book.topic}</em></p>\n"
+        content += "<hr>\n"
+        content += "<h2>Índice</h2>\n<ul>\n"
+        
+        for chapter in chapters:
+            content += f'<li><a href="#chapter-{chapter.order}">Capítulo {chapter.order}: {chapter.title}</a></li>\n'
+        
+        content += "</ul>\n<hr>\n"
+        
+        for chapter in chapters:
+            content += f'<h2 id="chapter-{chapter.order}">Capítulo {chapter.order}: {chapter.title}</h2>\n'
+            if chapter.content:
+                # Convertir párrafos a HTML
+                paragraphs = chapter.content.split('\n\n')
+                for para in paragraphs:
+                    if para.strip():
+                        if para.strip().isupper() and len(para.strip()) < 100:
+                            content += f"<h3>{para.strip()}</h3>\n"
+                        else:
+                            content += f"<p>{para.strip()}</p>\n"
+                content += "<hr>\n"
+        
+        # Crear HTML completo
+        html = f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{book.title}</title>
+    <style>
+        body {{
+            font-family: Georgia, serif;
+            line-height: 1.6;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+        }}
+        h1 {{ color: #2c3e50; text-align: center; }}
+        .author {{ color: #34495e; text-align: center; font-size: 1.2em; margin: 10px 0; }}
+        h2 {{ color: #34495e; margin-top: 40px; }}
+        h3 {{ color: #34495e; margin-top: 20px; }}
+        p {{ text-align: justify; }}
+        hr {{ margin: 40px 0; border: none; border-top: 2px solid #ecf0f1; }}
+        a {{ color: #3498db; text-decoration: none; }}
+        a:hover {{ text-decoration: underline; }}
+    </style>
+</head>
+<body>
+    {content}
+</body>
+</html>"""
+        
+        response = HttpResponse(html, content_type='text/html')
+        response['Content-Disposition'] = f'attachment; filename="{book.title}.html"'
+        return response
+    
+    messages.error(request, 'Formato de exportación no válido')
+    return redirect('ai_book_detail', pk=pk)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_book_delete(request, pk):
+    """Eliminar libro"""
+    from .models import AIBook
+    
+    book = get_object_or_404(AIBook, pk=pk)
+    
+    if request.method == 'POST':
+        book.delete()
+        messages.success(request, f'Libro "{book.title}" eliminado exitosamente')
+        return redirect('ai_book_list')
+    
+    context = {
+        'book': book,
+    }
+    return render(request, 'tickets/ai_book_delete.html', context)
+
+
+# ============================================
+# GENERACIÓN DE ARTÍCULOS CON IA
+# ============================================
+
+@login_required
+@user_passes_test(is_agent)
+def ai_article_project_list(request):
+    """Lista de proyectos de artículos con IA"""
+    from .models import AIArticleProject, AIArticle
+    from django.db.models import Count, Sum, Q, Avg
+    
+    projects = AIArticleProject.objects.filter(
+        created_by=request.user
+    ).select_related('company', 'created_by').prefetch_related('articles')
+    
+    # Calcular estadísticas generales
+    stats = AIArticle.objects.filter(project__created_by=request.user).aggregate(
+        total_articles=Count('id'),
+        generated_articles=Count('id', filter=Q(status__in=['content_generated', 'completed'])),
+        total_words=Sum('word_count'),
+        avg_words=Avg('word_count', filter=Q(status__in=['content_generated', 'completed']))
+    )
+    
+    total_articles = stats['total_articles'] or 0
+    generated_articles = stats['generated_articles'] or 0
+    total_words = (stats['total_words'] or 0) / 1000  # Convertir a miles
+    avg_words_per_article = stats['avg_words'] or 0
+    
+    generation_percentage = int((generated_articles / total_articles * 100)) if total_articles > 0 else 0
+    
+    context = {
+        'projects': projects,
+        'total_articles': total_articles,
+        'generated_articles': generated_articles,
+        'generation_percentage': generation_percentage,
+        'total_words': total_words,
+        'avg_words_per_article': avg_words_per_article,
+    }
+    return render(request, 'tickets/ai_article_project_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_article_project_create(request):
+    """Crear nuevo proyecto de artículos (Paso 1)"""
+    from .models import AIArticleProject, Company
+    
+    if request.method == 'POST':
+        title = request.POST.get('title')
+        main_topic = request.POST.get('main_topic')
+        content_format = request.POST.get('content_format', 'plain')
+        company_id = request.POST.get('company')
+        
+        if not title or not main_topic:
+            messages.error(request, 'El título y el tema principal son obligatorios.')
+            return redirect('ai_article_project_create')
+        
+        project = AIArticleProject.objects.create(
+            title=title,
+            main_topic=main_topic,
+            content_format=content_format,
+            created_by=request.user,
+            company_id=company_id if company_id else None,
+            status='draft'
+        )
+        
+        messages.success(request, f'Proyecto "{project.title}" creado exitosamente.')
+        return redirect('ai_article_project_proposals', pk=project.pk)
+    
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'companies': companies,
+    }
+    return render(request, 'tickets/ai_article_project_create.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_article_project_proposals(request, pk):
+    """Ver propuestas de artículos y generar más (Paso 2)"""
+    from .models import AIArticleProject
+    
+    project = get_object_or_404(AIArticleProject, pk=pk)
+    articles = project.articles.all().order_by('order')
+    
+    context = {
+        'project': project,
+        'articles': articles,
+    }
+    return render(request, 'tickets/ai_article_project_proposals.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_article_generate_proposals(request, pk):
+    """AJAX: Generar 10 propuestas de artículos con IA"""
+    import json
+    import traceback
+    from .models import AIArticleProject, AIArticle, SystemConfiguration
+    
+    project = get_object_or_404(AIArticleProject, pk=pk)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    try:
+        config = SystemConfiguration.get_config()
+        
+        if not config.openai_api_key:
+            return JsonResponse({'success': False, 'error': 'No se ha configurado la API Key de OpenAI'})
+        
+        # Obtener el número actual de artículos para continuar la numeración
+        current_count = project.articles.count()
+        
+        prompt = f"""Basándote en el siguiente tema principal, propón 10 títulos de artículos interesantes y relevantes.
+        
+Tema principal: {project.main_topic}
+
+Para cada artículo, proporciona:
+1. Un título atractivo y específico
+2. 3-5 palabras clave relevantes (separadas por comas)
+
+Formato de respuesta (JSON):
+[
+  {{"title": "Título del artículo", "keywords": "palabra1, palabra2, palabra3"}},
+  ...
+]
+
+Responde SOLO con el JSON, sin texto adicional."""
+        
+        from openai import OpenAI
+        client = OpenAI(api_key=config.openai_api_key)
+        
+        response = client.chat.completions.create(
+            model=config.openai_model or "gpt-4o-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Eres un experto en marketing de contenidos y generación de ideas para artículos."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.8,
+            max_tokens=2000
+        )
+        
+        response_text = response.choices[0].message.content.strip()
+        
+        # Limpiar respuesta si viene con markdown
+        if response_text.startswith('```'):
+            lines = response_text.split('\n')
+            # Eliminar primera línea con ```json y última con ```
+            response_text = '\n'.join(lines[1:-1]).strip()
+        
+        proposals = json.loads(response_text)
+        
+        # Crear los artículos propuestos
+        created_articles = []
+        for i, proposal in enumerate(proposals[:10]):  # Limitar a 10
+            article = AIArticle.objects.create(
+                project=project,
+                title=proposal.get('title', ''),
+                keywords=proposal.get('keywords', ''),
+                order=current_count + i + 1,
+                status='proposed'
+            )
+            created_articles.append({
+                'id': article.id,
+                'title': article.title,
+                'keywords': article.keywords,
+                'order': article.order
+            })
+        
+        # Actualizar estado del proyecto
+        if project.status == 'draft':
+            project.status = 'articles_proposed'
+            project.save()
+        
+        return JsonResponse({
+            'success': True,
+            'articles': created_articles,
+            'total_articles': project.articles.count()
+        })
+        
+    except json.JSONDecodeError as e:
+        return JsonResponse({'success': False, 'error': f'Error al procesar JSON de la IA: {str(e)}'})
+    except Exception as e:
+        error_trace = traceback.format_exc()
+        print(f"Error en ai_article_generate_proposals: {error_trace}")
+        return JsonResponse({'success': False, 'error': f'Error: {str(e)}'})
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_article_edit_keywords(request, pk, article_id):
+    """AJAX: Editar palabras clave de un artículo"""
+    import json
+    from .models import AIArticleProject, AIArticle
+    
+    project = get_object_or_404(AIArticleProject, pk=pk)
+    article = get_object_or_404(AIArticle, pk=article_id, project=project)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+        keywords = data.get('keywords', '').strip()
+        
+        article.keywords = keywords
+        article.save()
+        
+        return JsonResponse({
+            'success': True,
+            'keywords': article.keywords
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': f'Error: {str(e)}'})
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_article_generate_content(request, pk, article_id):
+    """AJAX: Generar contenido del artículo con IA"""
+    import json
+    import traceback
+    from .models import AIArticleProject, AIArticle, SystemConfiguration
+    
+    project = get_object_or_404(AIArticleProject, pk=pk)
+    article = get_object_or_404(AIArticle, pk=article_id, project=project)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    try:
+        config = SystemConfiguration.get_config()
+        
+        if not config.openai_api_key:
+            return JsonResponse({'success': False, 'error': 'No se ha configurado la API Key de OpenAI'})
+        
+        keywords_text = f"\nPalabras clave a incluir: {article.keywords}" if article.keywords else ""
+        
+        # Ajustar el prompt según el formato del proyecto
+        if project.content_format == 'markdown':
+            format_instructions = """1. Usa formato Markdown para estructurar el contenido
+2. Usa # para el título principal, ## para subtítulos, ### para sub-secciones
+3. Usa **texto** para negritas y *texto* para cursivas
+4. Usa listas numeradas o con viñetas donde sea apropiado
+5. Usa bloques de código ```código``` si es necesario"""
+        else:  # plain text
+            format_instructions = """1. Escribe en texto plano (NO uses formato Markdown)
+2. Los subtítulos deben estar EN MAYÚSCULAS
+3. Usa párrafos bien estructurados
+4. No uses símbolos especiales de formato (*, #, etc.)"""
+        
+        prompt = f"""Escribe un artículo completo y detallado sobre el siguiente tema:
+
+Título: {article.title}
+Contexto general: {project.main_topic}{keywords_text}
+
+REQUISITOS IMPORTANTES DE FORMATO:
+{format_instructions}
+
+REQUISITOS DE CONTENIDO:
+- Incluye introduccción, desarrollo y conclusión
+- Longitud: Entre 800-1500 palabras
+- Tono profesional pero accesible
+- Incluye ejemplos prácticos cuando sea posible
+
+El artículo debe ser informativo, bien investigado y de alta calidad."""
+        
+        from openai import OpenAI
+        client = OpenAI(api_key=config.openai_api_key)
+        
+        response = client.chat.completions.create(
+            model=config.openai_model or "gpt-4o-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Eres un redactor profesional experto en crear artículos de alta calidad, bien estructurados y optimizados para SEO."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.7,
+            max_tokens=4000
+        )
+        
+        content = response.choices[0].message.content.strip()
+        
+        article.content = content
+        article.status = 'content_generated'
+        article.save()  # Esto actualizará automáticamente el word_count
+        
+        # Actualizar progreso del proyecto
+        if project.get_completed_articles() > 0 and project.status == 'articles_proposed':
+            project.status = 'in_progress'
+            project.save()
+        
+        return JsonResponse({
+            'success': True,
+            'content': content,
+            'word_count': article.word_count
+        })
+        
+    except Exception as e:
+        error_trace = traceback.format_exc()
+        print(f"Error en ai_article_generate_content: {error_trace}")
+        return JsonResponse({'success': False, 'error': f'Error: {str(e)}'})
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_article_detail(request, pk, article_id):
+    """Ver detalle de un artículo"""
+    from .models import AIArticleProject, AIArticle
+    
+    project = get_object_or_404(AIArticleProject, pk=pk)
+    article = get_object_or_404(AIArticle, pk=article_id, project=project)
+    
+    context = {
+        'project': project,
+        'article': article,
+    }
+    return render(request, 'tickets/ai_article_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_article_delete(request, pk, article_id):
+    """Eliminar un artículo propuesto"""
+    from .models import AIArticleProject, AIArticle
+    
+    project = get_object_or_404(AIArticleProject, pk=pk)
+    article = get_object_or_404(AIArticle, pk=article_id, project=project)
+    
+    if request.method == 'POST':
+        article.delete()
+        messages.success(request, 'Artículo eliminado exitosamente.')
+        return redirect('ai_article_project_proposals', pk=project.pk)
+    
+    context = {
+        'project': project,
+        'article': article,
+    }
+    return render(request, 'tickets/ai_article_delete.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_article_project_edit(request, pk):
+    """Editar un proyecto de artículos"""
+    from .models import AIArticleProject, Company
+    
+    project = get_object_or_404(AIArticleProject, pk=pk)
+    
+    if request.method == 'POST':
+        project.title = request.POST.get('title')
+        project.main_topic = request.POST.get('main_topic')
+        project.content_format = request.POST.get('content_format', 'plain')
+        company_id = request.POST.get('company')
+        project.company_id = company_id if company_id else None
+        project.save()
+        
+        messages.success(request, f'Proyecto "{project.title}" actualizado exitosamente.')
+        return redirect('ai_article_project_proposals', pk=project.pk)
+    
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'project': project,
+        'companies': companies,
+    }
+    return render(request, 'tickets/ai_article_project_edit.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def ai_article_project_delete(request, pk):
+    """Eliminar un proyecto completo"""
+    from .models import AIArticleProject
+    
+    project = get_object_or_404(AIArticleProject, pk=pk)
+    
+    if request.method == 'POST':
+        title = project.title
+        project.delete()
+        messages.success(request, f'Proyecto "{title}" eliminado exitosamente.')
+        return redirect('ai_article_project_list')
+    
+    context = {
+        'project': project,
+    }
+    return render(request, 'tickets/ai_article_project_delete.html', context)
+
+
+# ==========================================
+# VISTAS PARA TUTOR IA
+# ==========================================
+
+@login_required
+def ai_tutor_list(request):
+    """Lista de tutores IA"""
+    # Filtros
+    status_filter = request.GET.get('status')
+    visibility_filter = request.GET.get('visibility')
+    search = request.GET.get('search')
+    
+    # Query base
+    tutors = AITutor.objects.all()
+    
+    # Aplicar filtros de visibilidad
+    if visibility_filter == 'private':
+        tutors = tutors.filter(created_by=request.user)
+    elif visibility_filter == 'public':
+        tutors = tutors.filter(is_private=False)
+    else:
+        # Mostrar solo tutores públicos o propios
+        tutors = tutors.filter(
+            Q(is_private=False) | Q(created_by=request.user)
+        )
+    
+    # Aplicar otros filtros
+    if status_filter:
+        tutors = tutors.filter(status=status_filter)
+    
+    if search:
+        tutors = tutors.filter(
+            Q(title__icontains=search) |
+            Q(objective__icontains=search)
+        )
+    
+    # Seleccionar datos relacionados
+    tutors = tutors.select_related('created_by').prefetch_related('progress_reports')
+    
+    # Estadísticas
+    total_tutors = tutors.count()
+    active_tutors = tutors.filter(status='active').count()
+    completed_tutors = tutors.filter(status='completed').count()
+    my_tutors = tutors.filter(created_by=request.user).count()
+    
+    # Paginación
+    paginator = Paginator(tutors, 12)  # 12 tutores por página
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'tutors': page_obj,
+        'total_tutors': total_tutors,
+        'active_tutors': active_tutors,
+        'completed_tutors': completed_tutors,
+        'my_tutors': my_tutors,
+        'status_choices': AITutor.STATUS_CHOICES,
+        'status_filter': status_filter,
+        'visibility_filter': visibility_filter,
+        'search': search,
+        'title': 'Tutor IA'
+    }
+    
+    return render(request, 'tickets/ai_tutor_list.html', context)
+
+
+@login_required
+@login_required
+def ai_tutor_create(request):
+    """Crear un nuevo tutor IA"""
+    if request.method == 'POST':
+        form = AITutorForm(request.POST)
+        print(f"DEBUG: POST data: {request.POST}")
+        print(f"DEBUG: Form is_valid: {form.is_valid()}")
+        if not form.is_valid():
+            print(f"DEBUG: Form errors: {form.errors}")
+        
+        if form.is_valid():
+            tutor = form.save(commit=False)
+            tutor.created_by = request.user
+            tutor.save()
+            
+            messages.success(request, f'Tutor IA "{tutor.title}" creado exitosamente.')
+            print(f"DEBUG: Tutor created with ID: {tutor.pk}")
+            return redirect('ai_tutor_detail', pk=tutor.pk)
+    else:
+        form = AITutorForm()
+    
+    context = {
+        'form': form,
+        'title': 'Crear Tutor IA'
+    }
+    
+    return render(request, 'tickets/ai_tutor_form.html', context)
+
+
+@login_required
+def ai_tutor_detail(request, pk):
+    """Ver detalles del tutor IA"""
+    tutor = get_object_or_404(AITutor, pk=pk)
+    
+    # Verificar permisos
+    if tutor.is_private and tutor.created_by != request.user:
+        messages.error(request, 'No tienes permisos para ver este tutor.')
+        return redirect('ai_tutor_list')
+    
+    # Obtener reportes de progreso
+    progress_reports = tutor.progress_reports.select_related('created_by').prefetch_related('attachments')
+    
+    # Obtener adjuntos del tutor principal
+    tutor_attachments = tutor.attachments.all()
+    
+    context = {
+        'tutor': tutor,
+        'progress_reports': progress_reports,
+        'tutor_attachments': tutor_attachments,
+        'title': f'Tutor IA: {tutor.title}'
+    }
+    
+    return render(request, 'tickets/ai_tutor_detail.html', context)
+
+
+@login_required
+@login_required
+def ai_tutor_edit(request, pk):
+    """Editar tutor IA"""
+    tutor = get_object_or_404(AITutor, pk=pk)
+    
+    # Verificar permisos
+    if tutor.created_by != request.user:
+        messages.error(request, 'Solo puedes editar tus propios tutores.')
+        return redirect('ai_tutor_detail', pk=pk)
+    
+    if request.method == 'POST':
+        form = AITutorForm(request.POST, instance=tutor)
+        print(f"DEBUG EDIT: POST data: {request.POST}")
+        print(f"DEBUG EDIT: Form is_valid: {form.is_valid()}")
+        if not form.is_valid():
+            print(f"DEBUG EDIT: Form errors: {form.errors}")
+            
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Tutor IA "{tutor.title}" actualizado exitosamente.')
+            print(f"DEBUG EDIT: Tutor updated with ID: {tutor.pk}")
+            return redirect('ai_tutor_detail', pk=tutor.pk)
+    else:
+        form = AITutorForm(instance=tutor)
+    
+    context = {
+        'form': form,
+        'tutor': tutor,
+        'title': f'Editar Tutor: {tutor.title}'
+    }
+    
+    return render(request, 'tickets/ai_tutor_form.html', context)
+
+
+@login_required
+def ai_tutor_delete(request, pk):
+    """Eliminar tutor IA"""
+    tutor = get_object_or_404(AITutor, pk=pk)
+    
+    # Verificar permisos
+    if tutor.created_by != request.user:
+        messages.error(request, 'Solo puedes eliminar tus propios tutores.')
+        return redirect('ai_tutor_detail', pk=pk)
+    
+    if request.method == 'POST':
+        tutor_title = tutor.title
+        tutor.delete()
+        messages.success(request, f'Tutor IA "{tutor_title}" eliminado exitosamente.')
+        return redirect('ai_tutor_list')
+    
+    context = {
+        'tutor': tutor,
+        'title': f'Eliminar Tutor: {tutor.title}'
+    }
+    
+    return render(request, 'tickets/ai_tutor_delete.html', context)
+
+
+@login_required
+def ai_tutor_progress_report(request, pk):
+    """Crear reporte de progreso"""
+    tutor = get_object_or_404(AITutor, pk=pk)
+    
+    # Verificar permisos
+    if tutor.is_private and tutor.created_by != request.user:
+        messages.error(request, 'No tienes permisos para reportar en este tutor.')
+        return redirect('ai_tutor_list')
+    
+    if request.method == 'POST':
+        form = AITutorProgressReportForm(request.POST)
+        attachment_form = AITutorAttachmentForm(request.POST, request.FILES)
+        
+        if form.is_valid():
+            progress_report = form.save(commit=False)
+            progress_report.tutor = tutor
+            progress_report.created_by = request.user
+            
+            # Aquí se podría integrar con OpenAI API para generar feedback
+            progress_report.ai_feedback = generate_ai_feedback(progress_report)
+            progress_report.ai_recommendations = generate_ai_recommendations(progress_report)
+            
+            progress_report.save()
+            
+            # Manejar adjunto si se subió
+            if attachment_form.is_valid() and request.FILES.get('file'):
+                attachment = attachment_form.save(commit=False)
+                attachment.progress_report = progress_report
+                attachment.uploaded_by = request.user
+                attachment.save()
+                
+                # Generar análisis del archivo con IA
+                attachment.ai_analysis = generate_file_analysis(attachment)
+                attachment.save()
+            
+            messages.success(request, 'Reporte de progreso creado exitosamente.')
+            return redirect('ai_tutor_detail', pk=tutor.pk)
+    else:
+        form = AITutorProgressReportForm()
+        attachment_form = AITutorAttachmentForm()
+    
+    context = {
+        'form': form,
+        'attachment_form': attachment_form,
+        'tutor': tutor,
+        'title': f'Reportar Progreso: {tutor.title}'
+    }
+    
+    return render(request, 'tickets/ai_tutor_progress_form.html', context)
+
+
+@login_required
+def ai_tutor_upload_attachment(request, pk):
+    """Subir adjunto al tutor principal"""
+    tutor = get_object_or_404(AITutor, pk=pk)
+    
+    # Verificar permisos
+    if tutor.is_private and tutor.created_by != request.user:
+        messages.error(request, 'No tienes permisos para subir archivos a este tutor.')
+        return redirect('ai_tutor_list')
+    
+    if request.method == 'POST':
+        form = AITutorAttachmentForm(request.POST, request.FILES)
+        if form.is_valid():
+            attachment = form.save(commit=False)
+            attachment.tutor = tutor
+            attachment.uploaded_by = request.user
+            attachment.save()
+            
+            # Generar análisis del archivo con IA
+            attachment.ai_analysis = generate_file_analysis(attachment)
+            attachment.save()
+            
+            messages.success(request, 'Archivo subido exitosamente.')
+            return redirect('ai_tutor_detail', pk=tutor.pk)
+    else:
+        form = AITutorAttachmentForm()
+    
+    context = {
+        'form': form,
+        'tutor': tutor,
+        'title': f'Subir Archivo: {tutor.title}'
+    }
+    
+    return render(request, 'tickets/ai_tutor_attachment_form.html', context)
+
+
+@login_required
+def ai_tutor_generate_feedback_ajax(request, pk):
+    """Generar feedback IA via AJAX"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        progress_report = get_object_or_404(AITutorProgressReport, pk=pk)
+        
+        # Verificar permisos
+        if progress_report.tutor.is_private and progress_report.tutor.created_by != request.user:
+            return JsonResponse({'error': 'No tienes permisos'}, status=403)
+        
+        # Generar feedback y recomendaciones
+        feedback = generate_ai_feedback(progress_report)
+        recommendations = generate_ai_recommendations(progress_report)
+        
+        # Actualizar el reporte
+        progress_report.ai_feedback = feedback
+        progress_report.ai_recommendations = recommendations
+        progress_report.save()
+        
+        return JsonResponse({
+            'success': True,
+            'feedback': feedback,
+            'recommendations': recommendations
+        })
+        
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+# Funciones de utilidad para IA con integración a ChatGPT
+def generate_ai_feedback(progress_report):
+    """Generar feedback con IA basado en el reporte de progreso"""
+    try:
+        from openai import OpenAI
+        from .models import SystemConfiguration
+        
+        # Obtener API key desde configuración del sistema
+        config = SystemConfiguration.get_config()
+        api_key = getattr(config, 'openai_api_key', None)
+        
+        if not api_key:
+            return "Por favor configura tu API key de OpenAI en la configuración del sistema para recibir feedback personalizado."
+        
+        # Configurar cliente OpenAI
+        client = OpenAI(api_key=api_key)
+        
+        # Crear el prompt para ChatGPT con rol de experimentado profesor
+        system_prompt = """Eres un experimentado profesor y tutor especializado en guiar estudiantes hacia el éxito académico y profesional. 
+        Tienes más de 15 años de experiencia enseñando y mentoreando a estudiantes de diversos niveles.
+        
+        Tu enfoque es:
+        - Constructivo y motivador
+        - Específico y actionable
+        - Personalizado según el contexto del estudiante
+        - Basado en metodologías pedagógicas comprobadas
+        - Empático pero directo cuando es necesario
+        
+        IMPORTANTE: Siempre responde en texto plano, sin usar formato Markdown, asteriscos, guiones especiales o símbolos de formato. 
+        Escribe como si estuvieras hablando directamente con el estudiante."""
+        
+        user_prompt = f"""
+        INFORMACIÓN DEL ESTUDIANTE:
+        - Objetivo que persigue: {progress_report.tutor.objective}
+        - Estado inicial al comenzar: {progress_report.tutor.current_state}
+        - Contexto personal/profesional: {progress_report.tutor.context}
+
+        PROGRESO REPORTADO:
+        {progress_report.progress_description}
+
+        DESAFÍOS Y DIFICULTADES:
+        {progress_report.challenges or 'No mencionó desafíos específicos'}
+
+        Como experimentado profesor, analiza este progreso y proporciona:
+        1. Feedback específico sobre lo logrado
+        2. Puntos donde puede mejorar
+        3. Motivación personalizada para continuar
+        
+        IMPORTANTE: Responde en texto plano, sin usar formato Markdown, asteriscos, guiones o símbolos especiales. 
+        Escribe como si estuvieras hablando directamente con el estudiante en una conversación natural.
+        Mantén un tono profesional pero cercano, como un mentor experimentado que realmente se preocupa por el éxito del estudiante.
+        """
+        
+        response = client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            max_tokens=400,
+            temperature=0.7
+        )
+        
+        return response.choices[0].message.content.strip()
+        
+    except Exception as e:
+        print(f"Error generando feedback con IA: {e}")
+        return f"Excelente progreso en '{progress_report.tutor.title}'. Como tu tutor, veo que estás avanzando bien hacia tu objetivo. Continúa con el buen trabajo y no dudes en reportar tus próximos avances."
+        
+    except Exception as e:
+        return f"Feedback automático: Excelente progreso en '{progress_report.tutor.title}'. Basado en tu reporte, pareces estar avanzando bien hacia tu objetivo. Continúa con el buen trabajo."
+
+
+def generate_ai_recommendations(progress_report):
+    """Generar recomendaciones con IA"""
+    try:
+        from openai import OpenAI
+        from .models import SystemConfiguration
+        
+        # Obtener API key desde configuración del sistema
+        config = SystemConfiguration.get_config()
+        api_key = getattr(config, 'openai_api_key', None)
+        
+        if not api_key:
+            return "1. Continúa practicando regularmente\n2. Documenta tu progreso\n3. Busca recursos adicionales cuando sea necesario\n4. Establece metas pequeñas y alcanzables\n5. Revisa y ajusta tu enfoque según sea necesario"
+        
+        # Configurar cliente OpenAI
+        client = OpenAI(api_key=api_key)
+        
+        # Crear el prompt para recomendaciones como experimentado profesor
+        system_prompt = """Eres un experimentado profesor con más de 15 años de experiencia en educación y mentoría. 
+        Tu especialidad es crear planes de acción específicos y recomendaciones personalizadas que realmente funcionan.
+        
+        Generas recomendaciones que son:
+        - Específicas y accionables
+        - Adaptadas al nivel del estudiante
+        - Progresivas y bien estructuradas
+        - Basadas en metodologías pedagógicas comprobadas
+        
+        IMPORTANTE: Siempre responde en texto plano, sin usar formato Markdown, asteriscos, guiones especiales o símbolos de formato. 
+        Usa solo numeración simple (1. 2. 3.) para las listas."""
+        
+        user_prompt = f"""
+        PERFIL DEL ESTUDIANTE:
+        - Objetivo principal: {progress_report.tutor.objective}
+        - Punto de partida: {progress_report.tutor.current_state}
+        - Contexto: {progress_report.tutor.context}
+
+        ÚLTIMO REPORTE DE PROGRESO:
+        {progress_report.progress_description}
+
+        DESAFÍOS IDENTIFICADOS:
+        {progress_report.challenges or 'No se mencionaron desafíos específicos'}
+
+        Como experimentado profesor, genera 4-5 recomendaciones específicas y accionables para el siguiente período de estudio.
+        
+        FORMATO REQUERIDO - TEXTO PLANO:
+        1. [Primera recomendación específica con acción clara]
+        2. [Segunda recomendación específica con acción clara]
+        3. [Tercera recomendación específica con acción clara]
+        4. [Cuarta recomendación específica con acción clara]
+        5. [Quinta recomendación específica con acción clara]
+        
+        IMPORTANTE: 
+        - Usa SOLO texto plano, sin formato Markdown
+        - No uses asteriscos, guiones largos, o símbolos especiales
+        - Numera simplemente con 1. 2. 3. etc.
+        - Escribe cada recomendación como una oración completa y clara
+        - Cada recomendación debe ser específica, actionable y apropiada para el nivel del estudiante
+        """
+        
+        response = client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            max_tokens=350,
+            temperature=0.7
+        )
+        
+        return response.choices[0].message.content.strip()
+        
+    except Exception as e:
+        print(f"Error generando recomendaciones con IA: {e}")
+        return "1. Continúa practicando regularmente con ejercicios específicos\n2. Documenta tu progreso y reflexiona sobre lo aprendido\n3. Busca recursos adicionales que complementen tu aprendizaje\n4. Establece metas pequeñas y medibles para la próxima semana\n5. Considera buscar feedback de otros expertos en el área"
+        
+        response = openai.ChatCompletion.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": "Eres un tutor experto que da recomendaciones prácticas y específicas."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=250,
+            temperature=0.7
+        )
+        
+        return response.choices[0].message.content.strip()
+        
+    except Exception as e:
+        return "1. Continúa con las estrategias que están funcionando.\n2. Considera documentar tus procesos para futuras referencias.\n3. Establece pequeños hitos para mantener la motivación."
+
+
+def generate_file_analysis(attachment):
+    """Analizar archivo con IA"""
+    import openai
+    import os
+    
+    try:
+        # Configurar OpenAI API
+        openai.api_key = os.getenv('OPENAI_API_KEY')
+        
+        if not openai.api_key:
+            return f"Archivo '{attachment.original_filename}' recibido. Para análisis automático, configura tu API key de OpenAI."
+        
+        # Para archivos de texto, podríamos leer el contenido y analizarlo
+        # Por ahora, haremos un análisis básico basado en el nombre y descripción
+        prompt = f"""
+        Eres {attachment.tutor.tutor_persona}.
+        
+        CONTEXTO DEL TUTOR:
+        - Objetivo: {attachment.tutor.objective}
+        
+        ARCHIVO SUBIDO:
+        - Nombre: {attachment.original_filename}
+        - Descripción del usuario: {attachment.description}
+        
+        Proporciona un breve análisis de cómo este archivo puede ser útil para el objetivo de aprendizaje.
+        """
+        
+        response = openai.ChatCompletion.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": "Eres un tutor que analiza recursos de aprendizaje."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=150,
+            temperature=0.7
+        )
+        
+        return response.choices[0].message.content.strip()
+        
+    except Exception as e:
+        return f"Archivo '{attachment.original_filename}' analizado. Contiene información relevante para tu objetivo de aprendizaje."
+
+
+@login_required
+def ai_tutor_optimize_config(request):
+    """Optimizar configuración del tutor con IA"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        import json
+        from openai import OpenAI
+        from .models import SystemConfiguration
+        
+        # Obtener datos del formulario
+        data = json.loads(request.body)
+        title = data.get('title', '').strip()
+        objective = data.get('objective', '').strip()
+        current_state = data.get('current_state', '').strip()
+        context = data.get('context', '').strip()
+        
+        # Validar que hay datos para optimizar
+        if not title and not objective:
+            return JsonResponse({'error': 'Se requiere al menos título y objetivo para optimizar'}, status=400)
+        
+        # Obtener API key desde configuración del sistema
+        config = SystemConfiguration.get_config()
+        api_key = getattr(config, 'openai_api_key', None)
+        
+        if not api_key:
+            return JsonResponse({'error': 'API key de OpenAI no configurada en el sistema'}, status=500)
+        
+        # Configurar cliente OpenAI
+        client = OpenAI(api_key=api_key)
+        
+        # Crear prompt para optimización
+        system_prompt = """Eres un experimentado profesor con más de 15 años de experiencia en educación y diseño de planes de aprendizaje personalizados.
+        
+        Tu tarea es analizar y mejorar la configuración de un tutor IA para maximizar el éxito del estudiante.
+        
+        Principios que sigues:
+        - Objetivos SMART (Específicos, Medibles, Alcanzables, Relevantes, Temporales)
+        - Personalización basada en el contexto del estudiante
+        - Claridad y precisión en la comunicación
+        - Metodologías pedagógicas comprobadas
+        
+        IMPORTANTE: Responde en texto plano, sin formato Markdown, asteriscos o símbolos especiales."""
+        
+        user_prompt = f"""
+        CONFIGURACIÓN ACTUAL DEL TUTOR:
+        - Título: {title}
+        - Objetivo: {objective}
+        - Estado actual: {current_state}
+        - Contexto: {context}
+        
+        Como experimentado profesor, analiza y mejora esta configuración:
+        
+        1. Revisa el título: ¿Es claro y descriptivo?
+        2. Optimiza el objetivo: ¿Sigue principios SMART?
+        3. Mejora la descripción del estado actual: ¿Es específica y útil?
+        4. Enriquece el contexto: ¿Proporciona información relevante para personalizar el aprendizaje?
+        
+        Devuelve una respuesta en formato JSON con las siguientes claves:
+        - "title": título mejorado (máximo 200 caracteres)
+        - "objective": objetivo optimizado (máximo 1000 caracteres)
+        - "current_state": estado actual mejorado (máximo 1000 caracteres)
+        - "context": contexto enriquecido (máximo 1000 caracteres)
+        
+        Si algún campo original está vacío o es muy corto, créalo basándote en la información disponible.
+        Mantén la esencia de lo que el usuario quiere lograr pero hazlo más claro, específico y educativamente sólido.
+        """
+        
+        response = client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            max_tokens=800,
+            temperature=0.7
+        )
+        
+        ai_response = response.choices[0].message.content.strip()
+        
+        # Intentar parsear como JSON
+        try:
+            optimized_config = json.loads(ai_response)
+        except json.JSONDecodeError:
+            # Si no es JSON válido, extraer manualmente
+            optimized_config = {
+                'title': title or 'Objetivo de Aprendizaje Personalizado',
+                'objective': objective or 'Objetivo de aprendizaje mejorado por IA',
+                'current_state': current_state or 'Estado inicial analizado por IA',
+                'context': context or 'Contexto enriquecido por IA'
+            }
+        
+        return JsonResponse({
+            'success': True,
+            'optimized': optimized_config,
+            'message': 'Configuración optimizada por tu profesor IA'
+        })
+        
+    except Exception as e:
+        print(f"Error optimizando configuración: {e}")
+        return JsonResponse({
+            'success': False,
+            'error': 'Error al optimizar la configuración'
+        })
+
+
+# ==================== VISTAS DE GENERADOR DE CITAS ====================
+
+@login_required
+def quote_generator_list(request):
+    """Lista de generadores de citas"""
+    if is_agent(request.user):
+        generators = QuoteGenerator.objects.all().order_by('-created_at')
+    else:
+        # Usuarios regulares ven solo los de su empresa
+        user_company = None
+        try:
+            user_company = request.user.profile.company
+        except:
+            pass
+        
+        if user_company:
+            generators = QuoteGenerator.objects.filter(
+                models.Q(created_by=request.user) | models.Q(company=user_company)
+            ).distinct().order_by('-created_at')
+        else:
+            generators = QuoteGenerator.objects.filter(created_by=request.user).order_by('-created_at')
+    
+    return render(request, 'tickets/quote_generator_list.html', {
+        'generators': generators,
+        'page_title': 'Generadores de Citas IA'
+    })
+
+
+@login_required
+def quote_generator_create(request):
+    """Crear un nuevo generador de citas"""
+    if request.method == 'POST':
+        form = QuoteGeneratorForm(request.POST, user=request.user)
+        if form.is_valid():
+            generator = form.save(commit=False)
+            generator.created_by = request.user
+            
+            # Asignar empresa del usuario
+            try:
+                generator.company = request.user.profile.company
+            except:
+                pass
+                
+            generator.save()
+            
+            # Generar las citas con IA
+            success = generate_quotes_with_ai(generator)
+            
+            if success:
+                messages.success(request, f'Generador "{generator.title}" creado exitosamente. Se generaron las citas automáticamente.')
+                return redirect('quote_generator_detail', pk=generator.pk)
+            else:
+                messages.warning(request, f'Generador "{generator.title}" creado, pero hubo un error al generar las citas. Puedes intentar generar nuevamente.')
+                return redirect('quote_generator_detail', pk=generator.pk)
+    else:
+        form = QuoteGeneratorForm(user=request.user)
+    
+    return render(request, 'tickets/quote_generator_form.html', {
+        'form': form,
+        'page_title': 'Crear Generador de Citas',
+        'submit_text': 'Generar Citas'
+    })
+
+
+@login_required
+def quote_generator_detail(request, pk):
+    """Detalle de un generador de citas"""
+    generator = get_object_or_404(QuoteGenerator, pk=pk)
+    
+    # Verificar permisos
+    if not is_agent(request.user) and generator.created_by != request.user:
+        user_company = None
+        try:
+            user_company = request.user.profile.company
+        except:
+            pass
+        
+        if not user_company or generator.company != user_company:
+            messages.error(request, 'No tienes permisos para ver este generador.')
+            return redirect('quote_generator_list')
+    
+    quotes_list = generator.get_quotes_list()
+    
+    return render(request, 'tickets/quote_generator_detail.html', {
+        'generator': generator,
+        'quotes_list': quotes_list,
+        'page_title': f'Generador: {generator.title}'
+    })
+
+
+@login_required
+def quote_generator_regenerate(request, pk):
+    """Regenerar citas de un generador"""
+    generator = get_object_or_404(QuoteGenerator, pk=pk)
+    
+    # Verificar permisos
+    if not is_agent(request.user) and generator.created_by != request.user:
+        messages.error(request, 'No tienes permisos para regenerar estas citas.')
+        return redirect('quote_generator_list')
+    
+    if request.method == 'POST':
+        success = generate_quotes_with_ai(generator)
+        
+        if success:
+            messages.success(request, 'Citas regeneradas exitosamente.')
+        else:
+            messages.error(request, 'Error al regenerar las citas. Inténtalo de nuevo.')
+    
+    return redirect('quote_generator_detail', pk=pk)
+
+
+@login_required
+def quote_generator_edit(request, pk):
+    """Editar un generador de citas"""
+    generator = get_object_or_404(QuoteGenerator, pk=pk)
+    
+    # Verificar permisos
+    if not is_agent(request.user) and generator.created_by != request.user:
+        messages.error(request, 'No tienes permisos para editar este generador.')
+        return redirect('quote_generator_list')
+    
+    if request.method == 'POST':
+        form = QuoteGeneratorForm(request.POST, user=request.user, instance=generator)
+        if form.is_valid():
+            # Verificar si cambió el tema
+            old_topic = generator.topic
+            generator = form.save()
+            
+            # Si cambió el tema, regenerar citas automáticamente
+            if old_topic != generator.topic:
+                success = generate_quotes_with_ai(generator)
+                if success:
+                    messages.success(request, f'Generador "{generator.title}" actualizado exitosamente. Se regeneraron las citas automáticamente debido al cambio de tema.')
+                else:
+                    messages.warning(request, f'Generador "{generator.title}" actualizado, pero hubo un error al regenerar las citas.')
+            else:
+                messages.success(request, f'Generador "{generator.title}" actualizado exitosamente.')
+            
+            return redirect('quote_generator_detail', pk=generator.pk)
+    else:
+        form = QuoteGeneratorForm(user=request.user, instance=generator)
+    
+    return render(request, 'tickets/quote_generator_form.html', {
+        'form': form,
+        'generator': generator,
+        'page_title': f'Editar Generador: {generator.title}',
+        'submit_text': 'Actualizar Generador'
+    })
+
+
+def generate_quotes_with_ai(generator):
+    """Función para generar citas con IA usando OpenAI"""
+    try:
+        from .models import SystemConfiguration
+        import json
+        import requests
+        
+        # Obtener configuración de OpenAI
+        config = SystemConfiguration.objects.first()
+        if not config or not config.openai_api_key:
+            print("Error: No hay API key de OpenAI configurada")
+            return False
+        
+        # Configurar la petición a OpenAI
+        headers = {
+            "Authorization": f"Bearer {config.openai_api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # Crear el prompt para generar citas
+        prompt = f"""Genera exactamente 10 citas sobre el siguiente tema: {generator.topic}
+
+Requisitos:
+- Deben ser citas reales o inspiradas en el tema solicitado
+- Cada cita debe tener máximo 150 caracteres (aproximadamente 2-3 líneas cuando se muestre)
+- IMPORTANTE: Las citas deben ser cortas y concisas, que no excedan 3 líneas al mostrarse
+- Incluye el autor cuando sea posible
+- Si no hay autor conocido, usa "Anónimo"
+- Las citas deben ser inspiradoras, motivacionales o reflexivas
+- Evita citas muy largas o con múltiples frases
+
+Responde únicamente con un JSON válido en este formato exacto:
+[
+  {{"quote": "texto de la cita", "author": "nombre del autor"}},
+  {{"quote": "texto de la cita", "author": "nombre del autor"}}
+]"""
+
+        data = {
+            "model": "gpt-3.5-turbo",
+            "messages": [
+                {"role": "system", "content": "Eres un experto en citas famosas y motivacionales. Generas únicamente citas cortas y concisas que no excedan 150 caracteres. Respondes únicamente con JSON válido, sin texto adicional antes o después del JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 1500,
+            "temperature": 0.7
+        }
+        
+        # Hacer la petición a OpenAI
+        response = requests.post(
+            "https://api.openai.com/v1/chat/completions",
+            headers=headers,
+            json=data,
+            timeout=30
+        )
+        
+        if response.status_code != 200:
+            print(f"Error en respuesta de OpenAI: {response.status_code} - {response.text}")
+            return False
+        
+        response_data = response.json()
+        
+        # Procesar respuesta
+        content = response_data['choices'][0]['message']['content'].strip()
+        print(f"Respuesta de OpenAI: {content}")
+        
+        # Limpiar el contenido para extraer solo el JSON
+        if content.startswith('```json'):
+            content = content[7:]
+        if content.endswith('```'):
+            content = content[:-3]
+        content = content.strip()
+        
+        # Parsear JSON
+        quotes_data = json.loads(content)
+        
+        # Validar que tenemos citas
+        if not isinstance(quotes_data, list) or len(quotes_data) == 0:
+            print(f"Error: Respuesta no es una lista válida: {quotes_data}")
+            return False
+            
+        # Asegurar que cada cita tenga los campos necesarios
+        valid_quotes = []
+        for quote in quotes_data:
+            if isinstance(quote, dict) and 'quote' in quote:
+                valid_quotes.append({
+                    'quote': quote.get('quote', ''),
+                    'author': quote.get('author', 'Anónimo')
+                })
+        
+        if len(valid_quotes) == 0:
+            print("Error: No se encontraron citas válidas")
+            return False
+        
+        # Guardar las citas en el generador
+        generator.set_quotes_list(valid_quotes)
+        generator.save()
+        
+        print(f"Éxito: Se generaron {len(valid_quotes)} citas")
+        return True
+        
+    except json.JSONDecodeError as e:
+        print(f"Error parseando JSON: {e}")
+        print(f"Contenido recibido: {content}")
+        return False
+    except requests.exceptions.RequestException as e:
+        print(f"Error en petición AI: {e}")
+        return False
+    except Exception as e:
+        print(f"Error generando citas: {e}")
+        return False
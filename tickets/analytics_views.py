@@ -0,0 +1,953 @@
+"""
+Vistas de analítica: visitas a páginas, contadores web, acortador de URLs y rastreador web.
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib import messages
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods
+from .models import ShortUrl, WebsiteTracker
+from .utils import is_agent_or_superuser
+
+
+# ====================================
+# VISTAS DE ANALYTICS Y REPORTES
+# ====================================
+
+@login_required
+@require_http_methods(["GET"])
+def page_visits_analytics_view(request):
+    """Vista principal de analytics de visitas a páginas públicas"""
+    from datetime import datetime, timedelta
+    from .models import PageVisit
+    from .visit_rollup import analytics, day_range
+    
+    # Filtros de fecha
+    end_date = timezone.localdate()
+    start_date = end_date - timedelta(days=30)  # Por defecto últimos 30 días
+    
+    # Obtener fechas desde parámetros
+    fecha_desde = request.GET.get('fecha_desde')
+    fecha_hasta = request.GET.get('fecha_hasta')
+    
+    if fecha_desde:
+        try:
+            start_date = datetime.strptime(fecha_desde, '%Y-%m-%d').date()
+        except ValueError:
+            pass
+    
+    if fecha_hasta:
+        try:
+            end_date = datetime.strptime(fecha_hasta, '%Y-%m-%d').date()
+        except ValueError:
+            pass
+    
+    # Filtros adicionales
+    page_type_filter = request.GET.get('page_type')
+    country_filter = request.GET.get('country')
+    exclude_bots = request.GET.get('exclude_bots', 'true') == 'true'
+    
+    # Estadísticas desde los agregados (número fijo de consultas para cualquier rango)
+    stats = analytics(
+        start_date, end_date,
+        page_type=page_type_filter, country_code=country_filter, exclude_bots=exclude_bots,
+    )
+    
+    # Visitas recientes
+    range_start, range_end = day_range(start_date, end_date)
+    visits = PageVisit.objects.filter(visited_at__gte=range_start, visited_at__lt=range_end)
+    
+    if page_type_filter:
+        visits = visits.filter(page_type=page_type_filter)
+    
+    if country_filter:
+        visits = visits.filter(country_code=country_filter)
+    
+    if exclude_bots:
+        visits = visits.filter(is_bot=False)
+    
+    recent_visits = visits.order_by('-visited_at')[:50]
+    
+    context = {
+        'page_title': 'Analytics de Páginas Públicas',
+        'start_date': start_date,
+        'end_date': end_date,
+        **stats,
+        'recent_visits': recent_visits,
+        'page_types': PageVisit.PAGE_CHOICES,
+        # Filtros aplicados
+        'page_type_filter': page_type_filter,
+        'country_filter': country_filter,
+        'exclude_bots': exclude_bots,
+    }
+    
+    response = render(request, 'tickets/page_visits_analytics.html', context)
+    # Agregar headers para evitar cache
+    response['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+    response['Pragma'] = 'no-cache'
+    response['Expires'] = '0'
+    return response
+
+
+@login_required
+@require_http_methods(["GET"])
+def page_visits_detail_view(request):
+    """Vista detallada de visitas a páginas con filtros avanzados"""
+    from django.core.paginator import Paginator
+    from django.db.models import Q
+    from .models import PageVisit
+    from .visit_rollup import day_start
+    
+    # Query base
+    visits = PageVisit.objects.all().order_by('-visited_at')
+    
+    # Filtros
+    search = request.GET.get('search')
+    page_type = request.GET.get('page_type')
+    country = request.GET.get('country')
+    is_mobile = request.GET.get('is_mobile')
+    exclude_bots = request.GET.get('exclude_bots', 'true') == 'true'
+    fecha_desde = request.GET.get('fecha_desde')
+    fecha_hasta = request.GET.get('fecha_hasta')
+    
+    if search:
+        visits = visits.filter(
+            Q(page_url__icontains=search) |
+            Q(page_title__icontains=search) |
+            Q(ip_address__icontains=search) |
+            Q(country__icontains=search) |
+            Q(browser__icontains=search)
+        )
+    
+    if page_type:
+        visits = visits.filter(page_type=page_type)
+    
+    if country:
+        visits = visits.filter(country_code=country)
+    
+    if is_mobile:
+        visits = visits.filter(is_mobile=is_mobile == 'true')
+    
+    if exclude_bots:
+        visits = visits.filter(is_bot=False)
+    
+    if fecha_desde:
+        try:
+            from datetime import datetime
+            start_date = datetime.strptime(fecha_desde, '%Y-%m-%d').date()
+            visits = visits.filter(visited_at__gte=day_start(start_date))
+        except ValueError:
+            pass
+    
+    if fecha_hasta:
+        try:
+            from datetime import datetime, timedelta
+            end_date = datetime.strptime(fecha_hasta, '%Y-%m-%d').date()
+            visits = visits.filter(visited_at__lt=day_start(end_date + timedelta(days=1)))
+        except ValueError:
+            pass
+    
+    # Paginación
+    paginator = Paginator(visits, 50)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Para filtros
+    page_types = PageVisit.PAGE_CHOICES
+    countries = PageVisit.objects.exclude(country_code='').values('country_code', 'country').distinct().order_by('country')
+    
+    context = {
+        'page_title': 'Detalle de Visitas',
+        'page_obj': page_obj,
+        'page_types': page_types,
+        'countries': countries,
+        # Filtros aplicados
+        'search': search,
+        'page_type': page_type,
+        'country': country,
+        'is_mobile': is_mobile,
+        'exclude_bots': exclude_bots,
+        'fecha_desde': fecha_desde,
+        'fecha_hasta': fecha_hasta,
+    }
+    
+    return render(request, 'tickets/page_visits_detail.html', context)
+
+
+@login_required
+@require_http_methods(["GET"])
+def page_visits_export_view(request):
+    """Vista para exportar datos de visitas en CSV"""
+    import csv
+    from django.http import HttpResponse
+    from django.utils import timezone
+    from .models import PageVisit
+    from .visit_rollup import day_start
+    
+    # Aplicar los mismos filtros que en la vista principal
+    visits = PageVisit.objects.all().order_by('-visited_at')
+    
+    # Filtros (copiar lógica de page_visits_detail_view)
+    search = request.GET.get('search')
+    page_type = request.GET.get('page_type')
+    country = request.GET.get('country')
+    exclude_bots = request.GET.get('exclude_bots', 'true') == 'true'
+    fecha_desde = request.GET.get('fecha_desde')
+    fecha_hasta = request.GET.get('fecha_hasta')
+    
+    if search:
+        from django.db.models import Q
+        visits = visits.filter(
+            Q(page_url__icontains=search) |
+            Q(page_title__icontains=search) |
+            Q(ip_address__icontains=search) |
+            Q(country__icontains=search) |
+            Q(browser__icontains=search)
+        )
+    
+    if page_type:
+        visits = visits.filter(page_type=page_type)
+    
+    if country:
+        visits = visits.filter(country_code=country)
+    
+    if exclude_bots:
+        visits = visits.filter(is_bot=False)
+    
+    if fecha_desde:
+        try:
+            from datetime import datetime
+            start_date = datetime.strptime(fecha_desde, '%Y-%m-%d').date()
+            visits = visits.filter(visited_at__gte=day_start(start_date))
+        except ValueError:
+            pass
+    
+    if fecha_hasta:
+        try:
+            from datetime import datetime, timedelta
+            end_date = datetime.strptime(fecha_hasta, '%Y-%m-%d').date()
+            visits = visits.filter(visited_at__lt=day_start(end_date + timedelta(days=1)))
+        except ValueError:
+            pass
+    
+    # Limitar a 10000 registros para evitar problemas de memoria
+    visits = visits[:10000]
+    
+    # Crear respuesta CSV
+    response = HttpResponse(content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="visitas_paginas_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
+    
+    writer = csv.writer(response)
+    
+    # Encabezados
+    writer.writerow([
+        'Fecha/Hora',
+        'Tipo de Página',
+        'URL',
+        'Título',
+        'IP',
+        'País',
+        'Ciudad',
+        'Navegador',
+        'Sistema Operativo',
+        'Es Móvil',
+        'Es Bot',
+        'Referrer',
+        'UTM Source',
+        'UTM Medium',
+        'UTM Campaign'
+    ])
+    
+    # Datos
+    for visit in visits:
+        writer.writerow([
+            visit.visited_at.strftime('%Y-%m-%d %H:%M:%S'),
+            visit.get_page_type_display(),
+            visit.page_url,
+            visit.page_title,
+            visit.ip_address,
+            visit.country,
+            visit.city,
+            visit.browser_info,
+            visit.operating_system,
+            'Sí' if visit.is_mobile else 'No',
+            'Sí' if visit.is_bot else 'No',
+            visit.referrer,
+            visit.utm_source,
+            visit.utm_medium,
+            visit.utm_campaign
+        ])
+    
+    return response
+
+
+# ============= VISTAS ACORTADOR DE URLS =============
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def short_url_list(request):
+    """Vista para listar todas las URLs cortas"""
+    short_urls = ShortUrl.objects.filter(created_by=request.user).order_by('-created_at')
+    
+    context = {
+        'page_title': 'Acortador de URLs',
+        'short_urls': short_urls,
+    }
+    
+    return render(request, 'tickets/short_url_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def short_url_create(request):
+    """Vista para crear una nueva URL corta"""
+    if request.method == 'POST':
+        original_url = request.POST.get('original_url')
+        title = request.POST.get('title', '')
+        description = request.POST.get('description', '')
+        expires_days = request.POST.get('expires_days')
+        
+        if original_url:
+            # Verificar si ya existe una URL corta para esta URL
+            existing = ShortUrl.objects.filter(
+                original_url=original_url,
+                created_by=request.user,
+                is_active=True
+            ).first()
+            
+            if existing:
+                messages.info(request, f'Ya existe una URL corta para esta dirección: {existing.get_short_url(request)}')
+                return redirect('short_url_list')
+            
+            # Crear nueva URL corta
+            short_url = ShortUrl(
+                original_url=original_url,
+                title=title,
+                description=description,
+                short_code=ShortUrl.generate_short_code(),
+                created_by=request.user
+            )
+            
+            # Establecer fecha de expiración si se especifica
+            if expires_days:
+                try:
+                    days = int(expires_days)
+                    short_url.expires_at = timezone.now() + timezone.timedelta(days=days)
+                except (ValueError, TypeError):
+                    pass
+            
+            short_url.save()
+            
+            messages.success(request, f'URL corta creada exitosamente: {short_url.get_short_url(request)}')
+            return redirect('short_url_list')
+        else:
+            messages.error(request, 'La URL es requerida.')
+    
+    context = {
+        'page_title': 'Crear URL Corta',
+    }
+    
+    return render(request, 'tickets/short_url_create.html', context)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def short_url_edit(request, pk):
+    """Vista para editar una URL corta"""
+    short_url = get_object_or_404(ShortUrl, pk=pk, created_by=request.user)
+    
+    if request.method == 'POST':
+        # Actualizar título
+        title = request.POST.get('title', '').strip()
+        if title:
+            short_url.title = title
+        
+        # Actualizar URL original
+        original_url = request.POST.get('original_url', '').strip()
+        if original_url:
+            short_url.original_url = original_url
+        
+        # Actualizar código corto si se proporciona uno diferente
+        new_short_code = request.POST.get('short_code', '').strip()
+        if new_short_code and new_short_code != short_url.short_code:
+            # Verificar que el nuevo código no esté en uso
+            if ShortUrl.objects.filter(short_code=new_short_code).exclude(pk=pk).exists():
+                messages.error(request, f'El código "{new_short_code}" ya está en uso.')
+                return redirect('short_url_edit', pk=pk)
+            short_url.short_code = new_short_code
+        
+        # Actualizar fecha de expiración
+        expires_at = request.POST.get('expires_at', '').strip()
+        if expires_at:
+            try:
+                from datetime import datetime
+                short_url.expires_at = timezone.make_aware(datetime.fromisoformat(expires_at))
+            except (ValueError, TypeError):
+                short_url.expires_at = None
+        else:
+            short_url.expires_at = None
+        
+        # Actualizar KPI de Ventas
+        short_url.is_sales_kpi = request.POST.get('is_sales_kpi') == 'on'
+        
+        short_url.save()
+        messages.success(request, 'URL corta actualizada exitosamente.')
+        return redirect('short_url_list')
+    
+    # Preparar datos para el formulario
+    form_data = {
+        'title': {'value': short_url.title},
+        'original_url': {'value': short_url.original_url},
+        'short_code': {'value': short_url.short_code},
+        'expires_at': {'value': short_url.expires_at},
+    }
+    
+    context = {
+        'page_title': 'Editar URL Corta',
+        'short_url': short_url,
+        'object': short_url,  # Para compatibilidad con el template
+        'form': form_data,
+    }
+    
+    return render(request, 'tickets/short_url_edit.html', context)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def short_url_delete(request, pk):
+    """Vista para eliminar una URL corta"""
+    short_url = get_object_or_404(ShortUrl, pk=pk, created_by=request.user)
+    
+    if request.method == 'POST':
+        short_url.delete()
+        messages.success(request, 'URL corta eliminada exitosamente.')
+        return redirect('short_url_list')
+    
+    context = {
+        'page_title': 'Eliminar URL Corta',
+        'short_url': short_url,
+    }
+    
+    return render(request, 'tickets/short_url_delete.html', context)
+
+
+def short_url_redirect(request, short_code):
+    """Vista para redireccionar desde URL corta a URL original"""
+    from .models import ShortUrlClick
+    import geoip2.database
+    import os
+    from django.conf import settings
+    
+    short_url = get_object_or_404(ShortUrl, short_code=short_code, is_active=True)
+    
+    # Verificar si ha expirado
+    if short_url.is_expired():
+        messages.error(request, 'Esta URL corta ha expirado.')
+        return render(request, 'tickets/short_url_expired.html', {'short_url': short_url})
+    
+    # Incrementar contador de clics
+    short_url.increment_clicks()
+    
+    # Registrar el clic con detalles
+    ip_address = request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')[0].strip() or \
+                 request.META.get('HTTP_X_REAL_IP', '').strip() or \
+                 request.META.get('REMOTE_ADDR', '')
+    
+    country = ''
+    city = ''
+    
+    # Verificar que la IP no sea privada
+    is_public_ip = ip_address and not ip_address.startswith(('127.', '192.168.', '10.', '172.16.', '172.17.', '172.18.', '172.19.', '172.20.', '172.21.', '172.22.', '172.23.', '172.24.', '172.25.', '172.26.', '172.27.', '172.28.', '172.29.', '172.30.', '172.31.', 'localhost', '::1'))
+    
+    # Intentar obtener geolocalización si está disponible
+    if is_public_ip:
+        try:
+            geoip_path = getattr(settings, 'GEOIP_PATH', None)
+            if geoip_path and os.path.exists(os.path.join(geoip_path, 'GeoLite2-City.mmdb')):
+                reader = geoip2.database.Reader(os.path.join(geoip_path, 'GeoLite2-City.mmdb'))
+                response = reader.city(ip_address)
+                country = response.country.name or ''
+                city = response.city.name or ''
+                reader.close()
+        except Exception as e:
+            # Log el error para debug
+            print(f"GeoIP2 error: {e}")
+    
+    # Si no se pudo obtener geolocalización con GeoIP2, usar API gratuita
+    if not country and is_public_ip:
+        try:
+            import requests
+            response = requests.get(
+                f'http://ip-api.com/json/{ip_address}',
+                timeout=5,
+                headers={'User-Agent': 'Mozilla/5.0'}
+            )
+            if response.status_code == 200:
+                data = response.json()
+                if data.get('status') == 'success':
+                    country = data.get('country', '')
+                    city = data.get('city', '')
+                    print(f"IP-API success: {ip_address} -> {country}, {city}")
+                else:
+                    print(f"IP-API failed: {data.get('message', 'Unknown error')}")
+            else:
+                print(f"IP-API HTTP error: {response.status_code}")
+        except Exception as e:
+            print(f"IP-API exception: {e}")
+    
+    # Crear registro del clic
+    ShortUrlClick.objects.create(
+        short_url=short_url,
+        ip_address=ip_address,
+        country=country,
+        city=city,
+        user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
+        referer=request.META.get('HTTP_REFERER', '')[:500]
+    )
+    
+    # Redireccionar a la URL original
+    return redirect(short_url.original_url)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def short_url_stats(request, pk):
+    """Vista API para obtener estadísticas detalladas de una URL corta"""
+    from datetime import timedelta
+    from .activity_rollup import short_url_summary
+    import json
+    
+    short_url = get_object_or_404(ShortUrl, pk=pk, created_by=request.user)
+    
+    # Estadísticas desde los agregados por hora y día (en caché unos segundos)
+    summary = short_url_summary(short_url)
+    by_day = summary['by_day']
+    
+    # Si es una petición AJAX, devolver JSON
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest' or request.path.startswith('/api/'):
+        clicks = short_url.click_records.all()
+        
+        # Clics por mes (últimos 12 meses)
+        from dateutil.relativedelta import relativedelta
+        today = timezone.localdate()
+        twelve_months_ago = today - relativedelta(months=11)
+        
+        clicks_by_month = {}
+        for day, count in by_day.items():
+            clicks_by_month[(day.year, day.month)] = clicks_by_month.get((day.year, day.month), 0) + count
+        
+        month_labels = []
+        month_values = []
+        month_names = ['Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun', 'Jul', 'Ago', 'Sep', 'Oct', 'Nov', 'Dic']
+        
+        for i in range(12):
+            month_date = twelve_months_ago + relativedelta(months=i)
+            month_labels.append(f"{month_names[month_date.month-1]} {month_date.year}")
+            month_values.append(clicks_by_month.get((month_date.year, month_date.month), 0))
+        
+        # Clics por día (últimos 30 días)
+        thirty_days_ago = today - timedelta(days=29)
+        day_labels = []
+        day_values = []
+        for i in range(30):
+            day_date = thirty_days_ago + timedelta(days=i)
+            day_labels.append(day_date.strftime('%d/%m'))
+            day_values.append(by_day.get(day_date, 0))
+        
+        # Clics por hora del día (agrupados por hora 0-23)
+        hour_labels = [f"{h:02d}:00" for h in range(24)]
+        hour_values = [summary['by_hour'].get(h, 0) for h in range(24)]
+        
+        # Top países
+        total_clicks = short_url.clicks
+        country_data = [{
+            'country': item['country'],
+            'count': item['count'],
+            'percentage': round((item['count'] / total_clicks * 100), 1) if total_clicks > 0 else 0
+        } for item in summary['countries']]
+        
+        # Top ciudades
+        city_data = [{
+            'city': item['city'],
+            'count': item['count'],
+            'percentage': round((item['count'] / total_clicks * 100), 1) if total_clicks > 0 else 0
+        } for item in summary['cities']]
+        
+        # Top dominios de referencia
+        referrer_data = [{
+            'domain': item['referrer_domain'],
+            'count': item['count'],
+            'percentage': round((item['count'] / total_clicks * 100), 1) if total_clicks > 0 else 0
+        } for item in summary['referrers']]
+        
+        # Detalles de clics recientes (últimos 100)
+        click_details = [{
+            'clicked_at': click.clicked_at.strftime('%d/%m/%Y %H:%M:%S'),
+            'ip_address': click.ip_address,
+            'country': click.country,
+            'city': click.city,
+            'referer': click.referer
+        } for click in clicks.order_by('-clicked_at')[:100]]
+        
+        return JsonResponse({
+            'by_month': {
+                'labels': month_labels,
+                'values': month_values
+            },
+            'by_day': {
+                'labels': day_labels,
+                'values': day_values
+            },
+            'by_hour': {
+                'labels': hour_labels,
+                'values': hour_values
+            },
+            'by_country': country_data,
+            'by_city': city_data,
+            'by_referrer': referrer_data,
+            'click_details': click_details
+        })
+    
+    # Vista HTML original (mantener compatibilidad)
+    clicks = short_url.click_records.all()
+    
+    # Usar el contador del modelo como total (incluye clicks históricos)
+    total_clicks = short_url.clicks
+    
+    # IPs (estimadas) y países únicos de los registros detallados disponibles
+    unique_ips = summary['unique_ips']
+    unique_countries = summary['unique_countries']
+    
+    # ==================== DATOS PARA GRÁFICO DE ACTIVIDAD ESTILO GITHUB ====================
+    # Calcular últimos 365 días para el gráfico de contribuciones
+    end_date = timezone.localdate()
+    start_date = end_date - timedelta(days=364)
+    
+    # Crear diccionario con todos los días (0 si no hubo clics)
+    activity_data = {}
+    current_date = start_date
+    while current_date <= end_date:
+        activity_data[current_date.isoformat()] = by_day.get(current_date, 0)
+        current_date += timedelta(days=1)
+    
+    # Calcular total y máximo para el gráfico
+    activity_total = sum(activity_data.values())
+    activity_max = max(activity_data.values()) if activity_data.values() else 0
+    
+    # Serializar datos para JavaScript
+    activity_data_json = json.dumps(activity_data)
+    # ==================== FIN DATOS GRÁFICO DE ACTIVIDAD ====================
+    
+    # Calcular clicks históricos (sin registro detallado)
+    clicks_historicos = total_clicks - summary['recorded_clicks']
+    
+    # Estadísticas por día (últimos 30 días)
+    clicks_by_day_labels = []
+    clicks_by_day_values = []
+    for i in range(30):
+        day = end_date - timedelta(days=29-i)
+        clicks_by_day_labels.append(day.strftime('%d/%m'))
+        clicks_by_day_values.append(by_day.get(day, 0))
+    
+    # Si hay clicks históricos, agregarlos en el primer día del rango
+    if clicks_historicos > 0:
+        # Agregar los clicks históricos al primer día del rango visible
+        clicks_by_day_values[0] += clicks_historicos
+    
+    # Estadísticas por mes (últimos 12 meses)
+    year_ago = end_date - timedelta(days=365)
+    clicks_by_month_dict = {}
+    for day, count in by_day.items():
+        if day >= year_ago:
+            label = day.strftime('%m/%Y')
+            clicks_by_month_dict[label] = clicks_by_month_dict.get(label, 0) + count
+    
+    # Generar etiquetas para los últimos 12 meses
+    clicks_by_month_labels = []
+    clicks_by_month_values = []
+    for i in range(12):
+        month = end_date - timedelta(days=30*(11-i))
+        label = month.strftime('%m/%Y')
+        if label not in clicks_by_month_labels:  # Evitar duplicados
+            clicks_by_month_labels.append(label)
+            clicks_by_month_values.append(clicks_by_month_dict.get(label, 0))
+    
+    # Si hay clicks históricos, agregarlos en el primer mes del rango
+    if clicks_historicos > 0:
+        # Agregar los clicks históricos al primer mes del rango visible
+        clicks_by_month_values[0] += clicks_historicos
+    
+    # Estadísticas por país
+    clicks_by_country_labels = [item['country'] for item in summary['countries']]
+    clicks_by_country_values = [item['count'] for item in summary['countries']]
+    
+    # Top 10 ciudades
+    top_cities = summary['cities']
+    
+    # Últimos 20 clicks
+    last_clicks = clicks.order_by('-clicked_at')[:20]
+    
+    context = {
+        'page_title': f'Estadísticas - {short_url.title or short_url.short_code}',
+        'short_url': short_url,
+        'total_clicks': total_clicks,
+        'unique_ips': unique_ips,
+        'unique_countries': unique_countries,
+        
+        # Datos para gráficos (en formato JSON)
+        'clicks_by_day_labels': json.dumps(clicks_by_day_labels),
+        'clicks_by_day_values': json.dumps(clicks_by_day_values),
+        
+        'clicks_by_month_labels': json.dumps(clicks_by_month_labels),
+        'clicks_by_month_values': json.dumps(clicks_by_month_values),
+        
+        'clicks_by_country_labels': json.dumps(clicks_by_country_labels),
+        'clicks_by_country_values': json.dumps(clicks_by_country_values),
+        
+        # Datos para gráfico de actividad estilo GitHub
+        'activity_data': activity_data_json,
+        'activity_total': activity_total,
+        'activity_max': activity_max,
+        'activity_start_date': start_date.isoformat(),
+        'activity_end_date': end_date.isoformat(),
+        
+        # Datos para tablas
+        'top_cities': top_cities,
+        'last_clicks': last_clicks,
+    }
+    
+    return render(request, 'tickets/short_url_stats.html', context)
+
+
+# ============= VISTAS PARA RASTREADOR WEB =============
+
+@login_required
+def website_tracker_list(request):
+    """Lista de rastreos realizados"""
+    trackers = WebsiteTracker.objects.filter(user=request.user).order_by('-created_at')
+    
+    context = {
+        'trackers': trackers,
+        'page_title': 'Rastreador Web'
+    }
+    return render(request, 'tickets/website_tracker_list.html', context)
+
+
+@login_required
+def website_tracker_create(request):
+    """Crear nuevo rastreo de sitio web/IP"""
+    if request.method == 'POST':
+        target = request.POST.get('target', '').strip()
+        
+        if not target:
+            messages.error(request, 'Debes proporcionar una URL o IP')
+            return redirect('website_tracker_list')
+        
+        try:
+            from .web_tracker_utils import apply_result, track_website
+            
+            # Realizar el rastreo (las sondas se lanzan a la vez)
+            result = track_website(target)
+            
+            # Crear el registro
+            tracker = apply_result(WebsiteTracker(target=target, user=request.user), result)
+            tracker.save()
+            
+            messages.success(request, f'Rastreo completado exitosamente para {target}')
+            return redirect('website_tracker_detail', pk=tracker.pk)
+            
+        except Exception as e:
+            messages.error(request, f'Error al realizar el rastreo: {str(e)}')
+            return redirect('website_tracker_list')
+    
+    return redirect('website_tracker_list')
+
+
+@login_required
+def website_tracker_detail(request, pk):
+    """Detalle de un rastreo"""
+    tracker = get_object_or_404(WebsiteTracker, pk=pk, user=request.user)
+    
+    context = {
+        'tracker': tracker,
+        'page_title': f'Rastreo - {tracker.target}'
+    }
+    return render(request, 'tickets/website_tracker_detail.html', context)
+
+
+@login_required
+def website_tracker_delete(request, pk):
+    """Eliminar un rastreo"""
+    tracker = get_object_or_404(WebsiteTracker, pk=pk, user=request.user)
+    
+    if request.method == 'POST':
+        target = tracker.target
+        tracker.delete()
+        messages.success(request, f'Rastreo de {target} eliminado exitosamente')
+        return redirect('website_tracker_list')
+    
+    context = {
+        'tracker': tracker,
+        'page_title': f'Eliminar rastreo - {tracker.target}'
+    }
+    return render(request, 'tickets/website_tracker_delete.html', context)
+
+
+# ==================== Web Counter Views ====================
+
+@login_required
+def web_counter_list(request):
+    """Lista de contadores web del usuario"""
+    from .models import WebCounter
+    from .web_counter_ingest import period_page_views
+    
+    counters = list(WebCounter.objects.filter(user=request.user))
+    periods = period_page_views(counters)
+    for counter in counters:
+        counter.visits_count = counter.total_page_views
+        counter.visits_today = periods[counter.pk]['today']
+        counter.visits_week = periods[counter.pk]['week']
+    
+    context = {
+        'counters': counters,
+        'page_title': 'Contadores Web',
+    }
+    return render(request, 'tickets/web_counter_list.html', context)
+
+
+@login_required
+def web_counter_create(request):
+    """Crear nuevo contador web"""
+    from .models import WebCounter
+    
+    if request.method == 'POST':
+        title = request.POST.get('title')
+        domain = request.POST.get('domain', '')
+        
+        if not title:
+            messages.error(request, 'El título es obligatorio')
+            return redirect('web_counter_list')
+        
+        counter = WebCounter.objects.create(
+            user=request.user,
+            title=title,
+            domain=domain
+        )
+        
+        messages.success(request, f'Contador "{counter.title}" creado exitosamente')
+        return redirect('web_counter_detail', pk=counter.pk)
+    
+    context = {
+        'page_title': 'Crear Contador Web',
+    }
+    return render(request, 'tickets/web_counter_form.html', context)
+
+
+@login_required
+def web_counter_detail(request, pk):
+    """Detalle y estadísticas de un contador web"""
+    from .models import WebCounter
+    from .web_counter_ingest import daily_page_views, period_page_views, top_values
+    import json
+    
+    counter = get_object_or_404(WebCounter, pk=pk, user=request.user)
+    
+    # Estadísticas generales (desde las estadísticas diarias)
+    periods = period_page_views([counter])[counter.pk]
+    total_visits = counter.total_page_views
+    visits_today = periods['today']
+    visits_week = periods['week']
+    visits_month = periods['month']
+    
+    # Páginas, países, navegadores, sistemas operativos y dispositivos más frecuentes
+    top_pages = top_values(counter, 'url', 10)
+    top_countries = top_values(counter, 'country', 10)
+    top_browsers = top_values(counter, 'browser', 5)
+    top_os = top_values(counter, 'os', 5)
+    device_stats = top_values(counter, 'device_type', None)
+    
+    # Visitas de los últimos 30 días (para gráfico)
+    last_30_days = [
+        {'date': day.strftime('%d/%m'), 'count': count}
+        for day, count in daily_page_views(counter, days=30)
+    ]
+    
+    # Visitas recientes
+    recent_visits = counter.visits.all()[:50]
+    
+    context = {
+        'counter': counter,
+        'total_visits': total_visits,
+        'visits_today': visits_today,
+        'visits_week': visits_week,
+        'visits_month': visits_month,
+        'top_pages': top_pages,
+        'top_countries': top_countries,
+        'top_browsers': top_browsers,
+        'top_os': top_os,
+        'device_stats': device_stats,
+        'last_30_days': json.dumps(last_30_days),
+        'recent_visits': recent_visits,
+        'script_code': counter.get_script_html(request),
+        'page_title': f'Contador: {counter.title}',
+    }
+    return render(request, 'tickets/web_counter_detail.html', context)
+
+
+@login_required
+def web_counter_edit(request, pk):
+    """Editar contador web"""
+    from .models import WebCounter
+    
+    counter = get_object_or_404(WebCounter, pk=pk, user=request.user)
+    
+    if request.method == 'POST':
+        counter.title = request.POST.get('title', counter.title)
+        counter.domain = request.POST.get('domain', '')
+        counter.is_active = request.POST.get('is_active') == 'on'
+        # Sin los totales: los actualiza el registro de visitas en lote
+        counter.save(update_fields=['title', 'domain', 'is_active'])
+        
+        messages.success(request, 'Contador actualizado exitosamente')
+        return redirect('web_counter_detail', pk=counter.pk)
+    
+    context = {
+        'counter': counter,
+        'page_title': f'Editar: {counter.title}',
+    }
+    return render(request, 'tickets/web_counter_form.html', context)
+
+
+@login_required
+def web_counter_delete(request, pk):
+    """Eliminar contador web"""
+    from .models import WebCounter
+    
+    counter = get_object_or_404(WebCounter, pk=pk, user=request.user)
+    
+    if request.method == 'POST':
+        title = counter.title
+        counter.delete()
+        messages.success(request, f'Contador "{title}" eliminado exitosamente')
+        return redirect('web_counter_list')
+    
+    context = {
+        'counter': counter,
+        'page_title': f'Eliminar: {counter.title}',
+    }
+    return render(request, 'tickets/web_counter_delete.html', context)
+
+
+def web_counter_test_page(request, token):
+    """Página pública de prueba para el contador web"""
+    from .models import WebCounter
+    
+    counter = get_object_or_404(WebCounter, token=token, is_active=True)
+    
+    context = {
+        'counter': counter,
+        'script_code': counter.get_script_html(request),
+        'page_title': f'Prueba: {counter.title}',
+    }
+    return render(request, 'tickets/web_counter_test_page.html', context)
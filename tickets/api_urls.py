@@ -11,7 +11,9 @@ from .api_views import (
     ocr_invoice_api, ocr_invoice_list_api, increment_class_link_copy_count, create_course_comment,
     rate_course
 )
-from .views import short_url_stats
+from .lazy_views import lazy_views
+
+analytics_views = lazy_views('tickets.analytics_views')
 
 # Router para los ViewSets
 router = DefaultRouter()
@@ -63,7 +65,7 @@ api_urlpatterns = [
     
     # URL para estadísticas de URLs cortas
     path('short-urls/stats/', short_url_stats_api, name='api-short-urls-stats'),
-    path('short-urls/<int:pk>/stats/', short_url_stats, name='api-short-url-stats'),
+    path('short-urls/<int:pk>/stats/', analytics_views.short_url_stats, name='api-short-url-stats'),
     
     # URL para tracking de contadores web (sin autenticación)
     path('web-counter/track/', web_counter_track, name='api-web-counter-track'),
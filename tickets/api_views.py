@@ -9,7 +9,6 @@ from django.db.models import Q
 from django.utils import timezone
 from django.http import JsonResponse
 import json
-import psutil
 import platform
 import socket
 import subprocess
@@ -76,6 +75,12 @@ class TicketViewSet(viewsets.ModelViewSet):
             return TicketCreateSerializer
         return TicketSerializer
     
+    def get_serializer(self, *args, **kwargs):
+        # POST con una lista de tickets: alta masiva
+        if self.action == 'create' and isinstance(kwargs.get('data'), list):
+            kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
+    
     def get_queryset(self):
         """
         Retorna tickets según los permisos del usuario
@@ -115,10 +120,8 @@ class TicketViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(priority=priority_filter)
         
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | 
-                Q(description__icontains=search)
-            )
+            from .search import filter_queryset
+            queryset = filter_queryset(queryset, 'ticket', search)
         
         if is_agent(user) and assigned_filter:
             if assigned_filter == 'unassigned':
@@ -132,20 +135,21 @@ class TicketViewSet(viewsets.ModelViewSet):
         """
         Asignar el usuario actual como creador del ticket y su compañía si la tiene
         """
-        # Obtener los datos validados
+        # Obtener los datos validados (una lista en el alta masiva)
         validated_data = serializer.validated_data
+        items = validated_data if isinstance(validated_data, list) else [validated_data]
         
         # Si el usuario no especificó una compañía, asignar la del perfil del usuario
-        if 'company' not in validated_data or validated_data.get('company') is None:
+        if any(item.get('company') is None for item in items):
             try:
                 user_company = self.request.user.profile.company
-                if user_company:
-                    serializer.save(created_by=self.request.user, company=user_company)
-                    return
             except:
-                pass
+                user_company = None
+            if user_company:
+                for item in items:
+                    if item.get('company') is None:
+                        item['company'] = user_company
         
-        # Si no tiene compañía o ya especificó una, solo asignar el usuario
         serializer.save(created_by=self.request.user)
 
 
@@ -340,7 +344,7 @@ def whatsapp_receive_message(request):
     Endpoint para recibir mensajes de WhatsApp desde el servidor Node.js
     No requiere autenticación porque viene del servidor interno
     """
-    from .models import WhatsAppConnection, WhatsAppMessage, WhatsAppKeyword
+    from .models import WhatsAppConnection, WhatsAppMessage
     from django.contrib.auth.models import User
     
     try:
@@ -349,7 +353,6 @@ def whatsapp_receive_message(request):
         from_number = request.data.get('from')
         body = request.data.get('body', '')
         timestamp = request.data.get('timestamp')
-        message_id = request.data.get('message_id')
         
         if not user_id or not from_number:
             return Response({
@@ -368,57 +371,35 @@ def whatsapp_receive_message(request):
         # Guardar el mensaje recibido
         incoming_message = WhatsAppMessage.objects.create(
             connection=connection,
-            sender_number=from_number,
+            from_number=from_number,
+            to_number=connection.phone_number or '',
             message_text=body,
-            message_type='received',
-            whatsapp_message_id=message_id
+            message_type='received'
         )
         
-        # Buscar palabra clave que coincida
-        keywords = WhatsAppKeyword.objects.filter(
-            connection=connection,
-            is_active=True
-        ).order_by('-priority', 'keyword')
-        
+        # Buscar palabra clave que coincida (matcher compilado de la conexión)
+        from .keyword_matcher import match_whatsapp
         auto_reply_text = None
         matched_keyword = None
-        
-        for keyword in keywords:
-            message_to_check = body
-            keyword_to_check = keyword.keyword
-            
-            # Aplicar sensibilidad a mayúsculas/minúsculas
-            if not keyword.is_case_sensitive:
-                message_to_check = message_to_check.lower()
-                keyword_to_check = keyword_to_check.lower()
-            
-            # Verificar coincidencia
-            if keyword.is_exact_match:
-                if message_to_check == keyword_to_check:
-                    auto_reply_text = keyword.response
-                    matched_keyword = keyword
-                    break
-            else:
-                if keyword_to_check in message_to_check:
-                    auto_reply_text = keyword.response
-                    matched_keyword = keyword
-                    break
+        match = match_whatsapp(connection.pk, body)
+        if match:
+            keyword_id, matched_keyword, auto_reply_text = match
         
         # Si hay respuesta automática, enviarla
         if auto_reply_text:
             # Guardar la respuesta automática en la base de datos
             WhatsAppMessage.objects.create(
                 connection=connection,
-                sender_number=connection.phone_number or 'Bot',
-                recipient_number=from_number,
+                from_number=connection.phone_number or 'Bot',
+                to_number=from_number,
                 message_text=auto_reply_text,
                 message_type='auto_reply',
-                related_keyword=matched_keyword
+                keyword_matched_id=keyword_id
             )
             
             return Response({
                 'auto_reply': auto_reply_text,
-                'matched_keyword': matched_keyword.keyword
+                'matched_keyword': matched_keyword
             })
         else:
             return Response({
@@ -896,6 +877,8 @@ def system_info_api(request):
     """
     API para obtener información del sistema en tiempo real
     """
+    import psutil
+
     try:
         # Información de CPU
         cpu_percent = psutil.cpu_percent(interval=1)
@@ -1086,9 +1069,10 @@ def web_counter_track(request):
     if request.method != 'POST':
         return JsonResponse({'error': 'Método no permitido'}, status=405)
     
-    from .models import WebCounter, WebCounterVisit
-    import hashlib
-    from user_agents import parse
+    from .models import WebCounterVisit
+    from .web_counter_ingest import (
+        counter_id_for_token, enqueue_visit, is_new_session, parse_user_agent, session_id_for,
+    )
     
     try:
         data = json.loads(request.body)
@@ -1097,10 +1081,9 @@ def web_counter_track(request):
         if not token:
             return JsonResponse({'error': 'Token requerido'}, status=400)
         
-        # Buscar el contador
-        try:
-            counter = WebCounter.objects.get(token=token, is_active=True)
-        except WebCounter.DoesNotExist:
+        # Buscar el contador (desde la caché)
+        counter_id = counter_id_for_token(token)
+        if not counter_id:
             return JsonResponse({'error': 'Contador no encontrado'}, status=404)
         
         # Obtener IP del visitante
@@ -1110,63 +1093,41 @@ def web_counter_track(request):
         else:
             ip_address = request.META.get('REMOTE_ADDR')
         
-        # Parse user agent
+        # Parse user agent (memorizado por cadena)
         user_agent_string = data.get('user_agent', request.META.get('HTTP_USER_AGENT', ''))
-        user_agent = parse(user_agent_string)
-        
-        # Determinar tipo de dispositivo
-        if user_agent.is_mobile:
-            device_type = 'mobile'
-        elif user_agent.is_tablet:
-            device_type = 'tablet'
-        else:
-            device_type = 'desktop'
+        browser, os_name, device_type = parse_user_agent(user_agent_string)
         
         # Generar session ID único basado en IP + User Agent
-        session_string = f"{ip_address}_{user_agent_string}_{counter.token}"
-        session_id = hashlib.md5(session_string.encode()).hexdigest()
-        
-        # Verificar si es una nueva visita (sesión nueva en las últimas 30 minutos)
-        from datetime import timedelta
-        recent_visit = WebCounterVisit.objects.filter(
-            counter=counter,
-            session_id=session_id,
-            created_at__gte=timezone.now() - timedelta(minutes=30)
-        ).first()
+        session_id = session_id_for(token, ip_address, user_agent_string)
         
-        is_new_visit = not recent_visit
+        # Verificar si es una nueva visita (sesión nueva en las últimas 30 minutos), sin consultar la base de datos
+        is_new_visit = is_new_session(counter_id, session_id)
         
         # Obtener geolocalización (simplificada - se puede mejorar con servicios externos)
         country = ''
         city = ''
         # Aquí podrías integrar un servicio de geolocalización como ipinfo.io o geoip2
         
-        # Crear registro de visita
-        visit = WebCounterVisit.objects.create(
-            counter=counter,
+        # Encolar la visita: se guarda en lote junto con los contadores y las estadísticas diarias
+        visit = WebCounterVisit(
+            counter_id=counter_id,
             url=data.get('url', '')[:2048],
             referrer=data.get('referrer', '')[:2048],
             ip_address=ip_address,
             country=country,
             city=city,
             user_agent=user_agent_string[:1000],
-            browser=f"{user_agent.browser.family} {user_agent.browser.version_string}",
-            os=f"{user_agent.os.family} {user_agent.os.version_string}",
+            browser=browser,
+            os=os_name,
             device_type=device_type,
             screen_resolution=data.get('screen_resolution', ''),
             language=data.get('language', ''),
             session_id=session_id
         )
-        
-        # Actualizar contadores
-        counter.total_page_views += 1
-        if is_new_visit:
-            counter.total_visits += 1
-        counter.save()
+        enqueue_visit(visit, is_new_visit)
         
         return JsonResponse({
             'success': True,
-            'visit_id': visit.id,
             'is_new_visit': is_new_visit
         })
         
@@ -1182,14 +1143,19 @@ def web_counter_track(request):
 def web_counter_stats(request, token):
     """Obtener estadísticas actualizadas del contador"""
     from .models import WebCounter
+    from .web_counter_ingest import period_page_views
     
     try:
         counter = WebCounter.objects.get(token=token, is_active=True)
+        periods = period_page_views([counter])[counter.pk]
         
         return Response({
             'success': True,
             'total_visits': counter.total_visits,
-            'total_page_views': counter.total_page_views
+            'total_page_views': counter.total_page_views,
+            'page_views_today': periods['today'],
+            'page_views_week': periods['week'],
+            'page_views_month': periods['month'],
         })
         
     except WebCounter.DoesNotExist:
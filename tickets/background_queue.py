@@ -0,0 +1,154 @@
+"""
+Colas de trabajo en la base de datos procesadas en segundo plano.
+
+Las exportaciones PDF (``pdf_service``), los mensajes de los chatbots
+(``chatbot_pipeline``) y las notificaciones salientes (``notification_utils``)
+usan la propia fila como entrada de la cola:
+
+- ``ClaimQueue`` reserva la fila pendiente más antigua con un ``UPDATE``
+  condicional, de modo que dos procesos nunca cogen la misma. Una fila que
+  lleva en curso más de ``running_timeout`` se da por abandonada (proceso
+  caído) y se vuelve a reservar. ``claim_batch`` reserva un lote de una vez
+  marcándolo con un token, para colas que procesan las filas en grupo.
+- ``InlineWorker`` es un hilo por proceso web que vacía la cola cuando se le
+  despierta y termina cuando no queda nada. Si el ajuste ``inline_setting``
+  es False no se arranca y la cola la vacía un comando de gestión.
+"""
+import logging
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class ClaimQueue:
+    """
+    Cola sobre las filas de ``model`` con un campo de estado y otro de inicio.
+
+    Con ``due_field`` las filas pendientes solo se reservan cuando su fecha ya
+    ha pasado (reintentos programados). ``token_field`` es necesario para
+    ``claim_batch``.
+    """
+
+    def __init__(self, model, status_field, started_field, running_timeout,
+                 pending='pending', running='running', order_by='pk', related=(),
+                 due_field=None, token_field=None):
+        self.model = model
+        self.status_field = status_field
+        self.started_field = started_field
+        self.running_timeout = running_timeout
+        self.pending = pending
+        self.running = running
+        self.order_by = (order_by,) if isinstance(order_by, str) else tuple(order_by)
+        self.related = related
+        self.due_field = due_field
+        self.token_field = token_field
+
+    def claimable(self):
+        """Filas pendientes (y vencidas) o en curso desde hace más de ``running_timeout``"""
+        now = timezone.now()
+        pending = Q(**{self.status_field: self.pending})
+        if self.due_field:
+            pending &= Q(**{f'{self.due_field}__lte': now})
+        return pending | Q(**{
+            self.status_field: self.running,
+            f'{self.started_field}__lt': now - self.running_timeout,
+        })
+
+    def claim_next(self):
+        """Reserva la fila pendiente más antigua y la devuelve, o ``None`` si no hay"""
+        candidates = (self.model.objects.filter(self.claimable())
+                      .order_by(*self.order_by).values_list('pk', flat=True)[:10])
+        for pk in candidates:
+            claimed = self.model.objects.filter(self.claimable(), pk=pk).update(**{
+                self.status_field: self.running,
+                self.started_field: timezone.now(),
+            })
+            if claimed:
+                return self.model.objects.select_related(*self.related).get(pk=pk)
+        return None
+
+    def claim_batch(self, size):
+        """Reserva hasta ``size`` filas con un solo UPDATE y devuelve las reservadas"""
+        claimable = self.claimable()
+        pks = list(self.model.objects.filter(claimable)
+                   .order_by(*self.order_by).values_list('pk', flat=True)[:size])
+        if not pks:
+            return []
+
+        # La condición se vuelve a evaluar en el UPDATE: las filas que otro
+        # proceso reservó entre medias ya no la cumplen y se quedan fuera
+        token = uuid.uuid4().hex
+        self.model.objects.filter(claimable, pk__in=pks).update(**{
+            self.status_field: self.running,
+            self.started_field: timezone.now(),
+            self.token_field: token,
+        })
+        return list(self.model.objects.select_related(*self.related)
+                    .filter(**{self.token_field: token, self.status_field: self.running})
+                    .order_by(*self.order_by))
+
+
+class InlineWorker:
+    """
+    Hilo del proceso que ejecuta ``run_pending`` mientras se le despierte.
+
+    ``next_run`` devuelve los segundos hasta el próximo trabajo programado (o
+    ``None`` si no hay): el hilo espera ese tiempo en lugar de terminar.
+    ``settle`` son los segundos que espera tras despertar para agrupar
+    ráfagas, y ``error_delay`` el reintento si ``run_pending`` falla.
+    """
+
+    def __init__(self, name, run_pending, inline_setting, next_run=None, settle=0, error_delay=None):
+        self.name = name
+        self.run_pending = run_pending
+        self.inline_setting = inline_setting
+        self.next_run = next_run
+        self.settle = settle
+        self.error_delay = error_delay
+        self._thread = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    def wake(self):
+        """Despierta el hilo, arrancándolo si hace falta"""
+        if not getattr(settings, self.inline_setting, True):
+            return
+        with self._lock:
+            self._wakeup.set()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _loop(self):
+        """Procesa mientras haya pendientes y termina al vaciarse la cola"""
+        timeout = None
+        try:
+            while True:
+                if timeout:
+                    self._wakeup.wait(timeout)
+                self._wakeup.clear()
+                if self.settle:
+                    time.sleep(self.settle)
+                try:
+                    self.run_pending()
+                    timeout = self.next_run() if self.next_run else None
+                except Exception as e:
+                    logger.error(f'Error en el hilo {self.name}: {e}')
+                    timeout = self.error_delay
+                connection.close()
+                with self._lock:
+                    if timeout is None and not self._wakeup.is_set():
+                        self._thread = None
+                        return
+        finally:
+            connection.close()
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
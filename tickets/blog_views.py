@@ -0,0 +1,795 @@
+"""
+Vistas del blog: publicaciones, categorías, comentarios y generación con IA.
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+from django.db.models import F, Q
+from django.http import JsonResponse
+from django.views.decorators.http import require_http_methods
+import json
+from .models import BlogCategory, BlogPost, BlogComment
+from .page_cache import cache_public_page
+
+
+# ===== VISTAS DEL BLOG =====
+
+def count_post_view(request, slug):
+    """Suma la visita cuando el artículo se sirve desde la caché de páginas"""
+    BlogPost.objects.filter(slug=slug, status='published').update(views_count=F('views_count') + 1)
+
+
+@cache_public_page('blog', bypass_params=('search',))
+def blog_list(request):
+    """Lista pública de artículos del blog"""
+    posts = BlogPost.objects.filter(status='published').select_related('category', 'created_by')
+    
+    # Filtros
+    category_slug = request.GET.get('category')
+    if category_slug:
+        posts = posts.filter(category__slug=category_slug)
+    
+    search = request.GET.get('search')
+    if search:
+        from .search import filter_queryset
+        posts = filter_queryset(posts, 'blog_post', search)
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(posts, 12)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Categorías para el menú
+    categories = BlogCategory.objects.filter(is_active=True)
+    
+    # Artículos destacados
+    featured_posts = BlogPost.objects.filter(
+        status='published', 
+        is_featured=True
+    ).select_related('category')[:3]
+    
+    context = {
+        'page_obj': page_obj,
+        'posts': page_obj.object_list,
+        'categories': categories,
+        'featured_posts': featured_posts,
+        'current_category': category_slug,
+        'page_title': 'Blog',
+        'is_authenticated': request.user.is_authenticated,
+    }
+    
+    return render(request, 'tickets/blog_list.html', context)
+
+
+@cache_public_page('blog', on_hit=count_post_view)
+def blog_post_detail(request, slug):
+    """Vista detalle de un artículo del blog"""
+    post = get_object_or_404(BlogPost, slug=slug, status='published')
+    
+    # Incrementar contador de visualizaciones
+    post.increment_views()
+    
+    # Procesar comentarios
+    if request.method == 'POST':
+        from .forms import BlogCommentForm
+        comment_form = BlogCommentForm(request.POST)
+        if comment_form.is_valid():
+            comment = comment_form.save(commit=False)
+            comment.post = post
+            
+            # Obtener IP del usuario
+            x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+            if x_forwarded_for:
+                comment.ip_address = x_forwarded_for.split(',')[0]
+            else:
+                comment.ip_address = request.META.get('REMOTE_ADDR')
+            
+            comment.save()
+            messages.success(request, 'Tu comentario ha sido enviado y está pendiente de aprobación.')
+            return redirect('blog_post_detail', slug=slug)
+    else:
+        from .forms import BlogCommentForm
+        comment_form = BlogCommentForm()
+    
+    # Comentarios aprobados
+    comments = post.comments.filter(is_approved=True).order_by('created_at')
+    
+    # Artículos relacionados
+    related_posts = BlogPost.objects.filter(
+        status='published',
+        category=post.category
+    ).exclude(pk=post.pk)[:3]
+    
+    context = {
+        'post': post,
+        'comments': comments,
+        'comment_form': comment_form,
+        'related_posts': related_posts,
+        'page_title': post.title,
+        'is_authenticated': request.user.is_authenticated,
+    }
+    
+    return render(request, 'tickets/blog_post_detail.html', context)
+
+
+@login_required
+def blog_category_list(request):
+    """Lista de categorías del blog (admin)"""
+    categories = BlogCategory.objects.all().order_by('name')
+    
+    context = {
+        'categories': categories,
+        'page_title': 'Categorías de Blog'
+    }
+    
+    return render(request, 'tickets/blog_category_list.html', context)
+
+
+@login_required
+def blog_category_create(request):
+    """Crear nueva categoría de blog"""
+    from .forms import BlogCategoryForm
+    
+    if request.method == 'POST':
+        print(f"POST data: {request.POST}")
+        form = BlogCategoryForm(request.POST)
+        print(f"Form is valid: {form.is_valid()}")
+        if not form.is_valid():
+            print(f"Form errors: {form.errors}")
+        
+        if form.is_valid():
+            try:
+                category = form.save(commit=False)
+                category.created_by = request.user
+                
+                # Auto-generar slug único
+                from django.utils.text import slugify
+                base_slug = slugify(category.name)
+                slug = base_slug
+                counter = 1
+                
+                # Verificar si el slug ya existe y crear uno único
+                while BlogCategory.objects.filter(slug=slug).exists():
+                    slug = f"{base_slug}-{counter}"
+                    counter += 1
+                
+                category.slug = slug
+                category.save()
+                print(f"Categoría creada: {category.name} - {category.slug}")
+                
+                messages.success(request, f'Categoría "{category.name}" creada exitosamente.')
+                return redirect('blog_category_list')
+                
+            except Exception as e:
+                print(f"Exception al crear categoría: {str(e)}")
+                messages.error(request, f'Error al crear la categoría: {str(e)}')
+        else:
+            messages.error(request, 'Por favor corrige los errores en el formulario.')
+    else:
+        form = BlogCategoryForm()
+    
+    context = {
+        'form': form,
+        'page_title': 'Nueva Categoría'
+    }
+    
+    return render(request, 'tickets/blog_category_form.html', context)
+
+
+@login_required
+def blog_post_list_admin(request):
+    """Lista de artículos del blog (admin)"""
+    posts = BlogPost.objects.all().select_related('category', 'created_by')
+    
+    # Filtros
+    status = request.GET.get('status')
+    if status:
+        posts = posts.filter(status=status)
+    
+    category_id = request.GET.get('category')
+    if category_id:
+        posts = posts.filter(category_id=category_id)
+    
+    search = request.GET.get('search')
+    if search:
+        posts = posts.filter(
+            Q(title__icontains=search) |
+            Q(excerpt__icontains=search)
+        )
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(posts, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    categories = BlogCategory.objects.filter(is_active=True)
+    
+    context = {
+        'page_obj': page_obj,
+        'posts': page_obj.object_list,
+        'categories': categories,
+        'page_title': 'Gestión de Blog'
+    }
+    
+    return render(request, 'tickets/blog_post_list_admin.html', context)
+
+
+@login_required
+def blog_post_create(request):
+    """Crear nuevo artículo de blog"""
+    from .forms import BlogPostForm
+    
+    if request.method == 'POST':
+        form = BlogPostForm(request.POST, request.FILES)
+        if form.is_valid():
+            post = form.save(commit=False)
+            post.created_by = request.user
+            post.save()
+            
+            messages.success(request, f'Artículo "{post.title}" creado exitosamente.')
+            return redirect('blog_post_detail_admin', pk=post.pk)
+    else:
+        form = BlogPostForm()
+    
+    context = {
+        'form': form,
+        'page_title': 'Nuevo Artículo'
+    }
+    
+    return render(request, 'tickets/blog_post_form.html', context)
+
+
+@login_required
+def blog_post_detail_admin(request, pk):
+    """Vista detalle de artículo (admin)"""
+    post = get_object_or_404(BlogPost, pk=pk)
+    
+    # Comentarios pendientes
+    pending_comments = post.comments.filter(is_approved=False).order_by('-created_at')
+    approved_comments = post.comments.filter(is_approved=True).order_by('-created_at')
+    
+    context = {
+        'post': post,
+        'pending_comments': pending_comments,
+        'approved_comments': approved_comments,
+        'page_title': f'Artículo: {post.title}'
+    }
+    
+    return render(request, 'tickets/blog_post_detail_admin.html', context)
+
+
+@login_required
+def blog_comment_approve(request, pk):
+    """Aprobar comentario"""
+    comment = get_object_or_404(BlogComment, pk=pk)
+    comment.is_approved = True
+    comment.save()
+    
+    messages.success(request, 'Comentario aprobado exitosamente.')
+    return redirect('blog_post_detail_admin', pk=comment.post.pk)
+
+
+@login_required
+def blog_comment_delete(request, pk):
+    """Eliminar comentario"""
+    comment = get_object_or_404(BlogComment, pk=pk)
+    post_pk = comment.post.pk
+    comment.delete()
+    
+    messages.success(request, 'Comentario eliminado exitosamente.')
+    return redirect('blog_post_detail_admin', pk=post_pk)
+
+
+@login_required
+def blog_post_edit(request, pk):
+    """Editar artículo de blog"""
+    from .forms import BlogPostForm
+    
+    post = get_object_or_404(BlogPost, pk=pk)
+    
+    if request.method == 'POST':
+        form = BlogPostForm(request.POST, request.FILES, instance=post)
+        if form.is_valid():
+            post = form.save(commit=False)
+            
+            # Si se está publicando por primera vez, establecer fecha de publicación
+            if post.status == 'published' and not post.published_at:
+                from django.utils import timezone
+                post.published_at = timezone.now()
+            
+            post.save()
+            messages.success(request, f'Artículo "{post.title}" actualizado exitosamente.')
+            return redirect('blog_post_detail_admin', pk=post.pk)
+    else:
+        form = BlogPostForm(instance=post)
+    
+    context = {
+        'form': form,
+        'post': post,
+        'page_title': f'Editar: {post.title}',
+        'action': 'Actualizar'
+    }
+    
+    return render(request, 'tickets/blog_post_form.html', context)
+
+
+@login_required
+def blog_post_toggle_status(request, pk):
+    """Cambiar estado de publicación del artículo"""
+    post = get_object_or_404(BlogPost, pk=pk)
+    
+    if post.status == 'published':
+        post.status = 'draft'
+        post.published_at = None
+        messages.success(request, f'Artículo "{post.title}" despublicado.')
+    else:
+        post.status = 'published'
+        if not post.published_at:
+            from django.utils import timezone
+            post.published_at = timezone.now()
+        messages.success(request, f'Artículo "{post.title}" publicado exitosamente.')
+    
+    post.save()
+    return redirect('blog_post_detail_admin', pk=post.pk)
+
+
+@login_required
+def blog_post_delete(request, pk):
+    """Eliminar artículo de blog"""
+    post = get_object_or_404(BlogPost, pk=pk)
+    
+    if request.method == 'POST':
+        title = post.title
+        post.delete()
+        messages.success(request, f'Artículo "{title}" eliminado exitosamente.')
+        return redirect('blog_post_list_admin')
+    
+    context = {
+        'post': post,
+        'page_title': f'Eliminar: {post.title}'
+    }
+    
+    return render(request, 'tickets/blog_post_delete.html', context)
+
+
+# =====================================================
+# FUNCIONALIDADES DE IA PARA BLOG
+# =====================================================
+
+@login_required
+@require_http_methods(["POST"])
+def blog_ai_improve_content(request, pk):
+    """Mejorar contenido del artículo con IA"""
+    try:
+        from .ai_utils import AIContentOptimizer
+        from .utils import is_agent
+        
+        post = get_object_or_404(BlogPost, pk=pk)
+        
+        # Verificar permisos
+        if not is_agent(request.user):
+            return JsonResponse({'error': 'Permisos insuficientes'}, status=403)
+        
+        optimizer = AIContentOptimizer()
+        result = optimizer.improve_content(post.title, post.content)
+        
+        return JsonResponse(result)
+    except Exception as e:
+        return JsonResponse({'error': f'Error interno: {str(e)}'}, status=500)
+
+
+@login_required
+@require_http_methods(["POST"])
+def blog_ai_generate_meta_description(request, pk):
+    """Generar meta descripción con IA"""
+    try:
+        from .ai_utils import AIContentOptimizer
+        from .utils import is_agent
+        
+        post = get_object_or_404(BlogPost, pk=pk)
+        
+        # Verificar permisos
+        if not is_agent(request.user):
+            return JsonResponse({'error': 'Permisos insuficientes'}, status=403)
+        
+        optimizer = AIContentOptimizer()
+        result = optimizer.generate_meta_description(post.title, post.content)
+        
+        return JsonResponse(result)
+    except Exception as e:
+        return JsonResponse({'error': f'Error interno: {str(e)}'}, status=500)
+
+
+@login_required
+@require_http_methods(["POST"])
+def blog_ai_suggest_titles(request, pk):
+    """Sugerir títulos alternativos con IA"""
+    try:
+        from .ai_utils import AIContentOptimizer
+        from .utils import is_agent
+        
+        post = get_object_or_404(BlogPost, pk=pk)
+        
+        # Verificar permisos
+        if not is_agent(request.user):
+            return JsonResponse({'error': 'Permisos insuficientes'}, status=403)
+        
+        optimizer = AIContentOptimizer()
+        result = optimizer.suggest_titles(post.content)
+        
+        return JsonResponse(result)
+    except Exception as e:
+        return JsonResponse({'error': f'Error interno: {str(e)}'}, status=500)
+
+
+@login_required
+@require_http_methods(["POST"])
+def blog_ai_generate_tags(request, pk):
+    """Generar etiquetas con IA"""
+    try:
+        from .ai_utils import AIContentOptimizer
+        from .utils import is_agent
+        
+        post = get_object_or_404(BlogPost, pk=pk)
+        
+        # Verificar permisos
+        if not is_agent(request.user):
+            return JsonResponse({'error': 'Permisos insuficientes'}, status=403)
+        
+        optimizer = AIContentOptimizer()
+        result = optimizer.generate_tags(post.title, post.content)
+        
+        return JsonResponse(result)
+    except Exception as e:
+        return JsonResponse({'error': f'Error interno: {str(e)}'}, status=500)
+
+
+@login_required
+@require_http_methods(["POST"])
+def blog_ai_analyze_readability(request, pk):
+    """Analizar legibilidad del contenido con IA"""
+    try:
+        from .ai_utils import AIContentOptimizer
+        from .utils import is_agent
+        
+        post = get_object_or_404(BlogPost, pk=pk)
+        
+        # Verificar permisos
+        if not is_agent(request.user):
+            return JsonResponse({'error': 'Permisos insuficientes'}, status=403)
+        
+        optimizer = AIContentOptimizer()
+        result = optimizer.analyze_readability(post.content)
+        
+        return JsonResponse(result)
+    except Exception as e:
+        return JsonResponse({'error': f'Error interno: {str(e)}'}, status=500)
+
+
+@login_required
+def blog_ai_test_connection(request):
+    """Probar conexión con IA"""
+    try:
+        from .ai_utils import test_ai_connection
+        from .utils import is_agent
+        
+        # Verificar permisos
+        if not is_agent(request.user):
+            return JsonResponse({'error': 'Permisos insuficientes'}, status=403)
+        
+        result = test_ai_connection()
+        return JsonResponse(result)
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error interno: {str(e)}'}, status=500)
+
+
+@login_required
+@require_http_methods(["POST"])
+def blog_ai_improve_complete_article(request, pk):
+    """Mejorar completamente el artículo (título + contenido) con IA"""
+    try:
+        from .ai_utils import AIContentOptimizer
+        from .utils import is_agent
+        
+        post = get_object_or_404(BlogPost, pk=pk)
+        
+        # Verificar permisos
+        if not is_agent(request.user):
+            return JsonResponse({'error': 'Permisos insuficientes'}, status=403)
+        
+        optimizer = AIContentOptimizer()
+        result = optimizer.improve_complete_article(post.title, post.content)
+        
+        return JsonResponse(result)
+    except Exception as e:
+        return JsonResponse({'error': f'Error interno: {str(e)}'}, status=500)
+
+
+@login_required
+@require_http_methods(["POST"])
+def blog_ai_generate_image(request, pk):
+    """Generar imagen para el artículo con IA basándose en el título"""
+    try:
+        from .ai_utils import AIContentOptimizer
+        from .utils import is_agent
+        
+        post = get_object_or_404(BlogPost, pk=pk)
+        
+        # Verificar permisos
+        if not is_agent(request.user):
+            return JsonResponse({'error': 'Permisos insuficientes'}, status=403)
+        
+        optimizer = AIContentOptimizer()
+        result = optimizer.generate_article_image(post.title, post.content)
+        
+        if result.get("success"):
+            # Actualizar el post con la nueva imagen
+            post.featured_image = result["file_path"]
+            post.save()
+            
+            return JsonResponse({
+                "success": True,
+                "image_url": result["local_url"],
+                "file_path": result["file_path"],
+                "message": "Imagen generada y guardada exitosamente"
+            })
+        else:
+            return JsonResponse(result)
+            
+    except Exception as e:
+        return JsonResponse({'error': f'Error interno: {str(e)}'}, status=500)
+
+
+@login_required
+@require_http_methods(["POST"])
+def blog_ai_apply_improvements(request, pk):
+    """Aplicar mejoras sugeridas por IA al artículo"""
+    try:
+        from .utils import is_agent
+        
+        post = get_object_or_404(BlogPost, pk=pk)
+        
+        # Verificar permisos
+        if not is_agent(request.user):
+            return JsonResponse({'error': 'Permisos insuficientes'}, status=403)
+        
+        data = json.loads(request.body)
+        
+        # Aplicar cambios si están presentes
+        if 'content' in data and data['content']:
+            post.content = data['content']
+        
+        if 'meta_description' in data and data['meta_description']:
+            post.meta_description = data['meta_description']
+        
+        if 'tags' in data and data['tags']:
+            post.tags = data['tags']
+        
+        if 'title' in data and data['title']:
+            post.title = data['title']
+            # Regenerar slug si se cambia el título
+            from django.utils.text import slugify
+            post.slug = slugify(post.title)
+        
+        post.save()
+        
+        return JsonResponse({
+            'success': True, 
+            'message': 'Artículo actualizado exitosamente con las mejoras de IA'
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Datos JSON inválidos'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': f'Error interno: {str(e)}'}, status=500)
+
+
+# ====================================
+# CONFIGURADOR DE IA PARA BLOG
+# ====================================
+
+@login_required
+@require_http_methods(["GET"])
+def ai_blog_configurators_list_view(request):
+    """Vista lista de configuradores de IA para blog"""
+    from .models import AIBlogConfigurator
+    
+    configurators = AIBlogConfigurator.objects.all().order_by('-created_at')
+    
+    # Agregar información de próxima ejecución y estadísticas
+    for config in configurators:
+        config.next_run_formatted = config.next_run_time.strftime('%d/%m/%Y %H:%M') if config.next_run_time else 'No programado'
+        config.last_run_formatted = config.last_run.strftime('%d/%m/%Y %H:%M') if config.last_run else 'Nunca'
+        
+        # Calcular estadísticas desde los logs
+        logs = config.generation_logs.all()
+        config.successful_runs = logs.filter(generation_status='success').count()
+        config.failed_runs = logs.filter(generation_status='error').count()
+        
+        # Contar posts realmente generados desde los logs
+        posts_generated = logs.filter(
+            generation_status='success',
+            generated_post__isnull=False
+        ).count()
+        config.posts_generated = posts_generated
+    
+    context = {
+        'page_title': 'Configuradores de IA para Blog',
+        'configurators': configurators,
+    }
+    
+    return render(request, 'tickets/ai_blog_configurators_list.html', context)
+
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def ai_blog_configurator_create_view(request):
+    """Vista para crear configurador de IA"""
+    from .models import AIBlogConfigurator, BlogCategory
+    
+    if request.method == 'POST':
+        try:
+            configurator = AIBlogConfigurator.objects.create(
+                name=request.POST.get('name'),
+                description=request.POST.get('description', ''),
+                keywords=request.POST.get('keywords'),
+                topic_template=request.POST.get('topic_template'),
+                content_length=request.POST.get('content_length'),
+                content_style=request.POST.get('content_style'),
+                is_active=request.POST.get('is_active') == 'on',
+                schedule_time=request.POST.get('schedule_time'),
+                frequency_days=int(request.POST.get('frequency_days', 1)),
+                max_posts_per_run=int(request.POST.get('max_posts_per_run', 1)),
+                default_category_id=request.POST.get('default_category') or None,
+            )
+            
+            messages.success(request, f'Configurador "{configurator.name}" creado exitosamente.')
+            return redirect('ai_blog_configurators_list')
+            
+        except Exception as e:
+            messages.error(request, f'Error creando configurador: {str(e)}')
+    
+    # Para el formulario
+    categories = BlogCategory.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'page_title': 'Crear Configurador de IA',
+        'categories': categories,
+    }
+    
+    return render(request, 'tickets/ai_blog_configurator_form.html', context)
+
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def ai_blog_configurator_edit_view(request, pk):
+    """Vista para editar configurador de IA"""
+    from .models import AIBlogConfigurator, BlogCategory
+    
+    configurator = get_object_or_404(AIBlogConfigurator, pk=pk)
+    
+    if request.method == 'POST':
+        try:
+            configurator.name = request.POST.get('name')
+            configurator.description = request.POST.get('description', '')
+            configurator.keywords = request.POST.get('keywords')
+            configurator.topic_template = request.POST.get('topic_template')
+            configurator.content_length = request.POST.get('content_length')
+            configurator.content_style = request.POST.get('content_style')
+            configurator.is_active = request.POST.get('is_active') == 'on'
+            configurator.schedule_time = request.POST.get('schedule_time')
+            configurator.frequency_days = int(request.POST.get('frequency_days', 1))
+            configurator.max_posts_per_run = int(request.POST.get('max_posts_per_run', 1))
+            configurator.default_category_id = request.POST.get('default_category') or None
+            configurator.save()
+            
+            messages.success(request, f'Configurador "{configurator.name}" actualizado exitosamente.')
+            return redirect('ai_blog_configurators_list')
+            
+        except Exception as e:
+            messages.error(request, f'Error actualizando configurador: {str(e)}')
+    
+    # Para el formulario
+    categories = BlogCategory.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'page_title': 'Editar Configurador de IA',
+        'configurator': configurator,
+        'categories': categories,
+    }
+    
+    return render(request, 'tickets/ai_blog_configurator_form.html', context)
+
+
+@login_required
+@require_http_methods(["POST"])
+def ai_blog_configurator_delete_view(request, pk):
+    """Vista para eliminar configurador de IA"""
+    from .models import AIBlogConfigurator
+    
+    configurator = get_object_or_404(AIBlogConfigurator, pk=pk)
+    configurator_name = configurator.name
+    configurator.delete()
+    
+    messages.success(request, f'Configurador "{configurator_name}" eliminado exitosamente.')
+    return redirect('ai_blog_configurators_list')
+
+
+@login_required
+@require_http_methods(["POST"])
+def ai_blog_configurator_toggle_view(request, pk):
+    """Vista para activar/desactivar configurador de IA"""
+    from .models import AIBlogConfigurator
+    
+    configurator = get_object_or_404(AIBlogConfigurator, pk=pk)
+    configurator.is_active = not configurator.is_active
+    configurator.save()
+    
+    status = 'activado' if configurator.is_active else 'desactivado'
+    messages.success(request, f'Configurador "{configurator.name}" {status} exitosamente.')
+    
+    return redirect('ai_blog_configurators_list')
+
+
+@login_required
+@require_http_methods(["POST"])
+def ai_blog_configurator_run_now_view(request, pk):
+    """Vista para ejecutar manualmente un configurador de IA"""
+    from .models import AIBlogConfigurator
+    
+    configurator = get_object_or_404(AIBlogConfigurator, pk=pk)
+    
+    try:
+        # Importar la función de generación
+        from .ai_blog_generator import run_ai_blog_generation
+        
+        # Ejecutar manualmente con force=True para ignorar frecuencia programada
+        result = run_ai_blog_generation(configurator, force=True)
+        
+        if result['success']:
+            messages.success(request, f'✅ Generación exitosa: {result["posts_created"]} post(s) creado(s)')
+        else:
+            messages.error(request, f'❌ Error en generación: {result["error"]}')
+            
+    except Exception as e:
+        messages.error(request, f'Error ejecutando configurador: {str(e)}')
+    
+    return redirect('ai_blog_configurators_list')
+
+
+@login_required
+@require_http_methods(["GET"])
+def ai_blog_generation_logs_view(request, pk):
+    """Vista para ver logs de generación de un configurador"""
+    from .models import AIBlogConfigurator, AIBlogGenerationLog
+    
+    configurator = get_object_or_404(AIBlogConfigurator, pk=pk)
+    logs = AIBlogGenerationLog.objects.filter(configurator=configurator).order_by('-created_at')
+    
+    # Calcular estadísticas
+    total_logs = logs.count()
+    successful_logs = logs.filter(generation_status='success').count()
+    failed_logs = logs.filter(generation_status='error').count()
+    posts_generated = logs.filter(generated_post__isnull=False).count()
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(logs, 50)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'page_title': f'Logs de Generación - {configurator.name}',
+        'configurator': configurator,
+        'page_obj': page_obj,
+        'stats': {
+            'total_logs': total_logs,
+            'successful_logs': successful_logs,
+            'failed_logs': failed_logs,
+            'posts_generated': posts_generated,
+        }
+    }
+    
+    return render(request, 'tickets/ai_blog_generation_logs.html', context)
@@ -3,7 +3,6 @@ Utilidades para generar certificados de exámenes
 """
 import io
 import qrcode
-from django.http import HttpResponse
 from django.conf import settings
 from django.utils import timezone
 from reportlab.pdfgen import canvas
@@ -199,15 +198,21 @@ def create_certificate_response(attempt):
     """
     Crea una respuesta HTTP con el certificado PDF
     """
-    pdf_buffer = generate_certificate_pdf(attempt)
-    if not pdf_buffer:
+    from .pdf_service import cached_pdf, pdf_response
+    
+    if not attempt.passed:
         return None
+    if not attempt.certificate_token:
+        attempt.generate_certificate_token()
     
-    response = HttpResponse(pdf_buffer.getvalue(), content_type='application/pdf')
-    filename = f"certificado_{attempt.participant_name.replace(' ', '_')}_{attempt.exam.title.replace(' ', '_')}.pdf"
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    # El certificado de un intento no cambia: se genera (con su QR) una sola vez
+    data = [attempt.certificate_token, attempt.certificate_generated_at, attempt.participant_name,
+            attempt.exam.title, attempt.score, attempt.correct_answers, attempt.total_questions,
+            attempt.completed_at]
+    pdf_buffer = cached_pdf('certificate', data, lambda: generate_certificate_pdf(attempt))
     
-    return response
+    filename = f"certificado_{attempt.participant_name.replace(' ', '_')}_{attempt.exam.title.replace(' ', '_')}.pdf"
+    return pdf_response(pdf_buffer, filename)
 
 
 def verify_certificate_data(token):
@@ -0,0 +1,251 @@
+"""
+Procesamiento en segundo plano de los mensajes de los chatbots.
+
+``chatbot_chat`` guarda el mensaje del usuario y responde enseguida: con la
+respuesta de la pregunta configurada que encaje (``keyword_matcher``), con
+la respuesta por defecto o, si la respuesta la tiene que dar la IA, con
+``pending`` para que el widget la espere. Lo lento se hace aquí:
+
+- la geolocalización de la IP de la conversación (en caché por IP durante
+  ``CHATBOT_GEO_CACHE_TTL`` segundos);
+- la detección del email, el teléfono y el nombre en el mensaje;
+- la respuesta de la IA, que se guarda como un mensaje más del bot
+  (``in_reply_to``) y el widget recoge con ``chatbot_get_new_messages``
+  (``reply_to``).
+
+El propio mensaje hace de cola (``ChatbotMessage.pipeline_status``). Con
+``CHATBOT_PIPELINE_INLINE`` cada proceso web lo procesa en un hilo propio
+con hasta ``CHATBOT_PIPELINE_WORKERS`` mensajes a la vez; si no, los procesa
+``python manage.py run_chatbot_pipeline``. La cola y el hilo son los de
+``background_queue``, los mismos que usan las exportaciones PDF.
+"""
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F
+
+from .background_queue import ClaimQueue, InlineWorker
+from .models import Chatbot, ChatbotMessage
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = getattr(settings, 'CHATBOT_PIPELINE_WORKERS', 4)
+GEO_CACHE_TTL = getattr(settings, 'CHATBOT_GEO_CACHE_TTL', 24 * 3600)
+
+# Un mensaje "procesando" durante más tiempo se da por abandonado y se reintenta
+RUNNING_TIMEOUT = timedelta(minutes=5)
+
+DEFAULT_RESPONSE = "Lo siento, no tengo una respuesta para esa pregunta. ¿Puedo ayudarte con algo más?"
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'\b[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,9}\b')
+# Patrones comunes: "Soy Juan", "Me llamo María", "Mi nombre es Pedro"
+NAME_PATTERNS = [
+    re.compile(
+        r'(?:soy|me llamo|mi nombre es)\s+([A-ZÁÉÍÓÚÑ][a-záéíóúñ]+(?:\s+[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+)?)',
+        re.IGNORECASE,
+    ),
+    re.compile(r'^([A-ZÁÉÍÓÚÑ][a-záéíóúñ]+(?:\s+[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+)?)[,\s]', re.IGNORECASE),
+]
+
+
+def client_ip(request):
+    """IP del cliente (la primera de ``X-Forwarded-For`` si viene)"""
+    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    if x_forwarded_for:
+        return x_forwarded_for.split(',')[0]
+    return request.META.get('REMOTE_ADDR')
+
+
+def geo_data(ip):
+    """País y ciudad de la IP según ip-api.com (en caché por IP)"""
+    key = f'chatbot_geo:{ip}'
+    data = cache.get(key)
+    if data is not None:
+        return data
+    data = {'country': '', 'city': ''}
+    try:
+        response = requests.get(f'http://ip-api.com/json/{ip}', timeout=2)
+        if response.status_code == 200:
+            result = response.json()
+            if result.get('status') == 'success':
+                data = {'country': result.get('country', ''), 'city': result.get('city', '')}
+    except (requests.RequestException, ValueError):
+        # Sin respuesta no se guarda en caché: se reintenta con el siguiente mensaje
+        return data
+    cache.set(key, data, GEO_CACHE_TTL)
+    return data
+
+
+def extract_lead_data(conversation, message):
+    """
+    Completa el email, el teléfono y el nombre de la conversación que falten
+    con lo que aparezca en el mensaje. Devuelve los campos cambiados.
+    """
+    updated = []
+    if not conversation.user_email:
+        emails = EMAIL_PATTERN.findall(message)
+        if emails:
+            conversation.user_email = emails[0]
+            updated.append('user_email')
+    if not conversation.user_phone:
+        # Solo los números que parezcan teléfonos reales (7 dígitos o más)
+        phones = [p for p in PHONE_PATTERN.findall(message) if len(re.sub(r'[^0-9]', '', p)) >= 7]
+        if phones:
+            conversation.user_phone = phones[0]
+            updated.append('user_phone')
+    if not conversation.user_name:
+        for pattern in NAME_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                conversation.user_name = match.group(1).strip()
+                updated.append('user_name')
+                break
+    return updated
+
+
+def ai_response(chatbot, conversation, message):
+    """Respuesta de la IA al mensaje, o ``None`` si no se pudo obtener"""
+    from .ai_utils import AIContentOptimizer
+
+    captured_data = []
+    if conversation.user_name:
+        captured_data.append(f"Nombre: {conversation.user_name}")
+    if conversation.user_email:
+        captured_data.append(f"Email: {conversation.user_email}")
+    if conversation.user_phone:
+        captured_data.append(f"Teléfono: {conversation.user_phone}")
+    datos_disponibles = "\n".join(captured_data) if captured_data else "Aún no tenemos datos del usuario."
+
+    context = f"""
+Eres un asistente virtual de {chatbot.title}.
+Descripción: {chatbot.description}
+{f'Contexto adicional: {chatbot.ai_context}' if chatbot.ai_context else ''}
+
+DATOS DEL USUARIO YA CAPTURADOS:
+{datos_disponibles}
+
+INSTRUCCIONES IMPORTANTES:
+- Si ya tienes el nombre del usuario, úsalo en tu respuesta
+- NO pidas datos que ya tenemos (nombre, email o teléfono)
+- Si ya tenemos todos los datos, enfócate en ayudar con lo que necesite
+- Si nos falta algún dato importante, pídelo de forma natural
+{f'- Dirígete al usuario como {conversation.user_name}' if conversation.user_name else '- Pide el nombre si aún no lo tenemos'}
+
+Pregunta del usuario:
+{message}
+"""
+    messages = [
+        {"role": "system", "content": "Eres un asistente virtual profesional y amigable."},
+        {"role": "user", "content": context},
+    ]
+    result = AIContentOptimizer()._make_ai_request(messages, max_tokens=300, temperature=0.7)
+    if 'choices' in result:
+        return result['choices'][0]['message']['content'].strip() or None
+    return None
+
+
+def save_user_message(conversation, text, needs_reply):
+    """Guarda el mensaje del usuario como pendiente y arranca su procesamiento tras el commit"""
+    message = ChatbotMessage.objects.create(
+        conversation=conversation,
+        is_bot=False,
+        message=text,
+        pipeline_status='pending',
+        needs_reply=needs_reply,
+    )
+    transaction.on_commit(wake_pipeline_worker)
+    return message
+
+
+# ------------------------------------------------------------ procesamiento
+
+def process_message(message):
+    """Geolocaliza la conversación, extrae sus datos y, si hace falta, responde con la IA"""
+    conversation = message.conversation
+    chatbot = conversation.chatbot
+    updated = []
+    try:
+        if conversation.ip_address and not (conversation.country and conversation.city):
+            geo = geo_data(conversation.ip_address)
+            for field in ('country', 'city'):
+                if not getattr(conversation, field) and geo[field]:
+                    setattr(conversation, field, geo[field])
+                    updated.append(field)
+        updated += extract_lead_data(conversation, message.message)
+        if updated:
+            conversation.save(update_fields=updated)
+    except Exception as e:
+        logger.error(f'Error al completar los datos de la conversación {conversation.pk}: {e}')
+
+    if message.needs_reply:
+        try:
+            response_text = ai_response(chatbot, conversation, message.message)
+        except Exception as e:
+            logger.error(f'Error de la IA en la conversación {conversation.pk}: {e}')
+            response_text = None
+        # Aunque falle la IA, el widget está esperando una respuesta
+        ChatbotMessage.objects.create(
+            conversation=conversation,
+            is_bot=True,
+            message=response_text or DEFAULT_RESPONSE,
+            used_ai=bool(response_text),
+            in_reply_to=message,
+        )
+        Chatbot.objects.filter(pk=chatbot.pk).update(total_messages=F('total_messages') + 1)
+
+    ChatbotMessage.objects.filter(pk=message.pk).update(pipeline_status='done')
+
+
+message_queue = ClaimQueue(
+    ChatbotMessage, 'pipeline_status', 'pipeline_started_at', RUNNING_TIMEOUT,
+    related=('conversation__chatbot',),
+)
+
+
+def claim_next_message():
+    """Reserva el mensaje pendiente más antiguo con un UPDATE condicional"""
+    return message_queue.claim_next()
+
+
+def _drain():
+    """Procesa mensajes hasta vaciar la cola; devuelve cuántos"""
+    processed = 0
+    try:
+        while True:
+            message = claim_next_message()
+            if message is None:
+                return processed
+            try:
+                process_message(message)
+            except Exception as e:
+                logger.error(f'Error al procesar el mensaje de chatbot {message.pk}: {e}')
+            processed += 1
+    finally:
+        connection.close()
+
+
+def run_pending_messages(max_workers=MAX_WORKERS):
+    """Procesa los mensajes pendientes con ``max_workers`` hilos y devuelve cuántos"""
+    max_workers = max(1, max_workers)
+    if max_workers == 1:
+        return _drain()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='chatbot-pipeline') as pool:
+        futures = [pool.submit(_drain) for _ in range(max_workers)]
+        return sum(future.result() for future in futures)
+
+
+# --------------------------------------------------------------- hilo
+
+pipeline_worker = InlineWorker('chatbot-pipeline', run_pending_messages, 'CHATBOT_PIPELINE_INLINE')
+
+
+def wake_pipeline_worker():
+    """Despierta el hilo de procesamiento de este proceso, arrancándolo si hace falta"""
+    pipeline_worker.wake()
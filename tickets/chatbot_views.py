@@ -0,0 +1,679 @@
+"""
+Vistas de chatbots: gestión, widget público y conversaciones.
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.http import require_http_methods
+
+
+# ==================== CHATBOT VIEWS ====================
+
+@login_required
+def chatbot_list(request):
+    """Lista de chatbots"""
+    from .models import Chatbot
+    
+    chatbots = Chatbot.objects.all().order_by('-created_at')
+    
+    context = {
+        'chatbots': chatbots,
+        'page_title': 'Chatbots',
+        'module': 'GT',
+        'submenu_active': 'chatbots'
+    }
+    
+    return render(request, 'tickets/chatbot_list.html', context)
+
+
+@login_required
+def chatbot_create(request):
+    """Crear chatbot"""
+    from .models import Chatbot
+    from .forms import ChatbotForm
+    
+    if request.method == 'POST':
+        form = ChatbotForm(request.POST)
+        if form.is_valid():
+            chatbot = form.save(commit=False)
+            chatbot.created_by = request.user
+            chatbot.save()
+            messages.success(request, f'Chatbot "{chatbot.title}" creado exitosamente.')
+            return redirect('chatbot_list')
+        else:
+            messages.error(request, 'Por favor corrige los errores en el formulario.')
+    else:
+        form = ChatbotForm()
+    
+    context = {
+        'form': form,
+        'page_title': 'Crear Chatbot',
+        'module': 'GT',
+        'submenu_active': 'chatbots'
+    }
+    
+    return render(request, 'tickets/chatbot_form.html', context)
+
+
+@login_required
+def chatbot_detail(request, pk):
+    """Detalle del chatbot"""
+    from .models import Chatbot, ChatbotQuestion
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    questions = chatbot.questions.all()
+    
+    context = {
+        'chatbot': chatbot,
+        'questions': questions,
+        'page_title': chatbot.title,
+        'module': 'GT',
+        'submenu_active': 'chatbots'
+    }
+    
+    return render(request, 'tickets/chatbot_detail.html', context)
+
+
+@login_required
+def chatbot_stats_api(request, pk):
+    """API para obtener estadísticas del chatbot por día"""
+    from .models import Chatbot
+    from .activity_rollup import chatbot_daily_activity
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    
+    # Últimos 30 días desde la actividad agregada por hora (en caché unos segundos)
+    activity = chatbot_daily_activity(chatbot, days=30)
+    
+    # Preparar datos para el gráfico
+    labels = [day.isoformat() for day, _, _, _ in activity]
+    messages = [day_messages for _, _, day_messages, _ in activity]
+    clicks = [day_clicks for _, _, _, day_clicks in activity]
+    
+    data = {
+        'labels': labels,
+        'messages': messages,
+        'clicks': clicks
+    }
+    
+    return JsonResponse(data)
+
+
+@login_required
+def chatbot_conversations(request, pk):
+    """Ver conversaciones del chatbot"""
+    from .models import Chatbot, ChatbotConversation
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    conversations = chatbot.conversations.all().order_by('-started_at')
+    
+    context = {
+        'chatbot': chatbot,
+        'conversations': conversations,
+        'page_title': f'Conversaciones - {chatbot.title}',
+        'module': 'GT',
+        'submenu_active': 'chatbots'
+    }
+    
+    return render(request, 'tickets/chatbot_conversations.html', context)
+
+
+@login_required
+def chatbot_conversation_detail(request, pk, conversation_id):
+    """Ver detalle de una conversación"""
+    from .models import Chatbot, ChatbotConversation
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    conversation = get_object_or_404(ChatbotConversation, pk=conversation_id, chatbot=chatbot)
+    # Obtener mensajes únicos ordenados por timestamp
+    messages = conversation.messages.all().order_by('timestamp').distinct()
+    
+    context = {
+        'chatbot': chatbot,
+        'conversation': conversation,
+        'messages': messages,
+        'page_title': f'Conversación {conversation.session_id[:8]}',
+        'module': 'GT',
+        'submenu_active': 'chatbots'
+    }
+    
+    return render(request, 'tickets/chatbot_conversation_detail.html', context)
+
+
+@login_required
+def chatbot_conversation_delete(request, pk, conversation_id):
+    """Eliminar conversación"""
+    from django.contrib import messages
+    from .models import Chatbot, ChatbotConversation
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    conversation = get_object_or_404(ChatbotConversation, pk=conversation_id, chatbot=chatbot)
+    
+    session_id = conversation.session_id[:8]
+    conversation.delete()
+    
+    messages.success(request, f'Conversación {session_id} eliminada correctamente.')
+    return redirect('chatbot_conversations', pk=pk)
+
+
+@login_required
+def chatbot_conversation_toggle_hide(request, pk, conversation_id):
+    """Ocultar/mostrar chat para una conversación"""
+    from django.contrib import messages
+    from .models import Chatbot, ChatbotConversation
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    conversation = get_object_or_404(ChatbotConversation, pk=conversation_id, chatbot=chatbot)
+    
+    conversation.hide_chat = not conversation.hide_chat
+    conversation.save()
+    
+    status = 'ocultado' if conversation.hide_chat else 'visible'
+    messages.success(request, f'Chat {status} para esta sesión.')
+    return redirect('chatbot_conversations', pk=pk)
+
+
+@login_required
+def chatbot_conversation_toggle_reviewed(request, pk, conversation_id):
+    """Marcar/desmarcar conversación como revisada"""
+    from django.contrib import messages
+    from django.utils import timezone
+    from .models import Chatbot, ChatbotConversation
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    conversation = get_object_or_404(ChatbotConversation, pk=conversation_id, chatbot=chatbot)
+    
+    conversation.reviewed = not conversation.reviewed
+    if conversation.reviewed:
+        conversation.reviewed_at = timezone.now()
+        conversation.reviewed_by = request.user
+    else:
+        conversation.reviewed_at = None
+        conversation.reviewed_by = None
+    conversation.save()
+    
+    status = 'revisada' if conversation.reviewed else 'no revisada'
+    messages.success(request, f'Conversación marcada como {status}.')
+    return redirect('chatbot_conversation_detail', pk=pk, conversation_id=conversation_id)
+
+
+@login_required
+def chatbot_conversation_reply(request, pk, conversation_id):
+    """Responder como administrador en una conversación"""
+    import json
+    from django.http import JsonResponse
+    from .models import Chatbot, ChatbotConversation, ChatbotMessage
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    conversation = get_object_or_404(ChatbotConversation, pk=conversation_id, chatbot=chatbot)
+    
+    try:
+        data = json.loads(request.body)
+        message_text = data.get('message', '').strip()
+        
+        if not message_text:
+            return JsonResponse({'error': 'El mensaje no puede estar vacío'}, status=400)
+        
+        # Crear el mensaje del administrador
+        ChatbotMessage.objects.create(
+            conversation=conversation,
+            message=message_text,
+            is_bot=True,  # Se marca como bot pero es del admin
+            used_ai=False  # No fue generado por IA
+        )
+        
+        # Actualizar última actividad de la conversación
+        from django.utils import timezone
+        conversation.last_activity = timezone.now()
+        conversation.save()
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Mensaje enviado correctamente'
+        })
+        
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+def chatbot_get_new_messages(request, token):
+    """
+    Obtener mensajes nuevos para una conversación (polling).
+
+    Con ``reply_to`` (el ``message_id`` que devolvió ``chatbot_chat`` con
+    ``pending``) incluye también ``reply``: la respuesta del bot a ese
+    mensaje, o ``None`` mientras se genera.
+    """
+    import json
+    from django.http import JsonResponse
+    from .models import Chatbot, ChatbotConversation, ChatbotMessage
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        chatbot = Chatbot.objects.get(script_token=token, is_active=True)
+        
+        data = json.loads(request.body)
+        session_id = data.get('session_id', '')
+        last_message_id = data.get('last_message_id', 0)
+        
+        # Obtener la conversación
+        try:
+            conversation = ChatbotConversation.objects.get(
+                chatbot=chatbot,
+                session_id=session_id
+            )
+        except ChatbotConversation.DoesNotExist:
+            return JsonResponse({'messages': []})
+        
+        # Obtener mensajes nuevos desde el último ID
+        # Solo mensajes del admin: las respuestas automáticas van enlazadas
+        # al mensaje del usuario (in_reply_to) y llegan por otro camino
+        admin_messages = ChatbotMessage.objects.filter(
+            conversation=conversation,
+            is_bot=True,
+            used_ai=False,
+            in_reply_to__isnull=True
+        )
+        new_messages = admin_messages.filter(
+            id__gt=last_message_id
+        ).order_by('timestamp').values('id', 'message', 'timestamp')
+        
+        messages_list = list(new_messages)
+        
+        # Obtener el ID del último mensaje del admin en la conversación
+        last_admin_message = admin_messages.order_by('-id').first()
+        
+        current_last_id = last_admin_message.id if last_admin_message else 0
+        
+        result = {
+            'messages': messages_list,
+            'last_message_id': current_last_id
+        }
+        
+        # Respuesta de la IA a un mensaje concreto (se genera en segundo plano)
+        reply_to = data.get('reply_to')
+        if reply_to:
+            reply = ChatbotMessage.objects.filter(
+                conversation=conversation,
+                in_reply_to_id=reply_to,
+                is_bot=True
+            ).order_by('id').values('id', 'message', 'timestamp').first()
+            result['reply'] = reply
+        
+        return JsonResponse(result)
+        
+    except Chatbot.DoesNotExist:
+        return JsonResponse({'error': 'Chatbot no encontrado'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@login_required
+def chatbot_unreviewed_conversations(request):
+    """API para obtener conversaciones no revisadas"""
+    from django.http import JsonResponse
+    from .models import ChatbotConversation
+    
+    conversations = ChatbotConversation.objects.filter(
+        reviewed=False
+    ).select_related('chatbot').order_by('-last_activity')[:50]
+    
+    data = [{
+        'id': conv.id,
+        'chatbot_id': conv.chatbot.id,
+        'chatbot_name': conv.chatbot.title,
+        'session_id': conv.session_id[:8],
+        'user_name': conv.user_name or 'Usuario anónimo',
+        'message_count': conv.messages.count(),
+        'last_activity': conv.last_activity.strftime('%d/%m/%Y %H:%M'),
+        'url': f'/chatbots/{conv.chatbot.id}/conversations/{conv.id}/'
+    } for conv in conversations]
+    
+    return JsonResponse({
+        'count': len(data),
+        'conversations': data
+    })
+
+
+@require_http_methods(["POST"])
+def chatbot_register_click(request, token):
+    """Registrar click en el botón del chatbot"""
+    from .models import Chatbot, ChatbotClick
+    
+    try:
+        chatbot = Chatbot.objects.get(script_token=token)
+        
+        # Obtener IP y User Agent
+        ip_address = request.META.get('HTTP_X_FORWARDED_FOR')
+        if ip_address:
+            ip_address = ip_address.split(',')[0]
+        else:
+            ip_address = request.META.get('REMOTE_ADDR')
+        
+        user_agent = request.META.get('HTTP_USER_AGENT', '')
+        
+        # Crear registro del click
+        ChatbotClick.objects.create(
+            chatbot=chatbot,
+            ip_address=ip_address,
+            user_agent=user_agent
+        )
+        
+        # Actualizar contador total
+        chatbot.total_clicks += 1
+        chatbot.save(update_fields=['total_clicks'])
+        
+        return JsonResponse({'success': True, 'total_clicks': chatbot.total_clicks})
+    except Chatbot.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Chatbot no encontrado'}, status=404)
+
+
+@login_required
+def chatbot_edit(request, pk):
+    """Editar chatbot"""
+    from .models import Chatbot
+    from .forms import ChatbotForm
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    
+    if request.method == 'POST':
+        form = ChatbotForm(request.POST, instance=chatbot)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Chatbot "{chatbot.title}" actualizado exitosamente.')
+            return redirect('chatbot_detail', pk=chatbot.pk)
+    else:
+        form = ChatbotForm(instance=chatbot)
+    
+    context = {
+        'form': form,
+        'chatbot': chatbot,
+        'page_title': f'Editar {chatbot.title}',
+        'module': 'GT',
+        'submenu_active': 'chatbots'
+    }
+    
+    return render(request, 'tickets/chatbot_form.html', context)
+
+
+@login_required
+def chatbot_delete(request, pk):
+    """Eliminar chatbot"""
+    from .models import Chatbot
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    
+    if request.method == 'POST':
+        title = chatbot.title
+        chatbot.delete()
+        messages.success(request, f'Chatbot "{title}" eliminado exitosamente.')
+        return redirect('chatbot_list')
+    
+    context = {
+        'chatbot': chatbot,
+        'page_title': f'Eliminar {chatbot.title}',
+        'module': 'GT',
+        'submenu_active': 'chatbots'
+    }
+    
+    return render(request, 'tickets/chatbot_confirm_delete.html', context)
+
+
+@login_required
+def chatbot_question_create(request, pk):
+    """Crear pregunta para chatbot"""
+    from .models import Chatbot, ChatbotQuestion
+    from .forms import ChatbotQuestionForm
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    
+    if request.method == 'POST':
+        form = ChatbotQuestionForm(request.POST)
+        if form.is_valid():
+            question = form.save(commit=False)
+            question.chatbot = chatbot
+            question.save()
+            messages.success(request, 'Pregunta agregada exitosamente.')
+            return redirect('chatbot_detail', pk=chatbot.pk)
+    else:
+        form = ChatbotQuestionForm()
+    
+    context = {
+        'form': form,
+        'chatbot': chatbot,
+        'page_title': f'Nueva Pregunta - {chatbot.title}',
+        'module': 'GT',
+        'submenu_active': 'chatbots'
+    }
+    
+    return render(request, 'tickets/chatbot_question_form.html', context)
+
+
+@login_required
+def chatbot_question_edit(request, pk, question_id):
+    """Editar pregunta del chatbot"""
+    from .models import Chatbot, ChatbotQuestion
+    from .forms import ChatbotQuestionForm
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    question = get_object_or_404(ChatbotQuestion, pk=question_id, chatbot=chatbot)
+    
+    if request.method == 'POST':
+        form = ChatbotQuestionForm(request.POST, instance=question)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Pregunta actualizada exitosamente.')
+            return redirect('chatbot_detail', pk=chatbot.pk)
+    else:
+        form = ChatbotQuestionForm(instance=question)
+    
+    context = {
+        'form': form,
+        'chatbot': chatbot,
+        'question': question,
+        'page_title': f'Editar Pregunta - {chatbot.title}',
+        'module': 'GT',
+        'submenu_active': 'chatbots'
+    }
+    
+    return render(request, 'tickets/chatbot_question_form.html', context)
+
+
+@login_required
+def chatbot_question_delete(request, pk, question_id):
+    """Eliminar pregunta del chatbot"""
+    from .models import Chatbot, ChatbotQuestion
+    
+    chatbot = get_object_or_404(Chatbot, pk=pk)
+    question = get_object_or_404(ChatbotQuestion, pk=question_id, chatbot=chatbot)
+    
+    if request.method == 'POST':
+        question.delete()
+        messages.success(request, 'Pregunta eliminada exitosamente.')
+        return redirect('chatbot_detail', pk=chatbot.pk)
+    
+    return redirect('chatbot_detail', pk=chatbot.pk)
+
+
+def chatbot_widget(request, token):
+    """Widget del chatbot para integración externa"""
+    from .models import Chatbot
+    
+    try:
+        chatbot = Chatbot.objects.get(script_token=token, is_active=True)
+        
+        context = {
+            'chatbot': chatbot,
+            'token': token
+        }
+        
+        return render(request, 'tickets/chatbot_widget.html', context)
+        
+    except Chatbot.DoesNotExist:
+        return HttpResponse('Chatbot no encontrado', status=404)
+
+
+def chatbot_script(request, token):
+    """Script JS para integración externa del chatbot"""
+    from .models import Chatbot
+    from django.http import HttpResponse
+    
+    try:
+        chatbot = Chatbot.objects.get(script_token=token, is_active=True)
+        
+        script = f"""
+(function() {{
+    var chatbotToken = '{token}';
+    var chatbotUrl = '{request.build_absolute_uri('/chatbot/widget/' + token + '/')}';
+    
+    // Crear botón flotante
+    var button = document.createElement('div');
+    button.id = 'ticketproo-chatbot-button';
+    button.style.cssText = 'position:fixed;bottom:20px;right:20px;width:60px;height:60px;border-radius:50%;background:{chatbot.primary_color};cursor:pointer;box-shadow:0 4px 8px rgba(0,0,0,0.2);z-index:9999;display:flex;align-items:center;justify-content:center;';
+    button.innerHTML = '<svg width="30" height="30" fill="white" viewBox="0 0 16 16"><path d="M8 15c4.418 0 8-3.134 8-7s-3.582-7-8-7-8 3.134-8 7c0 1.76.743 3.37 1.97 4.6-.097 1.016-.417 2.13-.771 2.966-.079.186.074.394.273.362 2.256-.37 3.597-.938 4.18-1.234A9.06 9.06 0 0 0 8 15z"/></svg>';
+    
+    // Crear iframe para el chat
+    var iframe = document.createElement('iframe');
+    iframe.id = 'ticketproo-chatbot-iframe';
+    iframe.src = chatbotUrl;
+    iframe.style.cssText = 'display:none;position:fixed;bottom:90px;right:20px;width:350px;height:500px;border:none;border-radius:10px;box-shadow:0 4px 12px rgba(0,0,0,0.15);z-index:9998;';
+    
+    // Toggle chat
+    button.onclick = function() {{
+        if (iframe.style.display === 'none') {{
+            iframe.style.display = 'block';
+        }} else {{
+            iframe.style.display = 'none';
+        }}
+    }};
+    
+    document.body.appendChild(button);
+    document.body.appendChild(iframe);
+}})();
+"""
+        
+        return HttpResponse(script, content_type='application/javascript')
+        
+    except Chatbot.DoesNotExist:
+        return HttpResponse('// Chatbot no encontrado', content_type='application/javascript', status=404)
+
+
+def chatbot_chat(request, token):
+    """
+    API para manejar mensajes del chat.
+
+    Guarda el mensaje y responde enseguida con la pregunta configurada que
+    encaje o con la respuesta por defecto. Si la respuesta la tiene que dar
+    la IA devuelve ``pending`` y el widget la recoge con
+    ``chatbot_get_new_messages``. La geolocalización y la detección de datos
+    del usuario se hacen en segundo plano (tickets/chatbot_pipeline.py).
+    """
+    import json
+    from django.db.models import F
+    from django.http import JsonResponse
+    from .models import Chatbot, ChatbotConversation, ChatbotMessage, ChatbotQuestion
+    from .chatbot_pipeline import DEFAULT_RESPONSE, client_ip, save_user_message
+    from .keyword_matcher import match_chatbot
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        chatbot = Chatbot.objects.get(script_token=token, is_active=True)
+        
+        data = json.loads(request.body)
+        message = data.get('message', '').strip()
+        session_id = data.get('session_id', '')
+        user_name = data.get('user_name', '').strip()
+        
+        if not message:
+            return JsonResponse({'error': 'Mensaje vacío'}, status=400)
+        
+        ip_address = client_ip(request)
+        
+        # Obtener o crear conversación
+        conversation, created = ChatbotConversation.objects.get_or_create(
+            chatbot=chatbot,
+            session_id=session_id,
+            defaults={
+                'ip_address': ip_address,
+                'user_name': user_name
+            }
+        )
+        
+        # Verificar si el chat está oculto para esta conversación
+        if conversation.hide_chat:
+            return JsonResponse({
+                'error': 'Chat no disponible',
+                'message': 'El chat ha sido deshabilitado para esta sesión.'
+            }, status=403)
+        
+        # Completar los datos que vienen en la propia petición
+        updated = []
+        if not conversation.ip_address and ip_address:
+            conversation.ip_address = ip_address
+            updated.append('ip_address')
+        if not conversation.user_name and user_name:
+            conversation.user_name = user_name
+            updated.append('user_name')
+        if updated:
+            conversation.save(update_fields=updated)
+        
+        # Buscar en preguntas configuradas (matcher compilado del chatbot)
+        response_text = None
+        matched_question_id = None
+        match = match_chatbot(chatbot.pk, message)
+        if match:
+            matched_question_id, response_text = match
+            ChatbotQuestion.objects.filter(pk=matched_question_id).update(times_used=F('times_used') + 1)
+        
+        # Sin pregunta configurada y con la IA habilitada, responde la IA en segundo plano
+        needs_reply = not response_text and chatbot.use_ai
+        user_message = save_user_message(conversation, message, needs_reply)
+        
+        if needs_reply:
+            Chatbot.objects.filter(pk=chatbot.pk).update(total_messages=F('total_messages') + 1)
+            return JsonResponse({
+                'success': True,
+                'pending': True,
+                'message_id': user_message.pk,
+                'session_id': session_id
+            })
+        
+        response_text = response_text or DEFAULT_RESPONSE
+        
+        # Aplicar delay si está configurado
+        if chatbot.response_delay > 0:
+            import time
+            time.sleep(chatbot.response_delay)
+        
+        # Guardar respuesta del bot
+        bot_message = ChatbotMessage.objects.create(
+            conversation=conversation,
+            is_bot=True,
+            message=response_text,
+            matched_question_id=matched_question_id,
+            in_reply_to=user_message
+        )
+        
+        # Actualizar estadísticas
+        Chatbot.objects.filter(pk=chatbot.pk).update(total_messages=F('total_messages') + 2)  # Usuario + Bot
+        
+        return JsonResponse({
+            'success': True,
+            'response': response_text,
+            'message_id': user_message.pk,
+            'reply_id': bot_message.pk,
+            'session_id': session_id
+        })
+        
+    except Chatbot.DoesNotExist:
+        return JsonResponse({'error': 'Chatbot no encontrado'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
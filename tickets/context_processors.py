@@ -1,192 +1,141 @@
 """
 Context processors para TicketProo
+
+Todas las plantillas reciben estas variables, pero la mayoría de páginas
+(parciales AJAX, páginas públicas) solo usan unas pocas. Por eso cada
+variable es un callable: la plantilla lo llama al leer la variable y el
+valor se calcula una sola vez por petición en ``GlobalContext``. Una
+variable que la plantilla no lee no hace ninguna consulta.
 """
+import logging
+from functools import cached_property, partial
+
+from django.core.cache import cache
 from django.db import models
+
 from tickets.models import TimeEntry, BlogCategory, SystemConfiguration
-from tickets.utils import is_agent
+from tickets.nav_counters import request_counters, request_is_agent
+from tickets.session_utils import Cart
 
+logger = logging.getLogger(__name__)
 
-def system_config(request):
-    """
-    Context processor que proporciona la configuración del sistema
-    en todas las plantillas.
-    """
-    try:
-        config = SystemConfiguration.objects.get(pk=1)
-    except SystemConfiguration.DoesNotExist:
-        # Crear configuración por defecto si no existe
-        config = SystemConfiguration.objects.create()
-    
-    return {
-        'system_config': config,
-    }
+SYSTEM_CONFIG_CACHE_KEY = 'context_processors:system_config'
+SYSTEM_CONFIG_CACHE_TTL = 60
 
 
-def time_status(request):
-    """
-    Context processor que proporciona el estado del tiempo de trabajo
-    en todas las plantillas de la aplicación.
-    """
-    context = {
-        'active_time_entry': None,
-        'can_start_work': False,
-        'can_end_work': False,
-        'is_working': False,
-    }
-    
-    if request.user.is_authenticated and is_agent(request.user):
-        active_time_entry = TimeEntry.get_active_entry(request.user)
-        
-        context.update({
-            'active_time_entry': active_time_entry,
-            'can_start_work': not active_time_entry,
-            'can_end_work': bool(active_time_entry),
-            'is_working': bool(active_time_entry),
-        })
-    
-    return context
-
-
-def blog_categories(request):
-    """
-    Context processor que proporciona las categorías del blog
-    en todas las plantillas públicas.
-    """
-    try:
-        categories = BlogCategory.objects.annotate(
-            posts_count=models.Count('posts', filter=models.Q(posts__status='published'))
-        ).filter(posts_count__gt=0).order_by('name')
-    except:
-        categories = []
-    
-    return {
-        'blog_categories': categories,
-    }
+def get_cached_system_config():
+    """Configuración del sistema guardada en caché (se invalida al guardarla)"""
+    config = cache.get(SYSTEM_CONFIG_CACHE_KEY)
+    if config is None:
+        config = SystemConfiguration.get_config()
+        cache.set(SYSTEM_CONFIG_CACHE_KEY, config, SYSTEM_CONFIG_CACHE_TTL)
+    return config
 
 
-def crm_counters(request):
-    """
-    Context processor que proporciona contadores para los menús del CRM
-    """
-    if not request.user.is_authenticated:
-        return {}
+class GlobalContext:
+    """Valores comunes a todas las plantillas, calculados la primera vez que se leen"""
+
+    def __init__(self, request):
+        self.request = request
+        self.user = request.user
+
+    @cached_property
+    def is_agent(self):
+        return self.user.is_authenticated and request_is_agent(self.request)
+
+    @cached_property
+    def system_config(self):
+        return get_cached_system_config()
+
+    # Estado del tiempo de trabajo (solo agentes)
+
+    @cached_property
+    def active_time_entry(self):
+        if not self.is_agent:
+            return None
+        return TimeEntry.get_active_entry(self.user)
+
+    def is_working(self):
+        return bool(self.active_time_entry)
+
+    def can_start_work(self):
+        return self.is_agent and not self.active_time_entry
 
-    # Contador de RFIs abiertos para no-agentes (sus propias + empresa + asignadas)
-    if not is_agent(request.user):
+    # Categorías del blog con artículos publicados (plantillas públicas)
+
+    @cached_property
+    def blog_categories(self):
+        try:
+            return list(BlogCategory.objects.annotate(
+                posts_count=models.Count('posts', filter=models.Q(posts__status='published'))
+            ).filter(posts_count__gt=0).order_by('name'))
+        except Exception:
+            return []
+
+    # Chatbot interno activo para el home público
+
+    @cached_property
+    def active_internal_chatbot(self):
         try:
-            from tickets.models import RFI
-            from django.db.models import Q
-            from django.utils import timezone
-            user = request.user
-            user_company = getattr(user, 'profile', None)
-            user_company = user_company.company if user_company else None
-            open_rfi_q = Q(created_by=user) | Q(assigned_user=user)
-            if user_company:
-                open_rfi_q |= Q(company=user_company)
-            open_rfis = RFI.objects.filter(open_rfi_q, closed_at__isnull=True).distinct()
-            rfi_open_count = open_rfis.count()
-            oldest_rfi = open_rfis.order_by('created_at').first()
-            rfi_oldest_days = (timezone.now() - oldest_rfi.created_at).days if oldest_rfi else 0
-
-            from tickets.models import Ticket
-            ticket_active_q = Q(created_by=user) | Q(assigned_to=user)
-            if user_company:
-                ticket_active_q |= Q(company=user_company)
-            ticket_active_count = Ticket.objects.filter(
-                ticket_active_q, status__in=['open', 'working']
-            ).distinct().count()
-
-            return {
-                'rfi_open_count': rfi_open_count,
-                'rfi_oldest_days': rfi_oldest_days,
-                'ticket_active_count': ticket_active_count,
-            }
+            from tickets.models import Chatbot
+            return Chatbot.objects.filter(type='internal', is_active=True).first()
         except Exception:
+            return None
+
+    # Contadores de los menús (ver tickets/nav_counters.py)
+
+    @cached_property
+    def crm_counters(self):
+        if not self.is_agent:
+            return {}
+        try:
+            return request_counters(self.request)
+        except Exception as e:
+            logger.error(f'Error calculando los contadores del CRM: {e}')
             return {}
 
-    try:
-        from tickets.models import Contact, Company, Opportunity, Meeting, Quotation, QuotationTemplate, OpportunityActivity, CrmQuestion
-        
-        # Contadores básicos
-        contacts_count = Contact.objects.count()
-        companies_count = Company.objects.filter(is_active=True).count()
-        
-        # Oportunidades activas (no ganadas ni perdidas)
-        opportunities_count = Opportunity.objects.exclude(
-            status__name__in=['Ganada', 'Perdida', 'Cancelada']
-        ).count()
-        
-        # Reuniones futuras o de hoy
-        from django.utils import timezone
-        today = timezone.now().date()
-        meetings_count = Meeting.objects.filter(date__gte=today).count()
-        
-        # Preguntas pendientes de respuesta
-        questions_count = CrmQuestion.objects.filter(answer__isnull=True).count()
-        
-        # Cotizaciones activas (draft, sent, approved)
-        quotations_count = Quotation.objects.filter(
-            status__in=['draft', 'sent', 'approved']
-        ).count()
-        
-        # Plantillas públicas activas
-        templates_count = QuotationTemplate.objects.filter(is_active=True).count()
-        
-        # Actividades pendientes del usuario
-        pending_activities_count = OpportunityActivity.objects.filter(
-            assigned_to=request.user,
-            status__in=['pending', 'in_progress']
-        ).count()
-
-        # RFIs registradas
-        from tickets.models import RFI
-        rfi_count = RFI.objects.count()
-        
-        return {
-            'crm_counters': {
-                'contacts': contacts_count,
-                'companies': companies_count,
-                'opportunities': opportunities_count,
-                'meetings': meetings_count,
-                'questions': questions_count,
-                'quotations': quotations_count,
-                'templates': templates_count,
-                'pending_activities': pending_activities_count,
-                'rfi': rfi_count,
-            }
-        }
-    except Exception:
-        return {}
-
-
-def active_chatbot(request):
-    """
-    Context processor que proporciona el chatbot interno activo
-    para mostrarlo en el home público
-    """
-    try:
-        from tickets.models import Chatbot
-        
-        # Buscar chatbot interno activo
-        chatbot = Chatbot.objects.filter(
-            type='internal',
-            is_active=True
-        ).first()
-        
-        return {
-            'active_internal_chatbot': chatbot
-        }
-    except Exception:
-        return {
-            'active_internal_chatbot': None
-        }
-
-
-def cart_context(request):
+    @cached_property
+    def user_counters(self):
+        if not self.user.is_authenticated or self.is_agent:
+            return {}
+        try:
+            return request_counters(self.request)
+        except Exception as e:
+            logger.error(f'Error calculando los contadores del usuario: {e}')
+            return {}
+
+    def user_counter(self, name):
+        return self.user_counters.get(name, 0)
+
+    # Carrito de compras (sesión; sin cookie de sesión no se consulta)
+
+    @cached_property
+    def cart_count(self):
+        return Cart(self.request).count()
+
+
+def global_context(request):
     """
-    Context processor que expone el contador del carrito de compras (sesión)
-    en todas las plantillas.
+    Context processor único de TicketProo: configuración del sistema, estado
+    del tiempo de trabajo, categorías del blog, chatbot activo, contadores de
+    los menús y carrito. Cada valor se calcula solo si la plantilla lo usa.
     """
-    cart = request.session.get('cart', {})
-    cart_count = sum(item.get('quantity', 1) for item in cart.values())
-    return {'cart_count': cart_count}
\ No newline at end of file
+    values = GlobalContext(request)
+
+    def attribute(name):
+        return partial(getattr, values, name)
+
+    return {
+        'system_config': attribute('system_config'),
+        'active_time_entry': attribute('active_time_entry'),
+        'is_working': values.is_working,
+        'can_start_work': values.can_start_work,
+        'can_end_work': values.is_working,
+        'blog_categories': attribute('blog_categories'),
+        'crm_counters': attribute('crm_counters'),
+        'rfi_open_count': partial(values.user_counter, 'rfi_open_count'),
+        'rfi_oldest_days': partial(values.user_counter, 'rfi_oldest_days'),
+        'ticket_active_count': partial(values.user_counter, 'ticket_active_count'),
+        'active_internal_chatbot': attribute('active_internal_chatbot'),
+        'cart_count': attribute('cart_count'),
+    }
@@ -0,0 +1,115 @@
+"""
+Estadísticas de las clases de un curso.
+
+Las páginas de un curso muestran, para cada clase, cuántos usuarios la han
+visto, si el usuario actual la ha visto y cuántos comentarios tiene (y
+cuántos pendientes o resueltos). En lugar de contarlo clase por clase,
+``course_class_stats`` lo resuelve para todas las clases del curso con dos
+consultas agrupadas y ``viewed_class_ids`` con una más para el usuario.
+
+Los resultados se guardan en la caché de Django por curso (y por curso y
+usuario para las clases vistas) durante ``COURSE_STATS_CACHE_TTL`` segundos.
+Guardar o borrar una ``CourseClassView`` o un ``CourseComment`` invalida las
+entradas de su curso (ver las señales al final de ``models.py``).
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+CACHE_TTL = getattr(settings, 'COURSE_STATS_CACHE_TTL', 300)
+
+
+def _stats_key(course_id):
+    return f'course_stats:{course_id}'
+
+
+def _viewed_key(course_id, user_id):
+    return f'course_stats:{course_id}:viewed:{user_id}'
+
+
+def course_class_stats(course_id):
+    """
+    ``{'views', 'comments', 'pending', 'resolved'}``, cada uno un diccionario
+    ``{id_clase: total}`` de todas las clases del curso (las clases sin
+    vistas o sin comentarios no aparecen).
+    """
+    from .models import CourseClassView, CourseComment
+
+    stats = cache.get(_stats_key(course_id))
+    if stats is None:
+        views = (
+            CourseClassView.objects.filter(course_class__course_id=course_id)
+            .values_list('course_class_id').annotate(total=Count('pk')).order_by()
+        )
+        comments = (
+            CourseComment.objects.filter(course_class__course_id=course_id)
+            .values('course_class_id').order_by()
+            .annotate(
+                total=Count('pk'),
+                pending=Count('pk', filter=Q(status='creado')),
+                resolved=Count('pk', filter=Q(status='resuelto')),
+            )
+        )
+        stats = {'views': dict(views), 'comments': {}, 'pending': {}, 'resolved': {}}
+        for row in comments:
+            class_id = row['course_class_id']
+            stats['comments'][class_id] = row['total']
+            stats['pending'][class_id] = row['pending']
+            stats['resolved'][class_id] = row['resolved']
+        cache.set(_stats_key(course_id), stats, CACHE_TTL)
+    return stats
+
+
+def viewed_class_ids(course_id, user):
+    """Ids de las clases del curso que ha visto ``user`` (vacío si es anónimo)"""
+    from .models import CourseClassView
+
+    if not user.is_authenticated:
+        return frozenset()
+    key = _viewed_key(course_id, user.pk)
+    viewed = cache.get(key)
+    if viewed is None:
+        viewed = frozenset(
+            CourseClassView.objects.filter(course_class__course_id=course_id, user=user)
+            .values_list('course_class_id', flat=True)
+        )
+        cache.set(key, viewed, CACHE_TTL)
+    return viewed
+
+
+def class_rows(classes, course_id, user):
+    """
+    Una fila por clase con ``class``, ``view_count``, ``user_has_viewed``,
+    ``comments_count``, ``pending_comments`` y ``resolved_comments``.
+    """
+    stats = course_class_stats(course_id)
+    viewed = viewed_class_ids(course_id, user)
+    return [
+        {
+            'class': course_class,
+            'view_count': stats['views'].get(course_class.pk, 0),
+            'user_has_viewed': course_class.pk in viewed,
+            'comments_count': stats['comments'].get(course_class.pk, 0),
+            'pending_comments': stats['pending'].get(course_class.pk, 0),
+            'resolved_comments': stats['resolved'].get(course_class.pk, 0),
+        }
+        for course_class in classes
+    ]
+
+
+def invalidate(course_id, user_id=None):
+    """Descarta las estadísticas del curso (y las clases vistas de ``user_id``)"""
+    keys = [_stats_key(course_id)]
+    if user_id:
+        keys.append(_viewed_key(course_id, user_id))
+    cache.delete_many(keys)
+
+
+def invalidate_for_instance(instance):
+    """Receptor de las señales de ``CourseClassView`` y ``CourseComment``"""
+    from .models import CourseClass, CourseClassView
+
+    course_id = CourseClass.objects.filter(pk=instance.course_class_id).values_list('course_id', flat=True).first()
+    if course_id is None:
+        return
+    invalidate(course_id, instance.user_id if isinstance(instance, CourseClassView) else None)
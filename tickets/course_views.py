@@ -0,0 +1,1433 @@
+"""
+Vistas de cursos, clases, exámenes y capacitaciones.
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required
+from django.contrib.auth.models import User
+from django.contrib import messages
+from django.db.models import Q
+from django.utils import timezone
+from .models import Ticket, Exam, ExamQuestion, ExamAttempt, ExamAnswer
+from .utils import get_client_ip, is_agent
+
+
+# ========================
+# SISTEMA DE CAPACITACIÓN
+# ========================
+
+@login_required
+def debug_user_access(request):
+    """Vista de debug para verificar acceso de usuarios a cursos"""
+    from .models import Course, Company
+    from django.http import HttpResponse
+    
+    debug_info = []
+    debug_info.append(f"Usuario actual: {request.user.username}")
+    debug_info.append(f"Es agente: {request.user.groups.filter(name='Agentes').exists()}")
+    
+    try:
+        profile = request.user.userprofile
+        debug_info.append(f"UserProfile existe: Sí")
+        debug_info.append(f"Empresa del usuario: {profile.company}")
+        debug_info.append(f"ID de empresa del usuario: {profile.company.id if profile.company else 'None'}")
+    except Exception as e:
+        debug_info.append(f"Error con UserProfile: {e}")
+    
+    debug_info.append("\n--- CURSOS ---")
+    courses = Course.objects.filter(is_active=True)
+    for course in courses:
+        debug_info.append(f"\nCurso: {course.title}")
+        debug_info.append(f"Empresa del curso: {course.company}")
+        debug_info.append(f"ID empresa del curso: {course.company.id if course.company else 'None'}")
+        debug_info.append(f"Puede acceder: {course.can_user_access(request.user)}")
+    
+    debug_info.append("\n--- EMPRESAS ---")
+    companies = Company.objects.all()
+    for company in companies:
+        debug_info.append(f"Empresa: {company.name} (ID: {company.id})")
+    
+    return HttpResponse("<pre>" + "\n".join(debug_info) + "</pre>")
+
+@login_required
+def course_generate_public_token(request, pk):
+    """Generar token público para un curso"""
+    from .models import Course
+    from django.contrib import messages
+    from django.http import JsonResponse
+    
+    course = get_object_or_404(Course, pk=pk, is_active=True)
+    
+    # Verificar permisos - solo el creador o superusuario
+    if course.created_by != request.user and not request.user.is_superuser:
+        # Verificar si es una petición AJAX usando headers
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({'success': False, 'error': 'No tienes permisos para esta acción'})
+        messages.error(request, 'No tienes permisos para generar enlaces públicos.')
+        return redirect('course_detail', pk=pk)
+    
+    # Generar token
+    token = course.generate_public_token()
+    public_url = course.get_public_url(request)
+    
+    # Verificar si es una petición AJAX usando headers
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return JsonResponse({
+            'success': True, 
+            'token': str(token),
+            'public_url': public_url,
+            'message': 'Enlace público generado exitosamente'
+        })
+    
+    messages.success(request, f'Enlace público generado: {public_url}')
+    return redirect('course_detail', pk=pk)
+
+@login_required
+def course_disable_public_access(request, pk):
+    """Deshabilitar acceso público a un curso"""
+    from .models import Course
+    from django.contrib import messages
+    from django.http import JsonResponse
+    
+    course = get_object_or_404(Course, pk=pk, is_active=True)
+    
+    # Verificar permisos
+    if course.created_by != request.user and not request.user.is_superuser:
+        # Verificar si es una petición AJAX usando headers
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({'success': False, 'error': 'No tienes permisos para esta acción'})
+        messages.error(request, 'No tienes permisos para deshabilitar el acceso público.')
+        return redirect('course_detail', pk=pk)
+    
+    course.disable_public_access()
+    
+    # Verificar si es una petición AJAX usando headers
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return JsonResponse({'success': True, 'message': 'Acceso público deshabilitado'})
+    
+    messages.success(request, 'Acceso público deshabilitado correctamente.')
+    return redirect('course_detail', pk=pk)
+
+def course_public(request, token):
+    """Vista pública del curso (sin autenticación requerida)"""
+    from .models import Course
+    from .course_stats import class_rows
+    from django.db.models import Count, F
+    
+    course = get_object_or_404(
+        Course, 
+        public_token=token, 
+        is_public_enabled=True, 
+        is_active=True
+    )
+    
+    # Incrementar el contador de visitas
+    Course.objects.filter(pk=course.pk).update(view_count=F('view_count') + 1)
+    course.refresh_from_db()
+    
+    # Calcular días desde la creación
+    days_since_creation = (timezone.now() - course.created_at).days
+    
+    classes = course.classes.filter(is_active=True).order_by('order', 'title').prefetch_related('comments')
+    
+    # Visualizaciones y comentarios de todas las clases en consultas agrupadas
+    classes_with_views = class_rows(classes, course.pk, request.user)
+    for item in classes_with_views:
+        item['status'] = 'vista' if item['user_has_viewed'] else 'sin ver'
+        item['comments'] = item['class'].comments.all()
+    total_comments = sum(item['comments_count'] for item in classes_with_views)
+    resolved_comments = sum(item['resolved_comments'] for item in classes_with_views)
+    
+    # Obtener estadísticas de calificaciones
+    from .models import CourseRating, CourseApproval
+    rating_stats = CourseRating.objects.filter(course=course).aggregate(
+        total=Count('pk'),
+        happy=Count('pk', filter=Q(rating='happy')),
+        neutral=Count('pk', filter=Q(rating='neutral')),
+        sad=Count('pk', filter=Q(rating='sad')),
+    )
+    
+    # Obtener todas las aprobaciones del curso
+    approvals = CourseApproval.objects.filter(course=course).order_by('-created_at')
+    approval_stats = approvals.aggregate(
+        total=Count('pk'),
+        aprobado=Count('pk', filter=Q(status='aprobado')),
+        desaprobado=Count('pk', filter=Q(status='desaprobado')),
+    )
+    
+    context = {
+        'course': course,
+        'classes_with_views': classes_with_views,
+        'page_title': f'Curso: {course.title}',
+        'is_public_view': True,
+        'days_since_creation': days_since_creation,
+        'total_comments': total_comments,
+        'resolved_comments': resolved_comments,
+        'rating_stats': rating_stats,
+        'approvals': approvals,
+        'approval_stats': approval_stats
+    }
+    
+    return render(request, 'tickets/course_public.html', context)
+
+def course_class_public(request, token, class_id):
+    """Vista pública de una clase específica"""
+    from .models import Course, CourseClass, CourseClassView
+    from .course_stats import course_class_stats, viewed_class_ids
+    
+    course = get_object_or_404(
+        Course, 
+        public_token=token, 
+        is_public_enabled=True, 
+        is_active=True
+    )
+    course_class = get_object_or_404(CourseClass, pk=class_id, course=course, is_active=True)
+    
+    # Verificar si el usuario autenticado ha visto la clase
+    user_has_viewed = course_class.pk in viewed_class_ids(course.pk, request.user)
+    
+    # Registrar la visualización solo si hay usuario autenticado y aún no la había visto
+    if request.user.is_authenticated and not user_has_viewed:
+        view_obj, created = CourseClassView.objects.get_or_create(
+            course_class=course_class,
+            user=request.user,
+            defaults={
+                'ip_address': get_client_ip(request)
+            }
+        )
+        
+        # Incrementar contador de vistas solo si es una nueva visualización
+        if created:
+            course_class.save()
+    
+    # Obtener clases siguientes y anteriores
+    all_classes = course.classes.filter(is_active=True).order_by('order', 'title')
+    current_index = None
+    
+    for i, class_item in enumerate(all_classes):
+        if class_item.pk == course_class.pk:
+            current_index = i
+            break
+    
+    prev_class = None
+    next_class = None
+    
+    if current_index is not None:
+        if current_index > 0:
+            prev_class = all_classes[current_index - 1]
+        if current_index < len(all_classes) - 1:
+            next_class = all_classes[current_index + 1]
+    
+    context = {
+        'course': course,
+        'course_class': course_class,
+        'page_title': f'{course.title} - {course_class.title}',
+        'user_has_viewed': user_has_viewed,
+        'view_count': course_class_stats(course.pk)['views'].get(course_class.pk, 0),
+        'prev_class': prev_class,
+        'next_class': next_class,
+    }
+    
+    return render(request, 'tickets/course_class_public.html', context)
+
+def course_approval(request, token):
+    """Vista para aprobar o desaprobar un curso público"""
+    from .models import Course, CourseApproval
+    from django.http import JsonResponse
+    import json
+    
+    if request.method == 'POST':
+        course = get_object_or_404(
+            Course, 
+            public_token=token, 
+            is_public_enabled=True, 
+            is_active=True
+        )
+        
+        try:
+            data = json.loads(request.body)
+            action = data.get('action')  # 'aprobar' o 'desaprobar'
+            name = data.get('name', '').strip()
+            email = data.get('email', '').strip()
+            
+            if not action or action not in ['aprobar', 'desaprobar']:
+                return JsonResponse({
+                    'success': False,
+                    'error': 'Acción no válida'
+                }, status=400)
+            
+            if not name or not email:
+                return JsonResponse({
+                    'success': False,
+                    'error': 'Nombre y correo son requeridos'
+                }, status=400)
+            
+            # Crear un nuevo registro de aprobación
+            approval = CourseApproval.objects.create(
+                course=course,
+                status='aprobado' if action == 'aprobar' else 'desaprobado',
+                approved_by_name=name,
+                approved_by_email=email
+            )
+            
+            # Actualizar también los campos legacy del curso (para el último registro)
+            course.approval_status = approval.status
+            course.approved_by_name = approval.approved_by_name
+            course.approved_by_email = approval.approved_by_email
+            course.approval_date = approval.created_at
+            course.save()
+            
+            # Obtener todas las aprobaciones del curso
+            approvals = CourseApproval.objects.filter(course=course)
+            total_aprobaciones = approvals.filter(status='aprobado').count()
+            total_desaprobaciones = approvals.filter(status='desaprobado').count()
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Curso {approval.status} correctamente',
+                'approval': {
+                    'status': approval.status,
+                    'approved_by_name': approval.approved_by_name,
+                    'approved_by_email': approval.approved_by_email,
+                    'created_at': approval.created_at.strftime('%d/%m/%Y %H:%M')
+                },
+                'stats': {
+                    'total': approvals.count(),
+                    'aprobado': total_aprobaciones,
+                    'desaprobado': total_desaprobaciones
+                }
+            })
+            
+        except json.JSONDecodeError:
+            return JsonResponse({
+                'success': False,
+                'error': 'Datos inválidos'
+            }, status=400)
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'error': str(e)
+            }, status=500)
+    
+    return JsonResponse({
+        'success': False,
+        'error': 'Método no permitido'
+    }, status=405)
+
+
+# ==================== VISTAS DE CURSOS ====================
+
+@login_required
+def course_list(request):
+    """Lista todos los cursos disponibles"""
+    from .models import Course
+    from . import utils
+    
+    # Verificar si el usuario puede gestionar cursos (agentes y profesores)
+    can_manage = utils.can_manage_courses(request.user)
+    
+    # Filtrar cursos según la empresa del usuario
+    courses = Course.objects.filter(is_active=True)
+    
+    if can_manage:
+        # Los gestores (agentes y profesores) siempre ven todos los cursos (públicos y empresariales)
+        user_accessible_courses = list(courses)
+    else:
+        # Filtrar según empresa del usuario para usuarios no gestores
+        user_accessible_courses = []
+        for course in courses:
+            if course.can_user_access(request.user):
+                user_accessible_courses.append(course)
+    
+    context = {
+        'courses': user_accessible_courses,
+        'can_manage_courses': can_manage,
+        'page_title': 'Cursos de Capacitación'
+    }
+    
+    return render(request, 'tickets/course_list.html', context)
+
+
+@login_required
+def course_detail(request, pk):
+    """Detalle de un curso con sus clases"""
+    from .models import Course, CourseComment
+    from .course_stats import class_rows
+    from . import utils
+    
+    course = get_object_or_404(Course, pk=pk, is_active=True)
+    
+    # Verificar si el usuario puede gestionar cursos (agentes y profesores)
+    can_manage = utils.can_manage_courses(request.user)
+    
+    # Verificar si el usuario puede acceder a este curso
+    if not can_manage and not course.can_user_access(request.user):
+        messages.error(request, 'No tienes permisos para acceder a este curso.')
+        return redirect('course_list')
+    
+    classes = course.classes.filter(is_active=True).order_by('order', 'title')
+    
+    # Visualizaciones y comentarios de todas las clases en consultas agrupadas
+    classes_with_views = class_rows(classes, course.pk, request.user)
+    total_pending_comments = sum(item['pending_comments'] for item in classes_with_views)
+    
+    # Obtener todos los comentarios del curso (de todas las clases)
+    all_comments = CourseComment.objects.filter(
+        course_class__course=course
+    ).select_related('course_class', 'resolved_by').order_by('-created_at')
+    
+    context = {
+        'course': course,
+        'classes': classes,
+        'classes_with_views': classes_with_views,
+        'can_manage_courses': can_manage,
+        'page_title': f'Curso: {course.title}',
+        'total_pending_comments': total_pending_comments,
+        'all_comments': all_comments
+    }
+    
+    return render(request, 'tickets/course_detail.html', context)
+
+
+@login_required
+def course_comment_resolve(request, comment_id):
+    """Cambiar el estado de un comentario de curso a resuelto"""
+    from .models import CourseComment
+    from . import utils
+    from django.http import JsonResponse
+    
+    if not utils.can_manage_courses(request.user):
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({
+                'success': False,
+                'error': 'No tienes permisos para esta acción'
+            }, status=403)
+        messages.error(request, 'No tienes permisos para esta acción')
+        return redirect('course_list')
+    
+    comment = get_object_or_404(CourseComment, pk=comment_id)
+    course = comment.course_class.course
+    
+    if request.method == 'POST':
+        comment.status = 'resuelto'
+        comment.resolved_at = timezone.now()
+        comment.resolved_by = request.user
+        
+        # Obtener solution_link y solution_note del POST
+        solution_link = request.POST.get('solution_link', '').strip()
+        solution_note = request.POST.get('solution_note', '').strip()
+        
+        if solution_link:
+            comment.solution_link = solution_link
+        if solution_note:
+            comment.solution_note = solution_note
+            
+        comment.save()
+        
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({
+                'success': True,
+                'message': 'Comentario marcado como resuelto'
+            })
+        
+        messages.success(request, 'Comentario marcado como resuelto')
+        return redirect('course_detail', pk=course.pk)
+    
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return JsonResponse({
+            'success': False,
+            'error': 'Método no permitido'
+        }, status=405)
+    
+    messages.error(request, 'Método no permitido')
+    return redirect('course_detail', pk=course.pk)
+
+
+@login_required
+def course_create(request):
+    """Crear nuevo curso (agentes y profesores)"""
+    from .models import Course
+    from .forms import CourseForm
+    from . import utils
+    
+    if not utils.can_manage_courses(request.user):
+        messages.error(request, 'Solo los agentes y profesores pueden crear cursos.')
+        return redirect('course_list')
+    
+    if request.method == 'POST':
+        form = CourseForm(request.POST)
+        if form.is_valid():
+            course = form.save(commit=False)
+            course.created_by = request.user
+            course.save()
+            messages.success(request, f'Curso "{course.title}" creado exitosamente.')
+            return redirect('course_detail', pk=course.pk)
+    else:
+        form = CourseForm()
+    
+    context = {
+        'form': form,
+        'page_title': 'Crear Nuevo Curso'
+    }
+    
+    return render(request, 'tickets/course_form.html', context)
+
+
+@login_required
+def course_edit(request, pk):
+    """Editar curso (agentes y profesores)"""
+    from .models import Course
+    from .forms import CourseForm
+    from . import utils
+    
+    course = get_object_or_404(Course, pk=pk)
+    
+    if not utils.can_manage_courses(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('crm_dashboard')
+    
+    if request.method == 'POST':
+        form = CourseForm(request.POST, instance=course)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Curso "{course.title}" actualizado exitosamente.')
+            return redirect('course_detail', pk=pk)
+    else:
+        form = CourseForm(instance=course)
+    
+    context = {
+        'form': form,
+        'course': course,
+        'page_title': f'Editar: {course.title}'
+    }
+    
+    return render(request, 'tickets/course_form.html', context)
+
+
+@login_required
+def course_delete(request, pk):
+    """Eliminar curso (agentes y profesores)"""
+    from .models import Course
+    from . import utils
+    
+    course = get_object_or_404(Course, pk=pk)
+    
+    if not utils.can_manage_courses(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('crm_dashboard')
+    
+    if request.method == 'POST':
+        course_title = course.title
+        course.delete()
+        messages.success(request, f'Curso "{course_title}" eliminado exitosamente.')
+        return redirect('course_list')
+    
+    context = {
+        'course': course,
+        'page_title': f'Eliminar: {course.title}'
+    }
+    
+    return render(request, 'tickets/course_delete.html', context)
+
+
+@login_required
+def course_class_create(request, course_id):
+    """Crear nueva clase para un curso (agentes y profesores)"""
+    from .models import Course, CourseClass
+    from .forms import CourseClassForm
+    from . import utils
+    
+    course = get_object_or_404(Course, pk=course_id)
+    
+    if not utils.can_manage_courses(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('crm_dashboard')
+    
+    if request.method == 'POST':
+        form = CourseClassForm(request.POST)
+        if form.is_valid():
+            course_class = form.save(commit=False)
+            course_class.course = course
+            course_class.created_by = request.user
+            course_class.save()
+            messages.success(request, f'Clase "{course_class.title}" agregada exitosamente.')
+            return redirect('course_detail', pk=course_id)
+    else:
+        # Sugerir el siguiente número de orden
+        next_order = course.classes.count() + 1
+        form = CourseClassForm(initial={'order': next_order})
+    
+    context = {
+        'form': form,
+        'course': course,
+        'page_title': f'Nueva Clase - {course.title}'
+    }
+    
+    return render(request, 'tickets/course_class_form.html', context)
+
+
+@login_required
+def course_class_edit(request, course_id, pk):
+    """Editar clase (agentes y profesores)"""
+    from .models import Course, CourseClass
+    from .forms import CourseClassForm
+    from . import utils
+    
+    course = get_object_or_404(Course, pk=course_id)
+    course_class = get_object_or_404(CourseClass, pk=pk, course=course)
+    
+    if not utils.can_manage_courses(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('crm_dashboard')
+    
+    if request.method == 'POST':
+        form = CourseClassForm(request.POST, instance=course_class)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Clase "{course_class.title}" actualizada exitosamente.')
+            return redirect('course_detail', pk=course_id)
+    else:
+        form = CourseClassForm(instance=course_class)
+    
+    context = {
+        'form': form,
+        'course': course,
+        'course_class': course_class,
+        'page_title': f'Editar: {course_class.title}'
+    }
+    
+    return render(request, 'tickets/course_class_form.html', context)
+
+
+@login_required
+def course_class_delete(request, course_id, pk):
+    """Eliminar clase (agentes y profesores)"""
+    from .models import Course, CourseClass
+    from . import utils
+    
+    course = get_object_or_404(Course, pk=course_id)
+    course_class = get_object_or_404(CourseClass, pk=pk, course=course)
+    
+    if not utils.can_manage_courses(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('crm_dashboard')
+    
+    if request.method == 'POST':
+        class_title = course_class.title
+        course_class.delete()
+        messages.success(request, f'Clase "{class_title}" eliminada exitosamente.')
+        return redirect('course_detail', pk=course_id)
+    
+    context = {
+        'course': course,
+        'course_class': course_class,
+        'page_title': f'Eliminar: {course_class.title}'
+    }
+    
+    return render(request, 'tickets/course_class_delete.html', context)
+
+
+@login_required
+def course_class_detail(request, course_id, pk):
+    """Ver detalle de una clase específica"""
+    from .models import Course, CourseClass, CourseClassView
+    from .course_stats import course_class_stats
+    
+    course = get_object_or_404(Course, pk=course_id, is_active=True)
+    course_class = get_object_or_404(CourseClass, pk=pk, course=course, is_active=True)
+    
+    # Verificar si el usuario es agente
+    is_agent = request.user.groups.filter(name='Agentes').exists()
+    
+    # Verificar si el usuario puede acceder a este curso
+    if not is_agent and not course.can_user_access(request.user):
+        messages.error(request, 'No tienes permisos para acceder a este curso.')
+        return redirect('course_list')
+    
+    # Registrar la visualización si no existe
+    view_obj, created = CourseClassView.objects.get_or_create(
+        course_class=course_class,
+        user=request.user,
+        defaults={
+            'ip_address': get_client_ip(request)
+        }
+    )
+    
+    # Obtener clases anterior y siguiente para navegación
+    all_classes = course.classes.filter(is_active=True).order_by('order', 'title')
+    current_index = None
+    
+    for i, class_item in enumerate(all_classes):
+        if class_item.pk == course_class.pk:
+            current_index = i
+            break
+    
+    prev_class = None
+    next_class = None
+    
+    if current_index is not None:
+        if current_index > 0:
+            prev_class = all_classes[current_index - 1]
+        if current_index < len(all_classes) - 1:
+            next_class = all_classes[current_index + 1]
+    
+    context = {
+        'course': course,
+        'course_class': course_class,
+        'page_title': f'{course.title} - {course_class.title}',
+        'user_has_viewed': True,  # Siempre True ya que acabamos de registrar la vista
+        'view_count': course_class_stats(course.pk)['views'].get(course_class.pk, 0),
+        'prev_class': prev_class,
+        'next_class': next_class,
+    }
+    
+    return render(request, 'tickets/course_class_detail.html', context)
+
+
+@login_required
+def mark_class_as_viewed(request, course_id, class_id):
+    """Marcar una clase como vista via AJAX"""
+    from .models import Course, CourseClass, CourseClassView
+    from django.http import JsonResponse
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'})
+    
+    try:
+        course = get_object_or_404(Course, pk=course_id, is_active=True)
+        course_class = get_object_or_404(CourseClass, pk=class_id, course=course, is_active=True)
+        
+        # Verificar si el usuario es agente
+        is_agent = request.user.groups.filter(name='Agentes').exists()
+        
+        # Verificar si el usuario puede acceder a este curso
+        if not is_agent and not course.can_user_access(request.user):
+            return JsonResponse({'success': False, 'error': 'No tienes permisos para acceder a este curso'})
+        
+        # Crear o actualizar la visualización
+        from .course_stats import course_class_stats
+        view_obj, created = CourseClassView.objects.get_or_create(
+            course_class=course_class,
+            user=request.user,
+            defaults={
+                'ip_address': get_client_ip(request)
+            }
+        )
+        
+        return JsonResponse({
+            'success': True,
+            'created': created,
+            'view_count': course_class_stats(course.pk)['views'].get(course_class.pk, 0),
+            'message': 'Clase marcada como vista' if created else 'Ya habías visto esta clase'
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': str(e)})
+
+
+def exam_take_public(request, token):
+    """Tomar examen público (sin autenticación)"""
+    exam = get_object_or_404(Exam, public_token=token, is_public=True)
+    
+    if request.method == 'POST':
+        # Registrar datos del participante
+        participant_name = request.POST.get('participant_name')
+        participant_email = request.POST.get('participant_email')
+        
+        if not participant_name or not participant_email:
+            messages.error(request, 'Nombre y email son requeridos')
+            return render(request, 'tickets/exam_public_start.html', {'exam': exam})
+        
+        # Redirigir al examen con los datos en sesión
+        request.session['exam_participant'] = {
+            'name': participant_name,
+            'email': participant_email,
+            'exam_id': exam.id,
+            'started_at': timezone.now().isoformat()
+        }
+        
+        return redirect('exam_take_questions', token=token)
+    
+    return render(request, 'tickets/exam_public_start.html', {'exam': exam})
+
+
+def exam_take_questions(request, token):
+    """Mostrar preguntas del examen público"""
+    exam = get_object_or_404(Exam, public_token=token, is_public=True)
+    
+    # Verificar datos del participante en sesión
+    participant_data = request.session.get('exam_participant')
+    if not participant_data or participant_data.get('exam_id') != exam.id:
+        return redirect('exam_take_public', token=token)
+    
+    questions = exam.questions.all().order_by('order')
+    
+    if request.method == 'POST':
+        # Procesar respuestas
+        from django.utils import timezone
+        from datetime import datetime
+        
+        started_at = datetime.fromisoformat(participant_data['started_at'])
+        completed_at = timezone.now()
+        time_taken = int((completed_at - started_at).total_seconds())
+        
+        # Crear intento de examen
+        attempt = ExamAttempt.objects.create(
+            exam=exam,
+            participant_name=participant_data['name'],
+            participant_email=participant_data['email'],
+            total_questions=questions.count(),
+            started_at=started_at,
+            completed_at=completed_at,
+            time_taken=time_taken,
+            score=0,  # Se calculará después
+            correct_answers=0
+        )
+        
+        # Procesar respuestas
+        correct_count = 0
+        for question in questions:
+            selected_option = request.POST.get(f'question_{question.id}')
+            if selected_option:
+                is_correct = selected_option == question.correct_option
+                if is_correct:
+                    correct_count += 1
+                
+                ExamAnswer.objects.create(
+                    attempt=attempt,
+                    question=question,
+                    selected_option=selected_option,
+                    is_correct=is_correct
+                )
+        
+        # Calcular puntuación
+        score = (correct_count / questions.count()) * 100 if questions.count() > 0 else 0
+        attempt.correct_answers = correct_count
+        attempt.score = score
+        attempt.passed = score >= exam.passing_score
+        attempt.save()
+        
+        # Limpiar sesión
+        del request.session['exam_participant']
+        
+        return redirect('exam_results', attempt_id=attempt.id)
+    
+    context = {
+        'exam': exam,
+        'questions': questions,
+        'participant_data': participant_data
+    }
+    return render(request, 'tickets/exam_take.html', context)
+
+
+def exam_results(request, attempt_id):
+    """Mostrar resultados del examen"""
+    from .utils import is_agent
+    
+    attempt = get_object_or_404(ExamAttempt, id=attempt_id)
+    answers = attempt.answers.all().select_related('question')
+    
+    # Solo los agentes pueden ver las respuestas correctas
+    can_view_answers = request.user.is_authenticated and is_agent(request.user)
+    
+    # Generar token del certificado si es necesario
+    if attempt.passed and not attempt.certificate_token:
+        attempt.generate_certificate_token()
+    
+    context = {
+        'attempt': attempt,
+        'answers': answers,
+        'exam': attempt.exam,
+        'can_view_answers': can_view_answers
+    }
+    return render(request, 'tickets/exam_results.html', context)
+
+
+def download_certificate(request, attempt_id):
+    """Descargar certificado de examen aprobado"""
+    from .certificate_utils import create_certificate_response
+    
+    attempt = get_object_or_404(ExamAttempt, id=attempt_id)
+    
+    # Verificar que el usuario puede descargar este certificado
+    # Para exámenes públicos, cualquiera puede descargar el certificado si tiene el ID
+    # Para exámenes privados, solo el usuario o agentes pueden descargarlo
+    if not attempt.exam.is_public and request.user.is_authenticated:
+        if not (attempt.user == request.user or 
+                request.user.groups.filter(name='Agentes').exists()):
+            messages.error(request, 'No tienes permisos para descargar este certificado')
+            return redirect('exam_results', attempt_id=attempt_id)
+    elif not attempt.exam.is_public and not request.user.is_authenticated:
+        messages.error(request, 'Debes iniciar sesión para descargar este certificado')
+        return redirect('exam_results', attempt_id=attempt_id)
+    
+    # Verificar que el examen fue aprobado
+    if not attempt.passed:
+        messages.error(request, 'Solo se pueden generar certificados para exámenes aprobados')
+        return redirect('exam_results', attempt_id=attempt_id)
+    
+    # Generar y retornar el certificado
+    response = create_certificate_response(attempt)
+    if response:
+        return response
+    else:
+        messages.error(request, 'Error al generar el certificado')
+        return redirect('exam_results', attempt_id=attempt_id)
+
+
+def verify_certificate(request, token):
+    """Verificar autenticidad de un certificado"""
+    from .certificate_utils import verify_certificate_data
+    
+    cert_data = verify_certificate_data(token)
+    
+    context = {
+        'cert_data': cert_data,
+        'token': token
+    }
+    return render(request, 'tickets/certificate_verify.html', context)
+
+
+@login_required
+def question_create(request, exam_pk):
+    """Crear pregunta para examen"""
+    from .utils import can_manage_courses
+    
+    exam = get_object_or_404(Exam, pk=exam_pk)
+    
+    if not (can_manage_courses(request.user) or exam.created_by == request.user):
+        messages.error(request, 'No tienes permisos para agregar preguntas')
+        return redirect('exam_detail', pk=exam.pk)
+    
+    if request.method == 'POST':
+        question = ExamQuestion.objects.create(
+            exam=exam,
+            question_text=request.POST.get('question_text'),
+            option_a=request.POST.get('option_a'),
+            option_b=request.POST.get('option_b'),
+            option_c=request.POST.get('option_c'),
+            correct_option=request.POST.get('correct_option'),
+            order=exam.questions.count() + 1
+        )
+        
+        messages.success(request, 'Pregunta agregada exitosamente')
+        return redirect('exam_detail', pk=exam.pk)
+    
+    context = {'exam': exam}
+    return render(request, 'tickets/question_form.html', context)
+
+
+@login_required
+def question_edit(request, pk):
+    """Editar pregunta"""
+    from .utils import can_manage_courses
+    
+    question = get_object_or_404(ExamQuestion, pk=pk)
+    exam = question.exam
+    
+    if not (can_manage_courses(request.user) or exam.created_by == request.user):
+        messages.error(request, 'No tienes permisos para editar esta pregunta')
+        return redirect('exam_detail', pk=exam.pk)
+    
+    if request.method == 'POST':
+        question.question_text = request.POST.get('question_text')
+        question.option_a = request.POST.get('option_a')
+        question.option_b = request.POST.get('option_b')
+        question.option_c = request.POST.get('option_c')
+        question.correct_option = request.POST.get('correct_option')
+        question.save()
+        
+        messages.success(request, 'Pregunta actualizada exitosamente')
+        return redirect('exam_detail', pk=exam.pk)
+    
+    context = {'question': question, 'exam': exam}
+    return render(request, 'tickets/question_form.html', context)
+
+
+@login_required
+def question_delete(request, pk):
+    """Eliminar pregunta"""
+    from .utils import can_manage_courses
+    
+    question = get_object_or_404(ExamQuestion, pk=pk)
+    exam = question.exam
+    
+    if not (can_manage_courses(request.user) or exam.created_by == request.user):
+        messages.error(request, 'No tienes permisos para eliminar esta pregunta')
+        return redirect('exam_detail', pk=exam.pk)
+    
+    if request.method == 'POST':
+        question.delete()
+        messages.success(request, 'Pregunta eliminada exitosamente')
+        return redirect('exam_detail', pk=exam.pk)
+    
+    context = {'question': question, 'exam': exam}
+    return render(request, 'tickets/question_delete.html', context)
+
+
+# === VISTAS DE REGISTRO PÚBLICO DE CURSOS ===
+
+@login_required
+def course_generate_registration_token(request, pk):
+    """Generar token de registro público para un curso"""
+    from .models import Course, CourseRegistrationToken
+    from . import utils
+    
+    course = get_object_or_404(Course, pk=pk)
+    
+    if not utils.can_manage_courses(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('course_detail', pk=pk)
+    
+    if request.method == 'POST':
+        # Obtener parámetros del formulario
+        expires_in_days = request.POST.get('expires_in_days')
+        max_registrations = request.POST.get('max_registrations')
+        
+        # Calcular fecha de expiración
+        expires_at = None
+        if expires_in_days:
+            try:
+                days = int(expires_in_days)
+                expires_at = timezone.now() + timezone.timedelta(days=days)
+            except ValueError:
+                pass
+        
+        # Validar max_registrations
+        max_regs = None
+        if max_registrations:
+            try:
+                max_regs = int(max_registrations)
+            except ValueError:
+                pass
+        
+        # Crear el token
+        token = CourseRegistrationToken.objects.create(
+            course=course,
+            created_by=request.user,
+            expires_at=expires_at,
+            max_registrations=max_regs
+        )
+        
+        messages.success(request, f'Token de registro creado exitosamente.')
+        return redirect('course_detail', pk=pk)
+    
+    context = {
+        'course': course,
+        'page_title': f'Generar Token de Registro - {course.title}'
+    }
+    
+    return render(request, 'tickets/course_generate_registration_token.html', context)
+
+
+@login_required
+def course_disable_registration_token(request, pk, token_id):
+    """Desactivar token de registro público"""
+    from .models import Course, CourseRegistrationToken
+    from . import utils
+    
+    course = get_object_or_404(Course, pk=pk)
+    token = get_object_or_404(CourseRegistrationToken, pk=token_id, course=course)
+    
+    if not utils.can_manage_courses(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('course_detail', pk=pk)
+    
+    token.is_active = False
+    token.save()
+    
+    messages.success(request, 'Token de registro desactivado exitosamente.')
+    return redirect('course_detail', pk=pk)
+
+
+def course_public_register(request, token):
+    """Formulario de registro público para cursos"""
+    from .models import CourseRegistrationToken, UserProfile
+    from django.contrib.auth.models import User
+    from django.contrib.auth import login
+    
+    # Buscar el token
+    try:
+        registration_token = CourseRegistrationToken.objects.get(token=token)
+    except CourseRegistrationToken.DoesNotExist:
+        messages.error(request, 'Token de registro no válido.')
+        return redirect('course_public')
+    
+    # Verificar si el token es válido
+    is_valid, message = registration_token.is_valid()
+    if not is_valid:
+        messages.error(request, f'Token no válido: {message}')
+        return redirect('course_public')
+    
+    course = registration_token.course
+    
+    if request.method == 'POST':
+        # Obtener datos del formulario
+        first_name = request.POST.get('first_name', '').strip()
+        last_name = request.POST.get('last_name', '').strip()
+        email = request.POST.get('email', '').strip()
+        password = request.POST.get('password', '')
+        password_confirm = request.POST.get('password_confirm', '')
+        
+        # Validaciones
+        errors = []
+        
+        if not first_name:
+            errors.append('El nombre es obligatorio.')
+        
+        if not last_name:
+            errors.append('El apellido es obligatorio.')
+        
+        if not email:
+            errors.append('El correo electrónico es obligatorio.')
+        elif User.objects.filter(email=email).exists():
+            errors.append('Ya existe un usuario con este correo electrónico.')
+        
+        if not password:
+            errors.append('La contraseña es obligatoria.')
+        elif len(password) < 8:
+            errors.append('La contraseña debe tener al menos 8 caracteres.')
+        
+        if password != password_confirm:
+            errors.append('Las contraseñas no coinciden.')
+        
+        if errors:
+            for error in errors:
+                messages.error(request, error)
+        else:
+            try:
+                # Crear el usuario
+                username = email.split('@')[0]
+                counter = 1
+                original_username = username
+                
+                # Asegurar que el username sea único
+                while User.objects.filter(username=username).exists():
+                    username = f"{original_username}{counter}"
+                    counter += 1
+                
+                user = User.objects.create_user(
+                    username=username,
+                    email=email,
+                    password=password,
+                    first_name=first_name,
+                    last_name=last_name
+                )
+                
+                # Crear o actualizar el perfil del usuario
+                user_profile, created = UserProfile.objects.get_or_create(user=user)
+                
+                # Asignar la empresa del profesor/agente que creó el token
+                try:
+                    creator_profile = UserProfile.objects.get(user=registration_token.created_by)
+                    if creator_profile.company:
+                        user_profile.company = creator_profile.company
+                        user_profile.save()
+                except UserProfile.DoesNotExist:
+                    # Si el creador del token no tiene perfil, usar la empresa del curso como fallback
+                    if course.company:
+                        user_profile.company = course.company
+                        user_profile.save()
+                
+                # Incrementar contador de registros
+                registration_token.increment_registration_count()
+                
+                # Iniciar sesión automáticamente
+                login(request, user)
+                
+                messages.success(request, f'¡Registro exitoso! Bienvenido al curso "{course.title}".')
+                return redirect('course_detail', pk=course.pk)
+                
+            except Exception as e:
+                messages.error(request, f'Error al crear el usuario: {str(e)}')
+    
+    context = {
+        'course': course,
+        'token': registration_token,
+        'page_title': f'Registro para {course.title}'
+    }
+    
+    return render(request, 'tickets/course_public_register.html', context)
+
+
+@login_required
+def course_registration_tokens_list(request, pk):
+    """Lista de tokens de registro para un curso"""
+    from .models import Course, CourseRegistrationToken
+    from . import utils
+    
+    course = get_object_or_404(Course, pk=pk)
+    
+    if not utils.can_manage_courses(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('course_detail', pk=pk)
+    
+    tokens = CourseRegistrationToken.objects.filter(course=course).order_by('-created_at')
+    
+    context = {
+        'course': course,
+        'tokens': tokens,
+        'page_title': f'Tokens de Registro - {course.title}'
+    }
+    
+    return render(request, 'tickets/course_registration_tokens_list.html', context)
+
+
+@login_required
+def ticket_update_commit(request, pk):
+    """Actualizar el campo commit de un ticket (solo agentes)"""
+    if not is_agent(request.user):
+        from django.http import HttpResponseForbidden
+        return HttpResponseForbidden()
+    ticket = get_object_or_404(Ticket, pk=pk)
+    if request.method == 'POST':
+        ticket.commit = request.POST.get('commit', '').strip()
+        ticket.save(update_fields=['commit'])
+        messages.success(request, 'Commit actualizado.')
+    return redirect('ticket_detail', pk=pk)
+
+
+@login_required
+def ticket_update_rating(request, pk):
+    """Actualizar la calificación de un ticket (1-5 estrellas)"""
+    ticket = get_object_or_404(Ticket, pk=pk)
+    if request.method == 'POST':
+        try:
+            val = int(request.POST.get('rating', 0))
+            ticket.rating = val if 1 <= val <= 5 else None
+            ticket.save(update_fields=['rating'])
+        except (ValueError, TypeError):
+            pass
+    return redirect('ticket_detail', pk=pk)
+
+# ─────────────────────────────────────────────────────────────
+# CAPACITACIONES
+# ─────────────────────────────────────────────────────────────
+
+@login_required
+def capacitacion_list(request):
+    """Lista de capacitaciones: agentes ven todas, usuarios ven las asignadas"""
+    from .models import Capacitacion
+    user = request.user
+    if is_agent(user) or user.is_staff or user.is_superuser:
+        capacitaciones = Capacitacion.objects.select_related("created_by").order_by("-created_at")
+    else:
+        user_company = getattr(getattr(user, "profile", None), "company", None)
+        qs = Capacitacion.objects.filter(is_active=True)
+        if user_company:
+            qs = qs.filter(
+                Q(assigned_users=user) | Q(assigned_companies=user_company)
+            )
+        else:
+            qs = qs.filter(assigned_users=user)
+        capacitaciones = qs.distinct().select_related("created_by").order_by("-created_at")
+    return render(request, "tickets/capacitacion_list.html", {"capacitaciones": capacitaciones})
+
+
+@login_required
+def capacitacion_create(request):
+    """Crear nueva capacitación (solo agentes)"""
+    from .models import Capacitacion
+    if not (is_agent(request.user) or request.user.is_staff or request.user.is_superuser):
+        messages.error(request, "No tienes permiso para crear capacitaciones.")
+        return redirect("capacitacion_list")
+    from .models import Company
+    companies = Company.objects.filter(is_active=True).order_by("name")
+    users = User.objects.filter(is_active=True).order_by("first_name", "last_name", "username")
+    if request.method == "POST":
+        titulo = request.POST.get("titulo", "").strip()
+        temas = request.POST.get("temas", "").strip()
+        user_ids = request.POST.getlist("assigned_users")
+        company_ids = request.POST.getlist("assigned_companies")
+        if not titulo:
+            messages.error(request, "El título es obligatorio.")
+        else:
+            cap = Capacitacion.objects.create(
+                titulo=titulo,
+                temas=temas,
+                created_by=request.user,
+            )
+            if user_ids:
+                cap.assigned_users.set(User.objects.filter(pk__in=user_ids))
+            if company_ids:
+                cap.assigned_companies.set(companies.filter(pk__in=company_ids))
+            messages.success(request, f"Capacitación \"{titulo}\" creada exitosamente.")
+            return redirect("capacitacion_detail", pk=cap.pk)
+    return render(request, "tickets/capacitacion_form.html", {
+        "companies": companies,
+        "users": users,
+    })
+
+
+@login_required
+def capacitacion_detail(request, pk):
+    """Detalle de capacitación con sus líneas/tareas"""
+    from .models import Capacitacion, CapacitacionLinea, CapacitacionRespuesta
+    cap = get_object_or_404(Capacitacion, pk=pk)
+    if not cap.user_can_view(request.user):
+        messages.error(request, "No tienes acceso a esta capacitación.")
+        return redirect("capacitacion_list")
+    can_manage = is_agent(request.user) or request.user.is_staff or request.user.is_superuser
+    lineas = cap.lineas.prefetch_related("respuestas__submitted_by").order_by("orden", "created_at")
+
+    # Manejar envío de respuesta (POST sin acción especial)
+    if request.method == "POST":
+        action = request.POST.get("action", "")
+        if action == "add_linea" and can_manage:
+            tarea = request.POST.get("tarea", "").strip()
+            descripcion = request.POST.get("descripcion", "").strip()
+            orden = request.POST.get("orden", 0)
+            if tarea:
+                CapacitacionLinea.objects.create(
+                    capacitacion=cap,
+                    tarea=tarea,
+                    descripcion=descripcion,
+                    orden=orden or 0,
+                )
+                messages.success(request, "Línea agregada.")
+        elif action == "add_respuesta":
+            linea_id = request.POST.get("linea_id")
+            nombre = request.POST.get("nombre", "").strip()
+            enlace = request.POST.get("enlace", "").strip()
+            linea = CapacitacionLinea.objects.filter(pk=linea_id, capacitacion=cap).first()
+            if linea and nombre and enlace:
+                CapacitacionRespuesta.objects.create(
+                    linea=linea,
+                    nombre=nombre,
+                    enlace=enlace,
+                    submitted_by=request.user,
+                )
+                messages.success(request, "Respuesta enviada.")
+            else:
+                messages.error(request, "Nombre y enlace son obligatorios.")
+        return redirect("capacitacion_detail", pk=pk)
+
+    return render(request, "tickets/capacitacion_detail.html", {
+        "cap": cap,
+        "lineas": lineas,
+        "can_manage": can_manage,
+    })
+
+
+@login_required
+def capacitacion_edit(request, pk):
+    """Editar capacitación (solo agentes)"""
+    from .models import Capacitacion
+    from .models import Company
+    cap = get_object_or_404(Capacitacion, pk=pk)
+    if not (is_agent(request.user) or request.user.is_staff or request.user.is_superuser):
+        messages.error(request, "No tienes permiso para editar esta capacitación.")
+        return redirect("capacitacion_detail", pk=pk)
+    companies = Company.objects.filter(is_active=True).order_by("name")
+    users = User.objects.filter(is_active=True).order_by("first_name", "last_name", "username")
+    if request.method == "POST":
+        titulo = request.POST.get("titulo", "").strip()
+        temas = request.POST.get("temas", "").strip()
+        user_ids = request.POST.getlist("assigned_users")
+        company_ids = request.POST.getlist("assigned_companies")
+        is_active = request.POST.get("is_active") == "on"
+        if not titulo:
+            messages.error(request, "El título es obligatorio.")
+        else:
+            cap.titulo = titulo
+            cap.temas = temas
+            cap.is_active = is_active
+            cap.save()
+            cap.assigned_users.set(User.objects.filter(pk__in=user_ids))
+            cap.assigned_companies.set(companies.filter(pk__in=company_ids))
+            messages.success(request, "Capacitación actualizada.")
+            return redirect("capacitacion_detail", pk=pk)
+    return render(request, "tickets/capacitacion_form.html", {
+        "cap": cap,
+        "companies": companies,
+        "users": users,
+    })
+
+
+@login_required
+def capacitacion_delete(request, pk):
+    """Eliminar capacitación (solo agentes)"""
+    from .models import Capacitacion
+    cap = get_object_or_404(Capacitacion, pk=pk)
+    if not (is_agent(request.user) or request.user.is_staff or request.user.is_superuser):
+        messages.error(request, "No tienes permiso para eliminar esta capacitación.")
+        return redirect("capacitacion_detail", pk=pk)
+    if request.method == "POST":
+        titulo = cap.titulo
+        cap.delete()
+        messages.success(request, f"Capacitación \"{titulo}\" eliminada.")
+        return redirect("capacitacion_list")
+    return render(request, "tickets/capacitacion_delete.html", {"cap": cap})
+
+
+@login_required
+def capacitacion_linea_delete(request, pk, linea_id):
+    """Eliminar una línea de capacitación (solo agentes)"""
+    from .models import Capacitacion, CapacitacionLinea
+    cap = get_object_or_404(Capacitacion, pk=pk)
+    linea = get_object_or_404(CapacitacionLinea, pk=linea_id, capacitacion=cap)
+    if not (is_agent(request.user) or request.user.is_staff or request.user.is_superuser):
+        messages.error(request, "No tienes permiso.")
+        return redirect("capacitacion_detail", pk=pk)
+    if request.method == "POST":
+        linea.delete()
+        messages.success(request, "Línea eliminada.")
+    return redirect("capacitacion_detail", pk=pk)
+
+
+@login_required
+def capacitacion_respuesta_delete(request, pk, respuesta_id):
+    """Eliminar una respuesta (solo agentes o el propio autor)"""
+    from .models import Capacitacion, CapacitacionRespuesta
+    cap = get_object_or_404(Capacitacion, pk=pk)
+    respuesta = get_object_or_404(CapacitacionRespuesta, pk=respuesta_id, linea__capacitacion=cap)
+    can_delete = (
+        is_agent(request.user)
+        or request.user.is_staff
+        or request.user.is_superuser
+        or respuesta.submitted_by == request.user
+    )
+    if not can_delete:
+        messages.error(request, "No tienes permiso.")
+        return redirect("capacitacion_detail", pk=pk)
+    if request.method == "POST":
+        respuesta.delete()
+        messages.success(request, "Respuesta eliminada.")
+    return redirect("capacitacion_detail", pk=pk)
+
+
+def capacitacion_public(request, token):
+    """Vista pública de una capacitación accesible sin login mediante token UUID"""
+    from .models import Capacitacion, CapacitacionLinea, CapacitacionRespuesta
+
+    cap = get_object_or_404(Capacitacion, public_token=token, is_active=True)
+    lineas = cap.lineas.prefetch_related("respuestas__submitted_by").order_by("orden", "created_at")
+
+    error = None
+    if request.method == "POST":
+        linea_id = request.POST.get("linea_id")
+        nombre = request.POST.get("nombre", "").strip()
+        enlace = request.POST.get("enlace", "").strip()
+        linea = CapacitacionLinea.objects.filter(pk=linea_id, capacitacion=cap).first()
+        if not linea:
+            error = "Línea no válida."
+        elif not nombre:
+            error = "Por favor ingresa tu nombre."
+        elif not enlace:
+            error = "Por favor ingresa un enlace."
+        else:
+            submitted_by = request.user if request.user.is_authenticated else None
+            CapacitacionRespuesta.objects.create(
+                linea=linea,
+                nombre=nombre,
+                enlace=enlace,
+                submitted_by=submitted_by,
+            )
+            from django.http import HttpResponseRedirect
+            return HttpResponseRedirect(request.path + "?ok=1#linea-" + str(linea.pk))
+
+    return render(request, "tickets/capacitacion_public.html", {
+        "cap": cap,
+        "lineas": lineas,
+        "error": error,
+        "ok": request.GET.get("ok"),
+    })
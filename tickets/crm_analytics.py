@@ -0,0 +1,372 @@
+"""
+Estadísticas del CRM calculadas con agregaciones agrupadas.
+
+Las vistas del CRM no cuentan oportunidades ni contactos con un ``count()``
+por estado y por periodo: cada bloque de cifras sale de una sola consulta
+``values(...).annotate(...)`` o de un ``aggregate`` con ``Count(filter=...)``.
+
+Los resúmenes por periodo de contactos (tabla de estados, progreso mensual)
+se guardan en la caché de Django durante ``CRM_ANALYTICS_CACHE_TTL``
+segundos. Guardar o borrar un contacto invalida todas las entradas de este
+proceso (ver ``invalidate``); con una caché compartida (Redis, Memcached)
+la invalidación alcanza a todos los procesos.
+"""
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, DecimalField, F, Q, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear, TruncDate
+from django.utils import timezone
+
+from .models import Contact, OpportunityStatus, SalesPlan
+
+CACHE_TTL = getattr(settings, 'CRM_ANALYTICS_CACHE_TTL', 300)
+CACHE_VERSION_KEY = 'crm_analytics:version'
+
+# Estados de contacto en el orden en que se muestran en tablas e informes
+CONTACT_STATUS_ORDER = ['do_not_contact', 'negative', 'not_now', 'neutral', 'positive', 'won']
+CONTACT_STATUS_LABELS = {
+    'do_not_contact': 'No Contactar',
+    'negative': 'Negativos',
+    'not_now': 'No Ahora',
+    'neutral': 'Neutros',
+    'positive': 'Positivos',
+    'won': 'Ganados',
+}
+
+MONTH_NAMES = ['Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun', 'Jul', 'Ago', 'Sep', 'Oct', 'Nov', 'Dic']
+
+
+# ------------------------------------------------------------------ caché
+
+def _cache_version():
+    version = cache.get(CACHE_VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(CACHE_VERSION_KEY, version, None)
+    return version
+
+
+def invalidate():
+    """Invalida los resúmenes en caché (se llama al guardar o borrar un contacto)"""
+    try:
+        cache.incr(CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(CACHE_VERSION_KEY, 2, None)
+
+
+def cached(key, compute):
+    """Devuelve ``compute()`` guardado en caché bajo ``key`` hasta que caduca o se invalida"""
+    full_key = f'crm_analytics:{_cache_version()}:{key}'
+    value = cache.get(full_key)
+    if value is None:
+        value = compute()
+        cache.set(full_key, value, CACHE_TTL)
+    return value
+
+
+def _empty_counts():
+    return {status: 0 for status in CONTACT_STATUS_ORDER}
+
+
+# ----------------------------------------------------------- oportunidades
+
+def opportunity_summary(opportunities):
+    """
+    Totales del dashboard para un queryset de oportunidades: número, valor,
+    valor esperado (valor × probabilidad) y desglose por estado activo.
+
+    Dos consultas en total, independientemente del número de estados.
+    """
+    totals = opportunities.aggregate(
+        total_opportunities=Count('id'),
+        total_value=Sum('value'),
+        weighted_value=Sum(F('value') * F('probability'), output_field=DecimalField(max_digits=20, decimal_places=2)),
+    )
+
+    by_status = {
+        row['status']: row
+        for row in opportunities.order_by().values('status').annotate(count=Count('id'), value=Sum('value'))
+    }
+    status_stats = OrderedDict()
+    for status in OpportunityStatus.objects.filter(is_active=True):
+        row = by_status.get(status.pk, {})
+        status_stats[status] = {'count': row.get('count', 0), 'value': row.get('value') or 0}
+
+    return {
+        'total_opportunities': totals['total_opportunities'],
+        'total_value': totals['total_value'] or 0,
+        # La división por 100 se hace aquí para no depender de la aritmética entera de SQLite
+        'total_expected_value': (totals['weighted_value'] or 0) / 100,
+        'status_stats': status_stats,
+    }
+
+
+# -------------------------------------------------------------- contactos
+
+def contact_status_counts(contacts, start_date=None, end_date=None, year=None):
+    """Contactos por estado creados en el periodo indicado, con una consulta agrupada"""
+    if start_date:
+        contacts = contacts.filter(created_at__date__gte=start_date)
+    if end_date:
+        contacts = contacts.filter(created_at__date__lte=end_date)
+    if year:
+        contacts = contacts.filter(created_at__year=year)
+
+    counts = _empty_counts()
+    for row in contacts.order_by().values('status').annotate(count=Count('id')):
+        if row['status'] in counts:
+            counts[row['status']] = row['count']
+    return counts
+
+
+def contact_overview(user, today=None):
+    """
+    Contadores de la cabecera de la lista de contactos en una sola consulta:
+    totales por estado, hoy frente al día de comparación, mes actual...
+    """
+    now = timezone.now()
+    today = today or now.date()
+    # Los lunes se compara con el viernes; el resto de días con el anterior
+    if today.weekday() == 0:
+        comparison_date, comparison_label = today - timedelta(days=3), 'Viernes'
+    else:
+        comparison_date, comparison_label = today - timedelta(days=1), 'Ayer'
+
+    this_month = Q(created_at__year=now.year, created_at__month=now.month)
+
+    counts = Contact.objects.aggregate(
+        total_contacts=Count('id'),
+        positive_contacts=Count('id', filter=Q(status='positive')),
+        neutral_contacts=Count('id', filter=Q(status='neutral')),
+        negative_contacts=Count('id', filter=Q(status='negative')),
+        not_now_contacts=Count('id', filter=Q(status='not_now')),
+        do_not_contact_contacts=Count('id', filter=Q(status='do_not_contact')),
+        won_contacts=Count('id', filter=Q(status='won')),
+        my_positive_contacts=Count('id', filter=Q(assigned_to=user, status='positive')),
+        today_contacts=Count('id', filter=Q(contact_date__date=today)),
+        today_total_contacts=Count('id', filter=Q(created_at__date=today)),
+        comparison_total_contacts=Count('id', filter=Q(created_at__date=comparison_date)),
+        monthly_won_contacts=Count('id', filter=this_month & Q(status='won')),
+        contacts_with_activities=Count('id', filter=Q(activity_count__gt=0)),
+        monthly_meetings=Count('id', filter=Q(
+            had_meeting=True, meeting_date__year=now.year, meeting_date__month=now.month
+        )),
+        total_meetings=Count('id', filter=Q(had_meeting=True)),
+    )
+    counts['contacts_without_activities'] = counts['total_contacts'] - counts['contacts_with_activities']
+
+    if counts['comparison_total_contacts'] > 0:
+        counts['contact_change_percentage'] = (
+            (counts['today_total_contacts'] - counts['comparison_total_contacts'])
+            / counts['comparison_total_contacts'] * 100
+        )
+    else:
+        counts['contact_change_percentage'] = 100 if counts['today_total_contacts'] > 0 else 0
+
+    counts['comparison_date'] = comparison_date
+    counts['comparison_label'] = comparison_label
+    return counts
+
+
+def contact_status_table(contacts, view='day', days=30, weeks=12, year=None, years=None, cache_key=None):
+    """
+    Filas de la tabla de estados por periodo (día, semana, mes o año).
+
+    Cada vista es una sola consulta agrupada por periodo y estado; los
+    periodos sin contactos salen con ceros. Con ``cache_key`` el resultado
+    se guarda en caché.
+    """
+    if cache_key:
+        return cached(
+            f'table:{cache_key}:{timezone.localdate()}:{view}:{days}:{weeks}:{year}:'
+            + '-'.join(str(row_year) for row_year in years or ()),
+            lambda: contact_status_table(contacts, view, days, weeks, year, years),
+        )
+
+    today = timezone.localdate()
+    contacts = contacts.order_by()
+    rows = []
+
+    if view == 'day':
+        start_date = today - timedelta(days=days - 1)
+        grouped = _group_counts(
+            contacts.filter(created_at__date__gte=start_date, created_at__date__lte=today),
+            period=TruncDate('created_at'),
+        )
+        for i in range(days - 1, -1, -1):
+            date = today - timedelta(days=i)
+            rows.append({
+                'date': date,
+                'day': date.day,
+                'month': date.strftime('%b'),
+                'year': date.year,
+                'label': f"{date.day} {date.strftime('%b')} {date.year}",
+                'counts': grouped.get(date, _empty_counts()),
+            })
+
+    elif view == 'week':
+        # Semanas de lunes a domingo; se agrupa por día y se suman en Python
+        first_week_start = today - timedelta(weeks=weeks - 1, days=today.weekday())
+        daily = _group_counts(
+            contacts.filter(
+                created_at__date__gte=first_week_start,
+                created_at__date__lte=first_week_start + timedelta(weeks=weeks) - timedelta(days=1),
+            ),
+            period=TruncDate('created_at'),
+        )
+        for i in range(weeks - 1, -1, -1):
+            week_start = today - timedelta(weeks=i, days=today.weekday())
+            week_end = week_start + timedelta(days=6)
+            counts = _empty_counts()
+            for date, day_counts in daily.items():
+                if week_start <= date <= week_end:
+                    for status, count in day_counts.items():
+                        counts[status] += count
+            week_num = week_start.isocalendar()[1]
+            rows.append({
+                'week_start': week_start,
+                'week_end': week_end,
+                'week_num': week_num,
+                'year': week_start.year,
+                'label': f"Sem {week_num} ({week_start.day}/{week_start.month} - {week_end.day}/{week_end.month})",
+                'counts': counts,
+            })
+
+    elif view == 'month':
+        year = year or today.year
+        grouped = _group_counts(contacts.filter(created_at__year=year), period=ExtractMonth('created_at'))
+        for month_num in range(1, 13):
+            rows.append({
+                'month': month_num,
+                'month_name': MONTH_NAMES[month_num - 1],
+                'year': year,
+                'label': f"{MONTH_NAMES[month_num - 1]} {year}",
+                'counts': grouped.get(month_num, _empty_counts()),
+            })
+
+    elif view == 'year':
+        grouped = _group_counts(contacts, period=ExtractYear('created_at'))
+        for row_year in years or sorted(grouped):
+            rows.append({
+                'year': row_year,
+                'label': str(row_year),
+                'counts': grouped.get(row_year, _empty_counts()),
+            })
+
+    return rows
+
+
+def _group_counts(contacts, period):
+    """{periodo: {estado: n}} con una única consulta GROUP BY periodo, estado"""
+    grouped = {}
+    rows = contacts.annotate(period=period).values('period', 'status').annotate(count=Count('id'))
+    for row in rows:
+        if row['status'] not in CONTACT_STATUS_ORDER:
+            continue
+        grouped.setdefault(row['period'], _empty_counts())[row['status']] = row['count']
+    return grouped
+
+
+def table_totals(rows):
+    """Totales por estado y tasa de conversión de la tabla de estados"""
+    totals = _empty_counts()
+    totals['total'] = 0
+    for row in rows:
+        for status in CONTACT_STATUS_ORDER:
+            totals[status] += row['counts'][status]
+        totals['total'] += sum(row['counts'].values())
+    totals['conversion_rate'] = round(totals['won'] / totals['total'] * 100, 1) if totals['total'] else 0
+    return totals
+
+
+# ------------------------------------------------------------ plan de ventas
+
+def monthly_plan_progress(user=None, goals=None):
+    """
+    Progreso del mes actual frente al mismo tramo del mes anterior.
+
+    Con ``user`` se cuentan sus contactos; sin él, los de todos (vista
+    consolidada). ``goals`` son los objetivos mensuales; si no se indican se
+    suman los de todos los planes activos. Una consulta para los contadores
+    y otra para los objetivos.
+    """
+    from dateutil.relativedelta import relativedelta
+
+    now = timezone.now()
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    last_month = now - relativedelta(months=1)
+    last_month_start = last_month.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    last_month_same_day = last_month.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+    if goals is None:
+        goals = SalesPlan.objects.filter(is_active=True).aggregate(
+            contacts=Sum('monthly_contact_goal'),
+            positive=Sum('monthly_positive_contact_goal'),
+            meetings=Sum('monthly_meeting_goal'),
+            won=Sum('monthly_won_goal'),
+        )
+    goals = {key: value or 0 for key, value in goals.items()}
+
+    contacts = Contact.objects.all()
+    if user is not None:
+        contacts = contacts.filter(created_by=user)
+
+    this_month = Q(created_at__gte=month_start, created_at__lte=now)
+    previous_month = Q(created_at__gte=last_month_start, created_at__lte=last_month_same_day)
+    meetings_this_month = Q(had_meeting=True, meeting_date__gte=month_start.date(), meeting_date__lte=now.date())
+    meetings_previous_month = Q(
+        had_meeting=True,
+        meeting_date__gte=last_month_start.date(),
+        meeting_date__lte=last_month_same_day.date(),
+    )
+    counts = contacts.aggregate(
+        contacts_created=Count('id', filter=this_month),
+        contacts_last_month=Count('id', filter=previous_month),
+        positive_contacts=Count('id', filter=this_month & Q(status='positive')),
+        positive_last_month=Count('id', filter=previous_month & Q(status='positive')),
+        meetings_held=Count('id', filter=meetings_this_month),
+        meetings_last_month=Count('id', filter=meetings_previous_month),
+        won_contacts=Count('id', filter=this_month & Q(status='won')),
+        won_last_month=Count('id', filter=previous_month & Q(status='won')),
+    )
+
+    def percentage(value, goal):
+        return value / goal * 100 if goal > 0 else 0
+
+    contact_percentage = percentage(counts['contacts_created'], goals['contacts'])
+    positive_percentage = percentage(counts['positive_contacts'], goals['positive'])
+    meeting_percentage = percentage(counts['meetings_held'], goals['meetings'])
+    won_percentage = percentage(counts['won_contacts'], goals['won'])
+    overall_percentage = (contact_percentage + positive_percentage + meeting_percentage + won_percentage) / 4
+
+    return {
+        'contacts_created': counts['contacts_created'],
+        'contacts_goal': goals['contacts'],
+        'contact_percentage': round(contact_percentage, 1),
+        'contacts_last_month': counts['contacts_last_month'],
+        'contacts_diff': counts['contacts_created'] - counts['contacts_last_month'],
+        'positive_contacts': counts['positive_contacts'],
+        'positive_goal': goals['positive'],
+        'positive_percentage': round(positive_percentage, 1),
+        'positive_last_month': counts['positive_last_month'],
+        'positive_diff': counts['positive_contacts'] - counts['positive_last_month'],
+        'meetings_held': counts['meetings_held'],
+        'meeting_goal': goals['meetings'],
+        'meeting_percentage': round(meeting_percentage, 1),
+        'meetings_last_month': counts['meetings_last_month'],
+        'meetings_diff': counts['meetings_held'] - counts['meetings_last_month'],
+        'won_contacts': counts['won_contacts'],
+        'won_goal': goals['won'],
+        'won_percentage': round(won_percentage, 1),
+        'won_last_month': counts['won_last_month'],
+        'won_diff': counts['won_contacts'] - counts['won_last_month'],
+        'overall_percentage': round(overall_percentage, 1),
+    }
+
+
+def consolidated_plan_progress():
+    """Progreso mensual de todos los vendedores juntos, en caché"""
+    return cached('plan:all', monthly_plan_progress)
@@ -0,0 +1,10262 @@
+"""
+Vistas de CRM: contactos, oportunidades, reuniones, cotizaciones y landing pages.
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib.auth.models import User
+from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db.models import F, Q, Sum, Count
+from django.db import models
+from django.db.models.functions import TruncHour, TruncDay, TruncMonth
+from django.http import HttpResponse, Http404, JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods, require_POST
+from django.views.decorators.csrf import csrf_exempt
+from django.urls import reverse
+from datetime import date, timedelta
+import os
+import json
+from io import BytesIO
+from .models import (
+    Ticket, Company, SystemConfiguration, Opportunity, OpportunityStatus, OpportunityNote,
+    OpportunityStatusHistory, OpportunityActivity, Meeting, Contact, LandingPage,
+    LandingPageSubmission, CrmQuestion, ContactGenerator, CompanyRequest, VideoMeeting,
+)
+from .forms import (
+    LandingPageForm, LandingPageSubmissionForm, PublicCompanyTicketForm, ContactGeneratorForm,
+    PublicContactForm, PublicCrmQuestionForm,
+)
+from .utils import is_agent, is_agent_or_superuser
+from .page_cache import cache_public_page
+
+
+@login_required
+def contact_chart(request):
+    """Vista de gráfico de creación de contactos en el tiempo"""
+    group_by = request.GET.get('group_by', 'day')
+    time_range = request.GET.get('time_range', 'week')  # week, month, year, all
+    
+    # Calcular filtro de fecha según el rango temporal
+    end_date = timezone.now()
+    if time_range == 'week':
+        start_date = end_date - timedelta(days=7)
+    elif time_range == 'month':
+        start_date = end_date - timedelta(days=30)
+    elif time_range == 'year':
+        start_date = end_date - timedelta(days=365)
+    else:  # all
+        start_date = None
+    
+    if group_by == 'day':
+        trunc = TruncDay('contact_date')
+        label_fmt = '%d/%m/%Y'
+    elif group_by == 'month':
+        trunc = TruncMonth('contact_date')
+        label_fmt = '%m/%Y'
+    else:
+        trunc = TruncHour('contact_date')
+        label_fmt = '%d/%m/%Y %H:00'
+
+    # Obtener datos totales con filtro de fecha
+    contacts_qs = Contact.objects.all()
+    if start_date:
+        contacts_qs = contacts_qs.filter(contact_date__gte=start_date)
+    
+    data = (
+        contacts_qs
+        .annotate(grp=trunc)
+        .values('grp')
+        .annotate(count=Count('id'))
+        .order_by('grp')
+    )
+    labels = [item['grp'].strftime(label_fmt) for item in data if item['grp']]
+    counts = [item['count'] for item in data]
+    
+    # Obtener datos por usuario
+    from django.contrib.auth.models import User
+    users_data = {}
+    
+    for user in User.objects.filter(contacts_created__isnull=False).distinct():
+        user_contacts_qs = Contact.objects.filter(created_by=user)
+        if start_date:
+            user_contacts_qs = user_contacts_qs.filter(contact_date__gte=start_date)
+        
+        user_contacts = (
+            user_contacts_qs
+            .annotate(grp=trunc)
+            .values('grp')
+            .annotate(count=Count('id'))
+            .order_by('grp')
+        )
+        
+        # Crear diccionario para buscar rápidamente los valores
+        user_dict = {item['grp'].strftime(label_fmt): item['count'] for item in user_contacts if item['grp']}
+        
+        # Llenar con 0 para las fechas sin datos
+        users_data[user.username] = [user_dict.get(label, 0) for label in labels]
+    
+    # Generar datos para el gráfico de actividad de contactos (estilo GitHub)
+    from django.db.models.functions import TruncDate
+    
+    # Calcular fecha de inicio (365 días atrás)
+    end_date = timezone.now().date()
+    start_date = end_date - timedelta(days=364)  # 365 días incluyendo hoy
+    
+    # Obtener conteo de contactos por día
+    contacts_by_date = Contact.objects.filter(
+        contact_date__date__gte=start_date,
+        contact_date__date__lte=end_date
+    ).annotate(
+        date=TruncDate('contact_date')
+    ).values('date').annotate(
+        count=Count('id')
+    ).order_by('date')
+    
+    # Crear diccionario con todos los días del año (inicializados en 0)
+    activity_data = {}
+    current_date = start_date
+    while current_date <= end_date:
+        activity_data[current_date.isoformat()] = 0
+        current_date += timedelta(days=1)
+    
+    # Llenar con datos reales
+    for item in contacts_by_date:
+        activity_data[item['date'].isoformat()] = item['count']
+    
+    # Calcular estadísticas
+    total_contributions = sum(activity_data.values())
+    max_contributions = max(activity_data.values()) if activity_data.values() else 0
+    
+    # Generar datos para el gráfico de reuniones por mes (año actual y anterior)
+    from dateutil.relativedelta import relativedelta
+    
+    current_date = timezone.now().date()
+    current_year = current_date.year
+    previous_year = current_year - 1
+    
+    # Obtener reuniones del año actual
+    meetings_current_year = Contact.objects.filter(
+        had_meeting=True,
+        meeting_date__year=current_year
+    ).annotate(
+        month=TruncMonth('meeting_date')
+    ).values('month').annotate(
+        count=Count('id')
+    ).order_by('month')
+    
+    # Obtener reuniones del año anterior
+    meetings_previous_year = Contact.objects.filter(
+        had_meeting=True,
+        meeting_date__year=previous_year
+    ).annotate(
+        month=TruncMonth('meeting_date')
+    ).values('month').annotate(
+        count=Count('id')
+    ).order_by('month')
+    
+    # Crear diccionarios con datos de reuniones
+    current_year_dict = {item['month'].month: item['count'] for item in meetings_current_year if item['month']}
+    previous_year_dict = {item['month'].month: item['count'] for item in meetings_previous_year if item['month']}
+    
+    # Generar labels (meses del 1 al 12) y counts para ambos años
+    meetings_labels = []
+    meetings_counts_current = []
+    meetings_counts_previous = []
+    
+    month_names = ['Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun', 'Jul', 'Ago', 'Sep', 'Oct', 'Nov', 'Dic']
+    
+    for month_num in range(1, 13):
+        meetings_labels.append(month_names[month_num - 1])
+        meetings_counts_current.append(current_year_dict.get(month_num, 0))
+        meetings_counts_previous.append(previous_year_dict.get(month_num, 0))
+    
+    total_meetings_current = sum(meetings_counts_current)
+    total_meetings_previous = sum(meetings_counts_previous)
+    
+    import json
+    context = {
+        'labels': json.dumps(labels),
+        'counts': json.dumps(counts),
+        'users_data': json.dumps(users_data),
+        'group_by': group_by,
+        'time_range': time_range,
+        'page_title': 'Gráfico de Creación de Contactos',
+        'activity_data': json.dumps(activity_data),
+        'activity_total': total_contributions,
+        'activity_max': max_contributions,
+        'activity_start_date': start_date if start_date else None,
+        'activity_end_date': end_date,
+        'meetings_labels': json.dumps(meetings_labels),
+        'meetings_counts_current': json.dumps(meetings_counts_current),
+        'meetings_counts_previous': json.dumps(meetings_counts_previous),
+        'total_meetings_current': total_meetings_current,
+        'total_meetings_previous': total_meetings_previous,
+        'current_year': current_year,
+        'previous_year': previous_year,
+    }
+    return render(request, 'tickets/contact_chart.html', context)
+
+
+# ============= VISTAS CRM =============
+
+@login_required
+def crm_dashboard(request):
+    """Dashboard principal del CRM"""
+    # Obtener configuración del sistema
+    system_config = SystemConfiguration.get_config()
+    
+    # Obtener oportunidades del usuario
+    if is_agent(request.user):
+        opportunities = Opportunity.objects.all()
+    else:
+        opportunities = Opportunity.objects.filter(
+            Q(created_by=request.user) | Q(assigned_to=request.user)
+        )
+    
+    # Estadísticas generales y por estado (consultas agrupadas)
+    from .crm_analytics import opportunity_summary
+    summary = opportunity_summary(opportunities)
+    
+    # Oportunidades próximas a vencer (próximos 7 días)
+    next_week = timezone.now().date() + timedelta(days=7)
+    upcoming_opportunities = opportunities.filter(
+        expected_close_date__lte=next_week,
+        expected_close_date__gte=timezone.now().date(),
+        status__is_final=False
+    ).order_by('expected_close_date')[:5]
+    
+    # Oportunidades vencidas
+    overdue_opportunities = opportunities.filter(
+        expected_close_date__lt=timezone.now().date(),
+        status__is_final=False
+    ).count()
+    
+    context = {
+        'total_opportunities': summary['total_opportunities'],
+        'total_value': summary['total_value'],
+        'total_expected_value': summary['total_expected_value'],
+        'status_stats': summary['status_stats'],
+        'upcoming_opportunities': upcoming_opportunities,
+        'overdue_opportunities': overdue_opportunities,
+        'page_title': 'CRM Dashboard',
+        'system_config': system_config,
+    }
+    
+    return render(request, 'tickets/crm_dashboard.html', context)
+
+
+@login_required
+def opportunity_list(request):
+    """Lista de oportunidades"""
+    # Obtener oportunidades del usuario
+    if is_agent(request.user):
+        opportunities = Opportunity.objects.all()
+    else:
+        opportunities = Opportunity.objects.filter(
+            Q(created_by=request.user) | Q(assigned_to=request.user)
+        )
+    
+    # Filtros
+    status_filter = request.GET.get('status')
+    company_filter = request.GET.get('company')
+    assigned_filter = request.GET.get('assigned')
+    search = request.GET.get('search')
+    overdue_filter = request.GET.get('overdue')
+    
+    if status_filter:
+        opportunities = opportunities.filter(status_id=status_filter)
+    
+    if company_filter:
+        opportunities = opportunities.filter(company_id=company_filter)
+    
+    if assigned_filter:
+        opportunities = opportunities.filter(assigned_to_id=assigned_filter)
+    
+    if overdue_filter == 'true':
+        from django.utils import timezone
+        today = timezone.now().date()
+        opportunities = opportunities.filter(
+            expected_close_date__lt=today,
+            status__is_final=False
+        )
+    
+    if search:
+        from .search import filter_queryset
+        opportunities = filter_queryset(opportunities, 'opportunity', search)
+    
+    # Ordenamiento
+    order_by = request.GET.get('order_by', '-created_at')
+    opportunities = opportunities.order_by(order_by)
+    
+    # Paginación
+    paginator = Paginator(opportunities, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Agregar información de permisos a cada oportunidad
+    for opportunity in page_obj:
+        opportunity.user_can_edit = opportunity.can_be_edited_by(request.user)
+    
+    # Para los filtros
+    statuses = OpportunityStatus.objects.filter(is_active=True).order_by('order')
+    companies = Company.objects.all()
+    users = User.objects.filter(is_active=True)
+    
+    context = {
+        'page_obj': page_obj,
+        'statuses': statuses,
+        'companies': companies,
+        'users': users,
+        'current_filters': {
+            'status': status_filter,
+            'company': company_filter,
+            'assigned': assigned_filter,
+            'search': search,
+            'order_by': order_by,
+        },
+        'page_title': 'Oportunidades'
+    }
+    
+    return render(request, 'tickets/opportunity_list.html', context)
+
+
+@login_required
+def opportunity_detail(request, pk):
+    """Detalle de oportunidad"""
+    opportunity = get_object_or_404(Opportunity, pk=pk)
+    
+    # Verificar permisos
+    from . import utils
+    if not utils.is_agent(request.user):
+        if opportunity.created_by != request.user and opportunity.assigned_to != request.user:
+            messages.error(request, 'No tienes permisos para ver esta oportunidad.')
+            return redirect('opportunity_list')
+    
+    # Obtener notas y historial
+    notes = opportunity.notes.all()
+    history = opportunity.status_history.all()
+    
+    # Verificar si puede ser editada
+    can_be_edited = opportunity.can_be_edited_by(request.user)
+    
+    context = {
+        'opportunity': opportunity,
+        'notes': notes,
+        'history': history,
+        'can_be_edited': can_be_edited,
+        'page_title': f'Oportunidad: {opportunity.name}'
+    }
+    
+    return render(request, 'tickets/opportunity_detail.html', context)
+
+
+@login_required
+def opportunity_create(request):
+    """Crear nueva oportunidad"""
+    if request.method == 'POST':
+        # Procesar formulario
+        name = request.POST.get('name')
+        description = request.POST.get('description', '')
+        company_id = request.POST.get('company')
+        contact_name = request.POST.get('contact_name')
+        contact_position = request.POST.get('contact_position', '')
+        contact_email = request.POST.get('contact_email', '')
+        contact_phone = request.POST.get('contact_phone', '')
+        value = request.POST.get('value')
+        probability = request.POST.get('probability', 20)
+        status_id = request.POST.get('status')
+        expected_close_date = request.POST.get('expected_close_date')
+        assigned_to_id = request.POST.get('assigned_to')
+        source = request.POST.get('source', '')
+        
+        try:
+            company = Company.objects.get(pk=company_id)
+            status = OpportunityStatus.objects.get(pk=status_id)
+            assigned_to = User.objects.get(pk=assigned_to_id) if assigned_to_id else None
+            
+            opportunity = Opportunity.objects.create(
+                name=name,
+                description=description,
+                company=company,
+                contact_name=contact_name,
+                contact_position=contact_position,
+                contact_email=contact_email,
+                contact_phone=contact_phone,
+                value=value,
+                probability=probability,
+                status=status,
+                expected_close_date=expected_close_date,
+                assigned_to=assigned_to,
+                created_by=request.user,
+                source=source
+            )
+            
+            # Crear historial inicial
+            OpportunityStatusHistory.objects.create(
+                opportunity=opportunity,
+                new_status=status,
+                changed_by=request.user,
+                comment="Oportunidad creada"
+            )
+            
+            messages.success(request, 'Oportunidad creada exitosamente.')
+            return redirect('opportunity_detail', pk=opportunity.pk)
+            
+        except Exception as e:
+            messages.error(request, f'Error al crear la oportunidad: {str(e)}')
+    
+    # Para GET request
+    companies = Company.objects.all()
+    statuses = OpportunityStatus.objects.filter(is_active=True).order_by('order')
+    users = User.objects.filter(is_active=True)
+    
+    # Valores por defecto
+    default_close_date = (timezone.now().date() + timedelta(days=90)).strftime('%Y-%m-%d')  # 3 meses
+    default_status = statuses.first()  # Estado con menor secuencia (order)
+    default_assigned_to = request.user  # Usuario que crea la oportunidad
+    
+    # Si viene un contact_id, precargar datos del contacto
+    contact_data = {}
+    contact_id = request.GET.get('contact_id')
+    if contact_id:
+        try:
+            contact = Contact.objects.get(pk=contact_id)
+            contact_data = {
+                'contact_name': contact.name,
+                'contact_email': contact.email or '',
+                'contact_phone': contact.phone or '',
+                'contact_position': contact.position or '',
+                'source': f"Contacto: {contact.source}" if contact.source else "Contacto previo",
+            }
+            # Si el contacto tiene empresa, buscar si existe en Company
+            if contact.company:
+                try:
+                    company = Company.objects.filter(name__iexact=contact.company).first()
+                    if company:
+                        contact_data['default_company'] = company
+                except:
+                    pass
+        except Contact.DoesNotExist:
+            pass
+    
+    # Opciones de probabilidad
+    probability_choices = [
+        (0, '0%'), (10, '10%'), (20, '20%'), (30, '30%'), (40, '40%'),
+        (50, '50%'), (60, '60%'), (70, '70%'), (80, '80%'), (90, '90%'), (100, '100%')
+    ]
+    
+    context = {
+        'companies': companies,
+        'statuses': statuses,
+        'users': users,
+        'probability_choices': probability_choices,
+        'page_title': 'Nueva Oportunidad',
+        'default_close_date': default_close_date,
+        'default_status': default_status,
+        'default_assigned_to': default_assigned_to,
+        'contact_data': contact_data,
+    }
+    
+    return render(request, 'tickets/opportunity_form.html', context)
+
+
+@login_required
+def opportunity_edit(request, pk):
+    """Editar oportunidad"""
+    opportunity = get_object_or_404(Opportunity, pk=pk)
+    
+    # Verificar permisos
+    if not opportunity.can_be_edited_by(request.user):
+        messages.error(request, 'No tienes permisos para editar esta oportunidad.')
+        return redirect('opportunity_detail', pk=pk)
+    
+    if request.method == 'POST':
+        # Procesar formulario
+        previous_status = opportunity.status
+        
+        opportunity.name = request.POST.get('name')
+        opportunity.description = request.POST.get('description', '')
+        opportunity.company_id = request.POST.get('company')
+        opportunity.contact_name = request.POST.get('contact_name')
+        opportunity.contact_position = request.POST.get('contact_position', '')
+        opportunity.contact_email = request.POST.get('contact_email', '')
+        opportunity.contact_phone = request.POST.get('contact_phone', '')
+        opportunity.value = request.POST.get('value')
+        opportunity.probability = request.POST.get('probability', 20)
+        opportunity.status_id = request.POST.get('status')
+        opportunity.expected_close_date = request.POST.get('expected_close_date')
+        opportunity.assigned_to_id = request.POST.get('assigned_to') or None
+        opportunity.source = request.POST.get('source', '')
+        
+        # Si el estado cambió, crear historial
+        if previous_status.pk != int(request.POST.get('status')):
+            comment = request.POST.get('status_comment', '')
+            OpportunityStatusHistory.objects.create(
+                opportunity=opportunity,
+                previous_status=previous_status,
+                new_status=opportunity.status,
+                changed_by=request.user,
+                comment=comment
+            )
+        
+        opportunity.save()
+        messages.success(request, 'Oportunidad actualizada exitosamente.')
+        return redirect('opportunity_detail', pk=pk)
+    
+    # Para GET request
+    companies = Company.objects.all()
+    statuses = OpportunityStatus.objects.filter(is_active=True)
+    users = User.objects.filter(is_active=True)
+    
+    # Opciones de probabilidad
+    probability_choices = [
+        (0, '0%'), (10, '10%'), (20, '20%'), (30, '30%'), (40, '40%'),
+        (50, '50%'), (60, '60%'), (70, '70%'), (80, '80%'), (90, '90%'), (100, '100%')
+    ]
+    
+    context = {
+        'opportunity': opportunity,
+        'companies': companies,
+        'statuses': statuses,
+        'users': users,
+        'probability_choices': probability_choices,
+        'page_title': f'Editar: {opportunity.name}'
+    }
+    
+    return render(request, 'tickets/opportunity_form.html', context)
+
+
+@login_required
+def opportunity_delete(request, pk):
+    """Eliminar oportunidad"""
+    opportunity = get_object_or_404(Opportunity, pk=pk)
+    
+    # Verificar permisos
+    from . import utils
+    if not utils.is_agent(request.user) and opportunity.created_by != request.user:
+        messages.error(request, 'No tienes permisos para eliminar esta oportunidad.')
+        return redirect('opportunity_detail', pk=pk)
+    
+    if request.method == 'POST':
+        opportunity.delete()
+        messages.success(request, 'Oportunidad eliminada exitosamente.')
+        return redirect('opportunity_list')
+    
+    context = {
+        'opportunity': opportunity,
+        'page_title': f'Eliminar: {opportunity.name}'
+    }
+    
+    return render(request, 'tickets/opportunity_delete.html', context)
+
+
+@login_required
+def opportunity_status_list(request):
+    """Lista de estados de oportunidades"""
+    from . import utils
+    if not utils.is_agent(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('crm_dashboard')
+    
+    statuses = OpportunityStatus.objects.all().order_by('order', 'name')
+    
+    context = {
+        'statuses': statuses,
+        'page_title': 'Estados de Oportunidades'
+    }
+    
+    return render(request, 'tickets/opportunity_status_list.html', context)
+
+
+@login_required
+def opportunity_status_create(request):
+    """Crear estado de oportunidad"""
+    from . import utils
+    if not utils.is_agent(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('crm_dashboard')
+    
+    if request.method == 'POST':
+        name = request.POST.get('name')
+        description = request.POST.get('description', '')
+        color = request.POST.get('color', '#007bff')
+        is_final = request.POST.get('is_final') == 'on'
+        is_won = request.POST.get('is_won') == 'on'
+        order = request.POST.get('order', 0)
+        
+        try:
+            status = OpportunityStatus.objects.create(
+                name=name,
+                description=description,
+                color=color,
+                is_final=is_final,
+                is_won=is_won,
+                order=order,
+                created_by=request.user
+            )
+            messages.success(request, 'Estado creado exitosamente.')
+            return redirect('opportunity_status_list')
+        except Exception as e:
+            messages.error(request, f'Error al crear el estado: {str(e)}')
+    
+    context = {
+        'page_title': 'Nuevo Estado'
+    }
+    
+    return render(request, 'tickets/opportunity_status_form.html', context)
+
+
+@login_required
+def opportunity_status_edit(request, pk):
+    """Editar estado de oportunidad"""
+    from .models import OpportunityStatus
+    from . import utils
+    
+    status = get_object_or_404(OpportunityStatus, pk=pk)
+    
+    if not utils.is_agent(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('crm_dashboard')
+    
+    if request.method == 'POST':
+        status.name = request.POST.get('name')
+        status.description = request.POST.get('description', '')
+        status.color = request.POST.get('color', '#007bff')
+        status.is_final = request.POST.get('is_final') == 'on'
+        status.is_won = request.POST.get('is_won') == 'on'
+        status.order = request.POST.get('order', 0)
+        status.is_active = request.POST.get('is_active') == 'on'
+        
+        status.save()
+        messages.success(request, 'Estado actualizado exitosamente.')
+        return redirect('opportunity_status_list')
+    
+    context = {
+        'status': status,
+        'page_title': f'Editar: {status.name}'
+    }
+    
+    return render(request, 'tickets/opportunity_status_form.html', context)
+
+
+@login_required
+def opportunity_status_delete(request, pk):
+    """Eliminar estado de oportunidad"""
+    from .models import OpportunityStatus
+    
+    status = get_object_or_404(OpportunityStatus, pk=pk)
+    
+    # Verificar si hay oportunidades usando este estado
+    if status.opportunities.exists():
+        messages.error(request, 'No se puede eliminar este estado porque hay oportunidades que lo utilizan.')
+        return redirect('opportunity_status_list')
+    
+    if request.method == 'POST':
+        status.delete()
+        messages.success(request, 'Estado eliminado exitosamente.')
+        return redirect('opportunity_status_list')
+    
+    context = {
+        'status': status,
+        'page_title': f'Eliminar: {status.name}'
+    }
+    
+    return render(request, 'tickets/opportunity_status_delete.html', context)
+
+
+@login_required
+def opportunity_add_note(request, pk):
+    """Agregar nota a oportunidad"""
+    opportunity = get_object_or_404(Opportunity, pk=pk)
+    
+    # Verificar permisos
+    from . import utils
+    if not utils.is_agent(request.user):
+        if opportunity.created_by != request.user and opportunity.assigned_to != request.user:
+            messages.error(request, 'No tienes permisos para agregar notas a esta oportunidad.')
+            return redirect('opportunity_detail', pk=pk)
+    
+    if request.method == 'POST':
+        content = request.POST.get('content')
+        is_important = request.POST.get('is_important') == 'on'
+        
+        if content:
+            OpportunityNote.objects.create(
+                opportunity=opportunity,
+                content=content,
+                is_important=is_important,
+                created_by=request.user
+            )
+            messages.success(request, 'Nota agregada exitosamente.')
+        else:
+            messages.error(request, 'El contenido de la nota es requerido.')
+    
+    return redirect('opportunity_detail', pk=pk)
+
+
+# ============================
+# VISTAS DE ACTIVIDADES DE OPORTUNIDADES
+# ============================
+
+@login_required
+def opportunity_activity_create(request, opportunity_id):
+    """Crear nueva actividad para oportunidad"""
+    from .models import Opportunity, OpportunityActivity
+    from .forms import OpportunityActivityForm
+    
+    opportunity = get_object_or_404(Opportunity, pk=opportunity_id)
+    
+    # Verificar permisos
+    from . import utils
+    if not utils.is_agent(request.user):
+        if opportunity.created_by != request.user and opportunity.assigned_to != request.user:
+            messages.error(request, 'No tienes permisos para crear actividades en esta oportunidad.')
+            return redirect('opportunity_detail', pk=opportunity_id)
+    
+    if request.method == 'POST':
+        form = OpportunityActivityForm(request.POST, opportunity=opportunity, current_user=request.user)
+        if form.is_valid():
+            activity = form.save(commit=False)
+            activity.opportunity = opportunity
+            activity.created_by = request.user
+            activity.save()
+            
+            messages.success(request, f'Actividad "{activity.title}" creada exitosamente.')
+            return redirect('opportunity_detail', pk=opportunity_id)
+    else:
+        form = OpportunityActivityForm(opportunity=opportunity, current_user=request.user)
+    
+    context = {
+        'form': form,
+        'opportunity': opportunity,
+        'page_title': f'Nueva Actividad - {opportunity.name}'
+    }
+    
+    return render(request, 'tickets/opportunity_activity_form.html', context)
+
+
+@login_required
+def opportunity_activity_list(request, opportunity_id):
+    """Listar actividades de una oportunidad"""
+    from .models import Opportunity
+    
+    opportunity = get_object_or_404(Opportunity, pk=opportunity_id)
+    
+    # Verificar permisos
+    from . import utils
+    if not utils.is_agent(request.user):
+        if opportunity.created_by != request.user and opportunity.assigned_to != request.user:
+            messages.error(request, 'No tienes permisos para ver las actividades de esta oportunidad.')
+            return redirect('opportunity_detail', pk=opportunity_id)
+    
+    activities = opportunity.activities.all()
+    
+    # Filtros
+    status = request.GET.get('status')
+    if status:
+        activities = activities.filter(status=status)
+    
+    activity_type = request.GET.get('type')
+    if activity_type:
+        activities = activities.filter(activity_type=activity_type)
+    
+    context = {
+        'opportunity': opportunity,
+        'activities': activities,
+        'page_title': f'Actividades - {opportunity.name}'
+    }
+    
+    return render(request, 'tickets/opportunity_activity_list.html', context)
+
+
+@login_required
+def opportunity_activity_detail(request, pk):
+    """Detalle de actividad"""
+    from .models import OpportunityActivity
+    
+    activity = get_object_or_404(OpportunityActivity, pk=pk)
+    
+    # Verificar permisos
+    from . import utils
+    if not utils.is_agent(request.user):
+        if (activity.created_by != request.user and 
+            activity.assigned_to != request.user):
+            messages.error(request, 'No tienes permisos para ver esta actividad.')
+            return redirect('opportunity_detail', pk=activity.opportunity.pk)
+    
+    context = {
+        'activity': activity,
+        'page_title': f'Actividad: {activity.title}'
+    }
+    
+    return render(request, 'tickets/opportunity_activity_detail.html', context)
+
+
+@login_required
+def opportunity_activity_edit(request, pk):
+    """Editar actividad"""
+    from .models import OpportunityActivity
+    from .forms import OpportunityActivityForm
+    
+    activity = get_object_or_404(OpportunityActivity, pk=pk)
+    
+    # Verificar permisos
+    from . import utils
+    if not utils.is_agent(request.user):
+        if (activity.created_by != request.user and 
+            activity.assigned_to != request.user):
+            messages.error(request, 'No tienes permisos para editar esta actividad.')
+            return redirect('opportunity_activity_detail', pk=pk)
+    
+    if request.method == 'POST':
+        form = OpportunityActivityForm(request.POST, instance=activity, opportunity=activity.opportunity)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Actividad actualizada exitosamente.')
+            return redirect('opportunity_activity_detail', pk=pk)
+    else:
+        form = OpportunityActivityForm(instance=activity, opportunity=activity.opportunity)
+    
+    context = {
+        'form': form,
+        'activity': activity,
+        'opportunity': activity.opportunity,
+        'page_title': f'Editar: {activity.title}'
+    }
+    
+    return render(request, 'tickets/opportunity_activity_form.html', context)
+
+
+@login_required
+def opportunity_activity_complete(request, pk):
+    """Completar actividad"""
+    from .models import OpportunityActivity
+    from .forms import OpportunityActivityCompleteForm
+    
+    activity = get_object_or_404(OpportunityActivity, pk=pk)
+    
+    # Verificar permisos
+    if activity.assigned_to != request.user:
+        messages.error(request, 'Solo el asignado puede completar esta actividad.')
+        return redirect('opportunity_activity_detail', pk=pk)
+    
+    if request.method == 'POST':
+        form = OpportunityActivityCompleteForm(request.POST, instance=activity)
+        if form.is_valid():
+            activity = form.save(commit=False)
+            if activity.status == 'completed':
+                activity.completed_date = timezone.now()
+            activity.save()
+            
+            messages.success(request, 'Actividad completada exitosamente.')
+            return redirect('opportunity_activity_detail', pk=pk)
+    else:
+        form = OpportunityActivityCompleteForm(instance=activity)
+    
+    context = {
+        'form': form,
+        'activity': activity,
+        'page_title': f'Completar: {activity.title}'
+    }
+    
+    return render(request, 'tickets/opportunity_activity_complete.html', context)
+
+
+@login_required
+def opportunity_activity_delete(request, pk):
+    """Eliminar actividad"""
+    from .models import OpportunityActivity
+    
+    activity = get_object_or_404(OpportunityActivity, pk=pk)
+    opportunity_id = activity.opportunity.pk if activity.opportunity else None
+    
+    # Verificar permisos
+    from . import utils
+    if not utils.is_agent(request.user):
+        if activity.created_by != request.user:
+            messages.error(request, 'No tienes permisos para eliminar esta actividad.')
+            return redirect('opportunity_activity_detail', pk=pk)
+    
+    if request.method == 'POST':
+        activity_title = activity.title
+        activity.delete()
+        messages.success(request, f'Actividad "{activity_title}" eliminada exitosamente.')
+        
+        # Redirigir a la oportunidad si existe, sino al dashboard de CRM
+        if opportunity_id:
+            return redirect('opportunity_detail', pk=opportunity_id)
+        else:
+            return redirect('business_dashboard')
+    
+    context = {
+        'activity': activity,
+        'page_title': f'Eliminar: {activity.title}'
+    }
+    
+    return render(request, 'tickets/opportunity_activity_delete.html', context)
+
+
+@login_required
+def my_activities_dashboard(request):
+    """Panel de actividades del usuario"""
+    from .models import OpportunityActivity
+    from django.db.models import Q
+    
+    # Actividades asignadas al usuario
+    activities = OpportunityActivity.objects.filter(assigned_to=request.user)
+    
+    # Filtros
+    status = request.GET.get('status')
+    if status:
+        activities = activities.filter(status=status)
+    
+    # Separar por estado y fecha
+    today = timezone.now().date()
+    
+    overdue_activities = activities.filter(
+        status__in=['pending', 'in_progress'],
+        scheduled_date__date__lt=today
+    )
+    
+    today_activities = activities.filter(
+        scheduled_date__date=today
+    )
+    
+    upcoming_activities = activities.filter(
+        status__in=['pending', 'in_progress'],
+        scheduled_date__date__gt=today
+    ).order_by('scheduled_date')[:10]
+    
+    completed_recent = activities.filter(
+        status='completed',
+        completed_date__gte=today - timezone.timedelta(days=7)
+    ).order_by('-completed_date')[:5]
+    
+    # Estadísticas
+    stats = {
+        'total_pending': activities.filter(status='pending').count(),
+        'total_in_progress': activities.filter(status='in_progress').count(),
+        'total_overdue': overdue_activities.count(),
+        'total_today': today_activities.count(),
+        'total_completed_week': completed_recent.count(),
+    }
+    
+    context = {
+        'overdue_activities': overdue_activities,
+        'today_activities': today_activities,
+        'upcoming_activities': upcoming_activities,
+        'completed_recent': completed_recent,
+        'stats': stats,
+        'page_title': 'Mis Actividades'
+    }
+    
+    return render(request, 'tickets/my_activities_dashboard.html', context)
+
+
+@login_required
+def activity_create_standalone(request):
+    """Crear nueva actividad seleccionando la oportunidad"""
+    from .models import OpportunityActivity
+    from .forms import OpportunityActivityStandaloneForm
+    
+    if request.method == 'POST':
+        form = OpportunityActivityStandaloneForm(request.POST, current_user=request.user)
+        if form.is_valid():
+            activity = form.save(commit=False)
+            activity.created_by = request.user
+            activity.save()
+            
+            messages.success(request, f'Actividad "{activity.title}" creada exitosamente.')
+            return redirect('my_activities_dashboard')
+    else:
+        form = OpportunityActivityStandaloneForm(current_user=request.user)
+        
+        # Si se proporciona una fecha en los parámetros, establecerla como fecha programada
+        date_param = request.GET.get('date')
+        if date_param:
+            try:
+                from datetime import datetime
+                # Convertir fecha del calendario (YYYY-MM-DD) a datetime con hora por defecto
+                date_obj = datetime.strptime(date_param, '%Y-%m-%d')
+                # Establecer hora por defecto a las 9:00 AM
+                default_datetime = date_obj.replace(hour=9, minute=0)
+                form.fields['scheduled_date'].initial = default_datetime.strftime('%Y-%m-%dT%H:%M')
+            except ValueError:
+                pass  # Si la fecha no es válida, usar el valor por defecto
+    
+    context = {
+        'form': form,
+        'page_title': 'Nueva Actividad'
+    }
+    
+    return render(request, 'tickets/activity_standalone_form.html', context)
+
+
+@login_required
+def activity_create_from_contact(request, contact_id):
+    """Crear nueva actividad desde un contacto específico"""
+    from .models import OpportunityActivity, Contact
+    from .forms import OpportunityActivityStandaloneForm
+    
+    contact = get_object_or_404(Contact, pk=contact_id)
+    
+    if request.method == 'POST':
+        form = OpportunityActivityStandaloneForm(request.POST, current_user=request.user)
+        if form.is_valid():
+            activity = form.save(commit=False)
+            activity.created_by = request.user
+            activity.contact = contact  # Asociar automáticamente el contacto
+            activity.save()
+            
+            messages.success(request, f'Actividad "{activity.title}" creada exitosamente para {contact.name}.')
+            return redirect('contact_detail', pk=contact.pk)
+    else:
+        form = OpportunityActivityStandaloneForm(current_user=request.user)
+        # Pre-seleccionar el contacto y deshabilitar el campo
+        form.fields['contact'].initial = contact
+        form.fields['contact'].queryset = Contact.objects.filter(pk=contact.pk)
+        form.fields['contact'].widget.attrs['disabled'] = True
+    
+    context = {
+        'form': form,
+        'contact': contact,
+        'page_title': f'Nueva Actividad para {contact.name}'
+    }
+    
+    return render(request, 'tickets/activity_from_contact_form.html', context)
+
+
+@login_required
+def api_user_activities_pending(request):
+    """API para obtener actividades pendientes del usuario actual"""
+    from .models import OpportunityActivity
+    from django.http import JsonResponse
+    from django.utils import timezone
+    
+    # Obtener actividades pendientes del usuario
+    pending_activities = OpportunityActivity.objects.filter(
+        assigned_to=request.user,
+        status__in=['pending', 'in_progress']
+    ).order_by('scheduled_date')[:10]  # Limitamos a 10 para no sobrecargar
+    
+    # Convertir a formato JSON
+    activities_data = []
+    for activity in pending_activities:
+        is_overdue = activity.scheduled_date < timezone.now()
+        activities_data.append({
+            'id': activity.id,
+            'title': activity.title,
+            'opportunity_name': activity.opportunity.name if activity.opportunity else None,
+            'contact_name': activity.contact.name if activity.contact else None,
+            'scheduled_date': activity.scheduled_date.strftime('%d/%m/%Y %H:%M'),
+            'due_date_str': activity.scheduled_date.strftime('%d/%m/%Y %H:%M'),
+            'priority': activity.get_priority_display(),
+            'priority_color': activity.get_priority_color(),
+            'is_overdue': is_overdue,
+            'detail_url': f"/crm/activities/{activity.id}/",
+            'edit_url': f"/crm/activities/{activity.id}/edit/",
+        })
+    
+    return JsonResponse({
+        'activities': activities_data,
+        'total_pending': pending_activities.count()
+    })
+
+
+@login_required
+def api_activities_calendar(request):
+    """API para obtener actividades para el calendario"""
+    from .models import OpportunityActivity
+    from django.http import JsonResponse
+    from django.utils import timezone
+    from datetime import datetime, timedelta
+    
+    # Obtener parámetros de fecha (opcional)
+    start_param = request.GET.get('start')
+    end_param = request.GET.get('end')
+    
+    # Si no se proporcionan fechas, usar un rango de 3 meses
+    if not start_param or not end_param:
+        now = timezone.now()
+        start_date = now.replace(day=1) - timedelta(days=30)  # Mes anterior
+        end_date = start_date + timedelta(days=120)  # 4 meses
+    else:
+        try:
+            start_date = datetime.fromisoformat(start_param.replace('Z', '+00:00'))
+            end_date = datetime.fromisoformat(end_param.replace('Z', '+00:00'))
+        except ValueError:
+            start_date = timezone.now() - timedelta(days=30)
+            end_date = timezone.now() + timedelta(days=90)
+    
+    # Obtener actividades del usuario en el rango de fechas
+    activities = OpportunityActivity.objects.filter(
+        assigned_to=request.user,
+        scheduled_date__range=[start_date, end_date]
+    ).select_related('opportunity', 'contact').order_by('scheduled_date')
+    
+    # Convertir a formato FullCalendar
+    events = []
+    for activity in activities:
+        # Determinar color según estado y prioridad
+        color = '#6c757d'  # Default gris
+        if activity.status == 'pending':
+            color = '#ffc107'  # Amarillo
+        elif activity.status == 'in_progress':
+            color = '#17a2b8'  # Azul
+        elif activity.status == 'completed':
+            color = '#28a745'  # Verde
+        elif activity.status == 'cancelled':
+            color = '#6c757d'  # Gris
+        elif activity.status == 'overdue':
+            color = '#dc3545'  # Rojo
+            
+        # Ajustar color por prioridad
+        if activity.priority == 'urgent':
+            color = '#dc3545'  # Rojo urgente
+        elif activity.priority == 'high' and activity.status == 'pending':
+            color = '#fd7e14'  # Naranja para alta prioridad
+        
+        # Crear título descriptivo
+        title_parts = [activity.title]
+        if activity.contact:
+            title_parts.append(f"({activity.contact.name})")
+        elif activity.opportunity:
+            title_parts.append(f"({activity.opportunity.name})")
+            
+        event = {
+            'id': activity.id,
+            'title': ' '.join(title_parts),
+            'start': activity.scheduled_date.isoformat(),
+            'color': color,
+            'url': f"/crm/activities/{activity.id}/",
+            'extendedProps': {
+                'status': activity.status,
+                'priority': activity.priority,
+                'activity_type': activity.activity_type,
+                'contact_name': activity.contact.name if activity.contact else None,
+                'opportunity_name': activity.opportunity.name if activity.opportunity else None,
+                'description': activity.description,
+                'location': activity.location,
+                'duration_minutes': activity.duration_minutes,
+            }
+        }
+        
+        # Si tiene duración, establecer hora de fin
+        if activity.duration_minutes:
+            end_time = activity.scheduled_date + timedelta(minutes=activity.duration_minutes)
+            event['end'] = end_time.isoformat()
+        
+        events.append(event)
+    
+    return JsonResponse(events, safe=False)
+
+
+def create_bulk_activities_with_ai(contact, user_prompt, user):
+    """Helper para crear múltiples actividades usando IA"""
+    from .models import OpportunityActivity, SystemConfiguration
+    from django.http import JsonResponse
+    from django.utils import timezone
+    from datetime import timedelta
+    import json as json_module
+    import openai
+    
+    try:
+        config = SystemConfiguration.objects.first()
+        if not config or not config.openai_api_key:
+            return JsonResponse({'success': False, 'error': 'No se encontró la clave de API de OpenAI'})
+        
+        client = openai.OpenAI(api_key=config.openai_api_key)
+        
+        # Preparar contexto del contacto
+        contact_info = f"""
+Información del Contacto:
+- Nombre: {contact.name}
+- Empresa: {contact.company or 'No especificada'}
+- Email: {contact.email or 'No especificado'}
+- Teléfono: {contact.phone or 'No especificado'}
+- Cargo: {contact.position or 'No especificado'}
+- País: {contact.country or 'No especificado'}
+- ERP: {contact.erp or 'No especificado'}
+- Estado: {contact.get_status_display()}
+- Fuente: {contact.source or 'No especificada'}
+- Notas: {contact.notes or 'Sin notas'}
+"""
+        
+        system_prompt = """Eres un asistente experto en gestión de relaciones comerciales y ventas. 
+Tu tarea es crear un plan de actividades de seguimiento basado en las instrucciones del usuario.
+
+IMPORTANTE: Debes responder ÚNICAMENTE con un JSON válido con esta estructura exacta:
+{
+    "activities": [
+        {
+            "days": 15,
+            "type": "call",
+            "title": "título de la actividad",
+            "description": "descripción detallada con objetivos específicos",
+            "priority": "high"
+        }
+    ]
+}
+
+Reglas:
+- type puede ser: "call" (llamada) o "meeting" (reunión)
+- priority puede ser: "low", "medium", "high"
+- days debe ser un número entero (días desde hoy)
+- title debe ser conciso y profesional
+- description debe ser detallada, con contexto, objetivos y temas a tratar
+- NO uses formato markdown ni asteriscos en title ni description
+- Responde SOLO el JSON, sin texto adicional"""
+
+        user_message = f"""{contact_info}
+
+Instrucciones del usuario:
+{user_prompt}
+
+Genera las actividades solicitadas en formato JSON."""
+
+        response = client.chat.completions.create(
+            model=config.openai_model or "gpt-4",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=0.7,
+            max_tokens=2000
+        )
+        
+        ai_response = response.choices[0].message.content.strip()
+        
+        # Limpiar respuesta (eliminar markdown code blocks si existen)
+        if ai_response.startswith('```'):
+            lines = ai_response.split('\n')
+            ai_response = '\n'.join(lines[1:-1]) if len(lines) > 2 else ai_response
+        ai_response = ai_response.replace('```json', '').replace('```', '').strip()
+        
+        # Parsear JSON
+        try:
+            ai_data = json_module.loads(ai_response)
+        except json_module.JSONDecodeError as e:
+            return JsonResponse({
+                'success': False, 
+                'error': f'Error al parsear respuesta de IA: {str(e)}',
+                'ai_response': ai_response
+            })
+        
+        activities_data = ai_data.get('activities', [])
+        if not activities_data:
+            return JsonResponse({'success': False, 'error': 'La IA no generó actividades'})
+        
+        # Crear las actividades
+        created_activities = []
+        for activity_data in activities_data:
+            days = activity_data.get('days', 7)
+            activity_type = activity_data.get('type', 'call')
+            title = activity_data.get('title', f'Actividad - {contact.name}')
+            description = activity_data.get('description', '')
+            priority = activity_data.get('priority', 'medium')
+            
+            # Calcular fecha
+            scheduled_date = timezone.now() + timedelta(days=int(days))
+            
+            # Ajustar hora según tipo
+            if activity_type == 'call':
+                scheduled_date = scheduled_date.replace(hour=10, minute=0, second=0, microsecond=0)
+                duration_minutes = 30
+            else:  # meeting
+                scheduled_date = scheduled_date.replace(hour=14, minute=0, second=0, microsecond=0)
+                duration_minutes = 60
+            
+            # Crear actividad
+            activity = OpportunityActivity.objects.create(
+                title=title,
+                description=description,
+                activity_type=activity_type,
+                scheduled_date=scheduled_date,
+                priority=priority,
+                duration_minutes=duration_minutes,
+                status='pending',
+                contact=contact,
+                opportunity=None,
+                assigned_to=user,
+                created_by=user
+            )
+            
+            created_activities.append({
+                'id': activity.id,
+                'title': title,
+                'date': scheduled_date.strftime('%d/%m/%Y'),
+                'type': activity_type
+            })
+        
+        # Preparar mensaje de resumen
+        summary_lines = [f"✓ {act['title']} ({act['type']}) - {act['date']}" for act in created_activities]
+        summary = '\n'.join(summary_lines)
+        
+        return JsonResponse({
+            'success': True,
+            'activities_created': len(created_activities),
+            'message': f'Se crearon {len(created_activities)} actividades:\n\n{summary}',
+            'activities': created_activities
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': f'Error al crear actividades: {str(e)}'})
+
+
+@login_required
+@require_POST
+def create_quick_activity(request, contact_id):
+    """Vista AJAX para crear actividades rápidas desde contactos"""
+    from .models import Contact, OpportunityActivity
+    from django.http import JsonResponse
+    from django.utils import timezone
+    from datetime import timedelta
+    import json
+    
+    try:
+        # Obtener el contacto
+        contact = Contact.objects.get(pk=contact_id)
+        
+        # Obtener datos del request
+        data = json.loads(request.body)
+        
+        # Modo bulk: crear múltiples actividades con IA
+        use_ai_bulk = data.get('use_ai_bulk', False)
+        if use_ai_bulk:
+            ai_prompt = data.get('ai_prompt', '')
+            if not ai_prompt:
+                return JsonResponse({'success': False, 'error': 'Prompt de IA requerido'})
+            
+            return create_bulk_activities_with_ai(contact, ai_prompt, request.user)
+        
+        # Modo individual: crear una actividad
+        activity_type = data.get('type')
+        use_ai = data.get('use_ai', False)
+        custom_days = data.get('days')  # Días personalizados desde el modal de IA
+        
+        # Determinar si es para 1 semana o 1 mes
+        is_month = activity_type.endswith('_month')
+        base_type = activity_type.replace('_month', '') if is_month else activity_type
+        
+        if base_type not in ['call', 'meeting']:
+            return JsonResponse({'success': False, 'error': 'Tipo de actividad inválido'})
+        
+        # Calcular días adelante
+        if custom_days:
+            days_ahead = int(custom_days)
+        elif is_month:
+            days_ahead = 30
+        else:
+            days_ahead = 7
+            
+        # Calcular fecha programada
+        scheduled_date = timezone.now() + timedelta(days=days_ahead)
+        
+        # Ajustar hora según el tipo de actividad
+        if base_type == 'call':
+            scheduled_date = scheduled_date.replace(hour=10, minute=0, second=0, microsecond=0)
+            duration_minutes = 30
+            priority = 'medium'
+        else:  # meeting
+            scheduled_date = scheduled_date.replace(hour=14, minute=0, second=0, microsecond=0)
+            duration_minutes = 60
+            priority = 'high'
+        
+        # Generar título y descripción con IA si se solicita
+        if use_ai:
+            try:
+                import openai
+                from .models import SystemConfiguration
+                
+                config = SystemConfiguration.objects.first()
+                if not config or not config.openai_api_key:
+                    raise Exception("No se encontró la clave de API de OpenAI")
+                
+                client = openai.OpenAI(api_key=config.openai_api_key)
+                
+                # Preparar contexto del contacto
+                contact_context = f"""
+Contacto: {contact.name}
+Empresa: {contact.company or 'No especificada'}
+Email: {contact.email or 'No especificado'}
+Teléfono: {contact.phone or 'No especificado'}
+Cargo: {contact.position or 'No especificado'}
+País: {contact.country or 'No especificado'}
+ERP: {contact.erp or 'No especificado'}
+Estado: {contact.get_status_display()}
+Notas: {contact.notes or 'Sin notas'}
+"""
+                
+                activity_type_es = 'llamada' if base_type == 'call' else 'reunión'
+                
+                prompt = f"""Eres un asistente de ventas experto. Debes crear una {activity_type_es} profesional programada para dentro de {days_ahead} días.
+
+{contact_context}
+
+Por favor, genera:
+1. Un título conciso y profesional para la {activity_type_es}
+2. Una descripción detallada que incluya:
+   - Contexto del contacto
+   - Objetivos específicos de la {activity_type_es}
+   - Temas a tratar
+   - Información relevante que el vendedor debe tener en cuenta
+
+IMPORTANTE: Responde SOLO en formato JSON con esta estructura exacta:
+{{
+    "title": "título de la actividad",
+    "description": "descripción detallada"
+}}
+
+NO uses formato markdown ni asteriscos. Escribe en texto plano."""
+
+                response = client.chat.completions.create(
+                    model=config.openai_model or "gpt-4",
+                    messages=[
+                        {"role": "system", "content": "Eres un asistente experto en ventas y gestión de contactos comerciales."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=500
+                )
+                
+                ai_response = response.choices[0].message.content.strip()
+                
+                # Intentar parsear como JSON
+                import json as json_module
+                try:
+                    ai_data = json_module.loads(ai_response)
+                    title = ai_data.get('title', f"{'Llamada' if base_type == 'call' else 'Reunión'} - {contact.name}")
+                    description = ai_data.get('description', f"Actividad generada con IA para {contact.name}")
+                except:
+                    # Si falla el parsing JSON, usar el texto directamente
+                    lines = ai_response.split('\n', 1)
+                    title = lines[0].strip().replace('"', '').replace('title:', '').strip()
+                    description = lines[1].strip() if len(lines) > 1 else ai_response
+                    
+            except Exception as e:
+                print(f"Error al generar con IA: {e}")
+                # Fallback a contenido estándar
+                title = f"{'Llamada' if base_type == 'call' else 'Reunión'} - {contact.name}"
+                description = f"""Actividad programada para dentro de {days_ahead} días.
+
+Contacto: {contact.name}
+Empresa: {contact.company or 'No especificada'}
+
+Objetivos:
+- Revisar estado del contacto
+- Evaluar necesidades actuales
+- Definir próximos pasos"""
+        else:
+            # Contenido estándar sin IA
+            if base_type == 'call':
+                title = f"Llamada de seguimiento - {contact.name}"
+                description = f"""Llamada de seguimiento programada automáticamente.
+
+Contacto: {contact.name}
+Empresa: {contact.company or 'No especificada'}
+Teléfono: {contact.phone or 'No especificado'}
+
+Objetivos:
+- Revisar estado del contacto
+- Evaluar necesidades actuales
+- Definir próximos pasos
+- Mantener relación comercial"""
+            else:  # meeting
+                title = f"Reunión comercial - {contact.name}"
+                description = f"""Reunión comercial programada automáticamente.
+
+Contacto: {contact.name}
+Empresa: {contact.company or 'No especificada'}
+Email: {contact.email or 'No especificado'}
+
+Agenda:
+- Presentación de servicios/productos
+- Análisis de necesidades del cliente
+- Demostración si es necesario
+- Propuesta comercial
+- Definir siguientes pasos"""
+        
+        # Crear la actividad
+        activity = OpportunityActivity.objects.create(
+            title=title,
+            description=description,
+            activity_type=base_type,  # Usar el tipo base sin '_month'
+            scheduled_date=scheduled_date,
+            priority=priority,
+            duration_minutes=duration_minutes,
+            status='pending',
+            contact=contact,
+            opportunity=None,  # No hay oportunidad asociada
+            assigned_to=request.user,
+            created_by=request.user
+        )
+        
+        # Formatear fecha para mostrar al usuario
+        fecha_formateada = scheduled_date.strftime("%d/%m/%Y a las %H:%M")
+        
+        return JsonResponse({
+            'success': True,
+            'message': f'Actividad creada exitosamente para el {fecha_formateada}',
+            'activity_id': activity.id,
+            'activity_url': f'/crm/activities/{activity.id}/',
+            'scheduled_date': fecha_formateada
+        })
+        
+    except Contact.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Contacto no encontrado'})
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'error': 'Datos inválidos'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': f'Error inesperado: {str(e)}'})
+
+
+# ============================
+# VISTAS DE REUNIONES
+# ============================
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def meeting_list_view(request):
+    """Vista para listar reuniones"""
+    from .models import Meeting
+    
+    meetings = Meeting.objects.filter(organizer=request.user)
+    
+    # Filtros
+    status = request.GET.get('status')
+    if status:
+        meetings = meetings.filter(status=status)
+    
+    search = request.GET.get('search')
+    if search:
+        meetings = meetings.filter(
+            models.Q(title__icontains=search) | 
+            models.Q(description__icontains=search)
+        )
+    
+    meetings = meetings.order_by('-date')
+    
+    # Estadísticas
+    stats = {
+        'total': Meeting.objects.filter(organizer=request.user).count(),
+        'scheduled': Meeting.objects.filter(organizer=request.user, status='scheduled').count(),
+        'in_progress': Meeting.objects.filter(organizer=request.user, status='in_progress').count(),
+        'finished': Meeting.objects.filter(organizer=request.user, status='finished').count(),
+    }
+    
+    context = {
+        'page_title': 'Reuniones',
+        'meetings': meetings,
+        'stats': stats,
+        'current_status': status,
+        'search_query': search,
+    }
+    return render(request, 'tickets/meeting_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def meeting_create_view(request):
+    """Vista para crear reuniones"""
+    from .forms import MeetingForm
+    
+    if request.method == 'POST':
+        form = MeetingForm(request.POST, user=request.user)
+        if form.is_valid():
+            meeting = form.save(commit=False)
+            meeting.organizer = request.user
+            meeting.save()
+            messages.success(request, f'Reunión "{meeting.title}" creada exitosamente.')
+            return redirect('meeting_detail', pk=meeting.pk)
+    else:
+        form = MeetingForm(user=request.user)
+    
+    context = {
+        'page_title': 'Nueva Reunión',
+        'form': form,
+    }
+    return render(request, 'tickets/meeting_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def meeting_detail_view(request, pk):
+    """Vista detallada de una reunión"""
+    from .models import Meeting, MeetingAccessLog
+    from django.db.models import Count
+    
+    meeting = get_object_or_404(Meeting, pk=pk, organizer=request.user)
+    
+    # Obtener asistentes y preguntas
+    attendees = meeting.meetingattendee_set.all().order_by('registered_at')
+    questions = meeting.meetingquestion_set.all().order_by('-asked_at')
+    
+    # Obtener logs de acceso
+    access_logs = meeting.access_logs.all().order_by('-accessed_at')[:50]  # Últimos 50 accesos
+    
+    # Estadísticas de acceso
+    access_stats = {
+        'by_country': meeting.access_logs.values('country').annotate(count=Count('id')).order_by('-count')[:10],
+        'by_device': meeting.access_logs.values('device_type').annotate(count=Count('id')).order_by('-count'),
+        'by_browser': meeting.access_logs.values('browser').annotate(count=Count('id')).order_by('-count'),
+        'by_os': meeting.access_logs.values('os').annotate(count=Count('id')).order_by('-count'),
+        'total_accesses': meeting.access_logs.count(),
+    }
+    
+    # Estadísticas
+    stats = {
+        'total_attendees': attendees.count(),
+        'total_questions': questions.count(),
+        'pending_questions': questions.filter(status='pending').count(),
+        'answered_questions': questions.filter(status='answered').count(),
+    }
+    
+    context = {
+        'page_title': f'Reunión: {meeting.title}',
+        'meeting': meeting,
+        'attendees': attendees,
+        'questions': questions,
+        'stats': stats,
+        'access_logs': access_logs,
+        'access_stats': access_stats,
+    }
+    return render(request, 'tickets/meeting_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def meeting_print_view(request, pk):
+    """Vista para imprimir reunión"""
+    from .models import Meeting
+    
+    meeting = get_object_or_404(Meeting, pk=pk, organizer=request.user)
+    
+    # Obtener asistentes y preguntas
+    attendees = meeting.meetingattendee_set.all().order_by('registered_at')
+    questions = meeting.meetingquestion_set.all().order_by('-asked_at')
+    
+    # Estadísticas
+    stats = {
+        'total_attendees': attendees.count(),
+        'total_questions': questions.count(),
+        'pending_questions': questions.filter(status='pending').count(),
+        'answered_questions': questions.filter(status='answered').count(),
+    }
+    
+    context = {
+        'page_title': f'Informe: {meeting.title}',
+        'meeting': meeting,
+        'attendees': attendees,
+        'questions': questions,
+        'stats': stats,
+    }
+    return render(request, 'tickets/meeting_print.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def meeting_edit_view(request, pk):
+    """Vista para editar reuniones"""
+    from .forms import MeetingForm
+    from .models import Meeting
+    
+    meeting = get_object_or_404(Meeting, pk=pk, organizer=request.user)
+    
+    if request.method == 'POST':
+        form = MeetingForm(request.POST, instance=meeting, user=request.user)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Reunión "{meeting.title}" actualizada exitosamente.')
+            return redirect('meeting_detail', pk=meeting.pk)
+    else:
+        form = MeetingForm(instance=meeting, user=request.user)
+    
+    context = {
+        'page_title': f'Editar: {meeting.title}',
+        'form': form,
+        'meeting': meeting,
+    }
+    return render(request, 'tickets/meeting_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+@require_http_methods(["POST"])
+def meeting_add_link_view(request, pk):
+    """Vista para agregar un enlace a una reunión"""
+    from .models import Meeting, MeetingLink
+    
+    meeting = get_object_or_404(Meeting, pk=pk, organizer=request.user)
+    
+    try:
+        data = json.loads(request.body)
+        title = data.get('title', '').strip()
+        url = data.get('url', '').strip()
+        description = data.get('description', '').strip()
+        
+        if not title or not url:
+            return JsonResponse({
+                'success': False,
+                'message': 'El título y la URL son requeridos'
+            })
+        
+        # Crear el enlace
+        link = MeetingLink.objects.create(
+            meeting=meeting,
+            title=title,
+            url=url,
+            description=description
+        )
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Enlace agregado exitosamente',
+            'link': {
+                'id': link.id,
+                'title': link.title,
+                'url': link.url,
+                'description': link.description
+            }
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({
+            'success': False,
+            'message': 'Datos JSON inválidos'
+        }, status=400)
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'message': f'Error al agregar enlace: {str(e)}'
+        }, status=500)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+@require_http_methods(["POST"])
+def meeting_delete_link_view(request, link_id):
+    """Vista para eliminar un enlace de una reunión"""
+    from .models import MeetingLink
+    
+    link = get_object_or_404(MeetingLink, pk=link_id, meeting__organizer=request.user)
+    
+    try:
+        link.delete()
+        return JsonResponse({
+            'success': True,
+            'message': 'Enlace eliminado exitosamente'
+        })
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'message': f'Error al eliminar enlace: {str(e)}'
+        }, status=500)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def meeting_delete_view(request, pk):
+    """Vista para eliminar reuniones"""
+    from .models import Meeting
+    
+    meeting = get_object_or_404(Meeting, pk=pk, organizer=request.user)
+    
+    if request.method == 'POST':
+        meeting_title = meeting.title
+        meeting.delete()
+        messages.success(request, f'Reunión "{meeting_title}" eliminada exitosamente.')
+        return redirect('meeting_list')
+    
+    context = {
+        'page_title': f'Eliminar: {meeting.title}',
+        'meeting': meeting,
+    }
+    return render(request, 'tickets/meeting_delete.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def meeting_questions_view(request, pk):
+    """Vista para gestionar preguntas de una reunión"""
+    from .models import Meeting
+    
+    meeting = get_object_or_404(Meeting, pk=pk, organizer=request.user)
+    questions = meeting.meetingquestion_set.all().order_by('-asked_at')
+    
+    # Filtros
+    status = request.GET.get('status')
+    if status:
+        questions = questions.filter(status=status)
+    
+    context = {
+        'page_title': f'Preguntas: {meeting.title}',
+        'meeting': meeting,
+        'questions': questions,
+        'current_status': status,
+    }
+    return render(request, 'tickets/meeting_questions.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def meeting_attendees_view(request, pk):
+    """Vista para gestionar asistentes de una reunión"""
+    from .models import Meeting
+    
+    meeting = get_object_or_404(Meeting, pk=pk, organizer=request.user)
+    attendees = meeting.meetingattendee_set.all().order_by('registered_at')
+    
+    context = {
+        'page_title': f'Asistentes: {meeting.title}',
+        'meeting': meeting,
+        'attendees': attendees,
+    }
+    return render(request, 'tickets/meeting_attendees.html', context)
+
+
+# ============================
+# VISTAS PÚBLICAS DE REUNIONES
+# ============================
+
+def meeting_public_view(request, token):
+    """Vista pública de una reunión"""
+    from .models import Meeting, MeetingAttendee, MeetingQuestion, MeetingAccessLog
+    from .forms import MeetingAttendeeForm, MeetingQuestionForm
+    from django.db.models import F
+    import requests
+    
+    meeting = get_object_or_404(Meeting, public_token=token, is_active=True)
+    
+    # Incrementar el contador de vistas del enlace público
+    Meeting.objects.filter(id=meeting.id).update(public_views_count=F('public_views_count') + 1)
+    meeting.refresh_from_db()
+    
+    # Registrar estadísticas de acceso
+    try:
+        ip_address = request.META.get('HTTP_X_FORWARDED_FOR', request.META.get('REMOTE_ADDR', ''))
+        if ip_address:
+            ip_address = ip_address.split(',')[0].strip()
+        
+        user_agent = request.META.get('HTTP_USER_AGENT', '')
+        
+        # Detectar tipo de dispositivo
+        device_type = 'desktop'
+        if user_agent:
+            ua_lower = user_agent.lower()
+            if 'mobile' in ua_lower or 'android' in ua_lower or 'iphone' in ua_lower:
+                device_type = 'mobile'
+            elif 'tablet' in ua_lower or 'ipad' in ua_lower:
+                device_type = 'tablet'
+        
+        # Detectar navegador
+        browser = 'Unknown'
+        if 'chrome' in user_agent.lower() and 'edg' not in user_agent.lower():
+            browser = 'Chrome'
+        elif 'firefox' in user_agent.lower():
+            browser = 'Firefox'
+        elif 'safari' in user_agent.lower() and 'chrome' not in user_agent.lower():
+            browser = 'Safari'
+        elif 'edg' in user_agent.lower():
+            browser = 'Edge'
+        elif 'opera' in user_agent.lower() or 'opr' in user_agent.lower():
+            browser = 'Opera'
+        
+        # Detectar sistema operativo
+        os_name = 'Unknown'
+        if 'windows' in user_agent.lower():
+            os_name = 'Windows'
+        elif 'mac' in user_agent.lower():
+            os_name = 'macOS'
+        elif 'linux' in user_agent.lower():
+            os_name = 'Linux'
+        elif 'android' in user_agent.lower():
+            os_name = 'Android'
+        elif 'iphone' in user_agent.lower() or 'ipad' in user_agent.lower():
+            os_name = 'iOS'
+        
+        # Obtener información de geolocalización (país y ciudad)
+        country = ''
+        city = ''
+        try:
+            # Usar servicio gratuito de geolocalización
+            if ip_address and ip_address != '127.0.0.1':
+                geo_response = requests.get(f'http://ip-api.com/json/{ip_address}', timeout=2)
+                if geo_response.status_code == 200:
+                    geo_data = geo_response.json()
+                    if geo_data.get('status') == 'success':
+                        country = geo_data.get('country', '')
+                        city = geo_data.get('city', '')
+        except:
+            pass
+        
+        # Crear registro de acceso
+        MeetingAccessLog.objects.create(
+            meeting=meeting,
+            ip_address=ip_address or '0.0.0.0',
+            user_agent=user_agent,
+            device_type=device_type,
+            browser=browser,
+            os=os_name,
+            country=country,
+            city=city
+        )
+    except Exception as e:
+        print(f"Error registrando acceso: {e}")
+    
+    # Verificar si hay un usuario registrado en la sesión para esta reunión
+    session_key = f'meeting_{meeting.id}_attendee_id'
+    user_attendee = None
+    user_registered = False
+    user_questions = []
+    
+    if session_key in request.session:
+        try:
+            attendee_id = request.session[session_key]
+            user_attendee = MeetingAttendee.objects.get(id=attendee_id, meeting=meeting)
+            user_registered = True
+            user_questions = MeetingQuestion.objects.filter(
+                meeting=meeting, 
+                attendee=user_attendee
+            ).order_by('-asked_at')
+        except MeetingAttendee.DoesNotExist:
+            # Limpiar la sesión si el asistente no existe
+            del request.session[session_key]
+    
+    # Solo mostrar el formulario de registro si no hay nadie registrado en la sesión
+    register_form = None
+    if not user_registered:
+        register_form = MeetingAttendeeForm(meeting=meeting)
+    
+    question_form = MeetingQuestionForm() if meeting.allow_questions and user_registered else None
+    
+    # Verificar si ya evaluó la reunión
+    from .models import MeetingRating
+    user_rating = None
+    if user_registered:
+        try:
+            user_rating = MeetingRating.objects.get(meeting=meeting, attendee=user_attendee)
+        except MeetingRating.DoesNotExist:
+            pass
+    
+    context = {
+        'page_title': f'Reunión: {meeting.title}',
+        'meeting': meeting,
+        'user_registered': user_registered,
+        'user_attendee': user_attendee,
+        'user_questions': user_questions,
+        'user_rating': user_rating,
+        'register_form': register_form,
+        'question_form': question_form,
+    }
+    return render(request, 'tickets/meeting_public.html', context)
+
+
+def meeting_register_view(request, token):
+    """Vista pública para registrarse en una reunión"""
+    from .models import Meeting
+    from .forms import MeetingAttendeeForm
+    
+    meeting = get_object_or_404(Meeting, public_token=token, is_active=True)
+    
+    # Verificar si ya hay un usuario registrado en esta sesión
+    session_key = f'meeting_{meeting.id}_attendee_id'
+    if session_key in request.session:
+        messages.warning(request, 'Ya hay una persona registrada en esta sesión. Solo se permite un registro por sesión.')
+        return redirect('meeting_public', token=token)
+    
+    if request.method == 'POST':
+        form = MeetingAttendeeForm(request.POST, meeting=meeting)
+        if form.is_valid():
+            attendee = form.save(commit=False)
+            attendee.meeting = meeting
+            attendee.ip_address = request.META.get('REMOTE_ADDR')
+            attendee.save()
+            
+            # Guardar el ID del asistente en la sesión
+            request.session[session_key] = attendee.id
+            
+            messages.success(request, '¡Te has registrado exitosamente en la reunión!')
+            return redirect('meeting_public', token=token)
+    else:
+        form = MeetingAttendeeForm(meeting=meeting)
+    
+    context = {
+        'page_title': f'Registrarse: {meeting.title}',
+        'meeting': meeting,
+        'form': form,
+    }
+    return render(request, 'tickets/meeting_register.html', context)
+
+
+def meeting_questions_public_view(request, token):
+    """Vista pública para ver preguntas de una reunión"""
+    from .models import Meeting
+    
+    meeting = get_object_or_404(Meeting, public_token=token, is_active=True)
+    
+    if not meeting.allow_questions:
+        messages.error(request, 'Esta reunión no permite preguntas.')
+        return redirect('meeting_public', token=token)
+    
+    questions = meeting.meetingquestion_set.filter(status__in=['pending', 'answered']).order_by('-asked_at')
+    
+    context = {
+        'page_title': f'Preguntas: {meeting.title}',
+        'meeting': meeting,
+        'questions': questions,
+    }
+    return render(request, 'tickets/meeting_questions_public.html', context)
+
+
+def meeting_ask_question_view(request, token):
+    """Vista pública para hacer una pregunta"""
+    from .models import Meeting, MeetingAttendee
+    from .forms import MeetingQuestionForm
+    
+    meeting = get_object_or_404(Meeting, public_token=token, is_active=True)
+    
+    if not meeting.allow_questions:
+        messages.error(request, 'Esta reunión no permite preguntas.')
+        return redirect('meeting_public', token=token)
+    
+    # Verificar si hay un asistente registrado en la sesión
+    session_key = f'meeting_{meeting.id}_attendee_id'
+    user_attendee = None
+    
+    if session_key in request.session:
+        try:
+            attendee_id = request.session[session_key]
+            user_attendee = MeetingAttendee.objects.get(id=attendee_id, meeting=meeting)
+        except MeetingAttendee.DoesNotExist:
+            pass
+    
+    if request.method == 'POST':
+        form = MeetingQuestionForm(request.POST)
+        if form.is_valid():
+            question = form.save(commit=False)
+            question.meeting = meeting
+            question.attendee = user_attendee  # Asociar con el asistente de la sesión
+            question.ip_address = request.META.get('REMOTE_ADDR')
+            
+            # Si no hay asistente en sesión, usar los datos del formulario
+            if not user_attendee:
+                question.asker_name = question.asker_name or 'Anónimo'
+                question.asker_email = question.asker_email or ''
+            else:
+                question.asker_name = user_attendee.name
+                question.asker_email = user_attendee.email
+            
+            question.save()
+            messages.success(request, '¡Tu pregunta ha sido enviada!')
+            return redirect('meeting_public', token=token)
+    else:
+        form = MeetingQuestionForm()
+    
+    context = {
+        'page_title': f'Hacer Pregunta: {meeting.title}',
+        'meeting': meeting,
+        'form': form,
+    }
+    return render(request, 'tickets/meeting_ask_question.html', context)
+
+
+@require_http_methods(["POST"])
+def meeting_respond_view(request, token):
+    """Vista pública para aceptar o rechazar una reunión"""
+    from .models import Meeting, MeetingAttendee
+    from django.utils import timezone
+    
+    meeting = get_object_or_404(Meeting, public_token=token, is_active=True)
+    
+    # Verificar si hay un asistente registrado en la sesión
+    session_key = f'meeting_{meeting.id}_attendee_id'
+    
+    if session_key not in request.session:
+        messages.error(request, 'Debes registrarte primero para responder a la reunión.')
+        return redirect('meeting_public', token=token)
+    
+    try:
+        attendee_id = request.session[session_key]
+        attendee = MeetingAttendee.objects.get(id=attendee_id, meeting=meeting)
+    except MeetingAttendee.DoesNotExist:
+        messages.error(request, 'No se encontró tu registro.')
+        return redirect('meeting_public', token=token)
+    
+    # Obtener la respuesta del formulario
+    response = request.POST.get('response')
+    
+    if response not in ['accepted', 'declined']:
+        messages.error(request, 'Respuesta inválida.')
+        return redirect('meeting_public', token=token)
+    
+    # Actualizar el estado de respuesta
+    attendee.response_status = response
+    attendee.response_date = timezone.now()
+    attendee.save()
+    
+    if response == 'accepted':
+        messages.success(request, '¡Has aceptado la reunión! Nos vemos allí.')
+    else:
+        messages.info(request, 'Has rechazado la reunión. Gracias por tu respuesta.')
+    
+    return redirect('meeting_public', token=token)
+
+
+@require_http_methods(["POST"])
+def meeting_rate_view(request, token):
+    """Vista pública para evaluar una reunión con caras"""
+    from .models import Meeting, MeetingAttendee, MeetingRating, QARating
+    
+    meeting = get_object_or_404(Meeting, public_token=token, is_active=True)
+    
+    # Verificar si hay un asistente registrado en la sesión
+    session_key = f'meeting_{meeting.id}_attendee_id'
+    
+    if session_key not in request.session:
+        messages.error(request, 'Debes registrarte primero para evaluar la reunión.')
+        return redirect('meeting_public', token=token)
+    
+    try:
+        attendee_id = request.session[session_key]
+        attendee = MeetingAttendee.objects.get(id=attendee_id, meeting=meeting)
+    except MeetingAttendee.DoesNotExist:
+        messages.error(request, 'No se encontró tu registro.')
+        return redirect('meeting_public', token=token)
+    
+    # Obtener la calificación del formulario
+    rating = request.POST.get('rating')
+    comment = request.POST.get('comment', '')
+    
+    if rating not in ['sad', 'neutral', 'happy']:
+        messages.error(request, 'Calificación inválida.')
+        return redirect('meeting_public', token=token)
+    
+    # Crear o actualizar la evaluación de la reunión
+    MeetingRating.objects.update_or_create(
+        meeting=meeting,
+        attendee=attendee,
+        defaults={
+            'rating': rating,
+            'comment': comment,
+            'ip_address': request.META.get('REMOTE_ADDR')
+        }
+    )
+    
+    # También guardar en QARating para el sistema general de evaluaciones
+    opinion_text = comment if comment else f"Evaluación de reunión: {meeting.title}"
+    
+    QARating.objects.create(
+        rating=rating,
+        opinion=opinion_text,
+        name=attendee.name,
+        email=attendee.email,
+        company=meeting.company,  # Asociar con la empresa de la reunión si existe
+        ip_address=request.META.get('REMOTE_ADDR'),
+        user_agent=request.META.get('HTTP_USER_AGENT', ''),
+        is_public=True
+    )
+    
+    messages.success(request, '¡Gracias por tu evaluación!')
+    return redirect('meeting_public', token=token)
+    
+    context = {
+        'page_title': f'Hacer Pregunta: {meeting.title}',
+        'meeting': meeting,
+        'form': form,
+    }
+    return render(request, 'tickets/meeting_ask_question.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def meeting_answer_question_view(request, pk, question_id):
+    """Vista AJAX para responder preguntas"""
+    from .models import Meeting, MeetingQuestion
+    import json
+    
+    meeting = get_object_or_404(Meeting, pk=pk, organizer=request.user)
+    question = get_object_or_404(MeetingQuestion, pk=question_id, meeting=meeting)
+    
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+            answer = data.get('answer', '').strip()
+            
+            if not answer:
+                return JsonResponse({
+                    'success': False,
+                    'error': 'La respuesta no puede estar vacía.'
+                })
+            
+            question.answer = answer
+            question.answered_by = request.user
+            question.answered_at = timezone.now()
+            question.status = 'answered'
+            question.save()
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Pregunta respondida exitosamente.'
+            })
+            
+        except json.JSONDecodeError:
+            return JsonResponse({
+                'success': False,
+                'error': 'Datos JSON inválidos.'
+            })
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'error': f'Error al procesar la respuesta: {str(e)}'
+            })
+    
+    return JsonResponse({'success': False, 'error': 'Método no permitido.'})
+
+
+# ============================
+# VISTAS DE REUNIONES SOPORTE
+# ============================
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def support_meeting_list(request):
+    """Vista para listar reuniones de soporte"""
+    from .models import SupportMeeting
+    
+    meetings_base = SupportMeeting.objects.all()
+    
+    # Filtros
+    company_id = request.GET.get('company')
+    if company_id:
+        meetings_base = meetings_base.filter(company_id=company_id)
+    
+    search = request.GET.get('search')
+    if search:
+        meetings_base = meetings_base.filter(
+            models.Q(company__name__icontains=search) | 
+            models.Q(description__icontains=search) |
+            models.Q(sequence__icontains=search)
+        )
+    
+    meetings_base = meetings_base.order_by('-created_at')
+    
+    # Paginación
+    paginator = Paginator(meetings_base, 20)
+    page_number = request.GET.get('page')
+    meetings = paginator.get_page(page_number)
+    
+    # Estadísticas
+    stats = {
+        'total': SupportMeeting.objects.count(),
+        'this_month': SupportMeeting.objects.filter(created_at__month=timezone.now().month).count(),
+        'companies_count': SupportMeeting.objects.values('company').distinct().count(),
+    }
+    
+    # Lista de empresas para el filtro
+    from .models import Company
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'page_title': 'Reuniones de Soporte',
+        'meetings': meetings,
+        'all_meetings': meetings_base,  # Para el calendario sin paginación
+        'stats': stats,
+        'companies': companies,
+        'current_company': company_id,
+        'search_query': search,
+    }
+    return render(request, 'tickets/support_meeting_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def support_meeting_create(request):
+    """Vista para crear reuniones de soporte"""
+    from .forms import SupportMeetingForm
+    
+    if request.method == 'POST':
+        form = SupportMeetingForm(request.POST)
+        if form.is_valid():
+            meeting = form.save(commit=False)
+            meeting.created_by = request.user
+            meeting.save()
+            messages.success(request, f'Reunión de soporte #{meeting.sequence} creada exitosamente.')
+            return redirect('support_meeting_detail', pk=meeting.pk)
+    else:
+        form = SupportMeetingForm()
+    
+    context = {
+        'page_title': 'Nueva Reunión de Soporte',
+        'form': form,
+    }
+    return render(request, 'tickets/support_meeting_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def support_meeting_detail(request, pk):
+    """Vista detallada de una reunión de soporte"""
+    from .models import SupportMeeting, SupportMeetingPoint
+    from .forms import SupportMeetingPointForm
+    
+    meeting = get_object_or_404(SupportMeeting, pk=pk)
+    points = meeting.support_meeting_points.all().order_by('created_at')
+    
+    # Manejar AJAX para toggle de puntos
+    if request.method == 'POST' and request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        action = request.POST.get('action')
+        if action == 'toggle_point':
+            point_id = request.POST.get('point_id')
+            is_selected = request.POST.get('is_selected') == 'true'
+            
+            try:
+                point = SupportMeetingPoint.objects.get(id=point_id, meeting=meeting)
+                point.is_selected = is_selected
+                point.save()
+                
+                # Obtener conteos actualizados
+                selected_count = meeting.support_meeting_points.filter(is_selected=True).count()
+                
+                return JsonResponse({
+                    'success': True,
+                    'selected_count': selected_count,
+                    'message': 'Punto actualizado exitosamente.'
+                })
+            except SupportMeetingPoint.DoesNotExist:
+                return JsonResponse({
+                    'success': False,
+                    'error': 'Punto no encontrado.'
+                })
+        
+        return JsonResponse({'success': False, 'error': 'Acción no válida.'})
+    
+    # Manejar formulario de puntos (POST normal)
+    if request.method == 'POST':
+        point_form = SupportMeetingPointForm(request.POST)
+        if point_form.is_valid():
+            point = point_form.save(commit=False)
+            point.meeting = meeting
+            point.save()
+            messages.success(request, 'Punto agregado exitosamente.')
+            return redirect('support_meeting_detail', pk=meeting.pk)
+    else:
+        point_form = SupportMeetingPointForm()
+    
+    # Estadísticas
+    stats = {
+        'total_points': points.count(),
+        'selected_points': points.filter(is_selected=True).count(),
+        'unselected_points': points.filter(is_selected=False).count(),
+    }
+    
+    context = {
+        'page_title': f'Reunión #{meeting.sequence} - {meeting.company.name}',
+        'meeting': meeting,
+        'points': points,
+        'point_form': point_form,
+        'stats': stats,
+    }
+    return render(request, 'tickets/support_meeting_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def support_meeting_edit(request, pk):
+    """Vista para editar reuniones de soporte"""
+    from .forms import SupportMeetingForm
+    from .models import SupportMeeting
+    
+    meeting = get_object_or_404(SupportMeeting, pk=pk)
+    
+    if request.method == 'POST':
+        form = SupportMeetingForm(request.POST, instance=meeting)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Reunión #{meeting.sequence} actualizada exitosamente.')
+            return redirect('support_meeting_detail', pk=meeting.pk)
+    else:
+        form = SupportMeetingForm(instance=meeting)
+    
+    context = {
+        'page_title': f'Editar Reunión #{meeting.sequence}',
+        'form': form,
+        'meeting': meeting,
+    }
+    return render(request, 'tickets/support_meeting_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def support_meeting_delete(request, pk):
+    """Vista para eliminar reuniones de soporte"""
+    from .models import SupportMeeting
+    
+    meeting = get_object_or_404(SupportMeeting, pk=pk)
+    
+    if request.method == 'POST':
+        meeting_info = f"#{meeting.sequence} - {meeting.company.name}"
+        meeting.delete()
+        messages.success(request, f'Reunión {meeting_info} eliminada exitosamente.')
+        return redirect('support_meeting_list')
+    
+    context = {
+        'page_title': f'Eliminar Reunión #{meeting.sequence}',
+        'meeting': meeting,
+    }
+    return render(request, 'tickets/support_meeting_delete.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def support_meeting_create_tickets(request, pk):
+    """Vista para crear tickets masivamente desde puntos seleccionados"""
+    from .models import SupportMeeting, Ticket
+    
+    meeting = get_object_or_404(SupportMeeting, pk=pk)
+    
+    if request.method == 'POST':
+        selected_points = meeting.support_meeting_points.filter(is_selected=True)
+        
+        if not selected_points.exists():
+            messages.warning(request, 'No hay puntos seleccionados para crear tickets.')
+            return redirect('support_meeting_detail', pk=meeting.pk)
+        
+        tickets_created = 0
+        for point in selected_points:
+            # Crear ticket desde el punto
+            ticket = Ticket.objects.create(
+                title=f"Punto de reunión #{meeting.sequence}",
+                description=point.description,
+                company=meeting.company,
+                created_by=request.user,
+                priority='medium',
+                status='open'
+            )
+            
+            # Marcar punto como procesado (desseleccionar)
+            point.is_selected = False
+            point.save()
+            
+            tickets_created += 1
+        
+        messages.success(request, f'{tickets_created} tickets creados exitosamente desde los puntos seleccionados.')
+        return redirect('support_meeting_detail', pk=meeting.pk)
+    
+    # Obtener puntos seleccionados para confirmación
+    selected_points = meeting.support_meeting_points.filter(is_selected=True)
+    
+    context = {
+        'page_title': f'Crear Tickets - Reunión #{meeting.sequence}',
+        'meeting': meeting,
+        'selected_points': selected_points,
+    }
+    return render(request, 'tickets/support_meeting_create_tickets.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def support_meeting_generate_public_link(request, pk):
+    """Generar enlace público para una reunión de soporte"""
+    from .models import SupportMeeting, SupportMeetingPublicLink
+    from django.http import JsonResponse
+    
+    meeting = get_object_or_404(SupportMeeting, pk=pk)
+    
+    if request.method == 'POST':
+        # Verificar si ya existe un enlace
+        public_link, created = SupportMeetingPublicLink.objects.get_or_create(
+            meeting=meeting,
+            defaults={
+                'created_by': request.user,
+                'show_company_meetings': request.POST.get('show_company_meetings', 'true') == 'true'
+            }
+        )
+        
+        if not created:
+            # Si ya existe, actualizar configuración
+            public_link.show_company_meetings = request.POST.get('show_company_meetings', 'true') == 'true'
+            public_link.is_active = True
+            public_link.save()
+        
+        # Obtener URL completa
+        public_url = public_link.get_public_url(request)
+        
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({
+                'success': True,
+                'public_url': public_url,
+                'token': public_link.token,
+                'message': 'Enlace público generado exitosamente'
+            })
+        
+        messages.success(request, f'Enlace público generado: {public_url}')
+        return redirect('support_meeting_detail', pk=meeting.pk)
+    
+    context = {
+        'page_title': f'Generar Enlace Público - Reunión #{meeting.sequence}',
+        'meeting': meeting,
+    }
+    return render(request, 'tickets/support_meeting_generate_link.html', context)
+
+
+def support_meeting_public(request, token):
+    """Vista pública de reunión de soporte (sin autenticación)"""
+    from .models import SupportMeetingPublicLink, SupportMeeting
+    from django.utils import timezone
+    
+    # Buscar enlace público activo
+    public_link = get_object_or_404(
+        SupportMeetingPublicLink,
+        token=token,
+        is_active=True
+    )
+    
+    # Registrar acceso
+    public_link.register_access()
+    
+    meeting = public_link.meeting
+    points = meeting.support_meeting_points.all().order_by('created_at')
+    
+    # Obtener otras reuniones de la empresa si está configurado
+    other_meetings = []
+    total_company_meetings = 0
+    
+    if public_link.show_company_meetings:
+        # Contar todas las reuniones de la empresa
+        total_company_meetings = SupportMeeting.objects.filter(
+            company=meeting.company
+        ).exclude(pk=meeting.pk).count()
+        
+        # Buscar reuniones de la misma empresa que tengan enlaces públicos activos
+        other_meetings = list(SupportMeeting.objects.filter(
+            company=meeting.company,
+            public_link__is_active=True
+        ).exclude(pk=meeting.pk).select_related('public_link').order_by('-date')[:10])
+    
+    # Estadísticas de la reunión actual
+    stats = {
+        'total_points': points.count(),
+        'selected_points': points.filter(is_selected=True).count(),
+        'pending_points': points.filter(status='pending').count(),
+        'in_progress_points': points.filter(status='in_progress').count(),
+        'completed_points': points.filter(status='completed').count(),
+        'cancelled_points': points.filter(status='cancelled').count(),
+    }
+    
+    # KPIs empresariales para el cliente
+    from django.utils import timezone
+    from datetime import timedelta
+    from django.db.models import Count, Avg
+    
+    # Período de análisis (últimos 6 meses)
+    six_months_ago = timezone.now() - timedelta(days=180)
+    
+    company_kpis = {}
+    
+    # 1. Estadísticas de reuniones de soporte
+    total_support_meetings = SupportMeeting.objects.filter(company=meeting.company).count()
+    recent_meetings = SupportMeeting.objects.filter(
+        company=meeting.company,
+        created_at__gte=six_months_ago
+    ).count()
+    
+    # 2. Estadísticas de tickets
+    total_tickets = meeting.company.ticket_set.count() if hasattr(meeting.company, 'ticket_set') else 0
+    recent_tickets = meeting.company.ticket_set.filter(
+        created_at__gte=six_months_ago
+    ).count() if hasattr(meeting.company, 'ticket_set') else 0
+    
+    resolved_tickets = meeting.company.ticket_set.filter(
+        status='closed',
+        created_at__gte=six_months_ago
+    ).count() if hasattr(meeting.company, 'ticket_set') else 0
+    
+    # 3. Estadísticas de proyectos
+    total_projects = meeting.company.project_set.count() if hasattr(meeting.company, 'project_set') else 0
+    active_projects = meeting.company.project_set.filter(
+        created_at__gte=six_months_ago
+    ).count() if hasattr(meeting.company, 'project_set') else 0
+    
+    # 4. Estadísticas de órdenes de trabajo
+    total_workorders = meeting.company.workorder_set.count() if hasattr(meeting.company, 'workorder_set') else 0
+    recent_workorders = meeting.company.workorder_set.filter(
+        created_at__gte=six_months_ago
+    ).count() if hasattr(meeting.company, 'workorder_set') else 0
+    
+    # Calcular KPIs
+    company_kpis = {
+        'support_meetings': {
+            'total': total_support_meetings,
+            'recent': recent_meetings,
+            'growth': recent_meetings,
+        },
+        'tickets': {
+            'total': total_tickets,
+            'recent': recent_tickets,
+            'resolved': resolved_tickets,
+            'resolution_rate': round((resolved_tickets / recent_tickets * 100) if recent_tickets > 0 else 0, 1),
+        },
+        'projects': {
+            'total': total_projects,
+            'active': active_projects,
+        },
+        'workorders': {
+            'total': total_workorders,
+            'recent': recent_workorders,
+        },
+        'engagement': {
+            'meetings_frequency': round(recent_meetings / 6, 1) if recent_meetings > 0 else 0,  # promedio mensual
+            'activity_score': min(100, round((recent_tickets + recent_meetings + recent_workorders) / 3, 0)),
+        }
+    }
+    
+    context = {
+        'page_title': f'Reunión #{meeting.sequence} - {meeting.company.name}',
+        'meeting': meeting,
+        'points': points,
+        'stats': stats,
+        'company_kpis': company_kpis,
+        'other_meetings': other_meetings,
+        'total_company_meetings': total_company_meetings,
+        'public_link': public_link,
+        'company': meeting.company,
+    }
+    return render(request, 'tickets/support_meeting_public.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def support_meeting_disable_public_link(request, pk):
+    """Deshabilitar enlace público de una reunión"""
+    from .models import SupportMeeting, SupportMeetingPublicLink
+    from django.http import JsonResponse
+    
+    meeting = get_object_or_404(SupportMeeting, pk=pk)
+    
+    try:
+        public_link = meeting.public_link
+        public_link.is_active = False
+        public_link.save()
+        
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({
+                'success': True,
+                'message': 'Enlace público deshabilitado exitosamente'
+            })
+        
+        messages.success(request, 'Enlace público deshabilitado exitosamente.')
+    except SupportMeetingPublicLink.DoesNotExist:
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({
+                'success': False,
+                'error': 'No existe enlace público para esta reunión'
+            })
+        
+        messages.error(request, 'No existe enlace público para esta reunión.')
+    
+    return redirect('support_meeting_detail', pk=meeting.pk)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def support_meeting_point_edit(request, meeting_pk, point_pk):
+    """Vista para editar un punto de reunión de soporte"""
+    from .models import SupportMeeting, SupportMeetingPoint
+    from .forms import SupportMeetingPointForm
+    from django.http import JsonResponse
+    
+    meeting = get_object_or_404(SupportMeeting, pk=meeting_pk)
+    point = get_object_or_404(SupportMeetingPoint, pk=point_pk, meeting=meeting)
+    
+    if request.method == 'POST':
+        # Si es una petición AJAX
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            form = SupportMeetingPointForm(request.POST, instance=point)
+            if form.is_valid():
+                form.save()
+                return JsonResponse({
+                    'success': True,
+                    'message': 'Punto actualizado exitosamente.',
+                    'description': point.description,
+                    'is_selected': point.is_selected
+                })
+            else:
+                return JsonResponse({
+                    'success': False,
+                    'errors': form.errors
+                })
+        else:
+            # POST normal
+            form = SupportMeetingPointForm(request.POST, instance=point)
+            if form.is_valid():
+                form.save()
+                messages.success(request, 'Punto actualizado exitosamente.')
+                return redirect('support_meeting_detail', pk=meeting.pk)
+    else:
+        form = SupportMeetingPointForm(instance=point)
+    
+    context = {
+        'page_title': f'Editar Punto - Reunión #{meeting.sequence}',
+        'meeting': meeting,
+        'point': point,
+        'form': form,
+    }
+    return render(request, 'tickets/support_meeting_point_edit.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def support_meeting_point_delete(request, meeting_pk, point_pk):
+    """Vista para eliminar un punto de reunión de soporte"""
+    from .models import SupportMeeting, SupportMeetingPoint
+    from django.http import JsonResponse
+    
+    meeting = get_object_or_404(SupportMeeting, pk=meeting_pk)
+    point = get_object_or_404(SupportMeetingPoint, pk=point_pk, meeting=meeting)
+    
+    if request.method == 'POST':
+        # Si es una petición AJAX
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            point_description = point.description[:50] + "..." if len(point.description) > 50 else point.description
+            point.delete()
+            
+            # Obtener conteos actualizados
+            selected_count = meeting.support_meeting_points.filter(is_selected=True).count()
+            total_count = meeting.support_meeting_points.count()
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Punto "{point_description}" eliminado exitosamente.',
+                'selected_count': selected_count,
+                'total_count': total_count
+            })
+        else:
+            # POST normal
+            point_info = point.description[:100] + "..." if len(point.description) > 100 else point.description
+            point.delete()
+            messages.success(request, f'Punto "{point_info}" eliminado exitosamente.')
+            return redirect('support_meeting_detail', pk=meeting.pk)
+    
+    context = {
+        'page_title': f'Eliminar Punto - Reunión #{meeting.sequence}',
+        'meeting': meeting,
+        'point': point,
+    }
+    return render(request, 'tickets/support_meeting_point_delete.html', context)
+
+@login_required
+# ==================== VISTAS DE SOLICITUDES AL CLIENTE ====================
+
+@login_required
+def client_request_list(request):
+    """Lista todas las solicitudes al cliente con filtros y estadísticas"""
+    from .models import ClientRequest, Company
+    from . import utils
+    from django.db.models import Count, Q
+    import openpyxl
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from django.http import HttpResponse
+    from datetime import datetime
+    
+    # Si es agente o superusuario, ve todas las solicitudes
+    is_agent = request.user.is_superuser or utils.is_agent(request.user)
+    
+    if is_agent:
+        requests = ClientRequest.objects.all().select_related('created_by', 'company')
+    else:
+        # Si no es agente, solo ve las de su empresa
+        try:
+            user_profile = request.user.userprofile
+            if user_profile.company:
+                requests = ClientRequest.objects.filter(company=user_profile.company).select_related('created_by', 'company')
+            else:
+                requests = ClientRequest.objects.none()
+        except:
+            requests = ClientRequest.objects.none()
+    
+    # Aplicar filtros
+    status_filter = request.GET.get('status', '')
+    company_filter = request.GET.get('company', '')
+    search = request.GET.get('search', '')
+    date_from = request.GET.get('date_from', '')
+    date_to = request.GET.get('date_to', '')
+    
+    if status_filter:
+        requests = requests.filter(status=status_filter)
+    
+    if company_filter:
+        requests = requests.filter(company_id=company_filter)
+    
+    if search:
+        requests = requests.filter(
+            Q(sequence__icontains=search) |
+            Q(title__icontains=search) |
+            Q(requested_to__icontains=search) |
+            Q(description__icontains=search)
+        )
+    
+    if date_from:
+        requests = requests.filter(created_at__gte=date_from)
+    
+    if date_to:
+        requests = requests.filter(created_at__lte=date_to + ' 23:59:59')
+    
+    # Ordenar
+    requests = requests.order_by('-created_at')
+    
+    # Calcular estadísticas
+    total_requests = requests.count()
+    pending_requests = requests.filter(status='pending').count()
+    in_progress_requests = requests.filter(status='in_progress').count()
+    completed_requests = requests.filter(status='completed').count()
+    cancelled_requests = requests.filter(status='cancelled').count()
+    
+    # Solicitudes con respuesta
+    requests_with_response = sum(1 for r in requests if hasattr(r, 'response'))
+    requests_without_response = total_requests - requests_with_response
+    
+    # Exportar a Excel
+    if request.GET.get('export') == 'excel':
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = 'Solicitudes'
+        
+        # Estilos
+        header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
+        header_font = Font(bold=True, color='FFFFFF')
+        
+        # Encabezados
+        headers = ['Secuencia', 'Título', 'Solicitado a', 'Empresa', 'Estado', 'Respondida', 'Creado por', 'Fecha']
+        for col_num, header in enumerate(headers, 1):
+            cell = sheet.cell(row=1, column=col_num)
+            cell.value = header
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = Alignment(horizontal='center', vertical='center')
+        
+        # Datos
+        for row_num, req in enumerate(requests, 2):
+            sheet.cell(row=row_num, column=1).value = req.sequence
+            sheet.cell(row=row_num, column=2).value = req.title
+            sheet.cell(row=row_num, column=3).value = req.requested_to
+            sheet.cell(row=row_num, column=4).value = req.company.name if req.company else '-'
+            sheet.cell(row=row_num, column=5).value = req.get_status_display()
+            sheet.cell(row=row_num, column=6).value = 'Sí' if hasattr(req, 'response') else 'No'
+            sheet.cell(row=row_num, column=7).value = req.created_by.get_full_name() or req.created_by.username
+            sheet.cell(row=row_num, column=8).value = req.created_at.strftime('%d/%m/%Y %H:%M')
+        
+        # Ajustar ancho de columnas
+        for col in sheet.columns:
+            max_length = 0
+            column = col[0].column_letter
+            for cell in col:
+                try:
+                    if len(str(cell.value)) > max_length:
+                        max_length = len(cell.value)
+                except:
+                    pass
+            adjusted_width = (max_length + 2)
+            sheet.column_dimensions[column].width = adjusted_width
+        
+        # Crear respuesta HTTP
+        response = HttpResponse(
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
+        response['Content-Disposition'] = f'attachment; filename=solicitudes_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
+        workbook.save(response)
+        return response
+    
+    # Obtener empresas para el filtro
+    if is_agent:
+        companies = Company.objects.filter(clientrequest__isnull=False).distinct().order_by('name')
+    else:
+        try:
+            user_profile = request.user.userprofile
+            companies = Company.objects.filter(id=user_profile.company_id) if user_profile.company else Company.objects.none()
+        except:
+            companies = Company.objects.none()
+    
+    context = {
+        'requests': requests,
+        'page_title': 'Solicitudes al Cliente',
+        'is_agent': is_agent,
+        # Estadísticas
+        'total_requests': total_requests,
+        'pending_requests': pending_requests,
+        'in_progress_requests': in_progress_requests,
+        'completed_requests': completed_requests,
+        'cancelled_requests': cancelled_requests,
+        'requests_with_response': requests_with_response,
+        'requests_without_response': requests_without_response,
+        # Filtros
+        'status_filter': status_filter,
+        'company_filter': company_filter,
+        'search': search,
+        'date_from': date_from,
+        'date_to': date_to,
+        'companies': companies,
+        'status_choices': [
+            ('pending', 'Pendiente'),
+            ('in_progress', 'En Progreso'),
+            ('completed', 'Completada'),
+            ('cancelled', 'Cancelada')
+        ]
+    }
+    
+    return render(request, 'tickets/client_request_list.html', context)
+
+
+@login_required
+def client_request_create(request):
+    """Crear nueva solicitud al cliente"""
+    from .models import ClientRequest
+    from .forms import ClientRequestForm
+    from . import utils
+    
+    if request.method == 'POST':
+        form = ClientRequestForm(request.POST, request.FILES)
+        if form.is_valid():
+            client_request = form.save(commit=False)
+            client_request.created_by = request.user
+            
+            # Si no es agente y no tiene empresa asignada, asignar la del usuario
+            if not client_request.company and not (request.user.is_superuser or utils.is_agent(request.user)):
+                try:
+                    user_profile = request.user.userprofile
+                    if user_profile.company:
+                        client_request.company = user_profile.company
+                except:
+                    pass
+            
+            client_request.save()
+            messages.success(request, f'Solicitud "{client_request.sequence}" creada exitosamente.')
+            return redirect('client_request_detail', pk=client_request.pk)
+    else:
+        form = ClientRequestForm()
+        
+        # Si no es agente, prellenar con su empresa
+        if not (request.user.is_superuser or utils.is_agent(request.user)):
+            try:
+                user_profile = request.user.userprofile
+                if user_profile.company:
+                    form.initial['company'] = user_profile.company
+            except:
+                pass
+    
+    context = {
+        'form': form,
+        'page_title': 'Nueva Solicitud al Cliente'
+    }
+    
+    return render(request, 'tickets/client_request_form.html', context)
+
+
+@login_required
+def client_request_detail(request, pk):
+    """Detalle de una solicitud al cliente"""
+    from .models import ClientRequest, ClientRequestResponse
+    from .forms import ClientRequestResponseForm
+    from . import utils
+    
+    client_request = get_object_or_404(ClientRequest, pk=pk)
+    
+    # Verificar permisos
+    is_agent = request.user.is_superuser or utils.is_agent(request.user)
+    
+    if not is_agent:
+        # Si no es agente, verificar que sea de su empresa
+        try:
+            user_profile = request.user.userprofile
+            if not user_profile.company or client_request.company != user_profile.company:
+                messages.error(request, 'No tienes permisos para ver esta solicitud.')
+                return redirect('client_request_list')
+        except:
+            messages.error(request, 'No tienes permisos para ver esta solicitud.')
+            return redirect('client_request_list')
+    
+    # Verificar si ya hay respuesta
+    has_response = hasattr(client_request, 'response')
+    
+    # Formulario para responder (solo si no hay respuesta)
+    response_form = None
+    if not has_response and request.method == 'POST':
+        response_form = ClientRequestResponseForm(request.POST, request.FILES)
+        if response_form.is_valid():
+            response = response_form.save(commit=False)
+            response.request = client_request
+            response.responded_by = request.user
+            response.save()
+            
+            # Actualizar estado de la solicitud
+            client_request.status = 'completed'
+            client_request.save()
+            
+            messages.success(request, 'Respuesta enviada exitosamente.')
+            return redirect('client_request_detail', pk=client_request.pk)
+    elif not has_response:
+        response_form = ClientRequestResponseForm()
+    
+    context = {
+        'client_request': client_request,
+        'has_response': has_response,
+        'response_form': response_form,
+        'is_agent': is_agent,
+        'page_title': f'Solicitud {client_request.sequence}'
+    }
+    
+    return render(request, 'tickets/client_request_detail.html', context)
+
+
+@login_required
+def client_request_edit(request, pk):
+    """Editar solicitud al cliente"""
+    from .models import ClientRequest
+    from .forms import ClientRequestForm
+    
+    client_request = get_object_or_404(ClientRequest, pk=pk)
+    
+    # Solo el creador puede editar
+    if client_request.created_by != request.user:
+        messages.error(request, 'No tienes permisos para editar esta solicitud.')
+        return redirect('client_request_detail', pk=client_request.pk)
+    
+    # No se puede editar si ya tiene respuesta
+    if hasattr(client_request, 'response'):
+        messages.error(request, 'No puedes editar una solicitud que ya tiene respuesta.')
+        return redirect('client_request_detail', pk=client_request.pk)
+    
+    if request.method == 'POST':
+        form = ClientRequestForm(request.POST, instance=client_request)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Solicitud actualizada exitosamente.')
+            return redirect('client_request_detail', pk=client_request.pk)
+    else:
+        form = ClientRequestForm(instance=client_request)
+    
+    context = {
+        'form': form,
+        'client_request': client_request,
+        'page_title': f'Editar {client_request.sequence}'
+    }
+    
+    return render(request, 'tickets/client_request_form.html', context)
+
+
+@login_required
+def client_request_delete(request, pk):
+    """Eliminar solicitud al cliente"""
+    from .models import ClientRequest
+    
+    client_request = get_object_or_404(ClientRequest, pk=pk)
+    
+    # Solo el creador puede eliminar
+    if client_request.created_by != request.user:
+        messages.error(request, 'No tienes permisos para eliminar esta solicitud.')
+        return redirect('client_request_detail', pk=client_request.pk)
+    
+    # No se puede eliminar si ya tiene respuesta
+    if hasattr(client_request, 'response'):
+        messages.error(request, 'No puedes eliminar una solicitud que ya tiene respuesta.')
+        return redirect('client_request_detail', pk=client_request.pk)
+    
+    if request.method == 'POST':
+        sequence = client_request.sequence
+        client_request.delete()
+        messages.success(request, f'Solicitud {sequence} eliminada exitosamente.')
+        return redirect('client_request_list')
+    
+    context = {
+        'client_request': client_request,
+        'page_title': f'Eliminar {client_request.sequence}'
+    }
+    
+    return render(request, 'tickets/client_request_delete.html', context)
+
+
+@login_required
+def client_request_pdf(request, pk):
+    """Genera un PDF con el detalle de la solicitud"""
+    from .models import ClientRequest
+    from django.http import HttpResponse
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+    from io import BytesIO
+    from . import utils
+    
+    client_request = get_object_or_404(ClientRequest, pk=pk)
+    
+    # Verificar permisos
+    is_agent = request.user.is_superuser or utils.is_agent(request.user)
+    
+    if not is_agent:
+        # Si no es agente, verificar que sea de su empresa
+        try:
+            user_profile = request.user.userprofile
+            if not user_profile.company or client_request.company != user_profile.company:
+                messages.error(request, 'No tienes permisos para ver esta solicitud.')
+                return redirect('client_request_list')
+        except:
+            messages.error(request, 'No tienes permisos para ver esta solicitud.')
+            return redirect('client_request_list')
+    
+    # Crear el PDF
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    
+    # Estilos
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#2c3e50'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor('#34495e'),
+        spaceAfter=12,
+        spaceBefore=12
+    )
+    
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6
+    )
+    
+    label_style = ParagraphStyle(
+        'Label',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=colors.HexColor('#7f8c8d'),
+        spaceAfter=3
+    )
+    
+    # Construir el contenido
+    story = []
+    
+    # Título
+    story.append(Paragraph(f"Solicitud al Cliente", title_style))
+    story.append(Paragraph(f"{client_request.sequence}", heading_style))
+    story.append(Spacer(1, 0.3*inch))
+    
+    # Información básica en tabla
+    status_map = {
+        'pending': 'Pendiente',
+        'in_progress': 'En Progreso',
+        'completed': 'Completada',
+        'cancelled': 'Cancelada'
+    }
+    
+    info_data = [
+        ['Secuencia:', client_request.sequence],
+        ['Estado:', status_map.get(client_request.status, client_request.status)],
+        ['Empresa:', client_request.company.name if client_request.company else '-'],
+        ['Solicitado a:', client_request.requested_to],
+        ['Creado por:', client_request.created_by.get_full_name() or client_request.created_by.username],
+        ['Fecha de creación:', client_request.created_at.strftime('%d/%m/%Y %H:%M')],
+    ]
+    
+    if client_request.updated_at != client_request.created_at:
+        info_data.append(['Última actualización:', client_request.updated_at.strftime('%d/%m/%Y %H:%M')])
+    
+    info_table = Table(info_data, colWidths=[2*inch, 4*inch])
+    info_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ecf0f1')),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#2c3e50')),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 10),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ]))
+    
+    story.append(info_table)
+    story.append(Spacer(1, 0.3*inch))
+    
+    # Título de la solicitud
+    story.append(Paragraph("Título", heading_style))
+    story.append(Paragraph(client_request.title, normal_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    # Descripción
+    story.append(Paragraph("Descripción", heading_style))
+    description_text = client_request.description.replace('\n', '<br/>')
+    story.append(Paragraph(description_text, normal_style))
+    story.append(Spacer(1, 0.3*inch))
+    
+    # Respuesta si existe
+    if hasattr(client_request, 'response'):
+        story.append(Paragraph("Respuesta del Cliente", heading_style))
+        
+        response_text = client_request.response.response_text.replace('\n', '<br/>')
+        story.append(Paragraph(response_text, normal_style))
+        story.append(Spacer(1, 0.2*inch))
+        
+        if client_request.response.attachment:
+            story.append(Paragraph(f"<b>Archivo adjunto:</b> {client_request.response.attachment.name}", normal_style))
+            story.append(Spacer(1, 0.1*inch))
+        
+        responded_by = 'Cliente' if not client_request.response.responded_by else (
+            client_request.response.responded_by.get_full_name() or 
+            client_request.response.responded_by.username
+        )
+        
+        story.append(Paragraph(
+            f"<i>Respondido por {responded_by} el {client_request.response.responded_at.strftime('%d/%m/%Y %H:%M')}</i>",
+            label_style
+        ))
+    else:
+        story.append(Paragraph("Respuesta del Cliente", heading_style))
+        story.append(Paragraph("<i>Pendiente de respuesta</i>", label_style))
+    
+    # Construir PDF
+    doc.build(story)
+    
+    # Preparar respuesta
+    buffer.seek(0)
+    response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
+    response['Content-Disposition'] = f'attachment; filename="Solicitud_{client_request.sequence}.pdf"'
+    
+    return response
+
+
+# ==================== VISTAS PÚBLICAS DE SOLICITUDES AL CLIENTE ====================
+
+def public_client_requests(request, token):
+    """Vista pública para que los clientes vean y respondan sus solicitudes"""
+    from .models import Company, ClientRequest, ClientRequestResponse
+    from .forms import ClientRequestResponseForm
+    
+    # Buscar la empresa por token
+    company = get_object_or_404(Company, client_requests_token=token)
+    
+    # Obtener todas las solicitudes de esta empresa
+    all_requests = ClientRequest.objects.filter(company=company).order_by('-created_at')
+    
+    # Verificar si se debe mostrar todas o solo pendientes
+    show_all = request.GET.get('show_all', 'false') == 'true'
+    
+    if show_all:
+        requests = all_requests
+    else:
+        # Mostrar solo pendientes y en progreso por defecto
+        requests = all_requests.filter(status__in=['pending', 'in_progress'])
+    
+    # Calcular estadísticas (siempre sobre todas las solicitudes)
+    total_requests = all_requests.count()
+    pending_requests = all_requests.filter(status='pending').count()
+    completed_requests = all_requests.filter(status='completed').count()
+    in_progress_requests = all_requests.filter(status='in_progress').count()
+    
+    context = {
+        'company': company,
+        'requests': requests,
+        'total_requests': total_requests,
+        'pending_requests': pending_requests,
+        'completed_requests': completed_requests,
+        'in_progress_requests': in_progress_requests,
+        'token': token,
+        'show_all': show_all,
+        'page_title': f'Solicitudes - {company.name}'
+    }
+    
+    return render(request, 'tickets/public_client_requests.html', context)
+
+
+def public_client_request_detail(request, token, pk):
+    """Vista pública para ver detalle y responder una solicitud"""
+    from .models import Company, ClientRequest, ClientRequestResponse
+    from .forms import ClientRequestResponseForm
+    
+    # Buscar la empresa por token
+    company = get_object_or_404(Company, client_requests_token=token)
+    
+    # Buscar la solicitud y verificar que pertenece a la empresa
+    client_request = get_object_or_404(ClientRequest, pk=pk, company=company)
+    
+    # Verificar si ya hay respuesta
+    has_response = hasattr(client_request, 'response')
+    
+    # Formulario para responder (solo si no hay respuesta)
+    response_form = None
+    if not has_response and request.method == 'POST':
+        response_form = ClientRequestResponseForm(request.POST, request.FILES)
+        if response_form.is_valid():
+            response = response_form.save(commit=False)
+            response.request = client_request
+            response.responded_by = None  # Respuesta anónima desde vista pública
+            response.save()
+            
+            # Actualizar estado de la solicitud
+            client_request.status = 'completed'
+            client_request.save()
+            
+            messages.success(request, 'Respuesta enviada exitosamente.')
+            return redirect('public_client_request_detail', token=token, pk=client_request.pk)
+    elif not has_response:
+        response_form = ClientRequestResponseForm()
+    
+    context = {
+        'company': company,
+        'client_request': client_request,
+        'has_response': has_response,
+        'response_form': response_form,
+        'token': token,
+        'page_title': f'{client_request.sequence} - {company.name}'
+    }
+    
+    return render(request, 'tickets/public_client_request_detail.html', context)
+
+
+# ==================== VISTAS DE PLANTILLAS DE SOLICITUDES ====================
+
+@login_required
+def client_request_template_list(request):
+    """Lista de plantillas de solicitudes"""
+    from .models import ClientRequestTemplate
+    
+    templates = ClientRequestTemplate.objects.filter(
+        created_by=request.user
+    ).order_by('-created_at')
+    
+    context = {
+        'templates': templates,
+        'page_title': 'Plantillas de Solicitudes'
+    }
+    
+    return render(request, 'tickets/client_request_template_list.html', context)
+
+
+@login_required
+def client_request_template_create(request):
+    """Crear nueva plantilla"""
+    from .models import ClientRequestTemplate
+    from .forms import ClientRequestTemplateForm
+    
+    if request.method == 'POST':
+        form = ClientRequestTemplateForm(request.POST)
+        if form.is_valid():
+            template = form.save(commit=False)
+            template.created_by = request.user
+            template.save()
+            messages.success(request, f'Plantilla "{template.name}" creada exitosamente.')
+            return redirect('client_request_template_detail', pk=template.pk)
+    else:
+        form = ClientRequestTemplateForm()
+    
+    context = {
+        'form': form,
+        'page_title': 'Nueva Plantilla de Solicitudes'
+    }
+    
+    return render(request, 'tickets/client_request_template_form.html', context)
+
+
+@login_required
+def client_request_template_detail(request, pk):
+    """Detalle de una plantilla con sus items"""
+    from .models import ClientRequestTemplate
+    
+    template = get_object_or_404(ClientRequestTemplate, pk=pk, created_by=request.user)
+    items = template.items.all().order_by('order', 'id')
+    
+    context = {
+        'template': template,
+        'items': items,
+        'page_title': template.name
+    }
+    
+    return render(request, 'tickets/client_request_template_detail.html', context)
+
+
+@login_required
+def client_request_template_edit(request, pk):
+    """Editar plantilla"""
+    from .models import ClientRequestTemplate
+    from .forms import ClientRequestTemplateForm
+    
+    template = get_object_or_404(ClientRequestTemplate, pk=pk, created_by=request.user)
+    
+    if request.method == 'POST':
+        form = ClientRequestTemplateForm(request.POST, instance=template)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Plantilla actualizada exitosamente.')
+            return redirect('client_request_template_detail', pk=template.pk)
+    else:
+        form = ClientRequestTemplateForm(instance=template)
+    
+    context = {
+        'form': form,
+        'template': template,
+        'page_title': f'Editar {template.name}'
+    }
+    
+    return render(request, 'tickets/client_request_template_form.html', context)
+
+
+@login_required
+def client_request_template_delete(request, pk):
+    """Eliminar plantilla"""
+    from .models import ClientRequestTemplate
+    
+    template = get_object_or_404(ClientRequestTemplate, pk=pk, created_by=request.user)
+    
+    if request.method == 'POST':
+        name = template.name
+        template.delete()
+        messages.success(request, f'Plantilla "{name}" eliminada exitosamente.')
+        return redirect('client_request_template_list')
+    
+    context = {
+        'template': template,
+        'page_title': f'Eliminar {template.name}'
+    }
+    
+    return render(request, 'tickets/client_request_template_delete.html', context)
+
+
+@login_required
+def client_request_template_item_create(request, template_pk):
+    """Agregar item a una plantilla"""
+    from .models import ClientRequestTemplate, ClientRequestTemplateItem
+    from .forms import ClientRequestTemplateItemForm
+    
+    template = get_object_or_404(ClientRequestTemplate, pk=template_pk, created_by=request.user)
+    
+    if request.method == 'POST':
+        form = ClientRequestTemplateItemForm(request.POST, request.FILES)
+        if form.is_valid():
+            item = form.save(commit=False)
+            item.template = template
+            item.save()
+            messages.success(request, 'Item agregado exitosamente.')
+            return redirect('client_request_template_detail', pk=template.pk)
+    else:
+        # Sugerir el siguiente orden
+        last_item = template.items.order_by('-order').first()
+        initial_order = (last_item.order + 1) if last_item else 1
+        form = ClientRequestTemplateItemForm(initial={'order': initial_order})
+    
+    context = {
+        'form': form,
+        'template': template,
+        'page_title': f'Agregar Item a {template.name}'
+    }
+    
+    return render(request, 'tickets/client_request_template_item_form.html', context)
+
+
+@login_required
+def client_request_template_item_edit(request, pk):
+    """Editar item de plantilla"""
+    from .models import ClientRequestTemplateItem
+    from .forms import ClientRequestTemplateItemForm
+    
+    item = get_object_or_404(ClientRequestTemplateItem, pk=pk)
+    template = item.template
+    
+    # Verificar que el usuario sea el creador de la plantilla
+    if template.created_by != request.user:
+        messages.error(request, 'No tienes permisos para editar este item.')
+        return redirect('client_request_template_detail', pk=template.pk)
+    
+    if request.method == 'POST':
+        form = ClientRequestTemplateItemForm(request.POST, request.FILES, instance=item)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Item actualizado exitosamente.')
+            return redirect('client_request_template_detail', pk=template.pk)
+    else:
+        form = ClientRequestTemplateItemForm(instance=item)
+    
+    context = {
+        'form': form,
+        'item': item,
+        'template': template,
+        'page_title': f'Editar Item'
+    }
+    
+    return render(request, 'tickets/client_request_template_item_form.html', context)
+
+
+@login_required
+def client_request_template_item_delete(request, pk):
+    """Eliminar item de plantilla"""
+    from .models import ClientRequestTemplateItem
+    
+    item = get_object_or_404(ClientRequestTemplateItem, pk=pk)
+    template = item.template
+    
+    # Verificar que el usuario sea el creador de la plantilla
+    if template.created_by != request.user:
+        messages.error(request, 'No tienes permisos para eliminar este item.')
+        return redirect('client_request_template_detail', pk=template.pk)
+    
+    if request.method == 'POST':
+        item.delete()
+        messages.success(request, 'Item eliminado exitosamente.')
+        return redirect('client_request_template_detail', pk=template.pk)
+    
+    context = {
+        'item': item,
+        'template': template,
+        'page_title': 'Eliminar Item'
+    }
+    
+    return render(request, 'tickets/client_request_template_item_delete.html', context)
+
+
+@login_required
+def client_request_template_execute(request, pk):
+    """Ejecutar plantilla: crear solicitudes para una empresa"""
+    from .models import ClientRequestTemplate, ClientRequest, Company
+    from .forms import ExecuteTemplateForm
+    
+    template = get_object_or_404(ClientRequestTemplate, pk=pk, created_by=request.user)
+    
+    if not template.is_active:
+        messages.error(request, 'Esta plantilla está inactiva.')
+        return redirect('client_request_template_detail', pk=template.pk)
+    
+    if template.items.count() == 0:
+        messages.error(request, 'Esta plantilla no tiene items para crear.')
+        return redirect('client_request_template_detail', pk=template.pk)
+    
+    if request.method == 'POST':
+        form = ExecuteTemplateForm(request.POST)
+        if form.is_valid():
+            company = form.cleaned_data['company']
+            
+            # Crear todas las solicitudes
+            created_count = 0
+            for item in template.items.all().order_by('order', 'id'):
+                client_request = ClientRequest.objects.create(
+                    title=item.title,
+                    description=item.description,
+                    requested_to=item.requested_to,
+                    company=company,
+                    created_by=request.user,
+                    attachment=item.attachment
+                )
+                created_count += 1
+            
+            messages.success(request, f'Se crearon {created_count} solicitudes para {company.name}.')
+            return redirect('client_request_list')
+    else:
+        form = ExecuteTemplateForm()
+    
+    context = {
+        'form': form,
+        'template': template,
+        'items': template.items.all().order_by('order', 'id'),
+        'page_title': f'Ejecutar Plantilla: {template.name}'
+    }
+    
+    return render(request, 'tickets/client_request_template_execute.html', context)
+
+
+# ===== VISTAS DE CONTACTOS =====
+
+@login_required
+def contact_list(request):
+    """Lista de contactos con filtros"""
+    from django.utils import timezone
+    from datetime import timedelta
+    from .models import ContactTag
+    
+    now = timezone.now()
+    
+    # activity_count y next_activity_date son columnas del contacto que
+    # mantienen las señales de actividades: no hace falta agrupar
+    contacts = Contact.objects.order_by('-created_at')
+
+    # Filtro de visibilidad: solo superusuarios ven todo sin restricción.
+    # El resto (agentes y usuarios) depende del permiso can_see_all_contacts.
+    if not request.user.is_superuser:
+        can_see_all = getattr(getattr(request.user, 'profile', None), 'can_see_all_contacts', False)
+        if not can_see_all:
+            contacts = contacts.filter(assigned_to=request.user)
+    
+    # Filtros
+    status = request.GET.get('status')
+    if status:
+        contacts = contacts.filter(status=status)
+    
+    # Filtro por etiquetas
+    tags = request.GET.getlist('tags')
+    if tags:
+        contacts = contacts.filter(tags__id__in=tags).distinct()
+    
+    source = request.GET.get('source')
+    if source:
+        contacts = contacts.filter(source__icontains=f"Generador: {source}")
+    
+    search = request.GET.get('search')
+    if search:
+        from .search import filter_queryset
+        contacts = filter_queryset(contacts, 'contact', search)
+    
+    # Filtro por actividades
+    has_activity = request.GET.get('has_activity')
+    if has_activity == 'yes':
+        contacts = contacts.filter(activity_count__gt=0)
+    elif has_activity == 'no':
+        contacts = contacts.filter(activity_count=0)
+    
+    # Filtro por reuniones
+    has_meeting = request.GET.get('has_meeting')
+    if has_meeting == 'monthly':
+        # Reuniones del mes actual
+        contacts = contacts.filter(
+            had_meeting=True,
+            meeting_date__year=now.year,
+            meeting_date__month=now.month
+        )
+    elif has_meeting == 'all':
+        # Todas las reuniones
+        contacts = contacts.filter(had_meeting=True)
+    
+    date_from = request.GET.get('date_from')
+    if date_from:
+        contacts = contacts.filter(contact_date__date__gte=date_from)
+    
+    date_to = request.GET.get('date_to')
+    if date_to:
+        contacts = contacts.filter(contact_date__date__lte=date_to)
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(contacts, 25)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # La próxima actividad guardada caduca cuando pasa su fecha: recalcular
+    # solo las de los contactos de esta página
+    stale_contacts = [
+        contact for contact in page_obj.object_list
+        if contact.next_activity_date and contact.next_activity_date < now
+    ]
+    if stale_contacts:
+        stale_ids = [contact.pk for contact in stale_contacts]
+        Contact.refresh_next_activity(stale_ids)
+        next_dates = dict(Contact.objects.filter(pk__in=stale_ids).values_list('pk', 'next_activity_date'))
+        for contact in stale_contacts:
+            contact.next_activity_date = next_dates.get(contact.pk)
+    
+    # Verificar si se debe mostrar datos consolidados de todos los usuarios
+    from .models import SalesPlan
+    
+    show_all_users = request.GET.get('all_users') == 'true'
+    user_sales_plan = None
+    plan_progress = None
+    
+    if show_all_users:
+        # Progreso consolidado de todos los usuarios (dos consultas, en caché)
+        from .crm_analytics import consolidated_plan_progress
+        plan_progress = dict(consolidated_plan_progress(), is_consolidated=True)
+        user_sales_plan = True  # Para que se muestre la sección
+    else:
+        # Mostrar solo el plan del usuario actual
+        user_sales_plan = SalesPlan.objects.filter(user=request.user, is_active=True).first()
+        if user_sales_plan:
+            plan_progress = user_sales_plan.get_monthly_progress()
+            plan_progress['is_consolidated'] = False
+    
+    # Estadísticas (una sola consulta con contadores condicionales)
+    from .crm_analytics import contact_overview
+    overview = contact_overview(request.user)
+    
+    # Fecha de hoy para comparaciones en template
+    today_date = timezone.now().date().strftime('%Y-%m-%d')
+    
+    # Tabla de estados por fecha
+    from .crm_analytics import CONTACT_STATUS_LABELS, contact_status_table, table_totals as get_table_totals
+    
+    status_labels = CONTACT_STATUS_LABELS
+    
+    # Obtener filtros de la tabla
+    table_view = request.GET.get('table_view', 'day')
+    table_user = request.GET.get('table_user', 'all')
+    table_days = int(request.GET.get('table_days', '30'))
+    table_weeks = int(request.GET.get('table_weeks', '12'))
+    table_year = int(request.GET.get('table_year', timezone.now().year))
+    
+    # Filtro base de contactos para la tabla
+    table_contacts = Contact.objects.all()
+    table_cache_key = 'all'
+    if table_user == 'me':
+        table_contacts = table_contacts.filter(created_by=request.user)
+        table_cache_key = f'user:{request.user.pk}'
+    
+    # Generar años disponibles
+    first_contact = Contact.objects.order_by('created_at').first()
+    available_years = []
+    if first_contact:
+        start_year = first_contact.created_at.year
+        current_year_val = timezone.now().year
+        available_years = list(range(start_year, current_year_val + 1))
+    else:
+        available_years = [timezone.now().year]
+    
+    # Una consulta agrupada por periodo y estado, en caché
+    table_data = contact_status_table(
+        table_contacts,
+        view=table_view,
+        days=table_days,
+        weeks=table_weeks,
+        year=table_year,
+        years=available_years,
+        cache_key=table_cache_key,
+    )
+    table_totals = get_table_totals(table_data)
+    
+    # Estadísticas de tickets creados hoy por usuario en intervalos de hora
+    from django.db.models.functions import TruncHour, TruncDate
+    from collections import defaultdict
+    from datetime import date
+    
+    # Obtener fecha actual para filtros simples
+    now = timezone.now()
+    today_date = now.date()
+    
+    # Obtener tickets creados hoy - usar el mismo método que funciona en KPIs
+    tickets_today = Ticket.objects.filter(
+        created_at__year=now.year,
+        created_at__month=now.month,
+        created_at__day=now.day
+    ).select_related('created_by').order_by('created_at')
+    
+    # Agrupar tickets por usuario y hora
+    user_hourly_tickets = defaultdict(lambda: defaultdict(list))
+    
+    for ticket in tickets_today:
+        hour = ticket.created_at.hour
+        user = ticket.created_by
+        user_hourly_tickets[user][hour].append(ticket)
+    
+    # Formatear datos para el template
+    hourly_ticket_stats = []
+    users_with_high_activity = []
+    
+    for user, hourly_data in user_hourly_tickets.items():
+        user_stats = {
+            'user': user,
+            'user_name': user.get_full_name() or user.username,
+            'total_tickets': sum(len(tickets) for tickets in hourly_data.values()),
+            'hourly_breakdown': []
+        }
+        
+        # Crear breakdown por hora
+        for hour in sorted(hourly_data.keys()):
+            tickets_in_hour = hourly_data[hour]
+            count = len(tickets_in_hour)
+            
+            hour_info = {
+                'hour': hour,
+                'hour_label': f"{hour:02d}:00 - {hour:02d}:59",
+                'count': count,
+                'high_activity': count > 2,
+                'tickets': tickets_in_hour[:5]  # Solo los primeros 5 para mostrar
+            }
+            
+            user_stats['hourly_breakdown'].append(hour_info)
+            
+            # Si hay más de 2 tickets en una hora, agregar a lista de alta actividad
+            if count > 2:
+                users_with_high_activity.append({
+                    'user': user,
+                    'user_name': user.get_full_name() or user.username,
+                    'hour': hour,
+                    'hour_label': f"{hour:02d}:00 - {hour:02d}:59",
+                    'count': count
+                })
+        
+        hourly_ticket_stats.append(user_stats)
+    
+    # Ordenar por total de tickets descendente
+    hourly_ticket_stats.sort(key=lambda x: x['total_tickets'], reverse=True)
+    
+    # Estadísticas generales de contactos
+    from django.db.models import Count
+    from django.contrib.auth.models import User
+    
+    # Total de contactos
+    contacts_total = Contact.objects.count()
+    
+    # Contactos del año actual
+    contacts_year = Contact.objects.filter(
+        created_at__year=now.year
+    ).count()
+    
+    # Contactos del mes actual
+    contacts_month = Contact.objects.filter(
+        created_at__year=now.year,
+        created_at__month=now.month
+    ).count()
+    
+    # Contactos de la semana actual
+    week_start = now - timedelta(days=now.weekday())
+    contacts_week = Contact.objects.filter(
+        created_at__gte=week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+    ).count()
+    
+    # Contactos de hoy
+    contacts_today_count = Contact.objects.filter(
+        created_at__year=now.year,
+        created_at__month=now.month,
+        created_at__day=now.day
+    ).count()
+    
+    # Contactos de la última hora
+    one_hour_ago = now - timedelta(hours=1)
+    contacts_hour = Contact.objects.filter(
+        created_at__gte=one_hour_ago
+    ).count()
+    
+    # Contactos de hoy por usuario
+    contacts_today_by_user_list = []
+    all_users = User.objects.all()
+    
+    for user in all_users:
+        count = Contact.objects.filter(
+            created_by=user,
+            created_at__year=now.year,
+            created_at__month=now.month,
+            created_at__day=now.day
+        ).count()
+        
+        if count > 0:
+            contacts_today_by_user_list.append({
+                'username': user.username,
+                'count': count
+            })
+    
+    # Ordenar por count descendente
+    contacts_today_by_user_list.sort(key=lambda x: x['count'], reverse=True)
+    
+    # Obtener estadísticas de URLs cortas marcadas como KPI de Ventas
+    from .models import ShortUrl
+    from .activity_rollup import clicks_today as short_url_clicks_today
+    short_url_kpis = list(ShortUrl.objects.filter(
+        is_sales_kpi=True,
+        is_active=True
+    ).order_by('short_code'))
+    
+    # Clics de hoy de todas las URLs, desde los agregados por hora
+    kpi_clicks_today = short_url_clicks_today([url.pk for url in short_url_kpis])
+    
+    short_url_stats = []
+    for url in short_url_kpis:
+        short_url_stats.append({
+            'short_code': url.short_code,
+            'clicks_today': kpi_clicks_today.get(url.pk, 0),
+            'clicks_total': url.clicks,
+            'title': url.title or url.short_code
+        })
+    
+    context = {
+        'page_obj': page_obj,
+        'contacts': page_obj.object_list,
+        'total_contacts': overview['total_contacts'],
+        'positive_contacts': overview['positive_contacts'],
+        'neutral_contacts': overview['neutral_contacts'],
+        'negative_contacts': overview['negative_contacts'],
+        'not_now_contacts': overview['not_now_contacts'],
+        'do_not_contact_contacts': overview['do_not_contact_contacts'],
+        'won_contacts': overview['won_contacts'],
+        'monthly_won_contacts': overview['monthly_won_contacts'],
+        'my_positive_contacts': overview['my_positive_contacts'],
+        'today_contacts': overview['today_contacts'],
+        'contacts_with_activities': overview['contacts_with_activities'],
+        'contacts_without_activities': overview['contacts_without_activities'],
+        'monthly_meetings': overview['monthly_meetings'],
+        'total_meetings': overview['total_meetings'],
+        'today_date': today_date,
+        'user_sales_plan': user_sales_plan,
+        'plan_progress': plan_progress,
+        'table_data': table_data,
+        'table_totals': table_totals,
+        'status_labels': status_labels,
+        'available_years': available_years,
+        'current_year': timezone.now().year,
+        'page_title': 'Contactos',
+        'today_total_contacts': overview['today_total_contacts'],
+        'comparison_total_contacts': overview['comparison_total_contacts'],
+        'comparison_label': overview['comparison_label'],
+        'contact_change_percentage': overview['contact_change_percentage'],
+        'all_tags': ContactTag.objects.all().order_by('name'),
+        'selected_tags': request.GET.getlist('tags'),
+        'hourly_ticket_stats': hourly_ticket_stats,
+        'users_with_high_activity': users_with_high_activity,
+        'contacts_stats_total': contacts_total,
+        'contacts_stats_year': contacts_year,
+        'contacts_stats_month': contacts_month,
+        'contacts_stats_week': contacts_week,
+        'contacts_stats_today': contacts_today_count,
+        'contacts_stats_hour': contacts_hour,
+        'contacts_today_by_user': contacts_today_by_user_list,
+        'short_url_kpi_stats': short_url_stats,
+    }
+    
+    return render(request, 'tickets/contact_list.html', context)
+
+
+@login_required
+def contact_create(request):
+    """Crear nuevo contacto"""
+    from .forms import ContactForm
+    
+    if request.method == 'POST':
+        form = ContactForm(request.POST, user=request.user)
+        if form.is_valid():
+            contact = form.save(commit=False)
+            contact.created_by = request.user
+            # Asignar por defecto al usuario que lo crea si no se especificó otro
+            if not contact.assigned_to:
+                contact.assigned_to = request.user
+            contact.save()
+            
+            messages.success(request, f'Contacto "{contact.name}" creado exitosamente.')
+            return redirect('contact_detail', pk=contact.pk)
+    else:
+        form = ContactForm(user=request.user)
+    
+    context = {
+        'form': form,
+        'page_title': 'Nuevo Contacto'
+    }
+    
+    return render(request, 'tickets/contact_form.html', context)
+
+
+@login_required
+def contact_autocomplete_ai(request):
+    """Autocompletar información del contacto usando IA"""
+    import json
+    from django.http import JsonResponse
+    from .ai_utils import AIContentOptimizer
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+        
+        # Extraer datos del contacto
+        name = data.get('name', '').strip()
+        company = data.get('company', '').strip()
+        email = data.get('email', '').strip()
+        position = data.get('position', '').strip()
+        country = data.get('country', '').strip()
+        notes = data.get('notes', '').strip()
+        
+        # Campos actuales de redes sociales
+        current_website = data.get('website', '').strip()
+        current_linkedin = data.get('linkedin_url', '').strip()
+        current_facebook = data.get('facebook_url', '').strip()
+        current_twitter = data.get('twitter_url', '').strip()
+        current_instagram = data.get('instagram_url', '').strip()
+        current_youtube = data.get('youtube_url', '').strip()
+        current_tiktok = data.get('tiktok_url', '').strip()
+        
+        # Validar que tengamos información mínima
+        if not name and not company and not email:
+            return JsonResponse({
+                'success': False,
+                'error': 'Se necesita al menos nombre, empresa o email para autocompletar'
+            })
+        
+        # Construir contexto para la IA
+        context = f"""
+Tengo la siguiente información de un contacto comercial:
+- Nombre: {name if name else 'No especificado'}
+- Empresa: {company if company else 'No especificada'}
+- Email: {email if email else 'No especificado'}
+- Cargo: {position if position else 'No especificado'}
+- País: {country if country else 'No especificado'}
+- Notas: {notes if notes else 'Ninguna'}
+
+Redes sociales conocidas:
+- Sitio web: {current_website if current_website else 'No especificado'}
+- LinkedIn: {current_linkedin if current_linkedin else 'No especificado'}
+- Facebook: {current_facebook if current_facebook else 'No especificado'}
+- Twitter/X: {current_twitter if current_twitter else 'No especificado'}
+- Instagram: {current_instagram if current_instagram else 'No especificado'}
+- YouTube: {current_youtube if current_youtube else 'No especificado'}
+- TikTok: {current_tiktok if current_tiktok else 'No especificado'}
+
+Por favor, sugiere URLs de redes sociales que probablemente tenga esta empresa/contacto.
+Para cada red social que NO tenga URL especificada, proporciona una sugerencia realista basada en el nombre de la empresa.
+También proporciona información adicional relevante para las notas del CRM.
+
+Responde en formato JSON con esta estructura exacta:
+{{
+    "website": "URL sugerida o vacío si ya existe",
+    "linkedin_url": "URL sugerida o vacío si ya existe",
+    "facebook_url": "URL sugerida o vacío si ya existe",
+    "twitter_url": "URL sugerida o vacío si ya existe",
+    "instagram_url": "URL sugerida o vacío si ya existe",
+    "youtube_url": "URL sugerida o vacío si ya existe",
+    "tiktok_url": "URL sugerida o vacío si ya existe",
+    "additional_notes": "Información adicional relevante para el CRM"
+}}
+
+Solo sugiere URLs para campos vacíos. Si el campo ya tiene valor, deja la sugerencia vacía.
+Las URLs deben ser completas y válidas (empezando con https://).
+"""
+        
+        # Usar AIContentOptimizer
+        optimizer = AIContentOptimizer()
+        
+        messages = [
+            {
+                "role": "system",
+                "content": "Eres un asistente de CRM experto que ayuda a completar información de contactos comerciales. Proporcionas URLs realistas de redes sociales basadas en nombres de empresas y contexto. Siempre respondes en formato JSON válido."
+            },
+            {
+                "role": "user",
+                "content": context
+            }
+        ]
+        
+        # Hacer petición a IA
+        result = optimizer._make_ai_request(messages, max_tokens=800, temperature=0.7)
+        
+        if 'error' in result:
+            return JsonResponse({
+                'success': False,
+                'error': result['error']
+            })
+        
+        # Parsear respuesta
+        try:
+            ai_response = result['choices'][0]['message']['content'].strip()
+            
+            # Intentar extraer JSON si viene con markdown
+            if '```json' in ai_response:
+                ai_response = ai_response.split('```json')[1].split('```')[0].strip()
+            elif '```' in ai_response:
+                ai_response = ai_response.split('```')[1].split('```')[0].strip()
+            
+            suggestions = json.loads(ai_response)
+            
+            # Solo mantener sugerencias para campos vacíos
+            if current_website:
+                suggestions['website'] = ''
+            if current_linkedin:
+                suggestions['linkedin_url'] = ''
+            if current_facebook:
+                suggestions['facebook_url'] = ''
+            if current_twitter:
+                suggestions['twitter_url'] = ''
+            if current_instagram:
+                suggestions['instagram_url'] = ''
+            if current_youtube:
+                suggestions['youtube_url'] = ''
+            if current_tiktok:
+                suggestions['tiktok_url'] = ''
+            
+            return JsonResponse({
+                'success': True,
+                'suggestions': suggestions
+            })
+            
+        except json.JSONDecodeError as e:
+            return JsonResponse({
+                'success': False,
+                'error': f'Error parseando respuesta de IA: {str(e)}'
+            })
+            
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'error': f'Error interno: {str(e)}'
+        })
+
+
+@login_required
+def generate_sales_report(request):
+    """Generar informe de ventas con IA basado en estadísticas del período"""
+    from django.http import JsonResponse
+    from datetime import timedelta
+    from .ai_utils import AIContentOptimizer
+    
+    try:
+        # Obtener parámetros
+        table_view = request.GET.get('table_view', 'day')
+        table_user = request.GET.get('table_user', 'all')
+        table_days = int(request.GET.get('table_days', '30'))
+        table_weeks = int(request.GET.get('table_weeks', '12'))
+        table_year = int(request.GET.get('table_year', timezone.now().year))
+        
+        # Filtro base de contactos
+        contacts = Contact.objects.all()
+        if table_user == 'me':
+            contacts = contacts.filter(created_by=request.user)
+            user_context = f"tus resultados como vendedor ({request.user.get_full_name() or request.user.username})"
+        else:
+            user_context = "los resultados de toda la empresa"
+        
+        # Calcular estadísticas según el período (una consulta agrupada por estado)
+        from .crm_analytics import contact_status_counts
+        
+        if table_view == 'day':
+            start_date = timezone.now().date() - timedelta(days=table_days - 1)
+            end_date = timezone.now().date()
+            period_text = f"últimos {table_days} días ({start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')})"
+            stats = contact_status_counts(contacts, start_date=start_date, end_date=end_date)
+                
+        elif table_view == 'week':
+            period_text = f"últimas {table_weeks} semanas"
+            start_date = timezone.now().date() - timedelta(weeks=table_weeks)
+            end_date = timezone.now().date()
+            stats = contact_status_counts(contacts, start_date=start_date, end_date=end_date)
+                
+        elif table_view == 'month':
+            period_text = f"año {table_year} (vista mensual)"
+            stats = contact_status_counts(contacts, year=table_year)
+                
+        else:
+            first_contact = contacts.order_by('created_at').first()
+            if first_contact:
+                start_year = first_contact.created_at.year
+                end_year = timezone.now().year
+                period_text = f"años {start_year} - {end_year}"
+            else:
+                period_text = "todos los años"
+            stats = contact_status_counts(contacts)
+        
+        # Calcular totales y métricas
+        total_contacts = sum(stats.values())
+        positive_rate = (stats['positive'] / total_contacts * 100) if total_contacts > 0 else 0
+        won_rate = (stats['won'] / total_contacts * 100) if total_contacts > 0 else 0
+        negative_rate = (stats['negative'] / total_contacts * 100) if total_contacts > 0 else 0
+        
+        # Generar prompt para IA
+        prompt = f"""Eres un analista de ventas experto. Analiza las siguientes estadísticas de contactos del período: {period_text}.
+
+Estos son {user_context}:
+
+ESTADÍSTICAS DEL PERÍODO:
+- Total de contactos: {total_contacts}
+- No Contactar: {stats['do_not_contact']} ({stats['do_not_contact']/total_contacts*100:.1f}% del total)
+- Negativos: {stats['negative']} ({negative_rate:.1f}% del total)
+- No Ahora: {stats['not_now']} ({stats['not_now']/total_contacts*100:.1f}% del total)
+- Neutros: {stats['neutral']} ({stats['neutral']/total_contacts*100:.1f}% del total)
+- Positivos: {stats['positive']} ({positive_rate:.1f}% del total)
+- Ganados: {stats['won']} ({won_rate:.1f}% del total)
+
+Genera un informe detallado de ventas en español que incluya:
+
+1. RESUMEN EJECUTIVO: Una visión general del desempeño en 2-3 líneas.
+
+2. ANÁLISIS DE RENDIMIENTO:
+   - Evalúa la tasa de conversión (positivos + ganados vs total)
+   - Identifica fortalezas y debilidades
+   - Compara las métricas con estándares de la industria (tasa de conversión típica: 2-5%)
+
+3. PUNTOS DESTACADOS:
+   - Qué está funcionando bien
+   - Áreas de preocupación
+
+4. RECOMENDACIONES ESPECÍFICAS:
+   - 3-4 acciones concretas para mejorar el rendimiento
+   - Enfócate en aumentar conversiones y reducir negativos
+
+5. PRONÓSTICO:
+   - Proyección optimista basada en las tendencias actuales
+
+Usa un tono profesional pero motivador. Sé específico con los números y porcentajes.
+
+IMPORTANTE: NO uses formato Markdown. Escribe texto plano sin asteriscos, sin almohadillas, sin guiones bajos, sin backticks. Usa solo texto simple y legible."""
+
+        # Generar informe con IA
+        ai_optimizer = AIContentOptimizer()
+        messages = [
+            {"role": "system", "content": "Eres un analista de ventas experto que genera informes detallados y accionables."},
+            {"role": "user", "content": prompt}
+        ]
+        
+        response = ai_optimizer._make_ai_request(messages, max_tokens=1500, temperature=0.7)
+        
+        if "error" in response:
+            return JsonResponse({
+                'success': False,
+                'error': response['error']
+            })
+        
+        report_text = response['choices'][0]['message']['content']
+        
+        return JsonResponse({
+            'success': True,
+            'report': report_text,
+            'period': period_text,
+            'view_type': {
+                'day': 'Por Día',
+                'week': 'Por Semana',
+                'month': 'Por Mes',
+                'year': 'Por Año'
+            }.get(table_view, 'Desconocido')
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        })
+
+
+@login_required
+def contact_detail(request, pk):
+    """Ver detalles de un contacto"""
+    contact = get_object_or_404(Contact, pk=pk)
+    
+    # Obtener comentarios y adjuntos
+    comments = contact.comments.all().order_by('created_at')
+    attachments = contact.attachments.all().order_by('-uploaded_at')
+    
+    # Obtener actividades relacionadas con este contacto
+    from .models import OpportunityActivity
+    activities = OpportunityActivity.objects.filter(contact=contact).order_by('-created_at')
+    
+    # Estadísticas de actividades
+    total_activities = activities.count()
+    pending_activities = activities.filter(status__in=['pending', 'in_progress']).count()
+    completed_activities = activities.filter(status='completed').count()
+    
+    # Obtener contacto anterior y siguiente
+    previous_contact = Contact.objects.filter(
+        contact_date__lt=contact.contact_date
+    ).order_by('-contact_date').first()
+    
+    next_contact = Contact.objects.filter(
+        contact_date__gt=contact.contact_date
+    ).order_by('contact_date').first()
+    
+    # Formularios para nuevos comentarios y adjuntos
+    from .forms import ContactCommentForm, ContactAttachmentForm
+    comment_form = ContactCommentForm(user=request.user, contact=contact)
+    attachment_form = ContactAttachmentForm(user=request.user, contact=contact)
+    
+    # Procesar formularios si es POST
+    if request.method == 'POST':
+        if 'comment_submit' in request.POST:
+            comment_form = ContactCommentForm(request.POST, user=request.user, contact=contact)
+            if comment_form.is_valid():
+                comment = comment_form.save()
+                messages.success(request, 'Comentario agregado exitosamente.')
+                return redirect('contact_detail', pk=contact.pk)
+        elif 'attachment_submit' in request.POST:
+            attachment_form = ContactAttachmentForm(request.POST, request.FILES, user=request.user, contact=contact)
+            if attachment_form.is_valid():
+                attachment = attachment_form.save()
+                messages.success(request, 'Archivo adjuntado exitosamente.')
+                return redirect('contact_detail', pk=contact.pk)
+    
+    context = {
+        'contact': contact,
+        'comments': comments,
+        'attachments': attachments,
+        'activities': activities,
+        'total_activities': total_activities,
+        'pending_activities': pending_activities,
+        'completed_activities': completed_activities,
+        'comment_form': comment_form,
+        'attachment_form': attachment_form,
+        'previous_contact': previous_contact,
+        'next_contact': next_contact,
+        'page_title': f'Contacto: {contact.name}'
+    }
+    
+    return render(request, 'tickets/contact_detail.html', context)
+
+
+@login_required
+def contact_edit(request, pk):
+    """Editar contacto"""
+    from .forms import ContactForm
+    
+    contact = get_object_or_404(Contact, pk=pk)
+    
+    if request.method == 'POST':
+        form = ContactForm(request.POST, instance=contact, user=request.user)
+        if form.is_valid():
+            # Solo los campos del formulario: los resúmenes de actividades los mantienen las señales
+            contact = form.save(commit=False)
+            contact.save(update_fields=[field for field in form._meta.fields if field != 'tags'] + ['updated_at'])
+            form.save_m2m()
+            
+            messages.success(request, f'Contacto "{contact.name}" actualizado exitosamente.')
+            return redirect('contact_detail', pk=contact.pk)
+    else:
+        form = ContactForm(instance=contact, user=request.user)
+    
+    context = {
+        'form': form,
+        'contact': contact,
+        'page_title': f'Editar: {contact.name}'
+    }
+    
+    return render(request, 'tickets/contact_form.html', context)
+
+
+@login_required
+def convert_contact_to_company(request, pk):
+    """Convertir contacto en empresa"""
+    contact = get_object_or_404(Contact, pk=pk)
+    
+    # Verificar si ya tiene empresa vinculada
+    if contact.linked_company:
+        messages.warning(request, f'Este contacto ya está vinculado a la empresa "{contact.linked_company.name}".')
+        return redirect('contact_detail', pk=contact.pk)
+    
+    if request.method == 'POST':
+        try:
+            # Crear empresa a partir de los datos del contacto
+            company_name = contact.company if contact.company else contact.name
+            
+            # Verificar si ya existe una empresa con ese nombre
+            existing_company = Company.objects.filter(name=company_name).first()
+            if existing_company:
+                # Vincular a la empresa existente
+                contact.linked_company = existing_company
+                contact.save(update_fields=['linked_company', 'updated_at'])
+                messages.success(request, f'Contacto vinculado a la empresa existente "{existing_company.name}".')
+                return redirect('contact_detail', pk=contact.pk)
+            
+            # Crear nueva empresa
+            new_company = Company.objects.create(
+                name=company_name,
+                email=contact.email or '',
+                phone=contact.phone or '',
+                website=contact.website or '',
+                country=contact.country or '',
+                description=f'Empresa creada a partir del contacto: {contact.name}',
+                is_active=True
+            )
+            
+            # Vincular la empresa al contacto
+            contact.linked_company = new_company
+            contact.save(update_fields=['linked_company', 'updated_at'])
+            
+            messages.success(request, f'¡Empresa "{new_company.name}" creada y vinculada exitosamente!')
+            return redirect('contact_detail', pk=contact.pk)
+            
+        except Exception as e:
+            messages.error(request, f'Error al crear la empresa: {str(e)}')
+            return redirect('contact_detail', pk=contact.pk)
+    
+    # GET request - mostrar confirmación
+    context = {
+        'contact': contact,
+        'company_name': contact.company if contact.company else contact.name,
+        'page_title': f'Convertir contacto: {contact.name}'
+    }
+    
+    return render(request, 'tickets/contact_convert_confirm.html', context)
+
+
+@login_required
+def contact_delete(request, pk):
+    """Eliminar contacto"""
+    contact = get_object_or_404(Contact, pk=pk)
+    
+    if request.method == 'POST':
+        contact_name = contact.name
+        contact.delete()
+        messages.success(request, f'Contacto "{contact_name}" eliminado exitosamente.')
+        return redirect('contact_list')
+    
+    context = {
+        'contact': contact,
+        'page_title': f'Eliminar: {contact.name}'
+    }
+    
+    return render(request, 'tickets/contact_delete.html', context)
+
+
+@login_required
+@user_passes_test(lambda u: u.is_superuser, login_url='/')
+@require_POST
+def contact_delete_all(request):
+    """Eliminar TODOS los contactos - Solo para superusuarios"""
+    try:
+        # Contar contactos antes de eliminar
+        total_contacts = Contact.objects.count()
+        
+        # Eliminar todos los contactos
+        Contact.objects.all().delete()
+        
+        messages.success(request, f'✅ Se eliminaron exitosamente {total_contacts} contactos.')
+    except Exception as e:
+        messages.error(request, f'❌ Error al eliminar contactos: {str(e)}')
+    
+    return redirect('contact_list')
+
+
+@login_required
+def contact_comment_delete(request, pk):
+    """Eliminar comentario de contacto"""
+    from .models import ContactComment
+    
+    comment = get_object_or_404(ContactComment, pk=pk)
+    contact = comment.contact
+    
+    # Verificar permisos
+    if not comment.can_delete(request.user):
+        messages.error(request, 'No tienes permisos para eliminar este comentario.')
+        return redirect('contact_detail', pk=contact.pk)
+    
+    if request.method == 'POST':
+        comment.delete()
+        messages.success(request, 'Comentario eliminado exitosamente.')
+        return redirect('contact_detail', pk=contact.pk)
+    
+    return redirect('contact_detail', pk=contact.pk)
+
+
+@login_required
+def contact_attachment_delete(request, pk):
+    """Eliminar adjunto de contacto"""
+    from .models import ContactAttachment
+    
+    attachment = get_object_or_404(ContactAttachment, pk=pk)
+    contact = attachment.contact
+    
+    if request.method == 'POST':
+        filename = attachment.original_filename
+        attachment.delete()
+        messages.success(request, f'Archivo "{filename}" eliminado exitosamente.')
+        return redirect('contact_detail', pk=contact.pk)
+    
+    return redirect('contact_detail', pk=contact.pk)
+
+
+@login_required
+def contact_stage_tracking(request):
+    """Vista de seguimiento de contactos positivos por etapas"""
+    from django.db.models import Count
+    from django.utils import timezone
+    
+    # Filtro opcional por empresa
+    company_filter = request.GET.get('company', '').strip()
+    
+    # Obtener todos los contactos positivos agrupados por etapa
+    stages_data = []
+    
+    for stage_code, stage_name in Contact.STAGE_CHOICES:
+        contacts_qs = Contact.objects.filter(
+            status='positive',
+            stage=stage_code
+        )
+        
+        # Aplicar filtro de empresa si existe
+        if company_filter:
+            contacts_qs = contacts_qs.filter(company__iexact=company_filter)
+        
+        contacts = contacts_qs.select_related('created_by').order_by('created_at')
+        
+        # Calcular tiempo promedio desde el primer contacto
+        stage_info = {
+            'code': stage_code,
+            'name': stage_name,
+            'count': contacts.count(),
+            'contacts': contacts,
+        }
+        
+        stages_data.append(stage_info)
+    
+    # Contactos positivos sin etapa asignada
+    contacts_no_stage_qs = Contact.objects.filter(
+        status='positive',
+        stage__isnull=True
+    )
+    
+    # Aplicar filtro de empresa si existe
+    if company_filter:
+        contacts_no_stage_qs = contacts_no_stage_qs.filter(company__iexact=company_filter)
+    
+    contacts_no_stage = contacts_no_stage_qs.select_related('created_by').order_by('created_at')
+    
+    # Calcular total considerando el filtro
+    total_positive_qs = Contact.objects.filter(status='positive')
+    if company_filter:
+        total_positive_qs = total_positive_qs.filter(company__iexact=company_filter)
+    
+    context = {
+        'page_title': 'Seguimiento de Contactos Positivos por Etapas',
+        'stages_data': stages_data,
+        'contacts_no_stage': contacts_no_stage,
+        'total_positive': total_positive_qs.count(),
+        'company_filter': company_filter,
+    }
+    
+    return render(request, 'tickets/contact_stage_tracking.html', context)
+
+
+@login_required
+def contact_update_stage(request, pk):
+    """Actualizar la etapa de un contacto mediante AJAX"""
+    from django.http import JsonResponse
+    from django.views.decorators.http import require_POST
+    import logging
+    
+    logger = logging.getLogger(__name__)
+    logger.info(f"contact_update_stage called for contact {pk}")
+    logger.info(f"Method: {request.method}")
+    logger.info(f"POST data: {request.POST}")
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        contact = get_object_or_404(Contact, pk=pk)
+        new_stage = request.POST.get('stage')
+        
+        logger.info(f"Current stage: {contact.stage}, New stage: {new_stage}")
+        
+        # Validar que la etapa sea válida
+        valid_stages = [code for code, name in Contact.STAGE_CHOICES]
+        
+        if not new_stage:
+            return JsonResponse({'error': 'Etapa no proporcionada'}, status=400)
+        
+        if new_stage not in valid_stages:
+            return JsonResponse({'error': f'Etapa no válida: {new_stage}. Válidas: {valid_stages}'}, status=400)
+        
+        # Actualizar la etapa
+        old_stage = contact.get_stage_display() if contact.stage else 'Sin etapa'
+        contact.stage = new_stage
+        contact.save(update_fields=['stage', 'updated_at'])
+        
+        logger.info(f"Stage updated successfully from {old_stage} to {contact.get_stage_display()}")
+        
+        # Crear actividad de seguimiento
+        try:
+            from .models import Activity
+            Activity.objects.create(
+                contact=contact,
+                activity_type='call',
+                subject=f'Cambio de etapa: {old_stage} → {contact.get_stage_display()}',
+                notes=f'La etapa del contacto fue actualizada automáticamente desde el pipeline de ventas.',
+                created_by=request.user,
+                status='completed'
+            )
+            logger.info("Activity created successfully")
+        except Exception as e:
+            logger.error(f"Error creating activity: {str(e)}")
+        
+        return JsonResponse({
+            'success': True,
+            'message': f'Etapa actualizada a {contact.get_stage_display()}',
+            'new_stage': contact.stage,
+            'new_stage_name': contact.get_stage_display()
+        })
+    
+    except Exception as e:
+        logger.error(f"Error in contact_update_stage: {str(e)}")
+        return JsonResponse({'error': f'Error interno: {str(e)}'}, status=500)
+
+
+@login_required
+def contact_save_stage_comment(request, pk):
+    """Guardar un comentario para una etapa específica del contacto"""
+    from django.http import JsonResponse
+    import logging
+    
+    logger = logging.getLogger(__name__)
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        contact = get_object_or_404(Contact, pk=pk)
+        content = request.POST.get('content', '').strip()
+        stage = request.POST.get('stage', '').strip()
+        
+        if not content:
+            return JsonResponse({'error': 'El comentario no puede estar vacío'}, status=400)
+        
+        if not stage:
+            return JsonResponse({'error': 'La etapa no fue especificada'}, status=400)
+        
+        # Validar que la etapa sea válida
+        valid_stages = [code for code, name in Contact.STAGE_CHOICES]
+        if stage not in valid_stages:
+            return JsonResponse({'error': 'Etapa no válida'}, status=400)
+        
+        # Crear el comentario
+        from .models import ContactComment
+        comment = ContactComment.objects.create(
+            contact=contact,
+            user=request.user,
+            content=content,
+            stage=stage
+        )
+        
+        logger.info(f"Comment created for contact {pk}, stage {stage}")
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Comentario guardado correctamente',
+            'comment': {
+                'id': comment.id,
+                'content': comment.content,
+                'stage': comment.stage,
+                'user': comment.user.get_full_name() or comment.user.username,
+                'created_at': comment.created_at.strftime('%d/%m/%Y %H:%M')
+            }
+        })
+    
+    except Exception as e:
+        logger.error(f"Error saving stage comment: {str(e)}")
+        return JsonResponse({'error': f'Error al guardar: {str(e)}'}, status=500)
+
+
+@login_required
+def contact_get_stage_comments(request, pk):
+    """Obtener TODOS los comentarios del contacto (de todas las etapas)"""
+    from django.http import JsonResponse
+    import logging
+    
+    logger = logging.getLogger(__name__)
+    
+    try:
+        contact = get_object_or_404(Contact, pk=pk)
+        
+        # Obtener TODOS los comentarios del contacto con stage no nulo
+        from .models import ContactComment
+        comments = ContactComment.objects.filter(
+            contact=contact,
+            stage__isnull=False
+        ).select_related('user').order_by('-created_at')
+        
+        # Obtener nombre legible de la etapa
+        stage_dict = dict(Contact.STAGE_CHOICES)
+        
+        comments_data = [{
+            'id': c.id,
+            'content': c.content,
+            'stage': c.stage,
+            'stage_name': stage_dict.get(c.stage, c.stage),
+            'user': c.user.get_full_name() or c.user.username,
+            'created_at': c.created_at.strftime('%d/%m/%Y %H:%M')
+        } for c in comments]
+        
+        logger.info(f"Retrieved {len(comments_data)} comments for contact {pk} (all stages)")
+        
+        return JsonResponse({
+            'success': True,
+            'comments': comments_data
+        })
+    
+    except Exception as e:
+        logger.error(f"Error getting stage comments: {str(e)}")
+        return JsonResponse({'error': f'Error al cargar: {str(e)}'}, status=500)
+
+
+@login_required
+def contact_individual_stage_tracking(request, pk):
+    """Vista de seguimiento de etapas para un contacto específico"""
+    contact = get_object_or_404(Contact, pk=pk)
+    
+    # Preparar datos de todas las etapas
+    stages_data = []
+    for stage_code, stage_name in Contact.STAGE_CHOICES:
+        stage_info = {
+            'code': stage_code,
+            'name': stage_name,
+            'is_current': contact.stage == stage_code,
+            'is_completed': contact.stage and stage_code < contact.stage if contact.stage else False,
+        }
+        stages_data.append(stage_info)
+    
+    context = {
+        'page_title': f'Pipeline de {contact.name}',
+        'contact': contact,
+        'stages_data': stages_data,
+    }
+    
+    return render(request, 'tickets/contact_individual_stage_tracking.html', context)
+
+
+@login_required
+def business_dashboard(request):
+    """Dashboard empresarial con KPIs principales"""
+    from django.utils import timezone
+    from datetime import timedelta
+    from django.db.models import Count, Q
+    
+    today = timezone.now().date()
+    yesterday = today - timedelta(days=1)
+    today_start = timezone.datetime.combine(today, timezone.datetime.min.time())
+    today_start = timezone.make_aware(today_start)
+    yesterday_start = timezone.datetime.combine(yesterday, timezone.datetime.min.time())
+    yesterday_start = timezone.make_aware(yesterday_start)
+    
+    # Contactos creados hoy
+    contacts_today = Contact.objects.filter(
+        created_at__gte=today_start
+    ).count()
+    
+    # Contactos creados ayer
+    contacts_yesterday = Contact.objects.filter(
+        created_at__gte=yesterday_start,
+        created_at__lt=today_start
+    ).count()
+    
+    # Calcular variación
+    if contacts_yesterday > 0:
+        contacts_variation = ((contacts_today - contacts_yesterday) / contacts_yesterday) * 100
+    else:
+        contacts_variation = 100 if contacts_today > 0 else 0
+    
+    # Tickets creados hoy
+    from .models import Ticket
+    tickets_today = Ticket.objects.filter(
+        created_at__gte=today_start
+    ).count()
+    
+    # Tickets creados ayer
+    tickets_yesterday = Ticket.objects.filter(
+        created_at__gte=yesterday_start,
+        created_at__lt=today_start
+    ).count()
+    
+    # Calcular variación tickets
+    if tickets_yesterday > 0:
+        tickets_variation = ((tickets_today - tickets_yesterday) / tickets_yesterday) * 100
+    else:
+        tickets_variation = 100 if tickets_today > 0 else 0
+    
+    # Reuniones de soporte hoy
+    from .models import SupportMeeting
+    meetings_today = SupportMeeting.objects.filter(
+        created_at__gte=today_start
+    ).count()
+    
+    # Reuniones de soporte ayer
+    meetings_yesterday = SupportMeeting.objects.filter(
+        created_at__gte=yesterday_start,
+        created_at__lt=today_start
+    ).count()
+    
+    # Calcular variación reuniones
+    if meetings_yesterday > 0:
+        meetings_variation = ((meetings_today - meetings_yesterday) / meetings_yesterday) * 100
+    else:
+        meetings_variation = 100 if meetings_today > 0 else 0
+    
+    # Total general de contactos
+    total_contacts = Contact.objects.count()
+    
+    # Total general de tickets
+    total_tickets = Ticket.objects.count()
+    
+    # Total general de reuniones
+    total_meetings = SupportMeeting.objects.count()
+    
+    # Contactos positivos vs negativos
+    contacts_positive = Contact.objects.filter(status='positive').count()
+    contacts_negative = Contact.objects.filter(status='negative').count()
+    
+    # Calcular porcentaje
+    total_with_status = contacts_positive + contacts_negative
+    if total_with_status > 0:
+        positive_percentage = (contacts_positive / total_with_status) * 100
+        negative_percentage = (contacts_negative / total_with_status) * 100
+    else:
+        positive_percentage = 0
+        negative_percentage = 0
+    
+    # Órdenes de trabajo hoy
+    from .models import WorkOrder
+    workorders_today = WorkOrder.objects.filter(
+        created_at__gte=today_start
+    ).count()
+    
+    # Órdenes de trabajo ayer
+    workorders_yesterday = WorkOrder.objects.filter(
+        created_at__gte=yesterday_start,
+        created_at__lt=today_start
+    ).count()
+    
+    # Calcular variación órdenes
+    if workorders_yesterday > 0:
+        workorders_variation = ((workorders_today - workorders_yesterday) / workorders_yesterday) * 100
+    else:
+        workorders_variation = 100 if workorders_today > 0 else 0
+    
+    # Total general de órdenes
+    total_workorders = WorkOrder.objects.count()
+    
+    # Evaluaciones hoy
+    from .models import UserAIPerformanceEvaluation
+    evaluations_today = UserAIPerformanceEvaluation.objects.filter(
+        created_at__gte=today_start
+    ).count()
+    
+    # Evaluaciones ayer
+    evaluations_yesterday = UserAIPerformanceEvaluation.objects.filter(
+        created_at__gte=yesterday_start,
+        created_at__lt=today_start
+    ).count()
+    
+    # Calcular variación evaluaciones
+    if evaluations_yesterday > 0:
+        evaluations_variation = ((evaluations_today - evaluations_yesterday) / evaluations_yesterday) * 100
+    else:
+        evaluations_variation = 100 if evaluations_today > 0 else 0
+    
+    # Total general de evaluaciones
+    total_evaluations = UserAIPerformanceEvaluation.objects.count()
+    
+    context = {
+        'page_title': 'Dashboard Empresarial',
+        'contacts_today': contacts_today,
+        'contacts_yesterday': contacts_yesterday,
+        'contacts_variation': contacts_variation,
+        'tickets_today': tickets_today,
+        'tickets_yesterday': tickets_yesterday,
+        'tickets_variation': tickets_variation,
+        'meetings_today': meetings_today,
+        'meetings_yesterday': meetings_yesterday,
+        'meetings_variation': meetings_variation,
+        'workorders_today': workorders_today,
+        'workorders_yesterday': workorders_yesterday,
+        'workorders_variation': workorders_variation,
+        'evaluations_today': evaluations_today,
+        'evaluations_yesterday': evaluations_yesterday,
+        'evaluations_variation': evaluations_variation,
+        'total_contacts': total_contacts,
+        'total_tickets': total_tickets,
+        'total_meetings': total_meetings,
+        'total_workorders': total_workorders,
+        'total_evaluations': total_evaluations,
+        'contacts_positive': contacts_positive,
+        'contacts_negative': contacts_negative,
+        'positive_percentage': positive_percentage,
+        'negative_percentage': negative_percentage,
+    }
+    
+    return render(request, 'tickets/business_dashboard.html', context)
+
+
+def business_dashboard_public(request, token):
+    """Dashboard empresarial público con token de acceso"""
+    from django.utils import timezone
+    from datetime import timedelta
+    from .models import SystemConfiguration
+    import hashlib
+    
+    # Verificar token
+    try:
+        config = SystemConfiguration.objects.first()
+        if not config:
+            return render(request, 'tickets/public_dashboard_error.html', {'error': 'Configuración no encontrada'})
+        
+        # Generar token esperado
+        secret = getattr(config, 'dashboard_secret', 'default-secret-key')
+        expected_token = hashlib.sha256(f"{secret}-dashboard".encode()).hexdigest()[:32]
+        
+        if token != expected_token:
+            return render(request, 'tickets/public_dashboard_error.html', {'error': 'Token inválido'})
+    except Exception as e:
+        return render(request, 'tickets/public_dashboard_error.html', {'error': str(e)})
+    
+    # Mismo código que business_dashboard pero sin @login_required
+    today = timezone.now().date()
+    yesterday = today - timedelta(days=1)
+    today_start = timezone.datetime.combine(today, timezone.datetime.min.time())
+    today_start = timezone.make_aware(today_start)
+    yesterday_start = timezone.datetime.combine(yesterday, timezone.datetime.min.time())
+    yesterday_start = timezone.make_aware(yesterday_start)
+    
+    contacts_today = Contact.objects.filter(created_at__gte=today_start).count()
+    contacts_yesterday = Contact.objects.filter(created_at__gte=yesterday_start, created_at__lt=today_start).count()
+    
+    if contacts_yesterday > 0:
+        contacts_variation = ((contacts_today - contacts_yesterday) / contacts_yesterday) * 100
+    else:
+        contacts_variation = 100 if contacts_today > 0 else 0
+    
+    from .models import Ticket
+    tickets_today = Ticket.objects.filter(created_at__gte=today_start).count()
+    tickets_yesterday = Ticket.objects.filter(created_at__gte=yesterday_start, created_at__lt=today_start).count()
+    
+    if tickets_yesterday > 0:
+        tickets_variation = ((tickets_today - tickets_yesterday) / tickets_yesterday) * 100
+    else:
+        tickets_variation = 100 if tickets_today > 0 else 0
+    
+    from .models import SupportMeeting
+    meetings_today = SupportMeeting.objects.filter(created_at__gte=today_start).count()
+    meetings_yesterday = SupportMeeting.objects.filter(created_at__gte=yesterday_start, created_at__lt=today_start).count()
+    
+    if meetings_yesterday > 0:
+        meetings_variation = ((meetings_today - meetings_yesterday) / meetings_yesterday) * 100
+    else:
+        meetings_variation = 100 if meetings_today > 0 else 0
+    
+    total_contacts = Contact.objects.count()
+    total_tickets = Ticket.objects.count()
+    total_meetings = SupportMeeting.objects.count()
+    
+    # Contactos positivos vs negativos
+    contacts_positive = Contact.objects.filter(status='positive').count()
+    contacts_negative = Contact.objects.filter(status='negative').count()
+    
+    total_with_status = contacts_positive + contacts_negative
+    if total_with_status > 0:
+        positive_percentage = (contacts_positive / total_with_status) * 100
+        negative_percentage = (contacts_negative / total_with_status) * 100
+    else:
+        positive_percentage = 0
+        negative_percentage = 0
+    
+    # Órdenes de trabajo hoy
+    from .models import WorkOrder
+    workorders_today = WorkOrder.objects.filter(
+        created_at__gte=today_start
+    ).count()
+    
+    # Órdenes de trabajo ayer
+    workorders_yesterday = WorkOrder.objects.filter(
+        created_at__gte=yesterday_start,
+        created_at__lt=today_start
+    ).count()
+    
+    # Calcular variación órdenes
+    if workorders_yesterday > 0:
+        workorders_variation = ((workorders_today - workorders_yesterday) / workorders_yesterday) * 100
+    else:
+        workorders_variation = 100 if workorders_today > 0 else 0
+    
+    # Total general de órdenes
+    total_workorders = WorkOrder.objects.count()
+    
+    # Evaluaciones hoy
+    from .models import UserAIPerformanceEvaluation
+    evaluations_today = UserAIPerformanceEvaluation.objects.filter(
+        created_at__gte=today_start
+    ).count()
+    
+    # Evaluaciones ayer
+    evaluations_yesterday = UserAIPerformanceEvaluation.objects.filter(
+        created_at__gte=yesterday_start,
+        created_at__lt=today_start
+    ).count()
+    
+    # Calcular variación evaluaciones
+    if evaluations_yesterday > 0:
+        evaluations_variation = ((evaluations_today - evaluations_yesterday) / evaluations_yesterday) * 100
+    else:
+        evaluations_variation = 100 if evaluations_today > 0 else 0
+    
+    # Total general de evaluaciones
+    total_evaluations = UserAIPerformanceEvaluation.objects.count()
+    
+    context = {
+        'page_title': 'Dashboard Empresarial',
+        'contacts_today': contacts_today,
+        'contacts_yesterday': contacts_yesterday,
+        'contacts_variation': contacts_variation,
+        'tickets_today': tickets_today,
+        'tickets_yesterday': tickets_yesterday,
+        'tickets_variation': tickets_variation,
+        'meetings_today': meetings_today,
+        'meetings_yesterday': meetings_yesterday,
+        'meetings_variation': meetings_variation,
+        'workorders_today': workorders_today,
+        'workorders_yesterday': workorders_yesterday,
+        'workorders_variation': workorders_variation,
+        'evaluations_today': evaluations_today,
+        'evaluations_yesterday': evaluations_yesterday,
+        'evaluations_variation': evaluations_variation,
+        'total_contacts': total_contacts,
+        'total_tickets': total_tickets,
+        'total_meetings': total_meetings,
+        'total_workorders': total_workorders,
+        'total_evaluations': total_evaluations,
+        'contacts_positive': contacts_positive,
+        'contacts_negative': contacts_negative,
+        'positive_percentage': positive_percentage,
+        'negative_percentage': negative_percentage,
+        'is_public': True,
+    }
+    
+    return render(request, 'tickets/business_dashboard.html', context)
+
+
+@login_required
+def generate_dashboard_token(request):
+    """Generar token para compartir dashboard públicamente"""
+    from django.http import JsonResponse
+    from .models import SystemConfiguration
+    import hashlib
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Método no permitido'}, status=405)
+    
+    try:
+        config = SystemConfiguration.objects.first()
+        if not config:
+            return JsonResponse({'error': 'Configuración no encontrada'}, status=400)
+        
+        # Generar token único
+        secret = getattr(config, 'dashboard_secret', 'default-secret-key')
+        token = hashlib.sha256(f"{secret}-dashboard".encode()).hexdigest()[:32]
+        
+        # Construir URL pública
+        public_url = request.build_absolute_uri(f'/business-dashboard/public/{token}/')
+        
+        return JsonResponse({
+            'success': True,
+            'token': token,
+            'url': public_url
+        })
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@login_required
+def contact_ai_comment(request, pk):
+    """Generar comentario asistido por IA para un contacto"""
+    import json
+    from django.http import JsonResponse
+    from .models import SystemConfiguration
+    import openai
+    
+    if request.method != 'POST':
+        return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+    
+    contact = get_object_or_404(Contact, pk=pk)
+    
+    try:
+        data = json.loads(request.body)
+        prompt_type = data.get('prompt_type', '')
+        custom_prompt = data.get('custom_prompt', '')
+        
+        # Obtener configuración de IA
+        try:
+            config = SystemConfiguration.objects.first()
+            if not config or not config.openai_api_key:
+                return JsonResponse({
+                    'status': 'error',
+                    'message': 'No se ha configurado la API de OpenAI en el sistema.'
+                }, status=400)
+            
+            model = config.openai_model or 'gpt-4'
+        except Exception as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': f'Error al obtener configuración: {str(e)}'
+            }, status=500)
+        
+        # Construir el contexto del contacto
+        contact_info = f"""
+Información del contacto:
+- Nombre: {contact.name}
+- Email: {contact.email or 'No disponible'}
+- Teléfono: {contact.phone or 'No disponible'}
+- Empresa: {contact.company or 'No disponible'}
+- Cargo: {contact.position or 'No disponible'}
+- País: {contact.country or 'No disponible'}
+- ERP: {contact.erp or 'No disponible'}
+- Estado: {contact.get_status_display()}
+- Fuente: {contact.source or 'No disponible'}
+- Notas previas: {contact.notes or 'Sin notas'}
+"""
+        
+        # Definir prompts según el tipo
+        prompts = {
+            'company_info': f"""Basándote en el email corporativo {contact.email} y la empresa {contact.company}, proporciona toda la información relevante que puedas inferir o conocer sobre esta empresa. Incluye detalles sobre su industria, tamaño aproximado, ubicación, servicios/productos principales y cualquier dato relevante. Si no tienes información específica, proporciona información general del sector y recomendaciones de qué investigar.
+
+{contact_info}
+
+IMPORTANTE: NO uses formato markdown ni asteriscos. Escribe en texto plano con saltos de línea normales.
+Responde en formato de comentario profesional, directo y útil para añadir al CRM (máximo 300 palabras).""",
+            
+            'contact_info': f"""Analiza toda la información disponible sobre este contacto: {contact.name} de {contact.company}. Proporciona insights sobre su perfil profesional, su rol probable en la toma de decisiones, y recomendaciones sobre cómo abordar la conversación comercial con esta persona.
+
+{contact_info}
+
+IMPORTANTE: NO uses formato markdown ni asteriscos. Escribe en texto plano con saltos de línea normales.
+Responde en formato de comentario profesional, directo y útil para añadir al CRM (máximo 300 palabras).""",
+            
+            'sales_estimate': f"""Basándote en la información de la empresa {contact.company} en {contact.country}, con ERP {contact.erp or 'no especificado'}, proporciona una estimación de:
+1. Ventas anuales aproximadas (rango)
+2. Presupuesto tecnológico probable
+3. Tamaño de oportunidad comercial estimada
+4. Ciclo de venta esperado
+
+{contact_info}
+
+IMPORTANTE: NO uses formato markdown ni asteriscos. Escribe en texto plano con saltos de línea normales.
+Proporciona rangos realistas y justifica brevemente cada estimación. Formato profesional para CRM (máximo 300 palabras).""",
+            
+            'employees_estimate': f"""Estima el número de empleados aproximado de {contact.company} en {contact.country}. Considera:
+1. Rango de empleados (ej: 50-100, 100-500, etc.)
+2. Departamentos clave probables
+3. Estructura organizacional estimada
+4. Nivel de madurez digital de la empresa
+
+{contact_info}
+
+IMPORTANTE: NO uses formato markdown ni asteriscos. Escribe en texto plano con saltos de línea normales.
+Proporciona estimaciones fundamentadas. Formato profesional para CRM (máximo 300 palabras).""",
+            
+            'next_steps': f"""Basándote en toda la información del contacto y su estado actual ({contact.get_status_display()}), sugiere los próximos pasos concretos y accionables para avanzar en la relación comercial. Incluye:
+1. Acciones inmediatas recomendadas
+2. Temas de conversación sugeridos
+3. Recursos o materiales a preparar
+4. Timing recomendado para el seguimiento
+
+{contact_info}
+
+IMPORTANTE: NO uses formato markdown ni asteriscos. Escribe en texto plano con saltos de línea normales.
+Sé específico y práctico. Formato profesional para CRM (máximo 300 palabras).""",
+            
+            'custom': f"""{custom_prompt}
+
+Contexto del contacto:
+{contact_info}
+
+IMPORTANTE: NO uses formato markdown ni asteriscos. Escribe en texto plano con saltos de línea normales.
+Responde de manera profesional y útil para añadir como comentario en el CRM (máximo 300 palabras)."""
+        }
+        
+        # Seleccionar el prompt apropiado
+        if prompt_type == 'custom' and custom_prompt:
+            system_prompt = "Eres un asistente comercial experto que ayuda a gestionar contactos y oportunidades de venta en un CRM. Proporciona información precisa, profesional y accionable."
+            user_prompt = prompts['custom']
+        elif prompt_type in prompts:
+            system_prompt = "Eres un asistente comercial experto que ayuda a gestionar contactos y oportunidades de venta en un CRM. Proporciona información precisa, profesional y accionable."
+            user_prompt = prompts[prompt_type]
+        else:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Tipo de prompt no válido.'
+            }, status=400)
+        
+        # Configurar cliente OpenAI (forma moderna que funciona)
+        try:
+            client = openai.OpenAI(api_key=config.openai_api_key)
+            
+            response = client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.7,
+                max_tokens=800
+            )
+            
+            ai_response = response.choices[0].message.content.strip()
+            
+            return JsonResponse({
+                'status': 'success',
+                'comment': ai_response
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': f'Error al comunicarse con OpenAI: {str(e)}'
+            }, status=500)
+            
+    except json.JSONDecodeError:
+        return JsonResponse({
+            'status': 'error',
+            'message': 'Error al decodificar JSON.'
+        }, status=400)
+    except Exception as e:
+        return JsonResponse({
+            'status': 'error',
+            'message': f'Error inesperado: {str(e)}'
+        }, status=500)
+
+
+@login_required
+def contact_attachment_download(request, pk):
+    """Descargar adjunto de contacto"""
+    from .models import ContactAttachment
+    from django.http import HttpResponse, Http404
+    import mimetypes
+    
+    attachment = get_object_or_404(ContactAttachment, pk=pk)
+    
+    try:
+        if attachment.file and os.path.exists(attachment.file.path):
+            # Determinar el tipo MIME
+            content_type, encoding = mimetypes.guess_type(attachment.file.path)
+            if content_type is None:
+                content_type = 'application/octet-stream'
+            
+            # Leer el archivo
+            with open(attachment.file.path, 'rb') as f:
+                response = HttpResponse(f.read(), content_type=content_type)
+                response['Content-Disposition'] = f'attachment; filename="{attachment.original_filename}"'
+                return response
+        else:
+            raise Http404("El archivo no existe")
+    except Exception as e:
+        messages.error(request, f'Error al descargar el archivo: {str(e)}')
+        return redirect('contact_detail', pk=attachment.contact.pk)
+
+
+# ===== VISTAS DE PLAN DE VENTAS =====
+
+@login_required
+def sales_plan_list(request):
+    """Lista de planes de venta"""
+    from .models import SalesPlan
+    
+    plans = SalesPlan.objects.filter(is_active=True).select_related('user')
+    
+    # Si no es admin, solo mostrar su propio plan
+    if not request.user.is_staff:
+        plans = plans.filter(user=request.user)
+    
+    context = {
+        'plans': plans,
+        'page_title': 'Planes de Venta'
+    }
+    
+    return render(request, 'tickets/sales_plan_list.html', context)
+
+
+@login_required
+def sales_plan_create(request):
+    """Crear plan de venta"""
+    from .models import SalesPlan
+    from .forms import SalesPlanForm
+    
+    if request.method == 'POST':
+        form = SalesPlanForm(request.POST)
+        if form.is_valid():
+            plan = form.save(commit=False)
+            # Si no es admin, solo puede crear plan para sí mismo
+            if not request.user.is_staff:
+                plan.user = request.user
+            plan.save()
+            messages.success(request, 'Plan de venta creado exitosamente.')
+            return redirect('sales_plan_list')
+    else:
+        form = SalesPlanForm()
+        # Si no es admin, pre-seleccionar el usuario actual
+        if not request.user.is_staff:
+            form.fields['user'].initial = request.user
+            form.fields['user'].widget.attrs['readonly'] = True
+    
+    context = {
+        'form': form,
+        'page_title': 'Nuevo Plan de Venta'
+    }
+    
+    return render(request, 'tickets/sales_plan_form.html', context)
+
+
+@login_required
+def sales_plan_edit(request, pk):
+    """Editar plan de venta"""
+    from .models import SalesPlan
+    from .forms import SalesPlanForm
+    
+    plan = get_object_or_404(SalesPlan, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.is_staff and plan.user != request.user:
+        messages.error(request, 'No tienes permiso para editar este plan.')
+        return redirect('sales_plan_list')
+    
+    if request.method == 'POST':
+        form = SalesPlanForm(request.POST, instance=plan)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Plan de venta actualizado exitosamente.')
+            return redirect('sales_plan_list')
+    else:
+        form = SalesPlanForm(instance=plan)
+    
+    context = {
+        'form': form,
+        'plan': plan,
+        'page_title': f'Editar Plan de {plan.user.get_full_name() or plan.user.username}'
+    }
+    
+    return render(request, 'tickets/sales_plan_form.html', context)
+
+
+@login_required
+def sales_plan_delete(request, pk):
+    """Eliminar plan de venta"""
+    from .models import SalesPlan
+    
+    plan = get_object_or_404(SalesPlan, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.is_staff and plan.user != request.user:
+        messages.error(request, 'No tienes permiso para eliminar este plan.')
+        return redirect('sales_plan_list')
+    
+    if request.method == 'POST':
+        user_name = plan.user.get_full_name() or plan.user.username
+        plan.delete()
+        messages.success(request, f'Plan de {user_name} eliminado exitosamente.')
+        return redirect('sales_plan_list')
+    
+    context = {
+        'plan': plan,
+        'page_title': f'Eliminar Plan de {plan.user.get_full_name() or plan.user.username}'
+    }
+    
+    return render(request, 'tickets/sales_plan_delete.html', context)
+
+
+# ==================== CONTACTO WEB ====================
+
+def quien_eres_wizard(request):
+    """Formulario de contacto wizard público (3 pasos)"""
+    from .models import Contact, ContactoWeb, SystemConfiguration
+
+    step = request.session.get('quien_eres_step', 1)
+
+    if request.method == 'POST':
+        action = request.POST.get('action')
+
+        if action == 'step1':
+            nombre = request.POST.get('nombre', '').strip()
+            email = request.POST.get('email', '').strip()
+            if not nombre or not email:
+                return render(request, 'tickets/quien_eres_wizard.html', {
+                    'step': 1,
+                    'error': 'El nombre y el email son obligatorios.',
+                    'data': request.POST,
+                })
+            request.session['quien_eres_data'] = {
+                'nombre': nombre,
+                'email': email,
+                'telefono': request.POST.get('telefono', '').strip(),
+                'empresa': request.POST.get('empresa', '').strip(),
+                'pais': request.POST.get('pais', '').strip(),
+                'ciudad': request.POST.get('ciudad', '').strip(),
+            }
+            request.session['quien_eres_step'] = 2
+            return redirect('quien_eres_wizard')
+
+        elif action == 'step2':
+            data = request.session.get('quien_eres_data', {})
+            mensaje = request.POST.get('mensaje', '').strip()
+            acepto_forma_trabajo = request.POST.get('acepto_forma_trabajo')
+            config = SystemConfiguration.objects.first()
+            ft_url = config.forma_trabajo_url if config else ''
+            if not mensaje:
+                return render(request, 'tickets/quien_eres_wizard.html', {
+                    'step': 2,
+                    'error': 'Por favor, cuéntame qué deseas hablar.',
+                    'data': request.POST,
+                    'config': config,
+                    'forma_trabajo_url': ft_url,
+                })
+            if ft_url and not acepto_forma_trabajo:
+                return render(request, 'tickets/quien_eres_wizard.html', {
+                    'step': 2,
+                    'error': 'Debes revisar y aceptar la forma de trabajo antes de continuar.',
+                    'data': request.POST,
+                    'config': config,
+                    'forma_trabajo_url': ft_url,
+                })
+            # Obtener IP
+            x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+            ip = x_forwarded_for.split(',')[0] if x_forwarded_for else request.META.get('REMOTE_ADDR')
+
+            # Verificar si el email ya existe en el CRM
+            email_contacto = data.get('email', '')
+            if email_contacto and Contact.objects.filter(email__iexact=email_contacto).exists():
+                # Guardar igualmente el mensaje en ContactoWeb como histórico
+                ContactoWeb.objects.create(
+                    nombre=data.get('nombre', ''),
+                    email=email_contacto,
+                    telefono=data.get('telefono') or None,
+                    empresa=data.get('empresa') or None,
+                    asunto='Contacto vía formulario ¿Quién eres? (email ya registrado)',
+                    mensaje=mensaje,
+                    ip_address=ip,
+                    user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
+                )
+                request.session.pop('quien_eres_data', None)
+                request.session.pop('quien_eres_step', None)
+                request.session['quien_eres_step'] = 3
+                request.session['quien_eres_ya_registrado'] = True
+                return redirect('quien_eres_wizard')
+
+            # Crear contacto en el CRM (/contacts/)
+            from django.contrib.auth import get_user_model
+            User = get_user_model()
+            system_user = User.objects.filter(is_superuser=True).order_by('id').first()
+            pais = data.get('pais', '')
+            ciudad = data.get('ciudad', '')
+            ubicacion = ', '.join(filter(None, [ciudad, pais]))
+            notas_contacto = mensaje
+            if ubicacion:
+                notas_contacto = f"Ubicación: {ubicacion}\n\n{mensaje}"
+            Contact.objects.create(
+                name=data.get('nombre', ''),
+                email=data.get('email', '') or None,
+                phone=data.get('telefono', '') or None,
+                company=data.get('empresa', '') or None,
+                country=pais or None,
+                source='Formulario ¿Quién eres?',
+                status='neutral',
+                notes=notas_contacto,
+                created_by=system_user,
+            )
+
+            # Crear ContactoWeb (registro histórico)
+            ContactoWeb.objects.create(
+                nombre=data.get('nombre', ''),
+                email=data.get('email', ''),
+                telefono=data.get('telefono') or None,
+                empresa=data.get('empresa') or None,
+                asunto='Contacto vía formulario ¿Quién eres?',
+                mensaje=mensaje,
+                ip_address=ip,
+                user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
+            )
+
+            # Notificación Telegram
+            config = SystemConfiguration.objects.first()
+            if config and config.telegram_bot_token and config.telegram_chat_id:
+                try:
+                    from .notification_utils import queue_telegram
+                    from django.utils import timezone
+                    nombre_c = data.get('nombre', '')
+                    email_c = data.get('email', '')
+                    telefono_c = data.get('telefono', '') or '—'
+                    empresa_c = data.get('empresa', '') or '—'
+                    pais_tg = data.get('pais', '') or '—'
+                    ciudad_tg = data.get('ciudad', '') or '—'
+                    tg_msg = (
+                        f"👋 <b>Nuevo contacto — ¿Quién eres?</b>\n\n"
+                        f"👤 <b>Nombre:</b> {nombre_c}\n"
+                        f"📧 <b>Email:</b> {email_c}\n"
+                        f"📞 <b>Teléfono:</b> {telefono_c}\n"
+                        f"🏢 <b>Empresa:</b> {empresa_c}\n"
+                        f"🌍 <b>País:</b> {pais_tg}\n"
+                        f"🏙️ <b>Ciudad:</b> {ciudad_tg}\n\n"
+                        f"💬 <b>Mensaje:</b>\n{mensaje}\n\n"
+                        f"🕐 {timezone.now().strftime('%d/%m/%Y %H:%M')}"
+                    )
+                    queue_telegram(
+                        bot_token=config.telegram_bot_token,
+                        chat_id=config.telegram_chat_id,
+                        text=tg_msg,
+                        parse_mode='HTML',
+                    )
+                except Exception:
+                    pass
+
+            # Limpiar sesión
+            request.session.pop('quien_eres_data', None)
+            request.session.pop('quien_eres_step', None)
+            request.session['quien_eres_step'] = 3
+            return redirect('quien_eres_wizard')
+
+        elif action == 'restart':
+            request.session.pop('quien_eres_data', None)
+            request.session.pop('quien_eres_ya_registrado', None)
+            request.session['quien_eres_step'] = 1
+            return redirect('quien_eres_wizard')
+
+    else:
+        step = request.session.get('quien_eres_step', 1)
+
+    config = SystemConfiguration.objects.first()
+    ya_registrado = request.session.pop('quien_eres_ya_registrado', False)
+    return render(request, 'tickets/quien_eres_wizard.html', {
+        'step': step,
+        'config': config,
+        'data': request.session.get('quien_eres_data', {}),
+        'forma_trabajo_url': config.forma_trabajo_url if config else '',
+        'ya_registrado': ya_registrado,
+    })
+
+
+def contacto_web(request):
+    """Vista pública para formulario de contacto"""
+    from .forms import ContactoWebForm
+    from .models import ContactoWeb
+    from datetime import datetime, timedelta
+    from django.utils import timezone
+    
+    # Obtener IP del usuario para control de spam
+    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    if x_forwarded_for:
+        user_ip = x_forwarded_for.split(',')[0]
+    else:
+        user_ip = request.META.get('REMOTE_ADDR')
+    
+    # Verificar límite de envíos (máximo 3 por hora por IP)
+    one_hour_ago = timezone.now() - timedelta(hours=1)
+    recent_contacts = ContactoWeb.objects.filter(
+        ip_address=user_ip,
+        fecha_creacion__gte=one_hour_ago
+    ).count()
+    
+    if recent_contacts >= 3:
+        messages.error(request, 'Has alcanzado el límite de contactos por hora. Por favor, inténtalo más tarde.')
+        form = ContactoWebForm()
+        # Generar CAPTCHA aunque no se pueda enviar
+        import random
+        num1 = random.randint(1, 10)
+        num2 = random.randint(1, 10)
+        operation = random.choice(['+', '-', '*'])
+        
+        if operation == '+':
+            question = f"¿Cuánto es {num1} + {num2}?"
+            correct_answer = num1 + num2
+        elif operation == '-':
+            if num1 < num2:
+                num1, num2 = num2, num1
+            question = f"¿Cuánto es {num1} - {num2}?"
+            correct_answer = num1 - num2
+        else:
+            question = f"¿Cuánto es {num1} × {num2}?"
+            correct_answer = num1 * num2
+        
+        request.session['captcha_answer'] = correct_answer
+        form.fields['captcha_question'].initial = question
+        
+        context = {
+            'form': form,
+            'page_title': 'Contáctanos',
+            'rate_limited': True
+        }
+        return render(request, 'tickets/contacto_web.html', context)
+    
+    if request.method == 'POST':
+        form = ContactoWebForm(request.POST)
+        
+        # Verificar CAPTCHA
+        captcha_answer = request.POST.get('captcha_answer')
+        correct_answer = request.session.get('captcha_answer')
+        
+        if not captcha_answer or not correct_answer:
+            form.add_error('captcha_answer', 'Error en la verificación. Recarga la página e inténtalo de nuevo.')
+        else:
+            try:
+                if int(captcha_answer) != correct_answer:
+                    form.add_error('captcha_answer', 'La respuesta del CAPTCHA es incorrecta. Inténtalo de nuevo.')
+            except (ValueError, TypeError):
+                form.add_error('captcha_answer', 'Por favor, introduce solo números en el resultado.')
+        
+        if form.is_valid():
+            # Guardar el contacto con información adicional
+            contacto = form.save(commit=False)
+            
+            # Obtener IP del usuario
+            contacto.ip_address = user_ip
+            
+            # Obtener User Agent
+            contacto.user_agent = request.META.get('HTTP_USER_AGENT', '')
+            
+            contacto.save()
+            
+            # Enviar notificación por email
+            try:
+                from .utils import send_contact_notification
+                send_contact_notification(contacto)
+            except Exception as e:
+                # Log del error pero no interrumpir el flujo
+                import logging
+                logger = logging.getLogger(__name__)
+                logger.error(f"Error enviando notificación de contacto: {str(e)}")
+            
+            # Limpiar CAPTCHA de la sesión después del envío exitoso
+            if 'captcha_answer' in request.session:
+                del request.session['captcha_answer']
+            
+            messages.success(request, '¡Gracias por contactarnos! Hemos recibido tu mensaje y te responderemos pronto.')
+            return redirect('contacto_web')
+    else:
+        form = ContactoWebForm()
+        
+    # Generar nuevo CAPTCHA y guardarlo en la sesión
+    import random
+    num1 = random.randint(1, 10)
+    num2 = random.randint(1, 10)
+    operation = random.choice(['+', '-', '*'])
+    
+    if operation == '+':
+        question = f"¿Cuánto es {num1} + {num2}?"
+        correct_answer = num1 + num2
+    elif operation == '-':
+        # Asegurar que el resultado sea positivo
+        if num1 < num2:
+            num1, num2 = num2, num1
+        question = f"¿Cuánto es {num1} - {num2}?"
+        correct_answer = num1 - num2
+    else:  # multiplicación
+        question = f"¿Cuánto es {num1} × {num2}?"
+        correct_answer = num1 * num2
+    
+    # Guardar la respuesta correcta en la sesión
+    request.session['captcha_answer'] = correct_answer
+    
+    # Establecer la pregunta en el formulario
+    form.fields['captcha_question'].initial = question
+    
+    context = {
+        'form': form,
+        'page_title': 'Contáctanos'
+    }
+    
+    return render(request, 'tickets/contacto_web.html', context)
+
+
+@login_required
+def contactos_web_list(request):
+    """Vista para listar contactos web - solo para agentes"""
+    from .utils import is_agent
+    from .models import ContactoWeb
+    
+    if not is_agent(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección')
+        return redirect('dashboard')
+    
+    # Filtros
+    search = request.GET.get('search', '')
+    status_filter = request.GET.get('status', 'all')
+    date_from = request.GET.get('date_from', '')
+    date_to = request.GET.get('date_to', '')
+    
+    # Obtener contactos
+    contactos = ContactoWeb.objects.all().order_by('-fecha_creacion')
+    
+    # Aplicar filtros
+    if search:
+        from django.db.models import Q
+        contactos = contactos.filter(
+            Q(nombre__icontains=search) |
+            Q(email__icontains=search) |
+            Q(empresa__icontains=search) |
+            Q(asunto__icontains=search) |
+            Q(mensaje__icontains=search)
+        )
+    
+    if status_filter == 'no_leido':
+        contactos = contactos.filter(leido=False)
+    elif status_filter == 'leido':
+        contactos = contactos.filter(leido=True)
+    elif status_filter == 'respondido':
+        contactos = contactos.filter(respondido=True)
+    elif status_filter == 'pendiente':
+        contactos = contactos.filter(respondido=False)
+    
+    if date_from:
+        try:
+            from datetime import datetime
+            date_from_obj = datetime.strptime(date_from, '%Y-%m-%d')
+            contactos = contactos.filter(fecha_creacion__date__gte=date_from_obj.date())
+        except ValueError:
+            pass
+    
+    if date_to:
+        try:
+            from datetime import datetime
+            date_to_obj = datetime.strptime(date_to, '%Y-%m-%d')
+            contactos = contactos.filter(fecha_creacion__date__lte=date_to_obj.date())
+        except ValueError:
+            pass
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(contactos, 25)  # 25 contactos por página
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Estadísticas
+    total_contactos = ContactoWeb.objects.count()
+    no_leidos = ContactoWeb.objects.filter(leido=False).count()
+    respondidos = ContactoWeb.objects.filter(respondido=True).count()
+    pendientes = ContactoWeb.objects.filter(respondido=False).count()
+    
+    context = {
+        'page_obj': page_obj,
+        'contactos': page_obj,
+        'current_filters': {
+            'search': search,
+            'status': status_filter,
+            'date_from': date_from,
+            'date_to': date_to,
+        },
+        'stats': {
+            'total_contactos': total_contactos,
+            'no_leidos': no_leidos,
+            'respondidos': respondidos,
+            'pendientes': pendientes,
+        },
+        'page_title': 'Contactos Web'
+    }
+    
+    return render(request, 'tickets/contactos_web_list.html', context)
+
+
+@login_required
+def contacto_web_detail(request, pk):
+    """Vista para ver detalle de un contacto web"""
+    from .utils import is_agent
+    from .models import ContactoWeb
+    
+    if not is_agent(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección')
+        return redirect('dashboard')
+    
+    contacto = get_object_or_404(ContactoWeb, pk=pk)
+    
+    # Marcar como leído si no lo estaba
+    if not contacto.leido:
+        contacto.leido = True
+        contacto.save()
+    
+    # Si es POST, actualizar estado de respondido
+    if request.method == 'POST':
+        if 'marcar_respondido' in request.POST:
+            contacto.respondido = True
+            contacto.save()
+            messages.success(request, 'Contacto marcado como respondido')
+        elif 'marcar_pendiente' in request.POST:
+            contacto.respondido = False
+            contacto.save()
+            messages.success(request, 'Contacto marcado como pendiente')
+        
+        return redirect('contacto_web_detail', pk=pk)
+    
+    context = {
+        'contacto': contacto,
+        'page_title': f'Contacto: {contacto.nombre}'
+    }
+    
+    return render(request, 'tickets/contacto_web_detail.html', context)
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def landing_page_list(request):
+    """Vista para listar todas las landing pages"""
+    landing_pages = LandingPage.objects.all().order_by('-created_at')
+    
+    context = {
+        'page_title': 'Landing Pages',
+        'landing_pages': landing_pages,
+    }
+    
+    return render(request, 'tickets/landing_page_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def landing_page_create(request):
+    """Vista para crear una nueva landing page"""
+    if request.method == 'POST':
+        form = LandingPageForm(request.POST, request.FILES)
+        if form.is_valid():
+            landing_page = form.save(commit=False)
+            landing_page.created_by = request.user
+            landing_page.save()
+            messages.success(request, 'Landing Page creada exitosamente.')
+            return redirect('landing_page_detail', pk=landing_page.pk)
+        else:
+            # Agregar errores del formulario a los mensajes
+            for field, errors in form.errors.items():
+                for error in errors:
+                    messages.error(request, f'Error en {field}: {error}')
+    else:
+        form = LandingPageForm()
+    
+    context = {
+        'page_title': 'Crear Landing Page',
+        'form': form,
+    }
+    
+    return render(request, 'tickets/landing_page_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+@login_required
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def landing_page_detail(request, pk):
+    """Vista para ver detalles de una landing page"""
+    landing_page = get_object_or_404(LandingPage, pk=pk)
+    # Solo mostrar submissions que no han sido procesadas (pendientes por contactar)
+    submissions = landing_page.submissions.filter(processed=False).order_by('-created_at')[:20]
+    
+    context = {
+        'page_title': f'Landing Page: {landing_page.nombre_producto}',
+        'landing_page': landing_page,
+        'submissions': submissions,
+    }
+    
+    return render(request, 'tickets/landing_page_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def landing_page_edit(request, pk):
+    """Vista para editar una landing page"""
+    landing_page = get_object_or_404(LandingPage, pk=pk)
+    
+    if request.method == 'POST':
+        form = LandingPageForm(request.POST, request.FILES, instance=landing_page)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Landing Page actualizada exitosamente.')
+            return redirect('landing_page_detail', pk=landing_page.pk)
+    else:
+        form = LandingPageForm(instance=landing_page)
+    
+    context = {
+        'page_title': f'Editar Landing Page: {landing_page.nombre_producto}',
+        'form': form,
+        'landing_page': landing_page,
+    }
+    
+    return render(request, 'tickets/landing_page_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def landing_page_delete(request, pk):
+    """Vista para eliminar una landing page"""
+    landing_page = get_object_or_404(LandingPage, pk=pk)
+    
+    if request.method == 'POST':
+        landing_page.delete()
+        messages.success(request, 'Landing Page eliminada exitosamente.')
+        return redirect('landing_page_list')
+    
+    context = {
+        'page_title': f'Eliminar Landing Page: {landing_page.nombre_producto}',
+        'landing_page': landing_page,
+    }
+    
+    return render(request, 'tickets/landing_page_delete.html', context)
+
+
+def count_landing_page_view(request, slug):
+    """Suma la visita cuando la landing page se sirve desde la caché de páginas"""
+    LandingPage.objects.filter(slug=slug, is_active=True).update(views_count=F('views_count') + 1)
+
+
+@cache_public_page('landing', on_hit=count_landing_page_view)
+def landing_page_public(request, slug):
+    """Vista pública de la landing page"""
+    landing_page = get_object_or_404(LandingPage, slug=slug, is_active=True)
+    
+    # Incrementar contador de visitas
+    landing_page.increment_views()
+    
+    if request.method == 'POST':
+        # Obtener la IP del usuario
+        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+        if x_forwarded_for:
+            user_ip = x_forwarded_for.split(',')[0]
+        else:
+            user_ip = request.META.get('REMOTE_ADDR')
+        
+        # Verificar si ya hay un envío de esta IP hoy
+        today = date.today()
+        existing_submission = LandingPageSubmission.objects.filter(
+            landing_page=landing_page,
+            ip_address=user_ip,
+            created_at__date=today
+        ).exists()
+        
+        # Si ya existe un envío, mostrar éxito pero NO crear contacto (modo silencioso)
+        if existing_submission:
+            form = LandingPageSubmissionForm(request.POST)
+            
+            # Si es una petición AJAX, devolver JSON de éxito
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({
+                    'success': True,
+                    'message': '¡Formulario enviado con éxito! Nos pondremos en contacto contigo pronto.'
+                })
+            
+            # Redirigir a página de gracias (sin crear nada)
+            return render(request, 'tickets/landing_page_thanks.html', {
+                'landing_page': landing_page,
+                'submission': None,
+            })
+        
+        form = LandingPageSubmissionForm(request.POST)
+        if form.is_valid():
+            submission = form.save(commit=False)
+            submission.landing_page = landing_page
+            
+            # Capturar información adicional
+            submission.ip_address = user_ip
+            submission.user_agent = request.META.get('HTTP_USER_AGENT', '')
+            submission.utm_source = request.GET.get('utm_source', '')
+            submission.utm_medium = request.GET.get('utm_medium', '')
+            submission.utm_campaign = request.GET.get('utm_campaign', '')
+            
+            submission.save()
+            
+            # Detectar spam por teléfono (menos de 5 dígitos)
+            is_spam = False
+            if submission.telefono:
+                phone_digits = ''.join(filter(str.isdigit, submission.telefono))
+                if len(phone_digits) < 5:
+                    is_spam = True
+                    import logging
+                    logger = logging.getLogger(__name__)
+                    logger.warning(
+                        f"SPAM detectado en formulario público submission {submission.pk}: "
+                        f"teléfono '{submission.telefono}' ({len(phone_digits)} dígitos). "
+                        f"Email: {submission.email}. No se creará contacto."
+                    )
+            
+            # Crear contacto y enviar notificaciones SOLO si NO es spam
+            if not is_spam:
+                # Crear contacto web automáticamente
+                try:
+                    # En vista pública no hay usuario logueado, así que created_by será None
+                    contact = create_contact_from_submission(submission, landing_page, created_by=None)
+                    
+                    # Enviar notificación de creación de contacto
+                    try:
+                        from .utils import send_contact_creation_notification
+                        send_contact_creation_notification(contact, landing_page)
+                    except Exception as e:
+                        import logging
+                        logger = logging.getLogger(__name__)
+                        logger.error(f"Error enviando notificación de contacto: {str(e)}")
+                        
+                except Exception as e:
+                    import logging
+                    logger = logging.getLogger(__name__)
+                    logger.error(f"Error creando contacto desde landing page: {str(e)}")
+            
+            # Incrementar contador de envíos (siempre, incluso para spam)
+            landing_page.increment_submissions()
+            
+            # Enviar notificaciones SOLO si NO es spam
+            if not is_spam:
+                # Enviar notificación por email si está configurada
+                try:
+                    from .utils import send_landing_page_notification
+                    send_landing_page_notification(submission)
+                except Exception as e:
+                    import logging
+                    logger = logging.getLogger(__name__)
+                    logger.error(f"Error enviando notificación de landing page: {str(e)}")
+                
+                # Enviar notificación por Telegram si está configurada
+                try:
+                    from .utils import send_telegram_notification
+                    send_telegram_notification(landing_page, submission)
+                except Exception as e:
+                    import logging
+                    logger = logging.getLogger(__name__)
+                    logger.error(f"Error enviando notificación de Telegram: {str(e)}")
+            
+            # SIEMPRE devolver éxito (tanto para spam como para válidos)
+            # Si es una petición AJAX, devolver JSON de éxito
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({
+                    'success': True,
+                    'message': '¡Formulario enviado con éxito! Nos pondremos en contacto contigo pronto.'
+                })
+            
+            # Redirigir a página de gracias
+            return render(request, 'tickets/landing_page_thanks.html', {
+                'landing_page': landing_page,
+                'submission': submission,
+            })
+        else:
+            # El formulario no es válido
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                # Recopilar errores del formulario
+                errors = {}
+                for field, error_list in form.errors.items():
+                    errors[field] = list(error_list)
+                
+                return JsonResponse({
+                    'success': False,
+                    'errors': errors,
+                    'message': 'Por favor, corrige los errores en el formulario.'
+                })
+    else:
+        form = LandingPageSubmissionForm()
+    
+    context = {
+        'landing_page': landing_page,
+        'form': form,
+    }
+    
+    return render(request, 'tickets/landing_page_public.html', context)
+
+
+@csrf_exempt
+@require_POST
+def landing_page_api_submit(request, pk):
+    """Endpoint API público que acepta JSON POST para crear un LandingPageSubmission.
+    Ruta: /api/landing-pages/<pk>/submit/
+    Requiere header: Authorization: Bearer <api_token>
+    """
+    import json
+    from .models import LandingPage, LandingPageSubmission
+
+    landing_page = get_object_or_404(LandingPage, pk=pk, is_active=True)
+
+    # Validar token de API
+    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+    if not auth_header.startswith('Bearer '):
+        return JsonResponse({'success': False, 'error': 'Missing or invalid Authorization header. Use: Authorization: Bearer <api_token>'}, status=401)
+    
+    token = auth_header.replace('Bearer ', '').strip()
+    if str(landing_page.api_token) != token:
+        return JsonResponse({'success': False, 'error': 'Invalid API token'}, status=403)
+
+    # Obtener body JSON
+    try:
+        payload = json.loads(request.body.decode('utf-8')) if request.body else {}
+    except Exception:
+        return JsonResponse({'success': False, 'error': 'Invalid JSON body'}, status=400)
+
+    # Campos esperados
+    nombre = payload.get('nombre') or payload.get('first_name')
+    apellido = payload.get('apellido') or payload.get('last_name')
+    email = payload.get('email')
+    telefono = payload.get('telefono') or payload.get('phone')
+    empresa = payload.get('empresa') or payload.get('company')
+    cargo = payload.get('cargo') or payload.get('position')
+    mensaje = payload.get('mensaje') or payload.get('message')
+    preferred_contact_time = payload.get('preferred_contact_time')
+
+    # Validación básica
+    if not nombre or not apellido or not email:
+        return JsonResponse({'success': False, 'error': 'Missing required fields: nombre, apellido, email'}, status=400)
+
+    # Obtener IP y user agent
+    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    if x_forwarded_for:
+        user_ip = x_forwarded_for.split(',')[0]
+    else:
+        user_ip = request.META.get('REMOTE_ADDR')
+
+    user_agent = request.META.get('HTTP_USER_AGENT', '')
+
+    # Crear el envío
+    submission = LandingPageSubmission(
+        landing_page=landing_page,
+        nombre=nombre,
+        apellido=apellido,
+        email=email,
+        telefono=telefono or '',
+        empresa=empresa or '',
+        cargo=cargo or '',
+        mensaje=mensaje or '',
+        preferred_contact_time=preferred_contact_time or 'asap',
+        ip_address=user_ip,
+        user_agent=user_agent,
+        utm_source=payload.get('utm_source', ''),
+        utm_medium=payload.get('utm_medium', ''),
+        utm_campaign=payload.get('utm_campaign', ''),
+    )
+    submission.save()
+
+    # Detectar spam por teléfono (menos de 5 dígitos)
+    is_spam = False
+    if telefono:
+        phone_digits = ''.join(filter(str.isdigit, telefono))
+        if len(phone_digits) < 5:
+            is_spam = True
+            import logging
+            logging.getLogger(__name__).warning(
+                f"SPAM detectado en API submission {submission.pk}: "
+                f"teléfono '{telefono}' ({len(phone_digits)} dígitos). "
+                f"Email: {email}. No se creará contacto."
+            )
+
+    # Crear contacto y notificaciones SOLO si NO es spam
+    if not is_spam:
+        try:
+            create_contact_from_submission(submission, landing_page, created_by=None)
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).error(f"Error creando contacto desde API: {e}")
+
+    # Incrementar contador de envíos (siempre, incluso para spam)
+    try:
+        landing_page.increment_submissions()
+    except Exception:
+        pass
+
+    # Enviar notificaciones SOLO si NO es spam
+    if not is_spam:
+        try:
+            from .utils import send_landing_page_notification
+            send_landing_page_notification(submission)
+        except Exception:
+            pass
+
+        try:
+            from .utils import send_telegram_notification
+            send_telegram_notification(landing_page, submission)
+        except Exception:
+            pass
+
+    # SIEMPRE devolver éxito (incluso si es spam, para no alertar al atacante)
+    return JsonResponse({'success': True, 'message': 'Submission created', 'submission_id': submission.pk})
+
+
+def create_contact_from_submission(submission, landing_page, created_by=None):
+    """Crear un contacto desde un envío de landing page"""
+    from .models import Contact
+    from django.contrib.auth.models import User
+    
+    # Si no hay usuario logueado, usar un usuario sistema
+    if created_by is None:
+        # Buscar o crear un usuario sistema para contacts automáticos
+        system_user, created = User.objects.get_or_create(
+            username='system_landing_pages',
+            defaults={
+                'first_name': 'Sistema',
+                'last_name': 'Landing Pages',
+                'email': 'system@landingpages.local',
+                'is_active': False  # Usuario inactivo para que no pueda loguearse
+            }
+        )
+        created_by = system_user
+    
+    # Verificar si ya existe un contacto con el mismo email
+    existing_contact = Contact.objects.filter(
+        email=submission.email
+    ).first()
+    
+    # Preparar notas con información del landing page y mensaje del usuario
+    notas_base = f"Contacto generado desde landing page: {landing_page.nombre_producto}\n\n"
+    
+    # Agregar mensaje del usuario si existe
+    if hasattr(submission, 'mensaje') and submission.mensaje:
+        notas_base += f"Mensaje del cliente:\n{submission.mensaje}\n\n"
+    
+    # Agregar información de seguimiento
+    notas_base += f"Datos de seguimiento:\n" \
+                  f"- UTM Source: {submission.utm_source or 'N/A'}\n" \
+                  f"- UTM Medium: {submission.utm_medium or 'N/A'}\n" \
+                  f"- UTM Campaign: {submission.utm_campaign or 'N/A'}\n" \
+                  f"- IP Address: {submission.ip_address or 'N/A'}\n" \
+                  f"- Fecha de envío: {submission.created_at.strftime('%d/%m/%Y %H:%M')}"
+    
+    if existing_contact:
+        # Actualizar el contacto existente con nueva información
+        existing_contact.name = f"{submission.nombre} {submission.apellido}".strip()
+        if submission.telefono:
+            existing_contact.phone = submission.telefono
+        if submission.empresa:
+            existing_contact.company = submission.empresa
+        existing_contact.source = f"Landing Page: {landing_page.nombre_producto}"
+        existing_contact.notes = notas_base
+        existing_contact.status = 'positive'  # Nuevo lead es positivo
+        existing_contact.save(update_fields=['name', 'phone', 'company', 'source', 'notes', 'status', 'updated_at'])
+        
+        return existing_contact
+    else:
+        # Crear nuevo contacto
+        contact = Contact.objects.create(
+            name=f"{submission.nombre} {submission.apellido}".strip(),
+            email=submission.email,
+            phone=submission.telefono or '',
+            company=submission.empresa or '',
+            source=f"Landing Page: {landing_page.nombre_producto}",
+            notes=notas_base,
+            status='positive',  # Nuevo lead es positivo por defecto
+            created_by=created_by  # Asignar el usuario que creó el contacto
+        )
+        
+        return contact
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def landing_page_submissions(request, pk):
+    """Vista para ver todos los envíos de una landing page"""
+    landing_page = get_object_or_404(LandingPage, pk=pk)
+    submissions = landing_page.submissions.all().order_by('-created_at')
+    
+    # Agregar información de contactos existentes
+    from .models import Contact
+    for submission in submissions:
+        # Buscar contacto existente por email
+        existing_contact = Contact.objects.filter(
+            email=submission.email
+        ).first()
+        submission.existing_contact = existing_contact
+    
+    context = {
+        'page_title': f'Envíos: {landing_page.nombre_producto}',
+        'landing_page': landing_page,
+        'submissions': submissions,
+    }
+    
+    return render(request, 'tickets/landing_page_submissions.html', context)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def landing_page_submission_detail(request, submission_id):
+    """Vista para ver los detalles de un envío específico de landing page"""
+    from .models import LandingPageSubmission, Contact
+    
+    submission = get_object_or_404(LandingPageSubmission, pk=submission_id)
+    
+    # Buscar contacto existente por email
+    existing_contact = Contact.objects.filter(
+        email=submission.email
+    ).first()
+    
+    context = {
+        'page_title': f'Detalle del Envío #{submission.id}',
+        'submission': submission,
+        'landing_page': submission.landing_page,
+        'existing_contact': existing_contact,
+    }
+    
+    return render(request, 'tickets/landing_page_submission_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def create_contact_from_submission_view(request, submission_id):
+    """Vista para crear un contacto manualmente desde un envío de landing page"""
+    from .models import LandingPageSubmission
+    
+    submission = get_object_or_404(LandingPageSubmission, pk=submission_id)
+    
+    if request.method == 'POST':
+        try:
+            contact = create_contact_from_submission(submission, submission.landing_page, created_by=request.user)
+            messages.success(request, f'Contacto creado exitosamente para {contact.name}')
+            
+            # Enviar notificación
+            try:
+                from .utils import send_contact_creation_notification
+                send_contact_creation_notification(contact, submission.landing_page)
+            except Exception as e:
+                messages.warning(request, 'Contacto creado pero no se pudo enviar la notificación por email.')
+                
+        except Exception as e:
+            messages.error(request, f'Error al crear el contacto: {str(e)}')
+    
+    return redirect('landing_page_submissions', pk=submission.landing_page.pk)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def toggle_submission_processed(request, submission_id):
+    """Vista AJAX para marcar/desmarcar un envío de landing page como procesado/contactado"""
+    # Verificar si es una petición AJAX y si el usuario está autenticado
+    if not request.user.is_authenticated:
+        return JsonResponse({
+            'success': False,
+            'error': 'No autorizado - debe iniciar sesión'
+        }, status=401)
+    
+    if not is_agent_or_superuser(request.user):
+        return JsonResponse({
+            'success': False,
+            'error': 'No tiene permisos para realizar esta acción'
+        }, status=403)
+    
+    if request.method == 'POST':
+        try:
+            submission = get_object_or_404(LandingPageSubmission, pk=submission_id)
+            
+            # Obtener el nuevo estado desde el request y debug
+            processed_value = request.POST.get('processed', 'false')
+            new_processed_state = processed_value.lower() == 'true'
+            
+            print(f"DEBUG toggle_submission_processed:")
+            print(f"  - submission_id: {submission_id}")
+            print(f"  - processed_value recibido: '{processed_value}'")
+            print(f"  - new_processed_state: {new_processed_state}")
+            print(f"  - estado actual: {submission.processed}")
+            
+            # Actualizar el estado
+            submission.processed = new_processed_state
+            if new_processed_state:
+                submission.processed_at = timezone.now()
+                submission.processed_by = request.user
+            else:
+                submission.processed_at = None
+                submission.processed_by = None
+            
+            submission.save()
+            
+            print(f"  - estado después de guardar: {submission.processed}")
+            
+            return JsonResponse({
+                'success': True,
+                'processed': submission.processed,
+                'processed_at': submission.processed_at.isoformat() if submission.processed_at else None,
+                'processed_by': submission.processed_by.get_full_name() if submission.processed_by else None,
+                'message': 'Estado actualizado correctamente'
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'error': str(e)
+            }, status=400)
+    
+    return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def update_contact_tracking(request, submission_id):
+    """Vista para actualizar el seguimiento de contacto de un envío"""
+    from .models import LandingPageSubmission
+    from django.utils import timezone
+    from datetime import datetime
+    
+    if request.method == 'POST':
+        try:
+            submission = get_object_or_404(LandingPageSubmission, pk=submission_id)
+            
+            # Obtener datos del formulario
+            contacted_by_phone = request.POST.get('contacted_by_phone') == 'on'
+            contacted_by_web = request.POST.get('contacted_by_web') == 'on'
+            contact_notes = request.POST.get('contact_notes', '')
+            contact_date_str = request.POST.get('contact_date', '')
+            
+            # Actualizar campos
+            submission.contacted_by_phone = contacted_by_phone
+            submission.contacted_by_web = contacted_by_web
+            submission.contact_notes = contact_notes
+            
+            # Procesar fecha de contacto
+            if contact_date_str:
+                try:
+                    # Convertir datetime-local format a datetime object
+                    contact_datetime = datetime.strptime(contact_date_str, '%Y-%m-%dT%H:%M')
+                    submission.contact_date = timezone.make_aware(contact_datetime)
+                except ValueError:
+                    pass  # Si no se puede parsear, mantener el valor anterior
+            
+            submission.save()
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Seguimiento de contacto actualizado correctamente',
+                'contacted_by_phone': submission.contacted_by_phone,
+                'contacted_by_web': submission.contacted_by_web,
+                'contact_date': submission.contact_date.isoformat() if submission.contact_date else None,
+                'contact_notes': submission.contact_notes
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'error': f'Error al actualizar seguimiento: {str(e)}'
+            }, status=400)
+    
+    return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def landing_page_contacts(request):
+    """Vista para ver todos los contactos creados desde landing pages"""
+    from .models import Contact
+    
+    # Filtrar contactos que contienen "landing page" en la fuente o notas
+    contacts = Contact.objects.filter(
+        models.Q(source__icontains='landing page') |
+        models.Q(notes__icontains='landing page')
+    ).order_by('-created_at')
+    
+    # Estadísticas
+    total_contacts = contacts.count()
+    positive_contacts = contacts.filter(status='positive').count()
+    negative_contacts = contacts.filter(status='negative').count()
+    
+    context = {
+        'page_title': 'Contactos desde Landing Pages',
+        'contacts': contacts,
+        'total_contacts': total_contacts,
+        'positive_contacts': positive_contacts,
+        'negative_contacts': negative_contacts,
+    }
+    
+    return render(request, 'tickets/landing_page_contacts.html', context)
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def ajax_create_contact_from_submission(request, submission_id):
+    """Vista AJAX para crear un contacto desde un envío"""
+    if request.method == 'POST':
+        try:
+            from .models import LandingPageSubmission
+            submission = get_object_or_404(LandingPageSubmission, pk=submission_id)
+            
+            contact = create_contact_from_submission(submission, submission.landing_page, created_by=request.user)
+            
+            if not contact:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'No se pudo crear el contacto'
+                })
+            
+            # Verificar si es un contacto nuevo o actualizado
+            from .models import ContactoWeb
+            existing_contact_count = ContactoWeb.objects.filter(email=submission.email).count()
+            
+            if existing_contact_count > 1:
+                message = f'Contacto actualizado para {contact.name} ({contact.email})'
+            else:
+                message = f'Contacto creado exitosamente para {contact.name}'
+            
+            # Log para debugging
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.info(f"Contacto procesado: {message}")
+            
+            # Enviar notificación (opcional)
+            try:
+                from .utils import send_contact_creation_notification
+                send_contact_creation_notification(contact, submission.landing_page)
+            except Exception as e:
+                logger.warning(f"Error enviando notificación de contacto: {str(e)}")
+            
+            response_data = {
+                'success': True,
+                'message': message,
+                'contact_id': contact.id
+            }
+            
+            logger.info(f"Enviando respuesta: {response_data}")
+            return JsonResponse(response_data)
+            
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error creando contacto desde submission {submission_id}: {str(e)}")
+            
+            return JsonResponse({
+                'success': False,
+                'message': f'Error al crear el contacto: {str(e)}'
+            })
+    
+    return JsonResponse({'success': False, 'message': 'Método no permitido'})
+
+
+@login_required
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def ajax_create_contacts_batch(request):
+    """Vista AJAX para crear contactos en lote desde múltiples envíos"""
+    if request.method == 'POST':
+        try:
+            import json
+            data = json.loads(request.body)
+            submission_ids = data.get('submission_ids', [])
+            
+            if not submission_ids:
+                return JsonResponse({'success': False, 'message': 'No se seleccionaron envíos'})
+            
+            from .models import LandingPageSubmission
+            contacts_created = 0
+            errors = []
+            
+            for submission_id in submission_ids:
+                try:
+                    submission = LandingPageSubmission.objects.get(pk=submission_id)
+                    contact = create_contact_from_submission(submission, submission.landing_page, created_by=request.user)
+                    if contact:
+                        contacts_created += 1
+                except Exception as e:
+                    errors.append(f'Error en envío {submission_id}: {str(e)}')
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Se crearon {contacts_created} contactos exitosamente',
+                'contacts_created': contacts_created,
+                'errors': errors
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': f'Error en la operación: {str(e)}'
+            })
+    
+    return JsonResponse({'success': False, 'message': 'Método no permitido'})
+
+
+@login_required  
+@user_passes_test(is_agent_or_superuser, login_url='/')
+def ajax_submission_details(request, submission_id):
+    """Vista AJAX para obtener detalles de un envío"""
+    try:
+        from .models import LandingPageSubmission
+        submission = get_object_or_404(LandingPageSubmission, pk=submission_id)
+        
+        data = {
+            'success': True,
+            'submission': {
+                'id': submission.id,
+                'nombre': submission.nombre,
+                'apellido': submission.apellido,
+                'email': submission.email,
+                'telefono': submission.telefono or '',
+                'empresa': submission.empresa or '',
+                'ip_address': submission.ip_address or '',
+                'user_agent': submission.user_agent or '',
+                'utm_source': submission.utm_source or '',
+                'utm_medium': submission.utm_medium or '',
+                'utm_campaign': submission.utm_campaign or '',
+                'created_at': submission.created_at.strftime('%d/%m/%Y %H:%M:%S'),
+                'landing_page': submission.landing_page.nombre_producto
+            }
+        }
+        
+        return JsonResponse(data)
+        
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'message': f'Error al obtener detalles: {str(e)}'
+        })
+
+
+@require_http_methods(["DELETE"])
+@login_required
+def ajax_landing_submission_delete(request, submission_id):
+    """Vista AJAX para eliminar un envío de landing page - Solo para agentes"""
+    if not is_agent(request.user):
+        return JsonResponse({
+            'success': False,
+            'message': 'No tienes permisos para realizar esta acción.'
+        }, status=403)
+    
+    try:
+        from .models import LandingPageSubmission
+        submission = get_object_or_404(LandingPageSubmission, pk=submission_id)
+        
+        # Guardar información para el mensaje de confirmación
+        submission_info = f"{submission.nombre} {submission.apellido} ({submission.email})"
+        
+        # Eliminar el envío
+        submission.delete()
+        
+        return JsonResponse({
+            'success': True,
+            'message': f'Envío de {submission_info} eliminado correctamente.'
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'message': f'Error al eliminar el envío: {str(e)}'
+        }, status=500)
+
+
+def public_company_ticket_create(request, public_token):
+    """Vista pública para crear tickets desde una empresa usando su token público"""
+    try:
+        company = get_object_or_404(Company, public_token=public_token, is_active=True)
+    except (Company.DoesNotExist, ValueError):
+        return render(request, 'tickets/public_company_ticket_error.html', {
+            'error_message': 'Esta empresa no existe o no tiene habilitada la creación pública de tickets.'
+        })
+    
+    if request.method == 'POST':
+        form = PublicCompanyTicketForm(request.POST, company=company)
+        if form.is_valid():
+            try:
+                # Crear o obtener usuario del sistema para tickets públicos
+                system_user, created = User.objects.get_or_create(
+                    username='system_public_tickets',
+                    defaults={
+                        'email': 'system@ticketproo.com',
+                        'first_name': 'Sistema',
+                        'last_name': 'Tickets Públicos',
+                        'is_active': True,
+                    }
+                )
+                
+                # Crear el ticket
+                ticket = form.save(commit=False)
+                ticket.created_by = system_user
+                ticket.ticket_type = 'desarrollo'  # Tipo por defecto para tickets públicos
+                ticket.status = 'open'
+                ticket.save()
+                
+                return render(request, 'tickets/public_company_ticket_success.html', {
+                    'ticket': ticket,
+                    'company': company,
+                    'customer_name': form.cleaned_data['customer_name'],
+                    'customer_email': form.cleaned_data['customer_email'],
+                })
+                
+            except Exception as e:
+                form.add_error(None, f'Error al crear el ticket: {str(e)}')
+    else:
+        form = PublicCompanyTicketForm(company=company)
+    
+    return render(request, 'tickets/public_company_ticket_create.html', {
+        'form': form,
+        'company': company,
+    })
+
+
+# ===========================================
+# VISTAS PARA EVALUACIÓN DE IA DE LANDING PAGES
+# ===========================================
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def landing_submissions_list_view(request):
+    """Vista para listar envíos de landing pages con evaluación de IA"""
+    from .models import LandingPageSubmission
+    
+    # Filtros
+    evaluated_filter = request.GET.get('evaluated', 'all')
+    priority_filter = request.GET.get('priority', 'all')
+    score_filter = request.GET.get('score', 'all')
+    search = request.GET.get('search', '')
+    
+    # Base queryset
+    submissions = LandingPageSubmission.objects.select_related('landing_page').order_by('-created_at')
+    
+    # Aplicar filtros
+    if evaluated_filter == 'yes':
+        submissions = submissions.filter(ai_evaluated=True)
+    elif evaluated_filter == 'no':
+        submissions = submissions.filter(ai_evaluated=False)
+    
+    if priority_filter != 'all':
+        submissions = submissions.filter(ai_priority_level=priority_filter)
+    
+    if score_filter == 'high':
+        submissions = submissions.filter(ai_overall_score__gte=7.0)
+    elif score_filter == 'medium':
+        submissions = submissions.filter(ai_overall_score__gte=4.0, ai_overall_score__lt=7.0)
+    elif score_filter == 'low':
+        submissions = submissions.filter(ai_overall_score__lt=4.0)
+    
+    if search:
+        submissions = submissions.filter(
+            Q(nombre__icontains=search) |
+            Q(apellido__icontains=search) |
+            Q(email__icontains=search) |
+            Q(empresa__icontains=search) |
+            Q(mensaje__icontains=search)
+        )
+    
+    # Paginación
+    paginator = Paginator(submissions, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Estadísticas
+    from .ai_landing_evaluator import get_evaluation_stats
+    try:
+        stats = get_evaluation_stats()
+    except:
+        stats = {}
+    
+    context = {
+        'page_title': 'Evaluación IA - Landing Pages',
+        'page_obj': page_obj,
+        'evaluated_filter': evaluated_filter,
+        'priority_filter': priority_filter,
+        'score_filter': score_filter,
+        'search': search,
+        'stats': stats,
+        'priority_choices': [
+            ('low', 'Baja'),
+            ('medium', 'Media'),
+            ('high', 'Alta'),
+            ('urgent', 'Urgente'),
+        ]
+    }
+    
+    return render(request, 'tickets/landing_submissions_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def landing_submission_detail_view(request, submission_id):
+    """Vista detallada de un envío de landing page con evaluación IA"""
+    from .models import LandingPageSubmission
+    
+    submission = get_object_or_404(LandingPageSubmission, id=submission_id)
+    
+    context = {
+        'page_title': f'Evaluación: {submission.nombre} {submission.apellido}',
+        'submission': submission,
+    }
+    
+    return render(request, 'tickets/landing_submission_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def evaluate_submission_ai_view(request, submission_id):
+    """Vista para evaluar un envío específico con IA"""
+    from .models import LandingPageSubmission
+    
+    submission = get_object_or_404(LandingPageSubmission, id=submission_id)
+    
+    if request.method == 'POST':
+        try:
+            success = submission.evaluate_with_ai()
+            if success:
+                messages.success(request, f'Evaluación IA completada. Puntuación: {submission.ai_overall_score}/10')
+            else:
+                messages.error(request, 'Error al evaluar con IA')
+        except Exception as e:
+            messages.error(request, f'Error: {str(e)}')
+    
+    return redirect('landing_submission_detail', submission_id=submission.id)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def landing_submission_delete_view(request, submission_id):
+    """Vista para eliminar una submission de landing page"""
+    from .models import LandingPageSubmission
+    
+    submission = get_object_or_404(LandingPageSubmission, id=submission_id)
+    
+    if request.method == 'POST':
+        try:
+            submission.delete()
+            messages.success(request, f'Submission de "{submission.nombre} {submission.apellido}" eliminada correctamente.')
+            return redirect('landing_submissions_list')
+        except Exception as e:
+            messages.error(request, f'Error al eliminar la submission: {str(e)}')
+            return redirect('landing_submission_detail', submission_id=submission.id)
+    
+    context = {
+        'submission': submission,
+        'page_title': f'Eliminar Submission - {submission.nombre} {submission.apellido}',
+    }
+    
+    return render(request, 'tickets/landing_submission_delete.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def batch_evaluate_submissions_view(request):
+    """Vista para evaluación en lote con IA"""
+    if request.method == 'POST':
+        limit = int(request.POST.get('limit', 10))
+        
+        try:
+            from .ai_landing_evaluator import batch_evaluate_submissions
+            results = batch_evaluate_submissions(limit=limit)
+            
+            messages.success(
+                request, 
+                f'Evaluación completada: {results["processed"]} procesados, {results["errors"]} errores'
+            )
+            
+            # Mostrar detalles de errores si los hay
+            if results["errors"] > 0:
+                error_details = [r for r in results["results"] if r["status"] == "error"]
+                for error in error_details[:3]:  # Mostrar máximo 3 errores
+                    messages.warning(request, f'Error en ID {error["id"]}: {error["error"]}')
+                    
+        except Exception as e:
+            messages.error(request, f'Error en evaluación en lote: {str(e)}')
+    
+    return redirect('landing_submissions_list')
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def ai_evaluation_dashboard_view(request):
+    """Dashboard con estadísticas de evaluación IA"""
+    from .ai_landing_evaluator import get_evaluation_stats
+    from .models import LandingPageSubmission
+    from django.db.models import Count
+    from datetime import datetime, timedelta
+    
+    # Estadísticas generales
+    try:
+        stats = get_evaluation_stats()
+    except:
+        stats = {}
+    
+    # Top submissions por puntuación
+    top_submissions = LandingPageSubmission.objects.filter(
+        ai_evaluated=True
+    ).order_by('-ai_overall_score')[:10]
+    
+    # Submissions recientes no evaluados
+    pending_submissions = LandingPageSubmission.objects.filter(
+        ai_evaluated=False
+    ).order_by('-created_at')[:10]
+    
+    # Submissions urgentes
+    urgent_submissions = LandingPageSubmission.objects.filter(
+        ai_priority_level='urgent'
+    ).order_by('-ai_overall_score')[:5]
+    
+    # Estadísticas por mes
+    last_30_days = timezone.now() - timedelta(days=30)
+    monthly_stats = LandingPageSubmission.objects.filter(
+        created_at__gte=last_30_days
+    ).extra(
+        select={'month': 'DATE(created_at)'}
+    ).values('month').annotate(
+        total=Count('id'),
+        evaluated=Count('id', filter=Q(ai_evaluated=True))
+    ).order_by('-month')[:10]
+    
+    context = {
+        'page_title': 'Dashboard Evaluación IA',
+        'stats': stats,
+        'top_submissions': top_submissions,
+        'pending_submissions': pending_submissions,
+        'urgent_submissions': urgent_submissions,
+        'monthly_stats': monthly_stats,
+    }
+    
+    return render(request, 'tickets/ai_evaluation_dashboard.html', context)
+
+
+@login_required
+def meeting_pdf_download_view(request, pk):
+    """Vista para descargar reunión en formato PDF"""
+    try:
+        meeting = get_object_or_404(Meeting.objects.select_related('organizer', 'company'), pk=pk)
+        
+        # Verificar permisos
+        if not request.user.is_staff and meeting.organizer != request.user:
+            return HttpResponse('No tiene permisos para acceder a esta reunión', status=403)
+        
+        # Importar librerías de PDF
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+        import datetime
+        from .pdf_service import pdf_response, pdf_style, render_pdf
+        
+        # Estilos personalizados
+        title_style = pdf_style('MeetingTitle', 'Heading1', fontSize=24, textColor=colors.HexColor('#2c3e50'),
+                                alignment=TA_CENTER, spaceAfter=30)
+        heading_style = pdf_style('MeetingHeading', 'Heading2', fontSize=16, textColor=colors.HexColor('#34495e'),
+                                  spaceBefore=20, spaceAfter=12)
+        normal_style = pdf_style('MeetingNormal', fontSize=11, textColor=colors.HexColor('#2c3e50'), spaceAfter=12)
+        
+        # Lista para almacenar elementos del PDF
+        story = []
+        
+        # Título principal
+        story.append(Paragraph("📋 REPORTE DE REUNIÓN", title_style))
+        story.append(Spacer(1, 20))
+        
+        # Información básica de la reunión
+        info_data = [
+            ['Título:', meeting.title or 'Sin título'],
+            ['Fecha:', meeting.created_at.strftime('%d/%m/%Y %H:%M')],
+            ['Creado por:', f"{meeting.organizer.first_name} {meeting.organizer.last_name}" if meeting.organizer.first_name else meeting.organizer.username],
+            ['Empresa:', meeting.company.name if meeting.company else 'No especificada'],
+            ['Estado:', meeting.get_status_display() if hasattr(meeting, 'get_status_display') else 'Activa'],
+        ]
+        
+        # Crear tabla de información
+        info_table = Table(info_data, colWidths=[2*inch, 4*inch])
+        info_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ecf0f1')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2c3e50')),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]))
+        
+        story.append(info_table)
+        story.append(Spacer(1, 30))
+        
+        # Descripción de la reunión
+        if meeting.description:
+            story.append(Paragraph("📝 DESCRIPCIÓN DE LA REUNIÓN", heading_style))
+            # Dividir la descripción en párrafos
+            description_paragraphs = meeting.description.split('\n')
+            for para in description_paragraphs:
+                if para.strip():
+                    story.append(Paragraph(para.strip(), normal_style))
+            story.append(Spacer(1, 20))
+        
+        # Objetivos (si existen)
+        if hasattr(meeting, 'objectives') and meeting.objectives:
+            story.append(Paragraph("🎯 OBJETIVOS", heading_style))
+            story.append(Paragraph(meeting.objectives, normal_style))
+            story.append(Spacer(1, 20))
+        
+        # Participantes (si existen)
+        if hasattr(meeting, 'attendees') and meeting.attendees.exists():
+            story.append(Paragraph("👥 PARTICIPANTES", heading_style))
+            attendees_list = []
+            for attendee in meeting.attendees.all():
+                attendees_list.append(f"• {attendee.name} ({attendee.email})")
+            attendees_text = "<br/>".join(attendees_list)
+            story.append(Paragraph(attendees_text, normal_style))
+            story.append(Spacer(1, 20))
+        
+        # Temas tratados (extraer de la descripción si contiene estructura)
+        if meeting.description and ('🎯 PROPUESTA' in meeting.description or '📋 Acción:' in meeting.description):
+            story.append(Paragraph("💡 PROPUESTAS Y ACCIONES", heading_style))
+            
+            # Extraer propuestas de la descripción
+            description_lines = meeting.description.split('\n')
+            proposals = []
+            current_proposal = None
+            
+            for line in description_lines:
+                if '🎯 PROPUESTA PRESENTADA:' in line:
+                    if current_proposal:
+                        proposals.append(current_proposal)
+                    current_proposal = {'title': line.replace('🎯 PROPUESTA PRESENTADA:', '').strip()}
+                elif current_proposal and '📋 Acción:' in line:
+                    current_proposal['action'] = line.replace('📋 Acción:', '').strip()
+                elif current_proposal and '⏰ Fecha:' in line:
+                    current_proposal['date'] = line.replace('⏰ Fecha:', '').strip()
+                    proposals.append(current_proposal)
+                    current_proposal = None
+            
+            if current_proposal:
+                proposals.append(current_proposal)
+            
+            if proposals:
+                for i, proposal in enumerate(proposals, 1):
+                    story.append(Paragraph(f"<b>Propuesta {i}:</b> {proposal.get('title', 'Sin título')}", normal_style))
+                    if proposal.get('action'):
+                        story.append(Paragraph(f"<b>Acción:</b> {proposal.get('action')}", normal_style))
+                    if proposal.get('date'):
+                        story.append(Paragraph(f"<b>Fecha:</b> {proposal.get('date')}", normal_style))
+                    story.append(Spacer(1, 10))
+        
+        # Notas adicionales
+        if hasattr(meeting, 'notes') and meeting.notes:
+            story.append(Paragraph("📝 NOTAS ADICIONALES", heading_style))
+            story.append(Paragraph(meeting.notes, normal_style))
+            story.append(Spacer(1, 20))
+        
+        # Próximos pasos
+        story.append(Paragraph("🔜 PRÓXIMOS PASOS", heading_style))
+        next_steps = [
+            "• Revisar puntos acordados en la reunión",
+            "• Programar seguimiento según cronograma definido",
+            "• Implementar acciones específicas discutidas",
+            "• Preparar documentación adicional si es necesaria"
+        ]
+        story.append(Paragraph("<br/>".join(next_steps), normal_style))
+        story.append(Spacer(1, 30))
+        
+        # Pie de página con información del reporte
+        footer_style = pdf_style('MeetingFooter', fontSize=9, textColor=colors.HexColor('#7f8c8d'), alignment=TA_CENTER)
+        
+        footer_text = f"Reporte generado el {datetime.datetime.now().strftime('%d/%m/%Y a las %H:%M')} | TicketProo - Sistema de Gestión"
+        story.append(Paragraph(footer_text, footer_style))
+        
+        filename = f"reunion_{meeting.id}_{datetime.datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
+        return pdf_response(render_pdf(story, bottomMargin=18), filename)
+        
+    except Exception as e:
+        messages.error(request, f'Error al generar PDF: {str(e)}')
+        return redirect('meeting_edit', pk=pk)
+
+
+# ==========================================
+# VISTAS PARA GENERADORES DE CONTACTOS
+# ==========================================
+
+@login_required
+def contact_generator_list(request):
+    """Lista de generadores de contactos"""
+    if not is_agent(request.user):
+        return redirect('dashboard')
+    
+    # Filtrar por empresa según permisos del usuario
+    if request.user.is_superuser:
+        generators = ContactGenerator.objects.all()
+    else:
+        # Obtener empresas del usuario
+        user_companies = []
+        if hasattr(request.user, 'company'):
+            user_companies.append(request.user.company.id)
+        if hasattr(request.user, 'additional_companies'):
+            user_companies.extend(request.user.additional_companies.values_list('id', flat=True))
+        
+        generators = ContactGenerator.objects.filter(company_id__in=user_companies)
+    
+    generators = generators.order_by('-created_at')
+    
+    context = {
+        'generators': generators,
+        'page_title': 'Generadores de Contactos'
+    }
+    
+    return render(request, 'tickets/contact_generator_list.html', context)
+
+
+@login_required
+def contact_generator_create(request):
+    """Crear nuevo generador de contactos"""
+    if not is_agent(request.user):
+        return redirect('dashboard')
+    
+    if request.method == 'POST':
+        form = ContactGeneratorForm(request.POST, user=request.user)
+        if form.is_valid():
+            generator = form.save(commit=False)
+            generator.created_by = request.user
+            generator.save()
+            
+            messages.success(request, f'Generador de contactos "{generator.title}" creado correctamente.')
+            return redirect('contact_generator_detail', pk=generator.pk)
+    else:
+        form = ContactGeneratorForm(user=request.user)
+    
+    context = {
+        'form': form,
+        'page_title': 'Crear Generador de Contactos',
+        'form_title': 'Nuevo Generador de Contactos'
+    }
+    
+    return render(request, 'tickets/contact_generator_form.html', context)
+
+
+@login_required
+def contact_generator_detail(request, pk):
+    """Detalle de un generador de contactos"""
+    if not is_agent(request.user):
+        return redirect('dashboard')
+    
+    generator = get_object_or_404(ContactGenerator, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.is_superuser:
+        user_companies = []
+        if hasattr(request.user, 'company'):
+            user_companies.append(request.user.company.id)
+        if hasattr(request.user, 'additional_companies'):
+            user_companies.extend(request.user.additional_companies.values_list('id', flat=True))
+        
+        if generator.company.id not in user_companies:
+            messages.error(request, 'No tienes permisos para ver este generador.')
+            return redirect('contact_generator_list')
+    
+    # Obtener estadísticas de contactos generados
+    recent_contacts = Contact.objects.filter(
+        source=f"Generador: {generator.title}",
+        created_by=generator.created_by
+    ).order_by('-created_at')[:10]
+    
+    context = {
+        'generator': generator,
+        'recent_contacts': recent_contacts,
+        'contacts_count': generator.get_contacts_count(),
+        'page_title': f'Generador: {generator.title}'
+    }
+    
+    return render(request, 'tickets/contact_generator_detail.html', context)
+
+
+@login_required
+def contact_generator_edit(request, pk):
+    """Editar generador de contactos"""
+    if not is_agent(request.user):
+        return redirect('dashboard')
+    
+    generator = get_object_or_404(ContactGenerator, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.is_superuser:
+        user_companies = []
+        if hasattr(request.user, 'company'):
+            user_companies.append(request.user.company.id)
+        if hasattr(request.user, 'additional_companies'):
+            user_companies.extend(request.user.additional_companies.values_list('id', flat=True))
+        
+        if generator.company.id not in user_companies:
+            messages.error(request, 'No tienes permisos para editar este generador.')
+            return redirect('contact_generator_list')
+    
+    if request.method == 'POST':
+        form = ContactGeneratorForm(request.POST, instance=generator, user=request.user)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Generador "{generator.title}" actualizado correctamente.')
+            return redirect('contact_generator_detail', pk=generator.pk)
+    else:
+        form = ContactGeneratorForm(instance=generator, user=request.user)
+    
+    context = {
+        'form': form,
+        'generator': generator,
+        'page_title': f'Editar: {generator.title}',
+        'form_title': f'Editar Generador: {generator.title}'
+    }
+    
+    return render(request, 'tickets/contact_generator_form.html', context)
+
+
+@login_required
+def contact_generator_delete(request, pk):
+    """Eliminar generador de contactos"""
+    if not is_agent(request.user):
+        return redirect('dashboard')
+    
+    generator = get_object_or_404(ContactGenerator, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.is_superuser:
+        user_companies = []
+        if hasattr(request.user, 'company'):
+            user_companies.append(request.user.company.id)
+        if hasattr(request.user, 'additional_companies'):
+            user_companies.extend(request.user.additional_companies.values_list('id', flat=True))
+        
+        if generator.company.id not in user_companies:
+            messages.error(request, 'No tienes permisos para eliminar este generador.')
+            return redirect('contact_generator_list')
+    
+    if request.method == 'POST':
+        generator_title = generator.title
+        generator.delete()
+        messages.success(request, f'Generador "{generator_title}" eliminado correctamente.')
+        return redirect('contact_generator_list')
+    
+    context = {
+        'generator': generator,
+        'page_title': f'Eliminar: {generator.title}',
+        'contacts_count': generator.get_contacts_count()
+    }
+    
+    return render(request, 'tickets/contact_generator_delete.html', context)
+
+
+@login_required
+def contact_generator_toggle_active(request, pk):
+    """Activar/desactivar generador de contactos"""
+    if not is_agent(request.user):
+        return redirect('dashboard')
+    
+    generator = get_object_or_404(ContactGenerator, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.is_superuser:
+        user_companies = []
+        if hasattr(request.user, 'company'):
+            user_companies.append(request.user.company.id)
+        if hasattr(request.user, 'additional_companies'):
+            user_companies.extend(request.user.additional_companies.values_list('id', flat=True))
+        
+        if generator.company.id not in user_companies:
+            messages.error(request, 'No tienes permisos para modificar este generador.')
+            return redirect('contact_generator_list')
+    
+    generator.is_active = not generator.is_active
+    generator.save()
+    
+    if generator.is_active:
+        messages.success(request, f'Generador "{generator.title}" activado. El formulario público está disponible.')
+    else:
+        messages.warning(request, f'Generador "{generator.title}" desactivado. El formulario público no está disponible.')
+    
+    return redirect('contact_generator_detail', pk=generator.pk)
+
+
+def contact_generator_public(request, token):
+    """Vista pública para que los usuarios llenen el formulario de contacto"""
+    generator = get_object_or_404(ContactGenerator, public_token=token, is_active=True)
+    
+    if request.method == 'POST':
+        form = PublicContactForm(request.POST, generator=generator)
+        if form.is_valid():
+            contact = form.save(commit=False)
+            contact.source = f"Generador: {generator.title}"
+            contact.status = 'positive'  # Por defecto positivo
+            contact.created_by = generator.created_by  # El usuario que creó el generador
+            
+            # Si no se proporcionó empresa o está vacía, usar la empresa del generador
+            if not contact.company or contact.company.strip() == '':
+                contact.company = generator.company.name
+            
+            contact.save()
+            
+            # Mostrar mensaje de éxito
+            context = {
+                'generator': generator,
+                'success': True,
+                'success_message': generator.success_message,
+                'page_title': f'{generator.title} - {generator.company.name}',
+                'is_public_view': True
+            }
+            return render(request, 'tickets/contact_generator_public.html', context)
+    else:
+        form = PublicContactForm(generator=generator)
+    
+    context = {
+        'generator': generator,
+        'form': form,
+        'page_title': f'{generator.title} - {generator.company.name}',
+        'is_public_view': True
+    }
+    
+    return render(request, 'tickets/contact_generator_public.html', context)
+
+
+def public_tickets_and_requests_view(request):
+    """Vista pública que muestra la última solicitud de empresa y listado de solicitudes"""
+    
+    # Obtener la última solicitud de empresa
+    latest_request = CompanyRequest.objects.select_related(
+        'generator', 'generator__company'
+    ).order_by('-created_at').first()
+    
+    # Obtener todas las solicitudes de empresa (últimas 20)
+    recent_requests = CompanyRequest.objects.select_related(
+        'generator', 'generator__company'
+    ).order_by('-created_at')[:20]
+    
+    # Estadísticas generales
+    total_requests = CompanyRequest.objects.count()
+    
+    # Estadísticas por estado de solicitudes
+    status_stats = {}
+    for status_choice in CompanyRequest.STATUS_CHOICES:
+        status_key = status_choice[0]
+        status_stats[status_key] = CompanyRequest.objects.filter(status=status_key).count()
+    
+    context = {
+        'latest_request': latest_request,
+        'recent_requests': recent_requests,
+        'total_requests': total_requests,
+        'status_stats': status_stats,
+        'page_title': 'Dashboard Público - Solicitudes de Empresa'
+    }
+    
+    return render(request, 'tickets/public_tickets_and_requests.html', context)
+
+
+@login_required
+def update_company_request_status(request, request_id):
+    """Vista AJAX para actualizar el estado de una solicitud de empresa"""
+    if request.method == 'POST':
+        try:
+            company_request = get_object_or_404(CompanyRequest, id=request_id)
+            new_status = request.POST.get('status')
+            
+            if new_status in dict(CompanyRequest.STATUS_CHOICES):
+                company_request.status = new_status
+                
+                # Si se marca como ejecutada, registrar fecha y usuario
+                if new_status == 'executed':
+                    company_request.executed_at = timezone.now()
+                    company_request.executed_by = request.user
+                
+                company_request.save()
+                
+                response_data = {
+                    'success': True,
+                    'message': f'Estado actualizado a {company_request.get_status_display()}',
+                    'new_status': company_request.status,
+                    'status_display': company_request.get_status_display()
+                }
+                
+                # Agregar información de ejecución si está disponible
+                if company_request.executed_at:
+                    response_data['executed_at'] = company_request.executed_at.strftime('%d/%m/%Y %H:%M:%S')
+                    response_data['executed_by'] = company_request.executed_by.get_full_name() or company_request.executed_by.username if company_request.executed_by else ''
+                
+                return JsonResponse(response_data)
+            else:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Estado no válido'
+                })
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': str(e)
+            })
+    
+    return JsonResponse({'success': False, 'message': 'Método no permitido'})
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def landing_page_meeting_click(request, slug):
+    """
+    Incrementa el contador de clics del botón "Planificar Reunión"
+    """
+    try:
+        from django.db import transaction
+        
+        # Buscar la landing page por slug
+        landing_page = get_object_or_404(LandingPage, slug=slug, is_active=True)
+        
+        # Incrementar el contador de clics de reunión de forma atómica
+        with transaction.atomic():
+            landing_page.meeting_button_clicks += 1
+            landing_page.save(update_fields=['meeting_button_clicks'])
+        
+        return JsonResponse({
+            'success': True,
+            'meeting_clicks': landing_page.meeting_button_clicks
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'error': f'Error al incrementar contador: {str(e)}'
+        }, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def landing_page_contact_click(request, slug):
+    """
+    Incrementa el contador de clics del botón "Contactar"
+    """
+    try:
+        from django.db import transaction
+        
+        # Buscar la landing page por slug
+        landing_page = get_object_or_404(LandingPage, slug=slug, is_active=True)
+        
+        # Incrementar el contador de clics de contacto de forma atómica
+        with transaction.atomic():
+            landing_page.contact_button_clicks += 1
+            landing_page.save(update_fields=['contact_button_clicks'])
+        
+        return JsonResponse({
+            'success': True,
+            'contact_clicks': landing_page.contact_button_clicks
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'error': f'Error al incrementar contador: {str(e)}'
+        }, status=500)
+
+
+# ============================================
+# VISTAS PARA REUNIONES DE VIDEO
+# ============================================
+
+@login_required
+def video_meeting_list(request):
+    """Lista de reuniones de video"""
+    from .models import VideoMeeting
+    from .forms import MeetingFilterForm
+    
+    # Obtener todas las reuniones del usuario
+    meetings = VideoMeeting.objects.all()
+    
+    # Filtrar por permisos
+    if not is_agent(request.user):
+        # Los empleados solo ven sus reuniones (organizadas o participan)
+        meetings = meetings.filter(
+            models.Q(organizer=request.user) | 
+            models.Q(participants=request.user)
+        ).distinct()
+    
+    # Aplicar filtros
+    filter_form = MeetingFilterForm(request.GET, user=request.user)
+    if filter_form.is_valid():
+        if filter_form.cleaned_data.get('search'):
+            search = filter_form.cleaned_data['search']
+            meetings = meetings.filter(
+                models.Q(title__icontains=search) |
+                models.Q(description__icontains=search)
+            )
+        
+        if filter_form.cleaned_data.get('status'):
+            meetings = meetings.filter(status=filter_form.cleaned_data['status'])
+        
+        if filter_form.cleaned_data.get('transcription_status'):
+            meetings = meetings.filter(
+                transcription_status=filter_form.cleaned_data['transcription_status']
+            )
+        
+        if filter_form.cleaned_data.get('company'):
+            meetings = meetings.filter(company=filter_form.cleaned_data['company'])
+        
+        if filter_form.cleaned_data.get('organizer'):
+            meetings = meetings.filter(organizer=filter_form.cleaned_data['organizer'])
+        
+        if filter_form.cleaned_data.get('date_from'):
+            meetings = meetings.filter(scheduled_date__gte=filter_form.cleaned_data['date_from'])
+        
+        if filter_form.cleaned_data.get('date_to'):
+            from datetime import datetime, time
+            date_to = datetime.combine(filter_form.cleaned_data['date_to'], time.max)
+            meetings = meetings.filter(scheduled_date__lte=date_to)
+    
+    # Ordenar
+    meetings = meetings.order_by('-scheduled_date', '-created_at')
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(meetings, 10)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'page_obj': page_obj,
+        'filter_form': filter_form,
+        'total_meetings': meetings.count(),
+    }
+    
+    return render(request, 'tickets/video_meeting_list.html', context)
+
+
+@login_required
+def video_meeting_create(request):
+    """Crear nueva reunión de video (sin archivos)"""
+    from .forms import VideoMeetingForm
+    
+    if request.method == 'POST':
+        form = VideoMeetingForm(request.POST, user=request.user)
+        if form.is_valid():
+            meeting = form.save(commit=False)
+            meeting.organizer = request.user
+            
+            # Si el usuario tiene empresa y no se especificó una, asignar la del usuario
+            if not meeting.company and hasattr(request.user, 'employee') and request.user.employee and request.user.employee.company:
+                meeting.company = request.user.employee.company
+            
+            meeting.save()
+            form.save_m2m()  # Guardar participantes (ManyToMany)
+            
+            messages.success(request, 'Reunión creada exitosamente. Ahora puedes subir archivos en la edición.')
+            return redirect('video_meeting_edit', pk=meeting.pk)
+    else:
+        form = VideoMeetingForm(user=request.user)
+    
+    context = {
+        'form': form,
+        'title': 'Nueva Reunión de Video',
+        'action': 'Crear',
+        'is_create': True
+    }
+    
+    return render(request, 'tickets/video_meeting_form.html', context)
+
+
+@login_required
+def video_meeting_detail(request, pk):
+    """Detalle de reunión de video"""
+    from .models import VideoMeeting, MeetingNote
+    from .forms import MeetingNoteForm
+    
+    meeting = get_object_or_404(VideoMeeting, pk=pk)
+    
+    # Verificar permisos
+    if not is_agent(request.user):
+        if request.user != meeting.organizer and request.user not in meeting.participants.all():
+            messages.error(request, 'No tienes permisos para ver esta reunión.')
+            return redirect('video_meeting_list')
+    
+    # Manejar formulario de notas
+    if request.method == 'POST':
+        if 'add_note' in request.POST:
+            note_form = MeetingNoteForm(request.POST)
+            if note_form.is_valid():
+                note = note_form.save(commit=False)
+                note.meeting = meeting
+                note.user = request.user
+                note.save()
+                messages.success(request, 'Nota agregada exitosamente.')
+                return redirect('video_meeting_detail', pk=pk)
+        
+        elif 'transcribe_now' in request.POST or 'force_transcription' in request.POST:
+            # Iniciar/forzar transcripción
+            if meeting.recording_file or meeting.attachments.exists():
+                meeting.transcription_status = 'pending'
+                meeting.save()
+                
+                try:
+                    from .tasks import process_meeting_recordings_async
+                    from .models import MeetingAttachment
+                    
+                    # Recolectar todas las rutas de archivos
+                    file_paths = []
+                    
+                    # Agregar archivo principal si existe
+                    if meeting.recording_file:
+                        file_paths.append(meeting.recording_file.path)
+                    
+                    # Agregar archivos adjuntos
+                    for attachment in meeting.attachments.all():
+                        file_paths.append(attachment.file.path)
+                    
+                    # Procesar en segundo plano
+                    process_meeting_recordings_async(meeting.id, file_paths)
+                    
+                    messages.success(
+                        request, 
+                        f'Procesamiento iniciado para {len(file_paths)} archivo(s). '
+                        'La transcripción y análisis se realizarán en segundo plano.'
+                    )
+                except Exception as e:
+                    messages.error(request, f'Error al iniciar el procesamiento: {str(e)}')
+            else:
+                messages.error(request, 'No hay archivos para transcribir.')
+            
+            return redirect('video_meeting_detail', pk=pk)
+    
+    # Obtener notas (filtrar privadas si no es el autor)
+    notes = meeting.notes.all()
+    if not is_agent(request.user):
+        notes = notes.filter(
+            models.Q(is_private=False) | models.Q(user=request.user)
+        )
+    notes = notes.order_by('-created_at')
+    
+    note_form = MeetingNoteForm()
+    
+    context = {
+        'meeting': meeting,
+        'notes': notes,
+        'note_form': note_form,
+        'can_edit': meeting.can_edit() and (is_agent(request.user) or meeting.organizer == request.user),
+    }
+    
+    return render(request, 'tickets/video_meeting_detail.html', context)
+
+
+@login_required
+def video_meeting_edit(request, pk):
+    """Editar reunión de video con subida de múltiples archivos"""
+    from .forms import VideoMeetingEditForm
+    
+    meeting = get_object_or_404(VideoMeeting, pk=pk)
+    
+    # Verificar permisos
+    if not is_agent(request.user) and meeting.organizer != request.user:
+        messages.error(request, 'No tienes permisos para editar esta reunión.')
+        return redirect('video_meeting_detail', pk=pk)
+    
+    if not meeting.can_edit():
+        messages.error(request, 'Esta reunión no puede ser editada.')
+        return redirect('video_meeting_detail', pk=pk)
+    
+    if request.method == 'POST':
+        form = VideoMeetingEditForm(request.POST, request.FILES, instance=meeting, user=request.user)
+        if form.is_valid():
+            meeting = form.save()
+            
+            # Manejar múltiples archivos
+            uploaded_files = request.FILES.getlist('recording_files')
+            
+            if uploaded_files:
+                # Iniciar procesamiento en thread separado (sin Celery)
+                from .tasks import process_meeting_recordings_async
+                from .models import MeetingAttachment
+                
+                # Guardar archivos como adjuntos y crear lista de rutas
+                file_paths = []
+                from django.core.files.storage import default_storage
+                import os
+                
+                for uploaded_file in uploaded_files:
+                    # Guardar archivo
+                    file_path = f'meeting_recordings/{meeting.id}_{uploaded_file.name}'
+                    saved_path = default_storage.save(file_path, uploaded_file)
+                    file_paths.append(saved_path)
+                    
+                    # Crear registro de adjunto
+                    MeetingAttachment.objects.create(
+                        meeting=meeting,
+                        file=saved_path,
+                        filename=uploaded_file.name,
+                        file_size=uploaded_file.size,
+                        uploaded_by=request.user
+                    )
+                
+                # Procesar en segundo plano usando threading
+                process_meeting_recordings_async(meeting.id, file_paths)
+                
+                messages.success(
+                    request, 
+                    f'Reunión actualizada. {len(uploaded_files)} archivo(s) se procesarán en segundo plano. '
+                    'El análisis de IA se generará automáticamente.'
+                )
+            else:
+                messages.success(request, 'Reunión actualizada exitosamente.')
+            
+            return redirect('video_meeting_detail', pk=meeting.pk)
+    else:
+        form = VideoMeetingEditForm(instance=meeting, user=request.user)
+    
+    context = {
+        'form': form,
+        'meeting': meeting,
+        'title': f'Editar - {meeting.title}',
+        'action': 'Guardar Cambios',
+        'is_create': False
+    }
+    
+    return render(request, 'tickets/video_meeting_form.html', context)
+
+
+@login_required
+def video_meeting_transcription(request, pk):
+    """Editar transcripción manualmente"""
+    from .forms import MeetingTranscriptionForm
+    
+    meeting = get_object_or_404(VideoMeeting, pk=pk)
+    
+    # Verificar permisos
+    if not is_agent(request.user):
+        if request.user != meeting.organizer and request.user not in meeting.participants.all():
+            messages.error(request, 'No tienes permisos para editar la transcripción.')
+            return redirect('video_meeting_detail', pk=pk)
+    
+    if request.method == 'POST':
+        form = MeetingTranscriptionForm(request.POST, instance=meeting)
+        if form.is_valid():
+            form.save()
+            # Si se editó manualmente, marcar como completada
+            if meeting.transcription_text:
+                meeting.transcription_status = 'completed'
+                meeting.save()
+            
+            messages.success(request, 'Transcripción actualizada exitosamente.')
+            return redirect('video_meeting_detail', pk=meeting.pk)
+    else:
+        form = MeetingTranscriptionForm(instance=meeting)
+    
+    context = {
+        'form': form,
+        'meeting': meeting,
+        'title': f'Transcripción - {meeting.title}',
+    }
+    
+    return render(request, 'tickets/video_meeting_transcription.html', context)
+
+
+@login_required
+def video_meeting_delete(request, pk):
+    """Eliminar reunión de video"""
+    meeting = get_object_or_404(VideoMeeting, pk=pk)
+    
+    # Verificar permisos
+    if not is_agent(request.user) and meeting.organizer != request.user:
+        messages.error(request, 'No tienes permisos para eliminar esta reunión.')
+        return redirect('video_meeting_detail', pk=pk)
+    
+    if request.method == 'POST':
+        meeting_title = meeting.title
+        
+        # Eliminar archivo de grabación si existe
+        if meeting.recording_file:
+            try:
+                import os
+                if os.path.exists(meeting.recording_file.path):
+                    os.remove(meeting.recording_file.path)
+            except:
+                pass
+        
+        meeting.delete()
+        messages.success(request, f'Reunión "{meeting_title}" eliminada exitosamente.')
+        return redirect('video_meeting_list')
+    
+    context = {
+        'meeting': meeting,
+        'title': f'Eliminar Reunión - {meeting.title}',
+    }
+    
+    return render(request, 'tickets/video_meeting_delete.html', context)
+
+
+@login_required
+@require_http_methods(["POST"])
+def video_meeting_transcribe(request, pk):
+    """Iniciar transcripción automática de reunión"""
+    from django.http import JsonResponse
+    from .ai_utils import transcribe_meeting_async
+    
+    meeting = get_object_or_404(VideoMeeting, pk=pk)
+    
+    # Verificar permisos
+    if not is_agent(request.user) and meeting.organizer != request.user:
+        return JsonResponse({'success': False, 'error': 'Sin permisos'})
+    
+    # Verificar que hay archivo
+    if not meeting.recording_file:
+        return JsonResponse({'success': False, 'error': 'No hay archivo para transcribir'})
+    
+    # Verificar que no esté ya procesando
+    if meeting.transcription_status == 'pending':
+        return JsonResponse({'success': False, 'error': 'Ya se está procesando la transcripción'})
+    
+    try:
+        # Iniciar transcripción asíncrona
+        transcribe_meeting_async(meeting.id)
+        
+        # Actualizar estado
+        meeting.transcription_status = 'pending'
+        meeting.save(update_fields=['transcription_status'])
+        
+        return JsonResponse({'success': True, 'message': 'Transcripción iniciada'})
+    
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': str(e)})
+
+
+@login_required
+def video_meeting_transcription_status(request, pk):
+    """Obtener estado de transcripción de reunión"""
+    from django.http import JsonResponse
+    
+    meeting = get_object_or_404(VideoMeeting, pk=pk)
+    
+    # Verificar permisos
+    if not is_agent(request.user) and meeting.organizer != request.user:
+        return JsonResponse({'error': 'Sin permisos'}, status=403)
+    
+    return JsonResponse({
+        'status': meeting.transcription_status or 'none',
+        'has_transcription': bool(meeting.transcription_text),
+        'transcription_date': meeting.transcription_date.isoformat() if meeting.transcription_date else None,
+    })
+
+
+@login_required
+def meeting_note_delete(request, meeting_pk, note_pk):
+    """Eliminar nota de reunión"""
+    from .models import MeetingNote
+    
+    meeting = get_object_or_404(VideoMeeting, pk=meeting_pk)
+    note = get_object_or_404(MeetingNote, pk=note_pk, meeting=meeting)
+    
+    # Verificar permisos
+    if not is_agent(request.user) and note.user != request.user:
+        messages.error(request, 'No tienes permisos para eliminar esta nota.')
+        return redirect('video_meeting_detail', pk=meeting_pk)
+    
+    if request.method == 'POST':
+        note.delete()
+        messages.success(request, 'Nota eliminada exitosamente.')
+    
+    return redirect('video_meeting_detail', pk=meeting_pk)
+
+
+@login_required
+def video_meeting_download_transcription(request, pk):
+    """Descargar transcripción de reunión de video como archivo de texto"""
+    meeting = get_object_or_404(VideoMeeting, pk=pk)
+    
+    # Verificar que la transcripción esté completa y disponible
+    if meeting.transcription_status != 'completed' or not meeting.transcription_text:
+        messages.error(request, 'La transcripción no está disponible para descarga.')
+        return redirect('dashboard')
+    
+    # Verificar permisos (organizador, participantes o agentes)
+    if not is_agent(request.user) and meeting.organizer != request.user and request.user not in meeting.participants.all():
+        messages.error(request, 'No tienes permisos para descargar esta transcripción.')
+        return redirect('dashboard')
+    
+    # Crear el contenido del archivo
+    content = f"""TRANSCRIPCIÓN DE REUNIÓN DE VIDEO
+========================================
+
+Título: {meeting.title}
+Organizador: {meeting.organizer.get_full_name() or meeting.organizer.username}
+Fecha: {meeting.created_at.strftime('%d/%m/%Y %H:%M')}
+Duración: {meeting.duration_minutes or 'No especificada'} minutos
+Estado: {meeting.get_status_display()}
+
+DESCRIPCIÓN:
+{meeting.description or 'Sin descripción'}
+
+TRANSCRIPCIÓN:
+==============
+{meeting.transcription_text}
+
+RESUMEN DE IA:
+==============
+{meeting.ai_summary or 'No disponible'}
+
+PUNTOS CLAVE:
+=============
+{meeting.key_points or 'No disponibles'}
+
+ELEMENTOS DE ACCIÓN:
+===================
+{meeting.action_items or 'No disponibles'}
+
+---
+Generado automáticamente por TicketProo
+Fecha de descarga: {timezone.now().strftime('%d/%m/%Y %H:%M')}
+"""
+    
+    # Crear la respuesta HTTP
+    response = HttpResponse(content, content_type='text/plain; charset=utf-8')
+    filename = f"transcripcion_{meeting.title.replace(' ', '_')}_{meeting.created_at.strftime('%Y%m%d')}.txt"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    
+    return response
+
+
+# === VISTAS DE COTIZACIONES ===
+
+@user_passes_test(is_agent, login_url='/')
+@login_required
+def quotation_list_view(request):
+    """Vista para listar cotizaciones"""
+    from .models import Quotation, SystemConfiguration
+    
+    # Obtener configuración del sistema para la moneda
+    config = SystemConfiguration.get_config()
+    currency_symbol = config.get_currency_symbol() if config else '€'
+    
+    quotations = Quotation.objects.all()
+    
+    # Filtros
+    status = request.GET.get('status')
+    if status:
+        quotations = quotations.filter(status=status)
+    
+    company = request.GET.get('company')
+    if company:
+        quotations = quotations.filter(company_id=company)
+    
+    salesperson = request.GET.get('salesperson')
+    if salesperson:
+        quotations = quotations.filter(salesperson_id=salesperson)
+    
+    search = request.GET.get('search')
+    if search:
+        quotations = quotations.filter(
+            models.Q(sequence__icontains=search) | 
+            models.Q(company__name__icontains=search) |
+            models.Q(salesperson__first_name__icontains=search) |
+            models.Q(salesperson__last_name__icontains=search)
+        )
+    
+    quotations = quotations.order_by('-created_at')
+    
+    # Estadísticas
+    stats = {
+        'total': Quotation.objects.count(),
+        'draft': Quotation.objects.filter(status='draft').count(),
+        'sent': Quotation.objects.filter(status='sent').count(),
+        'approved': Quotation.objects.filter(status='approved').count(),
+        'rejected': Quotation.objects.filter(status='rejected').count(),
+    }
+    
+    # Calcular suma total de todas las cotizaciones mostradas
+    total_amount = sum(quotation.get_total_amount() for quotation in quotations)
+    stats['total_amount'] = total_amount
+    
+    # Calcular total de visitas públicas
+    from .models import QuotationView
+    total_views = QuotationView.objects.filter(quotation__in=quotations).count()
+    stats['total_views'] = total_views
+    
+    # Para los filtros
+    from .models import Company
+    from django.contrib.auth.models import User
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    salespeople = User.objects.filter(is_active=True).order_by('first_name', 'last_name')
+    
+    context = {
+        'page_title': 'Cotizaciones',
+        'quotations': quotations,
+        'stats': stats,
+        'companies': companies,
+        'salespeople': salespeople,
+        'current_status': status,
+        'current_company': company,
+        'current_salesperson': salesperson,
+        'current_search': search,
+        'currency_symbol': currency_symbol,
+    }
+    
+    return render(request, 'tickets/quotation_list.html', context)
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_create_view(request):
+    """Vista para crear una nueva cotización"""
+    from .models import Quotation, Company, Product
+    from django.contrib.auth.models import User
+    
+    def get_form_context():
+        companies = Company.objects.filter(is_active=True).order_by('name')
+        salespeople = User.objects.filter(is_active=True).order_by('first_name', 'last_name')
+        products = Product.objects.filter(is_active=True).order_by('name')
+        
+        # Obtener configuración del sistema para la moneda
+        from .models import SystemConfiguration
+        config = SystemConfiguration.get_config()
+        currency_symbol = config.get_currency_symbol() if config else '€'
+        
+        return {
+            'page_title': 'Nueva Cotización',
+            'companies': companies,
+            'salespeople': salespeople,
+            'products': products,
+            'today': timezone.now().date(),
+            'currency_symbol': currency_symbol,
+        }
+    
+    if request.method == 'POST':
+        try:
+            # Validar datos requeridos
+            company_id = request.POST.get('company')
+            salesperson_id = request.POST.get('salesperson')
+            date = request.POST.get('date')
+            
+            if not company_id:
+                messages.error(request, 'Debe seleccionar una empresa')
+                return render(request, 'tickets/quotation_form.html', get_form_context())
+            
+            if not salesperson_id:
+                messages.error(request, 'Debe seleccionar un vendedor')
+                return render(request, 'tickets/quotation_form.html', get_form_context())
+            
+            if not date:
+                messages.error(request, 'Debe especificar una fecha')
+                return render(request, 'tickets/quotation_form.html', get_form_context())
+            
+            quotation = Quotation(
+                company_id=company_id,
+                salesperson_id=salesperson_id,
+                date=date,
+                status=request.POST.get('status', 'draft'),
+                client_status=request.POST.get('client_status', 'pending'),
+                description=request.POST.get('description', '')
+            )
+            
+            # Manejar fecha de vencimiento
+            expiry_date = request.POST.get('expiry_date')
+            if expiry_date:
+                quotation.expiry_date = expiry_date
+            # Si no se proporciona, se calculará automáticamente en el método save()
+            
+            # Manejar fechas de servicio
+            service_start_date = request.POST.get('service_start_date')
+            service_end_date = request.POST.get('service_end_date')
+            
+            if service_start_date:
+                quotation.service_start_date = service_start_date
+            
+            if service_end_date:
+                quotation.service_end_date = service_end_date
+            
+            quotation.save()
+            messages.success(request, f'Cotización {quotation.sequence} creada exitosamente')
+            return redirect('quotation_list')
+        except Exception as e:
+            import traceback
+            traceback.print_exc()  # Imprimir stack trace completo en la consola
+            messages.error(request, f'Error al crear la cotización: {str(e)}')
+    
+    return render(request, 'tickets/quotation_form.html', get_form_context())
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_detail_view(request, quotation_id):
+    """Vista para ver detalles de una cotización"""
+    from .models import Quotation, SystemConfiguration
+    from django.db.models import Count
+    
+    # Obtener configuración del sistema para la moneda
+    config = SystemConfiguration.get_config()
+    currency_symbol = config.get_currency_symbol() if config else '€'
+    
+    quotation = get_object_or_404(Quotation, id=quotation_id)
+    
+    # Obtener estadísticas de visitas
+    total_views = quotation.views.count()
+    views_by_country = quotation.views.values('country', 'country_code').annotate(
+        count=Count('id')
+    ).order_by('-count')
+    
+    # Obtener las últimas 10 visitas
+    recent_views = quotation.views.all()[:10]
+    
+    context = {
+        'page_title': f'Cotización {quotation.sequence}',
+        'quotation': quotation,
+        'currency_symbol': currency_symbol,
+        'total_views': total_views,
+        'views_by_country': views_by_country,
+        'recent_views': recent_views,
+    }
+    
+    return render(request, 'tickets/quotation_detail.html', context)
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_edit_view(request, quotation_id):
+    """Vista para editar una cotización"""
+    from .models import Quotation, Company, Product
+    from django.contrib.auth.models import User
+    
+    quotation = get_object_or_404(Quotation, id=quotation_id)
+    
+    if request.method == 'POST':
+        try:
+            quotation.company_id = request.POST.get('company')
+            quotation.salesperson_id = request.POST.get('salesperson')
+            quotation.date = request.POST.get('date')
+            quotation.status = request.POST.get('status')
+            
+            # Actualizar secuencia/código si se proporciona
+            sequence = request.POST.get('sequence')
+            if sequence:
+                quotation.sequence = sequence
+            
+            # Manejar fecha de vencimiento
+            expiry_date = request.POST.get('expiry_date')
+            if expiry_date:
+                quotation.expiry_date = expiry_date
+            else:
+                # Si no se proporciona, se calculará automáticamente en el método save()
+                quotation.expiry_date = None
+            
+            new_client_status = request.POST.get('client_status', 'pending')
+            
+            # Si se cambia a 'pending', limpiar datos de respuesta anterior para permitir nueva respuesta
+            if new_client_status == 'pending' and quotation.client_status != 'pending':
+                quotation.client_response_name = ''
+                quotation.client_response_email = ''
+                quotation.client_response_comments = ''
+                quotation.client_response_date = None
+                messages.info(request, f'Estado del cliente cambiado a "Pendiente". Se habilitó nuevamente la respuesta pública.')
+            
+            quotation.client_status = new_client_status
+            quotation.description = request.POST.get('description', '')
+            
+            # Manejar fechas de servicio
+            service_start_date = request.POST.get('service_start_date')
+            service_end_date = request.POST.get('service_end_date')
+            
+            if service_start_date:
+                quotation.service_start_date = service_start_date
+            else:
+                quotation.service_start_date = None
+                
+            if service_end_date:
+                quotation.service_end_date = service_end_date
+            else:
+                quotation.service_end_date = None
+            
+            quotation.save()
+            
+            # Mensaje especial cuando se aprueba
+            if quotation.status == 'approved':
+                messages.success(request, f'¡Excelente! La cotización {quotation.sequence} ha sido APROBADA exitosamente 🎉')
+            else:
+                messages.success(request, f'Cotización {quotation.sequence} actualizada exitosamente')
+                
+            return redirect('quotation_detail', quotation_id=quotation.id)
+        except Exception as e:
+            messages.error(request, f'Error al actualizar la cotización: {str(e)}')
+    
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    salespeople = User.objects.filter(is_active=True).order_by('first_name', 'last_name')
+    products = Product.objects.filter(is_active=True).order_by('name')
+    
+    # Obtener configuración del sistema para la moneda
+    from .models import SystemConfiguration
+    config = SystemConfiguration.get_config()
+    currency_symbol = config.get_currency_symbol() if config else '€'
+    
+    context = {
+        'page_title': f'Editar Cotización {quotation.sequence}',
+        'quotation': quotation,
+        'companies': companies,
+        'salespeople': salespeople,
+        'products': products,
+        'currency_symbol': currency_symbol,
+    }
+    
+    return render(request, 'tickets/quotation_form.html', context)
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_duplicate_view(request, quotation_id):
+    """Vista para duplicar una cotización"""
+    from .models import Quotation, QuotationLine
+    from django.utils import timezone
+    
+    # Obtener la cotización original
+    original_quotation = get_object_or_404(Quotation, id=quotation_id)
+    
+    try:
+        # Crear una nueva cotización duplicada
+        new_quotation = Quotation(
+            company=original_quotation.company,
+            salesperson=original_quotation.salesperson,
+            date=timezone.now().date(),  # Fecha actual
+            status='draft',  # Siempre empezar como borrador
+            client_status='pending',  # Estado del cliente pendiente
+            description=f"Duplicada de {original_quotation.sequence} - {original_quotation.description}"
+        )
+        new_quotation.save()  # Esto generará automáticamente la secuencia
+        
+        # Duplicar todas las líneas de la cotización original
+        original_lines = original_quotation.lines.all()
+        for line in original_lines:
+            QuotationLine.objects.create(
+                quotation=new_quotation,
+                product=line.product,
+                quantity=line.quantity,
+                unit_price=line.unit_price,
+                discount_percentage=line.discount_percentage,
+                description=line.description
+            )
+        
+        messages.success(
+            request, 
+            f'Cotización duplicada exitosamente. Nueva cotización: {new_quotation.sequence}'
+        )
+        
+        # Redirigir a la edición de la nueva cotización
+        return redirect('quotation_edit', quotation_id=new_quotation.id)
+        
+    except Exception as e:
+        messages.error(request, f'Error al duplicar la cotización: {str(e)}')
+        return redirect('quotation_detail', quotation_id=quotation_id)
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_delete_view(request, quotation_id):
+    """Vista para eliminar una cotización"""
+    from .models import Quotation
+    
+    quotation = get_object_or_404(Quotation, id=quotation_id)
+    
+    if request.method == 'POST':
+        sequence = quotation.sequence
+        quotation.delete()
+        messages.success(request, f'Cotización {sequence} eliminada exitosamente')
+        return redirect('quotation_list')
+    
+    context = {
+        'page_title': f'Eliminar Cotización {quotation.sequence}',
+        'quotation': quotation,
+    }
+    
+    return render(request, 'tickets/quotation_delete.html', context)
+
+
+@user_passes_test(is_agent, login_url='/')
+@user_passes_test(is_agent, login_url='/')
+def quotation_add_line_view(request, quotation_id):
+    """Vista AJAX para agregar línea a cotización"""
+    from .models import Quotation, QuotationLine, Product
+    from django.http import JsonResponse
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Método no permitido'})
+    
+    try:
+        quotation = get_object_or_404(Quotation, id=quotation_id)
+        product_id = request.POST.get('product_id')
+        quantity = request.POST.get('quantity', 1)
+        unit_price = request.POST.get('unit_price')
+        discount_percentage = request.POST.get('discount_percentage', 0)
+        description = request.POST.get('description', '')
+        
+        product = get_object_or_404(Product, id=product_id)
+        
+        # Si no se proporciona precio unitario, usar el del producto
+        if not unit_price:
+            unit_price = product.price
+        
+        line = QuotationLine.objects.create(
+            quotation=quotation,
+            product=product,
+            quantity=float(quantity),
+            unit_price=float(unit_price),
+            discount_percentage=float(discount_percentage),
+            description=description
+        )
+        
+        return JsonResponse({
+            'success': True,
+            'line': {
+                'id': line.id,
+                'product_name': line.product.name,
+                'quantity': float(line.quantity),
+                'unit_price': float(line.unit_price),
+                'discount_percentage': float(line.discount_percentage),
+                'subtotal': float(line.get_subtotal()),
+                'discount_amount': float(line.get_discount_amount()),
+                'total': float(line.get_total()),
+                'description': line.description,
+            },
+            'quotation_total': float(quotation.get_total_amount())
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_remove_line_view(request, quotation_id, line_id):
+    """Vista AJAX para remover línea de cotización"""
+    from .models import Quotation, QuotationLine
+    from django.http import JsonResponse
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Método no permitido'})
+    
+    try:
+        quotation = get_object_or_404(Quotation, id=quotation_id)
+        line = get_object_or_404(QuotationLine, id=line_id, quotation=quotation)
+        
+        line.delete()
+        
+        return JsonResponse({
+            'success': True,
+            'quotation_total': float(quotation.get_total_amount())
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+
+@login_required
+def quotation_pdf_view(request, quotation_id):
+    """Vista para generar PDF de cotización"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.lib.units import inch
+    import qrcode
+    from .models import Quotation, SystemConfiguration
+    
+    quotation = get_object_or_404(Quotation, id=quotation_id)
+    
+    # Crear el objeto response con content type PDF
+    response = HttpResponse(content_type='application/pdf')
+    response['Content-Disposition'] = f'attachment; filename="cotizacion_{quotation.sequence}.pdf"'
+    
+    # Crear el buffer
+    buffer = BytesIO()
+    
+    # Crear el documento PDF
+    doc = SimpleDocTemplate(buffer, pagesize=A4,
+                           rightMargin=72, leftMargin=72,
+                           topMargin=36, bottomMargin=18)
+    
+    # Crear lista de elementos para el PDF
+    elements = []
+    
+    # Obtener estilos
+    styles = getSampleStyleSheet()
+    
+    # Estilo personalizado para el encabezado
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        textColor=colors.darkblue,
+        alignment=1,  # Center
+        spaceAfter=20
+    )
+    
+    # Estilo para información de empresa
+    company_style = ParagraphStyle(
+        'Company',
+        parent=styles['Normal'],
+        fontSize=10,
+        alignment=2,  # Right
+    )
+    
+    # Información de la empresa emisora (parte superior derecha)
+    # Obtener la empresa del usuario que creó la cotización
+    user_company = None
+    if hasattr(quotation.salesperson, 'profile') and quotation.salesperson.profile.company:
+        user_company = quotation.salesperson.profile.company
+    
+    if user_company:
+        # Construir líneas solo si hay datos
+        company_lines = []
+        if user_company.name:
+            company_lines.append(user_company.name)
+        if user_company.address:
+            company_lines.append(user_company.address)
+        
+        # Ciudad y código postal en la misma línea
+        city_line = []
+        if user_company.city:
+            city_line.append(user_company.city)
+        if user_company.postal_code:
+            city_line.append(user_company.postal_code)
+        if city_line:
+            company_lines.append(' '.join(city_line))
+        
+        if user_company.state:
+            company_lines.append(user_company.state)
+        if user_company.country:
+            company_lines.append(user_company.country)
+        if user_company.tax_id:
+            company_lines.append(f"NIF: {user_company.tax_id}")
+        
+        # Agregar información de contacto
+        if user_company.phone:
+            company_lines.append(user_company.phone)
+        if user_company.email:
+            company_lines.append(user_company.email)
+        if user_company.website:
+            company_lines.append(user_company.website)
+        
+        # Unir todas las líneas
+        company_info = '<br/>'.join(company_lines)
+    else:
+        # Fallback a datos por defecto si no hay empresa asociada
+        company_info = """Manufactura y Servicios TACA<br/>
+CALLE 2DA TRANS LOCAL 22 ZONA<br/>
+INDUSTRIAL 2<br/>
+ACARIGUA PORTUGUESA ZONA POSTAL<br/>
+3301<br/>
+Venezuela<br/>
+NIF: V-14.677.128"""
+    
+    # Información del cliente (parte izquierda)
+    client_lines = []
+    # Agregar etiqueta "Contacto"
+    client_lines.append("Contacto")
+    if quotation.company.name:
+        client_lines.append(quotation.company.name)
+    if quotation.company.address:
+        client_lines.append(quotation.company.address)
+    
+    # Ciudad y código postal del cliente
+    client_city_line = []
+    if quotation.company.city:
+        client_city_line.append(quotation.company.city)
+    if quotation.company.postal_code:
+        client_city_line.append(quotation.company.postal_code)
+    if client_city_line:
+        client_lines.append(' '.join(client_city_line))
+    
+    if quotation.company.state:
+        client_lines.append(quotation.company.state)
+    if quotation.company.country:
+        client_lines.append(quotation.company.country)
+    if quotation.company.tax_id:
+        client_lines.append(f"NIF: {quotation.company.tax_id}")
+    
+    # Información de contacto del cliente
+    if quotation.company.phone:
+        client_lines.append(quotation.company.phone)
+    if quotation.company.email:
+        client_lines.append(quotation.company.email)
+    if quotation.company.website:
+        client_lines.append(quotation.company.website)
+    
+    client_info = '<br/>'.join(client_lines) if client_lines else quotation.company.name
+    
+    client_style = ParagraphStyle(
+        'Client',
+        parent=styles['Normal'],
+        fontSize=10,
+        alignment=0,  # Left
+    )
+    
+    # Crear tabla con empresa y cliente lado a lado
+    header_data = [[Paragraph(client_info, client_style), Paragraph(company_info, company_style)]]
+    header_table = Table(header_data, colWidths=[3.7*inch, 3.7*inch])
+    header_table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ]))
+    elements.append(header_table)
+    elements.append(Spacer(1, 20))
+    
+    # Título del documento
+    elements.append(Paragraph(f'Cotización # {quotation.sequence}', title_style))
+    
+    # Información de la cotización - izquierda y derecha
+    left_data = [
+        ['Fecha de cotización:', quotation.date.strftime('%d/%m/%Y')],
+        ['Fecha de vencimiento:', quotation.expiry_date.strftime('%d/%m/%Y') if quotation.expiry_date else 'No especificada'],
+    ]
+    
+    # Información del comercial - derecha
+    commercial_lines = []
+    commercial_name = quotation.salesperson.get_full_name() or quotation.salesperson.username
+    commercial_lines.append(f"<b>Comercial:</b> {commercial_name}")
+    
+    # Email del usuario
+    if quotation.salesperson.email:
+        commercial_lines.append(quotation.salesperson.email)
+    
+    # Teléfono del perfil del usuario
+    try:
+        profile = quotation.salesperson.profile
+        if profile and profile.phone:
+            commercial_lines.append(profile.phone)
+    except Exception:
+        # Si no hay perfil, intentar obtener el teléfono de la empresa del vendedor
+        try:
+            if user_company and user_company.phone:
+                commercial_lines.append(user_company.phone)
+        except Exception:
+            pass
+    
+    commercial_info = '<br/>'.join(commercial_lines)
+    
+    commercial_style = ParagraphStyle(
+        'Commercial',
+        parent=styles['Normal'],
+        fontSize=10,
+        alignment=2,  # Right
+    )
+    
+    # Crear tabla izquierda con fechas
+    left_table = Table(left_data, colWidths=[2*inch, 1.7*inch])
+    left_table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ]))
+    
+    # Combinar fechas e información comercial lado a lado
+    info_data = [[left_table, Paragraph(commercial_info, commercial_style)]]
+    info_table = Table(info_data, colWidths=[3.7*inch, 3.7*inch])
+    info_table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ]))
+    elements.append(info_table)
+    elements.append(Spacer(1, 20))
+    
+    # Tabla de productos
+    lines = quotation.lines.all()
+    table_data = [['Descripción', 'Cantidad', 'Precio unitario', 'Importe']]
+    
+    # Obtener configuración del sistema para la moneda
+    config = SystemConfiguration.get_config()
+    currency_symbol = config.get_currency_symbol()
+    
+    # Estilo para las descripciones en la tabla
+    description_style = ParagraphStyle(
+        'TableDescription',
+        parent=styles['Normal'],
+        fontSize=9,
+        leading=11,
+        wordWrap='CJK',
+    )
+    
+    for line in lines:
+        description_text = line.description or line.product.name
+        description_paragraph = Paragraph(description_text, description_style)
+        
+        table_data.append([
+            description_paragraph,
+            f'{line.quantity:,.0f}',
+            f'{line.unit_price:,.2f}',
+            f'{line.get_total():,.2f} {currency_symbol}'
+        ])
+    
+    # Crear la tabla
+    product_table = Table(table_data, colWidths=[3.7*inch, 1.2*inch, 1.3*inch, 1.2*inch])
+    product_table.setStyle(TableStyle([
+        # Bordes
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        
+        # Fuentes
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        
+        # Alineación vertical
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        
+        # Alineación horizontal - primero todo centrado
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        # Luego sobrescribimos la primera columna (Descripción) a la izquierda
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ]))
+    elements.append(product_table)
+    elements.append(Spacer(1, 20))
+    
+    # Totales
+    total_amount = quotation.get_total_amount()
+    totals_data = [
+        ['', '', '', 'Subtotal', f'{total_amount:,.2f} {currency_symbol}'],
+        ['', '', '', 'Total', f'{total_amount:,.2f} {currency_symbol}']
+    ]
+    
+    totals_table = Table(totals_data, colWidths=[3*inch, 1*inch, 1.2*inch, 1*inch, 1.2*inch])
+    totals_table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
+        ('FONTNAME', (3, 0), (3, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (4, 0), (4, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('LINEBELOW', (3, -1), (4, -1), 2, colors.black),
+    ]))
+    elements.append(totals_table)
+    elements.append(Spacer(1, 20))
+    
+    # Descripción de la cotización (si existe)
+    if quotation.description:
+        description_cotizacion_style = ParagraphStyle(
+            'DescriptionCotizacion',
+            parent=styles['Normal'],
+            fontSize=10,
+            alignment=0,  # Left
+            leading=14,
+            wordWrap='CJK',
+        )
+        # Reemplazar saltos de línea con <br/> para que se respeten en el PDF
+        formatted_description = quotation.description.replace('\n', '<br/>')
+        description_table = Table([[Paragraph(formatted_description, description_cotizacion_style)]], colWidths=[7.4*inch])
+        description_table.setStyle(TableStyle([
+            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+            ('LEFTPADDING', (0, 0), (0, 0), 0),
+            ('RIGHTPADDING', (0, 0), (0, 0), 0),
+            ('TOPPADDING', (0, 0), (0, 0), 0),
+            ('BOTTOMPADDING', (0, 0), (0, 0), 0),
+        ]))
+        elements.append(description_table)
+        elements.append(Spacer(1, 20))
+    
+    # Información de pago y QR code
+    # Construir información de pago basada en los datos de la empresa
+    payment_lines = []
+    
+    if user_company:
+        # Solo agregar secciones si hay datos
+        has_bank_data = user_company.bank_name or user_company.bank_account or user_company.bank_swift
+        has_contact_data = user_company.email or user_company.website
+        
+        if has_bank_data:
+            payment_lines.append("Datos Pago")
+            payment_lines.append("")  # Línea en blanco
+            
+            # Banco
+            if user_company.bank_name:
+                bank_line = f"Banco: {user_company.bank_name}"
+                if user_company.bank_url:
+                    bank_line += f" ( {user_company.bank_url} )"
+                payment_lines.append(bank_line)
+            
+            # Beneficiario
+            if user_company.bank_account_holder:
+                payment_lines.append(f"Nombre del Beneficiario: {user_company.bank_account_holder}")
+            elif user_company.name:
+                payment_lines.append(f"Nombre del Beneficiario: {user_company.name}")
+            
+            # Dirección
+            address_parts = []
+            if user_company.city:
+                address_parts.append(user_company.city)
+            if user_company.country:
+                address_parts.append(user_company.country)
+            if address_parts:
+                payment_lines.append(f"Dirección Beneficiario: {', '.join(address_parts)}")
+            
+            # Cuenta bancaria
+            if user_company.bank_account:
+                payment_lines.append(f"Numero de Cuenta Bancaria: {user_company.bank_account}")
+            
+            # SWIFT
+            if user_company.bank_swift:
+                payment_lines.append(f"BIC ( SWIFT ): {user_company.bank_swift}")
+            
+            payment_lines.append("")  # Línea en blanco
+        
+        # Condiciones de pago
+        if user_company.payment_terms:
+            # Las condiciones pueden tener múltiples líneas
+            payment_lines.extend(user_company.payment_terms.split('\n'))
+        
+        payment_info = '<br/>'.join(payment_lines) if payment_lines else "Información de pago no disponible"
+    else:
+        # Fallback a datos por defecto
+        payment_info = """"""
+    
+    # Generar QR code con la URL pública de la cotización
+    from io import BytesIO as QRBuffer
+    
+    # Obtener la URL pública de la cotización
+    public_url = request.build_absolute_uri(
+        reverse('quotation_public_view', kwargs={'token': quotation.public_token or quotation.generate_public_token()})
+    )
+    
+    # Generar QR code
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(public_url)
+    qr.make(fit=True)
+    
+    # Crear imagen del QR
+    qr_img = qr.make_image(fill_color="black", back_color="white")
+    
+    # Guardar imagen QR en buffer
+    qr_buffer = QRBuffer()
+    qr_img.save(qr_buffer, format='PNG')
+    qr_buffer.seek(0)
+    
+    # Crear objeto Image de ReportLab desde el buffer
+    qr_image = Image(qr_buffer, width=1.5*inch, height=1.5*inch)
+    
+    # Crear estilo para información de pago
+    payment_style = ParagraphStyle(
+        'PaymentInfo',
+        parent=styles['Normal'],
+        fontSize=9,
+        alignment=0,  # Left
+        leading=12,  # Espaciado entre líneas
+    )
+    
+    # Envolver payment_info en un Paragraph para que procese el HTML correctamente
+    payment_paragraph = Paragraph(payment_info, payment_style)
+    
+    # Crear una tabla con dos columnas: una para el QR y otra para la información de pago
+    payment_table_data = [
+        [qr_image, payment_paragraph]
+    ]
+    
+    payment_table = Table(payment_table_data, colWidths=[2*inch, 5.4*inch])
+    payment_table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+        ('ALIGN', (1, 0), (1, 0), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+    ]))
+    elements.append(payment_table)
+    
+    # Construir el PDF
+    doc.build(elements)
+    
+    # Obtener el valor del buffer y cerrarlo
+    pdf = buffer.getvalue()
+    buffer.close()
+    response.write(pdf)
+    
+    return response
+
+
+@login_required 
+def quotation_share_view(request, quotation_id):
+    """Vista para generar y compartir enlace público de cotización"""
+    from .models import Quotation
+    
+    quotation = get_object_or_404(Quotation, id=quotation_id)
+    
+    if request.method == 'POST':
+        # Generar token si no existe
+        token = quotation.generate_public_token()
+        public_url = quotation.get_public_url(request)
+        
+        return JsonResponse({
+            'success': True,
+            'public_url': public_url,
+            'token': token
+        })
+    
+    # Si es GET, mostrar modal o redirigir
+    return redirect('quotation_detail', quotation_id=quotation_id)
+
+
+def quotation_public_view(request, token):
+    """Vista pública para mostrar cotización sin autenticación"""
+    from .models import Quotation, SystemConfiguration, QuotationView
+    from .utils import get_client_ip, get_country_from_ip
+    
+    try:
+        quotation = get_object_or_404(Quotation, public_token=token)
+        
+        # Registrar la visita
+        ip_address = get_client_ip(request)
+        user_agent = request.META.get('HTTP_USER_AGENT', '')
+        
+        # Obtener información del país desde la IP
+        location_data = get_country_from_ip(ip_address)
+        
+        # Crear registro de visita
+        QuotationView.objects.create(
+            quotation=quotation,
+            ip_address=ip_address,
+            country=location_data.get('country', 'Desconocido'),
+            country_code=location_data.get('country_code', 'XX'),
+            user_agent=user_agent
+        )
+        
+        # Obtener configuración del sistema para la moneda
+        config = SystemConfiguration.get_config()
+        currency_symbol = config.get_currency_symbol()
+        
+        # Obtener la empresa del vendedor (compañía que cotiza)
+        seller_company = None
+        if hasattr(quotation.salesperson, 'profile') and quotation.salesperson.profile.company:
+            seller_company = quotation.salesperson.profile.company
+        
+        context = {
+            'quotation': quotation,
+            'currency_symbol': currency_symbol,
+            'can_respond': quotation.can_be_responded(),
+            'seller_company': seller_company,
+        }
+        
+        return render(request, 'tickets/quotation_public_view.html', context)
+        
+    except Exception as e:
+        return render(request, 'tickets/quotation_public_error.html', {
+            'error': 'Cotización no encontrada o enlace inválido.'
+        })
+
+
+def quotation_public_respond_view(request, token):
+    """Vista pública para que el cliente acepte o rechace la cotización"""
+    from .models import Quotation
+    from django.utils import timezone
+    
+    if request.method == 'POST':
+        try:
+            quotation = get_object_or_404(Quotation, public_token=token)
+            
+            if not quotation.can_be_responded():
+                return JsonResponse({
+                    'success': False, 
+                    'message': 'Esta cotización ya no puede ser modificada.'
+                })
+            
+            action = request.POST.get('action')  # 'accept' o 'reject'
+            client_name = request.POST.get('client_name', '')
+            client_email = request.POST.get('client_email', '')
+            comments = request.POST.get('comments', '')
+            
+            # Registrar información del cliente
+            quotation.client_response_name = client_name
+            quotation.client_response_email = client_email
+            quotation.client_response_comments = comments
+            quotation.client_response_date = timezone.now()
+            
+            if action == 'accept':
+                quotation.client_status = 'accepted'
+                quotation.status = 'approved'  # También actualizar el estado interno
+                message = f"Cotización aceptada por {client_name}"
+            elif action == 'reject':
+                quotation.client_status = 'rejected'
+                quotation.status = 'rejected'  # También actualizar el estado interno
+                message = f"Cotización rechazada por {client_name}"
+            else:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Acción no válida.'
+                })
+            
+            quotation.save()
+            
+            # Aquí podrías agregar lógica para enviar notificaciones por email
+            # o crear un registro de la respuesta del cliente
+            
+            return JsonResponse({
+                'success': True,
+                'message': message,
+                'new_status': quotation.get_status_display(),
+                'client_status': quotation.get_client_status_display()
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': f'Error al procesar la respuesta: {str(e)}'
+            })
+    
+    return JsonResponse({'success': False, 'message': 'Método no permitido.'})
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_edit_line_view(request, quotation_id, line_id):
+    """Vista AJAX para editar línea de cotización"""
+    from .models import Quotation, QuotationLine
+    from django.http import JsonResponse
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Método no permitido'})
+    
+    try:
+        quotation = get_object_or_404(Quotation, id=quotation_id)
+        line = get_object_or_404(QuotationLine, id=line_id, quotation=quotation)
+        
+        # Actualizar los campos de la línea
+        quantity = request.POST.get('quantity')
+        unit_price = request.POST.get('unit_price')
+        discount_percentage = request.POST.get('discount_percentage')
+        description = request.POST.get('description', '')
+        
+        if quantity:
+            line.quantity = float(quantity)
+        if unit_price:
+            line.unit_price = float(unit_price)
+        if discount_percentage:
+            line.discount_percentage = float(discount_percentage)
+        
+        line.description = description
+        line.save()
+        
+        return JsonResponse({
+            'success': True,
+            'line': {
+                'id': line.id,
+                'product_name': line.product.name,
+                'quantity': float(line.quantity),
+                'unit_price': float(line.unit_price),
+                'discount_percentage': float(line.discount_percentage),
+                'subtotal': float(line.get_subtotal()),
+                'discount_amount': float(line.get_discount_amount()),
+                'total': float(line.get_total()),
+                'description': line.description,
+            },
+            'quotation_total': float(quotation.get_total_amount())
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_get_lines_view(request, quotation_id):
+    """Vista AJAX para obtener líneas de una cotización"""
+    from .models import Quotation
+    from django.http import JsonResponse
+    
+    try:
+        quotation = get_object_or_404(Quotation, id=quotation_id)
+        
+        lines = []
+        for line in quotation.lines.all():
+            lines.append({
+                'id': line.id,
+                'product_name': line.product.name,
+                'quantity': float(line.quantity),
+                'unit_price': float(line.unit_price),
+                'discount_percentage': float(line.discount_percentage),
+                'subtotal': float(line.get_subtotal()),
+                'discount_amount': float(line.get_discount_amount()),
+                'total': float(line.get_total()),
+                'description': line.description,
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'lines': lines,
+            'quotation_total': float(quotation.get_total_amount())
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+
+@user_passes_test(is_agent, login_url='/')
+def get_products_ajax_view(request):
+    """Vista AJAX para obtener productos"""
+    from .models import Product
+    from django.http import JsonResponse
+    
+    try:
+        search = request.GET.get('search', '')
+        products = Product.objects.filter(is_active=True)
+        
+        if search:
+            products = products.filter(
+                models.Q(name__icontains=search) |
+                models.Q(description__icontains=search)
+            )
+        
+        products = products.order_by('name')[:20]  # Limitar a 20 resultados
+        
+        product_list = []
+        for product in products:
+            product_list.append({
+                'id': product.id,
+                'name': product.name,
+                'price': float(product.price),
+                'description': product.description[:100] + '...' if len(product.description) > 100 else product.description
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'products': product_list
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+
+# =================================
+# VISTAS PARA PLANTILLAS PÚBLICAS
+# =================================
+
+@user_passes_test(is_agent, login_url='/')
+@user_passes_test(is_agent, login_url='/')
+def quotation_template_create_new_view(request):
+    """Vista para crear una nueva plantilla desde cero"""
+    from .models import QuotationTemplate, Quotation
+    from django.contrib import messages
+    
+    if request.method == 'POST':
+        title = request.POST.get('title')
+        description = request.POST.get('description', '')
+        quotation_id = request.POST.get('quotation_id')
+        
+        if not title:
+            messages.error(request, 'El título es obligatorio.')
+        elif not quotation_id:
+            messages.error(request, 'Debes seleccionar una cotización base.')
+        else:
+            try:
+                quotation = Quotation.objects.get(id=quotation_id)
+                
+                # Crear la plantilla
+                template = QuotationTemplate.objects.create(
+                    title=title,
+                    description=description,
+                    template_quotation=quotation,
+                    created_by=request.user,
+                    is_active=True
+                )
+                
+                messages.success(request, f'Plantilla "{title}" creada exitosamente.')
+                return redirect('quotation_template_detail', template_id=template.id)
+                
+            except Quotation.DoesNotExist:
+                messages.error(request, 'La cotización seleccionada no existe.')
+    
+    # Obtener cotizaciones disponibles para usar como plantilla
+    quotations = Quotation.objects.select_related('company').filter(
+        status__in=['sent', 'approved']  # Solo cotizaciones enviadas o aprobadas
+    ).order_by('-created_at')[:50]  # Últimas 50
+    
+    context = {
+        'page_title': 'Crear Nueva Plantilla',
+        'quotations': quotations,
+    }
+    
+    return render(request, 'tickets/quotation_template_create_new.html', context)
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_template_edit_view(request, template_id):
+    """Vista para editar una plantilla existente"""
+    from .models import QuotationTemplate, Quotation
+    from django.contrib import messages
+    
+    template = get_object_or_404(QuotationTemplate, id=template_id)
+    
+    if request.method == 'POST':
+        title = request.POST.get('title')
+        description = request.POST.get('description', '')
+        quotation_id = request.POST.get('quotation_id')
+        is_active = request.POST.get('is_active') == 'on'
+        
+        if not title:
+            messages.error(request, 'El título es obligatorio.')
+        elif not quotation_id:
+            messages.error(request, 'Debes seleccionar una cotización base.')
+        else:
+            try:
+                quotation = Quotation.objects.get(id=quotation_id)
+                
+                # Actualizar la plantilla
+                template.title = title
+                template.description = description
+                template.template_quotation = quotation
+                template.is_active = is_active
+                template.save()
+                
+                messages.success(request, f'Plantilla "{title}" actualizada exitosamente.')
+                return redirect('quotation_template_detail', template_id=template.id)
+                
+            except Quotation.DoesNotExist:
+                messages.error(request, 'La cotización seleccionada no existe.')
+    
+    # Obtener cotizaciones disponibles para usar como plantilla
+    quotations = Quotation.objects.select_related('company').filter(
+        status__in=['sent', 'approved']  # Solo cotizaciones enviadas o aprobadas
+    ).order_by('-created_at')[:50]  # Últimas 50
+    
+    context = {
+        'page_title': f'Editar Plantilla: {template.title}',
+        'template': template,
+        'quotations': quotations,
+    }
+    
+    return render(request, 'tickets/quotation_template_edit.html', context)
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_template_delete_view(request, template_id):
+    """Vista para eliminar una plantilla"""
+    from .models import QuotationTemplate
+    from django.contrib import messages
+    
+    template = get_object_or_404(QuotationTemplate, id=template_id)
+    
+    if request.method == 'POST':
+        template_title = template.title
+        template.delete()
+        messages.success(request, f'Plantilla "{template_title}" eliminada exitosamente.')
+        return redirect('quotation_template_list')
+    
+    # Si no es POST, redirigir a la lista
+    return redirect('quotation_template_list')
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_template_create_view(request, quotation_id):
+    """Vista para crear una plantilla pública desde una cotización"""
+    from .models import Quotation, QuotationTemplate
+    
+    quotation = get_object_or_404(Quotation, id=quotation_id)
+    
+    if request.method == 'POST':
+        try:
+            template = QuotationTemplate.objects.create(
+                template_quotation=quotation,
+                title=request.POST.get('title'),
+                description=request.POST.get('description', ''),
+                created_by=request.user
+            )
+            
+            messages.success(request, f'Plantilla pública creada exitosamente. Token: {template.public_token}')
+            return redirect('quotation_template_detail', template_id=template.id)
+        except Exception as e:
+            messages.error(request, f'Error al crear la plantilla: {str(e)}')
+    
+    # Obtener configuración del sistema para la moneda
+    from .models import SystemConfiguration
+    config = SystemConfiguration.get_config()
+    currency_symbol = config.get_currency_symbol() if config else '€'
+    
+    context = {
+        'page_title': f'Crear Plantilla Pública - {quotation.sequence}',
+        'quotation': quotation,
+        'currency_symbol': currency_symbol,
+    }
+    
+    return render(request, 'tickets/quotation_template_create.html', context)
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_template_list_view(request):
+    """Vista para listar todas las plantillas públicas"""
+    from .models import QuotationTemplate
+    
+    templates = QuotationTemplate.objects.select_related(
+        'template_quotation', 'created_by'
+    ).order_by('-created_at')
+    
+    # Filtros opcionales
+    if request.GET.get('active_only'):
+        templates = templates.filter(is_active=True)
+    
+    # Calcular porcentajes de conversión y URLs públicas
+    for template in templates:
+        if template.views_count > 0:
+            template.conversion_rate = round((template.conversions_count * 100) / template.views_count, 1)
+        else:
+            template.conversion_rate = 0
+        # Agregar URL pública completa
+        template.public_url_full = request.build_absolute_uri(template.get_public_url())
+    
+    context = {
+        'page_title': 'Plantillas Públicas',
+        'templates': templates,
+    }
+    
+    return render(request, 'tickets/quotation_template_list.html', context)
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_template_detail_view(request, template_id):
+    """Vista para ver detalles de una plantilla pública"""
+    from .models import QuotationTemplate
+    
+    template = get_object_or_404(QuotationTemplate, id=template_id)
+    
+    # Calcular porcentaje de conversión
+    if template.views_count > 0:
+        template.conversion_rate = round((template.conversions_count * 100) / template.views_count, 1)
+    else:
+        template.conversion_rate = 0
+    
+    # Obtener solicitudes recientes
+    recent_requests = template.requests.select_related(
+        'generated_quotation'
+    ).order_by('-created_at')[:10]
+    
+    # Obtener configuración del sistema para la moneda
+    from .models import SystemConfiguration
+    config = SystemConfiguration.get_config()
+    currency_symbol = config.get_currency_symbol() if config else '€'
+    
+    context = {
+        'page_title': f'Plantilla: {template.title}',
+        'template': template,
+        'recent_requests': recent_requests,
+        'currency_symbol': currency_symbol,
+        'public_url': request.build_absolute_uri(template.get_public_url()),
+    }
+    
+    return render(request, 'tickets/quotation_template_detail.html', context)
+
+
+def quotation_template_public_form_view(request, token):
+    """Vista pública para que el cliente llene sus datos"""
+    from .models import QuotationTemplate, QuotationTemplateRequest
+    
+    try:
+        template = QuotationTemplate.objects.select_related(
+            'template_quotation', 'template_quotation__company'
+        ).get(public_token=token, is_active=True)
+    except QuotationTemplate.DoesNotExist:
+        return render(request, 'tickets/quotation_template_error.html', {
+            'error_message': 'El enlace que está intentando acceder no existe o ha expirado.'
+        })
+    
+    # Incrementar contador de vistas
+    template.increment_views()
+    
+    if request.method == 'POST':
+        try:
+            # Crear la solicitud
+            template_request = QuotationTemplateRequest.objects.create(
+                template=template,
+                client_name=request.POST.get('client_name'),
+                client_email=request.POST.get('client_email'),
+                client_phone=request.POST.get('client_phone', ''),
+                client_company=request.POST.get('client_company', ''),
+                client_comments=request.POST.get('client_comments', '')
+            )
+            
+            # Procesar automáticamente la solicitud
+            # Usar el vendedor de la cotización plantilla
+            salesperson = template.template_quotation.salesperson
+            new_quotation = template_request.process_request(salesperson)
+            
+            # Redirigir a la vista pública de la nueva cotización
+            return redirect('quotation_public_view', token=new_quotation.public_token)
+            
+        except Exception as e:
+            messages.error(request, f'Error al procesar su solicitud: {str(e)}')
+    
+    # Obtener configuración del sistema para la moneda
+    from .models import SystemConfiguration
+    config = SystemConfiguration.get_config()
+    currency_symbol = config.get_currency_symbol() if config else '€'
+    
+    context = {
+        'template': template,
+        'currency_symbol': currency_symbol,
+    }
+    
+    return render(request, 'tickets/quotation_template_public_form.html', context)
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_template_toggle_active_view(request, template_id):
+    """Vista para activar/desactivar una plantilla"""
+    from .models import QuotationTemplate
+    
+    if request.method == 'POST':
+        template = get_object_or_404(QuotationTemplate, id=template_id)
+        template.is_active = not template.is_active
+        template.save()
+        
+        status = "activada" if template.is_active else "desactivada"
+        messages.success(request, f'Plantilla {status} exitosamente')
+    
+    return redirect('quotation_template_detail', template_id=template_id)
+
+
+@user_passes_test(is_agent, login_url='/')
+def quotation_template_requests_view(request):
+    """Vista para ver todas las solicitudes de plantillas"""
+    from .models import QuotationTemplateRequest, QuotationTemplate
+    from django.core.paginator import Paginator
+    from django.db.models import Q
+    from datetime import datetime
+    
+    # Obtener todas las solicitudes
+    requests = QuotationTemplateRequest.objects.select_related(
+        'template', 'template__template_quotation', 'generated_quotation', 
+        'generated_quotation__company'
+    ).order_by('-created_at')
+    
+    # Filtros
+    template_filter = request.GET.get('template')
+    status_filter = request.GET.get('status')
+    date_from = request.GET.get('date_from')
+    date_to = request.GET.get('date_to')
+    
+    if template_filter:
+        requests = requests.filter(template_id=template_filter)
+    
+    if status_filter == 'processed':
+        requests = requests.filter(status__in=['processed', 'quoted'])
+    elif status_filter == 'pending':
+        requests = requests.filter(status='pending')
+    
+    if date_from:
+        try:
+            date_from_obj = datetime.strptime(date_from, '%Y-%m-%d').date()
+            requests = requests.filter(created_at__date__gte=date_from_obj)
+        except ValueError:
+            pass
+    
+    if date_to:
+        try:
+            date_to_obj = datetime.strptime(date_to, '%Y-%m-%d').date()
+            requests = requests.filter(created_at__date__lte=date_to_obj)
+        except ValueError:
+            pass
+    
+    # Paginación
+    paginator = Paginator(requests, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Estadísticas
+    all_requests = QuotationTemplateRequest.objects.all()
+    total_requests = all_requests.count()
+    processed_requests = all_requests.filter(status__in=['processed', 'quoted']).count()
+    pending_requests = total_requests - processed_requests
+    
+    conversion_rate = 0
+    if total_requests > 0:
+        conversion_rate = round((processed_requests * 100) / total_requests, 1)
+    
+    # Plantillas para filtro
+    templates_for_filter = QuotationTemplate.objects.select_related(
+        'template_quotation'
+    ).order_by('title')
+    
+    context = {
+        'page_title': 'Solicitudes de Plantillas',
+        'requests': page_obj,
+        'templates_for_filter': templates_for_filter,
+        'total_requests': total_requests,
+        'processed_requests': processed_requests,
+        'pending_requests': pending_requests,
+        'conversion_rate': conversion_rate,
+        'is_paginated': page_obj.has_other_pages(),
+        'page_obj': page_obj,
+    }
+    
+    return render(request, 'tickets/quotation_template_requests.html', context)
+
+
+# ============= VISTAS CRM PREGUNTAS =============
+
+def can_access_crm_question(user, question=None):
+    """
+    Verifica si un usuario puede acceder a las preguntas CRM o a una pregunta específica
+    - Agentes: pueden acceder a todas las preguntas
+    - Usuarios normales: solo pueden acceder a preguntas de su empresa
+    """
+    if not user.is_authenticated:
+        return False
+    
+    # Los agentes pueden ver todas las preguntas
+    if is_agent(user):
+        return True
+    
+    # Para usuarios normales, verificar empresa a través del profile
+    try:
+        user_company = user.profile.company
+    except:
+        user_company = None
+    
+    if not user_company:
+        return False
+    
+    # Si se especifica una pregunta, verificar que pertenezca a la empresa del usuario
+    if question:
+        return question.company == user_company
+    
+    # Si no se especifica pregunta, el usuario puede acceder al sistema pero con filtros
+    return True
+
+@login_required
+def crm_questions_list(request):
+    """Vista para listar preguntas del CRM"""
+    from .forms import CrmQuestionFilterForm
+    from django.db.models import Q
+    
+    # Verificar permisos de acceso
+    if not can_access_crm_question(request.user):
+        raise Http404("No tienes permisos para acceder a esta sección")
+    
+    # Filtros
+    filter_form = CrmQuestionFilterForm(request.GET, user=request.user)
+    questions = CrmQuestion.objects.all()
+    
+    # Aplicar filtros de visibilidad según el rol del usuario
+    if is_agent(request.user):
+        # Los agentes ven todas las preguntas
+        pass  # No se aplica ningún filtro
+    else:
+        # Los usuarios normales solo ven preguntas de su empresa
+        try:
+            user_company = request.user.profile.company
+        except:
+            user_company = None
+            
+        if user_company:
+            questions = questions.filter(company=user_company)
+        else:
+            # Si no tiene empresa asociada, no ve ninguna pregunta
+            questions = questions.none()
+    
+    # Variables para estadísticas antes de filtros
+    base_questions = questions
+    
+    if filter_form.is_valid():
+        # Filtro por empresa
+        if filter_form.cleaned_data.get('company'):
+            questions = questions.filter(company=filter_form.cleaned_data['company'])
+        
+        # Filtro por estado
+        status = filter_form.cleaned_data.get('status')
+        if status == 'answered':
+            questions = questions.filter(answer__isnull=False).exclude(answer='')
+        elif status == 'pending':
+            questions = questions.filter(Q(answer__isnull=True) | Q(answer=''))
+        
+        # Búsqueda de texto
+        search = filter_form.cleaned_data.get('search')
+        if search:
+            questions = questions.filter(
+                Q(question__icontains=search) |
+                Q(answer__icontains=search) |
+                Q(person_name__icontains=search) |
+                Q(person_email__icontains=search)
+            )
+    
+    questions = questions.order_by('-created_at')
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(questions, 20)  # Aumenté a 20 para la tabla
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Estadísticas basadas en filtros aplicados
+    total_questions = questions.count()
+    answered_questions = questions.filter(answer__isnull=False).exclude(answer='').count()
+    pending_questions = total_questions - answered_questions
+    
+    # Estadísticas generales (sin filtros)
+    total_all_questions = base_questions.count()
+    answered_all_questions = base_questions.filter(answer__isnull=False).exclude(answer='').count()
+    pending_all_questions = total_all_questions - answered_all_questions
+    
+    context = {
+        'page_title': 'Preguntas CRM',
+        'questions': page_obj,
+        'filter_form': filter_form,
+        'total_questions': total_questions,
+        'answered_questions': answered_questions,
+        'pending_questions': pending_questions,
+        'total_all_questions': total_all_questions,
+        'answered_all_questions': answered_all_questions,
+        'pending_all_questions': pending_all_questions,
+        'is_paginated': page_obj.has_other_pages(),
+        'page_obj': page_obj,
+        'has_filters': bool(request.GET.get('company') or request.GET.get('status') or request.GET.get('search')),
+    }
+    
+    return render(request, 'tickets/crm_questions_list.html', context)
+
+
+@login_required
+def crm_question_create(request):
+    """Vista para crear una nueva pregunta CRM"""
+    from .forms import CrmQuestionForm
+    
+    # Verificar permisos de acceso
+    if not can_access_crm_question(request.user):
+        raise Http404("No tienes permisos para acceder a esta sección")
+    
+    if request.method == 'POST':
+        form = CrmQuestionForm(request.POST, user=request.user)
+        if form.is_valid():
+            question = form.save(commit=False)
+            question.created_by = request.user
+            
+            # Verificar si se creó con respuesta
+            has_valid_answer = question.answer and question.answer.strip()
+            
+            if has_valid_answer:
+                question.answered_by = request.user
+                question.answered_at = timezone.now()
+            
+            question.save()
+            
+            # Mensaje según el estado inicial
+            if has_valid_answer:
+                messages.success(request, f'Pregunta #{question.sequence} creada y respondida exitosamente.')
+            else:
+                messages.success(request, f'Pregunta #{question.sequence} creada exitosamente (pendiente de respuesta).')
+            
+            return redirect('crm_questions_list')
+    else:
+        form = CrmQuestionForm(user=request.user)
+    
+    context = {
+        'page_title': 'Nueva Pregunta',
+        'form': form,
+        'action': 'create'
+    }
+    
+    return render(request, 'tickets/crm_question_form.html', context)
+
+
+@login_required
+def crm_question_detail(request, pk):
+    """Vista para ver el detalle de una pregunta CRM"""
+    question = get_object_or_404(CrmQuestion, pk=pk)
+    
+    # Verificar permisos
+    if not can_access_crm_question(request.user, question):
+        raise Http404("Pregunta no encontrada")
+    
+    context = {
+        'page_title': f'Pregunta #{question.sequence}',
+        'question': question,
+    }
+    
+    return render(request, 'tickets/crm_question_detail.html', context)
+
+
+@login_required
+def crm_question_edit(request, pk):
+    """Vista para editar una pregunta CRM"""
+    from .forms import CrmQuestionForm
+    
+    question = get_object_or_404(CrmQuestion, pk=pk)
+    
+    # Verificar permisos
+    if not can_access_crm_question(request.user, question):
+        raise Http404("Pregunta no encontrada")
+    
+    if request.method == 'POST':
+        form = CrmQuestionForm(request.POST, instance=question, user=request.user)
+        if form.is_valid():
+            # Obtener el estado anterior para comparar
+            was_answered_before = question.is_answered
+            old_answer = question.answer
+            
+            question = form.save(commit=False)
+            
+            # Verificar si hay respuesta válida
+            has_valid_answer = question.answer and question.answer.strip()
+            
+            if has_valid_answer:
+                # Si no había respuesta antes o se cambió
+                if not was_answered_before or (old_answer and old_answer.strip() != question.answer.strip()):
+                    question.answered_by = request.user
+                    question.answered_at = timezone.now()
+            else:
+                # No hay respuesta válida, marcar como pendiente
+                question.answered_by = None
+                question.answered_at = None
+            
+            question.save()
+            
+            # Mensaje según la acción realizada
+            if has_valid_answer:
+                if not was_answered_before:
+                    messages.success(request, f'Pregunta #{question.sequence} respondida exitosamente.')
+                else:
+                    messages.success(request, f'Respuesta de la pregunta #{question.sequence} actualizada exitosamente.')
+            else:
+                if was_answered_before:
+                    messages.warning(request, f'Pregunta #{question.sequence} marcada como pendiente (respuesta eliminada).')
+                else:
+                    messages.success(request, f'Pregunta #{question.sequence} actualizada exitosamente.')
+            
+            return redirect('crm_questions_list')
+    else:
+        form = CrmQuestionForm(instance=question, user=request.user)
+    
+    context = {
+        'page_title': f'Editar Pregunta #{question.sequence}',
+        'form': form,
+        'question': question,
+        'action': 'edit'
+    }
+    
+    return render(request, 'tickets/crm_question_form.html', context)
+
+
+@login_required
+def crm_question_delete(request, pk):
+    """Vista para eliminar una pregunta CRM"""
+    question = get_object_or_404(CrmQuestion, pk=pk)
+    
+    # Verificar permisos
+    if not can_access_crm_question(request.user, question):
+        raise Http404("Pregunta no encontrada")
+    
+    if request.method == 'POST':
+        question_number = question.sequence
+        question.delete()
+        messages.success(request, f'Pregunta #{question_number} eliminada exitosamente.')
+        return redirect('crm_questions_list')
+    
+    context = {
+        'page_title': f'Eliminar Pregunta #{question.sequence}',
+        'question': question,
+    }
+    
+    return render(request, 'tickets/crm_question_delete.html', context)
+
+
+# =============================================================================
+# VISTAS PÚBLICAS PARA CLIENTES
+# =============================================================================
+
+def public_crm_questions(request, company_uuid):
+    """Vista pública para que los clientes vean las preguntas de su empresa"""
+    company = get_object_or_404(Company, uuid=company_uuid, is_active=True)
+    
+    # Obtener todas las preguntas de la empresa
+    questions = CrmQuestion.objects.filter(company=company).order_by('-created_at')
+    
+    context = {
+        'page_title': f'Preguntas y Respuestas - {company.name}',
+        'company': company,
+        'questions': questions,
+    }
+    
+    return render(request, 'tickets/public_crm_questions.html', context)
+
+
+def public_crm_question_create(request, company_uuid):
+    """Vista pública para que los clientes envíen preguntas"""
+    company = get_object_or_404(Company, uuid=company_uuid, is_active=True)
+    
+    if request.method == 'POST':
+        form = PublicCrmQuestionForm(request.POST, company=company)
+        if form.is_valid():
+            question = form.save(commit=False)
+            question.company = company
+            question.save()
+            
+            messages.success(
+                request, 
+                f'¡Tu pregunta ha sido enviada exitosamente! '
+                f'Se te asignó el número #{question.sequence}. '
+                f'Podrás ver la respuesta en esta misma página cuando esté disponible.'
+            )
+            return redirect('public_crm_questions', company_uuid=company_uuid)
+    else:
+        form = PublicCrmQuestionForm(company=company)
+    
+    context = {
+        'page_title': f'Enviar Pregunta - {company.name}',
+        'company': company,
+        'form': form,
+    }
+    
+    return render(request, 'tickets/public_crm_question_form.html', context)
+
+
+# ==================== COTIZACIONES RÁPIDAS ====================
+
+@login_required
+def quick_quote_list(request):
+    """Lista de cotizaciones rápidas"""
+    from .models import QuickQuote
+    from django.db.models import Q, Sum, Count
+    
+    quotes = QuickQuote.objects.filter(user=request.user)
+    
+    # Calcular KPIs
+    total_quotes = quotes.count()
+    pending_quotes = quotes.filter(status='pending').count()
+    accepted_quotes = quotes.filter(status='accepted').count()
+    rejected_quotes = quotes.filter(status='rejected').count()
+    
+    # Total facturado (aceptadas)
+    total_revenue = quotes.filter(status='accepted').aggregate(total=Sum('total_amount'))['total'] or 0
+    
+    # Total pendiente
+    total_pending = quotes.filter(status='pending').aggregate(total=Sum('total_amount'))['total'] or 0
+    
+    # Filtros
+    status_filter = request.GET.get('status')
+    if status_filter:
+        quotes = quotes.filter(status=status_filter)
+    
+    quotes = quotes.order_by('-created_at')
+    
+    context = {
+        'quotes': quotes,
+        'status_filter': status_filter,
+        'page_title': 'Cotizaciones Rápidas',
+        'total_quotes': total_quotes,
+        'pending_quotes': pending_quotes,
+        'accepted_quotes': accepted_quotes,
+        'rejected_quotes': rejected_quotes,
+        'total_revenue': total_revenue,
+        'total_pending': total_pending,
+    }
+    return render(request, 'tickets/quick_quote_list.html', context)
+
+
+@login_required
+def quick_quote_create(request):
+    """Crear nueva cotización rápida"""
+    from .models import QuickQuote
+    from datetime import timedelta
+    
+    if request.method == 'POST':
+        from .models import Company
+        
+        title = request.POST.get('title')
+        hours = request.POST.get('hours')
+        hourly_rate = request.POST.get('hourly_rate')
+        client_name = request.POST.get('client_name', '')
+        client_email = request.POST.get('client_email', '')
+        notes = request.POST.get('notes', '')
+        valid_days = int(request.POST.get('valid_days', 7))
+        
+        # Obtener empresa si se seleccionó
+        company = None
+        client_selector = request.POST.get('client_selector', '')
+        if client_selector.startswith('company_'):
+            company_id = client_selector.replace('company_', '')
+            try:
+                company = Company.objects.get(id=company_id)
+            except Company.DoesNotExist:
+                pass
+        
+        quote = QuickQuote.objects.create(
+            user=request.user,
+            title=title,
+            hours=hours,
+            hourly_rate=hourly_rate,
+            company=company,
+            client_name=client_name,
+            client_email=client_email,
+            notes=notes,
+            valid_until=timezone.now() + timedelta(days=valid_days)
+        )
+        
+        messages.success(request, 'Cotización creada exitosamente')
+        return redirect('quick_quote_detail', pk=quote.pk)
+    
+    # Obtener empresas y contactos para selector
+    from .models import Company, Contact, UserProfile
+    import json
+    
+    # Obtener UserProfile del usuario actual
+    try:
+        user_profile = UserProfile.objects.get(user=request.user)
+        companies = Company.objects.filter(users=user_profile).values('id', 'name', 'email')
+    except UserProfile.DoesNotExist:
+        companies = []
+    
+    contacts = Contact.objects.filter(created_by=request.user).values('id', 'name', 'email')
+    
+    # Crear diccionario combinado
+    clients_data = {}
+    for company in companies:
+        clients_data[f'company_{company["id"]}'] = {
+            'name': company['name'],
+            'email': company['email'] or ''
+        }
+    for contact in contacts:
+        clients_data[f'contact_{contact["id"]}'] = {
+            'name': contact['name'],
+            'email': contact['email'] or ''
+        }
+    
+    context = {
+        'page_title': 'Nueva Cotización Rápida',
+        'companies': companies,
+        'contacts': contacts,
+        'clients_data_json': json.dumps(clients_data),
+    }
+    return render(request, 'tickets/quick_quote_form.html', context)
+
+
+@login_required
+def quick_quote_detail(request, pk):
+    """Detalle de cotización rápida"""
+    from .models import QuickQuote
+    
+    quote = get_object_or_404(QuickQuote, pk=pk, user=request.user)
+    
+    # Actualizar estado si expiró
+    if quote.is_expired() and quote.status == 'pending':
+        quote.status = 'expired'
+        quote.save()
+    
+    # Obtener estadísticas de visualizaciones
+    views = quote.views.all()
+    total_views = views.count()
+    unique_ips = views.values('ip_address').distinct().count()
+    
+    # Últimas visualizaciones
+    recent_views = views[:10]
+    
+    # Estadísticas por dispositivo
+    device_stats = {}
+    for view in views:
+        device = view.device_type or 'Unknown'
+        device_stats[device] = device_stats.get(device, 0) + 1
+    
+    # Estadísticas por país
+    country_stats = {}
+    for view in views:
+        country = view.country or 'Unknown'
+        country_stats[country] = country_stats.get(country, 0) + 1
+    
+    context = {
+        'quote': quote,
+        'public_url': quote.get_public_url(request),
+        'page_title': f'Cotización: {quote.title}',
+        'total_views': total_views,
+        'unique_ips': unique_ips,
+        'recent_views': recent_views,
+        'device_stats': device_stats,
+        'country_stats': country_stats,
+    }
+    return render(request, 'tickets/quick_quote_detail.html', context)
+
+
+@login_required
+def quick_quote_edit(request, pk):
+    """Editar cotización rápida"""
+    from .models import QuickQuote
+    from datetime import timedelta
+    
+    quote = get_object_or_404(QuickQuote, pk=pk, user=request.user)
+    
+    if request.method == 'POST':
+        quote.title = request.POST.get('title')
+        quote.hours = request.POST.get('hours')
+        quote.hourly_rate = request.POST.get('hourly_rate')
+        quote.client_name = request.POST.get('client_name', '')
+        quote.client_email = request.POST.get('client_email', '')
+        quote.notes = request.POST.get('notes', '')
+        
+        valid_days = int(request.POST.get('valid_days', 7))
+        quote.valid_until = timezone.now() + timedelta(days=valid_days)
+        
+        quote.save()
+        
+        messages.success(request, 'Cotización actualizada exitosamente')
+        return redirect('quick_quote_detail', pk=quote.pk)
+    
+    # Calcular días de validez restantes
+    days_remaining = (quote.valid_until - timezone.now()).days
+    
+    context = {
+        'quote': quote,
+        'days_remaining': days_remaining,
+        'page_title': f'Editar: {quote.title}',
+    }
+    return render(request, 'tickets/quick_quote_form.html', context)
+
+
+@login_required
+def quick_quote_delete(request, pk):
+    """Eliminar cotización rápida"""
+    from .models import QuickQuote
+    
+    quote = get_object_or_404(QuickQuote, pk=pk, user=request.user)
+    
+    if request.method == 'POST':
+        title = quote.title
+        quote.delete()
+        messages.success(request, f'Cotización "{title}" eliminada exitosamente')
+        return redirect('quick_quote_list')
+    
+    context = {
+        'quote': quote,
+        'page_title': f'Eliminar: {quote.title}',
+    }
+    return render(request, 'tickets/quick_quote_delete.html', context)
+
+
+def quick_quote_public(request, token):
+    """Vista pública para que el cliente acepte o rechace la cotización"""
+    from .models import QuickQuote, QuickQuoteView
+    
+    quote = get_object_or_404(QuickQuote, public_token=token)
+    
+    # Registrar visualización
+    try:
+        from user_agents import parse
+        import requests
+        
+        # Obtener IP
+        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+        if x_forwarded_for:
+            ip = x_forwarded_for.split(',')[0]
+        else:
+            ip = request.META.get('REMOTE_ADDR')
+        
+        # Parsear user agent
+        user_agent_string = request.META.get('HTTP_USER_AGENT', '')
+        user_agent = parse(user_agent_string)
+        
+        # Obtener geolocalización (opcional)
+        country = ''
+        city = ''
+        try:
+            geo_response = requests.get(f'http://ip-api.com/json/{ip}', timeout=2)
+            if geo_response.status_code == 200:
+                geo_data = geo_response.json()
+                country = geo_data.get('country', '')
+                city = geo_data.get('city', '')
+        except:
+            pass
+        
+        # Registrar vista
+        QuickQuoteView.objects.create(
+            quote=quote,
+            ip_address=ip,
+            user_agent=user_agent_string,
+            country=country,
+            city=city,
+            browser=f"{user_agent.browser.family} {user_agent.browser.version_string}",
+            device_type='Mobile' if user_agent.is_mobile else 'Tablet' if user_agent.is_tablet else 'Desktop'
+        )
+    except Exception as e:
+        # Si falla el tracking, continuar sin problemas
+        pass
+    
+    # Verificar si expiró
+    if quote.is_expired():
+        quote.status = 'expired'
+        quote.save()
+    
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        response_notes = request.POST.get('response_notes', '')
+        
+        # Manejar comentarios
+        if action == 'comment':
+            from .models import QuickQuoteComment
+            author_name = request.POST.get('author_name', '').strip()
+            author_email = request.POST.get('author_email', '').strip()
+            comment_text = request.POST.get('comment', '').strip()
+            
+            if author_name and author_email and comment_text:
+                QuickQuoteComment.objects.create(
+                    quote=quote,
+                    author_name=author_name,
+                    author_email=author_email,
+                    comment=comment_text,
+                    ip_address=request.META.get('REMOTE_ADDR')
+                )
+                messages.success(request, 'Comentario enviado exitosamente')
+            else:
+                messages.error(request, 'Por favor complete todos los campos del comentario')
+        
+        elif action in ['accept', 'reject']:
+            quote.status = 'accepted' if action == 'accept' else 'rejected'
+            quote.response_date = timezone.now()
+            quote.response_notes = response_notes
+            quote.save()
+            
+            # Enviar notificación al usuario (opcional)
+            # TODO: Implementar envío de email
+            
+            messages.success(
+                request, 
+                f'Cotización {"aceptada" if action == "accept" else "rechazada"} exitosamente'
+            )
+    
+    # Obtener otras cotizaciones del mismo cliente
+    other_quotes = []
+    if quote.company:
+        # Si tiene empresa, buscar por empresa
+        other_quotes = QuickQuote.objects.filter(
+            company=quote.company
+        ).exclude(
+            id=quote.id
+        ).order_by('-created_at')[:5]
+    elif quote.client_email:
+        # Si no tiene empresa pero tiene email, buscar por email
+        other_quotes = QuickQuote.objects.filter(
+            client_email=quote.client_email
+        ).exclude(
+            id=quote.id
+        ).order_by('-created_at')[:5]
+    elif quote.client_name:
+        # Si solo tiene nombre, buscar por nombre
+        other_quotes = QuickQuote.objects.filter(
+            client_name=quote.client_name
+        ).exclude(
+            id=quote.id
+        ).order_by('-created_at')[:5]
+    
+    # Obtener comentarios de la cotización
+    comments = quote.comments.all().order_by('-created_at')
+    
+    context = {
+        'quote': quote,
+        'page_title': f'Cotización: {quote.title}',
+        'other_quotes': other_quotes,
+        'comments': comments,
+    }
+    return render(request, 'tickets/quick_quote_public.html', context)
+
+
+@login_required
+def quick_quote_duplicate(request, pk):
+    """Duplicar cotización rápida"""
+    from .models import QuickQuote
+    from datetime import timedelta
+    
+    original = get_object_or_404(QuickQuote, pk=pk, user=request.user)
+    
+    # Crear copia
+    duplicate = QuickQuote.objects.create(
+        user=request.user,
+        title=f"{original.title} (Copia)",
+        hours=original.hours,
+        hourly_rate=original.hourly_rate,
+        company=original.company,
+        client_name=original.client_name,
+        client_email=original.client_email,
+        notes=original.notes,
+        valid_until=timezone.now() + timedelta(days=7),
+        status='pending'
+    )
+    
+    messages.success(request, 'Cotización duplicada exitosamente')
+    return redirect('quick_quote_detail', pk=duplicate.pk)
+
+
+def quick_quote_public_list(request, client_name):
+    """Vista pública del listado de cotizaciones de un cliente por nombre"""
+    from .models import QuickQuote
+    from django.db.models import Sum
+    from urllib.parse import unquote
+    
+    # Decodificar el nombre del cliente de la URL
+    client_name_decoded = unquote(client_name)
+    
+    # Filtrar cotizaciones por nombre de cliente (case-insensitive)
+    quotes = QuickQuote.objects.filter(
+        client_name__iexact=client_name_decoded
+    ).order_by('-created_at')
+    
+    if not quotes.exists():
+        from django.http import Http404
+        raise Http404("No se encontraron cotizaciones para este cliente")
+    
+    # Calcular subtotal de todas las cotizaciones
+    subtotal = quotes.aggregate(total=Sum('total_amount'))['total'] or 0
+    
+    # Calcular subtotal solo de cotizaciones aceptadas
+    subtotal_accepted = quotes.filter(status='accepted').aggregate(total=Sum('total_amount'))['total'] or 0
+    
+    # Estadísticas
+    total_quotes = quotes.count()
+    pending_quotes = quotes.filter(status='pending').count()
+    accepted_quotes = quotes.filter(status='accepted').count()
+    rejected_quotes = quotes.filter(status='rejected').count()
+    expired_quotes = quotes.filter(status='expired').count()
+    
+    context = {
+        'quotes': quotes,
+        'client_name': client_name_decoded,
+        'subtotal': subtotal,
+        'subtotal_accepted': subtotal_accepted,
+        'total_quotes': total_quotes,
+        'pending_quotes': pending_quotes,
+        'accepted_quotes': accepted_quotes,
+        'rejected_quotes': rejected_quotes,
+        'expired_quotes': expired_quotes,
+        'page_title': f'Cotizaciones de {client_name_decoded}',
+    }
+    return render(request, 'tickets/quick_quote_public_list.html', context)
+
+
+# ==================== CONTACT TAG API ====================
+
+@login_required
+def contact_tags_api(request):
+    """API endpoint para listar todas las etiquetas de contacto"""
+    from .models import ContactTag
+    
+    tags = ContactTag.objects.all().order_by('name')
+    
+    tags_data = [{
+        'id': tag.id,
+        'name': tag.name,
+        'color': tag.color,
+        'description': tag.description or ''
+    } for tag in tags]
+    
+    return JsonResponse(tags_data, safe=False)
+
+
+@login_required
+@require_POST
+def contact_tag_create_api(request):
+    """API endpoint para crear una nueva etiqueta de contacto"""
+    from .models import ContactTag
+    
+    try:
+        data = json.loads(request.body)
+        
+        name = data.get('name', '').strip()
+        color = data.get('color', '#6c757d').strip()
+        description = data.get('description', '').strip()
+        
+        if not name:
+            return JsonResponse({
+                'success': False,
+                'error': 'El nombre de la etiqueta es obligatorio'
+            }, status=400)
+        
+        # Validar que el nombre no exista
+        if ContactTag.objects.filter(name__iexact=name).exists():
+            return JsonResponse({
+                'success': False,
+                'error': 'Ya existe una etiqueta con ese nombre'
+            }, status=400)
+        
+        # Crear la etiqueta
+        tag = ContactTag.objects.create(
+            name=name,
+            color=color,
+            description=description
+        )
+        
+        return JsonResponse({
+            'success': True,
+            'tag': {
+                'id': tag.id,
+                'name': tag.name,
+                'color': tag.color,
+                'description': tag.description or ''
+            }
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({
+            'success': False,
+            'error': 'JSON inválido'
+        }, status=400)
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        }, status=500)
+
+
+# ==================== EMAIL TEMPLATES ====================
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def email_template_list(request):
+    """Vista para listar plantillas de correo"""
+    from .models import EmailTemplate
+    
+    # Filtros
+    category_filter = request.GET.get('category', '')
+    search = request.GET.get('search', '')
+    
+    templates = EmailTemplate.objects.all()
+    
+    if category_filter:
+        templates = templates.filter(category=category_filter)
+    
+    if search:
+        templates = templates.filter(
+            Q(title__icontains=search) | Q(body__icontains=search)
+        )
+    
+    # Paginación
+    paginator = Paginator(templates, 20)
+    page = request.GET.get('page')
+    page_obj = paginator.get_page(page)
+    
+    # Categorías para filtro
+    categories = EmailTemplate.CATEGORY_CHOICES
+    
+    context = {
+        'page_title': 'Plantillas de Correo',
+        'page_obj': page_obj,
+        'categories': categories,
+        'category_filter': category_filter,
+        'search': search,
+    }
+    return render(request, 'tickets/email_template_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def email_template_create(request):
+    """Vista para crear plantilla de correo"""
+    from .models import EmailTemplate
+    from .forms import EmailTemplateForm
+    
+    if request.method == 'POST':
+        form = EmailTemplateForm(request.POST)
+        if form.is_valid():
+            template = form.save(commit=False)
+            template.created_by = request.user
+            template.save()
+            
+            messages.success(request, f'Plantilla "{template.title}" creada exitosamente.')
+            return redirect('email_template_detail', pk=template.pk)
+    else:
+        form = EmailTemplateForm()
+    
+    context = {
+        'page_title': 'Nueva Plantilla de Correo',
+        'form': form,
+    }
+    return render(request, 'tickets/email_template_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def email_template_detail(request, pk):
+    """Vista de detalle de plantilla de correo"""
+    from .models import EmailTemplate
+    
+    template = get_object_or_404(EmailTemplate, pk=pk)
+    history = template.history.all()[:20]  # Últimos 20 cambios
+    
+    context = {
+        'page_title': f'Plantilla: {template.title}',
+        'template': template,
+        'history': history,
+    }
+    return render(request, 'tickets/email_template_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def email_template_edit(request, pk):
+    """Vista para editar plantilla de correo"""
+    from .models import EmailTemplate, EmailTemplateHistory
+    from .forms import EmailTemplateForm
+    
+    template = get_object_or_404(EmailTemplate, pk=pk)
+    
+    if request.method == 'POST':
+        form = EmailTemplateForm(request.POST, instance=template)
+        if form.is_valid():
+            # Guardar estado anterior en historial
+            EmailTemplateHistory.objects.create(
+                template=template,
+                title=template.title,
+                body=template.body,
+                category=template.category,
+                order=template.order,
+                changed_by=request.user,
+                change_reason=request.POST.get('change_reason', '')
+            )
+            
+            form.save()
+            messages.success(request, f'Plantilla "{template.title}" actualizada exitosamente.')
+            return redirect('email_template_detail', pk=template.pk)
+    else:
+        form = EmailTemplateForm(instance=template)
+    
+    context = {
+        'page_title': f'Editar: {template.title}',
+        'form': form,
+        'template': template,
+    }
+    return render(request, 'tickets/email_template_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def email_template_delete(request, pk):
+    """Vista para eliminar plantilla de correo"""
+    from .models import EmailTemplate
+    
+    template = get_object_or_404(EmailTemplate, pk=pk)
+    
+    if request.method == 'POST':
+        title = template.title
+        template.delete()
+        messages.success(request, f'Plantilla "{title}" eliminada exitosamente.')
+        return redirect('email_template_list')
+    
+    context = {
+        'page_title': f'Eliminar: {template.title}',
+        'template': template,
+    }
+    return render(request, 'tickets/email_template_delete.html', context)
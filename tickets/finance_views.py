@@ -0,0 +1,3346 @@
+"""
+Vistas financieras: acciones, PayPal, facturas, presupuestos y transacciones.
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.db import models
+from django.http import HttpResponse, JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods
+from django.views.decorators.csrf import csrf_exempt
+import json
+from io import BytesIO
+from .models import Company, PersonalBudget, BudgetIncomeItem, BudgetExpenseItem, BudgetTransaction
+from .forms import (
+    PersonalBudgetForm, BudgetIncomeItemForm, BudgetExpenseItemForm, BudgetTransactionForm,
+)
+from .utils import is_agent
+
+
+# ====================================
+# VISTAS DE ACCIONES FINANCIERAS
+# ====================================
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def financial_actions_list_view(request):
+    """Vista para listar todas las acciones financieras"""
+    from .models import FinancialAction
+    
+    actions = FinancialAction.objects.all().order_by('order', 'symbol')
+    
+    # Búsqueda
+    search = request.GET.get('search')
+    if search:
+        actions = actions.filter(
+            models.Q(symbol__icontains=search) |
+            models.Q(name__icontains=search)
+        )
+    
+    # Filtro por estado activo
+    status = request.GET.get('status')
+    if status == 'active':
+        actions = actions.filter(is_active=True)
+    elif status == 'inactive':
+        actions = actions.filter(is_active=False)
+    
+    context = {
+        'page_title': 'Gestión de Acciones Financieras',
+        'actions': actions,
+        'search': search,
+        'status': status,
+    }
+    
+    return render(request, 'tickets/financial_actions_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def financial_action_create_view(request):
+    """Vista para crear una nueva acción financiera"""
+    from .models import FinancialAction
+    from .forms import FinancialActionForm
+    
+    if request.method == 'POST':
+        form = FinancialActionForm(request.POST)
+        if form.is_valid():
+            action = form.save()
+            messages.success(request, f'Acción financiera "{action.symbol}" creada exitosamente.')
+            return redirect('financial_actions_list')
+        else:
+            messages.error(request, 'Por favor, corrige los errores en el formulario.')
+    else:
+        # Obtener el siguiente orden sugerido
+        last_action = FinancialAction.objects.order_by('-order').first()
+        suggested_order = (last_action.order + 1) if last_action else 1
+        
+        form = FinancialActionForm(initial={'order': suggested_order})
+    
+    context = {
+        'page_title': 'Crear Acción Financiera',
+        'form': form,
+        'suggested_order': form.initial.get('order', 1),
+        'is_edit': False,
+    }
+    
+    return render(request, 'tickets/financial_action_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def financial_action_edit_view(request, pk):
+    """Vista para editar una acción financiera"""
+    from .models import FinancialAction
+    from .forms import FinancialActionForm
+    
+    action = get_object_or_404(FinancialAction, pk=pk)
+    
+    if request.method == 'POST':
+        form = FinancialActionForm(request.POST, instance=action)
+        if form.is_valid():
+            # No actualizar los campos de precio si vienen en el POST
+            # Ya que deben ser de solo lectura
+            cleaned_data = form.cleaned_data.copy()
+            if action.pk:  # Si es edición, mantener precios existentes
+                cleaned_data.pop('current_price', None)
+                cleaned_data.pop('previous_price', None)
+            
+            # Actualizar solo los campos editables
+            for field, value in cleaned_data.items():
+                if field not in ['current_price', 'previous_price']:
+                    setattr(action, field, value)
+            
+            action.save()
+            messages.success(request, f'Acción financiera "{action.symbol}" actualizada exitosamente.')
+            return redirect('financial_actions_list')
+        else:
+            messages.error(request, 'Por favor, corrige los errores en el formulario.')
+    else:
+        form = FinancialActionForm(instance=action)
+    
+    # Obtener el siguiente orden sugerido por si lo necesita
+    last_action = FinancialAction.objects.order_by('-order').first()
+    suggested_order = (last_action.order + 1) if last_action else 1
+    
+    context = {
+        'page_title': f'Editar - {action.symbol}',
+        'action': action,
+        'form': form,
+        'suggested_order': suggested_order,
+        'is_edit': True,
+    }
+    
+    return render(request, 'tickets/financial_action_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def financial_action_delete_view(request, pk):
+    """Vista para eliminar una acción financiera"""
+    from .models import FinancialAction
+    
+    action = get_object_or_404(FinancialAction, pk=pk)
+    
+    if request.method == 'POST':
+        try:
+            symbol = action.symbol
+            action.delete()
+            messages.success(request, f'Acción financiera "{symbol}" eliminada exitosamente.')
+            return redirect('financial_actions_list')
+            
+        except Exception as e:
+            messages.error(request, f'Error eliminando acción financiera: {str(e)}')
+            return redirect('financial_actions_list')
+    
+    context = {
+        'page_title': f'Eliminar - {action.symbol}',
+        'action': action,
+    }
+    
+    return render(request, 'tickets/financial_action_delete.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def financial_action_toggle_view(request, pk):
+    """Vista para activar/desactivar una acción financiera"""
+    from .models import FinancialAction
+    
+    action = get_object_or_404(FinancialAction, pk=pk)
+    action.is_active = not action.is_active
+    action.save()
+    
+    status = 'activada' if action.is_active else 'desactivada'
+    messages.success(request, f'Acción financiera "{action.symbol}" {status} exitosamente.')
+    
+    return redirect('financial_actions_list')
+
+
+def financial_actions_ticker_data_view(request):
+    """Vista AJAX para obtener datos del ticker de acciones"""
+    from .models import FinancialAction
+    from django.http import JsonResponse
+    
+    actions = FinancialAction.objects.filter(is_active=True).order_by('order', 'symbol')
+    
+    data = []
+    for action in actions:
+        data.append({
+            'id': action.id,
+            'symbol': action.symbol,
+            'name': action.name,
+            'current_price': float(action.current_price) if action.current_price is not None else 0.0,
+            'previous_price': float(action.previous_price) if action.previous_price else None,
+            'currency': action.currency,
+            'price_change': float(action.price_change) if hasattr(action, 'price_change') and action.price_change is not None else 0.0,
+            'price_change_percent': float(action.price_change_percent) if hasattr(action, 'price_change_percent') and action.price_change_percent is not None else 0.0,
+            'is_positive_change': action.is_positive_change if hasattr(action, 'is_positive_change') else False,
+            'is_negative_change': action.is_negative_change if hasattr(action, 'is_negative_change') else False,
+            'change_color_class': action.change_color_class if hasattr(action, 'change_color_class') else '',
+        })
+    
+    return JsonResponse({'actions': data})
+
+
+@login_required
+@user_passes_test(lambda u: u.is_staff or hasattr(u, 'role') and u.role in ['agente'])
+def financial_actions_update_prices_view(request):
+    """
+    Lanza la actualización de precios de todas las acciones en segundo plano
+    (POST) o devuelve el estado de la última actualización (GET).
+    """
+    from .financial_api import price_refresh_status, start_price_refresh
+    
+    if request.method == 'POST':
+        started = start_price_refresh()
+        return JsonResponse({
+            'success': True,
+            'started': started,
+            'message': 'Actualización de precios iniciada' if started else 'Ya hay una actualización de precios en curso',
+        }, status=202)
+    
+    return JsonResponse({'success': True, **price_refresh_status()})
+
+
+@login_required
+@user_passes_test(lambda u: u.is_staff or hasattr(u, 'role') and u.role in ['agente'])
+def financial_action_update_single_price_view(request, pk):
+    """Vista para actualizar precio de una acción específica"""
+    if request.method == 'POST':
+        from .financial_api import FinancialDataAPI
+        from .models import FinancialAction
+        
+        try:
+            action = get_object_or_404(FinancialAction, pk=pk)
+            api = FinancialDataAPI()
+            
+            if api.update_price(action):
+                return JsonResponse({
+                    'success': True,
+                    'message': f'Precio de {action.symbol} actualizado exitosamente',
+                    'new_price': float(action.current_price),
+                    'previous_price': float(action.previous_price) if action.previous_price else None,
+                    'price_change': float(action.price_change),
+                    'price_change_percent': float(action.price_change_percent),
+                    'last_updated': action.last_updated.strftime('%d/%m/%Y %H:%M'),
+                })
+            else:
+                return JsonResponse({
+                    'success': False,
+                    'message': f'No se pudo obtener precio actualizado para {action.symbol}'
+                })
+                
+        except FinancialAction.DoesNotExist:
+            return JsonResponse({
+                'success': False,
+                'message': 'Acción financiera no encontrada'
+            })
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': f'Error actualizando precio: {str(e)}'
+            })
+    
+    return JsonResponse({'success': False, 'message': 'Método no permitido'})
+
+
+@login_required
+def meeting_ai_recommendations_view(request):
+    """Vista para generar propuestas específicas para el cliente basadas en el contenido de la reunión"""
+    if request.method == 'POST':
+        try:
+            import json
+            data = json.loads(request.body)
+            content = data.get('content', '').strip()
+            
+            if not content:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'No se proporcionó contenido para analizar'
+                })
+            
+            # Generar propuestas específicas para el cliente
+            proposals = generate_client_proposals(content.lower())
+            
+            return JsonResponse({
+                'success': True,
+                'recommendations': proposals[:5],  # Máximo 5 propuestas
+                'analysis_summary': f'Analicé {len(content.split())} palabras y generé {len(proposals[:5])} propuestas específicas para el cliente.'
+            })
+            
+        except json.JSONDecodeError:
+            return JsonResponse({
+                'success': False,
+                'message': 'Formato de datos inválido'
+            })
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': f'Error procesando propuestas: {str(e)}'
+            })
+    
+    return JsonResponse({'success': False, 'message': 'Método no permitido'})
+
+
+def generate_client_proposals(content):
+    """
+    Genera propuestas específicas para el cliente basadas en el análisis del contenido
+    """
+    proposals = []
+    
+    # Análisis de industria/sector
+    if any(word in content for word in ['tienda', 'venta', 'producto', 'inventario', 'retail', 'comercio']):
+        proposals.append({
+            'type': 'solution',
+            'icon': 'fa-store',
+            'title': 'Sistema de Gestión de Inventario Inteligente',
+            'suggestion': '🎯 Propuesta: Implementar sistema automatizado que optimice control de stock, reduzca mermas 25% y mejore rotación de productos con alertas inteligentes de restock.',
+            'action': 'Proponer Sistema de Inventario',
+            'priority': 'high'
+        })
+    
+    if any(word in content for word in ['ventas', 'clientes', 'crm', 'marketing', 'leads']):
+        proposals.append({
+            'type': 'crm',
+            'icon': 'fa-users',
+            'title': 'Plataforma CRM con Automatización de Marketing',
+            'suggestion': '🎯 Propuesta: Centralizar gestión de clientes con automatización de campañas, aumento del 40% en conversión de leads y reportes en tiempo real.',
+            'action': 'Implementar CRM Personalizado',
+            'priority': 'high'
+        })
+    
+    if any(word in content for word in ['empleados', 'nómina', 'recursos humanos', 'personal', 'asistencia']):
+        proposals.append({
+            'type': 'hr',
+            'icon': 'fa-user-friends',
+            'title': 'Sistema Integral de Recursos Humanos',
+            'suggestion': '🎯 Propuesta: Digitalizar RR.HH. con control de asistencia biométrico, nóminas automatizadas y evaluaciones de desempeño. Ahorro de 15 horas semanales.',
+            'action': 'Desarrollar Módulo de RR.HH.',
+            'priority': 'medium'
+        })
+    
+    if any(word in content for word in ['finanzas', 'contabilidad', 'facturación', 'impuestos', 'fiscal']):
+        proposals.append({
+            'type': 'finance',
+            'icon': 'fa-calculator',
+            'title': 'Módulo Financiero con Facturación Electrónica',
+            'suggestion': '🎯 Propuesta: Automatizar gestión financiera con facturación electrónica, control de flujo de caja y reportes fiscales automáticos para cumplimiento normativo.',
+            'action': 'Implementar Sistema Financiero',
+            'priority': 'high'
+        })
+    
+    if any(word in content for word in ['sitio web', 'online', 'internet', 'digital', 'e-commerce', 'página']):
+        proposals.append({
+            'type': 'web',
+            'icon': 'fa-globe',
+            'title': 'Presencia Digital Completa con E-commerce',
+            'suggestion': '🎯 Propuesta: Desarrollar plataforma web con tienda online 24/7, múltiples métodos de pago, integración con redes sociales y marketing digital automático.',
+            'action': 'Crear Plataforma Digital',
+            'priority': 'medium'
+        })
+    
+    if any(word in content for word in ['automatización', 'procesos', 'eficiencia', 'optimización', 'workflow']):
+        proposals.append({
+            'type': 'automation',
+            'icon': 'fa-cogs',
+            'title': 'Suite de Automatización de Procesos',
+            'suggestion': '🎯 Propuesta: Automatizar procesos repetitivos con workflows inteligentes, reducir 60% tareas manuales y eliminar errores humanos.',
+            'action': 'Desarrollar Automatización',
+            'priority': 'medium'
+        })
+    
+    if any(word in content for word in ['móvil', 'app', 'aplicación', 'smartphone', 'celular']):
+        proposals.append({
+            'type': 'mobile',
+            'icon': 'fa-mobile-alt',
+            'title': 'Aplicación Móvil Nativa para Clientes',
+            'suggestion': '🎯 Propuesta: Desarrollar app móvil para iOS/Android con autoservicio, notificaciones push personalizadas y mayor engagement 24/7 con clientes.',
+            'action': 'Desarrollar App Móvil',
+            'priority': 'medium'
+        })
+    
+    if any(word in content for word in ['seguridad', 'backup', 'protección', 'datos', 'ciberseguridad']):
+        proposals.append({
+            'type': 'security',
+            'icon': 'fa-shield-alt',
+            'title': 'Solución Integral de Seguridad y Backup',
+            'suggestion': '🎯 Propuesta: Implementar seguridad multicapa con protección 99.9% contra amenazas, backups automáticos diarios y cumplimiento normativo.',
+            'action': 'Implementar Seguridad Avanzada',
+            'priority': 'high'
+        })
+    
+    if any(word in content for word in ['reportes', 'análisis', 'datos', 'métricas', 'dashboard', 'kpi']):
+        proposals.append({
+            'type': 'analytics',
+            'icon': 'fa-chart-line',
+            'title': 'Plataforma de Business Intelligence',
+            'suggestion': '🎯 Propuesta: Implementar dashboards ejecutivos con KPIs en tiempo real, alertas automáticas y análisis predictivo para decisiones basadas en datos.',
+            'action': 'Desarrollar BI Dashboard',
+            'priority': 'medium'
+        })
+    
+    if any(word in content for word in ['capacitación', 'entrenamiento', 'formación', 'aprendizaje', 'educación']):
+        proposals.append({
+            'type': 'training',
+            'icon': 'fa-graduation-cap',
+            'title': 'Plataforma de Capacitación Digital',
+            'suggestion': '🎯 Propuesta: Crear LMS personalizado con cursos interactivos, certificaciones automáticas y seguimiento de progreso para maximizar adopción tecnológica.',
+            'action': 'Diseñar Plataforma Educativa',
+            'priority': 'medium'
+        })
+    
+    # Si no se detecta contenido específico, generar propuestas generales inteligentes
+    if not proposals:
+        proposals = [
+            {
+                'type': 'consultation',
+                'icon': 'fa-lightbulb',
+                'title': 'Consultoría de Transformación Digital Gratuita',
+                'suggestion': '🎯 Propuesta: Análisis completo de procesos actuales con roadmap personalizado de digitalización, diagnóstico gratuito y ROI proyectado.',
+                'action': 'Realizar Consultoría Estratégica',
+                'priority': 'high'
+            },
+            {
+                'type': 'pilot',
+                'icon': 'fa-flask',
+                'title': 'Proyecto Piloto de Automatización',
+                'suggestion': '🎯 Propuesta: Implementar solución piloto en área específica para demostrar valor tangible antes de expansión, con inversión inicial mínima.',
+                'action': 'Iniciar Proyecto Piloto',
+                'priority': 'medium'
+            },
+            {
+                'type': 'integration',
+                'icon': 'fa-link',
+                'title': 'Integración de Sistemas Existentes',
+                'suggestion': '🎯 Propuesta: Conectar sistemas actuales mediante APIs robustas para eliminar silos de información y crear flujo de datos unificado.',
+                'action': 'Integrar Sistemas Actuales',
+                'priority': 'high'
+            },
+            {
+                'type': 'support',
+                'icon': 'fa-headset',
+                'title': 'Mesa de Ayuda Especializada',
+                'suggestion': '🎯 Propuesta: Implementar sistema de tickets con IA para soporte técnico 24/7, categorización automática y resolución proactiva.',
+                'action': 'Crear Mesa de Ayuda',
+                'priority': 'medium'
+            },
+            {
+                'type': 'maintenance',
+                'icon': 'fa-tools',
+                'title': 'Plan de Mantenimiento Preventivo',
+                'suggestion': '🎯 Propuesta: Establecer mantenimiento predictivo con monitoreo continuo, actualizaciones automáticas y garantía de uptime 99.9%.',
+                'action': 'Estructurar Plan de Mantenimiento',
+                'priority': 'medium'
+            }
+        ]
+    
+    return proposals
+
+
+@require_http_methods(["POST"])
+@login_required
+def generate_spin_methodology_view(request):
+    """
+    Genera preguntas usando la metodología SPIN de ventas basándose en el contexto con IA
+    """
+    try:
+        data = json.loads(request.body)
+        description = data.get('description', '').strip()
+        company_id = data.get('company_id', '')
+        product_id = data.get('product_id', '')
+        
+        if not description:
+            return JsonResponse({
+                'success': False,
+                'message': 'Se requiere una descripción para generar la metodología SPIN'
+            })
+        
+        # Obtener información de la empresa si está disponible
+        company_info = ""
+        if company_id:
+            try:
+                from .models import Company
+                company = Company.objects.get(id=company_id)
+                company_info = f"""
+INFORMACIÓN DE LA EMPRESA:
+- Nombre: {company.name}
+- Sector: {getattr(company, 'industry', 'No especificado')}
+- Descripción: {getattr(company, 'description', 'No disponible')}
+- Tamaño: {getattr(company, 'size', 'No especificado')}
+"""
+            except:
+                company_info = ""
+        
+        # Obtener información del producto si está disponible
+        product_info = ""
+        if product_id:
+            try:
+                from .models import Product
+                product = Product.objects.get(id=product_id, is_active=True)
+                product_info = f"""
+PRODUCTO A DISCUTIR:
+- Nombre: {product.name}
+- Precio: {product.get_formatted_price()}
+- Descripción: {product.description}
+"""
+            except:
+                product_info = ""
+        
+        # Generar preguntas SPIN usando IA configurada
+        spin_questions = generate_spin_questions_with_ai(description, company_info, product_info)
+        
+        if spin_questions is None:
+            return JsonResponse({
+                'success': False,
+                'message': 'Error: La IA no está configurada o no está disponible'
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'spin_questions': spin_questions,
+            'message': 'Metodología SPIN generada exitosamente con IA'
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({
+            'success': False,
+            'message': 'Datos JSON inválidos'
+        }, status=400)
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'message': f'Error generando metodología SPIN: {str(e)}'
+        }, status=500)
+
+
+def generate_spin_questions_with_ai(description, company_info="", product_info=""):
+    """
+    Genera preguntas SPIN personalizadas usando la IA configurada
+    """
+    from .models import SystemConfiguration
+    
+    config = SystemConfiguration.objects.first()
+    if not config or not config.ai_chat_enabled or not config.openai_api_key:
+        return None
+        
+    try:
+        import openai
+        client = openai.OpenAI(api_key=config.openai_api_key)
+        
+        prompt = f"""
+Eres un experto en metodología SPIN de ventas. Basándote en el contexto proporcionado, genera una guía completa de preguntas SPIN (Situation, Problem, Implication, Need-Payoff) personalizada y profesional.
+
+CONTEXTO DE LA REUNIÓN:
+{description}
+
+{company_info}
+
+{product_info}
+
+INSTRUCCIONES:
+- Analiza el contexto, la información de la empresa y los productos mencionados
+- Genera 4-6 preguntas específicas para cada categoría SPIN
+- Las preguntas deben ser relevantes al contexto específico mencionado
+- Si hay productos específicos, incluye preguntas relacionadas con sus características, precio y beneficios
+- Incluye una estrategia de implementación
+- Formato profesional con emojis y estructura clara
+- Adapta las preguntas al sector y situación específica
+
+ESTRUCTURA REQUERIDA:
+🎯 METODOLOGÍA SPIN - PREGUNTAS ESTRATÉGICAS
+
+📊 S - PREGUNTAS DE SITUACIÓN (Understanding Current State)
+[4-6 preguntas específicas al contexto y productos]
+
+⚠️ P - PREGUNTAS DE PROBLEMA (Identifying Pain Points)  
+[4-6 preguntas que identifiquen dolor específico relacionado con la situación y productos]
+
+🔥 I - PREGUNTAS DE IMPLICACIÓN (Consequences & Impact)
+[4-6 preguntas sobre consecuencias de no actuar, considerando los productos ofrecidos]
+
+✅ N - PREGUNTAS DE NECESIDAD-BENEFICIO (Value Proposition)
+[4-6 preguntas sobre valor y beneficios específicos de los productos]
+
+🎯 ESTRATEGIA RECOMENDADA:
+[Estrategia específica basada en el contexto y productos a discutir]
+
+📋 PRÓXIMOS PASOS:
+[Acciones concretas para esta situación]
+
+Haz que las preguntas sean profesionales, directas y adaptadas específicamente al contexto proporcionado.
+"""
+        
+        response = client.chat.completions.create(
+            model=config.openai_model or "gpt-4o",
+            messages=[
+                {"role": "system", "content": "Eres un experto consultor en ventas especializado en la metodología SPIN. Generas preguntas estratégicas personalizadas que ayudan a los vendedores a identificar necesidades reales del cliente y crear urgencia de compra."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=3000,
+            temperature=0.7
+        )
+        
+        return response.choices[0].message.content
+        
+    except Exception as e:
+        print(f"Error generando contenido SPIN con IA: {e}")
+        # Fallback a función original si la IA falla
+        return generate_spin_questions_fallback(description, company_info, product_info)
+
+
+@login_required
+@require_http_methods(["POST"])
+def improve_meeting_description_view(request):
+    """
+    Mejora la descripción de una reunión usando IA
+    """
+    try:
+        data = json.loads(request.body)
+        description = data.get('description', '').strip()
+        title = data.get('title', '').strip()
+        company_id = data.get('company_id', '')
+        product_id = data.get('product_id', '')
+        
+        if not description:
+            return JsonResponse({
+                'success': False,
+                'message': 'Se requiere una descripción para mejorar'
+            })
+        
+        # Obtener información de la empresa si está disponible
+        company_info = ""
+        if company_id:
+            try:
+                from .models import Company
+                company = Company.objects.get(id=company_id)
+                company_info = f"\nEmpresa: {company.name}"
+            except:
+                pass
+        
+        # Obtener información del producto si está disponible
+        product_info = ""
+        if product_id:
+            try:
+                from .models import Product
+                product = Product.objects.get(id=product_id, is_active=True)
+                product_info = f"\nProducto a discutir: {product.name} - {product.description}"
+            except:
+                pass
+        
+        # Mejorar descripción usando IA
+        improved_description = improve_description_with_ai(description, title, company_info, product_info)
+        
+        if improved_description is None:
+            return JsonResponse({
+                'success': False,
+                'message': 'Error: La IA no está configurada o no está disponible'
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'improved_description': improved_description,
+            'message': 'Descripción mejorada exitosamente con IA'
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({
+            'success': False,
+            'message': 'Datos JSON inválidos'
+        }, status=400)
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'message': f'Error mejorando descripción: {str(e)}'
+        }, status=500)
+
+
+def improve_description_with_ai(description, title="", company_info="", product_info=""):
+    """
+    Mejora la descripción de la reunión usando la IA configurada
+    """
+    from .models import SystemConfiguration
+    
+    config = SystemConfiguration.objects.first()
+    if not config or not config.ai_chat_enabled or not config.openai_api_key:
+        return None
+        
+    try:
+        import openai
+        client = openai.OpenAI(api_key=config.openai_api_key)
+        
+        prompt = f"""
+Eres un asistente experto en redacción profesional de reuniones de negocios. Tu tarea es mejorar y optimizar la descripción de una reunión, haciéndola más clara, profesional y efectiva.
+
+TÍTULO DE LA REUNIÓN:
+{title}
+
+DESCRIPCIÓN ACTUAL:
+{description}
+
+{company_info}
+{product_info}
+
+INSTRUCCIONES CRÍTICAS:
+- NO uses formato markdown, NO uses asteriscos dobles, NO uses negritas markdown
+- Mejora la redacción haciéndola más clara, profesional y estructurada
+- Mantén toda la información importante del texto original
+- Agrega estructura con secciones si la descripción es larga (Objetivo, Agenda, Temas a tratar, etc.)
+- Usa emojis profesionales para mejorar la legibilidad (📌 🎯 📋 ✅ 💡 etc.)
+- Si hay productos mencionados, resalta sus beneficios
+- Mantén un tono profesional pero cercano
+- Si falta contexto importante, sugiere incluirlo entre [corchetes]
+- No inventes información que no esté en el original
+- Máximo 500 palabras
+- IMPORTANTE: NO uses negritas (**texto**), NO uses cursivas (*texto*), solo texto plano con emojis
+
+FORMATO SUGERIDO (SIN NEGRITAS):
+🎯 Objetivo Principal:
+[Objetivo claro y conciso]
+
+📋 Agenda:
+• Punto 1
+• Punto 2
+• Punto 3
+
+💡 Temas a Discutir:
+[Listado de temas importantes]
+
+✅ Resultados Esperados:
+[Qué se espera lograr]
+
+Genera la descripción mejorada directamente, sin explicaciones adicionales, sin markdown.
+"""
+        
+        response = client.chat.completions.create(
+            model=config.openai_model or "gpt-4o",
+            messages=[
+                {"role": "system", "content": "Eres un experto en redacción profesional de reuniones de negocios. Tu objetivo es mejorar la claridad, estructura y profesionalismo de las descripciones, manteniendo toda la información relevante."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=2000,
+            temperature=0.7
+        )
+        
+        return response.choices[0].message.content
+        
+    except Exception as e:
+        print(f"Error mejorando descripción con IA: {e}")
+        return None
+
+
+def generate_spin_questions_fallback(description, company_info="", product_info=""):
+    """
+    Función de fallback que genera preguntas SPIN básicas si la IA no está disponible
+    """
+    # Análisis del contexto para generar preguntas específicas
+    context_lower = description.lower()
+    
+    # Detectar industria/sector del contexto
+    industry_keywords = {
+        'tecnología': ['software', 'sistema', 'tecnología', 'digital', 'app', 'web', 'automatización'],
+        'retail': ['tienda', 'venta', 'producto', 'inventario', 'retail', 'comercio'],
+        'servicios': ['servicio', 'consultoría', 'asesoría', 'capacitación', 'formación'],
+        'manufactura': ['producción', 'manufactura', 'fábrica', 'proceso', 'calidad'],
+        'salud': ['salud', 'médico', 'hospital', 'clínica', 'paciente'],
+        'educación': ['educación', 'escuela', 'universidad', 'estudiante', 'curso'],
+        'finanzas': ['banco', 'financiero', 'préstamo', 'inversión', 'contabilidad']
+    }
+    
+    detected_industry = 'general'
+    for industry, keywords in industry_keywords.items():
+        if any(keyword in context_lower for keyword in keywords):
+            detected_industry = industry
+            break
+    
+    # Detectar problemas/necesidades mencionadas
+    pain_points = []
+    if any(word in context_lower for word in ['problema', 'dificultad', 'reto', 'desafío']):
+        pain_points.append('problemas_operacionales')
+    if any(word in context_lower for word in ['costo', 'gasto', 'presupuesto', 'caro']):
+        pain_points.append('costos_elevados')
+    if any(word in context_lower for word in ['tiempo', 'lento', 'demora', 'eficiencia']):
+        pain_points.append('ineficiencia_tiempo')
+    if any(word in context_lower for word in ['competencia', 'mercado', 'ventaja']):
+        pain_points.append('presion_competitiva')
+    
+    # Generar preguntas SPIN
+    spin_content = f"""
+🎯 METODOLOGÍA SPIN - PREGUNTAS ESTRATÉGICAS (Fallback)
+
+{company_info}
+
+CONTEXTO ANALIZADO:
+{description}
+
+═══════════════════════════════════════════════════════════════
+
+📊 S - PREGUNTAS DE SITUACIÓN (Understanding Current State)
+════════════════════════════════════════════════════════════
+
+{generate_situation_questions(detected_industry, context_lower)}
+
+═══════════════════════════════════════════════════════════════
+
+⚠️ P - PREGUNTAS DE PROBLEMA (Identifying Pain Points)
+═══════════════════════════════════════════════════════════
+
+{generate_problem_questions(detected_industry, pain_points, context_lower)}
+
+═══════════════════════════════════════════════════════════════
+
+🔥 I - PREGUNTAS DE IMPLICACIÓN (Consequences & Impact)
+═══════════════════════════════════════════════════════════
+
+{generate_implication_questions(detected_industry, pain_points)}
+
+═══════════════════════════════════════════════════════════════
+
+✅ N - PREGUNTAS DE NECESIDAD-BENEFICIO (Value Proposition)
+═══════════════════════════════════════════════════════════
+
+{generate_need_payoff_questions(detected_industry, context_lower)}
+
+═══════════════════════════════════════════════════════════════
+
+🎯 ESTRATEGIA RECOMENDADA:
+• Comenzar con 2-3 preguntas de Situación para entender el contexto
+• Profundizar con Preguntas de Problema para identificar dolor
+• Amplificar el impacto con preguntas de Implicación
+• Cerrar con Necesidad-Beneficio para crear urgencia de solución
+
+📋 PRÓXIMOS PASOS:
+• Preparar casos de éxito específicos del sector
+• Documentar respuestas del cliente para propuesta personalizada
+• Definir cronograma de implementación basado en urgencia detectada
+
+⚠️ Nota: Generado con sistema de fallback. Configure la IA para preguntas más personalizadas.
+"""
+    
+    return spin_content
+
+
+def generate_situation_questions(industry, context):
+    """Genera preguntas de situación específicas por industria"""
+    
+    base_questions = [
+        "¿Cómo manejan actualmente este proceso en su organización?",
+        "¿Qué herramientas o sistemas utilizan para esto?",
+        "¿Quién es responsable de supervisar esta área?",
+        "¿Con qué frecuencia revisan o evalúan estos procesos?"
+    ]
+    
+    industry_specific = {
+        'tecnología': [
+            "¿Qué stack tecnológico utilizan actualmente?",
+            "¿Cómo gestionan el ciclo de desarrollo de software?",
+            "¿Qué nivel de automatización tienen implementado?",
+            "¿Cómo manejan la seguridad de datos y ciberseguridad?"
+        ],
+        'retail': [
+            "¿Cómo controlan el inventario actualmente?",
+            "¿Qué canales de venta utilizan?",
+            "¿Cómo analizan el comportamiento de compra de sus clientes?",
+            "¿Qué estrategias de marketing digital implementan?"
+        ],
+        'servicios': [
+            "¿Cómo gestionan la relación con sus clientes?",
+            "¿Qué procesos siguen para la entrega de servicios?",
+            "¿Cómo miden la satisfacción del cliente?",
+            "¿Qué herramientas usan para gestionar proyectos?"
+        ],
+        'finanzas': [
+            "¿Cómo gestionan los procesos contables actualmente?",
+            "¿Qué nivel de automatización tienen en facturación?",
+            "¿Cómo realizan el seguimiento de flujo de caja?",
+            "¿Qué reportes financieros generan regularmente?"
+        ]
+    }
+    
+    questions = base_questions + industry_specific.get(industry, [])
+    return '\n'.join([f"• {q}" for q in questions[:6]])
+
+
+def generate_problem_questions(industry, pain_points, context):
+    """Genera preguntas de problema basadas en pain points detectados"""
+    
+    base_questions = [
+        "¿Qué aspectos de este proceso les resultan más desafiantes?",
+        "¿Hay algo que les gustaría que funcionara de manera diferente?",
+        "¿Qué obstáculos enfrentan para lograr sus objetivos?"
+    ]
+    
+    pain_point_questions = {
+        'problemas_operacionales': [
+            "¿Con qué frecuencia experimentan interrupciones en este proceso?",
+            "¿Qué impacto tienen estos problemas en la productividad del equipo?",
+            "¿Cuánto tiempo dedican a resolver problemas operacionales?"
+        ],
+        'costos_elevados': [
+            "¿Sienten que están gastando más de lo necesario en esta área?",
+            "¿Han calculado el costo de oportunidad de mantener el status quo?",
+            "¿Qué porcentaje del presupuesto representa esta área actualmente?"
+        ],
+        'ineficiencia_tiempo': [
+            "¿Cuánto tiempo podrían ahorrar si este proceso fuera más eficiente?",
+            "¿Qué tareas repetitivas consumen más tiempo de su equipo?",
+            "¿Han considerado el costo de las horas perdidas en procesos manuales?"
+        ],
+        'presion_competitiva': [
+            "¿Cómo los afecta la presión competitiva en este aspecto?",
+            "¿Qué ventajas tienen sus competidores que ustedes no?",
+            "¿Qué riesgo ven de no evolucionar en esta área?"
+        ]
+    }
+    
+    questions = base_questions[:]
+    for pain_point in pain_points:
+        questions.extend(pain_point_questions.get(pain_point, []))
+    
+    return '\n'.join([f"• {q}" for q in questions[:6]])
+
+
+def generate_implication_questions(industry, pain_points):
+    """Genera preguntas de implicación para amplificar el dolor"""
+    
+    base_questions = [
+        "¿Qué sucede si estos problemas continúan sin resolverse?",
+        "¿Cómo afecta esto a la moral y productividad del equipo?",
+        "¿Qué impacto tiene en la experiencia de sus clientes?",
+        "¿Cómo podría esto afectar su crecimiento futuro?"
+    ]
+    
+    specific_implications = [
+        "¿Cuál es el costo real de no actuar ahora?",
+        "¿Qué oportunidades podrían estar perdiendo?",
+        "¿Cómo esto los posiciona frente a la competencia?",
+        "¿Qué riesgos ven en el mediano y largo plazo?",
+        "¿Cómo afecta esto la toma de decisiones estratégicas?",
+        "¿Qué impacto tiene en la escalabilidad del negocio?"
+    ]
+    
+    all_questions = base_questions + specific_implications
+    return '\n'.join([f"• {q}" for q in all_questions[:6]])
+
+
+def generate_need_payoff_questions(industry, context):
+    """Genera preguntas de necesidad-beneficio para crear valor"""
+    
+    base_questions = [
+        "¿Qué valor tendría para ustedes resolver este desafío?",
+        "¿Cómo mejoraría su operación si tuvieran una solución eficaz?",
+        "¿Qué beneficios esperarían ver en los primeros 90 días?",
+        "¿Cómo mediría el éxito de una implementación?"
+    ]
+    
+    value_questions = [
+        "¿Cuál sería el impacto en ROI si optimizaran este proceso?",
+        "¿Qué nuevas oportunidades se abrirían con una solución efectiva?",
+        "¿Cómo esto les ayudaría a diferenciarse de la competencia?",
+        "¿Qué valor agregado podrían ofrecer a sus clientes?",
+        "¿Cómo esto contribuiría a sus objetivos estratégicos?",
+        "¿Qué tranquilidad les daría tener esto resuelto?"
+    ]
+    
+    all_questions = base_questions + value_questions
+    return '\n'.join([f"• {q}" for q in all_questions[:6]])
+
+
+# =====================================================
+# VISTAS DE ENLACES DE PAGO PAYPAL
+# =====================================================
+
+@login_required
+def paypal_link_list(request):
+    """Lista de enlaces de pago de PayPal"""
+    from .models import PayPalPaymentLink
+    
+    links = PayPalPaymentLink.objects.filter(user=request.user).select_related('company')
+    
+    # Filtros
+    search = request.GET.get('search', '')
+    if search:
+        links = links.filter(
+            Q(product_name__icontains=search) |
+            Q(description__icontains=search)
+        )
+    
+    company_id = request.GET.get('company')
+    if company_id:
+        links = links.filter(company_id=company_id)
+    
+    status = request.GET.get('status')
+    if status:
+        links = links.filter(status=status)
+    
+    # Paginación
+    paginator = Paginator(links, 12)
+    page_number = request.GET.get('page')
+    links = paginator.get_page(page_number)
+    
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'links': links,
+        'companies': companies,
+        'page_title': 'Enlaces de Pago PayPal'
+    }
+    return render(request, 'tickets/paypal_link_list.html', context)
+
+
+@login_required
+def paypal_link_create(request):
+    """Crear nuevo enlace de pago"""
+    from .models import PayPalPaymentLink
+    
+    if request.method == 'POST':
+        try:
+            link = PayPalPaymentLink()
+            link.user = request.user
+            link.product_name = request.POST.get('product_name')
+            link.description = request.POST.get('description', '')
+            link.amount = request.POST.get('amount')
+            
+            company_id = request.POST.get('company')
+            if company_id:
+                link.company_id = company_id
+            
+            # Manejar archivo adjunto
+            if 'attachment' in request.FILES:
+                link.attachment = request.FILES['attachment']
+                link.attachment_name = request.POST.get('attachment_name', link.attachment.name)
+            
+            # Fecha de expiración (opcional)
+            expires_at = request.POST.get('expires_at')
+            if expires_at:
+                from datetime import datetime
+                link.expires_at = datetime.strptime(expires_at, '%Y-%m-%d')
+            
+            link.notes = request.POST.get('notes', '')
+            link.save()
+            
+            messages.success(request, f'Enlace de pago creado exitosamente. URL: {link.public_url}')
+            return redirect('paypal_link_detail', pk=link.pk)
+            
+        except Exception as e:
+            messages.error(request, f'Error al crear el enlace: {str(e)}')
+    
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'companies': companies,
+        'page_title': 'Nuevo Enlace de Pago'
+    }
+    return render(request, 'tickets/paypal_link_form.html', context)
+
+
+@login_required
+def paypal_link_detail(request, pk):
+    """Detalle del enlace de pago"""
+    from .models import PayPalPaymentLink
+    
+    link = get_object_or_404(PayPalPaymentLink, pk=pk, user=request.user)
+    
+    context = {
+        'link': link,
+        'page_title': link.product_name
+    }
+    return render(request, 'tickets/paypal_link_detail.html', context)
+
+
+@login_required
+def paypal_link_edit(request, pk):
+    """Editar producto de pago (plantilla reutilizable)"""
+    from .models import PayPalPaymentLink
+    
+    link = get_object_or_404(PayPalPaymentLink, pk=pk, user=request.user)
+    
+    # Los productos reutilizables siempre pueden editarse
+    # Los cambios NO afectan a las órdenes ya creadas
+    
+    if request.method == 'POST':
+        try:
+            link.product_name = request.POST.get('product_name')
+            link.description = request.POST.get('description', '')
+            link.amount = request.POST.get('amount')
+            
+            company_id = request.POST.get('company')
+            link.company_id = company_id if company_id else None
+            
+            # Manejar archivo adjunto
+            if 'attachment' in request.FILES:
+                link.attachment = request.FILES['attachment']
+                link.attachment_name = request.POST.get('attachment_name', link.attachment.name)
+            
+            # Fecha de expiración
+            expires_at = request.POST.get('expires_at')
+            if expires_at:
+                from datetime import datetime
+                link.expires_at = datetime.strptime(expires_at, '%Y-%m-%d')
+            else:
+                link.expires_at = None
+            
+            link.notes = request.POST.get('notes', '')
+            link.save()
+            
+            messages.success(request, 'Producto actualizado exitosamente. Los cambios solo afectarán a las nuevas compras.')
+            return redirect('paypal_link_detail', pk=link.pk)
+            
+        except Exception as e:
+            messages.error(request, f'Error al actualizar el enlace: {str(e)}')
+    
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'link': link,
+        'companies': companies,
+        'page_title': f'Editar - {link.product_name}'
+    }
+    return render(request, 'tickets/paypal_link_form.html', context)
+
+
+@login_required
+def paypal_link_delete(request, pk):
+    """Eliminar enlace de pago"""
+    from .models import PayPalPaymentLink
+    
+    link = get_object_or_404(PayPalPaymentLink, pk=pk, user=request.user)
+    
+    # No permitir eliminación si ya está pagado
+    if link.status == 'paid':
+        messages.warning(request, 'No se puede eliminar un enlace que ya ha sido pagado')
+        return redirect('paypal_link_detail', pk=link.pk)
+    
+    if request.method == 'POST':
+        product_name = link.product_name
+        link.delete()
+        messages.success(request, f'Enlace "{product_name}" eliminado exitosamente')
+        return redirect('paypal_link_list')
+    
+    context = {
+        'link': link,
+        'page_title': f'Eliminar - {link.product_name}'
+    }
+    return render(request, 'tickets/paypal_link_delete.html', context)
+
+
+@login_required
+def paypal_link_cancel(request, pk):
+    """Cancelar enlace de pago"""
+    from .models import PayPalPaymentLink
+    
+    link = get_object_or_404(PayPalPaymentLink, pk=pk, user=request.user)
+    
+    if link.status in ['active']:
+        link.status = 'cancelled'
+        link.save()
+        messages.success(request, 'Enlace cancelado exitosamente')
+    else:
+        messages.warning(request, f'No se puede cancelar un enlace con estado {link.get_status_display()}')
+    
+    return redirect('paypal_link_detail', pk=link.pk)
+
+
+@login_required
+def paypal_generate_public_catalog_token(request):
+    """Generar o regenerar token público para catálogo de productos"""
+    import uuid
+    from .models import SystemConfiguration
+    
+    if request.method == 'POST':
+        config = SystemConfiguration.get_config()
+        
+        # Generar nuevo token
+        new_token = uuid.uuid4()
+        config.products_catalog_token = new_token
+        config.save()
+        
+        # Construir URL pública
+        public_url = request.build_absolute_uri(
+            f'/public/products/{new_token}/'
+        )
+        
+        messages.success(request, f'Token público generado exitosamente. URL: {public_url}')
+        return JsonResponse({
+            'success': True,
+            'token': str(new_token),
+            'url': public_url
+        })
+    
+    return JsonResponse({'success': False, 'error': 'Método no permitido'}, status=405)
+
+
+def public_products_catalog(request, token):
+    """Vista pública para mostrar catálogo de productos"""
+    from .models import Product, SystemConfiguration
+    
+    # Verificar token
+    config = SystemConfiguration.get_config()
+    
+    if not config.products_catalog_token or str(config.products_catalog_token) != str(token):
+        messages.error(request, 'Token inválido o catálogo no disponible')
+        return render(request, 'tickets/public_products_error.html', status=404)
+    
+    # Obtener productos activos
+    products = Product.objects.filter(is_active=True).order_by('name')
+    
+    # Información de configuración para el catálogo
+    catalog_info = {
+        'company_name': config.company_name if hasattr(config, 'company_name') else 'Nuestra Empresa',
+        'currency_symbol': '€',  # Puedes obtenerlo de config
+    }
+    
+    context = {
+        'products': products,
+        'catalog_info': catalog_info,
+        'token': token,
+    }
+    return render(request, 'tickets/public_products_catalog.html', context)
+
+
+def create_payment_from_product(request, token, product_id):
+    """Crear enlace de pago desde producto del catálogo público"""
+    from .models import Product, SystemConfiguration, PayPalPaymentLink
+    
+    # Verificar token
+    config = SystemConfiguration.get_config()
+    
+    if not config.products_catalog_token or str(config.products_catalog_token) != str(token):
+        messages.error(request, 'Token inválido')
+        return redirect('home')
+    
+    # Obtener producto
+    product = get_object_or_404(Product, id=product_id, is_active=True)
+    
+    # Crear enlace de pago automáticamente
+    payment_link = PayPalPaymentLink.objects.create(
+        product_name=product.name,
+        description=product.description,
+        amount=product.price,
+        status='active',
+        user=product.created_by,  # Usar el creador del producto
+        company=None  # O puedes asociarlo a una empresa si el producto tiene
+    )
+    
+    # Construir URL pública del enlace de pago
+    payment_link.public_url = request.build_absolute_uri(
+        f'/paypal-payment/{payment_link.public_token}/'
+    )
+    payment_link.save()
+    
+    # Redirigir a la página de pago
+    return redirect('paypal_payment_page', token=payment_link.public_token)
+
+
+# Vista de debug para PayPal (solo para admins)
+@login_required
+def paypal_debug_config(request):
+    """Vista para verificar configuración de PayPal"""
+    from .models import SystemConfiguration
+    
+    config = SystemConfiguration.objects.first()
+    
+    debug_info = {
+        'config_exists': config is not None,
+        'paypal_enabled': config.paypal_enabled if config else False,
+        'paypal_mode': config.paypal_mode if config else 'No configurado',
+        'client_id_configured': bool(config.paypal_client_id) if config else False,
+        'client_id_length': len(config.paypal_client_id) if config and config.paypal_client_id else 0,
+        'client_secret_configured': bool(config.paypal_client_secret) if config else False,
+    }
+    
+    context = {
+        'debug_info': debug_info,
+        'config': config,
+        'page_title': 'Debug PayPal'
+    }
+    
+    return render(request, 'tickets/paypal_debug.html', context)
+
+
+# Vista pública - sin login requerido
+def paypal_payment_page(request, token):
+    """Página pública de pago (reutilizable - cada compra crea una orden individual)"""
+    from .models import PayPalPaymentLink, SystemConfiguration
+    
+    link = get_object_or_404(PayPalPaymentLink, public_token=token)
+    
+    # Verificar si está activo (expiración)
+    if not link.is_active():
+        context = {
+            'error': 'Este enlace de pago ya no está disponible',
+            'link': link,
+            'page_title': 'Enlace No Disponible'
+        }
+        return render(request, 'tickets/paypal_payment_page.html', context)
+    
+    # Ya NO verificamos si está pagado - los enlaces son reutilizables
+    # Cada compra crea una orden individual (PayPalOrder)
+    
+    # Obtener configuración de PayPal
+    try:
+        config = SystemConfiguration.objects.first()
+        if not config or not config.paypal_enabled:
+            context = {
+                'error': 'El sistema de pagos no está disponible en este momento',
+                'page_title': 'Sistema No Disponible'
+            }
+            return render(request, 'tickets/paypal_payment_page.html', context)
+        
+        paypal_client_id = config.paypal_client_id
+        paypal_mode = config.paypal_mode  # 'sandbox' o 'live'
+        
+    except Exception as e:
+        context = {
+            'error': 'Error al cargar la configuración de pago',
+            'page_title': 'Error'
+        }
+        return render(request, 'tickets/paypal_payment_page.html', context)
+    
+    context = {
+        'link': link,
+        'paypal_client_id': paypal_client_id,
+        'paypal_mode': paypal_mode,
+        'page_title': link.product_name
+    }
+    return render(request, 'tickets/paypal_payment_page.html', context)
+
+
+@csrf_exempt  # PayPal webhook
+def paypal_webhook(request):
+    """Webhook para recibir notificaciones de PayPal"""
+    import json
+    from .models import PayPalPaymentLink, SystemConfiguration
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        payload = json.loads(request.body)
+        event_type = payload.get('event_type')
+        
+        # Manejar evento de pago completado
+        if event_type == 'CHECKOUT.ORDER.APPROVED' or event_type == 'PAYMENT.CAPTURE.COMPLETED':
+            resource = payload.get('resource', {})
+            order_id = resource.get('id')
+            
+            # Buscar el enlace por order_id
+            link = PayPalPaymentLink.objects.filter(paypal_order_id=order_id).first()
+            if link:
+                # Obtener información del pagador
+                payer_info = resource.get('payer', {})
+                link.mark_as_paid(order_id, payer_info)
+                
+                return JsonResponse({'status': 'success', 'message': 'Payment processed'})
+        
+        return JsonResponse({'status': 'ignored', 'message': 'Event not processed'})
+        
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+
+@csrf_exempt  # API endpoint para crear orden
+def paypal_create_order(request):
+    """API para crear orden de PayPal usando el SDK"""
+    import json
+    import logging
+    from .models import PayPalPaymentLink, PayPalOrder, SystemConfiguration
+    
+    logger = logging.getLogger(__name__)
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+        link_id = data.get('link_id')
+        
+        logger.info(f"Creating PayPal order for link_id: {link_id}")
+        
+        link = get_object_or_404(PayPalPaymentLink, pk=link_id)
+        
+        # Verificar que está activo (el enlace puede ser reutilizado)
+        if not link.is_active():
+            logger.warning(f"Link {link_id} is not active")
+            return JsonResponse({'error': 'Link not active'}, status=400)
+        
+        # Crear una nueva orden para esta compra
+        new_order = PayPalOrder.objects.create(
+            payment_link=link,
+            product_name=link.product_name,
+            description=link.description,
+            amount=link.amount,
+            paypal_order_id='',  # Se actualizará después
+            status='pending'
+        )
+        
+        logger.info(f"Created new PayPalOrder: {new_order.id}")
+        
+        # Obtener configuración
+        config = SystemConfiguration.objects.first()
+        if not config or not config.paypal_enabled:
+            logger.error("PayPal not enabled in configuration")
+            return JsonResponse({'error': 'PayPal not enabled'}, status=400)
+        
+        # Verificar credenciales
+        if not config.paypal_client_id or not config.paypal_client_secret:
+            logger.error("PayPal credentials not configured")
+            return JsonResponse({'error': 'PayPal credentials not configured'}, status=400)
+        
+        # Usar PayPal SDK para crear orden
+        import requests
+        import base64
+        
+        # Obtener token de acceso
+        auth_string = f"{config.paypal_client_id}:{config.paypal_client_secret}"
+        auth_bytes = auth_string.encode('utf-8')
+        auth_base64 = base64.b64encode(auth_bytes).decode('utf-8')
+        
+        # Determinar URL según el modo
+        if config.paypal_mode == 'sandbox':
+            base_url = 'https://api-m.sandbox.paypal.com'
+        else:
+            base_url = 'https://api-m.paypal.com'
+        
+        # Obtener access token
+        token_response = requests.post(
+            f'{base_url}/v1/oauth2/token',
+            headers={
+                'Authorization': f'Basic {auth_base64}',
+                'Content-Type': 'application/x-www-form-urlencoded'
+            },
+            data={'grant_type': 'client_credentials'}
+        )
+        
+        if token_response.status_code != 200:
+            logger.error(f"Failed to get PayPal access token: {token_response.text}")
+            return JsonResponse({'error': 'Failed to authenticate with PayPal'}, status=500)
+        
+        access_token = token_response.json()['access_token']
+        
+        # Crear orden en PayPal
+        order_payload = {
+            'intent': 'CAPTURE',
+            'purchase_units': [{
+                'description': link.product_name,
+                'amount': {
+                    'currency_code': 'EUR',
+                    'value': str(link.amount)
+                },
+                'reference_id': str(new_order.id),  # Usar ID de la orden nueva
+                'custom_id': str(new_order.order_token)  # Token de la orden para identificación
+            }],
+            'application_context': {
+                'brand_name': config.site_name,
+                'landing_page': 'BILLING',
+                'user_action': 'PAY_NOW',
+                'return_url': request.build_absolute_uri(f'/paypal-payment/{link.public_token}/'),
+                'cancel_url': request.build_absolute_uri(f'/paypal-payment/{link.public_token}/')
+            }
+        }
+        
+        order_response = requests.post(
+            f'{base_url}/v2/checkout/orders',
+            headers={
+                'Authorization': f'Bearer {access_token}',
+                'Content-Type': 'application/json'
+            },
+            json=order_payload
+        )
+        
+        if order_response.status_code not in [200, 201]:
+            logger.error(f"Failed to create PayPal order: {order_response.text}")
+            # Marcar orden como fallida
+            new_order.status = 'failed'
+            new_order.save()
+            return JsonResponse({'error': 'Failed to create PayPal order'}, status=500)
+        
+        order_data = order_response.json()
+        paypal_order_id = order_data.get('id')
+        logger.info(f"PayPal order created successfully: {paypal_order_id}")
+        
+        # Actualizar la orden con el ID de PayPal
+        new_order.paypal_order_id = paypal_order_id
+        new_order.save()
+        
+        # Agregar el order_token a la respuesta para usarlo en el capture
+        order_data['internal_order_token'] = str(new_order.order_token)
+        order_data['internal_order_id'] = new_order.id
+        
+        return JsonResponse(order_data)
+        
+    except Exception as e:
+        logger.exception(f"Exception creating PayPal order: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=400)
+
+
+@csrf_exempt  # API endpoint para capturar pago
+def paypal_capture_order(request):
+    """API para capturar orden de PayPal usando el SDK"""
+    import json
+    import logging
+    from .models import PayPalOrder, SystemConfiguration
+    
+    logger = logging.getLogger(__name__)
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+        order_id = data.get('order_id')  # PayPal Order ID
+        internal_order_id = data.get('internal_order_id')  # Nuestro ID interno
+        
+        logger.info(f"Capturing PayPal order {order_id}, internal order: {internal_order_id}")
+        
+        # Buscar la orden por nuestro ID interno
+        order = get_object_or_404(PayPalOrder, pk=internal_order_id)
+        
+        # Obtener configuración
+        config = SystemConfiguration.objects.first()
+        if not config or not config.paypal_enabled:
+            logger.error("PayPal not enabled in configuration")
+            return JsonResponse({'error': 'PayPal not enabled'}, status=400)
+        
+        # Verificar credenciales
+        if not config.paypal_client_id or not config.paypal_client_secret:
+            logger.error("PayPal credentials not configured")
+            return JsonResponse({'error': 'PayPal credentials not configured'}, status=400)
+        
+        # Usar PayPal SDK para capturar orden
+        import requests
+        import base64
+        
+        # Obtener token de acceso
+        auth_string = f"{config.paypal_client_id}:{config.paypal_client_secret}"
+        auth_bytes = auth_string.encode('utf-8')
+        auth_base64 = base64.b64encode(auth_bytes).decode('utf-8')
+        
+        # Determinar URL según el modo
+        if config.paypal_mode == 'sandbox':
+            base_url = 'https://api-m.sandbox.paypal.com'
+        else:
+            base_url = 'https://api-m.paypal.com'
+        
+        # Obtener access token
+        token_response = requests.post(
+            f'{base_url}/v1/oauth2/token',
+            headers={
+                'Authorization': f'Basic {auth_base64}',
+                'Content-Type': 'application/x-www-form-urlencoded'
+            },
+            data={'grant_type': 'client_credentials'}
+        )
+        
+        if token_response.status_code != 200:
+            logger.error(f"Failed to get PayPal access token: {token_response.text}")
+            return JsonResponse({'error': 'Failed to authenticate with PayPal'}, status=500)
+        
+        access_token = token_response.json()['access_token']
+        
+        # Capturar orden
+        capture_response = requests.post(
+            f'{base_url}/v2/checkout/orders/{order_id}/capture',
+            headers={
+                'Authorization': f'Bearer {access_token}',
+                'Content-Type': 'application/json'
+            }
+        )
+        
+        if capture_response.status_code not in [200, 201]:
+            logger.error(f"Failed to capture PayPal order: {capture_response.text}")
+            return JsonResponse({'error': 'Failed to capture payment'}, status=500)
+        
+        capture_data = capture_response.json()
+        logger.info(f"PayPal order captured successfully: {order_id}")
+        
+        # Extraer información del pagador
+        payer_info = capture_data.get('payer', {})
+        
+        # Marcar la orden como pagada
+        order.mark_as_paid(payer_info)
+        
+        # Generar URL del resumen de orden (usar el token de la orden específica)
+        from django.urls import reverse
+        order_summary_url = request.build_absolute_uri(
+            reverse('paypal_order_detail', kwargs={'token': order.order_token})
+        )
+        
+        return JsonResponse({
+            'status': 'success',
+            'message': 'Payment captured successfully',
+            'order_summary_url': order_summary_url,
+            'capture_id': capture_data.get('id'),
+            'payer_email': payer_info.get('email_address', ''),
+            'order_token': str(order.order_token)
+        })
+        
+    except Exception as e:
+        logger.exception(f"Exception capturing PayPal order: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=400)
+
+
+# Vista pública - detalle de orden individual
+def paypal_order_detail(request, token):
+    """Página de detalle de una orden específica"""
+    from .models import PayPalOrder, SystemConfiguration
+    
+    order = get_object_or_404(PayPalOrder, order_token=token)
+    
+    # Obtener configuración para mostrar nombre del sitio
+    config = SystemConfiguration.objects.first()
+    
+    context = {
+        'order': order,
+        'link': order.payment_link,  # Para compatibilidad con el template
+        'config': config,
+        'page_title': f'Orden #{order.id:05d} - {order.product_name}',
+        'hours_remaining': order.get_hours_until_download_expires(),
+        'download_url_valid': order.is_download_token_valid(),
+    }
+    
+    return render(request, 'tickets/paypal_order_detail.html', context)
+
+
+# Vista legacy - resumen de orden (mantener compatibilidad)
+def paypal_link_orders(request, token):
+    """Mostrar todas las órdenes de un payment link (solo para el dueño)"""
+    from .models import PayPalPaymentLink, PayPalOrder
+    from django.contrib.auth.decorators import login_required
+    
+    link = get_object_or_404(PayPalPaymentLink, public_token=token)
+    
+    # Solo el dueño puede ver las órdenes
+    if request.user != link.user:
+        messages.error(request, 'No tienes permiso para ver estas órdenes')
+        return redirect('dashboard')
+    
+    # Obtener todas las órdenes
+    orders = PayPalOrder.objects.filter(payment_link=link).order_by('-created_at')
+    
+    # Calcular estadísticas
+    total_orders = orders.count()
+    paid_orders = orders.filter(status='completed').count()
+    total_revenue = sum(order.amount for order in orders.filter(status='completed'))
+    
+    context = {
+        'link': link,
+        'orders': orders,
+        'total_orders': total_orders,
+        'paid_orders': paid_orders,
+        'total_revenue': total_revenue,
+    }
+    
+    return render(request, 'tickets/paypal_link_orders.html', context)
+
+
+def paypal_order_summary(request, token):
+    """Legacy - Redirige a la lista de órdenes del enlace"""
+    return redirect('paypal_link_orders', token=token)
+
+
+# Vista pública - descargar archivo con token de orden
+def paypal_order_download(request, token):
+    """Descargar archivo usando token de orden (válido 72 horas)"""
+    from .models import PayPalOrder
+    from .media_delivery import counts_as_download, serve_file
+    import os
+    
+    order = get_object_or_404(PayPalOrder, download_token=token)
+    
+    # Verificar que está pagado
+    if not order.is_paid():
+        messages.error(request, 'Esta orden no ha sido completada')
+        return redirect('paypal_order_detail', token=order.order_token)
+    
+    # Verificar que el token no ha expirado (72 horas)
+    if not order.is_download_token_valid():
+        context = {
+            'order': order,
+            'link': order.payment_link,
+            'error': 'El enlace de descarga ha expirado',
+            'error_detail': 'Los enlaces de descarga son válidos por 72 horas después del pago. Por favor, contacta con el vendedor para obtener un nuevo enlace.',
+            'page_title': 'Enlace Expirado'
+        }
+        return render(request, 'tickets/paypal_download_expired.html', context)
+    
+    # Verificar que tiene archivo
+    if not order.payment_link.attachment:
+        messages.error(request, 'Este producto no tiene archivo adjunto')
+        return redirect('paypal_order_detail', token=order.order_token)
+    
+    # Preparar descarga
+    attachment = order.payment_link.attachment
+    if attachment.storage.exists(attachment.name):
+        # Incrementar contador de descargas (no en las descargas reanudadas)
+        if counts_as_download(request):
+            order.increment_download()
+        return serve_file(
+            request,
+            attachment,
+            filename=order.payment_link.attachment_name or os.path.basename(attachment.name),
+            content_type='application/octet-stream',
+        )
+    
+    messages.error(request, 'Archivo no encontrado en el servidor')
+    return redirect('paypal_order_detail', token=order.order_token)
+
+
+# Vista legacy - mantener compatibilidad (redirige al resumen de orden)
+def paypal_file_download(request, token):
+    """Redirige a la página de resumen de orden (compatibilidad)"""
+    from .models import PayPalPaymentLink
+    
+    link = get_object_or_404(PayPalPaymentLink, public_token=token)
+    
+    # Si está pagado, redirigir al resumen
+    if link.is_paid():
+        return redirect('paypal_order_summary', token=token)
+    
+    # Si no está pagado, redirigir a la página de pago
+    messages.warning(request, 'Debes completar el pago antes de acceder a tu orden')
+    return redirect('paypal_payment_page', token=token)
+
+
+# ==========================================
+# PRESUPUESTO PERSONAL
+# ==========================================
+
+@login_required
+def budget_list(request):
+    """Lista todos los presupuestos del usuario y los públicos"""
+    from django.db.models import Q
+    
+    # Mostrar: presupuestos propios (privados o públicos) + presupuestos públicos de otros
+    budgets = PersonalBudget.objects.filter(
+        Q(user=request.user) | Q(is_private=False)
+    ).order_by('-year', 'name')
+    
+    context = {
+        'budgets': budgets,
+        'page_title': 'Presupuestos Personales',
+    }
+    return render(request, 'tickets/budget_list.html', context)
+
+
+@login_required
+def budget_create(request):
+    """Crea un nuevo presupuesto"""
+    if request.method == 'POST':
+        form = PersonalBudgetForm(request.POST)
+        if form.is_valid():
+            budget = form.save(commit=False)
+            budget.user = request.user
+            budget.save()
+            messages.success(request, f'Presupuesto "{budget.name}" creado exitosamente.')
+            return redirect('budget_detail', pk=budget.pk)
+    else:
+        form = PersonalBudgetForm()
+    
+    context = {
+        'form': form,
+        'page_title': 'Crear Presupuesto',
+    }
+    return render(request, 'tickets/budget_form.html', context)
+
+
+@login_required
+def budget_detail(request, pk):
+    """Muestra el detalle de un presupuesto anual con análisis mensual"""
+    budget = get_object_or_404(PersonalBudget, pk=pk)
+    
+    # Verificar permisos: si es privado, solo el creador puede verlo
+    if budget.is_private and budget.user != request.user:
+        from django.contrib import messages
+        messages.error(request, 'No tienes permisos para ver este presupuesto.')
+        return redirect('budget_list')
+    
+    # Obtener mes seleccionado (por defecto el mes actual)
+    from datetime import datetime
+    selected_month = int(request.GET.get('month', datetime.now().month))
+    view_type = request.GET.get('view', 'monthly')  # 'monthly' o 'annual'
+    
+    # Obtener items ordenados con sus montos actuales
+    income_items = budget.income_items.all().order_by('order', 'name')
+    expense_items = budget.expense_items.all().order_by('order', 'name')
+    
+    # Preparar datos de items con cálculos mensuales/anuales
+    from decimal import Decimal
+    income_items_data = []
+    for item in income_items:
+        # El monto presupuestado ya es mensual
+        monthly_budget = item.budgeted_amount
+        if view_type == 'monthly':
+            actual = item.get_actual_amount(month=selected_month, year=budget.year)
+            budget_amount = monthly_budget
+        else:
+            # Para vista anual, multiplicar el presupuesto mensual por 12
+            actual = item.get_actual_amount()
+            budget_amount = item.budgeted_amount * Decimal('12')
+        
+        variance = actual - budget_amount
+        percentage = float((actual / budget_amount * Decimal('100'))) if budget_amount > 0 else 0
+        
+        income_items_data.append({
+            'item': item,
+            'budget': budget_amount,
+            'actual': actual,
+            'variance': variance,
+            'percentage': percentage,
+        })
+    
+    expense_items_data = []
+    for item in expense_items:
+        # El monto presupuestado ya es mensual
+        monthly_budget = item.budgeted_amount
+        if view_type == 'monthly':
+            actual = item.get_actual_amount(month=selected_month, year=budget.year)
+            budget_amount = monthly_budget
+        else:
+            # Para vista anual, multiplicar el presupuesto mensual por 12
+            actual = item.get_actual_amount()
+            budget_amount = item.budgeted_amount * Decimal('12')
+        
+        variance = actual - budget_amount
+        percentage = float((actual / budget_amount * Decimal('100'))) if budget_amount > 0 else 0
+        
+        expense_items_data.append({
+            'item': item,
+            'budget': budget_amount,
+            'actual': actual,
+            'variance': variance,
+            'percentage': percentage,
+        })
+    
+    # Obtener transacciones según la vista
+    if view_type == 'monthly':
+        transactions = budget.transactions.filter(
+            month=selected_month, 
+            year=budget.year
+        ).order_by('-transaction_date', '-created_at')
+        total_income_budget = budget.get_total_income_budget(month=selected_month)
+        total_expense_budget = budget.get_total_expense_budget(month=selected_month)
+        total_income_actual = budget.get_total_income_actual(month=selected_month)
+        total_expense_actual = budget.get_total_expense_actual(month=selected_month)
+    else:
+        transactions = budget.transactions.all().order_by('-transaction_date', '-created_at')
+        total_income_budget = budget.get_total_income_budget()
+        total_expense_budget = budget.get_total_expense_budget()
+        total_income_actual = budget.get_total_income_actual()
+        total_expense_actual = budget.get_total_expense_actual()
+    
+    # Calcular diferencias y balance
+    income_difference = total_income_actual - total_income_budget
+    expense_difference = total_expense_actual - total_expense_budget
+    net_budget = total_income_budget - total_expense_budget
+    net_actual = total_income_actual - total_expense_actual
+    
+    # Calcular porcentajes totales
+    total_income_percentage = float((total_income_actual / total_income_budget * Decimal('100'))) if total_income_budget > 0 else 0
+    total_expense_percentage = float((total_expense_actual / total_expense_budget * Decimal('100'))) if total_expense_budget > 0 else 0
+    
+    # Lista de meses para el selector
+    months = [
+        (1, 'Enero'), (2, 'Febrero'), (3, 'Marzo'), (4, 'Abril'),
+        (5, 'Mayo'), (6, 'Junio'), (7, 'Julio'), (8, 'Agosto'),
+        (9, 'Septiembre'), (10, 'Octubre'), (11, 'Noviembre'), (12, 'Diciembre')
+    ]
+    
+    context = {
+        'budget': budget,
+        'income_items_data': income_items_data,
+        'expense_items_data': expense_items_data,
+        'transactions': transactions,
+        'total_income_budget': total_income_budget,
+        'total_expense_budget': total_expense_budget,
+        'total_income_actual': total_income_actual,
+        'total_expense_actual': total_expense_actual,
+        'total_income_percentage': total_income_percentage,
+        'total_expense_percentage': total_expense_percentage,
+        'income_difference': income_difference,
+        'expense_difference': expense_difference,
+        'net_budget': net_budget,
+        'net_actual': net_actual,
+        'selected_month': selected_month,
+        'view_type': view_type,
+        'months': months,
+        'page_title': f'{budget.name} - {budget.year}',
+    }
+    return render(request, 'tickets/budget_detail.html', context)
+
+
+@login_required
+def budget_edit(request, pk):
+    """Edita un presupuesto existente"""
+    budget = get_object_or_404(PersonalBudget, pk=pk, user=request.user)
+    
+    if request.method == 'POST':
+        form = PersonalBudgetForm(request.POST, instance=budget)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Presupuesto "{budget.name}" actualizado exitosamente.')
+            return redirect('budget_detail', pk=budget.pk)
+    else:
+        form = PersonalBudgetForm(instance=budget)
+    
+    context = {
+        'form': form,
+        'budget': budget,
+        'page_title': f'Editar Presupuesto: {budget.name}',
+    }
+    return render(request, 'tickets/budget_form.html', context)
+
+
+@login_required
+def budget_delete(request, pk):
+    """Elimina un presupuesto"""
+    budget = get_object_or_404(PersonalBudget, pk=pk, user=request.user)
+    
+    if request.method == 'POST':
+        budget_name = budget.name
+        budget.delete()
+        messages.success(request, f'Presupuesto "{budget_name}" eliminado exitosamente.')
+        return redirect('budget_list')
+    
+    context = {
+        'budget': budget,
+        'page_title': f'Eliminar Presupuesto: {budget.name}',
+    }
+    return render(request, 'tickets/budget_delete.html', context)
+
+
+@login_required
+def budget_income_item_create(request, budget_pk):
+    """Crea una partida de ingreso"""
+    budget = get_object_or_404(PersonalBudget, pk=budget_pk, user=request.user)
+    
+    if request.method == 'POST':
+        form = BudgetIncomeItemForm(request.POST)
+        if form.is_valid():
+            item = form.save(commit=False)
+            item.budget = budget
+            item.save()
+            messages.success(request, f'Partida de ingreso "{item.name}" agregada.')
+            return redirect('budget_detail', pk=budget.pk)
+    else:
+        form = BudgetIncomeItemForm()
+    
+    context = {
+        'form': form,
+        'budget': budget,
+        'item_type': 'ingreso',
+        'page_title': f'Agregar Ingreso - {budget.name}',
+    }
+    return render(request, 'tickets/budget_item_form.html', context)
+
+
+@login_required
+def budget_expense_item_create(request, budget_pk):
+    """Crea una partida de egreso"""
+    budget = get_object_or_404(PersonalBudget, pk=budget_pk, user=request.user)
+    
+    if request.method == 'POST':
+        form = BudgetExpenseItemForm(request.POST)
+        if form.is_valid():
+            item = form.save(commit=False)
+            item.budget = budget
+            item.save()
+            messages.success(request, f'Partida de egreso "{item.name}" agregada.')
+            return redirect('budget_detail', pk=budget.pk)
+    else:
+        form = BudgetExpenseItemForm()
+    
+    context = {
+        'form': form,
+        'budget': budget,
+        'item_type': 'egreso',
+        'page_title': f'Agregar Egreso - {budget.name}',
+    }
+    return render(request, 'tickets/budget_item_form.html', context)
+
+
+@login_required
+def budget_income_item_edit(request, budget_pk, item_pk):
+    """Edita una partida de ingreso"""
+    budget = get_object_or_404(PersonalBudget, pk=budget_pk, user=request.user)
+    item = get_object_or_404(BudgetIncomeItem, pk=item_pk, budget=budget)
+    
+    if request.method == 'POST':
+        form = BudgetIncomeItemForm(request.POST, instance=item)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Partida de ingreso "{item.name}" actualizada.')
+            return redirect('budget_detail', pk=budget.pk)
+    else:
+        form = BudgetIncomeItemForm(instance=item)
+    
+    context = {
+        'form': form,
+        'budget': budget,
+        'item': item,
+        'item_type': 'ingreso',
+        'page_title': f'Editar Ingreso - {item.name}',
+    }
+    return render(request, 'tickets/budget_item_form.html', context)
+
+
+@login_required
+def budget_expense_item_edit(request, budget_pk, item_pk):
+    """Edita una partida de egreso"""
+    budget = get_object_or_404(PersonalBudget, pk=budget_pk, user=request.user)
+    item = get_object_or_404(BudgetExpenseItem, pk=item_pk, budget=budget)
+    
+    if request.method == 'POST':
+        form = BudgetExpenseItemForm(request.POST, instance=item)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Partida de egreso "{item.name}" actualizada.')
+            return redirect('budget_detail', pk=budget.pk)
+    else:
+        form = BudgetExpenseItemForm(instance=item)
+    
+    context = {
+        'form': form,
+        'budget': budget,
+        'item': item,
+        'item_type': 'egreso',
+        'page_title': f'Editar Egreso - {item.name}',
+    }
+    return render(request, 'tickets/budget_item_form.html', context)
+
+
+@login_required
+def budget_income_item_delete(request, budget_pk, item_pk):
+    """Elimina una partida de ingreso"""
+    budget = get_object_or_404(PersonalBudget, pk=budget_pk, user=request.user)
+    item = get_object_or_404(BudgetIncomeItem, pk=item_pk, budget=budget)
+    
+    if request.method == 'POST':
+        item_name = item.name
+        item.delete()
+        messages.success(request, f'Partida de ingreso "{item_name}" eliminada.')
+        return redirect('budget_detail', pk=budget.pk)
+    
+    return redirect('budget_detail', pk=budget.pk)
+
+
+@login_required
+def budget_expense_item_delete(request, budget_pk, item_pk):
+    """Elimina una partida de egreso"""
+    budget = get_object_or_404(PersonalBudget, pk=budget_pk, user=request.user)
+    item = get_object_or_404(BudgetExpenseItem, pk=item_pk, budget=budget)
+    
+    if request.method == 'POST':
+        item_name = item.name
+        item.delete()
+        messages.success(request, f'Partida de egreso "{item_name}" eliminada.')
+        return redirect('budget_detail', pk=budget.pk)
+    
+    return redirect('budget_detail', pk=budget.pk)
+
+
+@login_required
+def budget_transaction_create(request, budget_pk):
+    """Crea una transacción (ingreso o egreso)"""
+    budget = get_object_or_404(PersonalBudget, pk=budget_pk, user=request.user)
+    
+    if request.method == 'POST':
+        form = BudgetTransactionForm(request.POST, budget=budget)
+        if form.is_valid():
+            transaction = form.save(commit=False)
+            transaction.budget = budget
+            transaction.save()
+            
+            trans_type = 'ingreso' if transaction.transaction_type == 'income' else 'egreso'
+            messages.success(request, f'Transacción de {trans_type} registrada por ${transaction.amount}.')
+            return redirect('budget_detail', pk=budget.pk)
+    else:
+        form = BudgetTransactionForm(budget=budget)
+    
+    context = {
+        'form': form,
+        'budget': budget,
+        'page_title': f'Registrar Transacción - {budget.name}',
+    }
+    return render(request, 'tickets/budget_transaction_form.html', context)
+
+
+@login_required
+def budget_transaction_delete(request, budget_pk, trans_pk):
+    """Elimina una transacción"""
+    budget = get_object_or_404(PersonalBudget, pk=budget_pk, user=request.user)
+    transaction = get_object_or_404(BudgetTransaction, pk=trans_pk, budget=budget)
+    
+    if request.method == 'POST':
+        trans_type = 'ingreso' if transaction.transaction_type == 'income' else 'egreso'
+        amount = transaction.amount
+        transaction.delete()
+        messages.success(request, f'Transacción de {trans_type} por ${amount} eliminada.')
+        return redirect('budget_detail', pk=budget.pk)
+    
+    return redirect('budget_detail', pk=budget.pk)
+
+
+# ========== VISTAS DE TRANSACCIONES ==========
+
+@login_required
+def transaction_list(request):
+    """Lista de transacciones - accesible desde menú CG"""
+    from .models import Transaction
+    
+    if not is_agent(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('home')
+    
+    transactions = Transaction.objects.all().order_by('code')
+    
+    context = {
+        'transactions': transactions,
+    }
+    
+    return render(request, 'tickets/transaction_list.html', context)
+
+
+@login_required
+def transaction_create(request):
+    """Crear nueva transacción"""
+    from .models import Transaction
+    
+    if not is_agent(request.user):
+        messages.error(request, 'No tienes permisos para crear transacciones.')
+        return redirect('home')
+    
+    if request.method == 'POST':
+        code = request.POST.get('code', '').strip().upper()
+        name = request.POST.get('name', '').strip()
+        url = request.POST.get('url', '').strip()
+        visible_for_all = request.POST.get('visible_for_all') == 'on'
+        description = request.POST.get('description', '').strip()
+        icon = request.POST.get('icon', 'bi-link-45deg').strip()
+        
+        if not all([code, name, url]):
+            messages.error(request, 'Los campos Código, Nombre y URL son obligatorios.')
+            return redirect('transaction_create')
+        
+        # Verificar que el código no exista
+        if Transaction.objects.filter(code=code).exists():
+            messages.error(request, f'Ya existe una transacción con el código {code}.')
+            return redirect('transaction_create')
+        
+        transaction = Transaction.objects.create(
+            code=code,
+            name=name,
+            url=url,
+            visible_for_all=visible_for_all,
+            description=description,
+            icon=icon,
+            created_by=request.user
+        )
+        
+        messages.success(request, f'Transacción {transaction.code} creada exitosamente.')
+        return redirect('transaction_list')
+    
+    return render(request, 'tickets/transaction_form.html', {'action': 'Crear'})
+
+
+@login_required
+def transaction_edit(request, pk):
+    """Editar transacción existente"""
+    from .models import Transaction
+    
+    if not is_agent(request.user):
+        messages.error(request, 'No tienes permisos para editar transacciones.')
+        return redirect('home')
+    
+    transaction = get_object_or_404(Transaction, id=pk)
+    
+    if request.method == 'POST':
+        code = request.POST.get('code', '').strip().upper()
+        name = request.POST.get('name', '').strip()
+        url = request.POST.get('url', '').strip()
+        visible_for_all = request.POST.get('visible_for_all') == 'on'
+        description = request.POST.get('description', '').strip()
+        icon = request.POST.get('icon', 'bi-link-45deg').strip()
+        is_active = request.POST.get('is_active') == 'on'
+        
+        if not all([code, name, url]):
+            messages.error(request, 'Los campos Código, Nombre y URL son obligatorios.')
+            return redirect('transaction_edit', pk=pk)
+        
+        # Verificar que el código no exista en otra transacción
+        if Transaction.objects.filter(code=code).exclude(id=pk).exists():
+            messages.error(request, f'Ya existe otra transacción con el código {code}.')
+            return redirect('transaction_edit', pk=pk)
+        
+        transaction.code = code
+        transaction.name = name
+        transaction.url = url
+        transaction.visible_for_all = visible_for_all
+        transaction.description = description
+        transaction.icon = icon
+        transaction.is_active = is_active
+        transaction.save()
+        
+        messages.success(request, f'Transacción {transaction.code} actualizada exitosamente.')
+        return redirect('transaction_list')
+    
+    context = {
+        'transaction': transaction,
+        'action': 'Editar'
+    }
+    
+    return render(request, 'tickets/transaction_form.html', context)
+
+
+@login_required
+def transaction_delete(request, pk):
+    """Eliminar transacción"""
+    from .models import Transaction
+    
+    if not is_agent(request.user):
+        messages.error(request, 'No tienes permisos para eliminar transacciones.')
+        return redirect('home')
+    
+    transaction = get_object_or_404(Transaction, id=pk)
+    
+    if request.method == 'POST':
+        code = transaction.code
+        transaction.delete()
+        messages.success(request, f'Transacción {code} eliminada exitosamente.')
+        return redirect('transaction_list')
+    
+    context = {
+        'transaction': transaction,
+    }
+    
+    return render(request, 'tickets/transaction_delete.html', context)
+
+
+@login_required
+def transaction_search(request):
+    """API para buscar transacciones por código o nombre"""
+    from .models import Transaction
+    from django.http import JsonResponse
+    
+    query = request.GET.get('q', '').strip()
+    
+    # Filtrar transacciones según permisos del usuario
+    transactions_qs = Transaction.objects.filter(is_active=True)
+    
+    if not is_agent(request.user):
+        transactions_qs = transactions_qs.filter(visible_for_all=True)
+    
+    # Si hay query, buscar por código o nombre
+    if query:
+        from .search import filter_queryset
+        transactions_qs = filter_queryset(transactions_qs, 'transaction', query)
+    
+    # Ordenar por código y limitar resultados
+    transactions_qs = transactions_qs.order_by('code')[:20]
+    
+    transactions = [{
+        'id': t.id,
+        'code': t.code,
+        'name': t.name,
+        'url': t.url,
+        'icon': t.icon,
+        'description': t.description
+    } for t in transactions_qs]
+    
+    return JsonResponse({'results': transactions})
+
+
+# ====== VISTAS DE FACTURAS OCR ======
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def ocr_invoice_list(request):
+    """Vista para listar facturas OCR"""
+    from .models import OCRInvoice, SystemConfiguration
+    
+    # Obtener configuración del sistema
+    config = SystemConfiguration.get_config()
+    
+    # Filtros
+    status_filter = request.GET.get('status', '')
+    search = request.GET.get('search', '')
+    view_mode = request.GET.get('view', 'table')  # Por defecto tabla
+    
+    invoices = OCRInvoice.objects.select_related('uploaded_by').all()
+    
+    if status_filter:
+        invoices = invoices.filter(status=status_filter)
+    
+    if search:
+        invoices = invoices.filter(
+            Q(number__icontains=search) | 
+            Q(supplier__icontains=search)
+        )
+    
+    # Paginación
+    paginator = Paginator(invoices, 20)
+    page = request.GET.get('page')
+    page_obj = paginator.get_page(page)
+    
+    # Estados para filtro
+    statuses = OCRInvoice.STATUS_CHOICES
+    
+    context = {
+        'page_title': 'Facturas OCR',
+        'page_obj': page_obj,
+        'statuses': statuses,
+        'status_filter': status_filter,
+        'search': search,
+        'ocr_config': config,
+        'view_mode': view_mode,
+    }
+    return render(request, 'tickets/ocr_invoice_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def ocr_invoice_create(request):
+    """Vista para crear factura OCR"""
+    from .models import OCRInvoice
+    from .forms import OCRInvoiceForm
+    
+    if request.method == 'POST':
+        form = OCRInvoiceForm(request.POST, request.FILES)
+        if form.is_valid():
+            invoice = form.save(commit=False)
+            invoice.uploaded_by = request.user
+            invoice.save()
+            
+            messages.success(request, f'Factura "{invoice.number}" creada exitosamente.')
+            return redirect('ocr_invoice_detail', pk=invoice.pk)
+    else:
+        form = OCRInvoiceForm()
+    
+    context = {
+        'page_title': 'Nueva Factura OCR',
+        'form': form,
+    }
+    return render(request, 'tickets/ocr_invoice_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def ocr_invoice_generate_api_token(request):
+    """Vista para generar o regenerar el token de API para OCR"""
+    from .models import SystemConfiguration
+    import secrets
+    
+    if request.method == 'POST':
+        config = SystemConfiguration.get_config()
+        config.ocr_public_upload_token = secrets.token_urlsafe(32)
+        config.save()
+        messages.success(request, 'Token de API generado exitosamente.')
+    
+    return redirect('ocr_invoice_list')
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def ocr_invoice_detail(request, pk):
+    """Vista de detalle de factura OCR"""
+    from .models import OCRInvoice
+    
+    invoice = get_object_or_404(OCRInvoice, pk=pk)
+    
+    # URLs completas
+    public_url = request.build_absolute_uri(invoice.get_public_url())
+    api_url = request.build_absolute_uri(invoice.get_api_url())
+    
+    context = {
+        'page_title': f'Factura: {invoice.number}',
+        'invoice': invoice,
+        'public_url': public_url,
+        'api_url': api_url,
+    }
+    return render(request, 'tickets/ocr_invoice_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def ocr_invoice_edit(request, pk):
+    """Vista para editar factura OCR"""
+    from .models import OCRInvoice
+    from .forms import OCRInvoiceForm
+    
+    invoice = get_object_or_404(OCRInvoice, pk=pk)
+    
+    if request.method == 'POST':
+        form = OCRInvoiceForm(request.POST, request.FILES, instance=invoice)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Factura "{invoice.number}" actualizada exitosamente.')
+            return redirect('ocr_invoice_detail', pk=invoice.pk)
+    else:
+        form = OCRInvoiceForm(instance=invoice)
+    
+    context = {
+        'page_title': f'Editar: {invoice.number}',
+        'form': form,
+        'invoice': invoice,
+    }
+    return render(request, 'tickets/ocr_invoice_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def ocr_invoice_delete(request, pk):
+    """Vista para eliminar factura OCR"""
+    from .models import OCRInvoice
+    
+    invoice = get_object_or_404(OCRInvoice, pk=pk)
+    
+    if request.method == 'POST':
+        number = invoice.number
+        invoice.delete()
+        messages.success(request, f'Factura "{number}" eliminada exitosamente.')
+        return redirect('ocr_invoice_list')
+    
+    context = {
+        'page_title': f'Eliminar: {invoice.number}',
+        'invoice': invoice,
+    }
+    return render(request, 'tickets/ocr_invoice_delete.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='/')
+def ocr_invoice_process(request, pk):
+    """Vista para procesar factura con OCR usando IA"""
+    from .models import OCRInvoice, SystemConfiguration
+    import json
+    import base64
+    from openai import OpenAI
+    
+    invoice = get_object_or_404(OCRInvoice, pk=pk)
+    
+    try:
+        # Obtener configuración de OpenAI
+        config = SystemConfiguration.get_config()
+        
+        if not config.openai_api_key:
+            messages.error(request, 'API key de OpenAI no configurada')
+            return redirect('ocr_invoice_detail', pk=invoice.pk)
+        
+        # Leer la imagen y codificar en base64
+        invoice.image.seek(0)
+        image_data = invoice.image.read()
+        image_base64 = base64.b64encode(image_data).decode('utf-8')
+        
+        # Crear cliente de OpenAI
+        client = OpenAI(api_key=config.openai_api_key)
+        
+        # Llamar a la API con vision
+        response = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Eres un experto en extraer datos de facturas. Analiza la imagen y extrae la información en formato JSON. Responde SOLO con JSON válido, sin texto adicional ni formato Markdown."
+                },
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": """Analiza esta imagen de factura y extrae la siguiente información en formato JSON:
+{
+    "numero_factura": "número de la factura",
+    "proveedor": "nombre del proveedor",
+    "neto": "importe neto sin impuestos como número",
+    "impuesto": "importe del impuesto/IVA como número",
+    "total": "importe total con impuestos como número",
+    "importe_total": "importe total como número (sin símbolos de moneda)",
+    "fecha": "fecha de la factura",
+    "conceptos": ["lista de conceptos o items"],
+    "otros_datos": "cualquier información relevante adicional"
+}
+
+Responde SOLO con el JSON válido, sin bloques de código ni texto adicional."""
+                        },
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{image_base64}"
+                            }
+                        }
+                    ]
+                }
+            ],
+            max_tokens=1000
+        )
+        
+        # Obtener respuesta
+        ai_response = response.choices[0].message.content.strip()
+        
+        # Limpiar la respuesta (remover bloques de código si existen)
+        if ai_response.startswith('```'):
+            # Remover bloques de código markdown
+            ai_response = ai_response.split('```')[1]
+            if ai_response.startswith('json'):
+                ai_response = ai_response[4:]
+            ai_response = ai_response.strip()
+        
+        # Parsear JSON
+        try:
+            extracted_data = json.loads(ai_response)
+        except json.JSONDecodeError:
+            # Intentar extraer JSON usando regex como fallback
+            import re
+            json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
+            if json_match:
+                extracted_data = json.loads(json_match.group())
+            else:
+                raise ValueError("No se pudo extraer JSON de la respuesta")
+        
+        # Actualizar la factura con los datos extraídos
+        invoice.json_data = extracted_data
+        
+        # Auto-llenar campos si están vacíos
+        if not invoice.number and extracted_data.get('numero_factura'):
+            invoice.number = extracted_data['numero_factura']
+        
+        if not invoice.supplier and extracted_data.get('proveedor'):
+            invoice.supplier = extracted_data['proveedor']
+        
+        # Extraer neto
+        if invoice.neto == 0 and extracted_data.get('neto'):
+            try:
+                neto_str = str(extracted_data['neto']).replace(',', '').replace('€', '').replace('$', '').strip()
+                invoice.neto = float(neto_str)
+            except (ValueError, TypeError):
+                pass
+        
+        # Extraer impuesto
+        if invoice.impuesto == 0 and extracted_data.get('impuesto'):
+            try:
+                impuesto_str = str(extracted_data['impuesto']).replace(',', '').replace('€', '').replace('$', '').strip()
+                invoice.impuesto = float(impuesto_str)
+            except (ValueError, TypeError):
+                pass
+        
+        # Extraer total
+        if invoice.total == 0 and extracted_data.get('total'):
+            try:
+                total_str = str(extracted_data['total']).replace(',', '').replace('€', '').replace('$', '').strip()
+                invoice.total = float(total_str)
+            except (ValueError, TypeError):
+                pass
+        
+        # Extraer importe_total (mantener por compatibilidad)
+        if invoice.amount == 0 and extracted_data.get('importe_total'):
+            try:
+                importe_str = str(extracted_data['importe_total']).replace(',', '').replace('€', '').replace('$', '').strip()
+                invoice.amount = float(importe_str)
+            except (ValueError, TypeError):
+                pass
+        
+        # Si no hay total pero hay neto e impuesto, calcular total
+        if invoice.total == 0 and invoice.neto > 0:
+            invoice.total = invoice.neto + invoice.impuesto
+        
+        # Cambiar estado a escaneado
+        invoice.status = 'scanned'
+        invoice.save()
+        
+        messages.success(request, 'Factura procesada exitosamente con OCR!')
+        return redirect('ocr_invoice_detail', pk=invoice.pk)
+        
+    except Exception as e:
+        messages.error(request, f'Error al procesar factura: {str(e)}')
+        return redirect('ocr_invoice_detail', pk=invoice.pk)
+
+
+# Vista pública para subir facturas (sin autenticación)
+def ocr_invoice_public_upload(request, token):
+    """Vista pública para subir facturas desde móvil (actualizar factura existente)"""
+    from .models import OCRInvoice
+    from .forms import OCRInvoicePublicForm
+    
+    # Verificar que el token exista
+    invoice = get_object_or_404(OCRInvoice, public_token=token)
+    
+    if request.method == 'POST':
+        form = OCRInvoicePublicForm(request.POST, request.FILES, instance=invoice)
+        if form.is_valid():
+            form.save()
+            messages.success(request, '¡Factura actualizada exitosamente!')
+            return redirect('ocr_invoice_public_upload', token=token)
+    else:
+        form = OCRInvoicePublicForm(instance=invoice)
+    
+    context = {
+        'page_title': 'Actualizar Factura',
+        'form': form,
+        'invoice': invoice,
+    }
+    return render(request, 'tickets/ocr_invoice_public_upload.html', context)
+
+
+def ocr_invoice_public_new(request, token=None):
+    """Vista pública para crear nuevas facturas desde móvil (sin autenticación)"""
+    from .models import OCRInvoice, SystemConfiguration
+    from .forms import OCRInvoicePublicForm
+    
+    # Validar token si se proporciona
+    config = SystemConfiguration.get_config()
+    
+    # Si no está habilitado el enlace público, denegar acceso
+    if not config.ocr_public_upload_enabled:
+        messages.error(request, 'El enlace público para subir facturas está desactivado.')
+        return redirect('/')
+    
+    # Si se proporciona token, validarlo
+    if token:
+        if not config.ocr_public_upload_token or config.ocr_public_upload_token != token:
+            messages.error(request, 'Token inválido.')
+            return redirect('/')
+    
+    if request.method == 'POST':
+        form = OCRInvoicePublicForm(request.POST, request.FILES)
+        if form.is_valid():
+            invoice = form.save(commit=False)
+            invoice.status = 'draft'
+            invoice.save()
+            
+            # Procesar automáticamente con OCR
+            try:
+                import json
+                import base64
+                from openai import OpenAI
+                
+                # Obtener configuración de OpenAI
+                if config.openai_api_key:
+                    # Leer la imagen y codificar en base64
+                    invoice.image.seek(0)
+                    image_data = invoice.image.read()
+                    image_base64 = base64.b64encode(image_data).decode('utf-8')
+                    
+                    # Crear cliente de OpenAI
+                    client = OpenAI(api_key=config.openai_api_key)
+                    
+                    # Llamar a la API con vision
+                    response = client.chat.completions.create(
+                        model="gpt-4o-mini",
+                        messages=[
+                            {
+                                "role": "system",
+                                "content": "Eres un experto en extraer datos de facturas. Analiza la imagen y extrae la información en formato JSON. Responde SOLO con JSON válido, sin texto adicional ni formato Markdown."
+                            },
+                            {
+                                "role": "user",
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": """Analiza esta imagen de factura y extrae la siguiente información en formato JSON:
+{
+    "numero_factura": "número de la factura",
+    "proveedor": "nombre del proveedor",
+    "neto": "importe neto sin impuestos como número",
+    "impuesto": "importe del impuesto/IVA como número",
+    "total": "importe total con impuestos como número",
+    "importe_total": "importe total como número (sin símbolos de moneda)",
+    "fecha": "fecha de la factura",
+    "conceptos": ["lista de conceptos o items"],
+    "otros_datos": "cualquier información relevante adicional"
+}
+
+Responde SOLO con el JSON válido, sin bloques de código ni texto adicional."""
+                                    },
+                                    {
+                                        "type": "image_url",
+                                        "image_url": {
+                                            "url": f"data:image/jpeg;base64,{image_base64}"
+                                        }
+                                    }
+                                ]
+                            }
+                        ],
+                        max_tokens=1000
+                    )
+                    
+                    # Obtener respuesta
+                    ai_response = response.choices[0].message.content.strip()
+                    
+                    # Limpiar la respuesta (remover bloques de código si existen)
+                    if ai_response.startswith('```'):
+                        ai_response = ai_response.split('```')[1]
+                        if ai_response.startswith('json'):
+                            ai_response = ai_response[4:]
+                        ai_response = ai_response.strip()
+                    
+                    # Parsear JSON
+                    try:
+                        extracted_data = json.loads(ai_response)
+                    except json.JSONDecodeError:
+                        import re
+                        json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
+                        if json_match:
+                            extracted_data = json.loads(json_match.group())
+                        else:
+                            extracted_data = {}
+                    
+                    # Actualizar la factura con los datos extraídos
+                    invoice.json_data = extracted_data
+                    
+                    # Auto-llenar campos
+                    if extracted_data.get('numero_factura'):
+                        invoice.number = extracted_data['numero_factura']
+                    
+                    if extracted_data.get('proveedor'):
+                        invoice.supplier = extracted_data['proveedor']
+                    
+                    # Extraer neto
+                    if extracted_data.get('neto'):
+                        try:
+                            neto_str = str(extracted_data['neto']).replace(',', '').replace('€', '').replace('$', '').strip()
+                            invoice.neto = float(neto_str)
+                        except (ValueError, TypeError):
+                            pass
+                    
+                    # Extraer impuesto
+                    if extracted_data.get('impuesto'):
+                        try:
+                            impuesto_str = str(extracted_data['impuesto']).replace(',', '').replace('€', '').replace('$', '').strip()
+                            invoice.impuesto = float(impuesto_str)
+                        except (ValueError, TypeError):
+                            pass
+                    
+                    # Extraer total
+                    if extracted_data.get('total'):
+                        try:
+                            total_str = str(extracted_data['total']).replace(',', '').replace('€', '').replace('$', '').strip()
+                            invoice.total = float(total_str)
+                        except (ValueError, TypeError):
+                            pass
+                    
+                    # Si no hay total pero hay neto e impuesto, calcular total
+                    if invoice.total == 0 and invoice.neto > 0:
+                        invoice.total = invoice.neto + invoice.impuesto
+                    
+                    # Cambiar estado a escaneado
+                    invoice.status = 'scanned'
+                    invoice.save()
+                    
+                    messages.success(request, '¡Factura procesada exitosamente con OCR!')
+                else:
+                    invoice.save()
+                    messages.success(request, '¡Factura creada exitosamente!')
+            except Exception as e:
+                invoice.save()
+                messages.warning(request, f'Factura creada pero no se pudo procesar con OCR: {str(e)}')
+            
+            # Redirigir con token si existe
+            if token:
+                return redirect('ocr_invoice_public_new_with_token', token=token)
+            return redirect('ocr_invoice_public_new')
+    else:
+        form = OCRInvoicePublicForm()
+    
+    context = {
+        'page_title': 'Subir Nueva Factura',
+        'form': form,
+        'token': token,
+    }
+    return render(request, 'tickets/ocr_invoice_public_new.html', context)
+
+# ==================== ERP3 - FACTURAS DE 3ROS ====================
+
+@login_required
+def invoice_list(request):
+    """Vista para listar todas las facturas"""
+    from .models import Invoice
+    from .submenu_utils import get_erp3_submenu
+    from .utils import is_agent
+    
+    # Admin/staff ven todas las facturas
+    # Usuarios normales y agentes solo ven las suyas
+    if request.user.is_staff or request.user.is_superuser:
+        invoices = Invoice.objects.all().select_related('company', 'created_by')
+    else:
+        invoices = Invoice.objects.filter(created_by=request.user).select_related('company', 'created_by')
+    
+    # Filtros
+    search = request.GET.get('search', '')
+    status = request.GET.get('status', '')
+    company_id = request.GET.get('company', '')
+    
+    if search:
+        invoices = invoices.filter(
+            Q(sequence__icontains=search) |
+            Q(company__name__icontains=search) |
+            Q(notes__icontains=search)
+        )
+    
+    if status:
+        invoices = invoices.filter(status=status)
+    
+    if company_id:
+        invoices = invoices.filter(company_id=company_id)
+    
+    # Paginación
+    paginator = Paginator(invoices, 25)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Lista de empresas para el filtro
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'page_obj': page_obj,
+        'search': search,
+        'status': status,
+        'company_id': company_id,
+        'companies': companies,
+        'app_name': 'ERP3',
+        'submenu_items': get_erp3_submenu(request, 'invoices'),
+    }
+    return render(request, 'tickets/invoice_list.html', context)
+
+
+@login_required
+def invoice_detail(request, pk):
+    """Vista para ver detalles de una factura"""
+    from .models import Invoice
+    from .submenu_utils import get_erp3_submenu
+    from .utils import is_agent
+    from django.core.exceptions import PermissionDenied
+    
+    invoice = get_object_or_404(Invoice, pk=pk)
+    
+    # Admin/superuser pueden ver todas las facturas
+    # Usuarios normales y agentes solo pueden ver las suyas
+    if not (request.user.is_staff or request.user.is_superuser):
+        if invoice.created_by != request.user:
+            raise PermissionDenied("No tienes permiso para ver esta factura")
+    
+    lines = invoice.lines.all().select_related('product')
+    invoice_messages = invoice.messages.all().select_related('user')
+    
+    context = {
+        'invoice': invoice,
+        'lines': lines,
+        'invoice_messages': invoice_messages,
+        'app_name': 'ERP3',
+        'submenu_items': get_erp3_submenu(request, 'invoices'),
+    }
+    return render(request, 'tickets/invoice_detail.html', context)
+
+
+@login_required
+def invoice_create(request):
+    """Vista para crear una nueva factura"""
+    from .models import Invoice, Product
+    from .submenu_utils import get_erp3_submenu
+    from decimal import Decimal
+    
+    if request.method == 'POST':
+        # Obtener datos de la cabecera
+        company_id = request.POST.get('company')
+        invoice_date = request.POST.get('invoice_date')
+        due_date = request.POST.get('due_date')
+        notes = request.POST.get('notes', '')
+        footer_message = request.POST.get('footer_message', '')
+        currency = request.POST.get('currency', 'USD')
+        
+        # Crear la factura
+        invoice = Invoice(
+            company_id=company_id,
+            invoice_date=invoice_date,
+            due_date=due_date if due_date else None,
+            notes=notes,
+            footer_message=footer_message,
+            currency=currency,
+            created_by=request.user
+        )
+        invoice.save()
+        
+        # Obtener datos de las líneas
+        product_ids = request.POST.getlist('product_id[]')
+        quantities = request.POST.getlist('quantity[]')
+        unit_prices = request.POST.getlist('unit_price[]')
+        tax_rates = request.POST.getlist('tax_rate[]')
+        descriptions = request.POST.getlist('description[]')
+        
+        # Crear las líneas
+        from .models import InvoiceLine
+        for i, product_id in enumerate(product_ids):
+            if product_id:  # Solo crear si hay producto seleccionado
+                try:
+                    quantity = Decimal(quantities[i]) if i < len(quantities) and quantities[i] else Decimal('1')
+                    unit_price = Decimal(unit_prices[i]) if i < len(unit_prices) and unit_prices[i] else Decimal('0')
+                    tax_rate = Decimal(tax_rates[i]) if i < len(tax_rates) and tax_rates[i] else Decimal('0')
+                except (ValueError, IndexError):
+                    quantity = Decimal('1')
+                    unit_price = Decimal('0')
+                    tax_rate = Decimal('0')
+                    
+                InvoiceLine.objects.create(
+                    invoice=invoice,
+                    product_id=product_id,
+                    quantity=quantity,
+                    unit_price=unit_price,
+                    tax_rate=tax_rate,
+                    description=descriptions[i] if i < len(descriptions) else '',
+                    line_number=i + 1
+                )
+        
+        messages.success(request, f'Factura {invoice.sequence} creada exitosamente.')
+        return redirect('invoice_detail', pk=invoice.pk)
+    
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    products = Product.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'companies': companies,
+        'products': products,
+        'today': timezone.now().date(),
+        'app_name': 'ERP3',
+        'submenu_items': get_erp3_submenu(request, 'invoices'),
+    }
+    return render(request, 'tickets/invoice_form.html', context)
+
+
+@login_required
+def invoice_update(request, pk):
+    """Vista para editar una factura existente"""
+    from .models import Invoice, InvoiceLine, Product
+    from .submenu_utils import get_erp3_submenu
+    from decimal import Decimal
+    
+    invoice = get_object_or_404(Invoice, pk=pk)
+    
+    if request.method == 'POST':
+        # Actualizar datos de la cabecera
+        invoice.sequence = request.POST.get('sequence', invoice.sequence)
+        invoice.company_id = request.POST.get('company')
+        invoice.invoice_date = request.POST.get('invoice_date')
+        invoice.due_date = request.POST.get('due_date') if request.POST.get('due_date') else None
+        invoice.notes = request.POST.get('notes', '')
+        invoice.footer_message = request.POST.get('footer_message', '')
+        invoice.status = request.POST.get('status', 'draft')
+        invoice.currency = request.POST.get('currency', 'USD')
+        invoice.save()
+        
+        # Eliminar líneas existentes
+        invoice.lines.all().delete()
+        
+        # Crear nuevas líneas
+        product_ids = request.POST.getlist('product_id[]')
+        quantities = request.POST.getlist('quantity[]')
+        unit_prices = request.POST.getlist('unit_price[]')
+        tax_rates = request.POST.getlist('tax_rate[]')
+        descriptions = request.POST.getlist('description[]')
+        
+        for i, product_id in enumerate(product_ids):
+            if product_id:
+                try:
+                    quantity = Decimal(quantities[i]) if i < len(quantities) and quantities[i] else Decimal('1')
+                    unit_price = Decimal(unit_prices[i]) if i < len(unit_prices) and unit_prices[i] else Decimal('0')
+                    tax_rate = Decimal(tax_rates[i]) if i < len(tax_rates) and tax_rates[i] else Decimal('0')
+                except (ValueError, IndexError):
+                    quantity = Decimal('1')
+                    unit_price = Decimal('0')
+                    tax_rate = Decimal('0')
+                    
+                InvoiceLine.objects.create(
+                    invoice=invoice,
+                    product_id=product_id,
+                    quantity=quantity,
+                    unit_price=unit_price,
+                    tax_rate=tax_rate,
+                    description=descriptions[i] if i < len(descriptions) else '',
+                    line_number=i + 1
+                )
+        
+        messages.success(request, f'Factura {invoice.sequence} actualizada exitosamente.')
+        return redirect('invoice_detail', pk=invoice.pk)
+    
+    companies = Company.objects.filter(is_active=True).order_by('name')
+    products = Product.objects.filter(is_active=True).order_by('name')
+    lines = invoice.lines.all().select_related('product')
+    
+    context = {
+        'invoice': invoice,
+        'lines': lines,
+        'companies': companies,
+        'products': products,
+        'app_name': 'ERP3',
+        'submenu_items': get_erp3_submenu(request, 'invoices'),
+    }
+    return render(request, 'tickets/invoice_form.html', context)
+
+
+@login_required
+def invoice_delete(request, pk):
+    """Vista para eliminar una factura"""
+    from .models import Invoice
+    from .submenu_utils import get_erp3_submenu
+    
+    invoice = get_object_or_404(Invoice, pk=pk)
+    
+    if request.method == 'POST':
+        sequence = invoice.sequence
+        invoice.delete()
+        messages.success(request, f'Factura {sequence} eliminada exitosamente.')
+        return redirect('invoice_list')
+    
+    context = {
+        'invoice': invoice,
+        'app_name': 'ERP3',
+        'submenu_items': get_erp3_submenu(request, 'invoices'),
+    }
+    return render(request, 'tickets/invoice_delete.html', context)
+
+@login_required
+def invoice_pdf(request, pk):
+    """Genera y descarga el PDF de la factura"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.pdfgen import canvas
+    from .models import Invoice
+    from decimal import Decimal
+    
+    invoice = get_object_or_404(Invoice, pk=pk)
+    lines = invoice.lines.all().select_related('product')
+    
+    # Obtener símbolo de moneda
+    currency_symbol = invoice.get_currency_symbol()
+    
+    # Crear el objeto HttpResponse con el tipo de contenido apropiado
+    response = HttpResponse(content_type='application/pdf')
+    response['Content-Disposition'] = f'attachment; filename="Factura_{invoice.sequence}.pdf"'
+    
+    # Crear el objeto PDF
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=letter)
+    width, height = letter
+    
+    # Configuración de márgenes
+    margin_left = 50
+    margin_right = width - 50
+    y_position = height - 50
+    
+    # ==================== ENCABEZADO - DATOS DEL EMISOR ====================
+    c.setFont("Helvetica-Bold", 16)
+    c.drawString(margin_left, y_position, "FACTURA")
+    
+    # Número de factura
+    c.setFont("Helvetica-Bold", 12)
+    c.drawString(margin_right - 150, y_position, invoice.sequence)
+    y_position -= 30
+    
+    # Línea separadora
+    c.setStrokeColor(colors.HexColor('#6c757d'))
+    c.setLineWidth(2)
+    c.line(margin_left, y_position, margin_right, y_position)
+    y_position -= 30
+    
+    # ==================== DATOS EN DOS COLUMNAS ====================
+    # Guardar posición inicial para ambas columnas
+    column_start_y = y_position
+    
+    # COLUMNA IZQUIERDA - CLIENTE
+    y_left = column_start_y
+    c.setFont("Helvetica-Bold", 11)
+    c.drawString(margin_left, y_left, "CLIENTE:")
+    y_left -= 20
+    
+    c.setFont("Helvetica", 10)
+    c.drawString(margin_left, y_left, f"Empresa: {invoice.company.name}")
+    y_left -= 15
+    if invoice.company.address:
+        c.drawString(margin_left, y_left, f"Dirección: {invoice.company.address}")
+        y_left -= 15
+    if invoice.company.phone:
+        c.drawString(margin_left, y_left, f"Teléfono: {invoice.company.phone}")
+        y_left -= 15
+    if invoice.company.email:
+        c.drawString(margin_left, y_left, f"Email: {invoice.company.email}")
+        y_left -= 15
+    
+    # COLUMNA DERECHA - EMISOR
+    y_right = column_start_y
+    right_column_x = width / 2 + 20
+    c.setFont("Helvetica-Bold", 11)
+    c.drawString(right_column_x, y_right, "EMISOR:")
+    y_right -= 20
+    
+    c.setFont("Helvetica", 10)
+    c.drawString(right_column_x, y_right, f"Usuario: {invoice.created_by.get_full_name() or invoice.created_by.username}")
+    y_right -= 15
+    c.drawString(right_column_x, y_right, f"Email: {invoice.created_by.email}")
+    y_right -= 15
+    c.drawString(right_column_x, y_right, f"Fecha de emisión: {invoice.created_at.strftime('%d/%m/%Y %H:%M')}")
+    y_right -= 15
+    
+    # Usar la posición más baja de las dos columnas
+    y_position = min(y_left, y_right) - 10
+    
+    # Fechas de la factura
+    c.setFont("Helvetica-Bold", 10)
+    c.drawString(margin_left, y_position, f"Fecha de Factura: {invoice.invoice_date.strftime('%d/%m/%Y')}")
+    if invoice.due_date:
+        c.drawString(margin_left + 200, y_position, f"Vencimiento: {invoice.due_date.strftime('%d/%m/%Y')}")
+    y_position -= 40
+    
+    # ==================== TABLA DE LÍNEAS ====================
+    c.setFont("Helvetica-Bold", 11)
+    c.drawString(margin_left, y_position, "DETALLE DE LA FACTURA")
+    y_position -= 20
+    
+    # Encabezados de la tabla
+    table_headers = ['#', 'Producto', 'Descripción', 'Cant.', 'P. Unit.', 'Subtotal', 'Imp.', 'Total']
+    col_widths = [30, 120, 120, 40, 60, 60, 50, 60]
+    
+    # Dibujar encabezados
+    c.setFillColor(colors.HexColor('#f8f9fa'))
+    c.rect(margin_left, y_position - 15, sum(col_widths), 18, fill=1, stroke=0)
+    c.setFillColor(colors.black)
+    c.setFont("Helvetica-Bold", 9)
+    
+    x_pos = margin_left + 5
+    for i, header in enumerate(table_headers):
+        if i >= 3:  # Alinear a la derecha cantidades y montos
+            c.drawRightString(x_pos + col_widths[i] - 5, y_position - 10, header)
+        else:
+            c.drawString(x_pos, y_position - 10, header)
+        x_pos += col_widths[i]
+    
+    y_position -= 20
+    c.setFont("Helvetica", 8)
+    
+    # Líneas de la factura
+    for line in lines:
+        # Verificar si necesitamos nueva página
+        if y_position < 150:
+            c.showPage()
+            y_position = height - 50
+            c.setFont("Helvetica", 8)
+        
+        x_pos = margin_left + 5
+        row_data = [
+            str(line.line_number),
+            line.product.name[:20],
+            (line.description[:25] if line.description else '-'),
+            f"{line.quantity}",
+            f"{currency_symbol}{line.unit_price:.2f}",
+            f"{currency_symbol}{line.subtotal:.2f}",
+            f"{currency_symbol}{line.tax_amount:.2f}",
+            f"{currency_symbol}{line.line_total:.2f}"
+        ]
+        
+        for i, data in enumerate(row_data):
+            if i >= 3:  # Alinear a la derecha
+                c.drawRightString(x_pos + col_widths[i] - 5, y_position, data)
+            else:
+                c.drawString(x_pos, y_position, data)
+            x_pos += col_widths[i]
+        
+        y_position -= 18
+    
+    # Línea separadora antes de totales
+    y_position -= 10
+    c.setStrokeColor(colors.grey)
+    c.setLineWidth(1)
+    c.line(margin_right - 200, y_position, margin_right, y_position)
+    y_position -= 25
+    
+    # ==================== TOTALES ====================
+    c.setFont("Helvetica-Bold", 10)
+    
+    # Subtotal
+    c.drawString(margin_right - 180, y_position, "Subtotal:")
+    c.drawRightString(margin_right - 10, y_position, f"{currency_symbol}{invoice.subtotal:.2f}")
+    y_position -= 18
+    
+    # Impuestos
+    c.drawString(margin_right - 180, y_position, "Impuestos:")
+    c.drawRightString(margin_right - 10, y_position, f"{currency_symbol}{invoice.tax_amount:.2f}")
+    y_position -= 18
+    
+    # Total
+    c.setFont("Helvetica-Bold", 12)
+    c.setFillColor(colors.HexColor('#6c757d'))
+    c.drawString(margin_right - 180, y_position, "TOTAL:")
+    c.drawRightString(margin_right - 10, y_position, f"{currency_symbol}{invoice.total:.2f}")
+    c.setFillColor(colors.black)
+    y_position -= 30
+    
+    # ==================== NOTAS ====================
+    if invoice.notes:
+        y_position -= 20
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(margin_left, y_position, "Notas:")
+        y_position -= 15
+        c.setFont("Helvetica", 9)
+        
+        # Dividir notas en líneas si es muy largo
+        notes_lines = invoice.notes.split('\n')
+        for note_line in notes_lines:
+            if y_position < 100:
+                c.showPage()
+                y_position = height - 50
+                c.setFont("Helvetica", 9)
+            c.drawString(margin_left, y_position, note_line[:100])
+            y_position -= 12
+    
+    # ==================== MENSAJE AL PIE ====================
+    if invoice.footer_message:
+        y_position -= 20
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(margin_left, y_position, "Mensaje:")
+        y_position -= 15
+        c.setFont("Helvetica", 9)
+        
+        # Dividir mensaje en líneas si es muy largo
+        message_lines = invoice.footer_message.split('\n')
+        for message_line in message_lines:
+            if y_position < 100:
+                c.showPage()
+                y_position = height - 50
+                c.setFont("Helvetica", 9)
+            c.drawString(margin_left, y_position, message_line[:100])
+            y_position -= 12
+    
+    # ==================== PIE DE PÁGINA ====================
+    c.setFont("Helvetica", 8)
+    c.setFillColor(colors.grey)
+    c.drawCentredString(width/2, 30, f"Factura generada el {timezone.now().strftime('%d/%m/%Y %H:%M')}")
+    c.drawCentredString(width/2, 15, "TicketProo - Sistema de Gestión")
+    
+    # Finalizar el PDF
+    c.showPage()
+    c.save()
+    
+    # Obtener el valor del BytesIO buffer y escribirlo en la respuesta
+    pdf = buffer.getvalue()
+    buffer.close()
+    response.write(pdf)
+    
+    return response
+
+@login_required
+@login_required
+def invoice_sequence_config(request):
+    """Vista para configurar la secuencia de facturas del usuario"""
+    from .models import UserProfile
+    from .submenu_utils import get_erp3_submenu
+    
+    # Obtener o crear el perfil del usuario
+    profile, created = UserProfile.objects.get_or_create(user=request.user)
+    
+    if request.method == 'POST':
+        prefix = request.POST.get('invoice_sequence_prefix', '')
+        next_number = request.POST.get('invoice_next_number', '1')
+        
+        try:
+            next_number = int(next_number)
+            if next_number < 1:
+                messages.error(request, 'El próximo número debe ser mayor o igual a 1.')
+            else:
+                profile.invoice_sequence_prefix = prefix
+                profile.invoice_next_number = next_number
+                profile.save()
+                messages.success(request, 'Configuración de secuencia actualizada exitosamente.')
+                return redirect('invoice_sequence_config')
+        except ValueError:
+            messages.error(request, 'El próximo número debe ser un número válido.')
+    
+    context = {
+        'profile': profile,
+        'app_name': 'ERP3',
+        'submenu_items': get_erp3_submenu(request, 'config'),
+    }
+    return render(request, 'tickets/invoice_sequence_config.html', context)
+
+@login_required
+def invoice_add_message(request, pk):
+    """Vista para agregar un mensaje a una factura"""
+    from .models import Invoice, InvoiceMessage
+    
+    invoice = get_object_or_404(Invoice, pk=pk)
+    
+    if request.method == 'POST':
+        message_text = request.POST.get('message', '').strip()
+        if message_text:
+            InvoiceMessage.objects.create(
+                invoice=invoice,
+                user=request.user,
+                message=message_text
+            )
+            messages.success(request, 'Mensaje agregado exitosamente.')
+        else:
+            messages.error(request, 'El mensaje no puede estar vacío.')
+    
+    return redirect('invoice_detail', pk=pk)
+
+@login_required
+def invoice_duplicate(request, pk):
+    """Vista para duplicar una factura existente"""
+    from .models import Invoice, InvoiceLine
+    from .utils import is_agent
+    from django.core.exceptions import PermissionDenied
+    from datetime import date
+    
+    original_invoice = get_object_or_404(Invoice, pk=pk)
+    
+    # Si es agente y no es admin, solo puede duplicar sus propias facturas
+    if is_agent(request.user) and not request.user.is_staff:
+        if original_invoice.created_by != request.user:
+            raise PermissionDenied("No tienes permiso para duplicar esta factura")
+    
+    # Crear nueva factura con los mismos datos
+    new_invoice = Invoice(
+        company=original_invoice.company,
+        invoice_date=date.today(),
+        due_date=original_invoice.due_date,
+        notes=original_invoice.notes,
+        footer_message=original_invoice.footer_message,
+        currency=original_invoice.currency,
+        status='draft',
+        created_by=request.user
+    )
+    new_invoice.save()
+    
+    # Copiar todas las líneas de la factura original
+    original_lines = original_invoice.lines.all()
+    for line in original_lines:
+        InvoiceLine.objects.create(
+            invoice=new_invoice,
+            line_number=line.line_number,
+            product=line.product,
+            description=line.description,
+            quantity=line.quantity,
+            unit_price=line.unit_price,
+            tax_rate=line.tax_rate
+        )
+    
+    messages.success(request, f'Factura duplicada exitosamente. Nueva factura: {new_invoice.sequence}')
+    return redirect('invoice_detail', pk=new_invoice.pk)
@@ -3,13 +3,50 @@ API externa para obtener cotizaciones financieras en tiempo real
 """
 import requests
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
 from decimal import Decimal
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
 import logging
 
 logger = logging.getLogger(__name__)
 
+FOREX_URL = 'https://api.exchangerate-api.com/v4/latest/{base}'
+STOCK_URL = 'https://query1.finance.yahoo.com/v8/finance/chart/{symbol}'
+CRYPTO_URL = 'https://api.coingecko.com/api/v3/simple/price'
+
+FOREX_CURRENCIES = ['USD', 'EUR', 'GBP', 'JPY', 'CAD', 'CHF', 'AUD', 'NZD']
+
+# Símbolos de criptomonedas e IDs de CoinGecko
+CRYPTO_IDS = {
+    'BTC': 'bitcoin',
+    'ETH': 'ethereum',
+    'BNB': 'binancecoin',
+    'XRP': 'ripple',
+    'ADA': 'cardano',
+    'DOGE': 'dogecoin',
+    'MATIC': 'polygon',
+    'SOL': 'solana',
+}
+
+
+def symbol_provider(symbol):
+    """Proveedor de la cotización del símbolo: 'crypto' (BTC/USD), 'forex' (EUR/USD) o 'stock' (AAPL)"""
+    if '/' in symbol:
+        base = symbol.split('/')[0].upper()
+        if base in CRYPTO_IDS:
+            return 'crypto'
+        if any(curr in symbol for curr in FOREX_CURRENCIES):
+            return 'forex'
+    return 'stock'
+
+
 class FinancialDataAPI:
     """Clase para obtener datos financieros de APIs externas"""
     
@@ -23,7 +60,7 @@ class FinancialDataAPI:
         """Obtiene cotización de divisas usando API gratuita"""
         try:
             # Usando API gratuita de exchangerate-api.com
-            url = f"https://api.exchangerate-api.com/v4/latest/{from_currency}"
+            url = FOREX_URL.format(base=from_currency)
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
@@ -70,7 +107,7 @@ class FinancialDataAPI:
         """Obtiene precio de acciones usando Yahoo Finance API"""
         try:
             # Usando API pública de Yahoo Finance
-            url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+            url = STOCK_URL.format(symbol=symbol)
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
@@ -125,8 +162,7 @@ class FinancialDataAPI:
             if not crypto_id:
                 return None
             
-            url = f"https://api.coingecko.com/api/v3/simple/price?ids={crypto_id}&vs_currencies=usd"
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(CRYPTO_URL, params={'ids': crypto_id, 'vs_currencies': 'usd'}, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -141,16 +177,7 @@ class FinancialDataAPI:
     
     def _get_crypto_id(self, symbol):
         """Mapea símbolos de crypto a IDs de CoinGecko"""
-        crypto_map = {
-            'BTC': 'bitcoin',
-            'ETH': 'ethereum',
-            'BNB': 'binancecoin',
-            'XRP': 'ripple',
-            'ADA': 'cardano',
-            'DOGE': 'dogecoin',
-            'MATIC': 'polygon',
-            'SOL': 'solana',
-        }
+        crypto_map = CRYPTO_IDS
         
         # Extraer símbolo de pares como BTC/USD
         if '/' in symbol:
@@ -196,12 +223,13 @@ class FinancialDataAPI:
             new_price = None
             
             # Determinar tipo de activo y obtener precio
-            if '/' in symbol and any(curr in symbol for curr in ['USD', 'EUR', 'GBP', 'JPY', 'CAD', 'CHF', 'AUD', 'NZD']):
+            provider = symbol_provider(symbol)
+            if provider == 'forex':
                 # Es un par de divisas
                 from_curr, to_curr = symbol.split('/')
                 new_price = self.get_forex_rate(from_curr, to_curr)
                 
-            elif '/' in symbol and any(crypto in symbol for crypto in ['BTC', 'ETH', 'BNB', 'XRP', 'ADA', 'DOGE']):
+            elif provider == 'crypto':
                 # Es una criptomoneda
                 new_price = self.get_crypto_price(symbol)
                 
@@ -232,21 +260,253 @@ class FinancialDataAPI:
             return False
 
 
+# =============================================================================
+# ACTUALIZACIÓN CONCURRENTE DE TODAS LAS COTIZACIONES
+# =============================================================================
+#
+# Los símbolos se agrupan por proveedor y se piden con las consultas por lotes
+# que admite cada uno: una petición por moneda base en divisas (la API devuelve
+# todas las tasas de esa base) y una sola petición para todas las
+# criptomonedas. Las acciones se piden una a una. Las peticiones se reparten
+# en un pool de hilos limitado (MARKET_DATA_MAX_WORKERS) y cada proveedor
+# tiene su propio límite de peticiones simultáneas e intervalo mínimo.
+#
+# Las cotizaciones obtenidas se guardan en la caché MARKET_DATA_QUOTE_TTL
+# segundos, y el historial y los precios se escriben con bulk_create y
+# bulk_update en una transacción.
+
+MAX_WORKERS = getattr(settings, 'MARKET_DATA_MAX_WORKERS', 8)
+QUOTE_TTL = getattr(settings, 'MARKET_DATA_QUOTE_TTL', 60)
+
+# Por proveedor: (peticiones simultáneas, segundos mínimos entre peticiones)
+RATE_LIMITS = {
+    'forex': (2, 0.2),
+    'crypto': (1, 1.0),
+    'stock': (4, 0.1),
+}
+RATE_LIMITS.update(getattr(settings, 'MARKET_DATA_RATE_LIMITS', {}))
+
+QUOTE_CACHE_PREFIX = 'market_quote:'
+REFRESH_LOCK_KEY = 'market_data:refresh_lock'
+REFRESH_STATUS_KEY = 'market_data:status'
+REFRESH_LOCK_TIMEOUT = 300
+
+
+class RateLimiter:
+    """Limita las peticiones simultáneas a un proveedor y el intervalo mínimo entre ellas"""
+
+    def __init__(self, max_concurrent, min_interval):
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+        self.min_interval = min_interval
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._semaphore.release()
+
+
+class MarketDataRefresher:
+    """Obtiene las cotizaciones de muchos símbolos a la vez"""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or MAX_WORKERS
+        self.limiters = {
+            provider: RateLimiter(*limits) for provider, limits in RATE_LIMITS.items()
+        }
+        self._local = threading.local()
+        # Precios simulados de respaldo si el proveedor no responde
+        self.fallback = FinancialDataAPI()
+
+    @property
+    def session(self):
+        """Sesión HTTP propia de cada hilo del pool (requests.Session no es segura entre hilos)"""
+        if not hasattr(self._local, 'session'):
+            self._local.session = FinancialDataAPI().session
+        return self._local.session
+
+    def _get_json(self, provider, url, params=None):
+        with self.limiters[provider]:
+            response = self.session.get(url, params=params, timeout=10)
+        if response.status_code != 200:
+            return None
+        return response.json()
+
+    def _fetch_forex(self, base, pairs):
+        """Todas las tasas de una moneda base en una petición"""
+        data = self._get_json('forex', FOREX_URL.format(base=base))
+        rates = (data or {}).get('rates', {})
+        quotes = {}
+        for pair in pairs:
+            target = pair.split('/')[1]
+            if target in rates:
+                quotes[pair] = Decimal(str(rates[target]))
+        return quotes
+
+    def _fetch_crypto(self, symbols):
+        """Todas las criptomonedas en una petición"""
+        ids = {symbol: CRYPTO_IDS[symbol.split('/')[0].upper()] for symbol in symbols}
+        data = self._get_json('crypto', CRYPTO_URL, {
+            'ids': ','.join(sorted(set(ids.values()))),
+            'vs_currencies': 'usd',
+        }) or {}
+        return {
+            symbol: Decimal(str(data[crypto_id]['usd']))
+            for symbol, crypto_id in ids.items()
+            if 'usd' in data.get(crypto_id, {})
+        }
+
+    def _fetch_stock(self, symbol):
+        data = self._get_json('stock', STOCK_URL.format(symbol=symbol)) or {}
+        results = data.get('chart', {}).get('result') or []
+        price = results[0].get('meta', {}).get('regularMarketPrice') if results else None
+        return {symbol: Decimal(str(price))} if price is not None else {}
+
+    def _tasks(self, symbols):
+        """Peticiones a lanzar: ``(función, argumentos)`` agrupadas por proveedor"""
+        forex, crypto = {}, []
+        tasks = []
+        for symbol in symbols:
+            provider = symbol_provider(symbol)
+            if provider == 'forex':
+                forex.setdefault(symbol.split('/')[0], []).append(symbol)
+            elif provider == 'crypto':
+                crypto.append(symbol)
+            else:
+                tasks.append((self._fetch_stock, (symbol,)))
+        tasks += [(self._fetch_forex, (base, pairs)) for base, pairs in forex.items()]
+        if crypto:
+            tasks.append((self._fetch_crypto, (crypto,)))
+        return tasks
+
+    def _fallback_quote(self, symbol):
+        provider = symbol_provider(symbol)
+        if provider == 'forex':
+            return self.fallback._get_forex_fixer(*symbol.split('/'))
+        if provider == 'crypto':
+            return self.fallback._get_crypto_fallback(symbol)
+        return self.fallback._get_stock_fallback(symbol)
+
+    def fetch_quotes(self, symbols):
+        """``{símbolo: precio}`` de los símbolos, usando la caché de cotizaciones recientes"""
+        symbols = list(dict.fromkeys(symbols))
+        cached = cache.get_many([QUOTE_CACHE_PREFIX + symbol for symbol in symbols])
+        quotes = {key[len(QUOTE_CACHE_PREFIX):]: price for key, price in cached.items()}
+        missing = [symbol for symbol in symbols if symbol not in quotes]
+
+        fetched = {}
+        if missing:
+            tasks = self._tasks(missing)
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as pool:
+                futures = [pool.submit(func, *args) for func, args in tasks]
+                for future in as_completed(futures):
+                    try:
+                        fetched.update(future.result())
+                    except Exception as e:
+                        logger.error(f'Error obteniendo cotizaciones: {e}')
+            cache.set_many({QUOTE_CACHE_PREFIX + symbol: price for symbol, price in fetched.items()}, QUOTE_TTL)
+        quotes.update(fetched)
+
+        for symbol in missing:
+            if symbol not in quotes:
+                price = self._fallback_quote(symbol)
+                if price is not None:
+                    quotes[symbol] = price
+        return quotes
+
+
+def save_quotes(quotes):
+    """
+    Guarda los precios nuevos: una fila de historial con el precio anterior de
+    cada acción (``bulk_create``) y el precio del día anterior como
+    ``previous_price`` (una subconsulta para todas). Devuelve cuántas se actualizaron.
+    """
+    from .models import FinancialAction, FinancialPriceHistory
+
+    quotes = {symbol: price for symbol, price in quotes.items() if price is not None and price > 0}
+    if not quotes:
+        return 0
+
+    now = timezone.now()
+    yesterday = now - timedelta(days=1)
+    yesterday_price = (
+        FinancialPriceHistory.objects.filter(
+            financial_action=OuterRef('pk'),
+            recorded_at__range=[yesterday - timedelta(hours=2), yesterday + timedelta(hours=2)],
+        )
+        .order_by('recorded_at').values('price')[:1]
+    )
+    actions = list(
+        FinancialAction.objects.filter(is_active=True, symbol__in=quotes)
+        .annotate(yesterday_price=Subquery(yesterday_price))
+    )
+
+    history = [
+        FinancialPriceHistory(financial_action=action, price=action.current_price, recorded_at=now)
+        for action in actions
+    ]
+    for action in actions:
+        if action.yesterday_price is not None:
+            action.previous_price = action.yesterday_price
+        action.current_price = quotes[action.symbol]
+        action.last_updated = now
+
+    with transaction.atomic():
+        FinancialPriceHistory.objects.bulk_create(history)
+        FinancialAction.objects.bulk_update(actions, ['current_price', 'previous_price', 'last_updated'])
+    return len(actions)
+
+
 def update_all_financial_prices():
     """Función utilitaria para actualizar todos los precios"""
     from .models import FinancialAction
-    
-    api = FinancialDataAPI()
-    updated_count = 0
-    
-    active_actions = FinancialAction.objects.filter(is_active=True)
-    
-    for action in active_actions:
-        if api.update_price(action):
-            updated_count += 1
-        
-        # Pausa pequeña entre llamadas para no saturar las APIs
-        time.sleep(0.5)
-    
-    logger.info(f"Precios actualizados: {updated_count} de {active_actions.count()}")
-    return updated_count
\ No newline at end of file
+
+    start = time.monotonic()
+    symbols = list(FinancialAction.objects.filter(is_active=True).values_list('symbol', flat=True))
+    quotes = MarketDataRefresher().fetch_quotes(symbols) if symbols else {}
+    updated_count = save_quotes(quotes)
+
+    cache.set(REFRESH_STATUS_KEY, {
+        'finished_at': timezone.now().isoformat(),
+        'updated_count': updated_count,
+        'total': len(symbols),
+        'seconds': round(time.monotonic() - start, 2),
+    }, None)
+    logger.info(f"Precios actualizados: {updated_count} de {len(symbols)} ({time.monotonic() - start:.2f}s)")
+    return updated_count
+
+
+def start_price_refresh():
+    """
+    Lanza la actualización de todos los precios en un hilo de fondo. Devuelve
+    ``False`` si ya hay una en curso (en este o en otro proceso).
+    """
+    if not cache.add(REFRESH_LOCK_KEY, True, REFRESH_LOCK_TIMEOUT):
+        return False
+    threading.Thread(target=_refresh_in_background, name='market-data-refresh', daemon=True).start()
+    return True
+
+
+def _refresh_in_background():
+    try:
+        update_all_financial_prices()
+    except Exception as e:
+        logger.error(f'Error actualizando precios financieros: {e}')
+    finally:
+        cache.delete(REFRESH_LOCK_KEY)
+        connection.close()
+
+
+def price_refresh_status():
+    """Estado de la última actualización masiva y si hay una en curso"""
+    status = cache.get(REFRESH_STATUS_KEY) or {}
+    return {'running': cache.get(REFRESH_LOCK_KEY) is not None, **status}
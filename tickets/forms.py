@@ -8459,10 +8459,10 @@ class TicketImportForm(forms.Form):
     
     excel_file = forms.FileField(
         label='Archivo Excel',
-        help_text='Archivo Excel con columnas: Título, Descripción',
+        help_text='Archivo Excel (.xlsx) con columnas: Título, Descripción',
         widget=forms.ClearableFileInput(attrs={
             'class': 'form-control',
-            'accept': '.xlsx,.xls',
+            'accept': '.xlsx',
             'required': True
         })
     )
@@ -8490,26 +8490,30 @@ class TicketImportForm(forms.Form):
     )
     
     priority = forms.ChoiceField(
-        choices=[
-            ('low', 'Baja'),
-            ('normal', 'Normal'),
-            ('high', 'Alta'),
-            ('urgent', 'Urgente')
-        ],
-        initial='normal',
+        choices=Ticket.PRIORITY_CHOICES,
+        initial='medium',
         label='Prioridad',
         help_text='Prioridad que se asignará a todos los tickets',
         widget=forms.Select(attrs={
             'class': 'form-select'
         })
     )
+    
+    dry_run = forms.BooleanField(
+        required=False,
+        label='Solo validar',
+        help_text='Comprueba todas las filas y muestra los errores sin crear ningún ticket',
+        widget=forms.CheckboxInput(attrs={
+            'class': 'form-check-input'
+        })
+    )
 
     def clean_excel_file(self):
         file = self.cleaned_data.get('excel_file')
         if file:
-            # Validar extensión
-            if not file.name.lower().endswith(('.xlsx', '.xls')):
-                raise forms.ValidationError('Solo se permiten archivos Excel (.xlsx, .xls)')
+            # Validar extensión (el importador lee .xlsx en streaming con openpyxl)
+            if not file.name.lower().endswith('.xlsx'):
+                raise forms.ValidationError('Solo se permiten archivos Excel (.xlsx)')
             
             # Validar tamaño (max 5MB)
             if file.size > 5 * 1024 * 1024:
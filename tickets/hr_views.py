@@ -0,0 +1,5496 @@
+"""
+Vistas de recursos humanos: control horario, empleados, ausencias, acuerdos y gastos.
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib.auth.models import User
+from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.db import models
+from django.http import JsonResponse
+from django.utils import timezone
+from datetime import datetime
+from .models import (
+    Ticket, UserProfile, TimeEntry, PublicTimeAccess, Project, SystemConfiguration, Opportunity,
+    Contact, Employee, JobApplicationToken, EmployeePayroll, Agreement, AgreementSignature,
+    AIManagerMeeting, ExpenseReport, ExpenseItem, ExpenseFund,
+)
+from .forms import (
+    TimeEntryStartForm, TimeEntryEndForm, TimeEntryEditForm, PublicTimeEntryForm,
+    EmployeeHiringOpinionForm, EmployeePayrollForm, AgreementForm, AgreementSignatureForm,
+    AgreementPublicForm, ExpenseReportForm, ExpenseItemForm, ExpenseCommentForm,
+    ExpenseReportFilterForm, ExpenseFundForm, AbsenceTypeForm,
+)
+from .utils import get_client_ip, is_agent
+
+
+# =======================================
+# VISTAS PARA CONTROL DE HORARIO
+# =======================================
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def time_clock_view(request):
+    """Vista principal del control de horario para agentes"""
+    
+    # Obtener registro activo del usuario
+    active_entry = TimeEntry.get_active_entry_for_agent(request.user)
+    
+    # Obtener registros recientes (última semana)
+    from datetime import timedelta
+    # Calcular el inicio de la semana actual (lunes)
+    now = timezone.now()
+    start_week = now - timedelta(days=now.weekday())
+    start_week = start_week.replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    recent_entries = TimeEntry.objects.filter(
+        user=request.user,
+        fecha_entrada__gte=start_week
+    ).order_by('-fecha_entrada')[:10]
+    
+    # Calcular estadísticas de la semana actual
+    week_entries = TimeEntry.objects.filter(
+        user=request.user,
+        fecha_entrada__gte=start_week,
+        fecha_salida__isnull=False  # Solo entradas completadas
+    )
+    total_minutos = sum(entry.duracion_trabajada for entry in week_entries)
+    total_horas = round(total_minutos / 60, 2)
+    
+    # Obtener acceso público si existe
+    public_access = None
+    try:
+        public_access = PublicTimeAccess.objects.get(user=request.user)
+    except PublicTimeAccess.DoesNotExist:
+        pass
+    
+    context = {
+        'active_entry': active_entry,
+        'recent_entries': recent_entries,
+        'total_horas_semana': total_horas,
+        'can_start': not active_entry,
+        'can_end': bool(active_entry),
+        'public_access': public_access,
+        'page_title': 'Control de Horario'
+    }
+    
+    return render(request, 'tickets/time_clock.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def time_start_work(request):
+    """Iniciar jornada laboral"""
+    
+    # Verificar que no hay una jornada activa
+    active_entry = TimeEntry.get_active_entry_for_agent(request.user)
+    if active_entry:
+        messages.warning(request, 'Ya tienes una jornada activa desde las ' + 
+                        active_entry.fecha_entrada.strftime('%H:%M'))
+        return redirect('time_clock')
+    
+    if request.method == 'POST':
+        form = TimeEntryStartForm(request.POST, user=request.user)
+        if form.is_valid():
+            try:
+                project = form.cleaned_data.get('project')
+                ticket = form.cleaned_data.get('ticket')
+                work_order = form.cleaned_data.get('work_order')
+                task = form.cleaned_data.get('task')
+                notas = form.cleaned_data.get('notas_entrada', '')
+                
+                entry = TimeEntry.create_entry(
+                    user=request.user,
+                    project=project,
+                    ticket=ticket,
+                    work_order=work_order,
+                    task=task,
+                    notas_entrada=notas
+                )
+                
+                # Mensaje personalizado según los elementos seleccionados
+                message_parts = [f'¡Jornada iniciada a las {entry.fecha_entrada.strftime("%H:%M")}']
+                if project:
+                    message_parts.append(f'en el proyecto "{project.name}"')
+                if ticket:
+                    message_parts.append(f'trabajando en el ticket "{ticket.ticket_number}"')
+                if work_order:
+                    message_parts.append(f'en la orden "{work_order.order_number}"')
+                if task:
+                    message_parts.append(f'en la tarea "{task.title}"')
+                
+                message = ' '.join(message_parts) + '!'
+                messages.success(request, message)
+                    
+                return redirect('time_clock')
+            except ValueError as e:
+                messages.error(request, str(e))
+                return redirect('time_clock')
+    else:
+        form = TimeEntryStartForm(user=request.user)
+    
+    context = {
+        'form': form,
+        'page_title': 'Iniciar Jornada'
+    }
+    return render(request, 'tickets/time_start.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def time_end_work(request):
+    """Finalizar jornada laboral"""
+    
+    # Verificar que hay una jornada activa
+    active_entry = TimeEntry.get_active_entry_for_agent(request.user)
+    if not active_entry:
+        messages.error(request, 'No tienes una jornada activa para finalizar.')
+        return redirect('time_clock')
+    
+    if request.method == 'POST':
+        form = TimeEntryEndForm(request.POST)
+        if form.is_valid():
+            try:
+                notas_salida = form.cleaned_data.get('notas_salida', '')
+                end_reason = form.cleaned_data.get('end_reason')
+                
+                # Actualizar el campo end_reason antes de finalizar
+                active_entry.end_reason = end_reason
+                active_entry.finalizar_jornada(notas_salida)
+                
+                duracion = active_entry.duracion_formateada
+                reason_display = dict(form.fields['end_reason'].choices)[end_reason]
+                messages.success(request, 
+                    f'¡Jornada finalizada! Duración total: {duracion} horas. Causa: {reason_display}')
+                return redirect('time_clock')
+            except ValueError as e:
+                messages.error(request, str(e))
+                return redirect('time_clock')
+    else:
+        form = TimeEntryEndForm()
+    
+    context = {
+        'form': form,
+        'active_entry': active_entry,
+        'page_title': 'Finalizar Jornada'
+    }
+    return render(request, 'tickets/time_end.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def time_entries_list(request):
+    """Lista de registros de horario del empleado"""
+    
+    # Filtros
+    fecha_desde = request.GET.get('fecha_desde')
+    fecha_hasta = request.GET.get('fecha_hasta')
+    
+    # Base queryset - solo registros del usuario actual
+    entries = TimeEntry.objects.filter(user=request.user)
+    
+    # Aplicar filtros de fecha
+    if fecha_desde:
+        try:
+            from datetime import datetime
+            fecha_desde_dt = datetime.strptime(fecha_desde, '%Y-%m-%d').date()
+            entries = entries.filter(fecha_entrada__date__gte=fecha_desde_dt)
+        except ValueError:
+            messages.warning(request, 'Formato de fecha inválido')
+    
+    if fecha_hasta:
+        try:
+            from datetime import datetime
+            fecha_hasta_dt = datetime.strptime(fecha_hasta, '%Y-%m-%d').date()
+            entries = entries.filter(fecha_entrada__date__lte=fecha_hasta_dt)
+        except ValueError:
+            messages.warning(request, 'Formato de fecha inválido')
+    
+    # Ordenar por fecha descendente
+    entries = entries.order_by('-fecha_entrada')
+    
+    # Paginación
+    paginator = Paginator(entries, 20)  # 20 registros por página
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Calcular totales
+    if page_obj.object_list:
+        total_minutos = sum(entry.duracion_trabajada for entry in entries if entry.fecha_salida)
+        total_horas = round(total_minutos / 60, 2)
+        total_dias = entries.filter(fecha_salida__isnull=False).count()
+    else:
+        total_horas = 0
+        total_dias = 0
+    
+    context = {
+        'page_obj': page_obj,
+        'fecha_desde': fecha_desde,
+        'fecha_hasta': fecha_hasta,
+        'total_horas': total_horas,
+        'total_dias': total_dias,
+        'page_title': 'Mis Registros de Horario'
+    }
+    
+    return render(request, 'tickets/time_entries_list.html', context)
+
+
+@login_required
+def time_entries_export_excel(request):
+    """Exportar registros de horario a Excel"""
+    
+    # Aplicar los mismos filtros que en la lista
+    fecha_desde = request.GET.get('fecha_desde')
+    fecha_hasta = request.GET.get('fecha_hasta')
+    
+    # Base queryset - solo registros del usuario actual
+    entries = TimeEntry.objects.filter(user=request.user)
+    
+    # Aplicar filtros de fecha
+    if fecha_desde:
+        try:
+            from datetime import datetime
+            fecha_desde_dt = datetime.strptime(fecha_desde, '%Y-%m-%d').date()
+            entries = entries.filter(fecha_entrada__date__gte=fecha_desde_dt)
+        except ValueError:
+            pass
+    
+    if fecha_hasta:
+        try:
+            from datetime import datetime
+            fecha_hasta_dt = datetime.strptime(fecha_hasta, '%Y-%m-%d').date()
+            entries = entries.filter(fecha_entrada__date__lte=fecha_hasta_dt)
+        except ValueError:
+            pass
+    
+    # Ordenar por fecha descendente
+    entries = entries.order_by('-fecha_entrada')
+    
+    # Crear el archivo Excel
+    import openpyxl
+    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+    from django.http import HttpResponse
+    from io import BytesIO
+    
+    # Crear workbook y worksheet
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Registros de Horario"
+    
+    # Definir estilos
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="2F5597", end_color="2F5597", fill_type="solid")
+    header_alignment = Alignment(horizontal="center", vertical="center")
+    
+    border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    
+    # Encabezados
+    headers = [
+        'Fecha',
+        'Hora Entrada',
+        'Hora Salida', 
+        'Duración',
+        'Estado',
+        'Notas',
+        'Proyecto',
+        'Ticket',
+        'Orden de Trabajo',
+        'Tarea'
+    ]
+    
+    # Escribir encabezados
+    for col, header in enumerate(headers, 1):
+        cell = ws.cell(row=1, column=col, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+        cell.border = border
+    
+    # Escribir datos
+    for row, entry in enumerate(entries, 2):
+        # Fecha
+        ws.cell(row=row, column=1, value=entry.fecha_entrada.strftime('%d/%m/%Y')).border = border
+        
+        # Hora entrada
+        ws.cell(row=row, column=2, value=entry.fecha_entrada.strftime('%H:%M')).border = border
+        
+        # Hora salida
+        salida_str = entry.fecha_salida.strftime('%H:%M') if entry.fecha_salida else 'En curso'
+        ws.cell(row=row, column=3, value=salida_str).border = border
+        
+        # Duración
+        if entry.fecha_salida:
+            duracion_str = entry.duracion_formateada
+        else:
+            duracion_str = 'En curso'
+        ws.cell(row=row, column=4, value=duracion_str).border = border
+        
+        # Estado
+        estado = 'Finalizada' if entry.fecha_salida else 'Activa'
+        ws.cell(row=row, column=5, value=estado).border = border
+        
+        # Notas
+        ws.cell(row=row, column=6, value=entry.notas or '').border = border
+        
+        # Proyecto
+        proyecto_str = str(entry.project) if entry.project else ''
+        ws.cell(row=row, column=7, value=proyecto_str).border = border
+        
+        # Ticket
+        ticket_str = f"#{entry.ticket.id} - {entry.ticket.title}" if entry.ticket else ''
+        ws.cell(row=row, column=8, value=ticket_str).border = border
+        
+        # Orden de trabajo
+        wo_str = f"#{entry.work_order.id} - {entry.work_order.title}" if entry.work_order else ''
+        ws.cell(row=row, column=9, value=wo_str).border = border
+        
+        # Tarea
+        task_str = f"{entry.task.title}" if entry.task else ''
+        ws.cell(row=row, column=10, value=task_str).border = border
+    
+    # Ajustar ancho de columnas
+    column_widths = [12, 12, 12, 12, 12, 30, 25, 30, 30, 25]
+    for col, width in enumerate(column_widths, 1):
+        ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
+    
+    # Agregar fila de totales si hay datos
+    if entries.exists():
+        total_row = len(list(entries)) + 3
+        
+        # Etiquetas de totales
+        ws.cell(row=total_row, column=1, value="TOTALES:").font = Font(bold=True)
+        
+        # Calcular totales
+        total_minutos = sum(entry.duracion_trabajada for entry in entries if entry.fecha_salida)
+        total_horas = round(total_minutos / 60, 2)
+        total_dias = entries.filter(fecha_salida__isnull=False).count()
+        
+        ws.cell(row=total_row, column=4, value=f"{total_horas}h").font = Font(bold=True)
+        ws.cell(row=total_row + 1, column=1, value="Días trabajados:").font = Font(bold=True)
+        ws.cell(row=total_row + 1, column=4, value=total_dias).font = Font(bold=True)
+    
+    # Preparar respuesta HTTP
+    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+    
+    # Generar nombre de archivo
+    usuario = request.user.get_full_name() or request.user.username
+    fecha_actual = timezone.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"registros_horario_{usuario.replace(' ', '_')}_{fecha_actual}.xlsx"
+    
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    
+    # Guardar workbook en response
+    wb.save(response)
+    
+    return response
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def time_entry_detail(request, entry_id):
+    """Vista detallada de un registro de horario"""
+    
+    entry = get_object_or_404(TimeEntry, id=entry_id)
+    
+    # Verificar permisos - solo el propietario puede ver sus registros
+    if not entry.can_view(request.user):
+        messages.error(request, 'No tienes permisos para ver este registro.')
+        return redirect('time_entries_list')
+    
+    context = {
+        'entry': entry,
+        'page_title': f'Registro del {entry.fecha_entrada.strftime("%d/%m/%Y")}'
+    }
+    
+    return render(request, 'tickets/time_entry_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def time_entry_edit(request, entry_id):
+    """Editar un registro de horario incluyendo entrada y salida"""
+    
+    entry = get_object_or_404(TimeEntry, id=entry_id)
+    
+    # Verificar permisos
+    if not entry.can_edit(request.user):
+        messages.error(request, 'No tienes permisos para editar este registro.')
+        return redirect('time_entry_detail', entry_id=entry.id)
+    
+    if request.method == 'POST':
+        form = TimeEntryEditForm(request.POST, instance=entry, user=request.user)
+        if form.is_valid():
+            # Establecer el usuario para el log de auditoría
+            form._user = request.user
+            form.save()
+            messages.success(request, 'Registro actualizado exitosamente.')
+            return redirect('time_entry_detail', entry_id=entry.id)
+    else:
+        form = TimeEntryEditForm(instance=entry, user=request.user)
+    
+    # Obtener logs de auditoría para mostrar historial
+    audit_logs = entry.audit_logs.all()[:10]  # Últimos 10 cambios
+    
+    context = {
+        'form': form,
+        'entry': entry,
+        'audit_logs': audit_logs,
+        'page_title': f'Editar Registro del {entry.fecha_entrada.strftime("%d/%m/%Y")}'
+    }
+    
+    return render(request, 'tickets/time_entry_edit.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def time_entry_audit_log(request, entry_id):
+    """Ver historial completo de auditoría de un registro de tiempo"""
+    
+    entry = get_object_or_404(TimeEntry, id=entry_id)
+    
+    # Verificar permisos
+    if not entry.can_view(request.user):
+        messages.error(request, 'No tienes permisos para ver este registro.')
+        return redirect('time_entries_list')
+    
+    # Obtener todos los logs de auditoría
+    audit_logs = entry.audit_logs.all()
+    
+    context = {
+        'entry': entry,
+        'audit_logs': audit_logs,
+        'page_title': f'Historial de Cambios - Registro del {entry.fecha_entrada.strftime("%d/%m/%Y")}'
+    }
+    
+    return render(request, 'tickets/time_entry_audit_log.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def ajax_current_time_status(request):
+    """API AJAX para obtener el estado actual del tiempo trabajado"""
+    
+    active_entry = TimeEntry.get_active_entry_for_agent(request.user)
+    
+    if active_entry:
+        return JsonResponse({
+            'is_working': True,
+            'start_time': active_entry.fecha_entrada.strftime('%H:%M'),
+            'duration': active_entry.duracion_formateada,
+            'minutes_worked': active_entry.duracion_trabajada
+        })
+    else:
+        return JsonResponse({
+            'is_working': False,
+            'start_time': None,
+            'duration': '00:00',
+            'minutes_worked': 0
+        })
+
+
+# ===========================================
+# VISTAS PÚBLICAS DE CONTROL DE HORARIO
+# ===========================================
+
+def public_time_clock(request, token):
+    """Vista pública para control de horario usando token"""
+    
+    # Buscar el acceso público por token
+    try:
+        public_access = PublicTimeAccess.objects.get(token=token, is_active=True)
+    except PublicTimeAccess.DoesNotExist:
+        return render(request, 'tickets/public_time_error.html', {
+            'error_title': 'Token no válido',
+            'error_message': 'El enlace que estás usando no es válido o ha expirado.'
+        }, status=404)
+    
+    # Verificar IP permitida (si está configurado)
+    client_ip = get_client_ip(request)
+    if not public_access.is_ip_allowed(client_ip):
+        return render(request, 'tickets/public_time_error.html', {
+            'error_title': 'Acceso no autorizado',
+            'error_message': 'Tu dirección IP no está autorizada para usar este enlace.'
+        }, status=403)
+    
+    user = public_access.user
+    
+    # Obtener estado actual del usuario
+    active_entry = TimeEntry.get_active_entry(user)
+    
+    # Procesar formulario
+    if request.method == 'POST':
+        form = PublicTimeEntryForm(request.POST, public_access=public_access)
+        if form.is_valid():
+            action = form.cleaned_data['action']
+            notes = form.cleaned_data.get('notes', '')
+            latitude = form.cleaned_data.get('latitude')
+            longitude = form.cleaned_data.get('longitude')
+            
+            try:
+                if action == 'entrada':
+                    # Verificar que no haya una jornada activa
+                    if active_entry:
+                        return render(request, 'tickets/public_time_error.html', {
+                            'error_title': 'Ya tienes una jornada activa',
+                            'error_message': f'Tu jornada comenzó a las {active_entry.fecha_entrada.strftime("%H:%M")}. Debes registrar la salida primero.',
+                            'token': token
+                        })
+                    
+                    # Crear nueva entrada (solo hora de entrada) usando método público
+                    entry = TimeEntry.create_public_entry(
+                        user=user,
+                        notas_entrada=notes
+                    )
+                    
+                    # Guardar ubicación si se proporcionó
+                    if latitude and longitude:
+                        entry.ubicacion_entrada = f"{latitude},{longitude}"
+                        entry.save()
+                    
+                    # Actualizar último uso
+                    public_access.update_last_used()
+                    
+                    return render(request, 'tickets/public_time_success.html', {
+                        'action': 'entrada',
+                        'time': entry.fecha_entrada.strftime('%H:%M'),
+                        'user': user,
+                        'notes': notes,
+                        'token': token
+                    })
+                
+                elif action == 'salida':
+                    # Verificar que haya una jornada activa
+                    if not active_entry:
+                        return render(request, 'tickets/public_time_error.html', {
+                            'error_title': 'No hay jornada activa',
+                            'error_message': 'No tienes una jornada activa para finalizar. Registra tu entrada primero.',
+                            'token': token
+                        })
+                    
+                    # Actualizar la entrada existente con la hora de salida
+                    active_entry.finalizar_jornada(notes)
+                    
+                    # Guardar ubicación de salida si se proporcionó
+                    if latitude and longitude:
+                        active_entry.ubicacion_salida = f"{latitude},{longitude}"
+                        active_entry.save()
+                    
+                    # Actualizar último uso
+                    public_access.update_last_used()
+                    
+                    return render(request, 'tickets/public_time_success.html', {
+                        'action': 'salida',
+                        'time': active_entry.fecha_salida.strftime('%H:%M'),
+                        'duration': active_entry.duracion_formateada,
+                        'user': user,
+                        'notes': notes,
+                        'token': token
+                    })
+                    
+            except Exception as e:
+                return render(request, 'tickets/public_time_error.html', {
+                    'error_title': 'Error al procesar',
+                    'error_message': f'Ocurrió un error: {str(e)}',
+                    'token': token
+                })
+    else:
+        form = PublicTimeEntryForm(public_access=public_access)
+    
+    # Estadísticas del día
+    from datetime import date
+    today = date.today()
+    today_entries = TimeEntry.objects.filter(
+        user=user,
+        fecha_entrada__date=today
+    ).order_by('-fecha_entrada')
+    
+    context = {
+        'user': user,
+        'active_entry': active_entry,
+        'public_access': public_access,
+        'form': form,
+        'today_entries': today_entries,
+        'token': token,
+        'require_location': public_access.require_location,
+    }
+    
+    return render(request, 'tickets/public_time_clock.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def public_time_access_list(request):
+    """Vista para listar y gestionar accesos públicos de control de horario (solo agentes)"""
+    
+    access_list = PublicTimeAccess.objects.select_related('user').order_by('-created_at')
+    
+    # Búsqueda
+    search = request.GET.get('search')
+    if search:
+        access_list = access_list.filter(
+            Q(user__username__icontains=search) |
+            Q(user__first_name__icontains=search) |
+            Q(user__last_name__icontains=search) |
+            Q(user__email__icontains=search)
+        )
+    
+    # Filtro por estado
+    status = request.GET.get('status')
+    if status == 'active':
+        access_list = access_list.filter(is_active=True)
+    elif status == 'inactive':
+        access_list = access_list.filter(is_active=False)
+    
+    # Paginación
+    paginator = Paginator(access_list, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'page_obj': page_obj,
+        'search': search,
+        'status': status,
+        'page_title': 'Gestión de Accesos Públicos de Horario'
+    }
+    
+    return render(request, 'tickets/public_time_access_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def public_time_access_create(request, user_id):
+    """Crear acceso público para un usuario específico"""
+    
+    user = get_object_or_404(User, id=user_id)
+    
+    # Verificar si ya existe un acceso para este usuario
+    if hasattr(user, 'public_time_access'):
+        messages.warning(request, f'{user.get_full_name() or user.username} ya tiene un acceso público configurado.')
+        return redirect('public_time_access_list')
+    
+    if request.method == 'POST':
+        form = PublicTimeAccessForm(request.POST)
+        if form.is_valid():
+            access = form.save(commit=False)
+            access.user = user
+            access.save()
+            
+            messages.success(request, f'Acceso público creado para {user.get_full_name() or user.username}')
+            return redirect('public_time_access_list')
+    else:
+        form = PublicTimeAccessForm()
+    
+    context = {
+        'form': form,
+        'user': user,
+        'page_title': f'Crear Acceso Público para {user.get_full_name() or user.username}'
+    }
+    
+    return render(request, 'tickets/public_time_access_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def public_time_access_edit(request, access_id):
+    """Editar acceso público existente"""
+    
+    access = get_object_or_404(PublicTimeAccess, id=access_id)
+    
+    if request.method == 'POST':
+        form = PublicTimeAccessForm(request.POST, instance=access)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Acceso público actualizado para {access.user.get_full_name() or access.user.username}')
+            return redirect('public_time_access_list')
+    else:
+        form = PublicTimeAccessForm(instance=access)
+    
+    context = {
+        'form': form,
+        'access': access,
+        'page_title': f'Editar Acceso Público - {access.user.get_full_name() or access.user.username}'
+    }
+    
+    return render(request, 'tickets/public_time_access_form.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def public_time_access_delete(request, access_id):
+    """Eliminar acceso público"""
+    
+    access = get_object_or_404(PublicTimeAccess, id=access_id)
+    
+    if request.method == 'POST':
+        user_name = access.user.get_full_name() or access.user.username
+        access.delete()
+        messages.success(request, f'Acceso público eliminado para {user_name}')
+        return redirect('public_time_access_list')
+    
+    context = {
+        'access': access,
+        'page_title': 'Confirmar Eliminación'
+    }
+    
+    return render(request, 'tickets/public_time_access_delete.html', context)
+
+
+@login_required
+@user_passes_test(is_agent, login_url='dashboard')
+def attendance_overview(request):
+    """Vista para que los agentes vean la asistencia de todos los empleados"""
+    from django.db.models import Q
+    from datetime import datetime, timedelta
+    
+    # Filtros de fecha
+    fecha_desde = request.GET.get('fecha_desde')
+    fecha_hasta = request.GET.get('fecha_hasta')
+    proyecto_id = request.GET.get('proyecto')
+    usuario_id = request.GET.get('usuario')
+    
+    # Si no hay fechas, mostrar los últimos 7 días
+    if not fecha_desde:
+        fecha_desde = (timezone.now() - timedelta(days=7)).date()
+    else:
+        fecha_desde = datetime.strptime(fecha_desde, '%Y-%m-%d').date()
+    
+    if not fecha_hasta:
+        fecha_hasta = timezone.now().date()
+    else:
+        fecha_hasta = datetime.strptime(fecha_hasta, '%Y-%m-%d').date()
+    
+    # Base queryset
+    queryset = TimeEntry.objects.select_related('user', 'project').filter(
+        fecha_entrada__date__gte=fecha_desde,
+        fecha_entrada__date__lte=fecha_hasta
+    ).order_by('-fecha_entrada')
+    
+    # Filtro por proyecto
+    if proyecto_id:
+        queryset = queryset.filter(project_id=proyecto_id)
+    
+    # Filtro por usuario
+    if usuario_id:
+        queryset = queryset.filter(user_id=usuario_id)
+    
+    # Obtener estadísticas
+    total_entries = queryset.count()
+    active_entries = queryset.filter(fecha_salida__isnull=True).count()
+    
+    # Calcular total de horas y promedio
+    total_hours = 0
+    completed_entries = 0
+    completed_hours = 0
+    
+    for entry in queryset:
+        if entry.fecha_salida:
+            # Jornada completada
+            duration = (entry.fecha_salida - entry.fecha_entrada).total_seconds()
+            completed_hours += duration
+            completed_entries += 1
+        else:
+            # Jornada activa - solo para el total
+            duration = (timezone.now() - entry.fecha_entrada).total_seconds()
+        
+        total_hours += duration
+    
+    total_hours = round(total_hours / 3600, 2)
+    
+    # Calcular promedio por jornada (solo jornadas completadas)
+    if completed_entries > 0:
+        avg_hours_per_session = round(completed_hours / 3600 / completed_entries, 2)
+    else:
+        avg_hours_per_session = 0
+    
+    # Paginación
+    paginator = Paginator(queryset, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Datos para filtros
+    proyectos = Project.objects.filter(is_active=True).order_by('name')
+    usuarios = User.objects.filter(
+        groups__name='Agentes'
+    ).order_by('first_name', 'username')
+    
+    context = {
+        'page_title': 'Control de Asistencia General',
+        'page_obj': page_obj,
+        'total_entries': total_entries,
+        'active_entries': active_entries,
+        'total_hours': total_hours,
+        'avg_hours_per_session': avg_hours_per_session,
+        'fecha_desde': fecha_desde.strftime('%Y-%m-%d'),
+        'fecha_hasta': fecha_hasta.strftime('%Y-%m-%d'),
+        'proyectos': proyectos,
+        'usuarios': usuarios,
+        'proyecto_seleccionado': proyecto_id,
+        'usuario_seleccionado': usuario_id,
+    }
+    
+    return render(request, 'tickets/attendance_overview.html', context)
+
+
+# =============================================================================
+# VISTAS DE EMPLEADOS Y APLICACIONES DE TRABAJO
+# =============================================================================
+
+@login_required
+def employee_list(request):
+    """Lista de empleados"""
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    # Filtrar por empresa del usuario
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company:
+        employees = Employee.objects.filter(company=user_profile.company).order_by('-created_at')
+    else:
+        employees = Employee.objects.all().order_by('-created_at')
+    
+    # Filtros
+    status_filter = request.GET.get('status')
+    search = request.GET.get('search')
+    
+    if status_filter:
+        employees = employees.filter(status=status_filter)
+    
+    if search:
+        employees = employees.filter(
+            Q(first_name__icontains=search) |
+            Q(last_name__icontains=search) |
+            Q(email__icontains=search) |
+            Q(position__icontains=search)
+        )
+    
+    # Paginación
+    paginator = Paginator(employees, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'page_obj': page_obj,
+        'status_choices': Employee.STATUS_CHOICES,
+        'current_status': status_filter,
+        'search': search,
+        'page_title': 'Gestión de Empleados'
+    }
+    
+    return render(request, 'tickets/employee_list.html', context)
+
+
+@login_required
+def employee_detail(request, pk):
+    """Detalle de un empleado"""
+    employee = get_object_or_404(Employee, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('employee_list')
+    
+    # Verificar que el usuario puede ver este empleado (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and employee.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para ver este empleado.')
+        return redirect('employee_list')
+    
+    if request.method == 'POST' and 'analyze_ai' in request.POST:
+        # Obtener configuración del sistema
+        config = SystemConfiguration.objects.first()
+        if not config or not config.openai_api_key:
+            messages.error(request, 'La configuración de IA no está disponible. Contacta al administrador.')
+            return redirect('employee_detail', pk=pk)
+            
+        # Preparar datos para IA
+        datos = f"Nombre: {employee.get_full_name()}\nEmail: {employee.email}\nTeléfono: {employee.phone}\nCargo: {employee.position}"
+        if employee.salary_euros:
+            datos += f"\nSalario propuesto: €{employee.salary_euros}"
+        if employee.description:
+            datos += f"\nDescripción/Experiencia: {employee.description}"
+        if employee.resume_file:
+            datos += f"\nCurrículo adjunto: {employee.resume_file.name}"
+            
+        # Usar el prompt personalizado de la configuración
+        prompt = config.ai_employee_analysis_prompt.format(datos=datos)
+        
+        # Llamada a OpenAI
+        try:
+            from openai import OpenAI
+            
+            client = OpenAI(api_key=config.openai_api_key)
+            
+            response = client.chat.completions.create(
+                model=config.openai_model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=500,
+                temperature=0.7
+            )
+            
+            texto = response.choices[0].message.content.strip()
+            resumen = ""
+            puntuacion = None
+            
+            # Extraer resumen y puntuación
+            import re
+            resumen_match = re.search(r"Resumen:\s*(.*?)(?=Puntuación:|$)", texto, re.DOTALL)
+            puntuacion_match = re.search(r"Puntuación:\s*(\d+)", texto)
+            
+            if resumen_match:
+                resumen = resumen_match.group(1).strip()
+            else:
+                # Si no encuentra el formato esperado, usar todo el texto
+                resumen = texto
+                
+            if puntuacion_match:
+                puntuacion = int(puntuacion_match.group(1))
+                # Validar que la puntuación esté entre 1 y 10
+                if puntuacion < 1 or puntuacion > 10:
+                    puntuacion = None
+                    
+            # Guardar resultados
+            employee.ai_analysis = resumen if resumen else texto
+            employee.ai_score = puntuacion
+            employee.save()
+            
+            messages.success(request, "Análisis de IA completado y guardado correctamente.")
+            
+        except Exception as e:
+            messages.error(request, f"Error al analizar con IA: {str(e)}")
+            
+        return redirect('employee_detail', pk=pk)
+    context = {
+        'employee': employee,
+        'page_title': f'Empleado: {employee.get_full_name()}',
+        'config': SystemConfiguration.objects.first()
+    }
+    return render(request, 'tickets/employee_detail.html', context)
+
+
+@login_required
+def employee_change_status(request, pk):
+    """Cambiar el estado de un empleado"""
+    employee = get_object_or_404(Employee, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('employee_list')
+    
+    # Verificar que el usuario puede modificar este empleado (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and employee.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para modificar este empleado.')
+        return redirect('employee_list')
+    
+    if request.method == 'POST':
+        new_status = request.POST.get('status')
+        if new_status in ['candidate', 'in_process', 'employee', 'not_employee']:
+            employee.status = new_status
+            employee.save()
+            messages.success(request, f'Estado actualizado a {employee.get_status_display()}')
+            return redirect('employee_detail', pk=pk)
+        else:
+            messages.error(request, 'Estado no válido.')
+    
+    return redirect('employee_detail', pk=pk)
+
+
+@login_required
+def employee_edit_hiring_opinion(request, pk):
+    """Editar opinión de reunión de contratación"""
+    employee = get_object_or_404(Employee, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('employee_list')
+    
+    # Verificar que el usuario puede modificar este empleado (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and employee.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para modificar este empleado.')
+        return redirect('employee_list')
+    
+    if request.method == 'POST':
+        form = EmployeeHiringOpinionForm(request.POST, instance=employee)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Opinión de reunión actualizada correctamente.')
+            
+            # Redirigir según el tipo de empleado
+            if employee.status in ['candidate', 'in_process']:
+                return redirect('candidate_detail', pk=pk)
+            else:
+                return redirect('active_employee_detail', pk=pk)
+        else:
+            messages.error(request, 'Por favor, corrige los errores en el formulario.')
+    else:
+        form = EmployeeHiringOpinionForm(instance=employee)
+    
+    context = {
+        'form': form,
+        'employee': employee,
+        'page_title': f'Editar Opinión de Reunión - {employee.get_full_name()}',
+    }
+    
+    return render(request, 'tickets/employee_edit_hiring_opinion.html', context)
+
+
+@login_required
+def employee_payroll_list(request, pk):
+    """Lista de nóminas de un empleado"""
+    employee = get_object_or_404(Employee, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('employee_list')
+    
+    # Verificar que el usuario puede ver este empleado (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and employee.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para ver este empleado.')
+        return redirect('employee_list')
+    
+    # Obtener nóminas del empleado
+    payrolls = employee.payrolls.all().order_by('-period_year', '-period_month')
+    
+    context = {
+        'employee': employee,
+        'payrolls': payrolls,
+        'page_title': f'Nóminas - {employee.get_full_name()}',
+    }
+    
+    return render(request, 'tickets/employee_payroll_list.html', context)
+
+
+@login_required
+def employee_payroll_create(request, pk):
+    """Agregar nueva nómina a un empleado"""
+    employee = get_object_or_404(Employee, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('employee_list')
+    
+    # Verificar que el usuario puede modificar este empleado (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and employee.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para modificar este empleado.')
+        return redirect('employee_list')
+    
+    if request.method == 'POST':
+        form = EmployeePayrollForm(request.POST, request.FILES)
+        if form.is_valid():
+            payroll = form.save(commit=False)
+            payroll.employee = employee
+            payroll.created_by = request.user
+            try:
+                payroll.save()
+                messages.success(request, f'Nómina de {payroll.get_period_display()} agregada correctamente.')
+                return redirect('employee_payroll_list', pk=employee.pk)
+            except Exception as e:
+                if 'UNIQUE constraint failed' in str(e) or 'unique_together' in str(e):
+                    messages.error(request, f'Ya existe una nómina para {payroll.get_period_display()}.')
+                else:
+                    messages.error(request, f'Error al guardar la nómina: {str(e)}')
+        else:
+            messages.error(request, 'Por favor, corrige los errores en el formulario.')
+    else:
+        form = EmployeePayrollForm()
+    
+    context = {
+        'form': form,
+        'employee': employee,
+        'page_title': f'Nueva Nómina - {employee.get_full_name()}',
+    }
+    
+    return render(request, 'tickets/employee_payroll_form.html', context)
+
+
+@login_required
+def employee_payroll_detail(request, employee_pk, payroll_pk):
+    """Ver detalles de una nómina específica"""
+    employee = get_object_or_404(Employee, pk=employee_pk)
+    payroll = get_object_or_404(EmployeePayroll, pk=payroll_pk, employee=employee)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('employee_list')
+    
+    # Verificar que el usuario puede ver este empleado (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and employee.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para ver este empleado.')
+        return redirect('employee_list')
+    
+    context = {
+        'employee': employee,
+        'payroll': payroll,
+        'page_title': f'Nómina {payroll.get_period_display()} - {employee.get_full_name()}',
+    }
+    
+    return render(request, 'tickets/employee_payroll_detail.html', context)
+
+
+@login_required
+def employee_payroll_edit(request, employee_pk, payroll_pk):
+    """Editar una nómina existente"""
+    employee = get_object_or_404(Employee, pk=employee_pk)
+    payroll = get_object_or_404(EmployeePayroll, pk=payroll_pk, employee=employee)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('employee_list')
+    
+    # Verificar que el usuario puede modificar este empleado (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and employee.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para modificar este empleado.')
+        return redirect('employee_list')
+    
+    if request.method == 'POST':
+        # Debug: Verificar archivos recibidos
+        print(f"DEBUG - FILES recibidos: {request.FILES}")
+        print(f"DEBUG - POST data: {request.POST}")
+        
+        form = EmployeePayrollForm(request.POST, request.FILES, instance=payroll)
+        if form.is_valid():
+            try:
+                saved_payroll = form.save()
+                print(f"DEBUG - Nómina guardada - Comprobante: {saved_payroll.payment_receipt}")
+                messages.success(request, f'Nómina de {payroll.get_period_display()} actualizada correctamente.')
+                return redirect('employee_payroll_detail', employee_pk=employee.pk, payroll_pk=payroll.pk)
+            except Exception as e:
+                print(f"DEBUG - Error al guardar: {str(e)}")
+                messages.error(request, f'Error al actualizar la nómina: {str(e)}')
+        else:
+            print(f"DEBUG - Errores del formulario: {form.errors}")
+            messages.error(request, 'Por favor, corrige los errores en el formulario.')
+    else:
+        form = EmployeePayrollForm(instance=payroll)
+    
+    context = {
+        'form': form,
+        'employee': employee,
+        'payroll': payroll,
+        'page_title': f'Editar Nómina {payroll.get_period_display()} - {employee.get_full_name()}',
+    }
+    
+    return render(request, 'tickets/employee_payroll_form.html', context)
+
+
+@login_required
+def employee_payroll_delete(request, employee_pk, payroll_pk):
+    """Eliminar una nómina"""
+    employee = get_object_or_404(Employee, pk=employee_pk)
+    payroll = get_object_or_404(EmployeePayroll, pk=payroll_pk, employee=employee)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('employee_list')
+    
+    # Verificar que el usuario puede modificar este empleado (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and employee.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para modificar este empleado.')
+        return redirect('employee_list')
+    
+    if request.method == 'POST':
+        period_display = payroll.get_period_display()
+        payroll.delete()
+        messages.success(request, f'Nómina de {period_display} eliminada correctamente.')
+        return redirect('employee_payroll_list', pk=employee.pk)
+    
+    context = {
+        'employee': employee,
+        'payroll': payroll,
+        'page_title': f'Eliminar Nómina {payroll.get_period_display()} - {employee.get_full_name()}',
+    }
+    
+    return render(request, 'tickets/employee_payroll_delete.html', context)
+
+
+@login_required
+def candidate_list(request):
+    """Lista de candidatos (estado: candidato e in_process)"""
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    # Filtrar por empresa del usuario
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company:
+        employees = Employee.objects.filter(
+            company=user_profile.company,
+            status__in=['candidate', 'in_process']
+        ).order_by('-created_at')
+    else:
+        employees = Employee.objects.filter(status__in=['candidate', 'in_process']).order_by('-created_at')
+    
+    # Búsqueda
+    search = request.GET.get('search')
+    if search:
+        employees = employees.filter(
+            models.Q(first_name__icontains=search) |
+            models.Q(last_name__icontains=search) |
+            models.Q(email__icontains=search) |
+            models.Q(position__icontains=search)
+        )
+    
+    # Paginación
+    paginator = Paginator(employees, 10)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'employees': page_obj,
+        'search': search,
+        'page_title': 'Candidatos',
+        'section': 'candidates'
+    }
+    
+    return render(request, 'tickets/candidate_list.html', context)
+
+
+@login_required
+def candidate_detail(request, pk):
+    """Detalle de un candidato"""
+    employee = get_object_or_404(Employee, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('candidate_list')
+    
+    # Verificar que el usuario puede ver este candidato (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and employee.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para ver este candidato.')
+        return redirect('candidate_list')
+    
+    # Análisis de IA (mismo código que employee_detail)
+    if request.method == 'POST' and 'analyze_ai' in request.POST:
+        config = SystemConfiguration.objects.first()
+        if not config or not config.openai_api_key:
+            messages.error(request, 'La configuración de IA no está disponible. Contacta al administrador.')
+            return redirect('candidate_detail', pk=pk)
+            
+        # Preparar datos para IA
+        datos = f"Nombre: {employee.get_full_name()}\nEmail: {employee.email}\nTeléfono: {employee.phone}\nCargo: {employee.position}"
+        if employee.salary_euros:
+            datos += f"\nSalario propuesto: €{employee.salary_euros}"
+        if employee.description:
+            datos += f"\nDescripción/Experiencia: {employee.description}"
+        if employee.resume_file:
+            datos += f"\nCurrículo adjunto: {employee.resume_file.name}"
+            
+        # Usar el prompt personalizado de la configuración
+        prompt = config.ai_employee_analysis_prompt.format(datos=datos)
+        
+        # Llamada a OpenAI
+        try:
+            from openai import OpenAI
+            
+            client = OpenAI(api_key=config.openai_api_key)
+            
+            response = client.chat.completions.create(
+                model=config.openai_model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=500,
+                temperature=0.7
+            )
+            
+            texto = response.choices[0].message.content.strip()
+            resumen = ""
+            puntuacion = None
+            
+            # Extraer resumen y puntuación
+            import re
+            resumen_match = re.search(r"Resumen:\s*(.*?)(?=Puntuación:|$)", texto, re.DOTALL)
+            puntuacion_match = re.search(r"Puntuación:\s*(\d+)", texto)
+            
+            if resumen_match:
+                resumen = resumen_match.group(1).strip()
+            else:
+                # Si no encuentra el formato esperado, usar todo el texto
+                resumen = texto
+                
+            if puntuacion_match:
+                puntuacion = int(puntuacion_match.group(1))
+                # Validar que la puntuación esté entre 1 y 10
+                if puntuacion < 1 or puntuacion > 10:
+                    puntuacion = None
+                    
+            # Guardar resultados
+            employee.ai_analysis = resumen if resumen else texto
+            employee.ai_score = puntuacion
+            employee.save()
+            
+            messages.success(request, "Análisis de IA completado y guardado correctamente.")
+            
+        except Exception as e:
+            messages.error(request, f"Error al analizar con IA: {str(e)}")
+            
+        return redirect('candidate_detail', pk=pk)
+    
+    context = {
+        'employee': employee,
+        'page_title': f'Candidato: {employee.get_full_name()}',
+        'config': SystemConfiguration.objects.first(),
+        'section': 'candidates'
+    }
+    
+    return render(request, 'tickets/candidate_detail.html', context)
+
+
+@login_required
+def active_employee_list(request):
+    """Lista de empleados activos (estado: employee)"""
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    # Filtrar por empresa del usuario
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company:
+        employees = Employee.objects.filter(
+            company=user_profile.company,
+            status='employee'
+        ).order_by('-created_at')
+    else:
+        employees = Employee.objects.filter(status='employee').order_by('-created_at')
+    
+    # Búsqueda
+    search = request.GET.get('search')
+    if search:
+        employees = employees.filter(
+            models.Q(first_name__icontains=search) |
+            models.Q(last_name__icontains=search) |
+            models.Q(email__icontains=search) |
+            models.Q(position__icontains=search)
+        )
+    
+    # Paginación
+    paginator = Paginator(employees, 10)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'employees': page_obj,
+        'search': search,
+        'page_title': 'Empleados Activos',
+        'section': 'employees'
+    }
+    
+    return render(request, 'tickets/active_employee_list.html', context)
+
+
+@login_required
+def active_employee_detail(request, pk):
+    """Detalle de un empleado activo"""
+    employee = get_object_or_404(Employee, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('active_employee_list')
+    
+    # Verificar que el usuario puede ver este empleado (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and employee.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para ver este empleado.')
+        return redirect('active_employee_list')
+    
+    context = {
+        'employee': employee,
+        'page_title': f'Empleado: {employee.get_full_name()}',
+        'config': SystemConfiguration.objects.first(),
+        'section': 'employees'
+    }
+    
+    return render(request, 'tickets/active_employee_detail.html', context)
+
+
+@login_required
+def job_application_token_list(request):
+    """Lista de tokens de aplicación de trabajo"""
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    # Filtrar por empresa del usuario
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company:
+        tokens = JobApplicationToken.objects.filter(company=user_profile.company).order_by('-created_at')
+    else:
+        tokens = JobApplicationToken.objects.all().order_by('-created_at')
+    
+    # Paginación
+    paginator = Paginator(tokens, 10)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'page_obj': page_obj,
+        'page_title': 'Enlaces de Aplicación de Empleo'
+    }
+    
+    return render(request, 'tickets/job_application_token_list.html', context)
+
+
+@login_required
+def job_application_token_create(request):
+    """Crear nuevo token de aplicación de trabajo"""
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    if request.method == 'POST':
+        try:
+            job_title = request.POST.get('job_title')
+            job_description = request.POST.get('job_description')
+            proposed_salary_euros = request.POST.get('proposed_salary_euros')
+            max_applications = request.POST.get('max_applications')
+            expires_at = request.POST.get('expires_at')
+            
+            if not job_title or not job_description:
+                messages.error(request, 'El título y descripción del trabajo son obligatorios.')
+                return render(request, 'tickets/job_application_token_form.html')
+            
+            # Obtener empresa del usuario
+            user_profile = UserProfile.objects.filter(user=request.user).first()
+            if not user_profile or not user_profile.company:
+                messages.error(request, 'Debes estar asociado a una empresa para crear enlaces de aplicación.')
+                return redirect('job_application_token_list')
+            
+            # Crear el token
+            token = JobApplicationToken.objects.create(
+                job_title=job_title,
+                job_description=job_description,
+                proposed_salary_euros=float(proposed_salary_euros) if proposed_salary_euros else None,
+                max_applications=int(max_applications) if max_applications else None,
+                expires_at=datetime.strptime(expires_at, '%Y-%m-%dT%H:%M') if expires_at else None,
+                company=user_profile.company,
+                created_by=request.user
+            )
+            
+            messages.success(request, f'Enlace de aplicación creado exitosamente para "{job_title}".')
+            return redirect('job_application_token_detail', pk=token.pk)
+            
+        except Exception as e:
+            messages.error(request, f'Error al crear el enlace: {str(e)}')
+    
+    context = {
+        'page_title': 'Crear Enlace de Aplicación de Empleo'
+    }
+    
+    return render(request, 'tickets/job_application_token_form.html', context)
+
+
+@login_required
+def job_application_token_detail(request, pk):
+    """Detalle de un token de aplicación de trabajo"""
+    token = get_object_or_404(JobApplicationToken, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes', 'Profesores']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('job_application_token_list')
+    
+    # Verificar que el usuario puede ver este token (misma empresa)
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and token.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para ver este enlace.')
+        return redirect('job_application_token_list')
+    
+    # Obtener aplicaciones relacionadas
+    applications = Employee.objects.filter(
+        company=token.company,
+        created_at__gte=token.created_at
+    ).order_by('-created_at')
+    
+    context = {
+        'token': token,
+        'applications': applications,
+        'page_title': f'Enlace: {token.job_title}'
+    }
+    
+    return render(request, 'tickets/job_application_token_detail.html', context)
+
+
+def public_job_application(request, token):
+    """Vista pública para aplicar a un empleo"""
+    try:
+        application_token = get_object_or_404(JobApplicationToken, application_token=token)
+    except Exception:
+        return render(request, 'tickets/public_job_application_error.html', {
+            'error': 'El enlace de aplicación no es válido.'
+        })
+    
+    if not application_token.is_valid():
+        error_msg = 'Este enlace de aplicación ya no está disponible.'
+        if application_token.expires_at and timezone.now() > application_token.expires_at:
+            error_msg = 'Este enlace de aplicación ha expirado.'
+        elif application_token.max_applications and application_token.application_count >= application_token.max_applications:
+            error_msg = 'Este enlace ha alcanzado el máximo de aplicaciones permitidas.'
+        
+        return render(request, 'tickets/public_job_application_error.html', {
+            'error': error_msg
+        })
+    
+    if request.method == 'POST':
+        try:
+            # Obtener datos del formulario
+            first_name = request.POST.get('first_name', '').strip()
+            last_name = request.POST.get('last_name', '').strip()
+            email = request.POST.get('email', '').strip()
+            phone = request.POST.get('phone', '').strip()
+            description = request.POST.get('description', '').strip()
+            resume_file = request.FILES.get('resume_file')
+            
+            # Validaciones básicas
+            if not all([first_name, last_name, email, description]):
+                messages.error(request, 'Todos los campos marcados con * son obligatorios.')
+                return render(request, 'tickets/public_job_application.html', {
+                    'token': application_token,
+                    'page_title': f'Aplicar a: {application_token.job_title}'
+                })
+            
+            # Verificar que el email no exista ya
+            if Employee.objects.filter(email=email, company=application_token.company).exists():
+                messages.error(request, 'Ya existe una aplicación con este correo electrónico.')
+                return render(request, 'tickets/public_job_application.html', {
+                    'token': application_token,
+                    'page_title': f'Aplicar a: {application_token.job_title}'
+                })
+            
+            # Crear el empleado/aplicante
+            employee = Employee.objects.create(
+                first_name=first_name,
+                last_name=last_name,
+                email=email,
+                phone=phone,
+                position=application_token.job_title,
+                salary_euros=application_token.proposed_salary_euros,
+                description=description,
+                resume_file=resume_file,
+                company=application_token.company,
+                status='applied'
+            )
+            
+            # Incrementar contador de aplicaciones
+            application_token.application_count += 1
+            application_token.save()
+            
+            # Procesar CV con IA si está configurada
+            try:
+                analyze_resume_with_ai(employee)
+            except Exception as e:
+                print(f"Error al analizar CV con IA: {e}")
+            
+            return render(request, 'tickets/public_job_application_success.html', {
+                'employee': employee,
+                'token': application_token,
+                'page_title': 'Aplicación Enviada'
+            })
+            
+        except Exception as e:
+            messages.error(request, f'Error al enviar la aplicación: {str(e)}')
+    
+    context = {
+        'token': application_token,
+        'page_title': f'Aplicar a: {application_token.job_title}'
+    }
+    
+    return render(request, 'tickets/public_job_application.html', context)
+
+
+def analyze_resume_with_ai(employee):
+    """Analizar currículo con IA si está configurada"""
+    try:
+        # Obtener configuración de IA
+        ai_config = SystemConfiguration.objects.first()
+        if not ai_config or not hasattr(ai_config, 'openai_api_key') or not ai_config.openai_api_key:
+            return
+        
+        # Si no hay archivo de CV, analizar solo la descripción
+        content_to_analyze = employee.description
+        
+        if employee.resume_file:
+            try:
+                # Leer el contenido del archivo (solo si es texto plano o PDF simple)
+                file_path = employee.resume_file.path
+                if file_path.endswith('.txt'):
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content_to_analyze += f"\n\nContenido del CV:\n{f.read()}"
+            except Exception:
+                pass  # Si no se puede leer el archivo, solo usar la descripción
+        
+        if not content_to_analyze.strip():
+            return
+        
+        # Configurar OpenAI
+        import openai
+        openai.api_key = ai_config.openai_api_key
+        
+        # Prompt para análisis de CV
+        prompt = f"""
+        Analiza el siguiente currículo/perfil profesional y proporciona:
+        
+        1. Un resumen ejecutivo del candidato (máximo 3 párrafos)
+        2. Fortalezas principales
+        3. Áreas de mejora o faltantes
+        4. Puntuación del 1 al 10 basada en:
+           - Experiencia relevante
+           - Habilidades técnicas
+           - Comunicación escrita
+           - Potencial de crecimiento
+        
+        Puesto aplicado: {employee.position}
+        
+        Perfil del candidato:
+        {content_to_analyze}
+        
+        Responde en formato estructurado y profesional.
+        """
+        
+        # Llamar a la API de OpenAI
+        response = openai.ChatCompletion.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": "Eres un experto en recursos humanos y análisis de currículos."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=800,
+            temperature=0.3
+        )
+        
+        ai_analysis = response.choices[0].message.content
+        
+        # Extraer puntuación del análisis (buscar números del 1-10)
+        import re
+        score_match = re.search(r'(\d+)/10|(\d+)\s*de\s*10|puntuación.*?(\d+)', ai_analysis.lower())
+        ai_score = None
+        if score_match:
+            for group in score_match.groups():
+                if group and 1 <= int(group) <= 10:
+                    ai_score = int(group)
+                    break
+        
+        # Guardar análisis
+        employee.ai_analysis = ai_analysis
+        employee.ai_score = ai_score
+        employee.save()
+        
+    except Exception as e:
+        print(f"Error en análisis de IA: {e}")
+        # No fallar silenciosamente, pero tampoco interrumpir el proceso
+
+
+# =============================================================================
+# VISTAS DE ACUERDOS/CONTRATOS
+# =============================================================================
+
+@login_required
+def agreement_list(request):
+    """Lista de acuerdos"""
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    # Filtrar por empresa del usuario si es necesario
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company:
+        agreements = Agreement.objects.filter(company=user_profile.company)
+    else:
+        agreements = Agreement.objects.all()
+    
+    # Filtros de búsqueda
+    search = request.GET.get('search', '').strip()
+    status_filter = request.GET.get('status', '')
+    
+    if search:
+        agreements = agreements.filter(
+            models.Q(title__icontains=search) |
+            models.Q(body__icontains=search)
+        )
+    
+    if status_filter:
+        agreements = agreements.filter(status=status_filter)
+    
+    agreements = agreements.order_by('-created_at')
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(agreements, 20)
+    page_number = request.GET.get('page')
+    agreements = paginator.get_page(page_number)
+    
+    context = {
+        'agreements': agreements,
+        'search': search,
+        'status_filter': status_filter,
+        'page_title': 'Gestión de Acuerdos',
+    }
+    
+    return render(request, 'tickets/agreement_list.html', context)
+
+
+@login_required
+def agreement_create(request):
+    """Crear nuevo acuerdo"""
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    if request.method == 'POST':
+        form = AgreementForm(request.POST)
+        if form.is_valid():
+            agreement = form.save(commit=False)
+            agreement.created_by = request.user
+            
+            # Asignar empresa del usuario
+            user_profile = UserProfile.objects.filter(user=request.user).first()
+            if user_profile and user_profile.company:
+                agreement.company = user_profile.company
+            
+            # Generar contenido con IA si se solicitó
+            if form.cleaned_data.get('generate_ai_content'):
+                ai_content = agreement.generate_ai_content(
+                    form.cleaned_data.get('ai_prompt_addition', '')
+                )
+                if ai_content:
+                    agreement.body = ai_content
+                    messages.success(request, 'Contenido generado con IA exitosamente.')
+                else:
+                    messages.warning(request, 'No se pudo generar contenido con IA. Verifica la configuración.')
+            
+            agreement.save()
+            messages.success(request, f'Acuerdo "{agreement.title}" creado correctamente.')
+            return redirect('agreement_detail', pk=agreement.pk)
+        else:
+            messages.error(request, 'Por favor, corrige los errores en el formulario.')
+    else:
+        form = AgreementForm()
+    
+    context = {
+        'form': form,
+        'page_title': 'Nuevo Acuerdo',
+    }
+    
+    return render(request, 'tickets/agreement_form.html', context)
+
+
+@login_required
+def agreement_detail(request, pk):
+    """Ver detalles de un acuerdo"""
+    agreement = get_object_or_404(Agreement, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    # Verificar empresa
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and agreement.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para ver este acuerdo.')
+        return redirect('agreement_list')
+    
+    signatures = agreement.signatures.all().order_by('-signed_at')
+    
+    context = {
+        'agreement': agreement,
+        'signatures': signatures,
+        'page_title': f'Acuerdo - {agreement.title}',
+    }
+    
+    return render(request, 'tickets/agreement_detail.html', context)
+
+
+@login_required
+def agreement_edit(request, pk):
+    """Editar acuerdo existente"""
+    agreement = get_object_or_404(Agreement, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    # Verificar empresa
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and agreement.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para editar este acuerdo.')
+        return redirect('agreement_list')
+    
+    # Verificar si es editable
+    if not agreement.is_editable:
+        messages.error(request, 'Este acuerdo ya no se puede editar porque tiene firmas válidas.')
+        return redirect('agreement_detail', pk=agreement.pk)
+    
+    if request.method == 'POST':
+        form = AgreementForm(request.POST, instance=agreement)
+        if form.is_valid():
+            agreement = form.save()
+            
+            # Generar contenido con IA si se solicitó
+            if form.cleaned_data.get('generate_ai_content'):
+                ai_content = agreement.generate_ai_content(
+                    form.cleaned_data.get('ai_prompt_addition', '')
+                )
+                if ai_content:
+                    agreement.body = ai_content
+                    agreement.save()
+                    messages.success(request, 'Contenido actualizado con IA exitosamente.')
+                else:
+                    messages.warning(request, 'No se pudo generar contenido con IA.')
+            
+            messages.success(request, f'Acuerdo "{agreement.title}" actualizado correctamente.')
+            return redirect('agreement_detail', pk=agreement.pk)
+        else:
+            messages.error(request, 'Por favor, corrige los errores en el formulario.')
+    else:
+        form = AgreementForm(instance=agreement)
+    
+    context = {
+        'form': form,
+        'agreement': agreement,
+        'page_title': f'Editar - {agreement.title}',
+    }
+    
+    return render(request, 'tickets/agreement_form.html', context)
+
+
+@login_required
+def agreement_delete(request, pk):
+    """Eliminar acuerdo"""
+    agreement = get_object_or_404(Agreement, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    # Verificar empresa
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and agreement.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para eliminar este acuerdo.')
+        return redirect('agreement_list')
+    
+    if request.method == 'POST':
+        title = agreement.title
+        agreement.delete()
+        messages.success(request, f'Acuerdo "{title}" eliminado correctamente.')
+        return redirect('agreement_list')
+    
+    context = {
+        'agreement': agreement,
+        'page_title': f'Eliminar - {agreement.title}',
+    }
+    
+    return render(request, 'tickets/agreement_delete.html', context)
+
+
+@login_required
+def agreement_publish(request, pk):
+    """Publicar acuerdo para firma"""
+    agreement = get_object_or_404(Agreement, pk=pk)
+    
+    # Verificar permisos
+    if not request.user.groups.filter(name__in=['Administradores', 'Agentes']).exists():
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    # Verificar empresa
+    user_profile = UserProfile.objects.filter(user=request.user).first()
+    if user_profile and user_profile.company and agreement.company != user_profile.company:
+        messages.error(request, 'No tienes permisos para publicar este acuerdo.')
+        return redirect('agreement_list')
+    
+    if request.method == 'POST':
+        form = AgreementPublicForm(request.POST)
+        if form.is_valid():
+            agreement.status = 'published'
+            agreement.published_at = timezone.now()
+            agreement.save()
+            
+            messages.success(request, f'Acuerdo "{agreement.title}" publicado correctamente.')
+            messages.info(request, f'URL pública: {agreement.get_public_url(request)}')
+            
+            # TODO: Enviar notificaciones por email si está configurado
+            email_list = form.cleaned_data.get('email_list', [])
+            if email_list and form.cleaned_data.get('send_notifications'):
+                # Implementar envío de emails
+                pass
+            
+            return redirect('agreement_detail', pk=agreement.pk)
+        else:
+            messages.error(request, 'Por favor, corrige los errores en el formulario.')
+    else:
+        form = AgreementPublicForm()
+    
+    context = {
+        'form': form,
+        'agreement': agreement,
+        'page_title': f'Publicar - {agreement.title}',
+    }
+    
+    return render(request, 'tickets/agreement_publish.html', context)
+
+
+# =============================================================================
+# VISTAS PÚBLICAS DE ACUERDOS (SIN LOGIN)
+# =============================================================================
+
+def public_agreement_sign(request, token):
+    """Vista pública para firmar un acuerdo"""
+    agreement = get_object_or_404(Agreement, public_token=token)
+    
+    # Verificar si el acuerdo puede ser firmado
+    if not agreement.can_be_signed:
+        error_msg = "Este acuerdo no está disponible para firmar."
+        if agreement.status != 'published':
+            error_msg = "Este acuerdo aún no ha sido publicado."
+        elif agreement.is_expired:
+            error_msg = "Este acuerdo ha expirado."
+        elif agreement.max_signers and agreement.signature_count >= agreement.max_signers:
+            error_msg = "Este acuerdo ha alcanzado el número máximo de firmantes."
+        
+        context = {
+            'agreement': agreement,
+            'error_message': error_msg,
+            'page_title': f'Acuerdo - {agreement.title}',
+        }
+        return render(request, 'tickets/public_agreement_error.html', context)
+    
+    if request.method == 'POST':
+        form = AgreementSignatureForm(request.POST)
+        form.agreement = agreement  # Para validaciones
+        
+        if form.is_valid():
+            signature = form.save(commit=False)
+            signature.agreement = agreement
+            
+            # Capturar información adicional
+            signature.ip_address = request.META.get('REMOTE_ADDR')
+            signature.user_agent = request.META.get('HTTP_USER_AGENT', '')
+            
+            # Si el acuerdo requiere aprobación, marcar como no aprobado
+            if agreement.requires_approval:
+                signature.is_approved = False
+            
+            signature.save()
+            
+            messages.success(request, '¡Acuerdo firmado correctamente!')
+            return redirect('public_agreement_success', token=token, signature_id=signature.pk)
+        else:
+            messages.error(request, 'Por favor, corrige los errores en el formulario.')
+    else:
+        form = AgreementSignatureForm()
+    
+    context = {
+        'agreement': agreement,
+        'form': form,
+        'signatures_count': agreement.signature_count,
+        'page_title': f'Firmar - {agreement.title}',
+    }
+    
+    return render(request, 'tickets/public_agreement_sign.html', context)
+
+
+def public_agreement_success(request, token, signature_id):
+    """Vista de confirmación después de firmar"""
+    agreement = get_object_or_404(Agreement, public_token=token)
+    signature = get_object_or_404(AgreementSignature, pk=signature_id, agreement=agreement)
+    
+    context = {
+        'agreement': agreement,
+        'signature': signature,
+        'download_url': signature.get_download_url(request),
+        'page_title': f'Firmado - {agreement.title}',
+    }
+    
+    return render(request, 'tickets/public_agreement_success.html', context)
+
+
+def download_signed_agreement(request, agreement_token, signature_id):
+    """Descargar PDF del acuerdo firmado"""
+    agreement = get_object_or_404(Agreement, public_token=agreement_token)
+    signature = get_object_or_404(AgreementSignature, pk=signature_id, agreement=agreement)
+    
+    # Actualizar estadísticas de descarga
+    signature.pdf_downloaded_at = timezone.now()
+    signature.download_count += 1
+    signature.save()
+    
+    # Generar PDF del acuerdo firmado
+    from django.http import HttpResponse
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from io import BytesIO
+    
+    # Crear PDF en memoria
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = getSampleStyleSheet()
+    story = []
+    
+    # Título
+    title = Paragraph(f"<b>{agreement.title}</b>", styles['Title'])
+    story.append(title)
+    story.append(Spacer(1, 20))
+    
+    # Contenido del acuerdo
+    body_paragraphs = agreement.body.split('\n')
+    for para in body_paragraphs:
+        if para.strip():
+            p = Paragraph(para, styles['Normal'])
+            story.append(p)
+            story.append(Spacer(1, 10))
+    
+    # Información de la firma
+    story.append(Spacer(1, 30))
+    story.append(Paragraph("<b>INFORMACIÓN DE LA FIRMA:</b>", styles['Heading2']))
+    story.append(Spacer(1, 10))
+    
+    signature_info = f"""
+    <b>Firmante:</b> {signature.signer_name}<br/>
+    <b>Email:</b> {signature.signer_email}<br/>
+    <b>Fecha de Firma:</b> {signature.signed_at.strftime('%d/%m/%Y %H:%M')}<br/>
+    <b>IP:</b> {signature.ip_address or 'No disponible'}<br/>
+    """
+    
+    story.append(Paragraph(signature_info, styles['Normal']))
+    
+    # Construir PDF
+    doc.build(story)
+    
+    # Preparar respuesta
+    buffer.seek(0)
+    response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
+    response['Content-Disposition'] = f'attachment; filename="{agreement.title}_firmado_{signature.signer_name}.pdf"'
+    
+    return response
+
+
+# ============================================
+# VISTAS DE SOLICITUDES DE EMPLEADOS
+# ============================================
+
+@login_required
+def employee_request_list(request):
+    """Vista para listar las solicitudes de empleados"""
+    from .models import EmployeeRequest
+    from django.db import models
+    
+    # Filtros básicos
+    status_filter = request.GET.get('status', '')
+    search = request.GET.get('search', '')
+    
+    # Query base
+    requests = EmployeeRequest.objects.all()
+    
+    # Si no es agente/admin, solo puede ver sus propias solicitudes
+    if not (request.user.is_staff or request.user.groups.filter(name='Agentes').exists()):
+        requests = requests.filter(created_by=request.user)
+    
+    # Aplicar filtros
+    if status_filter:
+        requests = requests.filter(status=status_filter)
+    
+    if search:
+        requests = requests.filter(
+            models.Q(title__icontains=search) | 
+            models.Q(text__icontains=search) |
+            models.Q(sequence__icontains=search)
+        )
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(requests, 15)
+    page = request.GET.get('page')
+    requests = paginator.get_page(page)
+    
+    context = {
+        'requests': requests,
+        'status_filter': status_filter,
+        'search': search,
+        'status_choices': EmployeeRequest.STATUS_CHOICES,
+    }
+    
+    return render(request, 'tickets/employee_request_list.html', context)
+
+
+@login_required
+def employee_request_create(request):
+    """Vista para crear una nueva solicitud de empleado"""
+    from .forms import EmployeeRequestForm
+    
+    if request.method == 'POST':
+        form = EmployeeRequestForm(request.POST, user=request.user)
+        if form.is_valid():
+            request_instance = form.save(commit=False)
+            request_instance.created_by = request.user
+            request_instance.save()
+            messages.success(request, f'Solicitud #{request_instance.sequence} creada correctamente.')
+            return redirect('employee_request_detail', pk=request_instance.pk)
+    else:
+        form = EmployeeRequestForm(user=request.user)
+    
+    context = {
+        'form': form,
+        'page_title': 'Nueva Solicitud de Empleado',
+        'is_create': True,
+    }
+    
+    return render(request, 'tickets/employee_request_form.html', context)
+
+
+@login_required
+def employee_request_detail(request, pk):
+    """Vista para ver el detalle de una solicitud de empleado"""
+    from .models import EmployeeRequest
+    
+    employee_request = get_object_or_404(EmployeeRequest, pk=pk)
+    
+    # Verificar permisos
+    if not (request.user.is_staff or 
+            request.user.groups.filter(name='Agentes').exists() or 
+            employee_request.created_by == request.user):
+        messages.error(request, 'No tienes permisos para ver esta solicitud.')
+        return redirect('employee_request_list')
+    
+    context = {
+        'request_instance': employee_request,
+        'page_title': f'Solicitud #{employee_request.sequence}',
+    }
+    
+    return render(request, 'tickets/employee_request_detail.html', context)
+
+
+@login_required
+def employee_request_edit(request, pk):
+    """Vista para editar una solicitud de empleado"""
+    from .models import EmployeeRequest
+    from .forms import EmployeeRequestForm
+    
+    employee_request = get_object_or_404(EmployeeRequest, pk=pk)
+    
+    # Verificar permisos de edición
+    can_edit = (
+        request.user.is_staff or 
+        request.user.groups.filter(name='Agentes').exists() or 
+        (employee_request.created_by == request.user and employee_request.status == 'draft')
+    )
+    
+    if not can_edit:
+        messages.error(request, 'No tienes permisos para editar esta solicitud.')
+        return redirect('employee_request_detail', pk=pk)
+    
+    if request.method == 'POST':
+        form = EmployeeRequestForm(request.POST, instance=employee_request, user=request.user)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Solicitud #{employee_request.sequence} actualizada correctamente.')
+            return redirect('employee_request_detail', pk=pk)
+    else:
+        form = EmployeeRequestForm(instance=employee_request, user=request.user)
+    
+    context = {
+        'form': form,
+        'request_instance': employee_request,
+        'page_title': f'Editar Solicitud #{employee_request.sequence}',
+        'is_create': False,
+    }
+    
+    return render(request, 'tickets/employee_request_form.html', context)
+
+
+@login_required
+def employee_request_delete(request, pk):
+    """Vista para eliminar una solicitud de empleado"""
+    from .models import EmployeeRequest
+    
+    employee_request = get_object_or_404(EmployeeRequest, pk=pk)
+    
+    # Solo el creador o agentes/admin pueden eliminar
+    can_delete = (
+        request.user.is_staff or 
+        request.user.groups.filter(name='Agentes').exists() or 
+        (employee_request.created_by == request.user and employee_request.status == 'draft')
+    )
+    
+    if not can_delete:
+        messages.error(request, 'No tienes permisos para eliminar esta solicitud.')
+        return redirect('employee_request_detail', pk=pk)
+    
+    if request.method == 'POST':
+        sequence = employee_request.sequence
+        employee_request.delete()
+        messages.success(request, f'Solicitud #{sequence} eliminada correctamente.')
+        return redirect('employee_request_list')
+    
+    context = {
+        'request_instance': employee_request,
+        'page_title': f'Eliminar Solicitud #{employee_request.sequence}',
+    }
+    
+    return render(request, 'tickets/employee_request_delete.html', context)
+
+
+@login_required
+def employee_dashboard(request):
+    """Vista del dashboard para empleados con métricas de productividad"""
+    from django.db.models import Count, Sum, Q
+    from datetime import datetime, timedelta
+    from django.utils import timezone
+    from .utils import is_agent
+    
+    # Verificar si el usuario puede ver el dashboard de otros empleados
+    can_view_others = (
+        request.user.is_staff or 
+        request.user.is_superuser or 
+        is_agent(request.user)
+    )
+    
+    # Obtener el empleado seleccionado
+    selected_employee_id = request.GET.get('employee_id')
+    selected_employee = request.user  # Por defecto, el usuario actual
+    
+    if selected_employee_id and can_view_others:
+        try:
+            selected_employee = User.objects.get(id=selected_employee_id)
+        except User.DoesNotExist:
+            messages.warning(request, 'El empleado seleccionado no existe.')
+            selected_employee = request.user
+    elif selected_employee_id and not can_view_others:
+        messages.warning(request, 'No tienes permisos para ver el dashboard de otros empleados.')
+    
+    # Obtener lista de empleados para el selector (solo si puede ver otros)
+    available_employees = []
+    if can_view_others:
+        # Obtener usuarios que son empleados (tienen registros de tiempo o están en grupo de agentes)
+        employee_users = User.objects.filter(
+            Q(time_entries__isnull=False) | 
+            Q(groups__name='Agentes') |
+            Q(is_staff=True)
+        ).distinct().order_by('first_name', 'last_name', 'username')
+        
+        available_employees = employee_users
+    
+    # Obtener fechas para los períodos
+    now = timezone.now()
+    today = now.date()
+    week_start = today - timedelta(days=today.weekday())  # Lunes de esta semana
+    month_start = today.replace(day=1)  # Primer día del mes actual
+    
+    # Métricas de horas trabajadas
+    # Horas del día actual
+    today_entries = TimeEntry.objects.filter(
+        user=selected_employee,
+        fecha_entrada__date=today,
+        fecha_salida__isnull=False
+    )
+    
+    hours_today = 0
+    for entry in today_entries:
+        if entry.fecha_salida:
+            duration = entry.fecha_salida - entry.fecha_entrada
+            hours_today += duration.total_seconds() / 3600
+    
+    # Horas de la semana actual
+    week_entries = TimeEntry.objects.filter(
+        user=selected_employee,
+        fecha_entrada__date__gte=week_start,
+        fecha_entrada__date__lte=today,
+        fecha_salida__isnull=False
+    )
+    
+    hours_week = 0
+    for entry in week_entries:
+        if entry.fecha_salida:
+            duration = entry.fecha_salida - entry.fecha_entrada
+            hours_week += duration.total_seconds() / 3600
+    
+    # Horas del mes actual
+    month_entries = TimeEntry.objects.filter(
+        user=selected_employee,
+        fecha_entrada__date__gte=month_start,
+        fecha_entrada__date__lte=today,
+        fecha_salida__isnull=False
+    )
+    
+    hours_month = 0
+    for entry in month_entries:
+        if entry.fecha_salida:
+            duration = entry.fecha_salida - entry.fecha_entrada
+            hours_month += duration.total_seconds() / 3600
+    
+    # Contactos creados en el mes
+    contacts_month = Contact.objects.filter(
+        created_by=selected_employee,
+        created_at__date__gte=month_start
+    ).count()
+    
+    # Oportunidades creadas en el mes
+    opportunities_month = Opportunity.objects.filter(
+        assigned_to=selected_employee,
+        created_at__date__gte=month_start
+    ).count()
+    
+    # Tickets creados en el mes
+    tickets_month = Ticket.objects.filter(
+        Q(created_by=selected_employee) | Q(assigned_to=selected_employee),
+        created_at__date__gte=month_start
+    ).count()
+    
+    # Reuniones con Gerente IA en el mes
+    ai_meetings_month = AIManagerMeeting.objects.filter(
+        user=selected_employee,
+        created_at__date__gte=month_start
+    ).count()
+    
+    # KPIs de Ausencias
+    from .models import EmployeeAbsence
+    
+    # Ausencias de la semana en horas
+    week_absences = EmployeeAbsence.objects.filter(
+        employee=selected_employee,
+        start_date__gte=week_start,
+        start_date__lte=today,
+        status='approved'
+    )
+    
+    absence_hours_week = 0
+    for absence in week_absences:
+        # Calcular días de ausencia que caen en esta semana
+        absence_start = max(absence.start_date, week_start)
+        absence_end = min(absence.end_date, today)
+        if absence_start <= absence_end:
+            absence_days = (absence_end - absence_start).days + 1
+            absence_hours_week += absence_days * 8  # Asumiendo 8 horas por día
+    
+    # Ausencias del mes en horas
+    month_absences = EmployeeAbsence.objects.filter(
+        employee=selected_employee,
+        start_date__gte=month_start,
+        start_date__lte=today,
+        status='approved'
+    )
+    
+    absence_hours_month = 0
+    for absence in month_absences:
+        # Calcular días de ausencia que caen en este mes
+        absence_start = max(absence.start_date, month_start)
+        absence_end = min(absence.end_date, today)
+        if absence_start <= absence_end:
+            absence_days = (absence_end - absence_start).days + 1
+            absence_hours_month += absence_days * 8  # Asumiendo 8 horas por día
+    
+    # Ausencias totales en horas (todas las ausencias aprobadas)
+    total_absences = EmployeeAbsence.objects.filter(
+        employee=selected_employee,
+        status='approved'
+    )
+    
+    absence_hours_total = 0
+    for absence in total_absences:
+        absence_days = (absence.end_date - absence.start_date).days + 1
+        absence_hours_total += absence_days * 8  # Asumiendo 8 horas por día
+    
+    # Datos para gráficos (últimos 7 días)
+    chart_data = []
+    for i in range(7):
+        day = today - timedelta(days=i)
+        day_entries = TimeEntry.objects.filter(
+            user=selected_employee,
+            fecha_entrada__date=day,
+            fecha_salida__isnull=False
+        )
+        
+        day_hours = 0
+        for entry in day_entries:
+            if entry.fecha_salida:
+                duration = entry.fecha_salida - entry.fecha_entrada
+                day_hours += duration.total_seconds() / 3600
+        
+        chart_data.append({
+            'date': day.strftime('%d/%m'),
+            'hours': round(day_hours, 2)
+        })
+    
+    chart_data.reverse()  # Para mostrar de más antiguo a más reciente
+    
+    # Obtener información del clima
+    weather_info = None
+    try:
+        # Obtener la ubicación del empleado seleccionado
+        profile = getattr(selected_employee, 'profile', None)
+        if profile:
+            city = profile.city or 'Valencia'
+            country_code = profile.country_code or 'ES'
+        else:
+            city = 'Valencia'
+            country_code = 'ES'
+        
+        from .utils import get_weather_info
+        weather_info = get_weather_info(city, country_code)
+    except Exception as e:
+        # Si hay error, usar valores por defecto
+        weather_info = {
+            'city': 'Valencia',
+            'temperature': '--',
+            'description': 'No disponible',
+            'icon': 'bi-exclamation-triangle',
+            'success': False
+        }
+    
+    context = {
+        'page_title': f'Dashboard de Empleado - {selected_employee.get_full_name() or selected_employee.username}',
+        'hours_today': round(hours_today, 2),
+        'hours_week': round(hours_week, 2),
+        'hours_month': round(hours_month, 2),
+        'absence_hours_week': round(absence_hours_week, 2),
+        'absence_hours_month': round(absence_hours_month, 2),
+        'absence_hours_total': round(absence_hours_total, 2),
+        'contacts_month': contacts_month,
+        'opportunities_month': opportunities_month,
+        'tickets_month': tickets_month,
+        'ai_meetings_month': ai_meetings_month,
+        'chart_data': chart_data,
+        'current_user': request.user,
+        'selected_employee': selected_employee,
+        'available_employees': available_employees,
+        'can_view_others': can_view_others,
+        'today': today,
+        'week_start': week_start,
+        'month_start': month_start,
+        'weather_info': weather_info,
+    }
+    
+    return render(request, 'tickets/employee_dashboard.html', context)
+
+
+# ===================================================
+# VISTAS PARA ACUERDOS INTERNOS
+# ===================================================
+
+@login_required
+def internal_agreement_list(request):
+    """Vista para listar los acuerdos internos"""
+    from .models import InternalAgreement
+    from django.db import models
+    from .utils import is_agent
+    
+    # Solo agentes y administradores pueden acceder
+    if not (is_agent(request.user) or request.user.is_staff):
+        messages.error(request, 'No tienes permisos para acceder a esta sección.')
+        return redirect('dashboard')
+    
+    # Filtros básicos
+    status_filter = request.GET.get('status', '')
+    type_filter = request.GET.get('type', '')
+    priority_filter = request.GET.get('priority', '')
+    search = request.GET.get('search', '')
+    
+    # Query base
+    agreements = InternalAgreement.objects.all()
+    
+    # Aplicar filtros
+    if status_filter:
+        agreements = agreements.filter(status=status_filter)
+    
+    if type_filter:
+        agreements = agreements.filter(agreement_type=type_filter)
+    
+    if priority_filter:
+        agreements = agreements.filter(priority=priority_filter)
+    
+    if search:
+        agreements = agreements.filter(
+            models.Q(title__icontains=search) | 
+            models.Q(description__icontains=search) |
+            models.Q(content__icontains=search) |
+            models.Q(tags__icontains=search) |
+            models.Q(sequence__icontains=search)
+        )
+    
+    # Optimizar consultas
+    agreements = agreements.select_related('created_by', 'approved_by')
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(agreements, 15)
+    page = request.GET.get('page')
+    agreements_page = paginator.get_page(page)
+    
+    # Agregar información de permisos a cada acuerdo
+    for agreement in agreements_page:
+        agreement.user_can_edit = agreement.can_edit(request.user)
+        agreement.user_can_delete = agreement.can_delete(request.user)
+    
+    context = {
+        'agreements': agreements_page,
+        'status_filter': status_filter,
+        'type_filter': type_filter,
+        'priority_filter': priority_filter,
+        'search': search,
+        'status_choices': InternalAgreement.STATUS_CHOICES,
+        'type_choices': InternalAgreement.TYPE_CHOICES,
+        'priority_choices': InternalAgreement.PRIORITY_CHOICES,
+    }
+    
+    return render(request, 'tickets/internal_agreement_list.html', context)
+
+
+@login_required
+def internal_agreement_create(request):
+    """Vista para crear un nuevo acuerdo interno"""
+    from .forms import InternalAgreementForm
+    from .utils import is_agent
+    
+    # Solo agentes y administradores pueden crear
+    if not (is_agent(request.user) or request.user.is_staff):
+        messages.error(request, 'No tienes permisos para crear acuerdos internos.')
+        return redirect('internal_agreement_list')
+    
+    if request.method == 'POST':
+        form = InternalAgreementForm(request.POST, user=request.user)
+        if form.is_valid():
+            agreement = form.save(commit=False)
+            agreement.created_by = request.user
+            agreement.save()
+            messages.success(request, f'Acuerdo Interno #{agreement.sequence} creado correctamente.')
+            return redirect('internal_agreement_detail', pk=agreement.pk)
+    else:
+        form = InternalAgreementForm(user=request.user)
+    
+    context = {
+        'form': form,
+        'page_title': 'Nuevo Acuerdo Interno',
+        'is_create': True,
+    }
+    
+    return render(request, 'tickets/internal_agreement_form.html', context)
+
+
+@login_required
+def internal_agreement_detail(request, pk):
+    """Vista para ver el detalle de un acuerdo interno"""
+    from .models import InternalAgreement
+    from .utils import is_agent
+    
+    # Solo agentes y administradores pueden ver
+    if not (is_agent(request.user) or request.user.is_staff):
+        messages.error(request, 'No tienes permisos para ver los acuerdos internos.')
+        return redirect('dashboard')
+    
+    agreement = get_object_or_404(InternalAgreement, pk=pk)
+    
+    # Procesar etiquetas
+    tags_list = []
+    if agreement.tags:
+        tags_list = [tag.strip() for tag in agreement.tags.split(',') if tag.strip()]
+    
+    context = {
+        'agreement': agreement,
+        'tags_list': tags_list,
+        'page_title': f'Acuerdo #{agreement.sequence}',
+        'can_edit': agreement.can_edit(request.user),
+        'can_delete': agreement.can_delete(request.user),
+        'can_sign_user': (agreement.signer_1 == request.user and not agreement.signer_1_date) or 
+                        (agreement.signer_2 == request.user and not agreement.signer_2_date),
+    }
+    
+    return render(request, 'tickets/internal_agreement_detail.html', context)
+
+
+@login_required
+def internal_agreement_edit(request, pk):
+    """Vista para editar un acuerdo interno"""
+    from .models import InternalAgreement
+    from .forms import InternalAgreementForm
+    from .utils import is_agent
+    
+    agreement = get_object_or_404(InternalAgreement, pk=pk)
+    
+    # Verificar permisos de edición
+    if not agreement.can_edit(request.user):
+        messages.error(request, 'No tienes permisos para editar este acuerdo.')
+        return redirect('internal_agreement_detail', pk=pk)
+    
+    if request.method == 'POST':
+        form = InternalAgreementForm(request.POST, instance=agreement, user=request.user)
+        if form.is_valid():
+            # Verificar si se está cambiando el estado que requiere aprobación/rechazo
+            old_status = agreement.status
+            agreement = form.save()
+            
+            # Si cambió a activo, aprobado y no tenía aprobación, registrar aprobación
+            if (old_status not in ['active', 'approved'] and agreement.status in ['active', 'approved'] and 
+                not agreement.approved_by):
+                agreement.approved_by = request.user
+                from django.utils import timezone
+                agreement.approved_date = timezone.now()
+                agreement.save()
+                
+            # Si se rechazó, limpiar datos de aprobación
+            elif agreement.status == 'rejected':
+                agreement.approved_by = None
+                agreement.approved_date = None
+                agreement.save()
+            
+            messages.success(request, f'Acuerdo #{agreement.sequence} actualizado correctamente.')
+            return redirect('internal_agreement_detail', pk=pk)
+    else:
+        form = InternalAgreementForm(instance=agreement, user=request.user)
+    
+    context = {
+        'form': form,
+        'agreement': agreement,
+        'page_title': f'Editar Acuerdo #{agreement.sequence}',
+        'is_create': False,
+    }
+    
+    return render(request, 'tickets/internal_agreement_form.html', context)
+
+
+@login_required
+def internal_agreement_delete(request, pk):
+    """Vista para eliminar un acuerdo interno"""
+    from .models import InternalAgreement
+    
+    agreement = get_object_or_404(InternalAgreement, pk=pk)
+    
+    # Verificar permisos de eliminación
+    if not agreement.can_delete(request.user):
+        messages.error(request, 'No tienes permisos para eliminar este acuerdo.')
+        return redirect('internal_agreement_detail', pk=pk)
+    
+    if request.method == 'POST':
+        sequence = agreement.sequence
+        agreement.delete()
+        messages.success(request, f'Acuerdo #{sequence} eliminado correctamente.')
+        return redirect('internal_agreement_list')
+    
+    context = {
+        'agreement': agreement,
+        'page_title': f'Eliminar Acuerdo #{agreement.sequence}',
+    }
+    
+    return render(request, 'tickets/internal_agreement_confirm_delete.html', context)
+
+
+@login_required
+def internal_agreement_sign(request, pk):
+    """Vista para firmar un acuerdo interno"""
+    from .models import InternalAgreement
+    from .utils import is_agent
+    from django.utils import timezone
+    
+    # Solo agentes y administradores pueden firmar
+    if not (is_agent(request.user) or request.user.is_staff):
+        messages.error(request, 'No tienes permisos para firmar acuerdos internos.')
+        return redirect('dashboard')
+    
+    agreement = get_object_or_404(InternalAgreement, pk=pk)
+    
+    if request.method == 'POST':
+        signer_number = request.POST.get('signer_number')
+        
+        try:
+            signer_number = int(signer_number)
+            if signer_number not in [1, 2]:
+                raise ValueError("Número de firmante inválido")
+        except (ValueError, TypeError):
+            messages.error(request, 'Número de firmante inválido.')
+            return redirect('internal_agreement_detail', pk=pk)
+        
+        # Verificar si el usuario puede firmar
+        if not agreement.can_sign(request.user, signer_number):
+            messages.error(request, 'No tienes permisos para firmar como este firmante o ya has firmado.')
+            return redirect('internal_agreement_detail', pk=pk)
+        
+        # Firmar el acuerdo
+        success = agreement.sign_agreement(request.user, signer_number)
+        
+        if success:
+            # Obtener la fecha/hora de la firma
+            if signer_number == 1:
+                signature_date = agreement.signer_1_date
+            else:
+                signature_date = agreement.signer_2_date
+            
+            # Mensaje de éxito con fecha y hora
+            formatted_date = signature_date.strftime("%d/%m/%Y a las %H:%M")
+            signer_role = "primer" if signer_number == 1 else "segundo"
+            
+            messages.success(
+                request, 
+                f'¡Firma registrada exitosamente! Has firmado el acuerdo como {signer_role} firmante '
+                f'el {formatted_date}.'
+            )
+            
+            # Verificar si el acuerdo está completamente firmado
+            if agreement.is_fully_signed():
+                messages.info(
+                    request,
+                    f'🎉 ¡El acuerdo está completamente firmado! Todos los firmantes requeridos han confirmado su firma.'
+                )
+        else:
+            messages.error(request, 'No se pudo completar la firma. Verifica que tengas permisos.')
+        
+        return redirect('internal_agreement_detail', pk=pk)
+    
+    # Si no es POST, redirigir al detalle
+    return redirect('internal_agreement_detail', pk=pk)
+
+
+# ===== VISTAS DE CAPACITACIÓN =====
+
+@login_required
+def training_plan_list(request):
+    """Vista para listar todos los planes de capacitación"""
+    from .models import TrainingPlan, EmployeeTrainingProgress, EmployeeLinkProgress
+    
+    plans = TrainingPlan.objects.filter(is_active=True).prefetch_related('links')
+    
+    # Agregar progreso del usuario actual para cada plan
+    for plan in plans:
+        # Calcular progreso de forma directa (mismo método que en detail)
+        total_links = plan.get_total_links()
+        completed_links_count = EmployeeLinkProgress.objects.filter(
+            employee=request.user, 
+            link__plan=plan
+        ).count()
+        
+        if total_links > 0:
+            plan.user_progress = (completed_links_count / total_links) * 100
+        else:
+            plan.user_progress = 0
+            
+        plan.is_completed = plan.is_completed_by_user(request.user)
+    
+    context = {
+        'plans': plans,
+        'page_title': 'Planes de Capacitación',
+    }
+    
+    return render(request, 'tickets/training_plan_list.html', context)
+
+
+@login_required
+def training_plan_detail(request, pk):
+    """Vista para ver el detalle de un plan de capacitación"""
+    from .models import TrainingPlan, TrainingLink, EmployeeLinkProgress, EmployeeTrainingProgress
+    
+    plan = get_object_or_404(TrainingPlan, pk=pk, is_active=True)
+    links = plan.links.all()
+    
+    # Obtener o crear progreso del plan para el usuario
+    training_progress, created = EmployeeTrainingProgress.objects.get_or_create(
+        employee=request.user,
+        plan=plan
+    )
+    
+    # Obtener progreso del usuario para cada enlace
+    for link in links:
+        link.is_completed = EmployeeLinkProgress.objects.filter(
+            employee=request.user, 
+            link=link
+        ).exists()
+    
+    # Estadísticas del plan
+    total_links = plan.get_total_links()
+    
+    # Calcular progreso de forma directa
+    completed_links_count = EmployeeLinkProgress.objects.filter(
+        employee=request.user, 
+        link__plan=plan
+    ).count()
+    
+    if total_links > 0:
+        user_progress_percent = (completed_links_count / total_links) * 100
+    else:
+        user_progress_percent = 0
+    
+    is_completed = plan.is_completed_by_user(request.user)
+    
+    context = {
+        'plan': plan,
+        'links': links,
+        'total_links': total_links,
+        'user_progress_percent': user_progress_percent,
+        'is_completed': is_completed,
+        'page_title': f'Plan de Capacitación #{plan.sequence}',
+        'debug_completed_count': completed_links_count,  # Para debug
+    }
+    
+    return render(request, 'tickets/training_plan_detail.html', context)
+
+
+@login_required
+def training_link_complete(request, pk):
+    """Vista para marcar un enlace como completado"""
+    from .models import TrainingLink, EmployeeLinkProgress, EmployeeTrainingProgress
+    
+    if request.method == 'POST':
+        link = get_object_or_404(TrainingLink, pk=pk)
+        notes = request.POST.get('notes', '').strip()
+        
+        # Obtener o crear progreso del plan
+        training_progress, created = EmployeeTrainingProgress.objects.get_or_create(
+            employee=request.user,
+            plan=link.plan
+        )
+        
+        # Crear progreso del enlace si no existe
+        link_progress, created = EmployeeLinkProgress.objects.get_or_create(
+            employee=request.user,
+            link=link,
+            training_progress=training_progress,
+            defaults={'notes': notes}
+        )
+        
+        if not created and notes:
+            link_progress.notes = notes
+        
+        messages.success(request, f'Enlace "{link.title}" marcado como completado.')
+        return redirect('training_plan_detail', pk=link.plan.pk)
+    
+    return redirect('training_plan_list')
+
+
+@login_required
+def training_link_uncomplete(request, pk):
+    """Vista para marcar un enlace como no completado"""
+    from .models import TrainingLink, EmployeeLinkProgress
+    
+    if request.method == 'POST':
+        link = get_object_or_404(TrainingLink, pk=pk)
+        
+        try:
+            progress = EmployeeLinkProgress.objects.get(employee=request.user, link=link)
+            progress.delete()
+            messages.info(request, f'Marcado como pendiente: {link.title}')
+        except EmployeeLinkProgress.DoesNotExist:
+            pass
+        
+        return redirect('training_plan_detail', pk=link.plan.pk)
+    
+    return redirect('training_plan_list')
+
+
+@login_required
+def my_training_progress(request):
+    """Vista para ver el progreso personal de capacitación"""
+    from .models import TrainingPlan, EmployeeTrainingProgress, EmployeeLinkProgress
+    
+    # Obtener todos los planes activos
+    plans = TrainingPlan.objects.filter(is_active=True).prefetch_related('links')
+    
+    progress_data = []
+    for plan in plans:
+        total_links = plan.get_total_links()
+        completed_links = EmployeeLinkProgress.objects.filter(
+            employee=request.user,
+            link__plan=plan
+        ).count()
+        
+        progress_percent = (completed_links / total_links * 100) if total_links > 0 else 0
+        
+        # Obtener o crear progreso del entrenamiento
+        training_progress, created = EmployeeTrainingProgress.objects.get_or_create(
+            employee=request.user,
+            plan=plan
+        )
+        
+        progress_data.append({
+            'plan': plan,
+            'total_links': total_links,
+            'completed_links': completed_links,
+            'pending_links': total_links - completed_links,
+            'progress_percent': progress_percent,
+            'is_completed': progress_percent == 100,
+            'training_progress': training_progress,
+        })
+    
+    # Calcular estadísticas generales
+    total_plans = len(progress_data)
+    completed_plans = sum(1 for data in progress_data if data['is_completed'])
+    in_progress_plans = sum(1 for data in progress_data if 0 < data['progress_percent'] < 100)
+    completion_rate = (completed_plans / total_plans * 100) if total_plans > 0 else 0
+    
+    context = {
+        'progress_data': progress_data,
+        'page_title': 'Mi Progreso de Capacitación',
+        'total_plans': total_plans,
+        'completed_plans': completed_plans,
+        'in_progress_plans': in_progress_plans,
+        'completion_rate': completion_rate,
+    }
+    
+    return render(request, 'tickets/my_training_progress.html', context)
+
+
+# Vistas administrativas (solo para Agentes)
+@login_required
+def training_plan_create(request):
+    """Vista para crear un nuevo plan de capacitación"""
+    from .models import TrainingPlan
+    
+    # Verificar permisos
+    if not (request.user.is_staff or (hasattr(request.user, 'groups') and 
+            request.user.groups.filter(name='Agentes').exists())):
+        messages.error(request, 'No tienes permisos para crear planes de capacitación.')
+        return redirect('training_plan_list')
+    
+    if request.method == 'POST':
+        title = request.POST.get('title', '').strip()
+        description = request.POST.get('description', '').strip()
+        
+        if title and description:
+            plan = TrainingPlan.objects.create(
+                title=title,
+                description=description,
+                created_by=request.user
+            )
+            messages.success(request, f'Plan de capacitación #{plan.sequence} creado exitosamente.')
+            return redirect('training_plan_detail', pk=plan.pk)
+        else:
+            messages.error(request, 'Título y descripción son requeridos.')
+    
+    context = {
+        'page_title': 'Crear Plan de Capacitación',
+    }
+    
+    return render(request, 'tickets/training_plan_form.html', context)
+
+
+@login_required
+def training_plan_edit(request, pk):
+    """Vista para editar un plan de capacitación"""
+    from .models import TrainingPlan
+    
+    # Verificar permisos
+    if not (request.user.is_staff or (hasattr(request.user, 'groups') and 
+            request.user.groups.filter(name='Agentes').exists())):
+        messages.error(request, 'No tienes permisos para editar planes de capacitación.')
+        return redirect('training_plan_list')
+    
+    plan = get_object_or_404(TrainingPlan, pk=pk)
+    
+    if request.method == 'POST':
+        title = request.POST.get('title', '').strip()
+        description = request.POST.get('description', '').strip()
+        is_active = request.POST.get('is_active') == 'on'
+        
+        if title and description:
+            plan.title = title
+            plan.description = description
+            plan.is_active = is_active
+            plan.save()
+            messages.success(request, f'Plan de capacitación #{plan.sequence} actualizado exitosamente.')
+            return redirect('training_plan_detail', pk=plan.pk)
+        else:
+            messages.error(request, 'Título y descripción son requeridos.')
+    
+    context = {
+        'plan': plan,
+        'page_title': f'Editar Plan #{plan.sequence}',
+    }
+    
+    return render(request, 'tickets/training_plan_form.html', context)
+
+
+@login_required
+def training_link_create(request, plan_pk):
+    """Vista para agregar un enlace a un plan de capacitación"""
+    from .models import TrainingPlan, TrainingLink
+    
+    # Verificar permisos
+    if not (request.user.is_staff or (hasattr(request.user, 'groups') and 
+            request.user.groups.filter(name='Agentes').exists())):
+        messages.error(request, 'No tienes permisos para gestionar enlaces de capacitación.')
+        return redirect('training_plan_list')
+    
+    plan = get_object_or_404(TrainingPlan, pk=plan_pk)
+    
+    if request.method == 'POST':
+        title = request.POST.get('title', '').strip()
+        url = request.POST.get('url', '').strip()
+        description = request.POST.get('description', '').strip()
+        is_required = request.POST.get('is_required') == 'on'
+        order = request.POST.get('order', 0)
+        estimated_hours = request.POST.get('estimated_hours', 1)
+        
+        try:
+            order = int(order)
+        except (ValueError, TypeError):
+            order = 0
+        
+        try:
+            estimated_hours = int(estimated_hours)
+        except (ValueError, TypeError):
+            estimated_hours = 1
+        
+        if title and url:
+            training_link = TrainingLink.objects.create(
+                plan=plan,
+                title=title,
+                url=url,
+                description=description,
+                is_required=is_required,
+                order=order,
+                estimated_hours=estimated_hours
+            )
+            messages.success(request, f'Enlace "{title}" agregado al plan exitosamente.')
+            return redirect('training_plan_detail', pk=plan.pk)
+        else:
+            messages.error(request, 'Título y URL son requeridos.')
+    
+    context = {
+        'plan': plan,
+        'page_title': f'Agregar URL al Plan #{plan.sequence}',
+    }
+    
+    return render(request, 'tickets/training_url_form.html', context)
+
+
+@login_required
+def training_link_edit(request, pk):
+    """Vista para editar un enlace de capacitación"""
+    from .models import TrainingLink
+    
+    # Verificar permisos
+    if not (request.user.is_staff or (hasattr(request.user, 'groups') and 
+            request.user.groups.filter(name='Agentes').exists())):
+        messages.error(request, 'No tienes permisos para editar enlaces de capacitación.')
+        return redirect('training_plan_list')
+    
+    training_link = get_object_or_404(TrainingLink, pk=pk)
+    
+    if request.method == 'POST':
+        title = request.POST.get('title', '').strip()
+        url = request.POST.get('url', '').strip()
+        description = request.POST.get('description', '').strip()
+        is_required = request.POST.get('is_required') == 'on'
+        order = request.POST.get('order', 0)
+        estimated_hours = request.POST.get('estimated_hours', 1)
+        
+        try:
+            order = int(order)
+        except (ValueError, TypeError):
+            order = training_link.order
+        
+        try:
+            estimated_hours = int(estimated_hours)
+        except (ValueError, TypeError):
+            estimated_hours = training_link.estimated_hours
+        
+        if title and url:
+            training_link.title = title
+            training_link.url = url
+            training_link.description = description
+            training_link.is_required = is_required
+            training_link.order = order
+            training_link.estimated_hours = estimated_hours
+            training_link.save()
+            messages.success(request, f'Enlace "{title}" actualizado exitosamente.')
+            return redirect('training_plan_detail', pk=training_link.plan.pk)
+        else:
+            messages.error(request, 'Título y URL son requeridos.')
+    
+    context = {
+        'training_link': training_link,
+        'plan': training_link.plan,
+        'page_title': f'Editar Enlace: {training_link.title}',
+    }
+    
+    return render(request, 'tickets/training_link_form.html', context)
+
+
+@login_required
+def training_link_delete(request, pk):
+    """Vista para eliminar un enlace de capacitación"""
+    from .models import TrainingLink
+    
+    # Verificar permisos
+    if not (request.user.is_staff or (hasattr(request.user, 'groups') and 
+            request.user.groups.filter(name='Agentes').exists())):
+        messages.error(request, 'No tienes permisos para eliminar enlaces de capacitación.')
+        return redirect('training_plan_list')
+    
+    training_link = get_object_or_404(TrainingLink, pk=pk)
+    plan_pk = training_link.plan.pk
+    
+    if request.method == 'POST':
+        title = training_link.title
+        training_link.delete()
+        messages.success(request, f'Enlace "{title}" eliminado exitosamente.')
+        return redirect('training_plan_detail', pk=plan_pk)
+    
+    context = {
+        'training_url': training_url,
+        'page_title': f'Eliminar URL: {training_url.title}',
+    }
+    
+    return render(request, 'tickets/training_url_delete.html', context)
+
+
+# ========== VISTAS DE RECOMENDACIONES IA ==========
+
+@login_required
+def ai_recommendation_list(request):
+    """Vista para listar todas las recomendaciones IA"""
+    from .models import AIRecommendation
+    
+    recommendations = AIRecommendation.objects.filter(is_active=True).order_by('-created_at')
+    
+    context = {
+        'recommendations': recommendations,
+        'page_title': 'Recomendaciones IA',
+    }
+    
+    return render(request, 'tickets/ai_recommendation_list.html', context)
+
+
+@login_required
+def ai_recommendation_create(request):
+    """Vista para crear una nueva recomendación IA"""
+    from .models import AIRecommendation
+    
+    if request.method == 'POST':
+        title = request.POST.get('title')
+        context_text = request.POST.get('context_text')
+        
+        if title and context_text:
+            recommendation = AIRecommendation.objects.create(
+                title=title,
+                context_text=context_text,
+                created_by=request.user
+            )
+            messages.success(request, f'Recomendación "{title}" creada exitosamente.')
+            return redirect('ai_recommendation_list')
+        else:
+            messages.error(request, 'Por favor, completa todos los campos requeridos.')
+    
+    context = {
+        'page_title': 'Crear Recomendación IA',
+    }
+    
+    return render(request, 'tickets/ai_recommendation_form.html', context)
+
+
+@login_required
+def ai_recommendation_edit(request, pk):
+    """Vista para editar una recomendación IA"""
+    from .models import AIRecommendation
+    
+    try:
+        recommendation = AIRecommendation.objects.get(pk=pk)
+    except AIRecommendation.DoesNotExist:
+        messages.error(request, 'La recomendación solicitada no existe.')
+        return redirect('ai_recommendation_list')
+    
+    if request.method == 'POST':
+        recommendation.title = request.POST.get('title', recommendation.title)
+        recommendation.context_text = request.POST.get('context_text', recommendation.context_text)
+        recommendation.save()
+        
+        messages.success(request, f'Recomendación "{recommendation.title}" actualizada exitosamente.')
+        return redirect('ai_recommendation_list')
+    
+    context = {
+        'recommendation': recommendation,
+        'page_title': f'Editar Recomendación: {recommendation.title}',
+    }
+    
+    return render(request, 'tickets/ai_recommendation_form.html', context)
+
+
+@login_required
+def ai_recommendation_detail(request, pk):
+    """Vista para ver el detalle de una recomendación y usar la IA"""
+    from .models import AIRecommendation, AIRecommendationUsage
+    from .ai_utils import AIContentOptimizer
+    
+    try:
+        recommendation = AIRecommendation.objects.get(pk=pk)
+    except AIRecommendation.DoesNotExist:
+        messages.error(request, 'La recomendación solicitada no existe.')
+        return redirect('ai_recommendation_list')
+    
+    ai_response = None
+    client_case = ""
+    
+    if request.method == 'POST':
+        client_case = request.POST.get('client_case', '').strip()
+        
+        if client_case:
+            # Crear instancia del optimizador de IA
+            ai_optimizer = AIContentOptimizer()
+            
+            # Preparar el prompt para la IA
+            messages_for_ai = [
+                {
+                    "role": "system",
+                    "content": f"""Eres un asistente experto en comunicación empresarial y atención al cliente. 
+                    
+CONTEXTO BASE:
+{recommendation.context_text}
+
+Tu tarea es generar una respuesta profesional, políticamente correcta y empática para el caso del cliente que se te presente. 
+La respuesta debe ser:
+- Profesional y respetuosa
+- Empática con la situación del cliente
+- Clara y concisa
+- Orientada a soluciones
+- Políticamente correcta
+- Apropiada para comunicación por email
+
+Responde únicamente con la sugerencia de respuesta, sin explicaciones adicionales."""
+                },
+                {
+                    "role": "user", 
+                    "content": f"Caso del cliente: {client_case}"
+                }
+            ]
+            
+            # Hacer la petición a la IA
+            result = ai_optimizer._make_ai_request(messages_for_ai, max_tokens=800, temperature=0.7)
+            
+            if 'error' not in result:
+                try:
+                    ai_response = result['choices'][0]['message']['content'].strip()
+                    
+                    # Guardar el uso de la recomendación
+                    AIRecommendationUsage.objects.create(
+                        recommendation=recommendation,
+                        user=request.user,
+                        client_case=client_case,
+                        ai_response=ai_response
+                    )
+                    
+                    messages.success(request, 'Respuesta generada exitosamente.')
+                    
+                except (KeyError, IndexError) as e:
+                    messages.error(request, 'Error al procesar la respuesta de la IA.')
+                    ai_response = "Error al generar la respuesta. Por favor, intenta nuevamente."
+            else:
+                messages.error(request, f'Error de IA: {result["error"]}')
+                ai_response = "Error al conectar con el servicio de IA. Verifica la configuración."
+        else:
+            messages.error(request, 'Por favor, ingresa el caso del cliente.')
+    
+    # Obtener el historial de usos recientes
+    recent_usage = AIRecommendationUsage.objects.filter(
+        recommendation=recommendation
+    ).order_by('-created_at')[:5]
+    
+    context = {
+        'recommendation': recommendation,
+        'ai_response': ai_response,
+        'client_case': client_case,
+        'recent_usage': recent_usage,
+        'page_title': f'Asistente IA: {recommendation.title}',
+    }
+    
+    return render(request, 'tickets/ai_recommendation_detail.html', context)
+
+
+@login_required
+def ai_recommendation_delete(request, pk):
+    """Vista para eliminar una recomendación IA"""
+    from .models import AIRecommendation
+    
+    try:
+        recommendation = AIRecommendation.objects.get(pk=pk)
+    except AIRecommendation.DoesNotExist:
+        messages.error(request, 'La recomendación solicitada no existe.')
+        return redirect('ai_recommendation_list')
+    
+    if request.method == 'POST':
+        title = recommendation.title
+        recommendation.delete()
+        messages.success(request, f'Recomendación "{title}" eliminada exitosamente.')
+        return redirect('ai_recommendation_list')
+    
+    context = {
+        'recommendation': recommendation,
+        'page_title': f'Eliminar Recomendación: {recommendation.title}',
+    }
+    
+    return render(request, 'tickets/ai_recommendation_delete.html', context)
+
+
+# ========== VISTAS DE AUSENCIAS DE EMPLEADOS ==========
+
+@login_required
+def employee_absence_list(request):
+    """Vista para listar ausencias de empleados"""
+    from .models import EmployeeAbsence, AbsenceType
+    from django.db.models import Q
+    from datetime import datetime, timedelta
+    from django.utils import timezone
+    
+    # Filtros
+    employee_filter = request.GET.get('employee', '')
+    type_filter = request.GET.get('type', '')
+    status_filter = request.GET.get('status', '')
+    date_from = request.GET.get('date_from', '')
+    date_to = request.GET.get('date_to', '')
+    
+    # Obtener todas las ausencias
+    absences = EmployeeAbsence.objects.select_related('employee', 'absence_type', 'approved_by')
+    
+    # Aplicar filtros
+    if employee_filter:
+        absences = absences.filter(
+            Q(employee__username__icontains=employee_filter) |
+            Q(employee__first_name__icontains=employee_filter) |
+            Q(employee__last_name__icontains=employee_filter)
+        )
+    
+    if type_filter:
+        absences = absences.filter(absence_type_id=type_filter)
+    
+    if status_filter:
+        absences = absences.filter(status=status_filter)
+    
+    if date_from:
+        try:
+            date_from_obj = datetime.strptime(date_from, '%Y-%m-%d').date()
+            absences = absences.filter(start_date__gte=date_from_obj)
+        except ValueError:
+            pass
+    
+    if date_to:
+        try:
+            date_to_obj = datetime.strptime(date_to, '%Y-%m-%d').date()
+            absences = absences.filter(end_date__lte=date_to_obj)
+        except ValueError:
+            pass
+    
+    # Obtener tipos de ausencias para el filtro
+    absence_types = AbsenceType.objects.filter(is_active=True)
+    
+    # Datos adicionales para reportes PDF
+    from django.contrib.auth.models import User
+    all_employees = User.objects.filter(is_active=True).order_by('first_name', 'last_name', 'username')
+    
+    current_year = timezone.now().year
+    current_month = timezone.now().month
+    years_range = range(current_year - 2, current_year + 1)  # Últimos 2 años y año actual
+    
+    # Estadísticas rápidas
+    today = timezone.now().date()
+    current_absences = EmployeeAbsence.objects.filter(
+        start_date__lte=today,
+        end_date__gte=today,
+        status='approved'
+    ).count()
+    
+    pending_approvals = EmployeeAbsence.objects.filter(status='pending').count()
+    
+    context = {
+        'absences': absences,
+        'absence_types': absence_types,
+        'all_employees': all_employees,
+        'current_year': current_year,
+        'current_month': current_month,
+        'years_range': years_range,
+        'current_absences': current_absences,
+        'pending_approvals': pending_approvals,
+        'employee_filter': employee_filter,
+        'type_filter': type_filter,
+        'status_filter': status_filter,
+        'date_from': date_from,
+        'date_to': date_to,
+        'page_title': 'Gestión de Ausencias',
+    }
+    
+    return render(request, 'tickets/employee_absence_list.html', context)
+
+
+@login_required
+def employee_absence_create(request):
+    """Vista para crear una nueva ausencia"""
+    from .models import EmployeeAbsence, AbsenceType
+    from django.contrib.auth.models import User
+    
+    if request.method == 'POST':
+        employee_id = request.POST.get('employee')
+        absence_type_id = request.POST.get('absence_type')
+        start_date = request.POST.get('start_date')
+        end_date = request.POST.get('end_date')
+        reason = request.POST.get('reason')
+        lost_hours = request.POST.get('lost_hours', 0)
+        documentation_file = request.FILES.get('documentation_file')
+        
+        try:
+            # Convertir horas perdidas
+            try:
+                lost_hours = float(lost_hours) if lost_hours else 0.0
+            except ValueError:
+                lost_hours = 0.0
+            
+            employee = User.objects.get(id=employee_id)
+            absence_type = AbsenceType.objects.get(id=absence_type_id)
+            
+            absence = EmployeeAbsence.objects.create(
+                employee=employee,
+                absence_type=absence_type,
+                start_date=start_date,
+                end_date=end_date,
+                reason=reason,
+                lost_hours=lost_hours,
+                documentation_file=documentation_file
+            )
+            
+            messages.success(request, f'Ausencia registrada para {employee.get_full_name() or employee.username}.')
+            return redirect('employee_absence_list')
+            
+        except (User.DoesNotExist, AbsenceType.DoesNotExist) as e:
+            messages.error(request, 'Error en los datos seleccionados.')
+        except Exception as e:
+            messages.error(request, f'Error al crear la ausencia: {str(e)}')
+    
+    # Obtener empleados y tipos de ausencias
+    employees = User.objects.filter(is_active=True).order_by('first_name', 'last_name', 'username')
+    absence_types = AbsenceType.objects.filter(is_active=True)
+    
+    context = {
+        'employees': employees,
+        'absence_types': absence_types,
+        'page_title': 'Registrar Nueva Ausencia',
+    }
+    
+    return render(request, 'tickets/employee_absence_form.html', context)
+
+
+@login_required
+def employee_absence_detail(request, pk):
+    """Vista para ver el detalle de una ausencia"""
+    from .models import EmployeeAbsence
+    
+    try:
+        absence = EmployeeAbsence.objects.select_related(
+            'employee', 'absence_type', 'approved_by'
+        ).get(pk=pk)
+    except EmployeeAbsence.DoesNotExist:
+        messages.error(request, 'La ausencia solicitada no existe.')
+        return redirect('employee_absence_list')
+    
+    context = {
+        'absence': absence,
+        'page_title': f'Ausencia de {absence.employee.get_full_name() or absence.employee.username}',
+    }
+    
+    return render(request, 'tickets/employee_absence_detail.html', context)
+
+
+@login_required
+def employee_absence_edit(request, pk):
+    """Vista para editar una ausencia"""
+    from .models import EmployeeAbsence, AbsenceType
+    from django.contrib.auth.models import User
+    
+    try:
+        absence = EmployeeAbsence.objects.get(pk=pk)
+    except EmployeeAbsence.DoesNotExist:
+        messages.error(request, 'La ausencia solicitada no existe.')
+        return redirect('employee_absence_list')
+    
+    if request.method == 'POST':
+        absence.employee_id = request.POST.get('employee')
+        absence.absence_type_id = request.POST.get('absence_type')
+        absence.start_date = request.POST.get('start_date')
+        absence.end_date = request.POST.get('end_date')
+        absence.reason = request.POST.get('reason')
+        
+        # Actualizar horas perdidas
+        lost_hours = request.POST.get('lost_hours', 0)
+        try:
+            absence.lost_hours = float(lost_hours) if lost_hours else 0.0
+        except ValueError:
+            absence.lost_hours = 0.0
+        
+        if request.FILES.get('documentation_file'):
+            absence.documentation_file = request.FILES.get('documentation_file')
+        
+        try:
+            absence.save()
+            messages.success(request, 'Ausencia actualizada exitosamente.')
+            return redirect('employee_absence_detail', pk=absence.pk)
+        except Exception as e:
+            messages.error(request, f'Error al actualizar la ausencia: {str(e)}')
+    
+    # Obtener empleados y tipos de ausencias
+    employees = User.objects.filter(is_active=True).order_by('first_name', 'last_name', 'username')
+    absence_types = AbsenceType.objects.filter(is_active=True)
+    
+    context = {
+        'absence': absence,
+        'employees': employees,
+        'absence_types': absence_types,
+        'page_title': f'Editar Ausencia de {absence.employee.get_full_name() or absence.employee.username}',
+    }
+    
+    return render(request, 'tickets/employee_absence_form.html', context)
+
+
+@login_required
+def employee_absence_approve(request, pk):
+    """Vista para aprobar una ausencia"""
+    from .models import EmployeeAbsence
+    
+    try:
+        absence = EmployeeAbsence.objects.get(pk=pk)
+    except EmployeeAbsence.DoesNotExist:
+        messages.error(request, 'La ausencia solicitada no existe.')
+        return redirect('employee_absence_list')
+    
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        
+        if action == 'approve':
+            absence.approve(request.user)
+            messages.success(request, f'Ausencia de {absence.employee.get_full_name() or absence.employee.username} aprobada.')
+        
+        elif action == 'reject':
+            rejection_reason = request.POST.get('rejection_reason', '')
+            if rejection_reason:
+                absence.reject(rejection_reason, request.user)
+                messages.success(request, f'Ausencia de {absence.employee.get_full_name() or absence.employee.username} rechazada.')
+            else:
+                messages.error(request, 'Debes proporcionar un motivo para el rechazo.')
+                return redirect('employee_absence_detail', pk=pk)
+        
+        return redirect('employee_absence_detail', pk=pk)
+    
+    return redirect('employee_absence_detail', pk=pk)
+
+
+@login_required
+def employee_absence_delete(request, pk):
+    """Vista para eliminar una ausencia"""
+    from .models import EmployeeAbsence
+    
+    try:
+        absence = EmployeeAbsence.objects.get(pk=pk)
+    except EmployeeAbsence.DoesNotExist:
+        messages.error(request, 'La ausencia solicitada no existe.')
+        return redirect('employee_absence_list')
+    
+    if request.method == 'POST':
+        employee_name = absence.employee.get_full_name() or absence.employee.username
+        absence.delete()
+        messages.success(request, f'Ausencia de {employee_name} eliminada exitosamente.')
+        return redirect('employee_absence_list')
+    
+    context = {
+        'absence': absence,
+        'page_title': f'Eliminar Ausencia de {absence.employee.get_full_name() or absence.employee.username}',
+    }
+    
+    return render(request, 'tickets/employee_absence_delete.html', context)
+
+
+@login_required
+def employee_absence_calendar(request):
+    """Vista de calendario de ausencias"""
+    from .models import EmployeeAbsence
+    from datetime import datetime, timedelta
+    from django.utils import timezone
+    import calendar
+    import json
+    
+    # Obtener mes y año de los parámetros o usar el mes actual
+    now = timezone.now()
+    year = int(request.GET.get('year', now.year))
+    month = int(request.GET.get('month', now.month))
+    
+    # Crear objeto fecha para el mes solicitado
+    try:
+        current_date = datetime(year, month, 1).date()
+    except ValueError:
+        current_date = now.date().replace(day=1)
+        year = current_date.year
+        month = current_date.month
+    
+    # Calcular fechas de inicio y fin del mes
+    first_day = current_date
+    if month == 12:
+        last_day = current_date.replace(year=year+1, month=1, day=1) - timedelta(days=1)
+    else:
+        last_day = current_date.replace(month=month+1, day=1) - timedelta(days=1)
+    
+    # Obtener ausencias del mes
+    absences = EmployeeAbsence.objects.filter(
+        start_date__lte=last_day,
+        end_date__gte=first_day,
+        status='approved'
+    ).select_related('employee', 'absence_type')
+    
+    # Preparar datos para el calendario
+    calendar_data = []
+    for absence in absences:
+        calendar_data.append({
+            'id': absence.id,
+            'title': f"{absence.employee.get_full_name() or absence.employee.username} - {absence.absence_type.name}",
+            'start': absence.start_date.isoformat(),
+            'end': (absence.end_date + timedelta(days=1)).isoformat(),  # FullCalendar usa fin exclusivo
+            'color': absence.absence_type.color,
+            'url': f"/employee-absences/{absence.id}/",
+        })
+    
+    # Navegación del calendario
+    prev_month = month - 1 if month > 1 else 12
+    prev_year = year if month > 1 else year - 1
+    next_month = month + 1 if month < 12 else 1
+    next_year = year if month < 12 else year + 1
+    
+    context = {
+        'calendar_data': json.dumps(calendar_data),
+        'current_month': calendar.month_name[month],
+        'current_year': year,
+        'prev_month': prev_month,
+        'prev_year': prev_year,
+        'next_month': next_month,
+        'next_year': next_year,
+        'page_title': f'Calendario de Ausencias - {calendar.month_name[month]} {year}',
+    }
+    
+    return render(request, 'tickets/employee_absence_calendar.html', context)
+
+
+@login_required
+def employee_absence_report_pdf(request):
+    """Vista para generar reporte PDF de ausencias por empleado y mes"""
+    from django.http import HttpResponse
+    from reportlab.platypus import Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.graphics.shapes import Drawing, Line
+    import calendar
+    from .pdf_service import pdf_response, pdf_style, render_pdf
+    from datetime import datetime, timedelta
+    from .models import EmployeeAbsence, AbsenceType
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+    
+    # Obtener parámetros
+    employee_id = request.GET.get('employee_id')
+    year = int(request.GET.get('year', timezone.now().year))
+    month = int(request.GET.get('month', timezone.now().month))
+    
+    # Validar empleado
+    try:
+        employee = User.objects.get(id=employee_id) if employee_id else None
+    except User.DoesNotExist:
+        employee = None
+    
+    if not employee:
+        return HttpResponse('Empleado no encontrado', status=404)
+    
+    # Calcular fechas del mes
+    try:
+        first_day = datetime(year, month, 1).date()
+        if month == 12:
+            last_day = datetime(year + 1, 1, 1).date() - timedelta(days=1)
+        else:
+            last_day = datetime(year, month + 1, 1).date() - timedelta(days=1)
+    except ValueError:
+        first_day = timezone.now().date().replace(day=1)
+        last_day = first_day.replace(day=calendar.monthrange(first_day.year, first_day.month)[1])
+    
+    # Obtener ausencias del empleado en el mes (una sola consulta: los totales se calculan en memoria)
+    absences = list(EmployeeAbsence.objects.filter(
+        employee=employee,
+        start_date__lte=last_day,
+        end_date__gte=first_day
+    ).select_related('absence_type', 'approved_by').order_by('start_date'))
+    
+    # Estilos
+    title_style = pdf_style('AbsenceReportTitle', 'Heading1', fontSize=18, spaceAfter=20, alignment=1,
+                            textColor=colors.darkblue)
+    subtitle_style = pdf_style('AbsenceReportSubtitle', 'Heading2', fontSize=14, spaceAfter=15,
+                               textColor=colors.darkblue)
+    normal_style = pdf_style('AbsenceReportNormal', fontSize=10, spaceAfter=6)
+    
+    # Contenido del PDF
+    story = []
+    
+    # Título
+    month_name = calendar.month_name[month]
+    title = Paragraph(f"Reporte de Ausencias", title_style)
+    subtitle = Paragraph(f"{employee.get_full_name() or employee.username}", subtitle_style)
+    period = Paragraph(f"Período: {month_name} {year}", normal_style)
+    
+    story.append(title)
+    story.append(subtitle)
+    story.append(period)
+    story.append(Spacer(1, 20))
+    
+    # Información del empleado
+    employee_info = [
+        ['Información del Empleado', ''],
+        ['Nombre:', employee.get_full_name() or employee.username],
+        ['Usuario:', employee.username],
+        ['Email:', employee.email or 'No registrado'],
+        ['Fecha del reporte:', timezone.now().strftime('%d/%m/%Y %H:%M')]
+    ]
+    
+    employee_table = Table(employee_info, colWidths=[2*inch, 3*inch])
+    employee_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (1, 0), colors.lightblue),
+        ('TEXTCOLOR', (0, 0), (1, 0), colors.darkblue),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (1, 0), 12),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('BOTTOMPADING', (0, 0), (-1, 0), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ]))
+    
+    story.append(employee_table)
+    story.append(Spacer(1, 20))
+    
+    # Resumen estadístico
+    total_days = sum(absence.get_duration_days() for absence in absences)
+    total_hours = sum(float(absence.lost_hours) for absence in absences)
+    approved_count = sum(1 for absence in absences if absence.status == 'approved')
+    pending_count = sum(1 for absence in absences if absence.status == 'pending')
+    rejected_count = sum(1 for absence in absences if absence.status == 'rejected')
+    
+    summary_info = [
+        ['Resumen del Mes', ''],
+        ['Total de ausencias:', str(len(absences))],
+        ['Días de ausencia:', str(total_days)],
+        ['Horas perdidas:', f"{total_hours:.1f} horas"],
+        ['Aprobadas:', str(approved_count)],
+        ['Pendientes:', str(pending_count)],
+        ['Rechazadas:', str(rejected_count)]
+    ]
+    
+    summary_table = Table(summary_info, colWidths=[2*inch, 1.5*inch])
+    summary_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (1, 0), colors.lightgreen),
+        ('TEXTCOLOR', (0, 0), (1, 0), colors.darkgreen),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (1, 0), 12),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ]))
+    
+    story.append(summary_table)
+    story.append(Spacer(1, 20))
+    
+    # Detalle de ausencias
+    if absences:
+        story.append(Paragraph("Detalle de Ausencias", subtitle_style))
+        story.append(Spacer(1, 10))
+        
+        # Crear tabla de ausencias
+        absence_data = [['Tipo', 'Fechas', 'Días', 'Horas', 'Estado', 'Motivo']]
+        
+        for absence in absences:
+            # Formatear fechas
+            if absence.start_date == absence.end_date:
+                dates = absence.start_date.strftime('%d/%m/%Y')
+            else:
+                dates = f"{absence.start_date.strftime('%d/%m/%Y')} - {absence.end_date.strftime('%d/%m/%Y')}"
+            
+            # Truncar motivo si es muy largo
+            reason = absence.reason[:40] + '...' if len(absence.reason) > 40 else absence.reason
+            
+            absence_data.append([
+                absence.absence_type.name,
+                dates,
+                str(absence.get_duration_days()),
+                f"{absence.lost_hours} h",
+                absence.get_status_display(),
+                reason
+            ])
+        
+        absence_table = Table(absence_data, colWidths=[1.3*inch, 1.6*inch, 0.6*inch, 0.7*inch, 0.9*inch, 1.9*inch])
+        absence_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]))
+        
+        story.append(absence_table)
+        story.append(Spacer(1, 20))
+        
+        # Detalle completo de cada ausencia
+        story.append(Paragraph("Información Detallada", subtitle_style))
+        story.append(Spacer(1, 10))
+        
+        for i, absence in enumerate(absences):
+            if i > 0:
+                story.append(Spacer(1, 15))
+            
+            # Información detallada de la ausencia
+            detail_info = [
+                [f'Ausencia #{i+1}', ''],
+                ['Tipo:', absence.absence_type.name],
+                ['Inicio:', absence.start_date.strftime('%d/%m/%Y')],
+                ['Fin:', absence.end_date.strftime('%d/%m/%Y')],
+                ['Duración:', f'{absence.get_duration_days()} día{"s" if absence.get_duration_days() != 1 else ""}'],
+                ['Horas perdidas:', f'{absence.lost_hours} horas'],
+                ['Estado:', absence.get_status_display()],
+                ['Solicitada:', absence.created_at.strftime('%d/%m/%Y %H:%M')],
+            ]
+            
+            if absence.approved_by:
+                detail_info.append(['Gestionada por:', absence.approved_by.get_full_name() or absence.approved_by.username])
+                detail_info.append(['Fecha gestión:', absence.approved_at.strftime('%d/%m/%Y %H:%M')])
+            
+            detail_table = Table(detail_info, colWidths=[1.5*inch, 4*inch])
+            detail_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (1, 0), colors.lightcyan),
+                ('TEXTCOLOR', (0, 0), (1, 0), colors.darkblue),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (1, 0), 11),
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 1), (-1, -1), 9),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ]))
+            
+            story.append(detail_table)
+            
+            # Motivo
+            story.append(Spacer(1, 5))
+            motivo_para = Paragraph(f"<b>Motivo:</b> {absence.reason}", normal_style)
+            story.append(motivo_para)
+            
+            # Motivo de rechazo si aplica
+            if absence.rejection_reason:
+                rejection_para = Paragraph(f"<b>Motivo de rechazo:</b> {absence.rejection_reason}", normal_style)
+                story.append(rejection_para)
+            
+            # Separador entre ausencias
+            if i < len(absences) - 1:
+                story.append(Spacer(1, 10))
+                # Línea separadora
+                drawing = Drawing(400, 1)
+                drawing.add(Line(0, 0, 400, 0))
+                story.append(drawing)
+    
+    else:
+        story.append(Paragraph("No se registraron ausencias en este período", normal_style))
+    
+    # Pie de página
+    story.append(Spacer(1, 30))
+    footer = Paragraph(
+        f"Reporte generado el {timezone.now().strftime('%d/%m/%Y a las %H:%M')} | Sistema de Gestión de Ausencias",
+        pdf_style('AbsenceReportFooter', fontSize=8, textColor=colors.grey, alignment=1)
+    )
+    story.append(footer)
+    
+    # Nombre del archivo
+    employee_name = (employee.get_full_name() or employee.username).replace(' ', '_')
+    filename = f"ausencias_{employee_name}_{month_name}_{year}.pdf"
+    return pdf_response(render_pdf(story), filename)
+
+
+# ==================== VISTAS DE PROTOCOLOS DE EMPRESA ====================
+
+@login_required
+def company_protocol_list(request):
+    """Vista para listar protocolos de empresa"""
+    from .models import CompanyProtocol
+    from django.db.models import Q
+    
+    # Filtros
+    search = request.GET.get('search', '')
+    active_filter = request.GET.get('active', 'all')
+    
+    # Obtener protocolos
+    protocols = CompanyProtocol.objects.all()
+    
+    # Aplicar filtros
+    if search:
+        protocols = protocols.filter(
+            Q(title__icontains=search) | Q(content__icontains=search)
+        )
+    
+    if active_filter == 'active':
+        protocols = protocols.filter(is_active=True)
+    elif active_filter == 'inactive':
+        protocols = protocols.filter(is_active=False)
+    
+    protocols = protocols.select_related('created_by').order_by('-created_at')
+    
+    context = {
+        'protocols': protocols,
+        'search': search,
+        'active_filter': active_filter,
+        'page_title': 'Protocolos de Empresa',
+    }
+    
+    return render(request, 'tickets/company_protocol_list.html', context)
+
+
+@login_required
+def company_protocol_create(request):
+    """Vista para crear un nuevo protocolo"""
+    from .models import CompanyProtocol, Company
+    
+    if request.method == 'POST':
+        title = request.POST.get('title')
+        content = request.POST.get('content')
+        company_id = request.POST.get('company')
+        version = request.POST.get('version', '1.0')
+        is_active = request.POST.get('is_active') == 'on'
+        
+        # Validaciones básicas
+        if not all([title, content, company_id]):
+            messages.error(request, 'El título, contenido y empresa son requeridos.')
+        else:
+            try:
+                company = Company.objects.get(pk=company_id)
+                protocol = CompanyProtocol.objects.create(
+                    title=title,
+                    content=content,
+                    company=company,
+                    version=version,
+                    is_active=is_active,
+                    created_by=request.user
+                )
+                
+                messages.success(request, f'Protocolo "{protocol.title}" creado exitosamente.')
+                return redirect('company_protocol_detail', pk=protocol.pk)
+                
+            except Company.DoesNotExist:
+                messages.error(request, 'La empresa seleccionada no existe.')
+            except Exception as e:
+                messages.error(request, f'Error al crear el protocolo: {str(e)}')
+    
+    # Obtener todas las empresas para el formulario
+    companies = Company.objects.all().order_by('name')
+    
+    context = {
+        'page_title': 'Crear Protocolo de Empresa',
+        'companies': companies,
+    }
+    
+    return render(request, 'tickets/company_protocol_form.html', context)
+
+
+@login_required
+def company_protocol_detail(request, pk):
+    """Vista para ver el detalle de un protocolo"""
+    from .models import CompanyProtocol
+    
+    try:
+        protocol = CompanyProtocol.objects.select_related('created_by').get(pk=pk)
+    except CompanyProtocol.DoesNotExist:
+        messages.error(request, 'El protocolo solicitado no existe.')
+        return redirect('company_protocol_list')
+    
+    context = {
+        'protocol': protocol,
+        'page_title': f'Protocolo: {protocol.title}',
+    }
+    
+    return render(request, 'tickets/company_protocol_detail.html', context)
+
+
+@login_required
+def company_protocol_edit(request, pk):
+    """Vista para editar un protocolo"""
+    from .models import CompanyProtocol, Company
+    
+    try:
+        protocol = CompanyProtocol.objects.get(pk=pk)
+    except CompanyProtocol.DoesNotExist:
+        messages.error(request, 'El protocolo solicitado no existe.')
+        return redirect('company_protocol_list')
+    
+    if request.method == 'POST':
+        protocol.title = request.POST.get('title', protocol.title)
+        protocol.content = request.POST.get('content', protocol.content)
+        company_id = request.POST.get('company')
+        protocol.version = request.POST.get('version', protocol.version)
+        protocol.is_active = request.POST.get('is_active') == 'on'
+        
+        if company_id:
+            try:
+                protocol.company = Company.objects.get(pk=company_id)
+            except Company.DoesNotExist:
+                messages.error(request, 'La empresa seleccionada no existe.')
+                return render(request, 'tickets/company_protocol_form.html', {
+                    'protocol': protocol,
+                    'companies': Company.objects.all().order_by('name'),
+                    'page_title': f'Editar Protocolo: {protocol.title}',
+                })
+        
+        try:
+            protocol.save()
+            messages.success(request, 'Protocolo actualizado exitosamente.')
+            return redirect('company_protocol_detail', pk=protocol.pk)
+        except Exception as e:
+            messages.error(request, f'Error al actualizar el protocolo: {str(e)}')
+    
+    # Obtener todas las empresas para el formulario
+    companies = Company.objects.all().order_by('name')
+    
+    context = {
+        'protocol': protocol,
+        'companies': companies,
+        'page_title': f'Editar Protocolo: {protocol.title}',
+    }
+    
+    return render(request, 'tickets/company_protocol_form.html', context)
+
+
+@login_required
+def company_protocol_delete(request, pk):
+    """Vista para eliminar un protocolo"""
+    from .models import CompanyProtocol
+    
+    try:
+        protocol = CompanyProtocol.objects.get(pk=pk)
+    except CompanyProtocol.DoesNotExist:
+        messages.error(request, 'El protocolo solicitado no existe.')
+        return redirect('company_protocol_list')
+    
+    if request.method == 'POST':
+        protocol_title = protocol.title
+        protocol.delete()
+        messages.success(request, f'Protocolo "{protocol_title}" eliminado exitosamente.')
+        return redirect('company_protocol_list')
+    
+    context = {
+        'protocol': protocol,
+        'page_title': f'Eliminar Protocolo: {protocol.title}',
+    }
+    
+    return render(request, 'tickets/company_protocol_delete.html', context)
+
+
+@login_required
+def company_protocol_print_pdf(request, pk):
+    """Vista para imprimir protocolo en PDF"""
+    from django.http import HttpResponse
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    import io
+    from .models import CompanyProtocol
+    from django.utils import timezone
+    
+    try:
+        protocol = CompanyProtocol.objects.select_related('created_by').get(pk=pk)
+    except CompanyProtocol.DoesNotExist:
+        return HttpResponse('Protocolo no encontrado', status=404)
+    
+    # Crear PDF
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
+    
+    # Estilos
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=20,
+        spaceAfter=30,
+        alignment=1,  # Centrado
+        textColor=colors.darkblue,
+        fontName='Helvetica-Bold'
+    )
+    
+    subtitle_style = ParagraphStyle(
+        'CustomSubtitle',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=20,
+        textColor=colors.darkblue,
+        fontName='Helvetica-Bold'
+    )
+    
+    content_style = ParagraphStyle(
+        'CustomContent',
+        parent=styles['Normal'],
+        fontSize=11,
+        spaceAfter=12,
+        alignment=0,  # Justificado
+        fontName='Helvetica'
+    )
+    
+    meta_style = ParagraphStyle(
+        'MetaStyle',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=colors.grey,
+        spaceAfter=6
+    )
+    
+    # Contenido del PDF
+    story = []
+    
+    # Encabezado de empresa
+    company_header = Paragraph("PROTOCOLO DE EMPRESA", title_style)
+    story.append(company_header)
+    story.append(Spacer(1, 20))
+    
+    # Título del protocolo
+    protocol_title = Paragraph(protocol.title, subtitle_style)
+    story.append(protocol_title)
+    story.append(Spacer(1, 15))
+    
+    # Información del protocolo
+    meta_info = f"""
+    <b>Empresa:</b> {protocol.company.name if protocol.company else 'No asignada'}<br/>
+    <b>Versión:</b> {protocol.version}<br/>
+    <b>Creado por:</b> {protocol.created_by.get_full_name() or protocol.created_by.username}<br/>
+    <b>Fecha de creación:</b> {protocol.created_at.strftime('%d/%m/%Y %H:%M')}<br/>
+    <b>Última actualización:</b> {protocol.updated_at.strftime('%d/%m/%Y %H:%M')}<br/>
+    <b>Estado:</b> {'Activo' if protocol.is_active else 'Inactivo'}<br/>
+    <b>Palabras:</b> {protocol.get_word_count()}
+    """
+    story.append(Paragraph(meta_info, meta_style))
+    story.append(Spacer(1, 30))
+    
+    # Línea separadora
+    from reportlab.graphics.shapes import Drawing, Line
+    drawing = Drawing(400, 2)
+    drawing.add(Line(0, 1, 400, 1, strokeColor=colors.darkblue, strokeWidth=2))
+    story.append(drawing)
+    story.append(Spacer(1, 20))
+    
+    # Contenido del protocolo
+    # Dividir el contenido en párrafos
+    content_paragraphs = protocol.content.split('\n')
+    
+    for paragraph_text in content_paragraphs:
+        if paragraph_text.strip():  # Solo agregar párrafos no vacíos
+            # Escapar caracteres especiales para ReportLab
+            paragraph_text = paragraph_text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            paragraph = Paragraph(paragraph_text, content_style)
+            story.append(paragraph)
+        else:
+            # Agregar espacio para párrafos vacíos
+            story.append(Spacer(1, 12))
+    
+    # Pie de página
+    story.append(Spacer(1, 40))
+    
+    # Línea separadora final
+    drawing_footer = Drawing(400, 2)
+    drawing_footer.add(Line(0, 1, 400, 1, strokeColor=colors.lightgrey, strokeWidth=1))
+    story.append(drawing_footer)
+    story.append(Spacer(1, 10))
+    
+    footer_text = f"""
+    <i>Documento generado el {timezone.now().strftime('%d/%m/%Y a las %H:%M')} | 
+    Sistema de Gestión de Protocolos Empresariales</i>
+    """
+    footer = Paragraph(footer_text, ParagraphStyle(
+        'Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.grey,
+        alignment=1  # Centrado
+    ))
+    story.append(footer)
+    
+    # Construir PDF
+    doc.build(story)
+    
+    # Preparar respuesta
+    buffer.seek(0)
+    response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
+    
+    # Nombre del archivo
+    protocol_name = protocol.title.replace(' ', '_').replace('/', '_')
+    filename = f"protocolo_{protocol_name}_v{protocol.version}.pdf"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    
+    return response
+
+
+# ================================
+# VISTAS API DE IA PARA PROTOCOLOS
+# ================================
+
+@login_required
+def company_protocol_ai_generate_content(request, pk):
+    """API para generar contenido del protocolo con IA"""
+    from django.http import JsonResponse
+    from .models import CompanyProtocol
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'})
+    
+    try:
+        protocol = CompanyProtocol.objects.get(pk=pk)
+    except CompanyProtocol.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Protocolo no encontrado'})
+    
+    content_type = request.POST.get('content_type', 'comprehensive')
+    result = protocol.generate_ai_content(content_type)
+    
+    return JsonResponse(result)
+
+
+@login_required
+def company_protocol_ai_analyze_readability(request, pk):
+    """API para analizar legibilidad del protocolo"""
+    from django.http import JsonResponse
+    from .models import CompanyProtocol
+    
+    try:
+        protocol = CompanyProtocol.objects.get(pk=pk)
+    except CompanyProtocol.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Protocolo no encontrado'})
+    
+    result = protocol.analyze_readability()
+    return JsonResponse(result)
+
+
+@login_required
+def company_protocol_ai_get_suggestions(request, pk):
+    """API para obtener sugerencias de mejora con IA"""
+    from django.http import JsonResponse
+    from .models import CompanyProtocol
+    
+    try:
+        protocol = CompanyProtocol.objects.get(pk=pk)
+    except CompanyProtocol.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Protocolo no encontrado'})
+    
+    result = protocol.get_ai_suggestions()
+    return JsonResponse(result)
+
+
+@login_required
+def company_protocol_ai_generate_summary(request, pk):
+    """API para generar resumen ejecutivo con IA"""
+    from django.http import JsonResponse
+    from .models import CompanyProtocol
+    
+    try:
+        protocol = CompanyProtocol.objects.get(pk=pk)
+    except CompanyProtocol.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Protocolo no encontrado'})
+    
+    result = protocol.generate_executive_summary()
+    return JsonResponse(result)
+
+
+@login_required
+def company_protocol_ai_improve_content(request, pk):
+    """API para mejorar automáticamente el contenido con IA"""
+    from django.http import JsonResponse
+    from .models import CompanyProtocol, SystemConfiguration
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Método no permitido'})
+    
+    try:
+        protocol = CompanyProtocol.objects.get(pk=pk)
+    except CompanyProtocol.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Protocolo no encontrado'})
+    
+    try:
+        config = SystemConfiguration.objects.first()
+        if not config or not config.ai_chat_enabled or not config.openai_api_key:
+            return JsonResponse({'success': False, 'error': 'OpenAI no está configurado en el sistema'})
+        
+        import openai
+        client = openai.OpenAI(api_key=config.openai_api_key)
+        
+        improvement_type = request.POST.get('improvement_type', 'general')
+        
+        prompts = {
+            'general': f"""
+            Mejora el siguiente protocolo empresarial manteniendo todo el contenido importante pero haciéndolo más claro, profesional y fácil de seguir:
+            
+            TÍTULO: {protocol.title}
+            CONTENIDO ACTUAL:
+            {protocol.content}
+            
+            Mejora la estructura, claridad y profesionalismo sin cambiar el mensaje principal.
+            NO uses formato Markdown (**, *, etc.). Usa texto plano con saltos de línea para separar secciones.
+            """,
+            'clarity': f"""
+            Reescribe este protocolo para hacerlo más claro y fácil de entender, usando lenguaje simple pero profesional:
+            
+            {protocol.content}
+            
+            NO uses formato Markdown. Usa texto plano con saltos de línea.
+            """,
+            'structure': f"""
+            Reorganiza y mejora la estructura de este protocolo usando encabezados, listas y párrafos bien organizados:
+            
+            {protocol.content}
+            
+            NO uses formato Markdown. Usa texto plano con numeración simple y saltos de línea.
+            """,
+            'professional': f"""
+            Reescribe este protocolo con un tono más profesional y formal apropiado para un documento corporativo:
+            
+            {protocol.content}
+            
+            NO uses formato Markdown. Usa texto plano con saltos de línea.
+            """
+        }
+        
+        response = client.chat.completions.create(
+            model=config.openai_model or "gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": "Eres un experto editor de documentos corporativos especializado en mejorar protocolos empresariales. NO uses formato Markdown en tus respuestas, solo texto plano con saltos de línea."},
+                {"role": "user", "content": prompts.get(improvement_type, prompts['general'])}
+            ],
+            max_tokens=2000,
+            temperature=0.6
+        )
+        
+        improved_content = response.choices[0].message.content.strip()
+        
+        # Limpiar cualquier formato Markdown y devolver texto plano
+        import re
+        def remove_markdown_formatting(text):
+            """Elimina formato Markdown y devuelve texto plano"""
+            # Eliminar negritas **texto** y dejar solo texto
+            text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
+            # Eliminar cursivas *texto* y dejar solo texto
+            text = re.sub(r'\*(.*?)\*', r'\1', text)
+            # Eliminar títulos ## y # y dejar solo el texto
+            text = re.sub(r'^#{1,6}\s*(.*?)$', r'\1', text, flags=re.MULTILINE)
+            return text
+        
+        improved_content = remove_markdown_formatting(improved_content)
+        
+        return JsonResponse({
+            'success': True,
+            'improved_content': improved_content,
+            'improvement_type': improvement_type,
+            'word_count': len(improved_content.split())
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': f'Error mejorando contenido: {str(e)}'})
+
+
+# ================================
+# VISTAS PÚBLICAS DE PROTOCOLOS
+# ================================
+
+@login_required
+def company_protocol_toggle_public(request, pk):
+    """Vista para activar/desactivar el compartir público de un protocolo"""
+    from .models import CompanyProtocol
+    
+    try:
+        protocol = CompanyProtocol.objects.get(pk=pk)
+    except CompanyProtocol.DoesNotExist:
+        messages.error(request, 'El protocolo solicitado no existe.')
+        return redirect('company_protocol_list')
+    
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        if action == 'make_public':
+            protocol.make_public()
+            messages.success(request, f'El protocolo "{protocol.title}" ahora es público.')
+        elif action == 'make_private':
+            protocol.make_private()
+            messages.success(request, f'El protocolo "{protocol.title}" ahora es privado.')
+        
+        return redirect('company_protocol_detail', pk=pk)
+    
+    return redirect('company_protocol_detail', pk=pk)
+
+
+def company_protocol_public_view(request, uuid):
+    """Vista pública para ver un protocolo sin autenticación"""
+    from .models import CompanyProtocol
+    
+    try:
+        protocol = CompanyProtocol.objects.select_related('created_by', 'company').get(
+            public_uuid=uuid, 
+            is_public=True
+        )
+    except CompanyProtocol.DoesNotExist:
+        from django.http import Http404
+        raise Http404("El protocolo solicitado no existe o no está disponible públicamente.")
+    
+    # Incrementar contador de vistas públicas
+    protocol.increment_public_views()
+    
+    context = {
+        'protocol': protocol,
+        'page_title': f'Protocolo: {protocol.title}',
+        'is_public_view': True,
+    }
+    
+    return render(request, 'tickets/company_protocol_public.html', context)
+
+
+@login_required 
+def company_protocol_stats_api(request):
+    """API para obtener estadísticas de protocolos públicos"""
+    from django.db.models import Sum, Count, Avg
+    from .models import CompanyProtocol
+    from django.http import JsonResponse
+    
+    # Estadísticas generales
+    total_protocols = CompanyProtocol.objects.count()
+    public_protocols = CompanyProtocol.objects.filter(is_public=True).count()
+    total_public_views = CompanyProtocol.objects.filter(is_public=True).aggregate(
+        total_views=Sum('public_views_count')
+    )['total_views'] or 0
+    
+    # Protocolos más vistos
+    top_viewed = CompanyProtocol.objects.filter(
+        is_public=True, 
+        public_views_count__gt=0
+    ).order_by('-public_views_count')[:5].values(
+        'id', 'title', 'public_views_count', 'created_at'
+    )
+    
+    # Promedio de vistas por protocolo público
+    avg_views = CompanyProtocol.objects.filter(is_public=True).aggregate(
+        avg_views=Avg('public_views_count')
+    )['avg_views'] or 0
+    
+    stats = {
+        'total_protocols': total_protocols,
+        'public_protocols': public_protocols,
+        'private_protocols': total_protocols - public_protocols,
+        'total_public_views': total_public_views,
+        'average_views_per_protocol': round(avg_views, 2),
+        'top_viewed_protocols': list(top_viewed),
+        'public_percentage': round((public_protocols / total_protocols * 100) if total_protocols > 0 else 0, 1)
+    }
+    
+    return JsonResponse(stats)
+
+
+# ================================
+# VISTAS PARA RENDICIÓN DE GASTOS
+# ================================
+
+@login_required
+def expense_report_list(request):
+    """Lista de rendiciones de gastos"""
+    # Filtrar por rol de usuario
+    if is_agent(request.user):
+        # Los agentes ven todas las rendiciones
+        queryset = ExpenseReport.objects.all()
+    else:
+        # Los empleados solo ven sus propias rendiciones
+        queryset = ExpenseReport.objects.filter(employee=request.user)
+    
+    # Aplicar filtros
+    form = ExpenseReportFilterForm(request.GET)
+    if form.is_valid():
+        if form.cleaned_data.get('status'):
+            queryset = queryset.filter(status=form.cleaned_data['status'])
+        if form.cleaned_data.get('employee') and is_agent(request.user):
+            queryset = queryset.filter(employee=form.cleaned_data['employee'])
+        if form.cleaned_data.get('start_date'):
+            queryset = queryset.filter(created_at__gte=form.cleaned_data['start_date'])
+        if form.cleaned_data.get('end_date'):
+            queryset = queryset.filter(created_at__lte=form.cleaned_data['end_date'])
+        if form.cleaned_data.get('search'):
+            search = form.cleaned_data['search']
+            queryset = queryset.filter(
+                Q(title__icontains=search) | 
+                Q(description__icontains=search)
+            )
+    
+    queryset = queryset.select_related('employee', 'company', 'approved_by').order_by('-created_at')
+
+    # Anotar cada rendición con el total de fondos recibidos
+    from django.db.models import OuterRef, Subquery, DecimalField as DField
+    funds_subq = ExpenseFund.objects.filter(
+        expense_report=OuterRef('pk')
+    ).order_by().values('expense_report').annotate(
+        s=models.Sum('amount')
+    ).values('s')
+    queryset = queryset.annotate(
+        total_funds=models.Subquery(funds_subq, output_field=DField(max_digits=10, decimal_places=2)),
+        row_balance=models.ExpressionWrapper(
+            models.functions.Coalesce(models.Subquery(funds_subq, output_field=DField(max_digits=10, decimal_places=2)), models.Value(0, output_field=DField(max_digits=10, decimal_places=2))) - models.F('total_amount'),
+            output_field=DField(max_digits=10, decimal_places=2)
+        )
+    )
+
+    # Totales generales del queryset filtrado (antes de paginar)
+    totals = queryset.aggregate(
+        grand_total=models.Sum('total_amount'),
+        grand_funds=models.Sum('total_funds'),
+    )
+    grand_total = totals['grand_total'] or 0
+    grand_funds = totals['grand_funds'] or 0
+
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(queryset, 20)
+    page_number = request.GET.get('page')
+    expense_reports = paginator.get_page(page_number)
+
+    # Totales de la página actual
+    page_total_expenses = sum(r.total_amount for r in expense_reports)
+    page_total_funds = sum(r.total_funds or 0 for r in expense_reports)
+    page_total_balance = sum(r.row_balance or 0 for r in expense_reports)
+    
+    context = {
+        'expense_reports': expense_reports,
+        'form': form,
+        'title': 'Administración de Gastos',
+        'is_agent': is_agent(request.user),
+        'page_total_expenses': page_total_expenses,
+        'page_total_funds': page_total_funds,
+        'page_total_balance': page_total_balance,
+        'grand_total': grand_total,
+        'grand_funds': grand_funds,
+        'grand_balance': grand_funds - grand_total,
+    }
+    
+    return render(request, 'tickets/expense_report_list.html', context)
+
+
+@login_required
+def expense_report_create(request):
+    """Crear nueva rendición de gastos"""
+    if request.method == 'POST':
+        form = ExpenseReportForm(request.POST)
+        if form.is_valid():
+            expense_report = form.save(commit=False)
+            expense_report.employee = request.user
+            # Asignar empresa del usuario si tiene
+            try:
+                expense_report.company = request.user.profile.company
+            except:
+                pass
+            expense_report.save()
+            messages.success(request, 'Rendición de gastos creada exitosamente.')
+            return redirect('expense_report_detail', pk=expense_report.pk)
+    else:
+        form = ExpenseReportForm()
+    
+    context = {
+        'form': form,
+        'title': 'Nueva Rendición de Gastos',
+        'action': 'Crear'
+    }
+    
+    return render(request, 'tickets/expense_report_form.html', context)
+
+
+@login_required
+def expense_report_detail(request, pk):
+    """Detalle de rendición de gastos"""
+    expense_report = get_object_or_404(ExpenseReport, pk=pk)
+    
+    # Verificar permisos
+    if not is_agent(request.user) and expense_report.employee != request.user:
+        messages.error(request, 'No tienes permisos para ver esta rendición.')
+        return redirect('expense_report_list')
+    
+    # Obtener items de gastos con paginación
+    expense_items_qs = expense_report.expense_items.all().order_by('-date', '-created_at')
+    from django.core.paginator import Paginator
+    items_paginator = Paginator(expense_items_qs, 20)
+    items_page_number = request.GET.get('items_page', 1)
+    expense_items = items_paginator.get_page(items_page_number)
+
+    # Obtener fondos
+    funds = expense_report.funds.all().order_by('-received_at', '-created_at')
+    total_funds = funds.aggregate(total=models.Sum('amount'))['total'] or 0
+    balance = total_funds - expense_report.total_amount
+
+    # Obtener comentarios
+    comments = expense_report.comments.all().order_by('-created_at')
+    if not is_agent(request.user):
+        # Los empleados no ven comentarios internos
+        comments = comments.filter(is_internal=False)
+    
+    # Formulario de comentarios
+    comment_form = ExpenseCommentForm()
+    
+    context = {
+        'expense_report': expense_report,
+        'expense_items': expense_items,
+        'funds': funds,
+        'total_funds': total_funds,
+        'balance': balance,
+        'comments': comments,
+        'comment_form': comment_form,
+        'title': f'Rendición: {expense_report.title}',
+        'is_agent': is_agent(request.user),
+        'can_edit': expense_report.can_edit() and (
+            expense_report.employee == request.user or is_agent(request.user)
+        ),
+        'can_submit': expense_report.can_submit() and expense_report.employee == request.user,
+        'can_approve': expense_report.can_approve() and is_agent(request.user),
+    }
+    
+    return render(request, 'tickets/expense_report_detail.html', context)
+
+
+@login_required
+def expense_report_edit(request, pk):
+    """Editar rendición de gastos"""
+    expense_report = get_object_or_404(ExpenseReport, pk=pk)
+    
+    # Verificar permisos
+    if not expense_report.can_edit():
+        messages.error(request, 'Esta rendición no puede ser editada.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    if not is_agent(request.user) and expense_report.employee != request.user:
+        messages.error(request, 'No tienes permisos para editar esta rendición.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    if request.method == 'POST':
+        form = ExpenseReportForm(request.POST, instance=expense_report)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Rendición actualizada exitosamente.')
+            return redirect('expense_report_detail', pk=pk)
+    else:
+        form = ExpenseReportForm(instance=expense_report)
+    
+    context = {
+        'form': form,
+        'expense_report': expense_report,
+        'title': f'Editar: {expense_report.title}',
+        'action': 'Actualizar'
+    }
+    
+    return render(request, 'tickets/expense_report_form.html', context)
+
+
+@login_required
+def expense_report_delete(request, pk):
+    """Eliminar rendición de gastos"""
+    expense_report = get_object_or_404(ExpenseReport, pk=pk)
+    
+    # Verificar permisos
+    if not expense_report.can_edit():
+        messages.error(request, 'Esta rendición no puede ser eliminada.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    if not is_agent(request.user) and expense_report.employee != request.user:
+        messages.error(request, 'No tienes permisos para eliminar esta rendición.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    if request.method == 'POST':
+        expense_report.delete()
+        messages.success(request, 'Rendición eliminada exitosamente.')
+        return redirect('expense_report_list')
+    
+    context = {
+        'expense_report': expense_report,
+        'title': f'Eliminar: {expense_report.title}'
+    }
+    
+    return render(request, 'tickets/expense_report_delete.html', context)
+
+
+@login_required
+def expense_report_submit(request, pk):
+    """Enviar rendición para aprobación"""
+    expense_report = get_object_or_404(ExpenseReport, pk=pk)
+    
+    # Verificar permisos
+    if not expense_report.can_submit() or expense_report.employee != request.user:
+        messages.error(request, 'No puedes enviar esta rendición.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    if request.method == 'POST':
+        expense_report.status = 'submitted'
+        expense_report.submitted_at = timezone.now()
+        expense_report.save()
+        
+        messages.success(request, 'Rendición enviada para aprobación.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    context = {
+        'expense_report': expense_report,
+        'title': f'Enviar: {expense_report.title}'
+    }
+    
+    return render(request, 'tickets/expense_report_submit.html', context)
+
+
+@login_required
+def expense_report_approve(request, pk):
+    """Aprobar rendición de gastos"""
+    if not is_agent(request.user):
+        messages.error(request, 'No tienes permisos para aprobar rendiciones.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    expense_report = get_object_or_404(ExpenseReport, pk=pk)
+    
+    if not expense_report.can_approve():
+        messages.error(request, 'Esta rendición no puede ser aprobada.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    if request.method == 'POST':
+        expense_report.status = 'approved'
+        expense_report.approved_by = request.user
+        expense_report.approved_at = timezone.now()
+        expense_report.save()
+        
+        messages.success(request, 'Rendición aprobada exitosamente.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    context = {
+        'expense_report': expense_report,
+        'title': f'Aprobar: {expense_report.title}'
+    }
+    
+    return render(request, 'tickets/expense_report_approve.html', context)
+
+
+@login_required
+def expense_report_reject(request, pk):
+    """Rechazar rendición de gastos"""
+    if not is_agent(request.user):
+        messages.error(request, 'No tienes permisos para rechazar rendiciones.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    expense_report = get_object_or_404(ExpenseReport, pk=pk)
+    
+    if not expense_report.can_approve():
+        messages.error(request, 'Esta rendición no puede ser rechazada.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    if request.method == 'POST':
+        reason = request.POST.get('reason', '')
+        if not reason:
+            messages.error(request, 'Debes proporcionar un motivo de rechazo.')
+            return redirect('expense_report_detail', pk=pk)
+        
+        expense_report.status = 'rejected'
+        expense_report.rejection_reason = reason
+        expense_report.save()
+        
+        messages.success(request, 'Rendición rechazada.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    context = {
+        'expense_report': expense_report,
+        'title': f'Rechazar: {expense_report.title}'
+    }
+    
+    return render(request, 'tickets/expense_report_reject.html', context)
+
+
+@login_required
+def expense_report_mark_paid(request, pk):
+    """Marcar rendición como pagada"""
+    if not is_agent(request.user):
+        messages.error(request, 'No tienes permisos para marcar como pagado.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    expense_report = get_object_or_404(ExpenseReport, pk=pk)
+    
+    if expense_report.status != 'approved':
+        messages.error(request, 'Solo se pueden marcar como pagadas las rendiciones aprobadas.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    if request.method == 'POST':
+        payment_reference = request.POST.get('payment_reference', '')
+        expense_report.status = 'paid'
+        expense_report.payment_reference = payment_reference
+        expense_report.paid_at = timezone.now()
+        expense_report.save()
+        
+        messages.success(request, 'Rendición marcada como pagada.')
+        return redirect('expense_report_detail', pk=pk)
+    
+    context = {
+        'expense_report': expense_report,
+        'title': f'Marcar como Pagado: {expense_report.title}'
+    }
+    
+    return render(request, 'tickets/expense_report_mark_paid.html', context)
+
+
+@login_required
+def expense_item_create(request, report_pk):
+    """Crear nuevo item de gasto"""
+    expense_report = get_object_or_404(ExpenseReport, pk=report_pk)
+    
+    # Verificar permisos
+    if not expense_report.can_edit():
+        messages.error(request, 'No se pueden agregar gastos a esta rendición.')
+        return redirect('expense_report_detail', pk=report_pk)
+    
+    if not is_agent(request.user) and expense_report.employee != request.user:
+        messages.error(request, 'No tienes permisos para agregar gastos a esta rendición.')
+        return redirect('expense_report_detail', pk=report_pk)
+    
+    if request.method == 'POST':
+        form = ExpenseItemForm(request.POST, request.FILES, expense_report=expense_report)
+        print(f"DEBUG - Errores del formulario: {form.errors}")
+        print(f"DEBUG - Datos POST: {request.POST}")
+        print(f"DEBUG - Currency field: {form['currency']}")
+        print(f"DEBUG - Currency choices: {form.fields['currency'].choices}")
+        if form.is_valid():
+            expense_item = form.save(commit=False)
+            expense_item.expense_report = expense_report
+            expense_item.save()
+            messages.success(request, 'Gasto agregado exitosamente.')
+            return redirect('expense_report_detail', pk=report_pk)
+    else:
+        form = ExpenseItemForm(expense_report=expense_report)
+        print(f"DEBUG - Currency field GET: {form['currency']}")
+        print(f"DEBUG - Currency choices GET: {form.fields['currency'].choices}")
+        print(f"DEBUG - Currency initial GET: {form.fields['currency'].initial}")
+    
+    context = {
+        'form': form,
+        'expense_report': expense_report,
+        'title': f'Agregar Gasto - {expense_report.title}',
+        'action': 'Agregar'
+    }
+    
+    return render(request, 'tickets/expense_item_form.html', context)
+
+
+@login_required
+def expense_item_edit(request, pk):
+    """Editar item de gasto"""
+    expense_item = get_object_or_404(ExpenseItem, pk=pk)
+    expense_report = expense_item.expense_report
+    
+    # Verificar permisos
+    if not expense_report.can_edit():
+        messages.error(request, 'Esta rendición no puede ser editada.')
+        return redirect('expense_report_detail', pk=expense_report.pk)
+    
+    if not is_agent(request.user) and expense_report.employee != request.user:
+        messages.error(request, 'No tienes permisos para editar este gasto.')
+        return redirect('expense_report_detail', pk=expense_report.pk)
+    
+    if request.method == 'POST':
+        form = ExpenseItemForm(request.POST, request.FILES, instance=expense_item, expense_report=expense_report)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Gasto actualizado exitosamente.')
+            return redirect('expense_report_detail', pk=expense_report.pk)
+    else:
+        form = ExpenseItemForm(instance=expense_item, expense_report=expense_report)
+    
+    context = {
+        'form': form,
+        'expense_item': expense_item,
+        'expense_report': expense_report,
+        'title': f'Editar Gasto - {expense_item.description}',
+        'action': 'Actualizar'
+    }
+    
+    return render(request, 'tickets/expense_item_form.html', context)
+
+
+@login_required
+def expense_item_delete(request, pk):
+    """Eliminar item de gasto"""
+    expense_item = get_object_or_404(ExpenseItem, pk=pk)
+    expense_report = expense_item.expense_report
+    
+    # Verificar permisos
+    if not expense_report.can_edit():
+        messages.error(request, 'Esta rendición no puede ser editada.')
+        return redirect('expense_report_detail', pk=expense_report.pk)
+    
+    if not is_agent(request.user) and expense_report.employee != request.user:
+        messages.error(request, 'No tienes permisos para eliminar este gasto.')
+        return redirect('expense_report_detail', pk=expense_report.pk)
+    
+    if request.method == 'POST':
+        expense_item.delete()
+        messages.success(request, 'Gasto eliminado exitosamente.')
+        return redirect('expense_report_detail', pk=expense_report.pk)
+    
+    context = {
+        'expense_item': expense_item,
+        'expense_report': expense_report,
+        'title': f'Eliminar Gasto - {expense_item.description}'
+    }
+    
+    return render(request, 'tickets/expense_item_delete.html', context)
+
+
+@login_required
+def expense_comment_create(request, report_pk):
+    """Crear comentario en rendición"""
+    expense_report = get_object_or_404(ExpenseReport, pk=report_pk)
+    
+    # Verificar permisos de lectura
+    if not is_agent(request.user) and expense_report.employee != request.user:
+        messages.error(request, 'No tienes permisos para comentar en esta rendición.')
+        return redirect('expense_report_detail', pk=report_pk)
+    
+    if request.method == 'POST':
+        form = ExpenseCommentForm(request.POST)
+        if form.is_valid():
+            comment = form.save(commit=False)
+            comment.expense_report = expense_report
+            comment.user = request.user
+            # Solo agentes pueden crear comentarios internos
+            if not is_agent(request.user):
+                comment.is_internal = False
+            comment.save()
+            messages.success(request, 'Comentario agregado exitosamente.')
+        else:
+            messages.error(request, 'Error al agregar el comentario.')
+    
+    return redirect('expense_report_detail', pk=report_pk)
+
+
+@login_required
+def expense_fund_create(request, report_pk):
+    """Agregar una fuente de fondos a una rendición de gastos"""
+    expense_report = get_object_or_404(ExpenseReport, pk=report_pk)
+
+    if not is_agent(request.user) and expense_report.employee != request.user:
+        messages.error(request, 'No tienes permisos para agregar fondos a esta rendición.')
+        return redirect('expense_report_detail', pk=report_pk)
+
+    if request.method == 'POST':
+        form = ExpenseFundForm(request.POST)
+        if form.is_valid():
+            fund = form.save(commit=False)
+            fund.expense_report = expense_report
+            fund.save()
+            messages.success(request, 'Fondo agregado exitosamente.')
+            return redirect('expense_report_detail', pk=report_pk)
+    else:
+        from django.utils import timezone
+        form = ExpenseFundForm(initial={'received_at': timezone.now().date()})
+
+    context = {
+        'form': form,
+        'expense_report': expense_report,
+        'title': f'Agregar Fondo - {expense_report.title}',
+        'action': 'Agregar',
+    }
+    return render(request, 'tickets/expense_fund_form.html', context)
+
+
+@login_required
+def expense_fund_edit(request, pk):
+    """Editar una fuente de fondos"""
+    fund = get_object_or_404(ExpenseFund, pk=pk)
+    expense_report = fund.expense_report
+
+    if not is_agent(request.user) and expense_report.employee != request.user:
+        messages.error(request, 'No tienes permisos para editar este fondo.')
+        return redirect('expense_report_detail', pk=expense_report.pk)
+
+    if request.method == 'POST':
+        form = ExpenseFundForm(request.POST, instance=fund)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Fondo actualizado exitosamente.')
+            return redirect('expense_report_detail', pk=expense_report.pk)
+    else:
+        form = ExpenseFundForm(instance=fund)
+
+    context = {
+        'form': form,
+        'fund': fund,
+        'expense_report': expense_report,
+        'title': f'Editar Fondo - {fund.source_name}',
+        'action': 'Actualizar',
+    }
+    return render(request, 'tickets/expense_fund_form.html', context)
+
+
+@login_required
+def expense_fund_delete(request, pk):
+    """Eliminar una fuente de fondos"""
+    fund = get_object_or_404(ExpenseFund, pk=pk)
+    expense_report = fund.expense_report
+
+    if not is_agent(request.user) and expense_report.employee != request.user:
+        messages.error(request, 'No tienes permisos para eliminar este fondo.')
+        return redirect('expense_report_detail', pk=expense_report.pk)
+
+    if request.method == 'POST':
+        fund.delete()
+        messages.success(request, 'Fondo eliminado exitosamente.')
+        return redirect('expense_report_detail', pk=expense_report.pk)
+
+    context = {
+        'fund': fund,
+        'expense_report': expense_report,
+        'title': f'Eliminar Fondo - {fund.source_name}',
+    }
+    return render(request, 'tickets/expense_fund_delete.html', context)
+
+
+# ========== VISTAS PARA GESTIÓN DE TIPOS DE AUSENCIAS ==========
+
+@login_required
+@user_passes_test(is_agent)
+def absence_type_list(request):
+    """Lista todos los tipos de ausencias"""
+    from .models import AbsenceType
+    
+    absence_types = AbsenceType.objects.all().order_by('name')
+    
+    # Estadísticas
+    total_types = absence_types.count()
+    active_types = absence_types.filter(is_active=True).count()
+    
+    context = {
+        'absence_types': absence_types,
+        'total_types': total_types,
+        'active_types': active_types,
+        'page_title': 'Tipos de Ausencias'
+    }
+    
+    return render(request, 'tickets/absence_type_list.html', context)
+
+
+@login_required
+@user_passes_test(is_agent)
+def absence_type_create(request):
+    """Crear un nuevo tipo de ausencia"""
+    from .models import AbsenceType
+    
+    if request.method == 'POST':
+        form = AbsenceTypeForm(request.POST)
+        if form.is_valid():
+            absence_type = form.save()
+            messages.success(request, f'Tipo de ausencia "{absence_type.name}" creado exitosamente.')
+            return redirect('absence_type_list')
+    else:
+        form = AbsenceTypeForm()
+    
+    return render(request, 'tickets/absence_type_form.html', {
+        'form': form,
+        'page_title': 'Crear Tipo de Ausencia',
+        'submit_text': 'Crear Tipo de Ausencia'
+    })
+
+
+@login_required
+@user_passes_test(is_agent)
+def absence_type_edit(request, pk):
+    """Editar un tipo de ausencia existente"""
+    from .models import AbsenceType
+    
+    absence_type = get_object_or_404(AbsenceType, pk=pk)
+    
+    if request.method == 'POST':
+        form = AbsenceTypeForm(request.POST, instance=absence_type)
+        if form.is_valid():
+            absence_type = form.save()
+            messages.success(request, f'Tipo de ausencia "{absence_type.name}" actualizado exitosamente.')
+            return redirect('absence_type_list')
+    else:
+        form = AbsenceTypeForm(instance=absence_type)
+    
+    return render(request, 'tickets/absence_type_form.html', {
+        'form': form,
+        'absence_type': absence_type,
+        'page_title': f'Editar: {absence_type.name}',
+        'submit_text': 'Actualizar Tipo de Ausencia'
+    })
+
+
+@login_required
+@user_passes_test(is_agent)
+def absence_type_delete(request, pk):
+    """Eliminar un tipo de ausencia"""
+    from .models import AbsenceType
+    
+    absence_type = get_object_or_404(AbsenceType, pk=pk)
+    
+    # Verificar si hay ausencias asociadas
+    usage_count = absence_type.get_usage_count()
+    
+    if request.method == 'POST':
+        if usage_count > 0:
+            messages.error(request, f'No se puede eliminar el tipo "{absence_type.name}" porque tiene {usage_count} ausencias asociadas.')
+        else:
+            name = absence_type.name
+            absence_type.delete()
+            messages.success(request, f'Tipo de ausencia "{name}" eliminado exitosamente.')
+        return redirect('absence_type_list')
+    
+    return render(request, 'tickets/absence_type_delete.html', {
+        'absence_type': absence_type,
+        'usage_count': usage_count,
+        'page_title': f'Eliminar: {absence_type.name}'
+    })
+
+
+@login_required
+@user_passes_test(is_agent)
+def absence_type_toggle_active(request, pk):
+    """Alternar el estado activo/inactivo de un tipo de ausencia"""
+    from .models import AbsenceType
+    
+    absence_type = get_object_or_404(AbsenceType, pk=pk)
+    absence_type.is_active = not absence_type.is_active
+    absence_type.save()
+    
+    status = "activado" if absence_type.is_active else "desactivado"
+    messages.success(request, f'Tipo de ausencia "{absence_type.name}" {status} exitosamente.')
+    
+    return redirect('absence_type_list')
+
+
+# ================================
+# CUMPLIMIENTO MENSUAL - QA
+# ================================
+
+@login_required
+@user_passes_test(lambda user: user.is_staff, login_url='/')
+def monthly_cumplimiento_list(request):
+    """Lista de cumplimientos mensuales"""
+    from .models import MonthlyCumplimiento
+    
+    cumplimientos = MonthlyCumplimiento.objects.all().order_by('-created_at')
+    
+    # Filtros
+    search = request.GET.get('search')
+    if search:
+        cumplimientos = cumplimientos.filter(
+            Q(name__icontains=search) |
+            Q(user__icontains=search) |
+            Q(description__icontains=search)
+        )
+    
+    is_active = request.GET.get('is_active')
+    if is_active in ['true', 'false']:
+        cumplimientos = cumplimientos.filter(is_active=is_active == 'true')
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(cumplimientos, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'page_obj': page_obj,
+        'page_title': 'Cumplimiento Mensual',
+        'section': 'qa'
+    }
+    
+    return render(request, 'tickets/monthly_cumplimiento_list.html', context)
+
+
+@login_required
+@user_passes_test(lambda user: user.is_staff, login_url='/')
+def monthly_cumplimiento_create(request):
+    """Crear nuevo cumplimiento mensual"""
+    from .forms import MonthlyCumplimientoForm
+    
+    if request.method == 'POST':
+        form = MonthlyCumplimientoForm(request.POST)
+        if form.is_valid():
+            cumplimiento = form.save(commit=False)
+            cumplimiento.created_by = request.user
+            cumplimiento.save()
+            
+            messages.success(request, f'Cumplimiento mensual "{cumplimiento.name}" creado exitosamente.')
+            return redirect('monthly_cumplimiento_detail', pk=cumplimiento.pk)
+    else:
+        form = MonthlyCumplimientoForm()
+    
+    context = {
+        'form': form,
+        'page_title': 'Nuevo Cumplimiento Mensual',
+        'section': 'qa'
+    }
+    
+    return render(request, 'tickets/monthly_cumplimiento_form.html', context)
+
+
+@login_required
+@user_passes_test(lambda user: user.is_staff, login_url='/')
+def monthly_cumplimiento_detail(request, pk):
+    """Detalle del cumplimiento mensual"""
+    from .models import MonthlyCumplimiento
+    
+    cumplimiento = get_object_or_404(MonthlyCumplimiento, pk=pk)
+    progress = cumplimiento.get_current_month_progress()
+    
+    # Obtener cumplimientos del mes actual para mostrar calendario
+    from datetime import date, timedelta
+    today = date.today()
+    current_month_start = today.replace(day=1)
+    
+    # Generar días del mes
+    days_in_month = []
+    current_date = current_month_start
+    while current_date.month == today.month:
+        daily_cumplimiento = cumplimiento.daily_cumplimientos.filter(date=current_date).first()
+        days_in_month.append({
+            'date': current_date,
+            'is_today': current_date == today,
+            'is_past': current_date < today,
+            'is_future': current_date > today,
+            'completed': daily_cumplimiento.completed if daily_cumplimiento else False,
+            'has_notes': daily_cumplimiento.notes if daily_cumplimiento else False
+        })
+        current_date += timedelta(days=1)
+    
+    context = {
+        'cumplimiento': cumplimiento,
+        'progress': progress,
+        'days_in_month': days_in_month,
+        'page_title': f'Cumplimiento - {cumplimiento.name}',
+        'section': 'qa'
+    }
+    
+    return render(request, 'tickets/monthly_cumplimiento_detail.html', context)
+
+
+@login_required
+@user_passes_test(lambda user: user.is_staff, login_url='/')
+def monthly_cumplimiento_edit(request, pk):
+    """Editar cumplimiento mensual"""
+    from .models import MonthlyCumplimiento
+    from .forms import MonthlyCumplimientoForm
+    
+    cumplimiento = get_object_or_404(MonthlyCumplimiento, pk=pk)
+    
+    if request.method == 'POST':
+        form = MonthlyCumplimientoForm(request.POST, instance=cumplimiento)
+        if form.is_valid():
+            form.save()
+            messages.success(request, f'Cumplimiento mensual "{cumplimiento.name}" actualizado exitosamente.')
+            return redirect('monthly_cumplimiento_detail', pk=cumplimiento.pk)
+    else:
+        form = MonthlyCumplimientoForm(instance=cumplimiento)
+    
+    context = {
+        'form': form,
+        'cumplimiento': cumplimiento,
+        'page_title': f'Editar - {cumplimiento.name}',
+        'section': 'qa'
+    }
+    
+    return render(request, 'tickets/monthly_cumplimiento_form.html', context)
+
+
+@login_required
+@user_passes_test(lambda user: user.is_staff, login_url='/')
+def monthly_cumplimiento_delete(request, pk):
+    """Eliminar cumplimiento mensual"""
+    from .models import MonthlyCumplimiento
+    
+    cumplimiento = get_object_or_404(MonthlyCumplimiento, pk=pk)
+    
+    if request.method == 'POST':
+        name = cumplimiento.name
+        cumplimiento.delete()
+        messages.success(request, f'Cumplimiento mensual "{name}" eliminado exitosamente.')
+        return redirect('monthly_cumplimiento_list')
+    
+    context = {
+        'cumplimiento': cumplimiento,
+        'page_title': f'Eliminar - {cumplimiento.name}',
+        'section': 'qa'
+    }
+    
+    return render(request, 'tickets/monthly_cumplimiento_delete.html', context)
+
+
+@login_required
+@user_passes_test(lambda user: user.is_staff, login_url='/')
+def monthly_cumplimiento_toggle(request, pk):
+    """Activar/desactivar cumplimiento mensual"""
+    from .models import MonthlyCumplimiento
+    
+    cumplimiento = get_object_or_404(MonthlyCumplimiento, pk=pk)
+    cumplimiento.is_active = not cumplimiento.is_active
+    cumplimiento.save()
+    
+    status = "activado" if cumplimiento.is_active else "desactivado"
+    messages.success(request, f'Cumplimiento mensual "{cumplimiento.name}" {status} exitosamente.')
+    
+    return redirect('monthly_cumplimiento_detail', pk=cumplimiento.pk)
+
+
+# Vista pública para móviles
+def monthly_cumplimiento_public(request, uuid):
+    """Vista pública para marcar cumplimientos diarios (optimizada para móvil)"""
+    from .models import MonthlyCumplimiento, DailyCumplimiento
+    from .forms import DailyCumplimientoForm
+    from datetime import date, timedelta
+    
+    cumplimiento = get_object_or_404(MonthlyCumplimiento, public_uuid=uuid, is_active=True)
+    today = date.today()
+    
+    # Verificar si el usuario tiene múltiples cumplimientos
+    user_cumplimientos_count = MonthlyCumplimiento.objects.filter(
+        user=cumplimiento.user, 
+        is_active=True
+    ).count()
+    
+    # Manejar POST (marcar/desmarcar cumplimiento)
+    if request.method == 'POST':
+        target_date_str = request.POST.get('date')
+        if target_date_str:
+            try:
+                target_date = date.fromisoformat(target_date_str)
+                daily_cumplimiento, created = DailyCumplimiento.objects.get_or_create(
+                    monthly_cumplimiento=cumplimiento,
+                    date=target_date,
+                    defaults={'completed': False}
+                )
+                
+                # Toggle estado
+                daily_cumplimiento.completed = not daily_cumplimiento.completed
+                daily_cumplimiento.save()
+                
+                status = "marcado como cumplido" if daily_cumplimiento.completed else "desmarcado"
+                return JsonResponse({
+                    'success': True,
+                    'message': f'Día {target_date.strftime("%d/%m")} {status}',
+                    'completed': daily_cumplimiento.completed
+                })
+            except ValueError:
+                return JsonResponse({'success': False, 'message': 'Fecha inválida'})
+    
+    # Generar calendario del mes actual
+    current_month_start = today.replace(day=1)
+    next_month = (current_month_start + timedelta(days=32)).replace(day=1)
+    
+    # Calcular el primer día de la semana (lunes = 0, domingo = 6)
+    first_weekday = current_month_start.weekday()
+    
+    # Agregar días vacíos del mes anterior si es necesario
+    days_in_month = []
+    
+    # Añadir días vacíos al inicio si el mes no empieza en lunes
+    for i in range(first_weekday):
+        days_in_month.append({
+            'date': None,
+            'day': '',
+            'is_today': False,
+            'is_past': False,
+            'is_future': False,
+            'completed': False,
+            'weekday': '',
+            'iso_date': '',
+            'is_empty': True
+        })
+    
+    # Generar días del mes actual
+    current_date = current_month_start
+    while current_date < next_month:
+        daily_cumplimiento = cumplimiento.daily_cumplimientos.filter(date=current_date).first()
+        
+        # Determinar el estado del día correctamente
+        is_past = current_date < today
+        is_today = current_date == today
+        is_future = current_date > today
+        
+        days_in_month.append({
+            'date': current_date,
+            'day': current_date.day,
+            'is_today': is_today,
+            'is_past': is_past,
+            'is_future': is_future,
+            'completed': daily_cumplimiento.completed if daily_cumplimiento else False,
+            'weekday': current_date.strftime('%a'),
+            'iso_date': current_date.isoformat(),
+            'is_empty': False
+        })
+        current_date += timedelta(days=1)
+    
+    # Completar la última fila con días vacíos si es necesario (para que siempre sean 42 días = 6 semanas)
+    total_cells_needed = 42  # 6 filas x 7 días
+    while len(days_in_month) < total_cells_needed:
+        days_in_month.append({
+            'date': None,
+            'day': '',
+            'is_today': False,
+            'is_past': False,
+            'is_future': False,
+            'completed': False,
+            'weekday': '',
+            'iso_date': '',
+            'is_empty': True
+        })
+    
+    # Progreso del mes
+    progress = cumplimiento.get_current_month_progress()
+    
+    context = {
+        'cumplimiento': cumplimiento,
+        'days_in_month': days_in_month,
+        'progress': progress,
+        'today': today,
+        'current_month': today.strftime('%B %Y'),
+        'page_title': f'{cumplimiento.name} - {cumplimiento.user}',
+        'user_cumplimientos_count': user_cumplimientos_count,
+        'has_multiple_cumplimientos': user_cumplimientos_count > 1
+    }
+    
+    return render(request, 'tickets/monthly_cumplimiento_public.html', context)
+
+
+def user_cumplimientos_menu(request, uuid):
+    """Vista que muestra todos los cumplimientos de un usuario específico"""
+    from .models import MonthlyCumplimiento
+    
+    # Buscar el cumplimiento por UUID para obtener el usuario
+    primary_cumplimiento = get_object_or_404(MonthlyCumplimiento, public_uuid=uuid, is_active=True)
+    
+    # Obtener todos los cumplimientos activos del mismo usuario
+    user_cumplimientos = MonthlyCumplimiento.objects.filter(
+        user=primary_cumplimiento.user, 
+        is_active=True
+    ).order_by('name')
+    
+    # Si solo hay un cumplimiento, redirigir directamente
+    if user_cumplimientos.count() == 1:
+        return redirect('monthly_cumplimiento_public', uuid=uuid)
+    
+    context = {
+        'user': primary_cumplimiento.user,
+        'cumplimientos': user_cumplimientos,
+        'primary_uuid': uuid,
+        'page_title': f'Cumplimientos de {primary_cumplimiento.user.get_full_name() or primary_cumplimiento.user.username}'
+    }
+    
+    return render(request, 'tickets/user_cumplimientos_menu.html', context)
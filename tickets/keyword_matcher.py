@@ -0,0 +1,203 @@
+"""
+Detección de palabras clave en los mensajes entrantes.
+
+Las respuestas automáticas de WhatsApp (``WhatsAppKeyword``) y las preguntas
+configuradas de los chatbots (``ChatbotQuestion``) se buscaban recorriendo
+todas las palabras clave en cada mensaje. Ahora cada conexión y cada
+chatbot tienen un ``KeywordMatcher`` compilado, con un autómata
+Aho-Corasick para las palabras que pueden aparecer en cualquier parte del
+mensaje y un diccionario para las de coincidencia exacta. El mensaje se
+recorre una sola vez, haya las palabras clave que haya.
+
+Los matchers se guardan en memoria en cada proceso, junto a una huella de
+sus filas en la base de datos (número, mayor id y última ``updated_at``,
+como hace ``run_scheduler`` con las tareas). Cada mensaje consulta la
+huella y, si alguna palabra clave o pregunta se ha creado, editado o
+borrado desde cualquier proceso, el matcher se vuelve a compilar. Para
+medirlo: ``python manage.py benchmark_keyword_matcher``.
+"""
+import threading
+from collections import OrderedDict
+
+from django.db.models import Count, Max
+
+# Matchers compilados que se conservan en cada proceso
+MAX_MATCHERS = 512
+
+_matchers = OrderedDict()
+_lock = threading.Lock()
+
+
+class _Automaton:
+    """
+    Autómata Aho-Corasick. Cada nodo guarda el mejor rango (el menor) de las
+    palabras que terminan en él o en alguno de sus sufijos, de modo que al
+    recorrer el texto basta con quedarse con el menor rango visto.
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.best = [None]
+
+    def add(self, word, rank):
+        node = 0
+        for char in word:
+            following = self.goto[node].get(char)
+            if following is None:
+                following = len(self.goto)
+                self.goto[node][char] = following
+                self.goto.append({})
+                self.fail.append(0)
+                self.best.append(None)
+            node = following
+        if self.best[node] is None or rank < self.best[node]:
+            self.best[node] = rank
+
+    def compile(self):
+        """Calcula los enlaces de fallo recorriendo el trie en anchura"""
+        goto, fail, best = self.goto, self.fail, self.best
+        queue = list(goto[0].values())
+        for node in queue:
+            for char, following in goto[node].items():
+                state = fail[node]
+                while char not in goto[state] and state:
+                    state = fail[state]
+                target = goto[state].get(char, 0)
+                fail[following] = target if target != following else 0
+                inherited = best[fail[following]]
+                if inherited is not None and (best[following] is None or inherited < best[following]):
+                    best[following] = inherited
+                queue.append(following)
+
+    def search(self, text):
+        """Menor rango de las palabras que aparecen en ``text``, o ``None``"""
+        goto, fail, best = self.goto, self.fail, self.best
+        found = None
+        node = 0
+        for char in text:
+            while char not in goto[node] and node:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            rank = best[node]
+            if rank is not None and (found is None or rank < found):
+                found = rank
+                if found == 0:
+                    break
+        return found
+
+
+class KeywordMatcher:
+    """
+    Matcher compilado de una lista de palabras clave en orden de prioridad.
+    ``entries`` son tuplas ``(palabra, valor, coincidencia_exacta,
+    distingue_mayúsculas)``; ``match`` devuelve el valor de la primera
+    palabra de la lista que encaja con el mensaje, igual que el recorrido
+    uno a uno, pero sin recorrerlas.
+    """
+
+    def __init__(self, entries):
+        self.values = []
+        self.exact = {}
+        self.exact_folded = {}
+        self.contains = _Automaton()
+        self.contains_folded = _Automaton()
+        for rank, (word, value, exact_match, case_sensitive) in enumerate(entries):
+            self.values.append(value)
+            if not case_sensitive:
+                word = word.lower()
+            if exact_match:
+                (self.exact if case_sensitive else self.exact_folded).setdefault(word, rank)
+            elif word:
+                # Una palabra vacía (p. ej. "hola, ,adiós") encajaba con cualquier mensaje
+                (self.contains if case_sensitive else self.contains_folded).add(word, rank)
+        self.contains.compile()
+        self.contains_folded.compile()
+
+    def __len__(self):
+        return len(self.values)
+
+    def match(self, text):
+        if not self.values:
+            return None
+        folded = text.lower()
+        ranks = [
+            self.exact.get(text),
+            self.exact_folded.get(folded),
+            self.contains.search(text),
+            self.contains_folded.search(folded),
+        ]
+        ranks = [rank for rank in ranks if rank is not None]
+        return self.values[min(ranks)] if ranks else None
+
+
+# ------------------------------------------------------------ caché
+
+def _fingerprint(rows):
+    """Cambia al crear, editar o borrar cualquiera de las filas"""
+    return tuple(rows.aggregate(total=Count('id'), last_id=Max('id'), last_update=Max('updated_at')).values())
+
+
+def _cached(kind, owner_id, rows, build):
+    fingerprint = _fingerprint(rows)
+    with _lock:
+        cached = _matchers.get((kind, owner_id))
+        if cached is not None and cached[0] == fingerprint:
+            _matchers.move_to_end((kind, owner_id))
+            return cached[1]
+    matcher = build()
+    with _lock:
+        _matchers[(kind, owner_id)] = (fingerprint, matcher)
+        _matchers.move_to_end((kind, owner_id))
+        while len(_matchers) > MAX_MATCHERS:
+            _matchers.popitem(last=False)
+    return matcher
+
+
+# -------------------------------------------------------------- WhatsApp
+
+def whatsapp_entries(connection_id):
+    """Palabras clave activas de la conexión, en el orden en que se prueban"""
+    from .models import WhatsAppKeyword
+    rows = WhatsAppKeyword.objects.filter(connection_id=connection_id, is_active=True).order_by(
+        '-priority', 'keyword',
+    ).values_list('pk', 'keyword', 'response', 'is_exact_match', 'is_case_sensitive')
+    return [
+        (keyword, (pk, keyword, response), exact_match, case_sensitive)
+        for pk, keyword, response, exact_match, case_sensitive in rows
+    ]
+
+
+def match_whatsapp(connection_id, text):
+    """``(id, palabra, respuesta)`` de la palabra clave que responde al mensaje, o ``None``"""
+    from .models import WhatsAppKeyword
+    matcher = _cached(
+        'whatsapp', connection_id, WhatsAppKeyword.objects.filter(connection_id=connection_id),
+        lambda: KeywordMatcher(whatsapp_entries(connection_id)),
+    )
+    return matcher.match(text)
+
+
+# -------------------------------------------------------------- chatbots
+
+def chatbot_entries(chatbot_id):
+    """Palabras clave de las preguntas activas del chatbot, en el orden de las preguntas"""
+    from .models import ChatbotQuestion
+    questions = ChatbotQuestion.objects.filter(chatbot_id=chatbot_id, is_active=True).only(
+        'pk', 'keywords', 'answer',
+    )
+    entries = []
+    for question in questions:
+        for keyword in question.get_keywords_list():
+            entries.append((keyword, (question.pk, question.answer), False, False))
+    return entries
+
+
+def match_chatbot(chatbot_id, text):
+    """``(id, respuesta)`` de la primera pregunta con alguna palabra clave en el mensaje, o ``None``"""
+    from .models import ChatbotQuestion
+    matcher = _cached(
+        'chatbot', chatbot_id, ChatbotQuestion.objects.filter(chatbot_id=chatbot_id),
+        lambda: KeywordMatcher(chatbot_entries(chatbot_id)),
+    )
+    return matcher.match(text)
@@ -0,0 +1,79 @@
+"""
+Carga diferida de vistas para las URLs.
+
+Los módulos de vistas son muy grandes, así que las URLs no los importan al
+arrancar: cada ruta guarda una referencia ``LazyView`` que importa el módulo
+real la primera vez que llega una petición. Así los workers de gunicorn y los
+comandos de ``manage.py`` (que ejecutan los checks de URLs) no pagan el coste
+de importar todas las vistas.
+
+Uso en ``urls.py``::
+
+    crm_views = lazy_views('tickets.crm_views')
+
+    urlpatterns = [
+        path('crm/', crm_views.crm_dashboard, name='crm_dashboard'),
+    ]
+"""
+import importlib
+
+# Atributos que Django consulta al construir el resolver de URLs; responder
+# sin importar la vista evita cargar el módulo completo durante los checks.
+_RESOLVER_ATTRIBUTES = frozenset(['view_class', 'view_initkwargs'])
+
+
+class LazyView:
+    """Callable que resuelve ``module_path.view_name`` en la primera llamada."""
+
+    def __init__(self, module_path, view_name, initkwargs=None):
+        self.__module__ = module_path
+        self.__name__ = view_name
+        self.__qualname__ = view_name
+        self._initkwargs = initkwargs
+        self._view = None
+
+    def resolve(self):
+        if self._view is None:
+            view = getattr(importlib.import_module(self.__module__), self.__name__)
+            if self._initkwargs is not None:
+                view = view.as_view(**self._initkwargs)
+            self._view = view
+        return self._view
+
+    def as_view(self, **initkwargs):
+        """Equivalente diferido de ``ClassBasedView.as_view(**initkwargs)``."""
+        return LazyView(self.__module__, self.__name__, initkwargs=initkwargs)
+
+    def __call__(self, request, *args, **kwargs):
+        return self.resolve()(request, *args, **kwargs)
+
+    def __getattr__(self, attr):
+        # Atributos de decoradores (csrf_exempt, xframe_options_exempt...)
+        # que los middlewares leen antes de ejecutar la vista.
+        if attr.startswith('_') or attr in _RESOLVER_ATTRIBUTES:
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self):
+        return f'<LazyView {self.__module__}.{self.__name__}>'
+
+
+class LazyViewModule:
+    """Proxy de un módulo de vistas que devuelve ``LazyView`` por atributo."""
+
+    def __init__(self, module_path):
+        self._module_path = module_path
+        self._views = {}
+
+    def __getattr__(self, view_name):
+        if view_name.startswith('_'):
+            raise AttributeError(view_name)
+        view = self._views.get(view_name)
+        if view is None:
+            view = self._views[view_name] = LazyView(self._module_path, view_name)
+        return view
+
+
+def lazy_views(module_path):
+    """Devuelve un proxy de ``module_path`` cuyas vistas se importan al usarse."""
+    return LazyViewModule(module_path)
@@ -0,0 +1,103 @@
+from django.core.management.base import BaseCommand, CommandError
+import os
+import re
+import subprocess
+import sys
+
+
+# Código que ejecuta el arranque en frío: lo mismo que hace un worker de
+# gunicorn o un comando de manage.py que pasa los checks de URLs.
+STARTUP_CODE = (
+    'import django; django.setup(); '
+    'from django.urls import get_resolver; get_resolver().url_patterns'
+)
+
+# Módulos que no deben cargarse al arrancar; se importan en la primera vista que los usa
+DEFERRED_MODULES = ['reportlab', 'openai', 'qrcode', 'psutil', 'tickets.views']
+
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+class Command(BaseCommand):
+    help = 'Mide el tiempo de importación en frío (python -X importtime) y falla si supera el presupuesto'
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--budget-ms',
+            type=int,
+            default=1500,
+            help='Tiempo máximo de importación permitido en milisegundos (por defecto 1500)',
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=3,
+            help='Número de arranques a medir; se usa el mejor (por defecto 3)',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=10,
+            help='Número de módulos más lentos a mostrar',
+        )
+
+    def handle(self, *args, **options):
+        budget_ms = options['budget_ms']
+        best_total = None
+        best_modules = None
+
+        for _ in range(max(1, options['runs'])):
+            total_us, modules = self.measure()
+            if best_total is None or total_us < best_total:
+                best_total, best_modules = total_us, modules
+
+        total_ms = best_total / 1000
+        self.stdout.write(f'Tiempo de importación en frío: {total_ms:.0f} ms (presupuesto: {budget_ms} ms)')
+
+        slowest = sorted(best_modules.items(), key=lambda item: item[1], reverse=True)[:options['top']]
+        for name, cumulative_us in slowest:
+            self.stdout.write(f'  {cumulative_us / 1000:8.1f} ms  {name}')
+
+        loaded = [
+            name for name in DEFERRED_MODULES
+            if any(module == name or module.startswith(name + '.') for module in best_modules)
+        ]
+        if loaded:
+            raise CommandError(
+                'Módulos que deberían cargarse de forma diferida se importan al arrancar: '
+                + ', '.join(loaded)
+            )
+
+        if total_ms > budget_ms:
+            raise CommandError(
+                f'El arranque en frío ({total_ms:.0f} ms) supera el presupuesto de {budget_ms} ms'
+            )
+
+        self.stdout.write(self.style.SUCCESS('✓ Arranque en frío dentro del presupuesto'))
+
+    def measure(self):
+        """Lanza un intérprete nuevo con -X importtime y devuelve (total_us, {módulo: acumulado_us})"""
+        env = dict(os.environ)
+        env.setdefault('DJANGO_SETTINGS_MODULE', 'ticket_system.settings')
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', STARTUP_CODE],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        if result.returncode != 0:
+            raise CommandError(f'El arranque de Django falló:\n{result.stderr[-2000:]}')
+
+        total_us = 0
+        modules = {}
+        for line in result.stderr.splitlines():
+            match = IMPORTTIME_RE.match(line)
+            if not match:
+                continue
+            _, cumulative, indent, name = match.groups()
+            modules[name] = int(cumulative)
+            # Solo los módulos de primer nivel, para no contar dos veces sus dependencias
+            if len(indent) == 1:
+                total_us += int(cumulative)
+        return total_us, modules
@@ -0,0 +1,97 @@
+import random
+import string
+import time
+
+from django.core.management.base import BaseCommand
+
+from tickets.keyword_matcher import KeywordMatcher
+
+
+def naive_match(entries, text):
+    """El recorrido uno a uno que hacían antes las vistas"""
+    for word, value, exact_match, case_sensitive in entries:
+        message_to_check = text if case_sensitive else text.lower()
+        word_to_check = word if case_sensitive else word.lower()
+        if exact_match:
+            if message_to_check == word_to_check:
+                return value
+        elif word_to_check and word_to_check in message_to_check:
+            return value
+    return None
+
+
+class Command(BaseCommand):
+    help = (
+        'Compara el recorrido uno a uno de las palabras clave con el matcher compilado '
+        '(tickets/keyword_matcher.py) sobre palabras y mensajes generados'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--keywords',
+            type=int,
+            default=10000,
+            help='Número de palabras clave (por defecto 10000)',
+        )
+        parser.add_argument(
+            '--messages',
+            type=int,
+            default=1000,
+            help='Número de mensajes a comprobar (por defecto 1000)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=1,
+            help='Semilla de los datos generados (por defecto 1)',
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        alphabet = string.ascii_letters + 'áéíóúñ'
+
+        def word(low, high):
+            return ''.join(rng.choice(alphabet) for _ in range(rng.randint(low, high)))
+
+        entries = [
+            (word(4, 12), i, rng.random() < 0.1, rng.random() < 0.2)
+            for i in range(max(1, options['keywords']))
+        ]
+        messages = []
+        for _ in range(max(1, options['messages'])):
+            parts = [word(2, 10) for _ in range(rng.randint(3, 25))]
+            if rng.random() < 0.5:
+                parts.insert(rng.randrange(len(parts) + 1), rng.choice(entries)[0])
+            messages.append(' '.join(parts))
+        messages.extend(entry[0] for entry in rng.sample(entries, min(10, len(entries))))
+        self.stdout.write(f'{len(entries)} palabras clave, {len(messages)} mensajes')
+
+        started = time.monotonic()
+        matcher = KeywordMatcher(entries)
+        compile_time = time.monotonic() - started
+
+        started = time.monotonic()
+        compiled = [matcher.match(message) for message in messages]
+        compiled_time = time.monotonic() - started
+
+        started = time.monotonic()
+        naive = [naive_match(entries, message) for message in messages]
+        naive_time = time.monotonic() - started
+
+        mismatches = sum(1 for a, b in zip(compiled, naive) if a != b)
+        matched = sum(1 for value in compiled if value is not None)
+        self.stdout.write(f'Coincidencias: {matched} de {len(messages)} mensajes')
+        self.stdout.write(f'Compilación: {compile_time * 1000:.1f} ms')
+        self.stdout.write(
+            f'Uno a uno: {naive_time * 1000:.1f} ms '
+            f'({naive_time / len(messages) * 1000:.3f} ms/mensaje)'
+        )
+        self.stdout.write(
+            f'Compilado: {compiled_time * 1000:.1f} ms '
+            f'({compiled_time / len(messages) * 1000:.3f} ms/mensaje)'
+        )
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f'✗ {mismatches} mensajes con resultado distinto'))
+        else:
+            speedup = naive_time / compiled_time if compiled_time else float('inf')
+            self.stdout.write(self.style.SUCCESS(f'✓ Mismos resultados, {speedup:.0f}x más rápido'))
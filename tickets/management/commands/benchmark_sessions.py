@@ -0,0 +1,87 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from tickets.models import Product
+
+
+# Páginas públicas que se miden para los visitantes anónimos
+PUBLIC_URLS = ['home', 'blog_list', 'public_app_catalogs', 'cart_view']
+
+# Páginas que se miden con sesión iniciada (--username)
+AUTHENTICATED_URLS = ['dashboard', 'blog_list', 'cart_view']
+
+
+class Command(BaseCommand):
+    help = (
+        'Mide las consultas a django_session (y el total de consultas) por petición en las '
+        'páginas públicas, con y sin carrito, y opcionalmente con sesión iniciada'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--username',
+            help='Usuario con el que medir también las páginas con sesión iniciada',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='Peticiones por página; se muestra la media (por defecto 3)',
+        )
+
+    def handle(self, *args, **options):
+        self.repeat = max(1, options['repeat'])
+        self.stdout.write(f'Motor de sesiones: {settings.SESSION_ENGINE}')
+
+        with override_settings(ALLOWED_HOSTS=['*']):
+            self.section('Visitante anónimo sin cookies', Client(), PUBLIC_URLS)
+
+            product = Product.objects.filter(is_active=True).first()
+            if product:
+                client = Client()
+                client.post(reverse('cart_add', args=[product.pk]), {'next': '/'})
+                self.section('Visitante anónimo con carrito', client, PUBLIC_URLS)
+                client.session.flush()
+            else:
+                self.stdout.write('(sin productos activos: se omite la medición con carrito)')
+
+            if options['username']:
+                try:
+                    user = User.objects.get(username=options['username'])
+                except User.DoesNotExist:
+                    raise CommandError(f'No existe el usuario "{options["username"]}"')
+                client = Client()
+                client.force_login(user)
+                self.section(f'Usuario {user.username}', client, AUTHENTICATED_URLS)
+                client.logout()
+
+    def section(self, title, client, url_names):
+        self.stdout.write('')
+        self.stdout.write(self.style.MIGRATE_HEADING(title))
+        self.stdout.write(f'  {"Página":<32} {"Consultas":>9} {"Sesión":>7}  SELECT/INSERT/UPDATE')
+        for name in url_names:
+            url = reverse(name)
+            totals = {'all': 0, 'SELECT': 0, 'INSERT': 0, 'UPDATE': 0}
+            status = None
+            for _ in range(self.repeat):
+                with CaptureQueriesContext(connection) as queries:
+                    status = client.get(url).status_code
+                totals['all'] += len(queries)
+                for query in queries:
+                    sql = query['sql']
+                    verb = sql.split(None, 1)[0].upper()
+                    if 'django_session' in sql and verb in totals:
+                        totals[verb] += 1
+
+            session_total = totals['SELECT'] + totals['INSERT'] + totals['UPDATE']
+            self.stdout.write(
+                f'  {url + f" ({status})":<32} {totals["all"] / self.repeat:>9.1f} '
+                f'{session_total / self.repeat:>7.1f}  '
+                f'{totals["SELECT"] / self.repeat:.1f}/{totals["INSERT"] / self.repeat:.1f}/'
+                f'{totals["UPDATE"] / self.repeat:.1f}'
+            )
@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand
+from tickets.notification_utils import NotificationDispatcher
+import signal
+import time
+
+
+class Command(BaseCommand):
+    help = (
+        'Envía las notificaciones pendientes de la cola (email y Telegram). '
+        'Úsalo con NOTIFICATION_INLINE_DISPATCH=False o para vaciar la cola manualmente'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Envía lo pendiente y termina en lugar de quedarse esperando',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Notificaciones reservadas por lote (por defecto 100)',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5,
+            help='Segundos entre comprobaciones de la cola (por defecto 5)',
+        )
+
+    def handle(self, *args, **options):
+        dispatcher = NotificationDispatcher(batch_size=max(1, options['batch_size']))
+        self.stopping = False
+
+        if options['once']:
+            total = self.drain(dispatcher)
+            self.stdout.write(self.style.SUCCESS(f'{total} notificaciones procesadas'))
+            return
+
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+        self.stdout.write(self.style.SUCCESS('Despachador de notificaciones iniciado'))
+
+        while not self.stopping:
+            total = self.drain(dispatcher)
+            if total:
+                self.stdout.write(f'{total} notificaciones procesadas')
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS('Despachador de notificaciones detenido'))
+
+    def drain(self, dispatcher):
+        total = 0
+        while not self.stopping:
+            processed = dispatcher.run_once()
+            if not processed:
+                break
+            total += processed
+        return total
+
+    def request_stop(self, signum, frame):
+        self.stopping = True
@@ -23,43 +23,34 @@ class Command(BaseCommand):
         # Agrupar tickets por usuario para generar secuencias ordenadas
         users_tickets = {}
         for ticket in tickets_without_number:
-            user_id = ticket.created_by.id
+            user_id = ticket.created_by_id
             if user_id not in users_tickets:
                 users_tickets[user_id] = []
             users_tickets[user_id].append(ticket)
 
-        # Procesar tickets por usuario
+        # Procesar tickets por usuario: una reserva de números y un UPDATE en lote por usuario
         for user_id, user_tickets in users_tickets.items():
             self.stdout.write(f'📝 Procesando {len(user_tickets)} tickets del usuario ID {user_id}...')
             
             # Ordenar por fecha de creación para mantener secuencia cronológica
             user_tickets.sort(key=lambda t: t.created_at)
             
-            for ticket in user_tickets:
-                try:
-                    with transaction.atomic():
-                        # Generar número de ticket
-                        old_number = ticket.ticket_number
-                        ticket.save()  # Esto activará la generación automática del número
-                        
-                        if ticket.ticket_number != old_number:
-                            updated_count += 1
-                            self.stdout.write(
-                                f'  ✓ Ticket #{ticket.id}: {old_number or "sin número"} → {ticket.ticket_number}'
-                            )
-                        else:
-                            self.stdout.write(
-                                f'  ⚠ Ticket #{ticket.id}: No se pudo generar número'
-                            )
-                            error_count += 1
-                            
-                except Exception as e:
-                    error_count += 1
-                    self.stdout.write(
-                        self.style.ERROR(
-                            f'  ❌ Error en ticket #{ticket.id}: {str(e)}'
-                        )
+            try:
+                with transaction.atomic():
+                    Ticket.assign_ticket_numbers(user_tickets)
+                    Ticket.objects.bulk_update(user_tickets, ['ticket_number'], batch_size=500)
+            except Exception as e:
+                error_count += len(user_tickets)
+                self.stdout.write(
+                    self.style.ERROR(
+                        f'  ❌ Error en los tickets del usuario ID {user_id}: {str(e)}'
                     )
+                )
+                continue
+            
+            updated_count += len(user_tickets)
+            for ticket in user_tickets:
+                self.stdout.write(f'  ✓ Ticket #{ticket.id}: sin número → {ticket.ticket_number}')
 
         # Resumen final
         self.stdout.write('\n' + '='*50)
@@ -0,0 +1,95 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from tickets.models import Category, Company, Ticket
+from tickets.ticket_import import DEFAULT_CHUNK_SIZE, TicketImporter, TicketImportError
+import time
+
+
+class Command(BaseCommand):
+    help = 'Importa tickets desde un Excel (.xlsx) con las mismas columnas que la importación web'
+
+    def add_arguments(self, parser):
+        parser.add_argument('excel_file', help='Ruta del archivo .xlsx')
+        parser.add_argument(
+            '--user',
+            required=True,
+            help='Usuario (username) que figurará como creador de los tickets',
+        )
+        parser.add_argument(
+            '--company',
+            help='Nombre de la empresa por defecto para las filas que no indiquen una',
+        )
+        parser.add_argument(
+            '--category',
+            help='Nombre de la categoría por defecto para las filas que no indiquen una',
+        )
+        parser.add_argument(
+            '--priority',
+            default='medium',
+            choices=[code for code, _ in Ticket.PRIORITY_CHOICES],
+            help='Prioridad por defecto (por defecto medium)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f'Tickets insertados por lote (por defecto {DEFAULT_CHUNK_SIZE})',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Valida todas las filas sin crear ningún ticket',
+        )
+        parser.add_argument(
+            '--no-notify',
+            action='store_true',
+            help='No envía la notificación resumen a Telegram',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f'El usuario "{options["user"]}" no existe')
+
+        company = category = None
+        if options['company']:
+            company = Company.objects.filter(name__iexact=options['company']).first()
+            if company is None:
+                raise CommandError(f'La empresa "{options["company"]}" no existe')
+        if options['category']:
+            category = Category.objects.filter(name__iexact=options['category']).first()
+            if category is None:
+                raise CommandError(f'La categoría "{options["category"]}" no existe')
+
+        importer = TicketImporter(
+            user=user,
+            company=company,
+            category=category,
+            priority=options['priority'],
+            chunk_size=options['chunk_size'],
+            dry_run=options['dry_run'],
+            notify=not options['no_notify'],
+        )
+
+        start = time.monotonic()
+        try:
+            with open(options['excel_file'], 'rb') as excel_file:
+                result = importer.run(excel_file)
+        except (OSError, TicketImportError) as e:
+            raise CommandError(str(e))
+        elapsed = time.monotonic() - start
+
+        for line in result.error_lines():
+            self.stdout.write(self.style.WARNING(f'  ⚠ {line}'))
+
+        if result.dry_run:
+            self.stdout.write(
+                f'Validación: {result.valid_rows} filas válidas, {result.error_count} con errores '
+                f'de {result.total_rows} ({elapsed:.2f}s). No se ha creado ningún ticket.'
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'✅ {result.created_count} tickets importados, {result.error_count} filas con errores '
+                f'de {result.total_rows} ({elapsed:.2f}s)'
+            ))
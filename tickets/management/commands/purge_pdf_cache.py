@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from tickets.models import PdfExportJob
+from tickets.pdf_service import CACHE_ROOT
+
+
+class Command(BaseCommand):
+    help = (
+        'Borra los PDF de la caché de documentos y las exportaciones terminadas '
+        'con más de --days días'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=30,
+            help='Antigüedad mínima en días de lo que se borra (por defecto 30)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Muestra lo que se borraría sin borrar nada',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        dry_run = options['dry_run']
+
+        old_jobs = PdfExportJob.objects.filter(status__in=['done', 'failed'], created_at__lt=cutoff)
+        jobs_count = old_jobs.count()
+        if not dry_run:
+            old_jobs.delete()
+
+        # Los archivos que aún usa alguna exportación se conservan
+        in_use = set(PdfExportJob.objects.exclude(file='').values_list('file', flat=True))
+        files_count = 0
+        for path in self.cached_files(CACHE_ROOT):
+            if path in in_use or default_storage.get_modified_time(path) >= cutoff:
+                continue
+            files_count += 1
+            if dry_run:
+                self.stdout.write(f'  {path}')
+            else:
+                default_storage.delete(path)
+
+        verb = 'se borrarían' if dry_run else 'borrados'
+        self.stdout.write(self.style.SUCCESS(
+            f'{files_count} PDF de la caché y {jobs_count} exportaciones {verb}'
+        ))
+
+    def cached_files(self, directory):
+        try:
+            directories, files = default_storage.listdir(directory)
+        except FileNotFoundError:
+            return
+        for name in files:
+            yield f'{directory}/{name}'
+        for name in directories:
+            yield from self.cached_files(f'{directory}/{name}')
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from tickets.models import Contact
+import time
+
+
+class Command(BaseCommand):
+    help = (
+        'Recalcula el resumen de actividades de los contactos (activity_count y '
+        'next_activity_date) a partir de OpportunityActivity'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--stale',
+            action='store_true',
+            help='Solo recalcula la próxima actividad de los contactos cuya fecha ya ha pasado',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Contactos procesados por lote (por defecto 1000)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        start = time.monotonic()
+
+        if options['stale']:
+            contact_ids = list(
+                Contact.objects.filter(next_activity_date__lt=timezone.now()).values_list('id', flat=True)
+            )
+            for offset in range(0, len(contact_ids), batch_size):
+                Contact.refresh_next_activity(contact_ids[offset:offset + batch_size])
+            self.stdout.write(self.style.SUCCESS(
+                f'✓ Próxima actividad recalculada en {len(contact_ids)} contactos '
+                f'({time.monotonic() - start:.2f}s)'
+            ))
+            return
+
+        total = changed = 0
+        contact_ids = Contact.objects.order_by('id').values_list('id', flat=True)
+        batch = []
+        for contact_id in contact_ids.iterator(chunk_size=batch_size):
+            batch.append(contact_id)
+            if len(batch) >= batch_size:
+                changed += Contact.rebuild_activity_summary(batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            changed += Contact.rebuild_activity_summary(batch)
+            total += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ {total} contactos revisados, {changed} corregidos ({time.monotonic() - start:.2f}s)'
+        ))
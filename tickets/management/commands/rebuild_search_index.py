@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from tickets.models import SearchDocument
+from tickets.search import ENTITIES, FTS_TABLE, get_backend, index_objects, mark_indexed
+import time
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el índice de búsqueda (tickets, contactos, blog y base de conocimientos)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--entity',
+            nargs='+',
+            choices=sorted(ENTITIES),
+            help='Tipos a reindexar (por defecto todos)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Objetos indexados por lote (por defecto 500)',
+        )
+
+    def handle(self, *args, **options):
+        names = options['entity'] or list(ENTITIES)
+        batch_size = max(1, options['batch_size'])
+        self.stdout.write(f'Motor de búsqueda: {get_backend()}')
+
+        for name in names:
+            entity = ENTITIES[name]
+            start = time.monotonic()
+            total = 0
+            with transaction.atomic():
+                SearchDocument.objects.filter(entity=name).delete()
+                batch = []
+                for obj in entity.get_queryset().iterator(chunk_size=batch_size):
+                    batch.append(obj)
+                    if len(batch) >= batch_size:
+                        total += index_objects(name, batch)
+                        batch = []
+                if batch:
+                    total += index_objects(name, batch)
+                # Desde aquí las búsquedas de este tipo usan el índice
+                mark_indexed(name)
+            self.stdout.write(self.style.SUCCESS(
+                f'✓ {entity.label}: {total} documentos ({time.monotonic() - start:.2f}s)'
+            ))
+
+        if get_backend() == 'fts5':
+            # Compacta los segmentos de la tabla FTS tras la carga masiva
+            with connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from tickets.models import SocialHashtag, SocialMention, SocialPost
+from tickets.social_index import index_posts, rebuild_counters
+import time
+
+
+class Command(BaseCommand):
+    help = (
+        'Reconstruye el índice de hashtags y menciones de la red social y sus contadores '
+        'por ámbito de visibilidad'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Publicaciones indexadas por lote (por defecto 500)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        start = time.monotonic()
+        total = rows = 0
+
+        with transaction.atomic():
+            SocialHashtag.objects.all().delete()
+            SocialMention.objects.all().delete()
+            posts = SocialPost.objects.filter(is_active=True).only(
+                'id', 'user_id', 'content', 'is_active', 'is_private', 'company_only'
+            ).order_by('id')
+            batch = []
+            for post in posts.iterator(chunk_size=batch_size):
+                batch.append(post)
+                if len(batch) >= batch_size:
+                    rows += index_posts(batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                rows += index_posts(batch)
+                total += len(batch)
+            counters = rebuild_counters()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ {total} publicaciones, {rows} hashtags/menciones, {counters} contadores '
+            f'({time.monotonic() - start:.2f}s)'
+        ))
@@ -0,0 +1,74 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from tickets.models import WebsiteTracker
+from tickets.web_tracker_utils import MAX_WORKERS, TRACKER_FIELDS, apply_result, track_websites
+
+
+class Command(BaseCommand):
+    help = (
+        'Vuelve a rastrear los sitios web/IPs guardados en el rastreador web, varios a la vez. '
+        'Pensado para ejecutarse periódicamente (cron)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than',
+            type=int,
+            default=0,
+            help='Solo los rastreos no actualizados en los últimos N minutos (por defecto todos)',
+        )
+        parser.add_argument(
+            '--user',
+            help='Solo los rastreos de este usuario',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            help='Número máximo de rastreos (los más antiguos primero)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=MAX_WORKERS,
+            help=f'Objetivos que se rastrean a la vez (por defecto {MAX_WORKERS})',
+        )
+
+    def handle(self, *args, **options):
+        trackers = WebsiteTracker.objects.order_by('updated_at')
+        if options['older_than']:
+            trackers = trackers.filter(updated_at__lt=timezone.now() - timedelta(minutes=options['older_than']))
+        if options['user']:
+            trackers = trackers.filter(user__username=options['user'])
+        if options['limit']:
+            trackers = trackers[:options['limit']]
+        trackers = list(trackers)
+        if not trackers:
+            self.stdout.write('No hay rastreos que actualizar')
+            return
+
+        # Un objetivo guardado por varios usuarios se rastrea una sola vez
+        targets = [tracker.target for tracker in trackers]
+        self.stdout.write(f'Rastreando {len(set(targets))} objetivos ({len(trackers)} rastreos)...')
+        started = time.monotonic()
+        results = track_websites(targets, max_workers=options['workers'])
+
+        active = 0
+        for tracker in trackers:
+            result = results[tracker.target]
+            apply_result(tracker, result)
+            tracker.save(update_fields=TRACKER_FIELDS + ['updated_at'])
+            active += bool(result['is_active'] or result['http_status_code'])
+            timings = result['probe_timings']
+            self.stdout.write(
+                f'  {tracker.target}: HTTP {result["http_status_code"] or "-"} '
+                f'({timings.get("total", 0):.0f} ms)'
+            )
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ {len(trackers)} rastreos actualizados en {elapsed:.1f}s ({active} responden)'
+        ))
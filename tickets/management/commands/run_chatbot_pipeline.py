@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from tickets.chatbot_pipeline import MAX_WORKERS, run_pending_messages
+import signal
+import time
+
+
+class Command(BaseCommand):
+    help = (
+        'Procesa los mensajes de chatbot pendientes (geolocalización, datos del usuario y '
+        'respuestas de la IA). Úsalo con CHATBOT_PIPELINE_INLINE=False o para vaciar la cola manualmente'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Procesa lo pendiente y termina en lugar de quedarse esperando',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1,
+            help='Segundos entre comprobaciones de la cola (por defecto 1)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=MAX_WORKERS,
+            help=f'Mensajes que se procesan a la vez (por defecto {MAX_WORKERS})',
+        )
+
+    def handle(self, *args, **options):
+        if options['once']:
+            total = run_pending_messages(options['workers'])
+            self.stdout.write(self.style.SUCCESS(f'{total} mensajes procesados'))
+            return
+
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+        self.stdout.write(self.style.SUCCESS('Procesamiento de mensajes de chatbot iniciado'))
+
+        while not self.stopping:
+            total = run_pending_messages(options['workers'])
+            if total:
+                self.stdout.write(f'{total} mensajes procesados')
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS('Procesamiento de mensajes de chatbot detenido'))
+
+    def request_stop(self, signum, frame):
+        self.stopping = True
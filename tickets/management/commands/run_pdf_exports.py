@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from tickets.pdf_service import run_pending_exports
+import signal
+import time
+
+
+class Command(BaseCommand):
+    help = (
+        'Genera las exportaciones PDF pendientes. '
+        'Úsalo con PDF_EXPORT_INLINE=False o para vaciar la cola manualmente'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Genera lo pendiente y termina en lugar de quedarse esperando',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5,
+            help='Segundos entre comprobaciones de la cola (por defecto 5)',
+        )
+
+    def handle(self, *args, **options):
+        if options['once']:
+            total = run_pending_exports()
+            self.stdout.write(self.style.SUCCESS(f'{total} exportaciones procesadas'))
+            return
+
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+        self.stdout.write(self.style.SUCCESS('Generador de exportaciones PDF iniciado'))
+
+        while not self.stopping:
+            total = run_pending_exports()
+            if total:
+                self.stdout.write(f'{total} exportaciones procesadas')
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS('Generador de exportaciones PDF detenido'))
+
+    def request_stop(self, signum, frame):
+        self.stopping = True
@@ -1,7 +1,10 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from tickets.models import ScheduledTask, ScheduledTaskExecution
-import time
+from tickets.models import ScheduledTask
+from tickets.scheduler_utils import (
+    DEFAULT_TASK_TIMEOUT, ExecutionLogBuffer, acquire_task_lease, get_worker_id, release_task_lease,
+    run_task_code_with_timeout,
+)
 import logging
 
 # Configurar logging
@@ -21,6 +24,12 @@ class Command(BaseCommand):
             type=int,
             help='Ejecuta solo la tarea con el ID especificado',
         )
+        parser.add_argument(
+            '--task-timeout',
+            type=int,
+            default=DEFAULT_TASK_TIMEOUT,
+            help=f'Segundos máximos por ejecución antes de cancelarla (por defecto {DEFAULT_TASK_TIMEOUT})',
+        )
         parser.add_argument(
             '--verbose',
             action='store_true',
@@ -31,8 +40,10 @@ class Command(BaseCommand):
         dry_run = options['dry_run']
         task_id = options['task_id']
         verbose = options['verbose']
+        self.task_timeout = options['task_timeout']
         
-        now = timezone.now()
+        self.worker_id = get_worker_id()
+        self.execution_log = ExecutionLogBuffer()
         
         if task_id:
             # Ejecutar una tarea específica
@@ -62,103 +73,56 @@ class Command(BaseCommand):
             self.style.SUCCESS(f'Encontradas {len(tasks_to_execute)} tareas para ejecutar:')
         )
         
-        for task in tasks_to_execute:
-            if verbose:
-                next_exec = task.get_next_execution()
-                self.stdout.write(f'  - {task.name} (próxima: {next_exec})')
-            
-            if dry_run:
-                self.stdout.write(f'[DRY RUN] Se ejecutaría: {task.name}')
-                continue
+        try:
+            for task in tasks_to_execute:
+                if verbose:
+                    next_exec = task.get_next_execution()
+                    self.stdout.write(f'  - {task.name} (próxima: {next_exec})')
                 
-            self.execute_task(task, verbose)
+                if dry_run:
+                    self.stdout.write(f'[DRY RUN] Se ejecutaría: {task.name}')
+                    continue
+                    
+                # Con --task-id la tarea se ejecuta aunque no le toque todavía
+                self.execute_task(task, verbose, require_due=not task_id)
+        finally:
+            # Las ejecuciones se registran en un único bulk_create
+            self.execution_log.flush()
+
+    def execute_task(self, task, verbose=False, require_due=True):
+        """Ejecuta una tarea específica si consigue su lease"""
+        if not acquire_task_lease(task, self.worker_id, timeout=self.task_timeout, require_due=require_due):
+            # Otro proceso (cron solapado o run_scheduler) ya la está ejecutando
+            if verbose:
+                self.stdout.write(
+                    self.style.WARNING(f'- {task.name} ya la ejecutó o la está ejecutando otro proceso, se omite')
+                )
+            return
 
-    def execute_task(self, task, verbose=False):
-        """Ejecuta una tarea específica"""
         if verbose:
             self.stdout.write(f'Ejecutando tarea: {task.name}')
         
-        start_time = time.time()
+        # En un proceso hijo que se cancela antes de que caduque el lease
+        status, result, execution_time = run_task_code_with_timeout(
+            task.code, self.task_timeout, name=f'scheduled-task-{task.id}',
+        )
+        finished_at = timezone.now()
         
-        try:
-            # Preparar el entorno de ejecución
-            exec_globals = {
-                '__builtins__': __builtins__,
-                'timezone': timezone,
-                'datetime': timezone.datetime,
-                'timedelta': timezone.timedelta,
-                'logger': logger,
-                'print': self.safe_print,
-            }
-            
-            # Importar modelos comunes que podrían necesitarse
-            try:
-                from django.contrib.auth.models import User
-                from tickets.models import Ticket, Contact, Company
-                exec_globals.update({
-                    'User': User,
-                    'Ticket': Ticket,
-                    'Contact': Contact,
-                    'Company': Company,
-                })
-            except ImportError:
-                pass
-            
-            exec_locals = {}
-            
-            # Ejecutar el código de la tarea
-            exec(task.code, exec_globals, exec_locals)
-            
-            execution_time = time.time() - start_time
-            result = f"Ejecución exitosa (tiempo: {execution_time:.2f}s)"
-            
-            # Registrar la ejecución exitosa
-            execution = ScheduledTaskExecution.objects.create(
-                task=task,
-                status='success',
-                result=result,
-                execution_time=execution_time
-            )
-            
-            # Actualizar la tarea
-            task.last_execution = timezone.now()
-            task.last_result = result
-            task.success_count += 1
-            task.save()
-            
+        # Actualizar la tarea y liberar el lease
+        release_task_lease(task, self.worker_id, status, result, finished_at)
+        self.execution_log.add(task, status, result, execution_time, finished_at)
+        
+        if status == 'success':
             if verbose:
                 self.stdout.write(
                     self.style.SUCCESS(f'✓ {task.name} ejecutada exitosamente en {execution_time:.2f}s')
                 )
             
             logger.info(f'Tarea programada ejecutada exitosamente: {task.name} (ID: {task.id})')
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            error_message = str(e)
-            
-            # Registrar la ejecución con error
-            execution = ScheduledTaskExecution.objects.create(
-                task=task,
-                status='error',
-                result=error_message,
-                execution_time=execution_time
-            )
-            
-            # Actualizar la tarea
-            task.last_execution = timezone.now()
-            task.last_result = error_message
-            task.error_count += 1
-            task.save()
-            
+        else:
             self.stdout.write(
-                self.style.ERROR(f'✗ Error ejecutando {task.name}: {error_message}')
+                self.style.ERROR(f'✗ Error ejecutando {task.name}: {result}')
             )
             
-            logger.error(f'Error ejecutando tarea programada {task.name} (ID: {task.id}): {error_message}')
+            logger.error(f'Error ejecutando tarea programada {task.name} (ID: {task.id}): {result}')
 
-    def safe_print(self, *args, **kwargs):
-        """Función print segura que captura la salida"""
-        output = ' '.join(str(arg) for arg in args)
-        self.stdout.write(output)
-        return output
\ No newline at end of file
@@ -0,0 +1,273 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Max
+from django.utils import timezone
+from multiprocessing.connection import wait
+from tickets.models import ScheduledTask
+from tickets.scheduler_utils import (
+    DEFAULT_TASK_TIMEOUT, ExecutionLogBuffer, acquire_task_lease, get_worker_id,
+    release_task_lease, start_task_process, stop_task_process, task_process_context,
+)
+import heapq
+import logging
+import signal
+import time
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+class RunningTask:
+    """Tarea en ejecución en un proceso hijo"""
+
+    def __init__(self, task, process, result_conn, timeout):
+        self.task = task
+        self.process = process
+        self.result_conn = result_conn
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout
+
+
+class Command(BaseCommand):
+    help = (
+        'Demonio que ejecuta las tareas programadas: mantiene un heap con la próxima '
+        'ejecución de cada tarea y las lanza en un pool acotado de procesos'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Número máximo de tareas ejecutándose a la vez (por defecto 4)',
+        )
+        parser.add_argument(
+            '--task-timeout',
+            type=int,
+            default=DEFAULT_TASK_TIMEOUT,
+            help=f'Segundos máximos por ejecución antes de cancelarla (por defecto {DEFAULT_TASK_TIMEOUT})',
+        )
+        parser.add_argument(
+            '--reload-interval',
+            type=int,
+            default=30,
+            help='Cada cuántos segundos se comprueba si las tareas han cambiado (por defecto 30)',
+        )
+        parser.add_argument(
+            '--log-batch-size',
+            type=int,
+            default=50,
+            help='Ejecuciones acumuladas antes de guardarlas en lote (por defecto 50)',
+        )
+        parser.add_argument(
+            '--log-flush-interval',
+            type=int,
+            default=10,
+            help='Segundos máximos que una ejecución espera a guardarse (por defecto 10)',
+        )
+        parser.add_argument(
+            '--verbose',
+            action='store_true',
+            help='Muestra información detallada de la planificación',
+        )
+
+    def handle(self, *args, **options):
+        self.workers = max(1, options['workers'])
+        self.task_timeout = options['task_timeout']
+        self.reload_interval = options['reload_interval']
+        self.verbose = options['verbose']
+
+        self.worker_id = get_worker_id()
+        self.execution_log = ExecutionLogBuffer(
+            batch_size=options['log_batch_size'],
+            flush_interval=options['log_flush_interval'],
+        )
+        self.heap = []            # (timestamp, task_id)
+        self.next_run = {}        # task_id -> timestamp vigente en el heap
+        self.tasks = {}           # task_id -> ScheduledTask
+        self.running = {}         # task_id -> RunningTask
+        self.fingerprint = None
+        self.next_reload = 0
+        self.stopping = False
+
+        self.mp_context = task_process_context()
+
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Planificador iniciado ({self.worker_id}, {self.workers} workers, '
+            f'timeout {self.task_timeout}s)'
+        ))
+
+        try:
+            while not self.stopping:
+                self.collect_finished()
+                self.cancel_expired()
+
+                if time.monotonic() >= self.next_reload:
+                    self.reload_if_changed()
+                    self.next_reload = time.monotonic() + self.reload_interval
+
+                self.launch_due_tasks()
+                self.execution_log.flush_if_due()
+                self.wait_for_next_event()
+        finally:
+            self.shutdown()
+
+    def request_stop(self, signum, frame):
+        self.stdout.write(f'Señal {signum} recibida, deteniendo el planificador...')
+        self.stopping = True
+
+    # ------------------------------------------------------------------ heap
+
+    def reload_if_changed(self):
+        """Recarga las tareas si alguna se ha creado, editado o borrado"""
+        fingerprint = ScheduledTask.objects.aggregate(total=Count('id'), last_update=Max('updated_at'))
+        fingerprint = (fingerprint['total'], fingerprint['last_update'])
+        if fingerprint == self.fingerprint:
+            return
+        self.fingerprint = fingerprint
+
+        self.tasks = {task.id: task for task in ScheduledTask.objects.filter(is_active=True)}
+        self.heap = []
+        self.next_run = {}
+        for task in self.tasks.values():
+            if task.id not in self.running:
+                self.schedule(task)
+
+        if self.verbose:
+            self.stdout.write(f'Tareas cargadas: {len(self.tasks)} activas')
+
+    def schedule(self, task, when=None):
+        when = when or task.get_next_execution()
+        timestamp = when.timestamp()
+        self.next_run[task.id] = timestamp
+        heapq.heappush(self.heap, (timestamp, task.id))
+        if self.verbose:
+            self.stdout.write(f'  - {task.name} (próxima: {timezone.localtime(when)})')
+
+    def refresh_and_schedule(self, task_id):
+        """Relee la tarea tras ejecutarla (o tras perder el lease) y la vuelve a planificar"""
+        task = ScheduledTask.objects.filter(pk=task_id, is_active=True).first()
+        if task is None:
+            self.tasks.pop(task_id, None)
+            self.next_run.pop(task_id, None)
+            return
+        self.tasks[task_id] = task
+
+        when = task.get_next_execution()
+        if when <= timezone.now() and task.locked_until:
+            # Otro nodo la está ejecutando; reintentar cuando caduque su lease
+            when = task.locked_until
+        self.schedule(task, when)
+
+    def launch_due_tasks(self):
+        now = time.time()
+        while self.heap and self.heap[0][0] <= now and len(self.running) < self.workers:
+            timestamp, task_id = heapq.heappop(self.heap)
+            if self.next_run.get(task_id) != timestamp or task_id in self.running:
+                continue  # Entrada obsoleta del heap
+            del self.next_run[task_id]
+
+            task = self.tasks.get(task_id)
+            if task is None:
+                continue
+            if not acquire_task_lease(task, self.worker_id, timeout=self.task_timeout):
+                if self.verbose:
+                    self.stdout.write(f'- {task.name} la ejecuta otro proceso, se replanifica')
+                self.refresh_and_schedule(task_id)
+                continue
+            self.start(task)
+
+    # ------------------------------------------------------------- procesos
+
+    def start(self, task):
+        process, parent_conn = start_task_process(self.mp_context, task.code, f'scheduled-task-{task.id}')
+        self.running[task.id] = RunningTask(task, process, parent_conn, self.task_timeout)
+        if self.verbose:
+            self.stdout.write(f'Ejecutando tarea: {task.name} (pid {process.pid})')
+
+    def collect_finished(self):
+        for task_id, running in list(self.running.items()):
+            if not running.result_conn.poll():
+                if running.process.is_alive():
+                    continue
+                # El proceso terminó sin enviar resultado (p. ej. os._exit o señal)
+                result = (
+                    'error',
+                    f'El proceso terminó sin resultado (código {running.process.exitcode})',
+                    time.monotonic() - running.started,
+                )
+            else:
+                try:
+                    result = running.result_conn.recv()
+                except EOFError:
+                    result = ('error', 'El proceso terminó sin resultado', time.monotonic() - running.started)
+            running.process.join()
+            self.finish(task_id, *result)
+
+    def cancel_expired(self):
+        now = time.monotonic()
+        for task_id, running in list(self.running.items()):
+            if now < running.deadline:
+                continue
+            stop_task_process(running.process)
+            self.finish(
+                task_id,
+                'timeout',
+                f'Tiempo máximo de ejecución superado ({self.task_timeout}s)',
+                now - running.started,
+            )
+
+    def finish(self, task_id, status, result, execution_time):
+        running = self.running.pop(task_id)
+        running.result_conn.close()
+        task = running.task
+        finished_at = timezone.now()
+
+        release_task_lease(task, self.worker_id, status, result, finished_at)
+        self.execution_log.add(task, status, result, execution_time, finished_at)
+
+        if status == 'success':
+            if self.verbose:
+                self.stdout.write(
+                    self.style.SUCCESS(f'✓ {task.name} ejecutada exitosamente en {execution_time:.2f}s')
+                )
+            logger.info(f'Tarea programada ejecutada exitosamente: {task.name} (ID: {task.id})')
+        else:
+            self.stdout.write(self.style.ERROR(f'✗ Error ejecutando {task.name}: {result}'))
+            logger.error(f'Error ejecutando tarea programada {task.name} (ID: {task.id}): {result}')
+
+        if not self.stopping:
+            self.refresh_and_schedule(task_id)
+
+    def wait_for_next_event(self):
+        """Duerme hasta la próxima tarea, el próximo timeout, la recarga o el fin de un hijo"""
+        now = time.monotonic()
+        timeout = self.next_reload - now
+        if self.heap:
+            timeout = min(timeout, self.heap[0][0] - time.time())
+        for running in self.running.values():
+            timeout = min(timeout, running.deadline - now)
+        if self.execution_log.pending:
+            timeout = min(timeout, self.execution_log.flush_interval)
+        timeout = max(0.05, min(timeout, 1.0))
+
+        sentinels = [running.process.sentinel for running in self.running.values()]
+        if sentinels:
+            wait(sentinels, timeout)
+        else:
+            time.sleep(timeout)
+
+    def shutdown(self):
+        """Espera a las tareas en curso (hasta su timeout) y guarda los registros pendientes"""
+        if self.running:
+            self.stdout.write(f'Esperando {len(self.running)} tareas en ejecución...')
+        while self.running:
+            self.collect_finished()
+            self.cancel_expired()
+            sentinels = [running.process.sentinel for running in self.running.values()]
+            if sentinels:
+                wait(sentinels, 1.0)
+        self.execution_log.flush()
+        self.stdout.write(self.style.SUCCESS('Planificador detenido'))
@@ -0,0 +1,143 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from tickets.models import Ticket
+import time
+
+
+STRESS_TITLE_PREFIX = '[stress-ticket-numbers]'
+
+
+class Command(BaseCommand):
+    help = (
+        'Prueba de carga del contador de números de ticket: crea tickets a la vez desde '
+        'muchos hilos y comprueba que no hay números duplicados ni huecos'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=16,
+            help='Hilos creando tickets a la vez (por defecto 16)',
+        )
+        parser.add_argument(
+            '--tickets',
+            type=int,
+            default=20,
+            help='Tickets que crea cada hilo (por defecto 20)',
+        )
+        parser.add_argument(
+            '--users',
+            nargs='+',
+            default=None,
+            help='Usuarios (username) que crean los tickets; por defecto el primer superusuario',
+        )
+        parser.add_argument(
+            '--bulk',
+            type=int,
+            default=1,
+            help='Tickets por reserva: 1 usa Ticket.save(), más de 1 usa la reserva en bloque (por defecto 1)',
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help='No borra los tickets creados al terminar',
+        )
+
+    def handle(self, *args, **options):
+        if options['users']:
+            users = list(User.objects.filter(username__in=options['users']))
+        else:
+            users = list(User.objects.filter(is_superuser=True).order_by('id')[:1])
+        if not users:
+            raise CommandError('No se encontraron usuarios para crear los tickets')
+
+        if connection.vendor == 'sqlite':
+            self.stdout.write(self.style.WARNING(
+                'SQLite serializa las escrituras y no soporta select_for_update; '
+                'la prueba es representativa en PostgreSQL'
+            ))
+
+        threads = max(1, options['threads'])
+        per_thread = max(1, options['tickets'])
+        bulk = max(1, options['bulk'])
+        jobs = [(users[i % len(users)], per_thread, bulk) for i in range(threads)]
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(lambda job: self.create_tickets(*job), jobs))
+        elapsed = time.monotonic() - start
+
+        ticket_ids = [ticket_id for ids, _ in results for ticket_id in ids]
+        errors = [error for _, errs in results for error in errs]
+        self.stdout.write(
+            f'{len(ticket_ids)} tickets creados en {elapsed:.2f}s '
+            f'({len(ticket_ids) / elapsed:.0f} tickets/s, {threads} hilos, reserva de {bulk})'
+        )
+
+        try:
+            problems = self.check_numbers(ticket_ids, users)
+        finally:
+            if not options['keep']:
+                Ticket.objects.filter(id__in=ticket_ids).delete()
+
+        for error in errors[:10]:
+            self.stdout.write(self.style.ERROR(f'  ❌ {error}'))
+        for problem in problems:
+            self.stdout.write(self.style.ERROR(f'  ❌ {problem}'))
+        if errors or problems:
+            raise CommandError(f'{len(errors)} errores al crear y {len(problems)} problemas en la numeración')
+
+        self.stdout.write(self.style.SUCCESS('✓ Todos los números son únicos y consecutivos'))
+
+    def create_tickets(self, user, count, bulk):
+        """Crea ``count`` tickets desde el hilo actual y devuelve (ids, errores)"""
+        ids, errors = [], []
+        try:
+            for offset in range(0, count, bulk):
+                size = min(bulk, count - offset)
+                tickets = [
+                    Ticket(
+                        title=f'{STRESS_TITLE_PREFIX} {user.username} {offset + i}',
+                        description='Ticket generado por stress_ticket_numbers',
+                        created_by=user,
+                    )
+                    for i in range(size)
+                ]
+                try:
+                    with transaction.atomic():
+                        if size == 1:
+                            # Mismo camino que un alta normal, sin encolar notificaciones
+                            tickets[0].ticket_number = tickets[0].generate_ticket_number()
+                        else:
+                            Ticket.assign_ticket_numbers(tickets)
+                        Ticket.objects.bulk_create(tickets)
+                except Exception as e:
+                    errors.append(f'{user.username}: {e}')
+                    continue
+                ids.extend(ticket.pk for ticket in tickets if ticket.pk)
+        finally:
+            connection.close()
+        return ids, errors
+
+    def check_numbers(self, ticket_ids, users):
+        problems = []
+        numbers = list(Ticket.objects.filter(id__in=ticket_ids).values_list('created_by_id', 'ticket_number'))
+
+        duplicates = [number for number, count in Counter(n for _, n in numbers).items() if count > 1]
+        if duplicates:
+            problems.append(f'Números duplicados: {", ".join(sorted(duplicates)[:10])}')
+
+        for user in users:
+            sequences = sorted(
+                int(number.split('-', 1)[1]) for user_id, number in numbers if user_id == user.id
+            )
+            if sequences and sequences[-1] - sequences[0] + 1 != len(sequences):
+                problems.append(
+                    f'Huecos en la secuencia de {user.username}: '
+                    f'{len(sequences)} tickets entre {sequences[0]} y {sequences[-1]}'
+                )
+        return problems
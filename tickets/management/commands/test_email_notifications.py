@@ -68,7 +68,7 @@ class Command(BaseCommand):
         self.stdout.write('📤 Enviando notificación...')
         
         try:
-            result = send_contact_notification(contacto_prueba)
+            result = send_contact_notification(contacto_prueba, send_immediately=True)
             
             if result:
                 self.stdout.write(
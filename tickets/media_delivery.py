@@ -0,0 +1,175 @@
+"""
+Entrega de archivos subidos (grabaciones, adjuntos, documentos, archivos
+compartidos y descargas de PayPal).
+
+Las vistas comprueban los permisos y después llaman a ``serve_file``, que:
+
+- responde ``304 Not Modified`` si el navegador ya tiene el archivo
+  (``If-None-Match`` con el ETag o ``If-Modified-Since``);
+- atiende peticiones ``Range`` con ``206 Partial Content``: el reproductor de
+  audio puede saltar a cualquier punto y las descargas cortadas se reanudan
+  sin volver a bajar el archivo entero;
+- con ``MEDIA_DELIVERY_MODE = 'x-accel-redirect'`` (nginx) o ``'x-sendfile'``
+  (Apache) no lee el archivo: devuelve una cabecera para que el servidor web
+  lo envíe y el worker de gunicorn queda libre al momento. El servidor web
+  se encarga entonces de los rangos y de las peticiones condicionales.
+"""
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+DELIVERY_MODE = getattr(settings, 'MEDIA_DELIVERY_MODE', 'django')
+ACCEL_REDIRECT_PREFIX = getattr(settings, 'MEDIA_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class _FileRange:
+    """Vista de solo lectura de ``length`` bytes de ``file`` a partir de ``start``"""
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        size = self.remaining if size is None or size < 0 else min(size, self.remaining)
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def _file_stats(field_file):
+    """Tamaño y fecha de modificación (timestamp o None) del archivo"""
+    storage, name = field_file.storage, field_file.name
+    size = storage.size(name)
+    try:
+        modified = int(storage.get_modified_time(name).timestamp())
+    except NotImplementedError:
+        modified = None
+    return size, modified
+
+
+def _etag(size, modified):
+    return f'"{size:x}-{modified or 0:x}"'
+
+
+def _requested_range(request, size, etag, modified):
+    """
+    ``(inicio, fin)`` del rango pedido, ``None`` si se debe enviar el archivo
+    completo o ``False`` si el rango no se puede satisfacer. Solo se atiende
+    un rango por petición; los multirrango reciben el archivo entero.
+    """
+    header = request.META.get('HTTP_RANGE', '').strip()
+    match = RANGE_RE.match(header)
+    if not match or not size:
+        return None
+
+    # If-Range: el rango solo vale si el archivo no ha cambiado desde entonces
+    if_range = request.META.get('HTTP_IF_RANGE', '').strip()
+    if if_range and if_range != etag:
+        if_range_date = parse_http_date_safe(if_range)
+        if if_range_date is None or modified is None or if_range_date < modified:
+            return None
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start > end:
+            return False if start >= size else None
+    elif last:
+        # bytes=-N: los últimos N bytes
+        if not int(last):
+            return False
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        return None
+    return start, end
+
+
+def _offload_response(field_file, filename, as_attachment, content_type):
+    """Respuesta vacía con la cabecera para que nginx o Apache envíen el archivo"""
+    response = HttpResponse(content_type=content_type or 'application/octet-stream')
+    if DELIVERY_MODE == 'x-accel-redirect':
+        response['X-Accel-Redirect'] = ACCEL_REDIRECT_PREFIX.rstrip('/') + '/' + quote(field_file.name)
+    else:
+        response['X-Sendfile'] = field_file.path
+    response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+    # Si no se indica el tipo, que lo decida el servidor web por la extensión
+    if not content_type and DELIVERY_MODE == 'x-accel-redirect':
+        del response['Content-Type']
+    return response
+
+
+def counts_as_download(request):
+    """
+    ``False`` en las peticiones que continúan una descarga ya contada:
+    revalidaciones (``If-None-Match``/``If-Modified-Since``) y rangos que
+    no empiezan en el primer byte (reproductor de audio, descarga reanudada).
+    """
+    if request.META.get('HTTP_IF_NONE_MATCH') or request.META.get('HTTP_IF_MODIFIED_SINCE'):
+        return False
+    match = RANGE_RE.match(request.META.get('HTTP_RANGE', '').strip())
+    return not match or match.group(1) == '0'
+
+
+def serve_file(request, field_file, filename=None, as_attachment=True, content_type=None):
+    """
+    Respuesta que envía ``field_file`` (un ``FieldFile``) al navegador. Llamar
+    siempre después de comprobar los permisos. Lanza ``FileNotFoundError`` si
+    el archivo no existe en el almacenamiento.
+    """
+    filename = filename or os.path.basename(field_file.name)
+
+    if DELIVERY_MODE in ('x-accel-redirect', 'x-sendfile'):
+        try:
+            return _offload_response(field_file, filename, as_attachment, content_type)
+        except NotImplementedError:
+            # Almacenamiento sin ruta local (p. ej. S3): se sirve desde Django
+            pass
+
+    size, modified = _file_stats(field_file)
+    etag = _etag(size, modified)
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=modified)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+        if modified is not None:
+            not_modified['Last-Modified'] = http_date(modified)
+        return not_modified
+
+    byte_range = _requested_range(request, size, etag, modified)
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    file = field_file.storage.open(field_file.name, 'rb')
+    if byte_range:
+        start, end = byte_range
+        response = FileResponse(_FileRange(file, start, end - start + 1), status=206,
+                                as_attachment=as_attachment, filename=filename, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = end - start + 1
+    else:
+        response = FileResponse(file, as_attachment=as_attachment, filename=filename, content_type=content_type)
+        response['Content-Length'] = size
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    if modified is not None:
+        response['Last-Modified'] = http_date(modified)
+    # Archivos con permisos: solo en la caché del navegador, revalidando con el ETag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
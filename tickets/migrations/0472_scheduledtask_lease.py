@@ -0,0 +1,28 @@
+# Generated by Django 4.2.20 on 2026-10-19 05:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0471_pi_line_comments_attachments'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scheduledtask',
+            name='locked_by',
+            field=models.CharField(blank=True, max_length=255, verbose_name='Bloqueada Por'),
+        ),
+        migrations.AddField(
+            model_name='scheduledtask',
+            name='locked_until',
+            field=models.DateTimeField(blank=True, help_text='Lease del proceso que está ejecutando la tarea; evita ejecuciones duplicadas entre nodos', null=True, verbose_name='Bloqueada Hasta'),
+        ),
+        migrations.AddField(
+            model_name='scheduledtask',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Última Modificación'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.20 on 2026-10-19 05:51
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0472_scheduledtask_lease'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel', models.CharField(choices=[('email', 'Email'), ('telegram', 'Telegram')], max_length=10, verbose_name='Canal')),
+                ('status', models.CharField(choices=[('pending', 'Pendiente'), ('sending', 'Enviando'), ('sent', 'Enviada'), ('failed', 'Fallida')], default='pending', max_length=10, verbose_name='Estado')),
+                ('payload', models.JSONField(default=dict, help_text='Datos del mensaje: destinatarios, asunto y cuerpo o chat y texto', verbose_name='Contenido')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Intentos')),
+                ('max_attempts', models.PositiveIntegerField(default=6, verbose_name='Intentos máximos')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Próximo intento')),
+                ('claim_token', models.CharField(blank=True, help_text='Identifica el lote del despachador que está enviando la notificación', max_length=32, verbose_name='Token de reserva')),
+                ('claimed_at', models.DateTimeField(blank=True, null=True, verbose_name='Reservada en')),
+                ('last_error', models.TextField(blank=True, verbose_name='Último error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Creada en')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='Enviada en')),
+            ],
+            options={
+                'verbose_name': 'Notificación Saliente',
+                'verbose_name_plural': 'Notificaciones Salientes',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='tickets_out_status_21f7b9_idx'), models.Index(fields=['claim_token'], name='tickets_out_claim_t_8b3729_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.20 on 2026-10-19 06:08
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('tickets', '0473_outboundnotification'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketNumberSequence',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ticket_number_sequence', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+                ('last_value', models.PositiveIntegerField(default=0, verbose_name='Último número asignado')),
+            ],
+            options={
+                'verbose_name': 'Secuencia de Números de Ticket',
+                'verbose_name_plural': 'Secuencias de Números de Ticket',
+            },
+        ),
+    ]
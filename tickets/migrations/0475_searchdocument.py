@@ -0,0 +1,139 @@
+# Generated by Django 4.2.20 on 2026-10-19 06:13
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+# PostgreSQL: search_vector lo calcula un trigger (título con peso A, palabras
+# clave sin stemming con peso B y contenido con peso C). Los índices de
+# trigramas sobre UPPER(...) son los que usa el icontains de Django.
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    CREATE OR REPLACE FUNCTION tickets_searchdocument_vector() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('spanish', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(NEW.keywords, '')), 'B') ||
+            setweight(to_tsvector('spanish', coalesce(NEW.body, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER tickets_searchdocument_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, keywords, body ON tickets_searchdocument
+    FOR EACH ROW EXECUTE PROCEDURE tickets_searchdocument_vector()
+    """,
+    "CREATE INDEX tickets_searchdocument_vector_gin ON tickets_searchdocument USING GIN (search_vector)",
+    "CREATE INDEX tickets_searchdocument_title_trgm ON tickets_searchdocument USING GIN (UPPER(title) gin_trgm_ops)",
+    "CREATE INDEX tickets_searchdocument_keywords_trgm ON tickets_searchdocument USING GIN (UPPER(keywords) gin_trgm_ops)",
+]
+
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS tickets_searchdocument_keywords_trgm",
+    "DROP INDEX IF EXISTS tickets_searchdocument_title_trgm",
+    "DROP INDEX IF EXISTS tickets_searchdocument_vector_gin",
+    "DROP TRIGGER IF EXISTS tickets_searchdocument_vector_trigger ON tickets_searchdocument",
+    "DROP FUNCTION IF EXISTS tickets_searchdocument_vector()",
+]
+
+# SQLite: tabla FTS5 de contenido externo sincronizada con triggers
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE tickets_searchdocument_fts USING fts5(
+        title, keywords, body,
+        content='tickets_searchdocument', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER tickets_searchdocument_fts_insert AFTER INSERT ON tickets_searchdocument BEGIN
+        INSERT INTO tickets_searchdocument_fts(rowid, title, keywords, body)
+        VALUES (new.id, new.title, new.keywords, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER tickets_searchdocument_fts_delete AFTER DELETE ON tickets_searchdocument BEGIN
+        INSERT INTO tickets_searchdocument_fts(tickets_searchdocument_fts, rowid, title, keywords, body)
+        VALUES ('delete', old.id, old.title, old.keywords, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER tickets_searchdocument_fts_update AFTER UPDATE ON tickets_searchdocument BEGIN
+        INSERT INTO tickets_searchdocument_fts(tickets_searchdocument_fts, rowid, title, keywords, body)
+        VALUES ('delete', old.id, old.title, old.keywords, old.body);
+        INSERT INTO tickets_searchdocument_fts(rowid, title, keywords, body)
+        VALUES (new.id, new.title, new.keywords, new.body);
+    END
+    """,
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS tickets_searchdocument_fts_update",
+    "DROP TRIGGER IF EXISTS tickets_searchdocument_fts_delete",
+    "DROP TRIGGER IF EXISTS tickets_searchdocument_fts_insert",
+    "DROP TABLE IF EXISTS tickets_searchdocument_fts",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_FORWARD)
+    elif vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("PRAGMA compile_options")
+            options = {row[0] for row in cursor.fetchall()}
+        # Sin FTS5 la búsqueda usa LIKE sobre la tabla de documentos
+        if 'ENABLE_FTS5' in options:
+            _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_REVERSE)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_REVERSE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0474_ticketnumbersequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(max_length=30, verbose_name='Tipo')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID del objeto')),
+                ('title', models.CharField(max_length=300, verbose_name='Título')),
+                ('keywords', models.CharField(blank=True, help_text='Identificadores cortos que se buscan por subcadena: número, email, teléfono, etiquetas...', max_length=500, verbose_name='Palabras clave')),
+                ('body', models.TextField(blank=True, verbose_name='Contenido')),
+                ('url', models.CharField(blank=True, max_length=300, verbose_name='URL')),
+                ('company_id', models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Empresa')),
+                ('project_id', models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Proyecto')),
+                ('owner_id', models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Creador')),
+                ('assignee_id', models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Asignado a')),
+                ('is_public', models.BooleanField(default=False, verbose_name='Público')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Actualizado')),
+            ],
+            options={
+                'verbose_name': 'Documento de Búsqueda',
+                'verbose_name_plural': 'Documentos de Búsqueda',
+                'indexes': [models.Index(fields=['entity', 'company_id'], name='tickets_sea_entity_7563f9_idx'), models.Index(fields=['entity', 'owner_id'], name='tickets_sea_entity_797283_idx')],
+                'unique_together': {('entity', 'object_id')},
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
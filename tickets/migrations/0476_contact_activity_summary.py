@@ -0,0 +1,54 @@
+# Generated by Django 4.2.20 on 2026-10-19 06:24
+
+from django.db import migrations, models
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+
+
+def fill_activity_summary(apps, schema_editor):
+    Contact = apps.get_model('tickets', 'Contact')
+    OpportunityActivity = apps.get_model('tickets', 'OpportunityActivity')
+    summaries = (
+        OpportunityActivity.objects
+        .filter(contact__isnull=False)
+        .order_by()
+        .values('contact_id')
+        .annotate(
+            count=Count('id'),
+            next_date=Min('scheduled_date', filter=Q(scheduled_date__gte=timezone.now())),
+        )
+    )
+    contacts = [
+        Contact(pk=row['contact_id'], activity_count=row['count'], next_activity_date=row['next_date'])
+        for row in summaries
+    ]
+    Contact.objects.bulk_update(contacts, ['activity_count', 'next_activity_date'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0475_searchdocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='activity_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, verbose_name='Actividades'),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='next_activity_date',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True, verbose_name='Próxima actividad'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['assigned_to', '-created_at'], name='tickets_con_assigne_d655b1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['status', 'created_at'], name='tickets_con_status_f0d761_idx'),
+        ),
+        migrations.RunPython(fill_activity_summary, migrations.RunPython.noop),
+    ]
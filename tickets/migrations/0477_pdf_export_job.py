@@ -0,0 +1,38 @@
+# Generated by Django 4.2.20 on 2026-10-19 06:38
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('tickets', '0476_contact_activity_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PdfExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=50, verbose_name='Tipo de documento')),
+                ('params', models.JSONField(default=dict, help_text='Datos que necesita el generador del documento (p. ej. los IDs de los tickets)', verbose_name='Parámetros')),
+                ('status', models.CharField(choices=[('pending', 'Pendiente'), ('running', 'Generando'), ('done', 'Completada'), ('failed', 'Fallida')], default='pending', max_length=10, verbose_name='Estado')),
+                ('filename', models.CharField(max_length=255, verbose_name='Nombre del archivo')),
+                ('file', models.FileField(blank=True, help_text='PDF generado, guardado en la caché de documentos por su hash de contenido', max_length=255, upload_to='', verbose_name='Archivo')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Creada en')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Iniciada en')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Terminada en')),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pdf_export_jobs', to=settings.AUTH_USER_MODEL, verbose_name='Solicitado por')),
+            ],
+            options={
+                'verbose_name': 'Exportación PDF',
+                'verbose_name_plural': 'Exportaciones PDF',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='tickets_pdf_status_aaf357_idx')],
+            },
+        ),
+    ]
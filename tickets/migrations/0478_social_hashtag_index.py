@@ -0,0 +1,64 @@
+# Generated by Django 4.2.20 on 2026-10-19 06:50
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('tickets', '0477_pdf_export_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SocialTagCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('hashtag', 'Hashtag'), ('mention', 'Mención')], max_length=10, verbose_name='Tipo')),
+                ('key', models.CharField(help_text='Hashtag en minúsculas o ID del usuario mencionado', max_length=100, verbose_name='Clave')),
+                ('scope', models.CharField(max_length=40, verbose_name='Ámbito de visibilidad')),
+                ('count', models.IntegerField(default=0, verbose_name='Apariciones')),
+            ],
+            options={
+                'verbose_name': 'Contador de hashtags y menciones',
+                'verbose_name_plural': 'Contadores de hashtags y menciones',
+                'indexes': [models.Index(fields=['kind', 'scope', '-count'], name='tickets_soc_kind_5985d9_idx')],
+                'unique_together': {('kind', 'scope', 'key')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SocialMention',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('occurrences', models.PositiveIntegerField(default=1, verbose_name='Apariciones en la publicación')),
+                ('scope', models.CharField(help_text="'public', 'company:<id>' o 'user:<id>'", max_length=40, verbose_name='Ámbito de visibilidad')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='mentions', to='tickets.socialpost', verbose_name='Publicación')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='social_mentions', to=settings.AUTH_USER_MODEL, verbose_name='Usuario mencionado')),
+            ],
+            options={
+                'verbose_name': 'Mención en publicación',
+                'verbose_name_plural': 'Menciones en publicaciones',
+                'indexes': [models.Index(fields=['user', 'scope'], name='tickets_soc_user_id_76bf6e_idx')],
+                'unique_together': {('post', 'user')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SocialHashtag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag', models.CharField(help_text='En minúsculas y sin #', max_length=100, verbose_name='Hashtag')),
+                ('occurrences', models.PositiveIntegerField(default=1, verbose_name='Apariciones en la publicación')),
+                ('scope', models.CharField(help_text="'public', 'company:<id>' o 'user:<id>'", max_length=40, verbose_name='Ámbito de visibilidad')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hashtags', to='tickets.socialpost', verbose_name='Publicación')),
+            ],
+            options={
+                'verbose_name': 'Hashtag de publicación',
+                'verbose_name_plural': 'Hashtags de publicaciones',
+                'indexes': [models.Index(fields=['tag', 'scope'], name='tickets_soc_tag_a0b031_idx')],
+                'unique_together': {('post', 'tag')},
+            },
+        ),
+    ]
@@ -0,0 +1,146 @@
+# Generated by Django 4.2.20 on 2026-10-19 07:00
+
+from collections import Counter
+
+from django.db import migrations, models
+
+
+def fill_page_visit_rollups(apps, schema_editor):
+    """
+    Agrega las visitas existentes (lo mismo que ``visit_rollup.rebuild_day``,
+    día a día en una sola pasada sobre las visitas).
+    """
+    from tickets.visit_rollup import HyperLogLog, _bucket, _cube_key, _sketch_key, _url_keys
+
+    PageVisit = apps.get_model('tickets', 'PageVisit')
+    PageVisitRollup = apps.get_model('tickets', 'PageVisitRollup')
+    PageVisitSketch = apps.get_model('tickets', 'PageVisitSketch')
+    PageVisitUrlRollup = apps.get_model('tickets', 'PageVisitUrlRollup')
+
+    def save(cube, urls, titles, sketches):
+        PageVisitRollup.objects.bulk_create(
+            [PageVisitRollup(visits=count, **dict(key)) for key, count in cube.items()],
+            batch_size=1000,
+        )
+        PageVisitUrlRollup.objects.bulk_create(
+            [PageVisitUrlRollup(visits=count, title=titles.get(key, ''), **dict(key)) for key, count in urls.items()],
+            batch_size=1000,
+        )
+        PageVisitSketch.objects.bulk_create(
+            [PageVisitSketch(ip_sketch=sketch.to_bytes(), **dict(key)) for key, sketch in sketches.items()],
+            batch_size=1000,
+        )
+
+    visits = PageVisit.objects.only(
+        'visited_at', 'page_type', 'page_url', 'page_title', 'ip_address', 'country',
+        'country_code', 'browser', 'device_type', 'is_mobile', 'is_bot', 'referrer', 'utm_source',
+    ).order_by('visited_at', 'pk')
+    current_day = None
+    cube, urls, titles, sketches = Counter(), Counter(), {}, {}
+    for visit in visits.iterator(chunk_size=2000):
+        day, hour = _bucket(visit.visited_at)
+        if day != current_day:
+            save(cube, urls, titles, sketches)
+            current_day = day
+            cube, urls, titles, sketches = Counter(), Counter(), {}, {}
+        cube[tuple(_cube_key(visit, day, hour).items())] += 1
+        for key, title in _url_keys(visit, day):
+            key = tuple(key.items())
+            urls[key] += 1
+            if title:
+                titles[key] = title
+        sketches.setdefault(tuple(_sketch_key(visit, day).items()), HyperLogLog()).add(visit.ip_address)
+    save(cube, urls, titles, sketches)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0478_social_hashtag_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageVisitRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Día')),
+                ('hour', models.PositiveSmallIntegerField(verbose_name='Hora')),
+                ('page_type', models.CharField(choices=[('home', 'Página de Inicio'), ('blog', 'Blog'), ('blog_post', 'Artículo de Blog'), ('conceptos', 'Conceptos Públicos'), ('contact', 'Contacto'), ('landing', 'Landing Page'), ('course_public', 'Curso Público'), ('ticket_public', 'Ticket Público'), ('other', 'Otra')], max_length=50, verbose_name='Tipo de Página')),
+                ('country_code', models.CharField(blank=True, max_length=2, verbose_name='Código de País')),
+                ('country', models.CharField(blank=True, max_length=100, verbose_name='País')),
+                ('browser', models.CharField(blank=True, max_length=100, verbose_name='Navegador')),
+                ('device_type', models.CharField(blank=True, max_length=50, verbose_name='Tipo de Dispositivo')),
+                ('is_mobile', models.BooleanField(default=False, verbose_name='Es Móvil')),
+                ('is_bot', models.BooleanField(default=False, verbose_name='Es Bot')),
+                ('utm_source', models.CharField(blank=True, max_length=100, verbose_name='UTM Source')),
+                ('visits', models.PositiveIntegerField(default=0, verbose_name='Visitas')),
+            ],
+            options={
+                'verbose_name': 'Agregado horario de visitas',
+                'verbose_name_plural': 'Agregados horarios de visitas',
+            },
+        ),
+        migrations.CreateModel(
+            name='PageVisitSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Día')),
+                ('page_type', models.CharField(choices=[('home', 'Página de Inicio'), ('blog', 'Blog'), ('blog_post', 'Artículo de Blog'), ('conceptos', 'Conceptos Públicos'), ('contact', 'Contacto'), ('landing', 'Landing Page'), ('course_public', 'Curso Público'), ('ticket_public', 'Ticket Público'), ('other', 'Otra')], max_length=50, verbose_name='Tipo de Página')),
+                ('country_code', models.CharField(blank=True, max_length=2, verbose_name='Código de País')),
+                ('is_bot', models.BooleanField(default=False, verbose_name='Es Bot')),
+                ('ip_sketch', models.BinaryField(default=bytes, verbose_name='Boceto de IPs')),
+            ],
+            options={
+                'verbose_name': 'Boceto de visitantes únicos',
+                'verbose_name_plural': 'Bocetos de visitantes únicos',
+            },
+        ),
+        migrations.CreateModel(
+            name='PageVisitUrlRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Día')),
+                ('kind', models.CharField(choices=[('page', 'Página'), ('referrer', 'Referencia')], max_length=10, verbose_name='Tipo')),
+                ('page_type', models.CharField(choices=[('home', 'Página de Inicio'), ('blog', 'Blog'), ('blog_post', 'Artículo de Blog'), ('conceptos', 'Conceptos Públicos'), ('contact', 'Contacto'), ('landing', 'Landing Page'), ('course_public', 'Curso Público'), ('ticket_public', 'Ticket Público'), ('other', 'Otra')], max_length=50, verbose_name='Tipo de Página')),
+                ('country_code', models.CharField(blank=True, max_length=2, verbose_name='Código de País')),
+                ('is_bot', models.BooleanField(default=False, verbose_name='Es Bot')),
+                ('url', models.URLField(max_length=500, verbose_name='URL')),
+                ('title', models.CharField(blank=True, max_length=200, verbose_name='Título de la Página')),
+                ('visits', models.PositiveIntegerField(default=0, verbose_name='Visitas')),
+            ],
+            options={
+                'verbose_name': 'Agregado diario de URLs visitadas',
+                'verbose_name_plural': 'Agregados diarios de URLs visitadas',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='pagevisit',
+            index=models.Index(fields=['visited_at'], name='tickets_pag_visited_a9bdde_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pagevisiturlrollup',
+            index=models.Index(fields=['kind', 'day'], name='tickets_pag_kind_4c8200_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='pagevisiturlrollup',
+            unique_together={('day', 'kind', 'page_type', 'country_code', 'is_bot', 'url')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='pagevisitsketch',
+            unique_together={('day', 'page_type', 'country_code', 'is_bot')},
+        ),
+        migrations.AddIndex(
+            model_name='pagevisitrollup',
+            index=models.Index(fields=['day', 'page_type'], name='tickets_pag_day_01287d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pagevisitrollup',
+            index=models.Index(fields=['country_code', 'day'], name='tickets_pag_country_6c8566_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='pagevisitrollup',
+            unique_together={('day', 'hour', 'page_type', 'country_code', 'country', 'browser', 'device_type', 'is_mobile', 'is_bot', 'utm_source')},
+        ),
+        migrations.RunPython(fill_page_visit_rollups, migrations.RunPython.noop),
+    ]
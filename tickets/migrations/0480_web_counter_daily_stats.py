@@ -0,0 +1,98 @@
+# Generated by Django 4.2.20 on 2026-10-19 07:03
+
+from datetime import timedelta
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_daily_stats(apps, schema_editor):
+    """
+    Calcula las estadísticas diarias de las visitas existentes (lo mismo que
+    ``web_counter_ingest.rebuild_counter``, sin tocar los totales de los
+    contadores, que ya se mantenían). Se procesa un contador cada vez.
+    """
+    from tickets.web_counter_ingest import DIMENSIONS, SESSION_TIMEOUT, _aggregate, _value_hash
+
+    WebCounterVisit = apps.get_model('tickets', 'WebCounterVisit')
+    WebCounterDailyStat = apps.get_model('tickets', 'WebCounterDailyStat')
+    WebCounterDailyBreakdown = apps.get_model('tickets', 'WebCounterDailyBreakdown')
+
+    timeout = timedelta(seconds=SESSION_TIMEOUT)
+    counter_ids = WebCounterVisit.objects.order_by().values_list('counter_id', flat=True).distinct()
+    for counter_id in counter_ids:
+        last_seen = {}
+        entries = []
+        visits = (
+            WebCounterVisit.objects.filter(counter_id=counter_id)
+            .only('counter_id', 'created_at', 'session_id', *DIMENSIONS)
+            .order_by('created_at', 'pk')
+        )
+        for visit in visits.iterator(chunk_size=2000):
+            previous = last_seen.get(visit.session_id)
+            entries.append((visit, previous is None or visit.created_at - previous > timeout))
+            last_seen[visit.session_id] = visit.created_at
+        _, daily, breakdowns = _aggregate(entries)
+
+        WebCounterDailyStat.objects.bulk_create(
+            [
+                WebCounterDailyStat(counter_id=counter_id, day=day, page_views=page_views, visits=visits)
+                for (counter_id, day), (page_views, visits) in daily.items()
+            ],
+            batch_size=1000,
+        )
+        WebCounterDailyBreakdown.objects.bulk_create(
+            [
+                WebCounterDailyBreakdown(
+                    counter_id=counter_id, day=day, dimension=dimension,
+                    value=value, value_hash=_value_hash(value), page_views=page_views,
+                )
+                for (counter_id, day, dimension, value), page_views in breakdowns.items()
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0479_page_visit_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebCounterDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Día')),
+                ('page_views', models.PositiveIntegerField(default=0, verbose_name='Páginas Vistas')),
+                ('visits', models.PositiveIntegerField(default=0, verbose_name='Visitas')),
+                ('counter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='tickets.webcounter', verbose_name='Contador')),
+            ],
+            options={
+                'verbose_name': 'Estadística Diaria de Contador Web',
+                'verbose_name_plural': 'Estadísticas Diarias de Contadores Web',
+                'ordering': ['-day'],
+                'unique_together': {('counter', 'day')},
+            },
+        ),
+        migrations.CreateModel(
+            name='WebCounterDailyBreakdown',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Día')),
+                ('dimension', models.CharField(choices=[('url', 'URL'), ('country', 'País'), ('browser', 'Navegador'), ('os', 'Sistema Operativo'), ('device_type', 'Tipo de Dispositivo')], max_length=20, verbose_name='Dimensión')),
+                ('value', models.CharField(max_length=2048, verbose_name='Valor')),
+                ('value_hash', models.CharField(help_text='SHA-1 del valor, para la restricción de unicidad (las URLs pueden ser largas)', max_length=40, verbose_name='Hash del Valor')),
+                ('page_views', models.PositiveIntegerField(default=0, verbose_name='Páginas Vistas')),
+                ('counter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_breakdowns', to='tickets.webcounter', verbose_name='Contador')),
+            ],
+            options={
+                'verbose_name': 'Desglose Diario de Contador Web',
+                'verbose_name_plural': 'Desgloses Diarios de Contadores Web',
+                'indexes': [models.Index(fields=['counter', 'dimension', 'day'], name='tickets_web_counter_16f0a8_idx')],
+                'unique_together': {('counter', 'day', 'dimension', 'value_hash')},
+            },
+        ),
+        migrations.RunPython(fill_daily_stats, migrations.RunPython.noop),
+    ]
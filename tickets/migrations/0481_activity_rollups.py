@@ -0,0 +1,171 @@
+# Generated by Django 4.2.20 on 2026-10-19 07:06
+
+from collections import Counter, defaultdict
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import ExtractHour, TruncDate
+import django.db.models.deletion
+
+
+def _hourly(queryset, date_field, *group):
+    """Filas ``(*group, día, hora, total)`` en la zona horaria del proyecto"""
+    return (
+        queryset.order_by().annotate(day=TruncDate(date_field), hour=ExtractHour(date_field))
+        .values_list(*group, 'day', 'hour').annotate(total=Count('pk'))
+    )
+
+
+def fill_short_url_rollups(apps, schema_editor):
+    """Agrega los clics existentes (lo mismo que ``activity_rollup.rebuild_short_url``)"""
+    from django.utils import timezone
+
+    from tickets.activity_rollup import DOMAIN_MAX_LENGTH, referrer_domain
+    from tickets.visit_rollup import HyperLogLog
+
+    ShortUrlClick = apps.get_model('tickets', 'ShortUrlClick')
+    ShortUrlClickRollup = apps.get_model('tickets', 'ShortUrlClickRollup')
+    ShortUrlClickBreakdown = apps.get_model('tickets', 'ShortUrlClickBreakdown')
+    ShortUrlClickSketch = apps.get_model('tickets', 'ShortUrlClickSketch')
+
+    clicks = ShortUrlClick.objects.order_by()
+    ShortUrlClickRollup.objects.bulk_create(
+        [
+            ShortUrlClickRollup(short_url_id=short_url_id, day=day, hour=hour, clicks=total)
+            for short_url_id, day, hour, total in _hourly(clicks, 'clicked_at', 'short_url_id')
+        ],
+        batch_size=1000,
+    )
+
+    breakdowns = Counter()
+    grouped = (
+        clicks.annotate(day=TruncDate('clicked_at'))
+        .values_list('short_url_id', 'day', 'country', 'city', 'referer').annotate(total=Count('pk'))
+    )
+    for short_url_id, day, country, city, referer, total in grouped:
+        domain = referrer_domain(referer)[:DOMAIN_MAX_LENGTH]
+        breakdowns[(short_url_id, day, country or '', city or '', domain)] += total
+    ShortUrlClickBreakdown.objects.bulk_create(
+        [
+            ShortUrlClickBreakdown(
+                short_url_id=short_url_id, day=day, country=country, city=city,
+                referrer_domain=domain, clicks=total,
+            )
+            for (short_url_id, day, country, city, domain), total in breakdowns.items()
+        ],
+        batch_size=1000,
+    )
+
+    # Un boceto por URL y día: se recorren las URLs de una en una para no
+    # tener en memoria los de todas
+    short_url_ids = clicks.exclude(ip_address=None).values_list('short_url_id', flat=True).distinct()
+    for short_url_id in short_url_ids:
+        sketches = defaultdict(HyperLogLog)
+        ip_rows = clicks.filter(short_url_id=short_url_id).exclude(ip_address=None).values_list(
+            'clicked_at', 'ip_address',
+        )
+        for clicked_at, ip_address in ip_rows.iterator(chunk_size=2000):
+            sketches[timezone.localtime(clicked_at).date()].add(ip_address)
+        ShortUrlClickSketch.objects.bulk_create(
+            [
+                ShortUrlClickSketch(short_url_id=short_url_id, day=day, ip_sketch=sketch.to_bytes())
+                for day, sketch in sketches.items()
+            ],
+            batch_size=1000,
+        )
+
+
+def fill_chatbot_rollups(apps, schema_editor):
+    """Agrega la actividad existente (lo mismo que ``activity_rollup.rebuild_chatbot``)"""
+    ChatbotActivityRollup = apps.get_model('tickets', 'ChatbotActivityRollup')
+    rows = defaultdict(Counter)
+    sources = [
+        ('conversations', apps.get_model('tickets', 'ChatbotConversation').objects.all(), 'started_at', 'chatbot_id'),
+        ('messages', apps.get_model('tickets', 'ChatbotMessage').objects.all(), 'timestamp', 'conversation__chatbot_id'),
+        ('clicks', apps.get_model('tickets', 'ChatbotClick').objects.all(), 'clicked_at', 'chatbot_id'),
+    ]
+    for field, queryset, date_field, chatbot_field in sources:
+        for chatbot_id, day, hour, total in _hourly(queryset, date_field, chatbot_field):
+            rows[(chatbot_id, day, hour)][field] += total
+    ChatbotActivityRollup.objects.bulk_create(
+        [
+            ChatbotActivityRollup(chatbot_id=chatbot_id, day=day, hour=hour, **totals)
+            for (chatbot_id, day, hour), totals in rows.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0480_web_counter_daily_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShortUrlClickSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Día')),
+                ('ip_sketch', models.BinaryField(default=bytes, verbose_name='Boceto de IPs')),
+                ('short_url', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='click_sketches', to='tickets.shorturl', verbose_name='URL Corta')),
+            ],
+            options={
+                'verbose_name': 'Boceto de IPs de URL Corta',
+                'verbose_name_plural': 'Bocetos de IPs de URLs Cortas',
+                'unique_together': {('short_url', 'day')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ShortUrlClickRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Día')),
+                ('hour', models.PositiveSmallIntegerField(verbose_name='Hora')),
+                ('clicks', models.PositiveIntegerField(default=0, verbose_name='Clics')),
+                ('short_url', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='click_rollups', to='tickets.shorturl', verbose_name='URL Corta')),
+            ],
+            options={
+                'verbose_name': 'Clics por Hora de URL Corta',
+                'verbose_name_plural': 'Clics por Hora de URLs Cortas',
+                'unique_together': {('short_url', 'day', 'hour')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ShortUrlClickBreakdown',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Día')),
+                ('country', models.CharField(blank=True, max_length=100, verbose_name='País')),
+                ('city', models.CharField(blank=True, max_length=100, verbose_name='Ciudad')),
+                ('referrer_domain', models.CharField(blank=True, max_length=255, verbose_name='Dominio de Referencia')),
+                ('clicks', models.PositiveIntegerField(default=0, verbose_name='Clics')),
+                ('short_url', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='click_breakdowns', to='tickets.shorturl', verbose_name='URL Corta')),
+            ],
+            options={
+                'verbose_name': 'Desglose Diario de Clics de URL Corta',
+                'verbose_name_plural': 'Desgloses Diarios de Clics de URLs Cortas',
+                'unique_together': {('short_url', 'day', 'country', 'city', 'referrer_domain')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ChatbotActivityRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Día')),
+                ('hour', models.PositiveSmallIntegerField(verbose_name='Hora')),
+                ('conversations', models.PositiveIntegerField(default=0, verbose_name='Conversaciones')),
+                ('messages', models.PositiveIntegerField(default=0, verbose_name='Mensajes')),
+                ('clicks', models.PositiveIntegerField(default=0, verbose_name='Clicks')),
+                ('chatbot', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_rollups', to='tickets.chatbot', verbose_name='Chatbot')),
+            ],
+            options={
+                'verbose_name': 'Actividad por Hora del Chatbot',
+                'verbose_name_plural': 'Actividad por Hora de los Chatbots',
+                'unique_together': {('chatbot', 'day', 'hour')},
+            },
+        ),
+        migrations.RunPython(fill_short_url_rollups, migrations.RunPython.noop),
+        migrations.RunPython(fill_chatbot_rollups, migrations.RunPython.noop),
+    ]
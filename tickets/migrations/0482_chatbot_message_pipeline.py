@@ -0,0 +1,34 @@
+# Generated by Django 4.2.20 on 2026-10-19 07:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0481_activity_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatbotmessage',
+            name='in_reply_to',
+            field=models.ForeignKey(blank=True, help_text='Mensaje del usuario al que responde el bot', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='replies', to='tickets.chatbotmessage', verbose_name='En respuesta a'),
+        ),
+        migrations.AddField(
+            model_name='chatbotmessage',
+            name='needs_reply',
+            field=models.BooleanField(default=False, help_text='True si la respuesta la genera la IA en segundo plano', verbose_name='Espera respuesta'),
+        ),
+        migrations.AddField(
+            model_name='chatbotmessage',
+            name='pipeline_started_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Inicio del procesamiento'),
+        ),
+        migrations.AddField(
+            model_name='chatbotmessage',
+            name='pipeline_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pendiente'), ('running', 'Procesando'), ('done', 'Procesado')], db_index=True, default='', max_length=10, verbose_name='Estado del procesamiento'),
+        ),
+    ]
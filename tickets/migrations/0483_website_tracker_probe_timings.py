@@ -0,0 +1,18 @@
+# Generated by Django 4.2.20 on 2026-10-19 07:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0482_chatbot_message_pipeline'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='websitetracker',
+            name='probe_timings',
+            field=models.JSONField(blank=True, default=dict, help_text='Milisegundos de cada sonda (ping, dns, http, ssl y total) del último rastreo', verbose_name='Tiempos de las sondas'),
+        ),
+    ]
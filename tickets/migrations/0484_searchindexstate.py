@@ -0,0 +1,25 @@
+# Generated by Django 4.2.20 on 2026-10-19 07:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0483_website_tracker_probe_timings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(max_length=30, unique=True, verbose_name='Tipo')),
+                ('built_at', models.DateTimeField(verbose_name='Construido')),
+            ],
+            options={
+                'verbose_name': 'Estado del Índice de Búsqueda',
+                'verbose_name_plural': 'Estados del Índice de Búsqueda',
+            },
+        ),
+    ]
@@ -1,7 +1,9 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.contrib.postgres.search import SearchVectorField
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from datetime import timedelta
@@ -475,6 +477,66 @@ class Project(models.Model):
         return 0
 
 
+class TicketNumberSequence(models.Model):
+    """Contador por usuario con el último número de ticket asignado"""
+    
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='ticket_number_sequence',
+        verbose_name='Usuario'
+    )
+    last_value = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Último número asignado'
+    )
+    
+    class Meta:
+        verbose_name = 'Secuencia de Números de Ticket'
+        verbose_name_plural = 'Secuencias de Números de Ticket'
+    
+    def __str__(self):
+        return f"{self.user_id}: {self.last_value}"
+    
+    @classmethod
+    def allocate(cls, user_id, count=1):
+        """
+        Reserva ``count`` números para el usuario y devuelve el primero
+        
+        La fila del contador se bloquea con select_for_update hasta el final de
+        la transacción, así dos creaciones simultáneas nunca reciben el mismo
+        número. Si el usuario aún no tiene contador se crea partiendo del
+        mayor número que ya exista para él.
+        """
+        with transaction.atomic():
+            sequence = cls.objects.select_for_update().filter(user_id=user_id).first()
+            if sequence is None:
+                try:
+                    with transaction.atomic():
+                        sequence = cls.objects.create(user_id=user_id, last_value=cls.initial_value(user_id))
+                except IntegrityError:
+                    # Otro proceso creó el contador a la vez
+                    sequence = cls.objects.select_for_update().get(user_id=user_id)
+            
+            first = sequence.last_value + 1
+            cls.objects.filter(user_id=user_id).update(last_value=F('last_value') + count)
+        return first
+    
+    @staticmethod
+    def initial_value(user_id):
+        """Mayor secuencia usada en los tickets existentes del usuario (comparación numérica)"""
+        prefix = f"{user_id:02d}-"
+        last_value = 0
+        numbers = Ticket.objects.filter(ticket_number__startswith=prefix).values_list('ticket_number', flat=True)
+        for number in numbers.iterator():
+            try:
+                last_value = max(last_value, int(number[len(prefix):]))
+            except ValueError:
+                continue
+        return last_value
+
+
 class Ticket(models.Model):
     PRIORITY_CHOICES = [
         ('low', 'Baja'),
@@ -634,64 +696,66 @@ class Ticket(models.Model):
         verbose_name = 'Ticket'
         verbose_name_plural = 'Tickets'
     
+    @staticmethod
+    def format_ticket_number(user_id, sequence):
+        """Formato XX-XXX: ID del usuario (2 dígitos) y secuencia (3 dígitos o más)"""
+        return f"{user_id:02d}-{sequence:03d}"
+    
+    @classmethod
+    def allocate_ticket_numbers(cls, user, count=1):
+        """
+        Reserva ``count`` números consecutivos para los tickets de ``user``
+        
+        Usa el contador de TicketNumberSequence, así que son seguros aunque se
+        creen tickets a la vez desde varios procesos.
+        """
+        user_id = getattr(user, 'pk', user)
+        first = TicketNumberSequence.allocate(user_id, count)
+        return [cls.format_ticket_number(user_id, sequence) for sequence in range(first, first + count)]
+    
+    @classmethod
+    def assign_ticket_numbers(cls, tickets):
+        """
+        Asigna número a los tickets (sin guardar) que aún no lo tienen
+        
+        Reserva todos los números de un mismo creador con una única operación
+        sobre su contador; pensado para importaciones y altas masivas.
+        """
+        pending = {}
+        for ticket in tickets:
+            if not ticket.ticket_number:
+                pending.setdefault(ticket.created_by_id, []).append(ticket)
+        
+        with transaction.atomic():
+            # Siempre en el mismo orden para no bloquearse con otra importación
+            for user_id, user_tickets in sorted(pending.items()):
+                numbers = cls.allocate_ticket_numbers(user_id, len(user_tickets))
+                for ticket, number in zip(user_tickets, numbers):
+                    ticket.ticket_number = number
+        return tickets
+    
     def generate_ticket_number(self):
         """Genera un numero de ticket unico con formato XX-XXX"""
         if self.ticket_number:
             return self.ticket_number
-            
-        # Formatear ID del usuario con ceros a la izquierda (2 digitos)
-        user_id_formatted = "{:02d}".format(self.created_by.id)
-        
-        # Buscar el ultimo ticket creado por este usuario
-        last_ticket = Ticket.objects.filter(
-            created_by=self.created_by,
-            ticket_number__startswith=user_id_formatted + "-"
-        ).exclude(id=self.id).order_by('-ticket_number').first()
-        
-        if last_ticket and last_ticket.ticket_number:
-            # Extraer el número de secuencia del último ticket
-            try:
-                last_sequence = int(last_ticket.ticket_number.split('-')[1])
-                new_sequence = last_sequence + 1
-            except (IndexError, ValueError):
-                new_sequence = 1
-        else:
-            new_sequence = 1
         
-        # Formatear secuencia con ceros a la izquierda (3 dígitos)
-        sequence_formatted = f"{new_sequence:03d}"
-        
-        return f"{user_id_formatted}-{sequence_formatted}"
+        return self.allocate_ticket_numbers(self.created_by_id)[0]
     
     def save(self, *args, **kwargs):
         """Override del método save para generar número de ticket automáticamente"""
         is_new_ticket = self.pk is None
         
         if not self.ticket_number:
-            # Usar transacción para evitar condiciones de carrera
-            with transaction.atomic():
-                self.ticket_number = self.generate_ticket_number()
-                # Verificar que el número sea único (por si acaso)
-                counter = 1
-                original_number = self.ticket_number
-                while Ticket.objects.filter(ticket_number=self.ticket_number).exists():
-                    user_id_formatted = f"{self.created_by.id:02d}"
-                    sequence_num = int(original_number.split('-')[1]) + counter
-                    self.ticket_number = f"{user_id_formatted}-{sequence_num:03d}"
-                    counter += 1
+            self.ticket_number = self.generate_ticket_number()
         
         super().save(*args, **kwargs)
         
-        # Enviar notificación de Telegram solo para tickets nuevos
+        # Encolar notificación de Telegram solo para tickets nuevos; el envío
+        # se hace en segundo plano (ver notification_utils)
         if is_new_ticket:
             try:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.info(f"Ticket nuevo creado: {self.ticket_number}, iniciando notificación Telegram")
-                
                 from .telegram_utils import notify_ticket_created
-                result = notify_ticket_created(self)
-                logger.info(f"Resultado notificación Telegram: {result}")
+                notify_ticket_created(self)
             except Exception as e:
                 # No queremos que falle la creación del ticket si falla la notificación
                 import logging
@@ -5153,14 +5217,88 @@ class Contact(models.Model):
         verbose_name='Última actualización'
     )
     
+    # Resumen de actividades, mantenido por las señales de OpportunityActivity
+    activity_count = models.PositiveIntegerField(
+        default=0,
+        db_index=True,
+        editable=False,
+        verbose_name='Actividades'
+    )
+    next_activity_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        editable=False,
+        verbose_name='Próxima actividad'
+    )
+    
+    # Los mantienen las señales de actividades: las vistas que modifican un
+    # contacto ya guardado pasan update_fields para no pisarlos con un valor leído antes
+    ACTIVITY_SUMMARY_FIELDS = ('activity_count', 'next_activity_date')
+    
     class Meta:
         ordering = ['-contact_date']
         verbose_name = 'Contacto'
         verbose_name_plural = 'Contactos'
+        indexes = [
+            models.Index(fields=['assigned_to', '-created_at']),
+            models.Index(fields=['status', 'created_at']),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.get_status_display()}"
     
+    @property
+    def has_activities(self):
+        return self.activity_count > 0
+    
+    @classmethod
+    def refresh_next_activity(cls, contact_ids):
+        """
+        Recalcula la próxima actividad (programada desde ahora) de los contactos
+        indicados con un único UPDATE con subconsulta. Devuelve cuántos se han actualizado.
+        """
+        from django.db.models import Min, OuterRef, Subquery
+        contact_ids = [pk for pk in set(contact_ids) if pk]
+        if not contact_ids:
+            return 0
+        next_date = (
+            OpportunityActivity.objects
+            .filter(contact_id=OuterRef('pk'), scheduled_date__gte=timezone.now())
+            .order_by()
+            .values('contact_id')
+            .annotate(next_date=Min('scheduled_date'))
+            .values('next_date')
+        )
+        return cls.objects.filter(pk__in=contact_ids).update(next_activity_date=Subquery(next_date))
+    
+    @classmethod
+    def rebuild_activity_summary(cls, contact_ids):
+        """Recalcula desde cero contador y próxima actividad de los contactos indicados"""
+        from django.db.models import Count, Min, Q
+        contact_ids = list(contact_ids)
+        summaries = {
+            row['contact_id']: row
+            for row in OpportunityActivity.objects
+            .filter(contact_id__in=contact_ids)
+            .order_by()
+            .values('contact_id')
+            .annotate(
+                count=Count('id'),
+                next_date=Min('scheduled_date', filter=Q(scheduled_date__gte=timezone.now())),
+            )
+        }
+        contacts = list(cls.objects.filter(pk__in=contact_ids).only('id', 'activity_count', 'next_activity_date'))
+        changed = []
+        for contact in contacts:
+            summary = summaries.get(contact.pk, {})
+            count, next_date = summary.get('count', 0), summary.get('next_date')
+            if contact.activity_count != count or contact.next_activity_date != next_date:
+                contact.activity_count, contact.next_activity_date = count, next_date
+                changed.append(contact)
+        cls.objects.bulk_update(changed, list(cls.ACTIVITY_SUMMARY_FIELDS))
+        return len(changed)
+    
     def get_status_color(self):
         """Retorna el color del estado"""
         if self.status == 'positive':
@@ -5192,6 +5330,47 @@ class Contact(models.Model):
             return 'bi-x-circle'
 
 
+# Señales para mantener el resumen de actividades de cada contacto
+@receiver(models.signals.post_init, sender=OpportunityActivity)
+def remember_activity_contact(sender, instance, **kwargs):
+    """Guarda contacto y fecha originales para saber qué cambió al guardar"""
+    instance._summary_state = (instance.__dict__.get('contact_id'), instance.__dict__.get('scheduled_date'))
+
+
+@receiver(post_save, sender=OpportunityActivity)
+def update_contact_activity_summary(sender, instance, created, raw=False, **kwargs):
+    """Actualiza el contador y la próxima actividad del contacto al guardar una actividad"""
+    if raw:
+        return
+    old_contact_id, old_scheduled_date = getattr(instance, '_summary_state', (None, None))
+    if created:
+        old_contact_id = None
+    
+    if old_contact_id != instance.contact_id:
+        if old_contact_id:
+            Contact.objects.filter(pk=old_contact_id, activity_count__gt=0).update(
+                activity_count=F('activity_count') - 1
+            )
+        if instance.contact_id:
+            Contact.objects.filter(pk=instance.contact_id).update(activity_count=F('activity_count') + 1)
+        Contact.refresh_next_activity([old_contact_id, instance.contact_id])
+    elif instance.contact_id and old_scheduled_date != instance.scheduled_date:
+        Contact.refresh_next_activity([instance.contact_id])
+    
+    instance._summary_state = (instance.contact_id, instance.scheduled_date)
+
+
+@receiver(models.signals.post_delete, sender=OpportunityActivity)
+def update_contact_activity_summary_on_delete(sender, instance, **kwargs):
+    """Descuenta la actividad borrada del resumen de su contacto"""
+    if not instance.contact_id:
+        return
+    Contact.objects.filter(pk=instance.contact_id, activity_count__gt=0).update(
+        activity_count=F('activity_count') - 1
+    )
+    Contact.refresh_next_activity([instance.contact_id])
+
+
 def contact_attachment_upload_path(instance, filename):
     """Ruta de subida para adjuntos de contactos"""
     return f'contact_attachments/contact_{instance.contact.id}/{filename}'
@@ -5365,118 +5544,13 @@ class SalesPlan(models.Model):
     
     def get_monthly_progress(self):
         """Calcula el progreso del mes actual"""
-        from django.db.models import Count, Q
-        from datetime import timedelta
-        from dateutil.relativedelta import relativedelta
-        
-        now = timezone.now()
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        
-        # Calcular el mismo día del mes pasado
-        last_month = now - relativedelta(months=1)
-        last_month_start = last_month.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        last_month_same_day = last_month.replace(hour=23, minute=59, second=59, microsecond=999999)
-        
-        # Contactos creados este mes
-        contacts_created = Contact.objects.filter(
-            created_by=self.user,
-            created_at__gte=month_start,
-            created_at__lte=now
-        ).count()
-        
-        # Contactos del mismo día del mes pasado
-        contacts_last_month = Contact.objects.filter(
-            created_by=self.user,
-            created_at__gte=last_month_start,
-            created_at__lte=last_month_same_day
-        ).count()
-        
-        # Contactos positivos este mes
-        positive_contacts = Contact.objects.filter(
-            created_by=self.user,
-            status='positive',
-            created_at__gte=month_start,
-            created_at__lte=now
-        ).count()
-        
-        # Positivos del mes pasado
-        positive_last_month = Contact.objects.filter(
-            created_by=self.user,
-            status='positive',
-            created_at__gte=last_month_start,
-            created_at__lte=last_month_same_day
-        ).count()
-        
-        # Reuniones este mes
-        meetings_held = Contact.objects.filter(
-            created_by=self.user,
-            had_meeting=True,
-            meeting_date__gte=month_start.date(),
-            meeting_date__lte=now.date()
-        ).count()
-        
-        # Reuniones del mes pasado
-        meetings_last_month = Contact.objects.filter(
-            created_by=self.user,
-            had_meeting=True,
-            meeting_date__gte=last_month_start.date(),
-            meeting_date__lte=last_month_same_day.date()
-        ).count()
-        
-        # Contactos ganados este mes
-        won_contacts = Contact.objects.filter(
-            created_by=self.user,
-            status='won',
-            created_at__gte=month_start,
-            created_at__lte=now
-        ).count()
-        
-        # Ganados del mes pasado
-        won_last_month = Contact.objects.filter(
-            created_by=self.user,
-            status='won',
-            created_at__gte=last_month_start,
-            created_at__lte=last_month_same_day
-        ).count()
-        
-        # Calcular diferencias
-        contacts_diff = contacts_created - contacts_last_month
-        positive_diff = positive_contacts - positive_last_month
-        meetings_diff = meetings_held - meetings_last_month
-        won_diff = won_contacts - won_last_month
-        
-        # Calcular porcentajes
-        contact_percentage = (contacts_created / self.monthly_contact_goal * 100) if self.monthly_contact_goal > 0 else 0
-        positive_percentage = (positive_contacts / self.monthly_positive_contact_goal * 100) if self.monthly_positive_contact_goal > 0 else 0
-        meeting_percentage = (meetings_held / self.monthly_meeting_goal * 100) if self.monthly_meeting_goal > 0 else 0
-        won_percentage = (won_contacts / self.monthly_won_goal * 100) if self.monthly_won_goal > 0 else 0
-        
-        # Promedio general
-        overall_percentage = (contact_percentage + positive_percentage + meeting_percentage + won_percentage) / 4
-        
-        return {
-            'contacts_created': contacts_created,
-            'contacts_goal': self.monthly_contact_goal,
-            'contact_percentage': round(contact_percentage, 1),
-            'contacts_last_month': contacts_last_month,
-            'contacts_diff': contacts_diff,
-            'positive_contacts': positive_contacts,
-            'positive_goal': self.monthly_positive_contact_goal,
-            'positive_percentage': round(positive_percentage, 1),
-            'positive_last_month': positive_last_month,
-            'positive_diff': positive_diff,
-            'meetings_held': meetings_held,
-            'meeting_goal': self.monthly_meeting_goal,
-            'meeting_percentage': round(meeting_percentage, 1),
-            'meetings_last_month': meetings_last_month,
-            'meetings_diff': meetings_diff,
-            'won_contacts': won_contacts,
-            'won_goal': self.monthly_won_goal,
-            'won_percentage': round(won_percentage, 1),
-            'won_last_month': won_last_month,
-            'won_diff': won_diff,
-            'overall_percentage': round(overall_percentage, 1)
-        }
+        from .crm_analytics import monthly_plan_progress
+        return monthly_plan_progress(user=self.user, goals={
+            'contacts': self.monthly_contact_goal,
+            'positive': self.monthly_positive_contact_goal,
+            'meetings': self.monthly_meeting_goal,
+            'won': self.monthly_won_goal,
+        })
 
 
 class BlogCategory(models.Model):
@@ -5642,9 +5716,9 @@ class BlogPost(models.Model):
         return []
     
     def increment_views(self):
-        """Incrementa el contador de visualizaciones"""
+        """Incrementa el contador de visualizaciones de forma atómica (sin señales)"""
+        BlogPost.objects.filter(pk=self.pk).update(views_count=models.F('views_count') + 1)
         self.views_count += 1
-        self.save(update_fields=['views_count'])
     
     def get_pending_comments_count(self):
         """Retorna el número de comentarios pendientes de aprobación"""
@@ -7200,14 +7274,14 @@ class LandingPage(models.Model):
         return reverse('landing_page_detail', kwargs={'pk': self.pk})
     
     def increment_views(self):
-        """Incrementar contador de visitas"""
+        """Incrementar contador de visitas de forma atómica (sin señales)"""
+        LandingPage.objects.filter(pk=self.pk).update(views_count=models.F('views_count') + 1)
         self.views_count += 1
-        self.save(update_fields=['views_count'])
     
     def increment_submissions(self):
-        """Incrementar contador de envíos"""
+        """Incrementar contador de envíos de forma atómica (sin señales)"""
+        LandingPage.objects.filter(pk=self.pk).update(submissions_count=models.F('submissions_count') + 1)
         self.submissions_count += 1
-        self.save(update_fields=['submissions_count'])
     
     @property
     def total_views(self):
@@ -7898,6 +7972,7 @@ class PageVisit(models.Model):
         verbose_name = 'Visita a Página'
         verbose_name_plural = 'Visitas a Páginas'
         indexes = [
+            models.Index(fields=['visited_at']),
             models.Index(fields=['page_type', 'visited_at']),
             models.Index(fields=['ip_address', 'visited_at']),
             models.Index(fields=['country_code']),
@@ -7929,6 +8004,162 @@ class PageVisit(models.Model):
         return 'Desconocido'
 
 
+class PageVisitRollup(models.Model):
+    """
+    Visitas agregadas por hora y por las dimensiones que filtra y agrupa la
+    página de analytics (ver ``tickets/visit_rollup.py``)
+    """
+
+    day = models.DateField(verbose_name='Día')
+    hour = models.PositiveSmallIntegerField(verbose_name='Hora')
+    page_type = models.CharField(
+        max_length=50,
+        choices=PageVisit.PAGE_CHOICES,
+        verbose_name='Tipo de Página'
+    )
+    country_code = models.CharField(
+        max_length=2,
+        blank=True,
+        verbose_name='Código de País'
+    )
+    country = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name='País'
+    )
+    browser = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name='Navegador'
+    )
+    device_type = models.CharField(
+        max_length=50,
+        blank=True,
+        verbose_name='Tipo de Dispositivo'
+    )
+    is_mobile = models.BooleanField(
+        default=False,
+        verbose_name='Es Móvil'
+    )
+    is_bot = models.BooleanField(
+        default=False,
+        verbose_name='Es Bot'
+    )
+    utm_source = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name='UTM Source'
+    )
+    visits = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Visitas'
+    )
+
+    class Meta:
+        verbose_name = 'Agregado horario de visitas'
+        verbose_name_plural = 'Agregados horarios de visitas'
+        unique_together = (
+            'day', 'hour', 'page_type', 'country_code', 'country', 'browser',
+            'device_type', 'is_mobile', 'is_bot', 'utm_source',
+        )
+        indexes = [
+            models.Index(fields=['day', 'page_type']),
+            models.Index(fields=['country_code', 'day']),
+        ]
+
+    def __str__(self):
+        return f'{self.day} {self.hour:02d}h {self.page_type}: {self.visits}'
+
+
+class PageVisitSketch(models.Model):
+    """
+    Boceto HyperLogLog de las IPs que visitaron un tipo de página en un día,
+    por país y bot, para estimar visitantes únicos de cualquier rango
+    """
+
+    day = models.DateField(verbose_name='Día')
+    page_type = models.CharField(
+        max_length=50,
+        choices=PageVisit.PAGE_CHOICES,
+        verbose_name='Tipo de Página'
+    )
+    country_code = models.CharField(
+        max_length=2,
+        blank=True,
+        verbose_name='Código de País'
+    )
+    is_bot = models.BooleanField(
+        default=False,
+        verbose_name='Es Bot'
+    )
+    ip_sketch = models.BinaryField(
+        default=bytes,
+        verbose_name='Boceto de IPs'
+    )
+
+    class Meta:
+        verbose_name = 'Boceto de visitantes únicos'
+        verbose_name_plural = 'Bocetos de visitantes únicos'
+        unique_together = ('day', 'page_type', 'country_code', 'is_bot')
+
+    def __str__(self):
+        return f'{self.day} {self.page_type} {self.country_code or "--"}'
+
+
+class PageVisitUrlRollup(models.Model):
+    """Visitas diarias por URL visitada o por página de referencia"""
+
+    KIND_CHOICES = [
+        ('page', 'Página'),
+        ('referrer', 'Referencia'),
+    ]
+
+    day = models.DateField(verbose_name='Día')
+    kind = models.CharField(
+        max_length=10,
+        choices=KIND_CHOICES,
+        verbose_name='Tipo'
+    )
+    page_type = models.CharField(
+        max_length=50,
+        choices=PageVisit.PAGE_CHOICES,
+        verbose_name='Tipo de Página'
+    )
+    country_code = models.CharField(
+        max_length=2,
+        blank=True,
+        verbose_name='Código de País'
+    )
+    is_bot = models.BooleanField(
+        default=False,
+        verbose_name='Es Bot'
+    )
+    url = models.URLField(
+        max_length=500,
+        verbose_name='URL'
+    )
+    title = models.CharField(
+        max_length=200,
+        blank=True,
+        verbose_name='Título de la Página'
+    )
+    visits = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Visitas'
+    )
+
+    class Meta:
+        verbose_name = 'Agregado diario de URLs visitadas'
+        verbose_name_plural = 'Agregados diarios de URLs visitadas'
+        unique_together = ('day', 'kind', 'page_type', 'country_code', 'is_bot', 'url')
+        indexes = [
+            models.Index(fields=['kind', 'day']),
+        ]
+
+    def __str__(self):
+        return f'{self.day} {self.kind} {self.url}: {self.visits}'
+
+
 class AIBlogConfigurator(models.Model):
     """Configurador de IA para generar contenido de blog automáticamente"""
     
@@ -9772,9 +10003,9 @@ class ShortUrl(models.Model):
         return False
     
     def increment_clicks(self):
-        """Incrementa el contador de clics"""
+        """Incrementa el contador de clics (con un UPDATE atómico: los clics simultáneos no se pisan)"""
+        ShortUrl.objects.filter(pk=self.pk).update(clicks=F('clicks') + 1)
         self.clicks += 1
-        self.save(update_fields=['clicks'])
     
     @staticmethod
     def generate_short_code():
@@ -9842,33 +10073,129 @@ class ShortUrlClick(models.Model):
         return f"Clic en {self.short_url.short_code} - {self.clicked_at}"
 
 
-class ClientRequest(models.Model):
-    """Modelo para solicitudes al cliente"""
+class ShortUrlClickRollup(models.Model):
+    """Clics de una URL corta por día y hora (ver ``tickets/activity_rollup.py``)"""
     
-    sequence = models.CharField(
-        max_length=50,
-        unique=True,
-        verbose_name='Secuencia',
-        help_text='Número de secuencia único de la solicitud'
+    short_url = models.ForeignKey(
+        ShortUrl,
+        on_delete=models.CASCADE,
+        related_name='click_rollups',
+        verbose_name='URL Corta'
     )
-    title = models.CharField(
-        max_length=200,
-        verbose_name='Título'
+    day = models.DateField(
+        verbose_name='Día'
     )
-    description = models.TextField(
-        verbose_name='Descripción',
-        help_text='Descripción de lo que se solicita'
+    hour = models.PositiveSmallIntegerField(
+        verbose_name='Hora'
     )
-    requested_to = models.CharField(
-        max_length=200,
-        verbose_name='Solicitado a',
-        help_text='Nombre de la persona a quien se solicita'
+    clicks = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Clics'
     )
-    created_by = models.ForeignKey(
-        User,
+    
+    class Meta:
+        verbose_name = 'Clics por Hora de URL Corta'
+        verbose_name_plural = 'Clics por Hora de URLs Cortas'
+        unique_together = ('short_url', 'day', 'hour')
+    
+    def __str__(self):
+        return f"{self.short_url_id} - {self.day} {self.hour:02d}h: {self.clicks}"
+
+
+class ShortUrlClickBreakdown(models.Model):
+    """Clics de una URL corta por día, país, ciudad y dominio de referencia"""
+    
+    short_url = models.ForeignKey(
+        ShortUrl,
         on_delete=models.CASCADE,
-        related_name='client_requests_created',
-        verbose_name='Creado por'
+        related_name='click_breakdowns',
+        verbose_name='URL Corta'
+    )
+    day = models.DateField(
+        verbose_name='Día'
+    )
+    country = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name='País'
+    )
+    city = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name='Ciudad'
+    )
+    referrer_domain = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name='Dominio de Referencia'
+    )
+    clicks = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Clics'
+    )
+    
+    class Meta:
+        verbose_name = 'Desglose Diario de Clics de URL Corta'
+        verbose_name_plural = 'Desgloses Diarios de Clics de URLs Cortas'
+        unique_together = ('short_url', 'day', 'country', 'city', 'referrer_domain')
+    
+    def __str__(self):
+        return f"{self.short_url_id} - {self.day} {self.country or '-'} {self.referrer_domain or '-'}: {self.clicks}"
+
+
+class ShortUrlClickSketch(models.Model):
+    """Boceto HyperLogLog de las IPs que hicieron clic en una URL corta en un día"""
+    
+    short_url = models.ForeignKey(
+        ShortUrl,
+        on_delete=models.CASCADE,
+        related_name='click_sketches',
+        verbose_name='URL Corta'
+    )
+    day = models.DateField(
+        verbose_name='Día'
+    )
+    ip_sketch = models.BinaryField(
+        default=bytes,
+        verbose_name='Boceto de IPs'
+    )
+    
+    class Meta:
+        verbose_name = 'Boceto de IPs de URL Corta'
+        verbose_name_plural = 'Bocetos de IPs de URLs Cortas'
+        unique_together = ('short_url', 'day')
+    
+    def __str__(self):
+        return f"{self.short_url_id} - {self.day}"
+
+
+class ClientRequest(models.Model):
+    """Modelo para solicitudes al cliente"""
+    
+    sequence = models.CharField(
+        max_length=50,
+        unique=True,
+        verbose_name='Secuencia',
+        help_text='Número de secuencia único de la solicitud'
+    )
+    title = models.CharField(
+        max_length=200,
+        verbose_name='Título'
+    )
+    description = models.TextField(
+        verbose_name='Descripción',
+        help_text='Descripción de lo que se solicita'
+    )
+    requested_to = models.CharField(
+        max_length=200,
+        verbose_name='Solicitado a',
+        help_text='Nombre de la persona a quien se solicita'
+    )
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='client_requests_created',
+        verbose_name='Creado por'
     )
     company = models.ForeignKey(
         'Company',
@@ -12224,6 +12551,12 @@ class WebsiteTracker(models.Model):
         blank=True,
         verbose_name='Datos WHOIS'
     )
+    probe_timings = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='Tiempos de las sondas',
+        help_text='Milisegundos de cada sonda (ping, dns, http, ssl y total) del último rastreo'
+    )
     error_message = models.TextField(
         blank=True,
         verbose_name='Mensaje de error',
@@ -18323,6 +18656,21 @@ class ScheduledTask(models.Model):
         related_name='created_scheduled_tasks',
         verbose_name='Creado por'
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Última Modificación'
+    )
+    locked_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Bloqueada Hasta',
+        help_text='Lease del proceso que está ejecutando la tarea; evita ejecuciones duplicadas entre nodos'
+    )
+    locked_by = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name='Bloqueada Por'
+    )
     
     class Meta:
         ordering = ['-created_at']
@@ -18354,7 +18702,10 @@ class ScheduledTask(models.Model):
         """Verifica si la tarea debe ejecutarse"""
         if not self.is_active:
             return False
-        return timezone.now() >= self.get_next_execution()
+        # Calcular primero la próxima ejecución: sin last_execution devuelve
+        # timezone.now(), que debe ser anterior al now() de la comparación
+        next_execution = self.get_next_execution()
+        return timezone.now() >= next_execution
 
 
 class ScheduledTaskExecution(models.Model):
@@ -18400,6 +18751,163 @@ class ScheduledTaskExecution(models.Model):
         return f"{self.task.name} - {self.executed_at.strftime('%d/%m/%Y %H:%M')} ({self.get_status_display()})"
 
 
+class OutboundNotification(models.Model):
+    """Cola de notificaciones salientes (email y Telegram) que se envían en segundo plano"""
+    
+    CHANNEL_CHOICES = [
+        ('email', 'Email'),
+        ('telegram', 'Telegram'),
+    ]
+    
+    STATUS_CHOICES = [
+        ('pending', 'Pendiente'),
+        ('sending', 'Enviando'),
+        ('sent', 'Enviada'),
+        ('failed', 'Fallida'),
+    ]
+    
+    channel = models.CharField(
+        max_length=10,
+        choices=CHANNEL_CHOICES,
+        verbose_name='Canal'
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default='pending',
+        verbose_name='Estado'
+    )
+    payload = models.JSONField(
+        default=dict,
+        verbose_name='Contenido',
+        help_text='Datos del mensaje: destinatarios, asunto y cuerpo o chat y texto'
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Intentos'
+    )
+    max_attempts = models.PositiveIntegerField(
+        default=6,
+        verbose_name='Intentos máximos'
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Próximo intento'
+    )
+    claim_token = models.CharField(
+        max_length=32,
+        blank=True,
+        verbose_name='Token de reserva',
+        help_text='Identifica el lote del despachador que está enviando la notificación'
+    )
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Reservada en'
+    )
+    last_error = models.TextField(
+        blank=True,
+        verbose_name='Último error'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Creada en'
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Enviada en'
+    )
+    
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Notificación Saliente'
+        verbose_name_plural = 'Notificaciones Salientes'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+            models.Index(fields=['claim_token']),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_channel_display()} #{self.pk} ({self.get_status_display()})"
+
+
+class PdfExportJob(models.Model):
+    """Exportación PDF grande que se genera en segundo plano (ver tickets/pdf_service.py)"""
+
+    STATUS_CHOICES = [
+        ('pending', 'Pendiente'),
+        ('running', 'Generando'),
+        ('done', 'Completada'),
+        ('failed', 'Fallida'),
+    ]
+
+    kind = models.CharField(
+        max_length=50,
+        verbose_name='Tipo de documento'
+    )
+    params = models.JSONField(
+        default=dict,
+        verbose_name='Parámetros',
+        help_text='Datos que necesita el generador del documento (p. ej. los IDs de los tickets)'
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default='pending',
+        verbose_name='Estado'
+    )
+    filename = models.CharField(
+        max_length=255,
+        verbose_name='Nombre del archivo'
+    )
+    file = models.FileField(
+        blank=True,
+        max_length=255,
+        verbose_name='Archivo',
+        help_text='PDF generado, guardado en la caché de documentos por su hash de contenido'
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name='Error'
+    )
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='pdf_export_jobs',
+        verbose_name='Solicitado por'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Creada en'
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Iniciada en'
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Terminada en'
+    )
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Exportación PDF'
+        verbose_name_plural = 'Exportaciones PDF'
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.filename} ({self.get_status_display()})"
+
+    @property
+    def is_finished(self):
+        return self.status in ('done', 'failed')
+
+
 class CourseRating(models.Model):
     """Modelo para calificaciones de cursos con caras (triste, neutro, feliz)"""
     
@@ -19507,6 +20015,95 @@ class WebCounterVisit(models.Model):
         return f"{self.counter.title} - {self.url} ({self.created_at})"
 
 
+class WebCounterDailyStat(models.Model):
+    """Páginas vistas y visitas (sesiones nuevas) de un contador web en un día"""
+    counter = models.ForeignKey(
+        WebCounter,
+        on_delete=models.CASCADE,
+        related_name='daily_stats',
+        verbose_name='Contador'
+    )
+    
+    day = models.DateField(
+        verbose_name='Día'
+    )
+    
+    page_views = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Páginas Vistas'
+    )
+    
+    visits = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Visitas'
+    )
+    
+    class Meta:
+        ordering = ['-day']
+        verbose_name = 'Estadística Diaria de Contador Web'
+        verbose_name_plural = 'Estadísticas Diarias de Contadores Web'
+        unique_together = ('counter', 'day')
+    
+    def __str__(self):
+        return f"{self.counter_id} - {self.day}: {self.page_views}"
+
+
+class WebCounterDailyBreakdown(models.Model):
+    """Páginas vistas de un contador web en un día por URL, país, navegador, sistema o dispositivo"""
+    
+    DIMENSION_CHOICES = [
+        ('url', 'URL'),
+        ('country', 'País'),
+        ('browser', 'Navegador'),
+        ('os', 'Sistema Operativo'),
+        ('device_type', 'Tipo de Dispositivo'),
+    ]
+    
+    counter = models.ForeignKey(
+        WebCounter,
+        on_delete=models.CASCADE,
+        related_name='daily_breakdowns',
+        verbose_name='Contador'
+    )
+    
+    day = models.DateField(
+        verbose_name='Día'
+    )
+    
+    dimension = models.CharField(
+        max_length=20,
+        choices=DIMENSION_CHOICES,
+        verbose_name='Dimensión'
+    )
+    
+    value = models.CharField(
+        max_length=2048,
+        verbose_name='Valor'
+    )
+    
+    value_hash = models.CharField(
+        max_length=40,
+        verbose_name='Hash del Valor',
+        help_text='SHA-1 del valor, para la restricción de unicidad (las URLs pueden ser largas)'
+    )
+    
+    page_views = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Páginas Vistas'
+    )
+    
+    class Meta:
+        verbose_name = 'Desglose Diario de Contador Web'
+        verbose_name_plural = 'Desgloses Diarios de Contadores Web'
+        unique_together = ('counter', 'day', 'dimension', 'value_hash')
+        indexes = [
+            models.Index(fields=['counter', 'dimension', 'day']),
+        ]
+    
+    def __str__(self):
+        return f"{self.counter_id} - {self.day} {self.dimension}={self.value[:50]}: {self.page_views}"
+
+
 class QuickQuote(models.Model):
     """Modelo para cotizaciones rápidas"""
     
@@ -21217,6 +21814,118 @@ class SocialPostFavorite(models.Model):
         return f'{self.user.username} - Post #{self.post.id}'
 
 
+class SocialHashtag(models.Model):
+    """Hashtag de una publicación (índice mantenido por tickets/social_index.py)"""
+
+    post = models.ForeignKey(
+        SocialPost,
+        on_delete=models.CASCADE,
+        related_name='hashtags',
+        verbose_name='Publicación'
+    )
+    tag = models.CharField(
+        max_length=100,
+        verbose_name='Hashtag',
+        help_text='En minúsculas y sin #'
+    )
+    occurrences = models.PositiveIntegerField(
+        default=1,
+        verbose_name='Apariciones en la publicación'
+    )
+    scope = models.CharField(
+        max_length=40,
+        verbose_name='Ámbito de visibilidad',
+        help_text="'public', 'company:<id>' o 'user:<id>'"
+    )
+
+    class Meta:
+        verbose_name = 'Hashtag de publicación'
+        verbose_name_plural = 'Hashtags de publicaciones'
+        unique_together = ('post', 'tag')
+        indexes = [
+            models.Index(fields=['tag', 'scope']),
+        ]
+
+    def __str__(self):
+        return f'#{self.tag} - Post #{self.post_id}'
+
+
+class SocialMention(models.Model):
+    """Usuario mencionado en una publicación (índice mantenido por tickets/social_index.py)"""
+
+    post = models.ForeignKey(
+        SocialPost,
+        on_delete=models.CASCADE,
+        related_name='mentions',
+        verbose_name='Publicación'
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='social_mentions',
+        verbose_name='Usuario mencionado'
+    )
+    occurrences = models.PositiveIntegerField(
+        default=1,
+        verbose_name='Apariciones en la publicación'
+    )
+    scope = models.CharField(
+        max_length=40,
+        verbose_name='Ámbito de visibilidad',
+        help_text="'public', 'company:<id>' o 'user:<id>'"
+    )
+
+    class Meta:
+        verbose_name = 'Mención en publicación'
+        verbose_name_plural = 'Menciones en publicaciones'
+        unique_together = ('post', 'user')
+        indexes = [
+            models.Index(fields=['user', 'scope']),
+        ]
+
+    def __str__(self):
+        return f'@{self.user.username} - Post #{self.post_id}'
+
+
+class SocialTagCounter(models.Model):
+    """Total de apariciones de un hashtag o de un usuario mencionado por ámbito de visibilidad"""
+
+    KIND_CHOICES = [
+        ('hashtag', 'Hashtag'),
+        ('mention', 'Mención'),
+    ]
+
+    kind = models.CharField(
+        max_length=10,
+        choices=KIND_CHOICES,
+        verbose_name='Tipo'
+    )
+    key = models.CharField(
+        max_length=100,
+        verbose_name='Clave',
+        help_text='Hashtag en minúsculas o ID del usuario mencionado'
+    )
+    scope = models.CharField(
+        max_length=40,
+        verbose_name='Ámbito de visibilidad'
+    )
+    count = models.IntegerField(
+        default=0,
+        verbose_name='Apariciones'
+    )
+
+    class Meta:
+        verbose_name = 'Contador de hashtags y menciones'
+        verbose_name_plural = 'Contadores de hashtags y menciones'
+        unique_together = ('kind', 'scope', 'key')
+        indexes = [
+            models.Index(fields=['kind', 'scope', '-count']),
+        ]
+
+    def __str__(self):
+        return f'{self.kind} {self.key} [{self.scope}]: {self.count}'
+
+
 class FunctionalRequirementDocument(models.Model):
     """Documento de Requerimientos Funcionales (DRF)"""
     
@@ -23108,6 +23817,44 @@ class ChatbotMessage(models.Model):
         verbose_name='Hora del mensaje'
     )
     
+    # Procesamiento en segundo plano de los mensajes del usuario (tickets/chatbot_pipeline.py)
+    PIPELINE_STATUS_CHOICES = [
+        ('pending', 'Pendiente'),
+        ('running', 'Procesando'),
+        ('done', 'Procesado'),
+    ]
+    
+    pipeline_status = models.CharField(
+        max_length=10,
+        choices=PIPELINE_STATUS_CHOICES,
+        blank=True,
+        default='',
+        db_index=True,
+        verbose_name='Estado del procesamiento'
+    )
+    
+    needs_reply = models.BooleanField(
+        default=False,
+        verbose_name='Espera respuesta',
+        help_text='True si la respuesta la genera la IA en segundo plano'
+    )
+    
+    pipeline_started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Inicio del procesamiento'
+    )
+    
+    in_reply_to = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='replies',
+        verbose_name='En respuesta a',
+        help_text='Mensaje del usuario al que responde el bot'
+    )
+    
     class Meta:
         ordering = ['timestamp']
         verbose_name = 'Mensaje del Chatbot'
@@ -23157,6 +23904,43 @@ class ChatbotClick(models.Model):
         return f"Click en {self.chatbot.title} - {self.clicked_at.strftime('%Y-%m-%d %H:%M')}"
 
 
+class ChatbotActivityRollup(models.Model):
+    """Conversaciones, mensajes y clicks de un chatbot por día y hora"""
+    
+    chatbot = models.ForeignKey(
+        Chatbot,
+        on_delete=models.CASCADE,
+        related_name='activity_rollups',
+        verbose_name='Chatbot'
+    )
+    day = models.DateField(
+        verbose_name='Día'
+    )
+    hour = models.PositiveSmallIntegerField(
+        verbose_name='Hora'
+    )
+    conversations = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Conversaciones'
+    )
+    messages = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Mensajes'
+    )
+    clicks = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Clicks'
+    )
+    
+    class Meta:
+        verbose_name = 'Actividad por Hora del Chatbot'
+        verbose_name_plural = 'Actividad por Hora de los Chatbots'
+        unique_together = ('chatbot', 'day', 'hour')
+    
+    def __str__(self):
+        return f"{self.chatbot_id} - {self.day} {self.hour:02d}h"
+
+
 class PrivacyPolicy(models.Model):
     """Modelo para políticas de privacidad"""
     title = models.CharField(
@@ -24847,3 +25631,292 @@ class ProjectInfoLineAttachment(models.Model):
 
     def __str__(self):
         return f'{self.line} – {self.original_name}'
+
+
+# ── Índice de búsqueda ────────────────────────────────────────────────────────
+
+class SearchDocument(models.Model):
+    """
+    Documento de búsqueda desnormalizado: una fila por objeto indexado
+    (ticket, contacto, artículo del blog...), mantenida por tickets/search.py.
+    
+    En PostgreSQL ``search_vector`` lo rellena un trigger (configuración
+    'spanish') y tiene índices GIN de texto completo y de trigramas; en SQLite
+    se usa una tabla FTS5 sincronizada con triggers.
+    """
+    
+    entity = models.CharField(
+        max_length=30,
+        verbose_name='Tipo'
+    )
+    object_id = models.PositiveBigIntegerField(
+        verbose_name='ID del objeto'
+    )
+    title = models.CharField(
+        max_length=300,
+        verbose_name='Título'
+    )
+    keywords = models.CharField(
+        max_length=500,
+        blank=True,
+        verbose_name='Palabras clave',
+        help_text='Identificadores cortos que se buscan por subcadena: número, email, teléfono, etiquetas...'
+    )
+    body = models.TextField(
+        blank=True,
+        verbose_name='Contenido'
+    )
+    url = models.CharField(
+        max_length=300,
+        blank=True,
+        verbose_name='URL'
+    )
+    # Datos de visibilidad copiados del objeto original
+    company_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='Empresa'
+    )
+    project_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='Proyecto'
+    )
+    owner_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='Creador'
+    )
+    assignee_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='Asignado a'
+    )
+    is_public = models.BooleanField(
+        default=False,
+        verbose_name='Público'
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Actualizado'
+    )
+    
+    class Meta:
+        verbose_name = 'Documento de Búsqueda'
+        verbose_name_plural = 'Documentos de Búsqueda'
+        unique_together = ['entity', 'object_id']
+        indexes = [
+            models.Index(fields=['entity', 'company_id']),
+            models.Index(fields=['entity', 'owner_id']),
+        ]
+    
+    def __str__(self):
+        return f"{self.entity} #{self.object_id}: {self.title}"
+
+
+class SearchIndexState(models.Model):
+    """
+    Tipos de objeto cuyo índice de búsqueda está completo. Lo marca
+    ``rebuild_search_index``; hasta entonces las búsquedas de ese tipo no usan
+    el índice (solo tiene los objetos guardados desde la migración).
+    """
+    
+    entity = models.CharField(
+        max_length=30,
+        unique=True,
+        verbose_name='Tipo'
+    )
+    built_at = models.DateTimeField(
+        verbose_name='Construido'
+    )
+    
+    class Meta:
+        verbose_name = 'Estado del Índice de Búsqueda'
+        verbose_name_plural = 'Estados del Índice de Búsqueda'
+    
+    def __str__(self):
+        return f"{self.entity}: {self.built_at}"
+
+
+# Señales para mantener el índice de búsqueda
+@receiver(post_save, sender=Ticket)
+@receiver(post_save, sender=Contact)
+@receiver(post_save, sender=BlogPost)
+@receiver(post_save, sender=KnowledgeBase)
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Opportunity)
+@receiver(post_save, sender=Document)
+@receiver(post_save, sender=UrlManager)
+@receiver(post_save, sender=Transaction)
+def update_search_document(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Actualiza el documento de búsqueda cuando se guarda un objeto indexado"""
+    from .search import handle_save
+    handle_save(instance, update_fields=update_fields, raw=raw)
+
+
+@receiver(models.signals.post_delete, sender=Ticket)
+@receiver(models.signals.post_delete, sender=Contact)
+@receiver(models.signals.post_delete, sender=BlogPost)
+@receiver(models.signals.post_delete, sender=KnowledgeBase)
+@receiver(models.signals.post_delete, sender=Company)
+@receiver(models.signals.post_delete, sender=Opportunity)
+@receiver(models.signals.post_delete, sender=Document)
+@receiver(models.signals.post_delete, sender=UrlManager)
+@receiver(models.signals.post_delete, sender=Transaction)
+def delete_search_document(sender, instance, **kwargs):
+    """Elimina el documento de búsqueda cuando se borra un objeto indexado"""
+    from .search import handle_delete
+    handle_delete(instance)
+
+
+# Señal para invalidar las estadísticas del CRM en caché
+@receiver(post_save, sender=Contact)
+@receiver(models.signals.post_delete, sender=Contact)
+def invalidate_crm_analytics(sender, **kwargs):
+    """Los resúmenes por periodo de contactos se recalculan tras cualquier cambio"""
+    from .crm_analytics import invalidate
+    invalidate()
+
+
+# Señales para invalidar la caché de páginas públicas
+@receiver(post_save, sender=BlogPost)
+@receiver(post_save, sender=BlogCategory)
+@receiver(post_save, sender=BlogComment)
+@receiver(post_save, sender=LandingPage)
+@receiver(post_save, sender=Alcance)
+@receiver(post_save, sender=AppCatalog)
+@receiver(post_save, sender=AppCatalogLine)
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=ProductVideo)
+@receiver(post_save, sender=Chatbot)
+@receiver(post_save, sender=SystemConfiguration)
+@receiver(post_save, sender=Exam)
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Document)
+def invalidate_public_pages(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Invalida las páginas públicas cacheadas que muestran el objeto guardado"""
+    if raw:
+        return
+    from .page_cache import invalidate_for_instance
+    invalidate_for_instance(instance, update_fields=update_fields)
+
+
+@receiver(models.signals.post_delete, sender=BlogPost)
+@receiver(models.signals.post_delete, sender=BlogCategory)
+@receiver(models.signals.post_delete, sender=BlogComment)
+@receiver(models.signals.post_delete, sender=LandingPage)
+@receiver(models.signals.post_delete, sender=Alcance)
+@receiver(models.signals.post_delete, sender=AppCatalog)
+@receiver(models.signals.post_delete, sender=AppCatalogLine)
+@receiver(models.signals.post_delete, sender=Product)
+@receiver(models.signals.post_delete, sender=ProductVideo)
+@receiver(models.signals.post_delete, sender=Chatbot)
+@receiver(models.signals.post_delete, sender=Exam)
+@receiver(models.signals.post_delete, sender=Course)
+@receiver(models.signals.post_delete, sender=Document)
+def invalidate_public_pages_on_delete(sender, instance, **kwargs):
+    """Invalida las páginas públicas cacheadas que mostraban el objeto borrado"""
+    from .page_cache import invalidate_for_instance
+    invalidate_for_instance(instance)
+
+
+# Señales para invalidar los contadores de los menús y la configuración en caché
+@receiver(post_save, sender=Contact)
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Opportunity)
+@receiver(post_save, sender=Meeting)
+@receiver(post_save, sender=CrmQuestion)
+@receiver(post_save, sender=Quotation)
+@receiver(post_save, sender=QuotationTemplate)
+@receiver(post_save, sender=OpportunityActivity)
+@receiver(post_save, sender=RFI)
+@receiver(post_save, sender=Ticket)
+@receiver(models.signals.post_delete, sender=Contact)
+@receiver(models.signals.post_delete, sender=Company)
+@receiver(models.signals.post_delete, sender=Opportunity)
+@receiver(models.signals.post_delete, sender=Meeting)
+@receiver(models.signals.post_delete, sender=CrmQuestion)
+@receiver(models.signals.post_delete, sender=Quotation)
+@receiver(models.signals.post_delete, sender=QuotationTemplate)
+@receiver(models.signals.post_delete, sender=OpportunityActivity)
+@receiver(models.signals.post_delete, sender=RFI)
+@receiver(models.signals.post_delete, sender=Ticket)
+def invalidate_nav_counters(sender, **kwargs):
+    """Los contadores de los menús se recalculan tras cualquier cambio en los modelos contados"""
+    from .nav_counters import invalidate
+    invalidate()
+
+
+@receiver(post_save, sender=SystemConfiguration)
+def invalidate_system_config_cache(sender, **kwargs):
+    """Las plantillas leen la configuración desde la caché: se descarta al guardarla"""
+    from django.core.cache import cache
+    from .context_processors import SYSTEM_CONFIG_CACHE_KEY
+    cache.delete(SYSTEM_CONFIG_CACHE_KEY)
+
+
+# Señales del índice de hashtags y menciones de la red social
+@receiver(post_save, sender=SocialPost)
+def index_social_post(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Mantiene los hashtags, las menciones y sus contadores de la publicación"""
+    from .social_index import handle_save
+    handle_save(instance, update_fields=update_fields, raw=raw)
+
+
+@receiver(models.signals.pre_delete, sender=SocialPost)
+def unindex_social_post(sender, instance, **kwargs):
+    """Descuenta los hashtags y menciones antes de que se borren en cascada"""
+    from .social_index import handle_delete
+    handle_delete(instance)
+
+
+@receiver(post_save, sender=UserProfile)
+def sync_social_post_scope(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Las publicaciones "solo mi empresa" siguen a la empresa de su autor"""
+    from .social_index import handle_profile_save
+    handle_profile_save(instance, update_fields=update_fields, raw=raw)
+
+
+@receiver(post_save, sender=CourseClassView)
+@receiver(post_save, sender=CourseComment)
+@receiver(models.signals.post_delete, sender=CourseClassView)
+@receiver(models.signals.post_delete, sender=CourseComment)
+def invalidate_course_stats(sender, instance, raw=False, **kwargs):
+    """Las estadísticas por clase del curso se recalculan tras cualquier vista o comentario"""
+    if raw:
+        return
+    from .course_stats import invalidate_for_instance
+    invalidate_for_instance(instance)
+
+
+@receiver(post_save, sender=PageVisit)
+def rollup_page_visit(sender, instance, created=False, raw=False, **kwargs):
+    """Suma la visita a los agregados de la página de analytics"""
+    if raw or not created:
+        return
+    from .visit_rollup import handle_save
+    handle_save(instance)
+
+
+@receiver(post_save, sender=WebCounter)
+@receiver(models.signals.post_delete, sender=WebCounter)
+def forget_web_counter_token(sender, instance, **kwargs):
+    """El seguimiento resuelve el token desde la caché: se descarta al cambiar el contador"""
+    from .web_counter_ingest import forget_token
+    forget_token(instance.token)
+
+
+@receiver(post_save, sender=ShortUrlClick)
+@receiver(post_save, sender=ChatbotConversation)
+@receiver(post_save, sender=ChatbotMessage)
+@receiver(post_save, sender=ChatbotClick)
+def rollup_activity(sender, instance, created=False, raw=False, **kwargs):
+    """Suma los clics de URLs cortas y la actividad de los chatbots a sus agregados por hora"""
+    if raw or not created:
+        return
+    from .activity_rollup import handle_save
+    handle_save(instance)
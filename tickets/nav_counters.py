@@ -0,0 +1,174 @@
+"""
+Contadores de los menús de navegación (badges).
+
+Los menús de ``base.html`` y los submenús de ``submenu_utils`` muestran en
+cada página el número de contactos, empresas, oportunidades, RFIs... Los
+contadores se guardan en la caché de Django durante
+``NAV_COUNTERS_CACHE_TTL`` segundos: los comunes a todos los agentes en una
+sola entrada y los propios de cada usuario en otra. Guardar o borrar un
+modelo contado invalida todas las entradas (ver las señales al final de
+``models.py``). Dentro de una petición se calculan una sola vez
+(``request_counters``).
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .utils import is_agent
+
+CACHE_TTL = getattr(settings, 'NAV_COUNTERS_CACHE_TTL', 60)
+CACHE_VERSION_KEY = 'nav_counters:version'
+
+
+def _cache_version():
+    version = cache.get(CACHE_VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(CACHE_VERSION_KEY, version, None)
+    return version
+
+
+def invalidate():
+    """Invalida los contadores de todos los usuarios (se llama desde las señales)"""
+    try:
+        cache.incr(CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(CACHE_VERSION_KEY, 2, None)
+
+
+def _cached(key, compute):
+    full_key = f'nav_counters:{_cache_version()}:{key}'
+    value = cache.get(full_key)
+    if value is None:
+        value = compute()
+        cache.set(full_key, value, CACHE_TTL)
+    return value
+
+
+# ---------------------------------------------------------------- agentes
+
+CLOSED_OPPORTUNITY_STATUSES = ['Ganada', 'Perdida', 'Cancelada']
+
+
+def _agent_totals():
+    from .models import (
+        RFI, Company, Contact, CrmQuestion, Meeting, Opportunity, Quotation, QuotationTemplate,
+    )
+    # Un solo aggregate por tabla: el total del submenú y el parcial del menú a la vez
+    companies = Company.objects.aggregate(
+        total=Count('pk'),
+        active=Count('pk', filter=Q(is_active=True)),
+    )
+    opportunities = Opportunity.objects.aggregate(
+        total=Count('pk'),
+        open=Count('pk', filter=~Q(status__name__in=CLOSED_OPPORTUNITY_STATUSES)),
+    )
+    return {
+        'contacts': Contact.objects.count(),
+        'companies': companies['active'],
+        'companies_total': companies['total'],
+        # Oportunidades activas (no ganadas ni perdidas)
+        'opportunities': opportunities['open'],
+        'opportunities_total': opportunities['total'],
+        # Reuniones futuras o de hoy
+        'meetings': Meeting.objects.filter(date__gte=timezone.localdate()).count(),
+        # Preguntas pendientes de respuesta
+        'questions': CrmQuestion.objects.filter(answer__isnull=True).count(),
+        # Cotizaciones activas (draft, sent, approved)
+        'quotations': Quotation.objects.filter(status__in=['draft', 'sent', 'approved']).count(),
+        # Plantillas públicas activas
+        'templates': QuotationTemplate.objects.filter(is_active=True).count(),
+        'rfi': RFI.objects.count(),
+    }
+
+
+def _pending_activities(user):
+    from .models import OpportunityActivity
+    return OpportunityActivity.objects.filter(
+        assigned_to=user,
+        status__in=['pending', 'in_progress']
+    ).count()
+
+
+def agent_counters(user):
+    """Contadores del menú CRM de un agente"""
+    counters = dict(_cached('agents', _agent_totals))
+    counters['pending_activities'] = _cached(f'user:{user.pk}:activities', lambda: _pending_activities(user))
+    return counters
+
+
+# ------------------------------------------------------------ no agentes
+
+def _user_totals(user):
+    from .models import RFI, Contact, Opportunity, Ticket
+
+    user_company = getattr(user, 'profile', None)
+    user_company = user_company.company if user_company else None
+
+    # RFIs abiertos: los suyos, los asignados y los de su empresa
+    open_rfi_q = Q(created_by=user) | Q(assigned_user=user)
+    if user_company:
+        open_rfi_q |= Q(company=user_company)
+    open_rfis = RFI.objects.filter(open_rfi_q, closed_at__isnull=True).distinct()
+    rfi_open_count = open_rfis.count()
+    oldest_rfi = open_rfis.order_by('created_at').values_list('created_at', flat=True).first()
+
+    ticket_active_q = Q(created_by=user) | Q(assigned_to=user)
+    if user_company:
+        ticket_active_q |= Q(company=user_company)
+    ticket_active_count = Ticket.objects.filter(
+        ticket_active_q, status__in=['open', 'working']
+    ).distinct().count()
+
+    return {
+        'contacts': Contact.objects.filter(created_by=user).count(),
+        # Company no tiene creador: el usuario solo tiene su propia empresa
+        'companies': 1 if user_company else 0,
+        # Las creadas o asignadas al usuario, cada una una sola vez
+        'opportunities': Opportunity.objects.filter(Q(created_by=user) | Q(assigned_to=user)).count(),
+        'rfi_open_count': rfi_open_count,
+        'rfi_oldest_at': oldest_rfi,
+        'ticket_active_count': ticket_active_count,
+    }
+
+
+def user_counters(user):
+    """Contadores de un usuario que no es agente: sus registros del CRM, RFIs y tickets activos"""
+    counters = dict(_cached(f'user:{user.pk}:totals', lambda: _user_totals(user)))
+    oldest_rfi = counters.pop('rfi_oldest_at')
+    counters['rfi_oldest_days'] = (timezone.now() - oldest_rfi).days if oldest_rfi else 0
+    return counters
+
+
+# ------------------------------------------------------------- petición
+
+def request_is_agent(request):
+    """``is_agent`` del usuario de la petición, consultado una sola vez por petición"""
+    if not hasattr(request, '_nav_is_agent'):
+        request._nav_is_agent = is_agent(request.user)
+    return request._nav_is_agent
+
+
+def request_counters(request):
+    """
+    Contadores del usuario de la petición. Se calculan (o se leen de la
+    caché) una vez por petición y los comparten el context processor y los
+    submenús de ``submenu_utils``.
+    """
+    if not request.user.is_authenticated:
+        return {}
+    if not hasattr(request, '_nav_counters'):
+        if request_is_agent(request):
+            request._nav_counters = agent_counters(request.user)
+        else:
+            request._nav_counters = user_counters(request.user)
+    return request._nav_counters
+
+
+def crm_submenu_counts(request):
+    """Contactos, empresas y oportunidades del submenú CRM (todos para agentes, los propios si no)"""
+    counters = request_counters(request)
+    if request_is_agent(request):
+        return counters['contacts'], counters['companies_total'], counters['opportunities_total']
+    return counters.get('contacts', 0), counters.get('companies', 0), counters.get('opportunities', 0)
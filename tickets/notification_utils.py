@@ -0,0 +1,309 @@
+"""
+Cola de notificaciones salientes (email y Telegram).
+
+Las vistas y los modelos no envían nada directamente: guardan una fila
+``OutboundNotification`` y un despachador en segundo plano la envía después
+del commit. Así crear un ticket o enviar un formulario nunca espera a un
+servidor SMTP ni a la API de Telegram.
+
+El despachador:
+
+- reserva lotes de notificaciones con un UPDATE condicional (``claim_token``),
+  así varios procesos pueden despachar a la vez sin duplicar envíos;
+- envía todos los emails del lote por una única conexión SMTP;
+- reutiliza una sesión HTTP persistente para Telegram y agrupa en un solo
+  mensaje las ráfagas dirigidas al mismo chat;
+- reintenta los fallos con backoff exponencial hasta ``max_attempts``.
+
+Por defecto cada proceso web arranca su propio hilo despachador al encolar
+(``NOTIFICATION_INLINE_DISPATCH``). Si se desactiva, las notificaciones las
+envía el comando ``python manage.py dispatch_notifications``.
+"""
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Min
+from django.utils import timezone
+
+from .background_queue import ClaimQueue, InlineWorker
+from .models import OutboundNotification, SystemConfiguration
+from .telegram_utils import TELEGRAM_MAX_MESSAGE_LENGTH, TelegramError, post_telegram_message
+
+logger = logging.getLogger(__name__)
+
+# Segundos que espera el despachador tras despertar, para agrupar ráfagas
+COALESCE_WINDOW = getattr(settings, 'NOTIFICATION_COALESCE_SECONDS', 2)
+
+# Backoff de reintentos: 30s, 1m, 2m, 4m... con un máximo de una hora
+RETRY_BASE_DELAY = 30
+RETRY_MAX_DELAY = 3600
+
+# Una notificación reservada que no se ha resuelto en este tiempo se considera
+# abandonada (proceso caído a mitad de envío) y vuelve a reservarse
+CLAIM_TIMEOUT = timedelta(minutes=5)
+
+# Separador entre mensajes agrupados en un mismo envío de Telegram
+TELEGRAM_COALESCE_SEPARATOR = '\n\n━━━━━━━━━━━━━━━━\n\n'
+
+
+# ---------------------------------------------------------------- encolado
+
+def queue_email(subject, body, recipients, html_body=None, from_email=None):
+    """
+    Encola un email para enviarlo en segundo plano.
+
+    Devuelve la ``OutboundNotification`` creada. El despachador se despierta
+    cuando se confirma la transacción en curso.
+    """
+    return _enqueue('email', {
+        'subject': subject,
+        'body': body,
+        'html_body': html_body or '',
+        'from_email': from_email or '',
+        'recipients': list(recipients),
+    })
+
+
+def queue_telegram(bot_token, chat_id, text, parse_mode='HTML'):
+    """Encola un mensaje de Telegram para enviarlo en segundo plano"""
+    return _enqueue('telegram', {
+        'bot_token': bot_token,
+        'chat_id': str(chat_id),
+        'text': text,
+        'parse_mode': parse_mode or '',
+    })
+
+
+def _enqueue(channel, payload):
+    notification = OutboundNotification.objects.create(channel=channel, payload=payload)
+    transaction.on_commit(wake_dispatcher)
+    return notification
+
+
+def send_now(notification):
+    """
+    Envía una notificación recién encolada sin esperar al despachador.
+
+    Solo para las pruebas de configuración, donde el usuario necesita saber
+    en el momento si el envío funciona. Devuelve True si se envió.
+    """
+    token = uuid.uuid4().hex
+    claimed = OutboundNotification.objects.filter(pk=notification.pk, status='pending').update(
+        status='sending', claim_token=token, claimed_at=timezone.now()
+    )
+    if not claimed:
+        notification.refresh_from_db()
+        return notification.status == 'sent'
+
+    notification.refresh_from_db()
+    NotificationDispatcher().deliver([notification])
+    notification.refresh_from_db()
+    return notification.status == 'sent'
+
+
+# ------------------------------------------------------ hilo despachador
+
+def _dispatch_pending():
+    dispatcher = NotificationDispatcher()
+    while dispatcher.run_once():
+        pass
+
+
+# Hilo despachador del proceso web (NOTIFICATION_INLINE_DISPATCH). A
+# diferencia de las otras colas no termina mientras queden reintentos
+# programados: duerme hasta el siguiente
+dispatcher_worker = InlineWorker(
+    'notification-dispatcher', _dispatch_pending, 'NOTIFICATION_INLINE_DISPATCH',
+    next_run=lambda: NotificationDispatcher().seconds_until_next(),
+    settle=COALESCE_WINDOW, error_delay=RETRY_BASE_DELAY,
+)
+
+
+def wake_dispatcher():
+    """Despierta el hilo despachador de este proceso, arrancándolo si hace falta"""
+    dispatcher_worker.wake()
+
+
+# ----------------------------------------------------------- despachador
+
+# Se reserva por lotes (``claim_batch``) porque los emails de un lote
+# comparten conexión SMTP y los Telegram al mismo chat se agrupan
+notification_queue = ClaimQueue(
+    OutboundNotification, 'status', 'claimed_at', CLAIM_TIMEOUT, running='sending',
+    order_by=('next_attempt_at', 'id'), due_field='next_attempt_at', token_field='claim_token',
+)
+
+def get_email_connection(config):
+    """
+    Conexión SMTP con los datos de SystemConfiguration.
+
+    Los valores vacíos en la configuración se toman de ``settings.EMAIL_*``;
+    no se modifican los settings del proceso.
+    """
+    options = {
+        'use_tls': config.email_use_tls,
+        'use_ssl': config.email_use_ssl,
+    }
+    if config.email_host:
+        options['host'] = config.email_host
+    if config.email_port:
+        options['port'] = config.email_port
+    if config.email_host_user:
+        options['username'] = config.email_host_user
+    if config.email_host_password:
+        options['password'] = config.email_host_password
+    return get_connection(fail_silently=False, **options)
+
+
+def get_retry_delay(attempts):
+    """Segundos hasta el siguiente intento tras ``attempts`` fallos"""
+    return min(RETRY_BASE_DELAY * 2 ** max(attempts - 1, 0), RETRY_MAX_DELAY)
+
+
+class NotificationDispatcher:
+    """Reserva y envía lotes de OutboundNotification"""
+
+    def __init__(self, batch_size=100):
+        self.batch_size = batch_size
+
+    def claim(self):
+        """Reserva hasta ``batch_size`` notificaciones vencidas y devuelve las reservadas"""
+        return notification_queue.claim_batch(self.batch_size)
+
+    def run_once(self):
+        """Despacha un lote y devuelve cuántas notificaciones se procesaron"""
+        notifications = self.claim()
+        if notifications:
+            self.deliver(notifications)
+        return len(notifications)
+
+    def seconds_until_next(self):
+        """Segundos hasta el próximo reintento pendiente, o None si la cola está vacía"""
+        next_attempt = OutboundNotification.objects.filter(status='pending').aggregate(
+            next_attempt=Min('next_attempt_at')
+        )['next_attempt']
+        if next_attempt is None:
+            return None
+        return max((next_attempt - timezone.now()).total_seconds(), 0)
+
+    def deliver(self, notifications):
+        emails = [n for n in notifications if n.channel == 'email']
+        telegrams = [n for n in notifications if n.channel == 'telegram']
+        if emails:
+            self.send_emails(emails)
+        if telegrams:
+            self.send_telegrams(telegrams)
+
+    # --------------------------------------------------------------- email
+
+    def send_emails(self, notifications):
+        config = SystemConfiguration.get_config()
+        default_from = config.email_from or settings.DEFAULT_FROM_EMAIL
+        try:
+            email_connection = get_email_connection(config)
+            email_connection.open()
+        except Exception as e:
+            for notification in notifications:
+                self.mark_failed(notification, f"No se pudo conectar al servidor SMTP: {e}")
+            return
+
+        sent = []
+        try:
+            for notification in notifications:
+                payload = notification.payload
+                message = EmailMultiAlternatives(
+                    subject=payload.get('subject', ''),
+                    body=payload.get('body', ''),
+                    from_email=payload.get('from_email') or default_from,
+                    to=payload.get('recipients', []),
+                    connection=email_connection,
+                )
+                if payload.get('html_body'):
+                    message.attach_alternative(payload['html_body'], 'text/html')
+                try:
+                    email_connection.send_messages([message])
+                except Exception as e:
+                    self.mark_failed(notification, f"Error enviando email: {e}")
+                else:
+                    sent.append(notification)
+        finally:
+            try:
+                email_connection.close()
+            except Exception:
+                pass
+
+        self.mark_sent(sent)
+
+    # ------------------------------------------------------------ telegram
+
+    def send_telegrams(self, notifications):
+        for group in self.coalesce_telegrams(notifications):
+            first = group[0].payload
+            text = TELEGRAM_COALESCE_SEPARATOR.join(n.payload.get('text', '') for n in group)
+            try:
+                post_telegram_message(first['bot_token'], first['chat_id'], text, first.get('parse_mode') or None)
+            except TelegramError as e:
+                for notification in group:
+                    self.mark_failed(notification, str(e), retry_after=e.retry_after)
+            except Exception as e:
+                for notification in group:
+                    self.mark_failed(notification, f"Error inesperado al enviar mensaje a Telegram: {e}")
+            else:
+                self.mark_sent(group)
+
+    def coalesce_telegrams(self, notifications):
+        """
+        Agrupa los mensajes dirigidos al mismo chat (y con el mismo formato)
+        en bloques que caben en un único mensaje de Telegram.
+        """
+        chats = {}
+        for notification in notifications:
+            payload = notification.payload
+            key = (payload.get('bot_token'), payload.get('chat_id'), payload.get('parse_mode'))
+            chats.setdefault(key, []).append(notification)
+
+        separator_length = len(TELEGRAM_COALESCE_SEPARATOR)
+        for chat_notifications in chats.values():
+            group, length = [], 0
+            for notification in chat_notifications:
+                text_length = len(notification.payload.get('text', ''))
+                if group and length + separator_length + text_length > TELEGRAM_MAX_MESSAGE_LENGTH:
+                    yield group
+                    group, length = [], 0
+                length += text_length + (separator_length if group else 0)
+                group.append(notification)
+            if group:
+                yield group
+
+    # ------------------------------------------------------------- estados
+
+    def mark_sent(self, notifications):
+        if not notifications:
+            return
+        OutboundNotification.objects.filter(
+            id__in=[n.id for n in notifications], status='sending'
+        ).update(
+            status='sent', sent_at=timezone.now(), attempts=F('attempts') + 1, claim_token='', last_error=''
+        )
+
+    def mark_failed(self, notification, error, retry_after=None):
+        attempts = notification.attempts + 1
+        if attempts >= notification.max_attempts:
+            status, next_attempt_at = 'failed', notification.next_attempt_at
+            logger.error(f"Notificación {notification.pk} descartada tras {attempts} intentos: {error}")
+        else:
+            delay = max(get_retry_delay(attempts), retry_after or 0)
+            status, next_attempt_at = 'pending', timezone.now() + timedelta(seconds=delay)
+            logger.warning(f"Notificación {notification.pk} fallida (intento {attempts}), reintento en {delay}s: {error}")
+
+        OutboundNotification.objects.filter(pk=notification.pk, status='sending').update(
+            status=status,
+            attempts=attempts,
+            next_attempt_at=next_attempt_at,
+            claim_token='',
+            last_error=error[:2000],
+        )
@@ -0,0 +1,203 @@
+"""
+Caché de páginas públicas para visitantes anónimos.
+
+La portada, el blog, las landing pages y ``sitemap.xml`` se sirven desde la
+caché de Django (``CACHES`` en ``settings.py``) a los visitantes sin sesión
+iniciada. Cada página se guarda asociada a unas etiquetas (``blog``,
+``home``...) y guardar o borrar un modelo relacionado invalida sus etiquetas
+(ver ``MODEL_TAGS`` y las señales al final de ``models.py``): las páginas no
+se borran una a una, cambia la versión de la etiqueta y las claves antiguas
+dejan de usarse hasta que caducan.
+
+El token CSRF de los formularios no se guarda en la caché: se sustituye por
+el del visitante al servir la página. Los contadores de visitas se siguen
+incrementando en cada petición con el ``on_hit`` del decorador.
+"""
+import hashlib
+import logging
+import re
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+
+from .session_utils import Cart
+
+logger = logging.getLogger(__name__)
+
+PAGE_TIMEOUT = getattr(settings, 'PUBLIC_PAGE_CACHE_TIMEOUT', 300)
+FRAGMENT_TIMEOUT = getattr(settings, 'PUBLIC_FRAGMENT_CACHE_TIMEOUT', 900)
+
+# Etiquetas que invalida cada modelo al guardarse o borrarse
+MODEL_TAGS = {
+    'tickets.blogpost': ('blog', 'home', 'sitemap'),
+    'tickets.blogcategory': ('blog', 'layout'),
+    'tickets.blogcomment': ('blog',),
+    'tickets.landingpage': ('landing', 'sitemap'),
+    'tickets.alcance': ('home',),
+    'tickets.appcatalog': ('catalog',),
+    'tickets.appcatalogline': ('catalog',),
+    'tickets.product': ('catalog',),
+    'tickets.productvideo': ('catalog',),
+    'tickets.chatbot': ('layout',),
+    'tickets.systemconfiguration': ('layout',),
+    'tickets.exam': ('sitemap',),
+    'tickets.course': ('sitemap',),
+    'tickets.document': ('sitemap',),
+}
+
+# Campos que cambian en cada visita y no afectan al contenido cacheado
+COUNTER_FIELDS = frozenset(['views_count', 'view_count', 'submissions_count', 'last_viewed_at'])
+
+# Parámetros de campañas que no cambian la página (no generan entradas distintas)
+TRACKING_PARAMS = ('utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+                   'gclid', 'fbclid', 'msclkid')
+
+CACHED_HEADERS = ('Content-Type', 'Content-Language', 'Last-Modified', 'X-Robots-Tag')
+
+CSRF_INPUT_RE = re.compile(r'(name="csrfmiddlewaretoken" value=")[^"]*(")')
+CSRF_PLACEHOLDER = '__page_cache_csrf_token__'
+
+
+# ------------------------------------------------------------- etiquetas
+
+def _tag_key(tag):
+    return f'page_cache:tag:{tag}'
+
+
+def _new_version():
+    # Basada en el reloj: si la clave de la etiqueta se expulsa de la caché
+    # no se vuelve a una versión que ya usaron páginas antiguas
+    return int(time.time() * 1000)
+
+
+def tag_versions(*tags):
+    """Versión actual de cada etiqueta (las crea si no existen)"""
+    keys = {tag: _tag_key(tag) for tag in tags}
+    stored = cache.get_many(keys.values())
+    versions = {}
+    for tag, key in keys.items():
+        version = stored.get(key)
+        if version is None:
+            version = _new_version()
+            cache.add(key, version, None)
+        versions[tag] = version
+    return versions
+
+
+def invalidate_tags(*tags):
+    """Invalida todas las páginas y fragmentos asociados a ``tags``"""
+    version = _new_version()
+    cache.set_many({_tag_key(tag): version for tag in tags}, None)
+
+
+def invalidate_for_instance(instance, update_fields=None):
+    """Invalida las etiquetas del modelo de ``instance`` (señales post_save/post_delete)"""
+    tags = MODEL_TAGS.get(instance._meta.label_lower)
+    if not tags:
+        return
+    if update_fields and set(update_fields) <= COUNTER_FIELDS:
+        return
+    try:
+        invalidate_tags(*tags)
+    except Exception as e:
+        logger.error(f'Error invalidando la caché de páginas ({", ".join(tags)}): {e}')
+
+
+# --------------------------------------------------------------- páginas
+
+def _page_key(request, view_name, versions):
+    params = [(key, value) for key, value in request.GET.lists() if key not in TRACKING_PARAMS]
+    url = f'{request.scheme}://{request.get_host()}{request.path}?{urlencode(sorted(params), doseq=True)}'
+    digest = hashlib.md5(url.encode()).hexdigest()
+    version = '.'.join(str(versions[tag]) for tag in sorted(versions))
+    return f'page_cache:page:{view_name}:{digest}:{version}'
+
+
+def _is_cacheable(request, bypass_params):
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if any(param in request.GET for param in bypass_params):
+        return False
+    if request.user.is_authenticated:
+        return False
+    # Mensajes pendientes o carrito: la página es propia de este visitante
+    if len(get_messages(request)):
+        return False
+    return not Cart(request)
+
+
+def _cached_response(request, entry):
+    content = entry['content']
+    if entry['csrf']:
+        content = content.replace(CSRF_PLACEHOLDER, get_token(request))
+    response = HttpResponse(content, status=entry['status'])
+    for header, value in entry['headers'].items():
+        response.headers[header] = value
+    response.headers['X-Page-Cache'] = 'HIT'
+    return response
+
+
+def _cache_entry(response):
+    content = response.content.decode(response.charset)
+    content, csrf_count = CSRF_INPUT_RE.subn(rf'\g<1>{CSRF_PLACEHOLDER}\g<2>', content)
+    return {
+        'content': content,
+        'csrf': bool(csrf_count),
+        'status': response.status_code,
+        'headers': {header: response.headers[header] for header in CACHED_HEADERS if header in response.headers},
+    }
+
+
+def cache_public_page(*tags, timeout=None, on_hit=None, bypass_params=()):
+    """
+    Decorador de vistas públicas: guarda la respuesta para los visitantes
+    anónimos y la invalida cuando cambian los modelos de ``tags``.
+
+    ``on_hit(request, *args, **kwargs)`` se ejecuta cuando la página sale de
+    la caché (p. ej. para sumar la visita). Las peticiones que traen algún
+    parámetro de ``bypass_params`` (búsquedas libres) no se cachean.
+    """
+    tags = ('layout',) + tags
+
+    def decorator(view_func):
+        view_name = f'{view_func.__module__}.{view_func.__qualname__}'
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if PAGE_TIMEOUT <= 0 or not _is_cacheable(request, bypass_params):
+                return view_func(request, *args, **kwargs)
+
+            try:
+                key = _page_key(request, view_name, tag_versions(*tags))
+                entry = cache.get(key)
+            except Exception as e:
+                logger.error(f'Error leyendo la caché de páginas: {e}')
+                return view_func(request, *args, **kwargs)
+
+            if entry is not None:
+                if on_hit is not None:
+                    on_hit(request, *args, **kwargs)
+                return _cached_response(request, entry)
+
+            response = view_func(request, *args, **kwargs)
+            if hasattr(response, 'render') and not response.is_rendered:
+                response.render()
+            if (request.method == 'GET' and response.status_code == 200
+                    and not response.streaming and not response.cookies
+                    and not request.user.is_authenticated):
+                try:
+                    cache.set(key, _cache_entry(response), timeout or PAGE_TIMEOUT)
+                except Exception as e:
+                    logger.error(f'Error guardando la caché de páginas: {e}')
+                response.headers['X-Page-Cache'] = 'MISS'
+            return response
+
+        return wrapper
+
+    return decorator
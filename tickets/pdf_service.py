@@ -0,0 +1,365 @@
+"""
+Servicio común de generación de PDF (reportlab).
+
+- Estilos: ``pdf_style`` devuelve ``ParagraphStyle`` compartidos por proceso.
+  La hoja de estilos base se crea una sola vez y no en cada petición. Los
+  estilos compartidos no se deben modificar.
+- Maquetación: ``render_pdf`` construye el documento en un archivo temporal
+  (en memoria hasta ``PDF_SPOOL_MAX_SIZE`` bytes y en disco a partir de ahí).
+  ``pdf_response`` lo envía por bloques con ``FileResponse``.
+- Caché por contenido: ``cached_pdf`` guarda cada PDF en ``default_storage``
+  con el hash de los datos que lo generan. Un documento idéntico (el mismo
+  ticket sin cambios, el mismo DRF...) no se vuelve a maquetar.
+- Exportaciones grandes: ``start_export`` crea un ``PdfExportJob``. Un hilo
+  del proceso web (``PDF_EXPORT_INLINE``) o el comando ``run_pdf_exports``
+  lo genera en segundo plano. El usuario descarga el archivo desde la
+  página de la exportación.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.http import FileResponse
+from django.utils import timezone
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from .background_queue import ClaimQueue, InlineWorker
+from .models import PdfExportJob, Ticket
+
+logger = logging.getLogger(__name__)
+
+# Tamaño a partir del cual el PDF en construcción pasa de memoria a disco
+SPOOL_MAX_SIZE = getattr(settings, 'PDF_SPOOL_MAX_SIZE', 5 * 1024 * 1024)
+
+CACHE_ENABLED = getattr(settings, 'PDF_CACHE_ENABLED', True)
+CACHE_ROOT = 'pdf_cache'
+# Se suma al hash de contenido: súbelo al cambiar el diseño de algún documento
+# para que no se sirvan PDFs con el diseño anterior
+LAYOUT_VERSION = 1
+
+# Exportaciones de más tickets que este límite se generan en segundo plano
+EXPORT_SYNC_LIMIT = getattr(settings, 'PDF_EXPORT_SYNC_LIMIT', 50)
+
+# Una exportación que lleva más de esto "generando" se da por abandonada
+# (proceso caído a mitad) y vuelve a reservarse
+RUNNING_TIMEOUT = timedelta(minutes=30)
+
+DEFAULT_MARGINS = {'rightMargin': 72, 'leftMargin': 72, 'topMargin': 72, 'bottomMargin': 72}
+
+
+# ---------------------------------------------------------------- estilos
+
+@lru_cache(maxsize=None)
+def sample_styles():
+    """Hoja de estilos base de reportlab, creada una vez por proceso"""
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def _cached_style(name, parent, attrs):
+    return ParagraphStyle(name, parent=sample_styles()[parent], **dict(attrs))
+
+
+def pdf_style(name, parent='Normal', **attrs):
+    """``ParagraphStyle`` derivado de ``parent``, compartido por todas las peticiones"""
+    return _cached_style(name, parent, tuple(sorted(attrs.items())))
+
+
+def paragraph_text(text):
+    """Texto plano para ``Paragraph``: respeta los saltos de línea"""
+    return text.replace('\r\n', '\n').replace('\r', '\n').replace('\n', '<br/>')
+
+
+# ------------------------------------------------------------ maquetación
+
+def render_pdf(story, pagesize=A4, **doc_options):
+    """Maqueta ``story`` y devuelve el PDF como archivo temporal rebobinado"""
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    SimpleDocTemplate(output, pagesize=pagesize, **{**DEFAULT_MARGINS, **doc_options}).build(story)
+    output.seek(0)
+    return output
+
+
+def pdf_response(pdf_file, filename, as_attachment=True):
+    """Respuesta que envía ``pdf_file`` por bloques y lo cierra al terminar"""
+    return FileResponse(pdf_file, as_attachment=as_attachment, filename=filename,
+                        content_type='application/pdf')
+
+
+# ---------------------------------------------------- caché por contenido
+
+def content_hash(kind, data):
+    """Hash de los datos que determinan el contenido de un documento"""
+    payload = json.dumps([kind, LAYOUT_VERSION, data], sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cache_path(kind, digest):
+    return f'{CACHE_ROOT}/{kind}/{digest[:2]}/{digest}.pdf'
+
+
+def store_pdf(kind, data, build):
+    """
+    Ruta en ``default_storage`` del PDF ``kind`` generado con ``data``.
+    ``build()`` solo se llama si ese documento no está ya guardado.
+    """
+    path = cache_path(kind, content_hash(kind, data))
+    if not default_storage.exists(path):
+        pdf = build()
+        try:
+            path = default_storage.save(path, File(pdf, name=os.path.basename(path)))
+        finally:
+            pdf.close()
+    return path
+
+
+def cached_pdf(kind, data, build):
+    """
+    PDF (archivo abierto) del documento ``kind`` con el contenido ``data``.
+    Se sirve de la caché si ya se generó uno idéntico. Si no, se genera con
+    ``build()`` y se guarda. ``data`` debe incluir todo lo que se imprime.
+    """
+    if not CACHE_ENABLED:
+        return build()
+    path = cache_path(kind, content_hash(kind, data))
+    try:
+        if default_storage.exists(path):
+            return default_storage.open(path, 'rb')
+    except Exception as e:
+        logger.error(f'Error leyendo la caché de PDF ({path}): {e}')
+        return build()
+
+    pdf = build()
+    try:
+        default_storage.save(path, File(pdf, name=os.path.basename(path)))
+    except Exception as e:
+        logger.error(f'Error guardando la caché de PDF ({path}): {e}')
+    pdf.seek(0)
+    return pdf
+
+
+# ---------------------------------------------------------------- tickets
+
+def _user_name(user):
+    return user.get_full_name() or user.username
+
+
+def exportable_tickets(user, ticket_ids):
+    """
+    Tickets de ``ticket_ids`` que ``user`` puede exportar (los asignados a él,
+    los que ha creado o todos si es staff), en el orden de ``ticket_ids``.
+    Una sola consulta, con los usuarios y la categoría ya cargados.
+    """
+    tickets = Ticket.objects.filter(pk__in=ticket_ids).select_related('created_by', 'assigned_to', 'category')
+    if not user.is_staff:
+        tickets = tickets.filter(Q(assigned_to=user) | Q(created_by=user))
+    position = {ticket_id: index for index, ticket_id in enumerate(ticket_ids)}
+    return sorted(tickets, key=lambda ticket: position[ticket.pk])
+
+
+def ticket_document_data(ticket):
+    """Lo que se imprime de un ticket (y forma parte de su hash de contenido)"""
+    return {
+        'id': ticket.id,
+        'rows': [
+            ['Campo', 'Información'],
+            ['Título', ticket.title],
+            ['Fecha de Creación', ticket.created_at.strftime('%d/%m/%Y %H:%M')],
+            ['Creado por', _user_name(ticket.created_by)],
+            ['Estado', ticket.get_status_display()],
+            ['Categoría', ticket.category.name if ticket.category else 'Sin categoría'],
+            ['Asignado a', ticket.assigned_to.get_full_name() if ticket.assigned_to else 'Sin asignar'],
+            ['Prioridad', ticket.get_priority_display()],
+            ['Tipo', 'Error' if ticket.ticket_type == 'error' else 'Desarrollo'],
+        ],
+        'description': ticket.description or 'Sin descripción disponible.',
+    }
+
+
+@lru_cache(maxsize=None)
+def _ticket_table_style(header_font_size, body_font_size, header_padding):
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (1, 0), colors.black),
+        ('TEXTCOLOR', (0, 0), (1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), header_padding),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 1), (-1, -1), body_font_size),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ])
+
+
+def _generated_footer(generated_by, generated_on, font_size):
+    # Solo la fecha: ``generated_on`` forma parte del hash y el PDF se reutiliza todo el día
+    text = (f"Documento generado el {generated_on.strftime('%d/%m/%Y')} "
+            f"| Usuario: {generated_by} | Sistema TicketPro")
+    return Paragraph(text, pdf_style(f'Footer{font_size}', fontSize=font_size,
+                                     textColor=colors.grey, alignment=1))
+
+
+def render_ticket_pdf(data, generated_by, generated_on):
+    """PDF de un ticket (``ticket_document_data``)"""
+    title_style = pdf_style('TicketPrintTitle', 'Heading1', fontSize=24, spaceAfter=30,
+                            textColor=colors.black, alignment=1)
+    header_style = pdf_style('TicketPrintHeader', 'Heading2', fontSize=14, spaceBefore=20,
+                             spaceAfter=10, textColor=colors.black)
+    normal_style = pdf_style('TicketPrintNormal', fontSize=11, spaceAfter=10)
+
+    table = Table(data['rows'], colWidths=[2*inch, 4*inch])
+    table.setStyle(_ticket_table_style(12, 10, 12))
+    story = [
+        Paragraph(f"TICKET #{data['id']}", title_style),
+        Spacer(1, 20),
+        table,
+        Spacer(1, 30),
+        Paragraph("Descripción del Ticket", header_style),
+        Paragraph(paragraph_text(data['description']), normal_style),
+        Spacer(1, 20),
+        Spacer(1, 30),
+        _generated_footer(generated_by, generated_on, 9),
+    ]
+    return render_pdf(story)
+
+
+def render_tickets_export_pdf(tickets_data, generated_by, generated_on):
+    """PDF con varios tickets, uno por página"""
+    title_style = pdf_style('TicketExportTitle', 'Heading1', fontSize=20, spaceAfter=30,
+                            textColor=colors.black, alignment=1)
+    ticket_title_style = pdf_style('TicketExportTicketTitle', 'Heading1', fontSize=16, spaceAfter=20,
+                                   textColor=colors.black, alignment=1)
+    header_style = pdf_style('TicketExportHeader', 'Heading2', fontSize=12, spaceBefore=15,
+                             spaceAfter=8, textColor=colors.black)
+    normal_style = pdf_style('TicketExportNormal', fontSize=10, spaceAfter=8)
+    table_style = _ticket_table_style(10, 9, 8)
+
+    story = [
+        Paragraph("EXPORTACIÓN DE TICKETS", title_style),
+        Paragraph(f"Total de tickets: {len(tickets_data)}", normal_style),
+        Spacer(1, 20),
+    ]
+    for index, data in enumerate(tickets_data):
+        table = Table(data['rows'], colWidths=[1.5*inch, 4.5*inch])
+        table.setStyle(table_style)
+        story += [
+            Paragraph(f"TICKET #{data['id']}", ticket_title_style),
+            Spacer(1, 10),
+            table,
+            Spacer(1, 15),
+            Paragraph("Descripción del Ticket", header_style),
+            Paragraph(paragraph_text(data['description']), normal_style),
+        ]
+        if index < len(tickets_data) - 1:
+            story.append(PageBreak())
+
+    story += [Spacer(1, 30), _generated_footer(generated_by, generated_on, 8)]
+    return render_pdf(story)
+
+
+def tickets_export_content(user, ticket_ids):
+    """Datos de la exportación de ``ticket_ids`` para ``user`` (lista vacía si no puede ver ninguno)"""
+    tickets = exportable_tickets(user, ticket_ids)
+    return {
+        'tickets': [ticket_document_data(ticket) for ticket in tickets],
+        'generated_by': _user_name(user),
+        'generated_on': timezone.localdate(),
+    }
+
+
+def tickets_export_filename():
+    return f'tickets_export_{timezone.localtime().strftime("%Y%m%d_%H%M")}.pdf'
+
+
+# ---------------------------------------------------- exportaciones grandes
+
+# Generadores de las exportaciones en segundo plano: tipo -> función(job) que
+# devuelve la ruta del PDF en default_storage
+EXPORT_BUILDERS = {}
+
+
+def export_builder(kind):
+    """Registra el generador de las exportaciones de tipo ``kind``"""
+    def decorator(func):
+        EXPORT_BUILDERS[kind] = func
+        return func
+    return decorator
+
+
+@export_builder('tickets')
+def build_tickets_export(job):
+    content = tickets_export_content(job.created_by, job.params['ticket_ids'])
+    if not content['tickets']:
+        raise ValueError('Ninguno de los tickets seleccionados se puede exportar.')
+    return store_pdf('tickets', content, lambda: render_tickets_export_pdf(
+        content['tickets'], content['generated_by'], content['generated_on']))
+
+
+def start_export(user, kind, params, filename):
+    """Crea la exportación y la arranca en segundo plano tras el commit"""
+    job = PdfExportJob.objects.create(kind=kind, params=params, filename=filename, created_by=user)
+    transaction.on_commit(wake_export_worker)
+    return job
+
+
+export_queue = ClaimQueue(
+    PdfExportJob, 'status', 'started_at', RUNNING_TIMEOUT, order_by='created_at', related=('created_by',),
+)
+
+
+def claim_next_export():
+    """Reserva la exportación pendiente más antigua con un UPDATE condicional"""
+    return export_queue.claim_next()
+
+
+def run_export(job):
+    """Genera el PDF de ``job`` y guarda el resultado o el error"""
+    try:
+        builder = EXPORT_BUILDERS.get(job.kind)
+        if builder is None:
+            raise ValueError(f'Tipo de exportación desconocido: {job.kind}')
+        job.file.name = builder(job)
+        job.status = 'done'
+        job.error = ''
+    except Exception as e:
+        logger.exception(f'Error generando la exportación PDF #{job.pk}')
+        job.status = 'failed'
+        job.error = str(e)
+    job.finished_at = timezone.now()
+    job.save(update_fields=['file', 'status', 'error', 'finished_at'])
+    return job
+
+
+def run_pending_exports():
+    """Genera todas las exportaciones pendientes y devuelve cuántas se procesaron"""
+    processed = 0
+    while True:
+        job = claim_next_export()
+        if job is None:
+            return processed
+        run_export(job)
+        processed += 1
+
+
+# Hilo de exportaciones del proceso web (PDF_EXPORT_INLINE)
+export_worker = InlineWorker('pdf-export-worker', run_pending_exports, 'PDF_EXPORT_INLINE')
+
+
+def wake_export_worker():
+    """Despierta el hilo de exportaciones de este proceso, arrancándolo si hace falta"""
+    export_worker.wake()
@@ -0,0 +1,241 @@
+"""
+Utilidades para ejecutar tareas programadas (ScheduledTask).
+
+Las usan el comando ``run_scheduled_tasks`` (cron) y el demonio ``run_scheduler``.
+Antes de ejecutar una tarea se toma un lease sobre su fila con un UPDATE
+condicional, así dos procesos o nodos nunca ejecutan la misma tarea a la vez.
+El código de la tarea se ejecuta en un proceso hijo que se cancela al superar
+su timeout, siempre menor que el lease: cuando el lease caduca la tarea ya no
+se está ejecutando.
+"""
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from datetime import timedelta
+
+from django.db import connections, models
+from django.db.models import F, Q, Case, When, Value
+from django.utils import timezone
+
+from .models import ScheduledTask, ScheduledTaskExecution
+
+logger = logging.getLogger(__name__)
+
+# Tiempo máximo por ejecución si no se indica otro
+DEFAULT_TASK_TIMEOUT = 300
+
+# Margen extra del lease sobre el timeout, para cubrir la cancelación del
+# proceso y el registro del resultado
+LEASE_MARGIN = 60
+
+# Segundos que se espera a que el proceso cancelado termine antes de matarlo
+TERMINATE_GRACE = 5
+
+
+def get_worker_id():
+    """Identificador del proceso actual, usado como dueño del lease"""
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def acquire_task_lease(task, owner, timeout=DEFAULT_TASK_TIMEOUT, require_due=True):
+    """
+    Intenta reservar la tarea para este proceso con un único UPDATE.
+
+    Solo lo consigue si la tarea sigue activa, nadie más tiene un lease vigente
+    y (con ``require_due``) nadie la ha ejecutado desde que se leyó ``task``.
+    Devuelve True si el lease es nuestro.
+    """
+    now = timezone.now()
+    tasks = ScheduledTask.objects.filter(pk=task.pk, is_active=True).filter(
+        Q(locked_until__isnull=True) | Q(locked_until__lt=now)
+    )
+    if require_due:
+        if task.last_execution is None:
+            tasks = tasks.filter(last_execution__isnull=True)
+        else:
+            tasks = tasks.filter(last_execution=task.last_execution)
+
+    acquired = tasks.update(
+        locked_until=now + timedelta(seconds=timeout + LEASE_MARGIN),
+        locked_by=owner,
+    ) == 1
+    if acquired:
+        task.locked_by = owner
+    return acquired
+
+
+def release_task_lease(task, owner, status, result, finished_at=None):
+    """
+    Registra el resultado en la tarea y libera el lease en un único UPDATE.
+
+    Los contadores se incrementan con F() para no pisar otras ejecuciones; el
+    lease solo se libera si sigue siendo nuestro.
+    """
+    finished_at = finished_at or timezone.now()
+    counter = 'success_count' if status == 'success' else 'error_count'
+    ScheduledTask.objects.filter(pk=task.pk).update(
+        last_execution=finished_at,
+        last_result=result,
+        locked_until=Case(
+            When(locked_by=owner, then=Value(None)),
+            default=F('locked_until'),
+            output_field=models.DateTimeField(),
+        ),
+        locked_by=Case(
+            When(locked_by=owner, then=Value('')),
+            default=F('locked_by'),
+            output_field=models.CharField(),
+        ),
+        **{counter: F(counter) + 1},
+    )
+
+
+def build_task_globals(print_function=print):
+    """Entorno de ejecución disponible para el código de las tareas"""
+    exec_globals = {
+        '__builtins__': __builtins__,
+        'timezone': timezone,
+        'datetime': timezone.datetime,
+        'timedelta': timezone.timedelta,
+        'logger': logger,
+        'print': print_function,
+    }
+
+    # Importar modelos comunes que podrían necesitarse
+    try:
+        from django.contrib.auth.models import User
+        from tickets.models import Ticket, Contact, Company
+        exec_globals.update({
+            'User': User,
+            'Ticket': Ticket,
+            'Contact': Contact,
+            'Company': Company,
+        })
+    except ImportError:
+        pass
+
+    return exec_globals
+
+
+def run_task_code(code, print_function=print):
+    """Ejecuta el código de una tarea y devuelve (status, result, execution_time)"""
+    start_time = time.time()
+    try:
+        exec(code, build_task_globals(print_function), {})
+    except Exception as e:
+        return 'error', str(e), time.time() - start_time
+
+    execution_time = time.time() - start_time
+    return 'success', f"Ejecución exitosa (tiempo: {execution_time:.2f}s)", execution_time
+
+
+def run_task_process(code, result_conn):
+    """Punto de entrada del proceso hijo: ejecuta el código y devuelve el resultado por el pipe"""
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        # Con el método 'spawn' (macOS) el hijo arranca sin Django configurado
+        django.setup()
+
+    # El hijo no hereda la parada ordenada del padre: SIGTERM lo termina y
+    # Ctrl+C solo lo recibe el planificador, que espera a las tareas en curso
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    try:
+        status, result, execution_time = run_task_code(code, print)
+    finally:
+        connections.close_all()
+    result_conn.send((status, result, execution_time))
+    result_conn.close()
+
+
+def task_process_context():
+    """Contexto de multiprocessing para las tareas ('fork' donde exista)"""
+    start_methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('fork' if 'fork' in start_methods else None)
+
+
+def start_task_process(mp_context, code, name):
+    """Arranca el proceso hijo de una tarea y devuelve (proceso, extremo de lectura del pipe)"""
+    # El hijo no debe heredar las conexiones abiertas del padre
+    connections.close_all()
+    parent_conn, child_conn = mp_context.Pipe(duplex=False)
+    process = mp_context.Process(target=run_task_process, args=(code, child_conn), name=name, daemon=True)
+    process.start()
+    child_conn.close()
+    return process, parent_conn
+
+
+def stop_task_process(process):
+    """Termina el proceso de una tarea, matándolo si no para a tiempo"""
+    process.terminate()
+    process.join(TERMINATE_GRACE)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def run_task_code_with_timeout(code, timeout=DEFAULT_TASK_TIMEOUT, name='scheduled-task'):
+    """
+    Ejecuta el código de una tarea en un proceso hijo y espera como mucho
+    ``timeout`` segundos. Devuelve (status, result, execution_time), con
+    status 'timeout' si hubo que cancelarla.
+    """
+    started = time.monotonic()
+    process, result_conn = start_task_process(task_process_context(), code, name)
+    try:
+        if result_conn.poll(timeout):
+            try:
+                return result_conn.recv()
+            except EOFError:
+                # El proceso terminó sin enviar resultado (p. ej. os._exit o señal)
+                process.join()
+                return (
+                    'error',
+                    f'El proceso terminó sin resultado (código {process.exitcode})',
+                    time.monotonic() - started,
+                )
+        stop_task_process(process)
+        return 'timeout', f'Tiempo máximo de ejecución superado ({timeout}s)', time.monotonic() - started
+    finally:
+        result_conn.close()
+        process.join()
+
+
+class ExecutionLogBuffer:
+    """Acumula ScheduledTaskExecution y los inserta por lotes con bulk_create"""
+
+    def __init__(self, batch_size=50, flush_interval=10):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pending = []
+        self.last_flush = time.monotonic()
+
+    def add(self, task, status, result, execution_time, executed_at=None):
+        self.pending.append(ScheduledTaskExecution(
+            task_id=task.pk,
+            executed_at=executed_at or timezone.now(),
+            status=status,
+            result=result,
+            execution_time=execution_time,
+        ))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush_if_due(self):
+        if self.pending and time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        try:
+            ScheduledTaskExecution.objects.bulk_create(pending, batch_size=self.batch_size)
+        except Exception as e:
+            logger.error(f'Error guardando {len(pending)} ejecuciones de tareas programadas: {e}')
@@ -0,0 +1,809 @@
+"""
+Índice de búsqueda de texto completo.
+
+Cada objeto buscable (ticket, contacto, empresa, oportunidad, documento,
+artículo del blog, base de conocimientos, URL, transacción) tiene una fila
+``SearchDocument`` con su texto desnormalizado, que se mantiene desde las
+señales ``post_save``/``post_delete`` de models.py.
+
+Las búsquedas no recorren las tablas originales con ``LIKE '%...%'``: se
+resuelven sobre el índice y devuelven los ids coincidentes.
+
+- PostgreSQL: ``tsvector`` (configuración 'spanish') con índice GIN y
+  búsqueda por prefijo, más trigramas para subcadenas en título y palabras
+  clave (números de ticket, emails, teléfonos...).
+- SQLite: tabla FTS5 con ranking ``bm25``.
+- Otros motores: ``icontains`` sobre la tabla de documentos.
+
+La visibilidad en las vistas de listado la decide su propio queryset:
+``filter_queryset`` solo restringe un queryset ya filtrado por permisos. La
+búsqueda global (``federated_search``) no toca las tablas originales y aplica
+las reglas de visibilidad de cada tipo sobre las columnas del documento.
+
+Para (re)construir el índice: ``python manage.py rebuild_search_index``.
+Las señales solo indexan lo que se guarda, así que hasta que ese comando
+marca un tipo como construido (``SearchIndexState``) sus búsquedas se hacen
+con ``icontains`` sobre la tabla original.
+"""
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import F, Q, Value, Window
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import RowNumber
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import escape, strip_tags
+
+from .models import (
+    BlogPost, Company, Contact, Document, KnowledgeBase, Opportunity, SearchDocument, SearchIndexState,
+    Ticket, Transaction, UrlManager,
+)
+
+logger = logging.getLogger(__name__)
+
+# Marcas de resaltado internas; se convierten a <mark> después de escapar el HTML
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_STOP = '\x03'
+
+TITLE_MAX_LENGTH = SearchDocument._meta.get_field('title').max_length
+KEYWORDS_MAX_LENGTH = SearchDocument._meta.get_field('keywords').max_length
+URL_MAX_LENGTH = SearchDocument._meta.get_field('url').max_length
+
+FTS_TABLE = 'tickets_searchdocument_fts'
+
+TOKEN_RE = re.compile(r'\w+')
+
+# Búsqueda global: longitud mínima de la consulta y caché de resultados recientes
+MIN_QUERY_LENGTH = 2
+RESULT_CACHE_SIZE = getattr(settings, 'SEARCH_RESULT_CACHE_SIZE', 512)
+RESULT_CACHE_TTL = getattr(settings, 'SEARCH_RESULT_CACHE_TTL', 30)
+
+
+# --------------------------------------------------------------- entidades
+
+class SearchEntity:
+    """Tipo de objeto indexado: modelo, campos que afectan al documento y función que lo construye"""
+
+    def __init__(self, name, model, label, build, fields=None, related=None, visibility=None,
+                 search_fields=None):
+        self.name = name
+        self.model = model
+        self.label = label
+        self.build = build
+        self.fields = set(fields or [])
+        self.related = related or []
+        self.visibility = visibility or _visible_to_agents
+        self.search_fields = search_fields or []
+
+    def get_queryset(self):
+        return self.model._default_manager.select_related(*self.related).order_by('pk')
+
+    def is_affected(self, update_fields):
+        """False si un save(update_fields=...) no toca ningún campo indexado"""
+        if not update_fields or not self.fields:
+            return True
+        return bool(self.fields.intersection(update_fields))
+
+    def fallback_condition(self, query):
+        """``icontains`` sobre las tablas originales, para cuando el índice aún está vacío"""
+        condition = Q()
+        for field in self.search_fields:
+            condition |= Q(**{f'{field}__icontains': query})
+        return condition
+
+
+ENTITIES = {}
+_entities_by_model = {}
+
+
+def register_entity(name, model, label, fields=None, related=None, visibility=None, search_fields=None):
+    """
+    Registra la función que construye el documento de un modelo.
+
+    La función recibe el objeto y devuelve un dict con los campos de
+    SearchDocument (``title``, ``keywords``, ``body``, ``url``, ``company_id``...)
+    o None si el objeto no debe aparecer en las búsquedas.
+
+    ``visibility`` recibe un SearchViewer y devuelve la condición (``Q``) sobre
+    SearchDocument que puede ver ese usuario, o None si no puede ver ninguno.
+    Por defecto solo los agentes.
+
+    ``search_fields`` son los campos del modelo en los que ``filter_queryset``
+    busca con ``icontains`` mientras el índice de este tipo no esté
+    construido (antes del primer ``rebuild_search_index``).
+    """
+    def decorator(build):
+        entity = SearchEntity(name, model, label, build, fields=fields, related=related,
+                              visibility=visibility, search_fields=search_fields)
+        ENTITIES[name] = entity
+        _entities_by_model[model] = entity
+        return build
+    return decorator
+
+
+def get_entity(model):
+    return _entities_by_model.get(model)
+
+
+def _join(*values):
+    return ' '.join(str(value) for value in values if value)
+
+
+# ------------------------------------------------------------ visibilidad
+
+class SearchViewer:
+    """Datos del usuario que deciden qué documentos ve, calculados una vez por búsqueda"""
+
+    def __init__(self, user):
+        self.user = user
+
+    @cached_property
+    def is_agent(self):
+        from .utils import is_agent
+        return is_agent(self.user)
+
+    @cached_property
+    def profile(self):
+        return getattr(self.user, 'profile', None)
+
+    @cached_property
+    def company_id(self):
+        return getattr(self.profile, 'company_id', None)
+
+    @cached_property
+    def project_ids(self):
+        return list(self.user.assigned_projects.values_list('id', flat=True))
+
+    @cached_property
+    def can_see_all_contacts(self):
+        return self.user.is_superuser or getattr(self.profile, 'can_see_all_contacts', False)
+
+
+def _visible_to_agents(viewer):
+    return Q() if viewer.is_agent else None
+
+
+def _visible_to_everyone(viewer):
+    return Q()
+
+
+def _ticket_visibility(viewer):
+    # Mismas reglas que ticket_list_view
+    if viewer.is_agent:
+        return Q()
+    condition = Q(owner_id=viewer.user.pk)
+    if viewer.project_ids:
+        condition |= Q(project_id__in=viewer.project_ids)
+    if viewer.company_id:
+        condition |= Q(company_id=viewer.company_id)
+    return condition
+
+
+def _contact_visibility(viewer):
+    # Mismas reglas que contact_list
+    return Q() if viewer.can_see_all_contacts else Q(assignee_id=viewer.user.pk)
+
+
+def _opportunity_visibility(viewer):
+    # Mismas reglas que opportunity_list
+    if viewer.is_agent:
+        return Q()
+    return Q(owner_id=viewer.user.pk) | Q(assignee_id=viewer.user.pk)
+
+
+def _owner_visibility(viewer):
+    return Q(owner_id=viewer.user.pk)
+
+
+def _transaction_visibility(viewer):
+    # Mismas reglas que transaction_search
+    return Q() if viewer.is_agent else Q(is_public=True)
+
+
+@register_entity(
+    'ticket', Ticket, 'Tickets',
+    fields=['title', 'ticket_number', 'description', 'company', 'project',
+            'created_by', 'assigned_to', 'is_public_shareable'],
+    visibility=_ticket_visibility,
+    search_fields=['title', 'description'],
+)
+def build_ticket(ticket):
+    return {
+        'title': ticket.title,
+        'keywords': ticket.ticket_number or '',
+        'body': ticket.description,
+        'url': reverse('ticket_detail', args=[ticket.pk]),
+        'company_id': ticket.company_id,
+        'project_id': ticket.project_id,
+        'owner_id': ticket.created_by_id,
+        'assignee_id': ticket.assigned_to_id,
+        'is_public': ticket.is_public_shareable,
+    }
+
+
+@register_entity(
+    'contact', Contact, 'Contactos',
+    fields=['name', 'email', 'phone', 'company', 'erp', 'position', 'notes', 'assigned_to'],
+    visibility=_contact_visibility,
+    search_fields=['name', 'email', 'company', 'phone', 'erp'],
+)
+def build_contact(contact):
+    return {
+        'title': contact.name,
+        'keywords': _join(contact.email, contact.phone, contact.company, contact.erp),
+        'body': _join(contact.position, contact.notes),
+        'url': reverse('contact_detail', args=[contact.pk]),
+        'owner_id': contact.created_by_id,
+        'assignee_id': contact.assigned_to_id,
+    }
+
+
+@register_entity(
+    'blog_post', BlogPost, 'Blog',
+    fields=['title', 'excerpt', 'content', 'tags', 'status', 'slug'],
+    visibility=_visible_to_everyone,
+    search_fields=['title', 'excerpt', 'content', 'tags'],
+)
+def build_blog_post(post):
+    # Solo los artículos publicados son buscables
+    if post.status != 'published':
+        return None
+    return {
+        'title': post.title,
+        'keywords': post.tags,
+        'body': _join(post.excerpt, strip_tags(post.content)),
+        'url': reverse('blog_post_detail', args=[post.slug]),
+        'owner_id': post.created_by_id,
+        'is_public': True,
+    }
+
+
+@register_entity(
+    'knowledge_base', KnowledgeBase, 'Base de Conocimientos',
+    fields=['title', 'description', 'tags', 'category', 'is_active'],
+    search_fields=['title', 'description', 'tags', 'category'],
+)
+def build_knowledge_base(entry):
+    if not entry.is_active:
+        return None
+    return {
+        'title': entry.title,
+        'keywords': _join(entry.tags, entry.category),
+        'body': entry.description,
+        'url': reverse('knowledge_base_detail', args=[entry.pk]),
+        'owner_id': entry.created_by_id,
+    }
+
+
+@register_entity(
+    'company', Company, 'Empresas',
+    fields=['name', 'email', 'phone', 'tax_id', 'city', 'description'],
+    search_fields=['name', 'description', 'email'],
+)
+def build_company(company):
+    return {
+        'title': company.name,
+        'keywords': _join(company.email, company.phone, company.tax_id, company.city),
+        'body': company.description,
+        'url': reverse('company_detail', args=[company.pk]),
+        'company_id': company.pk,
+    }
+
+
+@register_entity(
+    'opportunity', Opportunity, 'Oportunidades',
+    fields=['name', 'description', 'company', 'contact_name', 'contact_email', 'contact_phone',
+            'created_by', 'assigned_to'],
+    related=['company'],
+    visibility=_opportunity_visibility,
+    search_fields=['name', 'description', 'company__name', 'contact_name'],
+)
+def build_opportunity(opportunity):
+    return {
+        'title': opportunity.name,
+        'keywords': _join(
+            opportunity.company.name if opportunity.company_id else '',
+            opportunity.contact_name, opportunity.contact_email, opportunity.contact_phone,
+        ),
+        'body': opportunity.description,
+        'url': reverse('opportunity_detail', args=[opportunity.pk]),
+        'company_id': opportunity.company_id,
+        'owner_id': opportunity.created_by_id,
+        'assignee_id': opportunity.assigned_to_id,
+    }
+
+
+@register_entity(
+    'document', Document, 'Documentos',
+    fields=['title', 'description', 'tags', 'company', 'created_by', 'is_public'],
+    search_fields=['title', 'description', 'tags'],
+)
+def build_document(document):
+    return {
+        'title': document.title,
+        'keywords': document.tags,
+        'body': document.description,
+        'url': reverse('document_detail', args=[document.pk]),
+        'company_id': document.company_id,
+        'owner_id': document.created_by_id,
+        'is_public': document.is_public,
+    }
+
+
+@register_entity(
+    'url_manager', UrlManager, 'URLs',
+    fields=['title', 'url', 'description', 'category', 'is_active', 'created_by'],
+    visibility=_owner_visibility,
+    search_fields=['title', 'url', 'description', 'category'],
+)
+def build_url_manager(entry):
+    # Nunca se indexan usuario ni contraseña
+    if not entry.is_active:
+        return None
+    return {
+        'title': entry.title,
+        'keywords': _join(entry.url, entry.category),
+        'body': entry.description,
+        'url': reverse('url_manager_detail', args=[entry.pk]),
+        'owner_id': entry.created_by_id,
+    }
+
+
+@register_entity(
+    'transaction', Transaction, 'Transacciones',
+    fields=['code', 'name', 'url', 'description', 'visible_for_all', 'is_active'],
+    visibility=_transaction_visibility,
+    search_fields=['code', 'name'],
+)
+def build_transaction(entry):
+    if not entry.is_active:
+        return None
+    return {
+        'title': entry.name,
+        'keywords': entry.code,
+        'body': entry.description,
+        # La transacción es un acceso directo: el resultado lleva a su URL
+        'url': entry.url,
+        'owner_id': entry.created_by_id,
+        'is_public': entry.visible_for_all,
+    }
+
+
+# -------------------------------------------------------------- indexación
+
+def _document_values(entity, obj):
+    values = entity.build(obj)
+    if values is None:
+        return None
+    values['title'] = (values.get('title') or '')[:TITLE_MAX_LENGTH]
+    values['keywords'] = (values.get('keywords') or '')[:KEYWORDS_MAX_LENGTH]
+    values['body'] = values.get('body') or ''
+    values['url'] = (values.get('url') or '')[:URL_MAX_LENGTH]
+    return values
+
+
+def index_object(obj):
+    """Crea, actualiza o elimina el documento de ``obj``"""
+    entity = get_entity(type(obj))
+    if entity is None:
+        return
+    values = _document_values(entity, obj)
+    if values is None:
+        remove_object(obj)
+    else:
+        SearchDocument.objects.update_or_create(entity=entity.name, object_id=obj.pk, defaults=values)
+    result_cache.clear()
+
+
+def index_objects(entity_name, objects):
+    """
+    Indexa muchos objetos de un mismo tipo con un único INSERT ... ON CONFLICT.
+
+    Lo usan la importación masiva de tickets (``bulk_create`` no lanza señales)
+    y ``rebuild_search_index``. Devuelve cuántos documentos se escribieron.
+    """
+    entity = ENTITIES[entity_name]
+    documents, removed = [], []
+    for obj in objects:
+        values = _document_values(entity, obj)
+        if values is None:
+            removed.append(obj.pk)
+        else:
+            documents.append(SearchDocument(entity=entity.name, object_id=obj.pk, **values))
+
+    if removed:
+        SearchDocument.objects.filter(entity=entity.name, object_id__in=removed).delete()
+    if documents:
+        update_fields = [
+            'title', 'keywords', 'body', 'url', 'company_id', 'project_id',
+            'owner_id', 'assignee_id', 'is_public', 'updated_at',
+        ]
+        SearchDocument.objects.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=['entity', 'object_id'],
+            update_fields=update_fields,
+        )
+    result_cache.clear()
+    return len(documents)
+
+
+def remove_object(obj):
+    entity = get_entity(type(obj))
+    if entity is not None:
+        SearchDocument.objects.filter(entity=entity.name, object_id=obj.pk).delete()
+        result_cache.clear()
+
+
+def handle_save(instance, update_fields=None, raw=False):
+    """
+    Receptor de ``post_save``: mantiene el documento del objeto.
+
+    Un fallo del índice no debe impedir guardar el objeto, por eso se aísla
+    en un savepoint y solo se registra el error.
+    """
+    entity = get_entity(type(instance))
+    if raw or entity is None or not entity.is_affected(update_fields):
+        return
+    try:
+        with transaction.atomic():
+            index_object(instance)
+    except DatabaseError as e:
+        logger.error(f'Error al indexar {entity.name} {instance.pk} para la búsqueda: {e}')
+
+
+def handle_delete(instance):
+    """Receptor de ``post_delete``"""
+    try:
+        with transaction.atomic():
+            remove_object(instance)
+    except DatabaseError as e:
+        logger.error(f'Error al eliminar {type(instance).__name__} {instance.pk} del índice de búsqueda: {e}')
+
+
+# ---------------------------------------------------------------- consultas
+
+def tokenize(query):
+    return TOKEN_RE.findall(query or '')
+
+
+@lru_cache(maxsize=None)
+def _sqlite_fts_available(alias):
+    from django.db import connections
+    with connections[alias].cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+        return cursor.fetchone() is not None
+
+
+def get_backend():
+    """'postgresql', 'fts5' o 'like' según lo que ofrezca la base de datos"""
+    if connection.vendor == 'postgresql':
+        return 'postgresql'
+    if connection.vendor == 'sqlite' and _sqlite_fts_available(connection.alias):
+        return 'fts5'
+    return 'like'
+
+
+def _postgres_query(tokens):
+    from django.contrib.postgres.search import SearchQuery
+
+    # Cada término como prefijo y todos obligatorios: "fact clie" -> fact:* & clie:*
+    return SearchQuery(' & '.join(f'{token}:*' for token in tokens), config='spanish', search_type='raw')
+
+
+def _fts_query(tokens):
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def match_condition(query):
+    """Condición sobre SearchDocument para los documentos que coinciden con ``query``"""
+    query = query.strip()
+    tokens = tokenize(query)
+    substring = Q(title__icontains=query) | Q(keywords__icontains=query)
+    backend = get_backend()
+
+    if not tokens:
+        return substring
+    if backend == 'postgresql':
+        return Q(search_vector=_postgres_query(tokens)) | substring
+    if backend == 'fts5':
+        fts_ids = RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [_fts_query(tokens)])
+        return Q(id__in=fts_ids) | substring
+    return substring | Q(body__icontains=query)
+
+
+def matching_ids(entity_name, query):
+    """Subconsulta con los ids de los objetos de ``entity_name`` que coinciden con ``query``"""
+    return (
+        SearchDocument.objects
+        .filter(match_condition(query), entity=entity_name)
+        .values('object_id')
+    )
+
+
+def is_indexed(entity_name):
+    """True si ``rebuild_search_index`` ya construyó el índice de ``entity_name``"""
+    return SearchIndexState.objects.filter(entity=entity_name).exists()
+
+
+def mark_indexed(entity_name):
+    """Marca el índice de ``entity_name`` como completo"""
+    SearchIndexState.objects.update_or_create(entity=entity_name, defaults={'built_at': timezone.now()})
+
+
+def filter_queryset(queryset, entity_name, query):
+    """
+    Restringe ``queryset`` a los objetos que coinciden con ``query`` según el índice.
+
+    Mientras el índice de ese tipo no esté construido (instalación recién
+    migrada, sin ``rebuild_search_index``) solo tiene los objetos guardados
+    desde entonces: se busca con ``icontains`` sobre la tabla original.
+    """
+    if not query or not query.strip():
+        return queryset
+    if not is_indexed(entity_name):
+        return queryset.filter(ENTITIES[entity_name].fallback_condition(query.strip()))
+    return queryset.filter(pk__in=matching_ids(entity_name, query))
+
+
+class SearchHit:
+    """Resultado de ``search_documents``"""
+
+    def __init__(self, document, rank=0.0, highlight=''):
+        self.document = document
+        self.entity = document.entity
+        self.object_id = document.object_id
+        self.title = document.title
+        self.url = document.url
+        self.rank = rank
+        self.highlight = highlight
+
+    @property
+    def label(self):
+        return ENTITIES[self.entity].label if self.entity in ENTITIES else self.entity
+
+    @property
+    def highlight_html(self):
+        return highlight_html(self.highlight)
+
+
+def search_documents(query, entities=None, limit=20, documents=None, per_entity=False):
+    """
+    Busca en el índice y devuelve una lista de SearchHit ordenada por relevancia.
+
+    ``documents`` permite pasar un queryset de SearchDocument ya restringido
+    (por ejemplo por visibilidad). Con ``per_entity`` el límite se aplica a
+    cada tipo por separado (los ``limit`` mejores de cada uno) en la misma
+    consulta. El resaltado se devuelve con marcas internas; usar
+    ``SearchHit.highlight_html`` para mostrarlo.
+    """
+    query = (query or '').strip()
+    if not query:
+        return []
+    if documents is None:
+        documents = SearchDocument.objects.all()
+    if entities:
+        documents = documents.filter(entity__in=list(entities))
+
+    candidates = documents.filter(match_condition(query))
+    tokens = tokenize(query)
+    backend = get_backend()
+    if tokens and backend == 'postgresql':
+        return _search_postgres(candidates, tokens, limit, per_entity)
+    if tokens and backend == 'fts5':
+        return _search_fts5(candidates, tokens, limit, per_entity)
+    return _search_substring(candidates, tokens or [query], limit, per_entity)
+
+
+def _top_per_entity(queryset, limit, *order_by):
+    """Numera los resultados dentro de cada tipo y se queda con los ``limit`` primeros"""
+    return queryset.annotate(
+        position=Window(RowNumber(), partition_by=[F('entity')], order_by=list(order_by))
+    ).filter(position__lte=limit)
+
+
+def _search_postgres(candidates, tokens, limit, per_entity):
+    from django.contrib.postgres.search import SearchHeadline, SearchRank
+
+    search_query = _postgres_query(tokens)
+    ranked = candidates.annotate(rank=SearchRank(F('search_vector'), search_query))
+    if per_entity:
+        ranked = _top_per_entity(ranked, limit, F('rank').desc(), F('title').asc())
+    ranked = ranked.order_by('-rank', 'title').values_list('id', 'rank')
+    ranks = dict(ranked if per_entity else ranked[:limit])
+    if not ranks:
+        return []
+
+    # ts_headline es caro: solo se calcula para los resultados que se devuelven
+    documents = SearchDocument.objects.filter(id__in=list(ranks)).annotate(
+        headline=SearchHeadline(
+            'body', search_query, config='spanish',
+            start_sel=HIGHLIGHT_START, stop_sel=HIGHLIGHT_STOP,
+            max_words=30, min_words=10, max_fragments=1,
+        ),
+    ).defer('body').in_bulk()
+    return [
+        SearchHit(documents[pk], rank, documents[pk].headline)
+        for pk, rank in ranks.items() if pk in documents
+    ]
+
+
+def _search_fts5(candidates, tokens, limit, per_entity):
+    candidates_sql, candidates_params = candidates.values('id').query.sql_with_params()
+    if per_entity:
+        selection, selection_params = 'WHERE position <= %s ORDER BY score, title', [limit]
+    else:
+        selection, selection_params = 'ORDER BY score, title LIMIT %s', [limit]
+
+    # Pesos de bm25 por columna: título, palabras clave, contenido. bm25
+    # devuelve valores negativos: cuanto menor, más relevante. Los documentos
+    # que solo coinciden por subcadena (sin fila en matches) van detrás.
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH matches AS (
+                SELECT rowid AS id, bm25({FTS_TABLE}, 10.0, 5.0, 1.0) AS score,
+                       snippet({FTS_TABLE}, -1, %s, %s, '…', 24) AS highlight
+                FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s
+            ),
+            ranked AS (
+                SELECT d.id, d.title, COALESCE(m.score, 0) AS score, COALESCE(m.highlight, '') AS highlight,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY d.entity ORDER BY COALESCE(m.score, 0), d.title
+                       ) AS position
+                FROM tickets_searchdocument d LEFT JOIN matches m ON m.id = d.id
+                WHERE d.id IN ({candidates_sql})
+            )
+            SELECT id, score, highlight FROM ranked {selection}
+            """,
+            [HIGHLIGHT_START, HIGHLIGHT_STOP, _fts_query(tokens), *candidates_params, *selection_params],
+        )
+        ranked = cursor.fetchall()
+
+    documents = SearchDocument.objects.defer('body').in_bulk([pk for pk, _, _ in ranked])
+    return [
+        SearchHit(documents[pk], -score, snippet or make_highlight(documents[pk].title, tokens))
+        for pk, score, snippet in ranked if pk in documents
+    ]
+
+
+def _search_substring(candidates, tokens, limit, per_entity):
+    ranked = candidates.annotate(rank=Value(0.0))
+    if per_entity:
+        ranked = _top_per_entity(ranked, limit, F('title').asc())
+    ranked = ranked.order_by('title')
+    if not per_entity:
+        ranked = ranked[:limit]
+    return [
+        SearchHit(document, 0.0, make_highlight(document.body or document.title, tokens))
+        for document in ranked
+    ]
+
+
+# ---------------------------------------------------------- búsqueda global
+
+class ResultCache:
+    """
+    LRU en memoria (por proceso) con caducidad para los resultados recientes.
+
+    Pensado para la búsqueda mientras se escribe, donde se repiten las mismas
+    consultas en pocos segundos. Se vacía cuando este proceso escribe en el
+    índice; los cambios hechos desde otros procesos se ven al caducar.
+    """
+
+    def __init__(self, maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+result_cache = ResultCache()
+
+
+def visible_documents(viewer, entities=None):
+    """Queryset de SearchDocument que puede ver ``viewer`` en los tipos indicados"""
+    condition = None
+    for name in entities or ENTITIES:
+        visibility = ENTITIES[name].visibility(viewer)
+        if visibility is None:
+            continue
+        entity_condition = Q(entity=name) & visibility
+        condition = entity_condition if condition is None else condition | entity_condition
+    if condition is None:
+        return SearchDocument.objects.none()
+    return SearchDocument.objects.filter(condition)
+
+
+def federated_search(user, query, entities=None, per_entity=5):
+    """
+    Búsqueda global: los ``per_entity`` mejores resultados de cada tipo que
+    puede ver ``user``, en una sola consulta al índice.
+
+    Devuelve ``(grupos, cacheado)``; cada grupo es un dict con ``entity``,
+    ``label`` y ``results`` (ya serializables a JSON, con el resaltado en HTML).
+    """
+    query = ' '.join((query or '').split())
+    entities = [name for name in (entities or ENTITIES) if name in ENTITIES]
+    if len(query) < MIN_QUERY_LENGTH or not entities:
+        return [], False
+
+    key = (user.pk, query.lower(), tuple(entities), per_entity)
+    groups = result_cache.get(key)
+    if groups is not None:
+        return groups, True
+
+    viewer = SearchViewer(user)
+    hits = search_documents(
+        query, limit=per_entity, documents=visible_documents(viewer, entities), per_entity=True,
+    )
+    by_entity = {}
+    for hit in hits:
+        by_entity.setdefault(hit.entity, []).append({
+            'id': hit.object_id,
+            'title': hit.title,
+            'url': hit.url,
+            'highlight': hit.highlight_html,
+            'rank': round(float(hit.rank or 0), 4),
+        })
+    groups = [
+        {'entity': name, 'label': ENTITIES[name].label, 'results': by_entity[name]}
+        for name in entities if name in by_entity
+    ]
+    result_cache.set(key, groups)
+    return groups, False
+
+
+def make_highlight(text, tokens, width=160):
+    """Fragmento de ``text`` alrededor del primer término, con los términos marcados"""
+    if not text:
+        return ''
+    pattern = re.compile('|'.join(re.escape(token) for token in tokens if token), re.IGNORECASE)
+    match = pattern.search(text)
+    start = max((match.start() if match else 0) - width // 3, 0)
+    fragment = text[start:start + width]
+    fragment = pattern.sub(lambda m: f'{HIGHLIGHT_START}{m.group(0)}{HIGHLIGHT_STOP}', fragment)
+    prefix = '…' if start else ''
+    suffix = '…' if start + width < len(text) else ''
+    return f'{prefix}{fragment}{suffix}'
+
+
+def highlight_html(text):
+    """Escapa el fragmento y convierte las marcas internas en <mark>"""
+    return (
+        escape(text or '')
+        .replace(HIGHLIGHT_START, '<mark>')
+        .replace(HIGHLIGHT_STOP, '</mark>')
+    )
@@ -0,0 +1,48 @@
+"""
+Búsqueda global: un único endpoint JSON para la paleta de comandos y el
+buscador de la cabecera, con los mejores resultados de cada tipo.
+"""
+import time
+
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from .search import ENTITIES, federated_search
+
+DEFAULT_RESULTS_PER_TYPE = 5
+MAX_RESULTS_PER_TYPE = 20
+
+
+@login_required
+@require_GET
+def global_search(request):
+    """
+    API de búsqueda global.
+
+    Parámetros: ``q`` (texto, se busca por prefijo mientras se escribe),
+    ``types`` (tipos separados por comas, por defecto todos) y ``limit``
+    (resultados por tipo, por defecto 5).
+    """
+    query = request.GET.get('q', '').strip()
+
+    types = [name.strip() for name in request.GET.get('types', '').split(',') if name.strip()]
+    unknown = [name for name in types if name not in ENTITIES]
+    if unknown:
+        return JsonResponse({'error': f'Tipos desconocidos: {", ".join(unknown)}'}, status=400)
+
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_RESULTS_PER_TYPE))
+    except ValueError:
+        limit = DEFAULT_RESULTS_PER_TYPE
+    limit = min(max(limit, 1), MAX_RESULTS_PER_TYPE)
+
+    start = time.monotonic()
+    groups, cached = federated_search(request.user, query, entities=types or None, per_entity=limit)
+
+    return JsonResponse({
+        'query': query,
+        'results': groups,
+        'cached': cached,
+        'elapsed_ms': round((time.monotonic() - start) * 1000, 1),
+    })
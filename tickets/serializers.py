@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from django.db import transaction
 from .models import Ticket, Category, Company, Project
 from django.contrib.auth.models import User
 
@@ -152,10 +153,23 @@ class TicketSerializer(serializers.ModelSerializer):
         return instance
 
 
+class TicketBulkCreateSerializer(serializers.ListSerializer):
+    """Alta de varios tickets en una petición; los números se reservan en bloque"""
+    
+    def create(self, validated_data):
+        tickets = [Ticket(**attrs) for attrs in validated_data]
+        with transaction.atomic():
+            Ticket.assign_ticket_numbers(tickets)
+            for ticket in tickets:
+                ticket.save()
+        return tickets
+
+
 class TicketCreateSerializer(serializers.ModelSerializer):
     """Serializer simplificado para crear tickets"""
     class Meta:
         model = Ticket
+        list_serializer_class = TicketBulkCreateSerializer
         fields = [
             'title', 'description', 'priority', 'ticket_type', 'hours',
             'category_id', 'company_id', 'project_id'
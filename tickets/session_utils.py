@@ -0,0 +1,146 @@
+"""
+Sesiones de los visitantes anónimos.
+
+Una página pública no debe leer ni crear la sesión si no la necesita: leerla
+cuesta una consulta (o una lectura de la caché con ``cached_db``) y crearla
+inserta una fila en ``django_session`` por visitante, también por cada
+visita de un bot sin cookies.
+
+- ``has_session``: indica si el visitante trae cookie de sesión, sin cargarla.
+- ``Cart``: carrito de compras compacto (``{id_producto: cantidad}``) que solo
+  se escribe en la sesión cuando cambia. Nombres y precios se leen de los
+  productos en una consulta al mostrarlo.
+- ``first_visit`` / ``remember_visit``: contadores de visitas "una vez por
+  visitante" con una cookie ligera en lugar de la sesión.
+"""
+from decimal import Decimal
+
+from django.conf import settings
+
+CART_SESSION_KEY = 'cart'
+
+VISITS_COOKIE = 'tp_seen'
+VISITS_COOKIE_MAX_KEYS = 50
+VISITS_COOKIE_MAX_AGE = 60 * 60 * 24 * 30
+
+
+def has_session(request):
+    """``True`` si el visitante trae cookie de sesión (no carga la sesión)"""
+    return settings.SESSION_COOKIE_NAME in request.COOKIES
+
+
+# ----------------------------------------------------------------- carrito
+
+class Cart:
+    """Carrito de compras guardado en la sesión como ``{'<id_producto>': cantidad}``"""
+
+    def __init__(self, request):
+        self.request = request
+        self._items = None
+
+    @property
+    def items(self):
+        if self._items is None:
+            if has_session(self.request):
+                stored = self.request.session.get(CART_SESSION_KEY) or {}
+            else:
+                stored = {}
+            # Formato anterior: {'<id>': {'name', 'price', 'quantity', 'currency'}}
+            self._items = {
+                key: value['quantity'] if isinstance(value, dict) else value
+                for key, value in stored.items()
+            }
+        return self._items
+
+    def _save(self, items):
+        if items != self.items:
+            self._items = items
+            if items:
+                self.request.session[CART_SESSION_KEY] = items
+            elif CART_SESSION_KEY in self.request.session:
+                del self.request.session[CART_SESSION_KEY]
+
+    def __bool__(self):
+        return bool(self.items)
+
+    def count(self):
+        """Unidades en el carrito"""
+        return sum(self.items.values())
+
+    def add(self, product_id, quantity=1):
+        items = dict(self.items)
+        key = str(product_id)
+        items[key] = items.get(key, 0) + quantity
+        self._save(items)
+
+    def remove(self, product_id):
+        items = dict(self.items)
+        items.pop(str(product_id), None)
+        self._save(items)
+
+    def update(self, quantities):
+        """Cambia las cantidades de ``{'<id>': cantidad}``; las cantidades 0 quitan el producto"""
+        items = dict(self.items)
+        for key, quantity in quantities.items():
+            if key not in items:
+                continue
+            if quantity > 0:
+                items[key] = quantity
+            else:
+                del items[key]
+        self._save(items)
+
+    def clear(self):
+        self._save({})
+
+    def lines(self):
+        """
+        Líneas del carrito con el producto, precio actual y subtotal. Los
+        productos que ya no están activos se omiten.
+        """
+        from .models import Product
+
+        products = Product.objects.filter(pk__in=[int(key) for key in self.items], is_active=True).in_bulk()
+        lines = []
+        for key, quantity in self.items.items():
+            product = products.get(int(key))
+            if product is None:
+                continue
+            lines.append({
+                'product': product,
+                'product_id': key,
+                'name': product.name,
+                'price': product.price,
+                'quantity': quantity,
+                'subtotal': product.price * quantity,
+            })
+        return lines
+
+    @staticmethod
+    def total(lines):
+        return sum((line['subtotal'] for line in lines), Decimal('0'))
+
+
+# ------------------------------------------------------ visitas únicas
+
+def _seen_keys(request):
+    value = request.COOKIES.get(VISITS_COOKIE, '')
+    return [key for key in value.split('.') if key]
+
+
+def first_visit(request, key):
+    """``True`` si el visitante no ha visto aún ``key`` (según su cookie de visitas)"""
+    return key not in _seen_keys(request)
+
+
+def remember_visit(request, response, key):
+    """Anota ``key`` en la cookie de visitas del visitante"""
+    keys = [seen for seen in _seen_keys(request) if seen != key] + [key]
+    response.set_cookie(
+        VISITS_COOKIE,
+        '.'.join(keys[-VISITS_COOKIE_MAX_KEYS:]),
+        max_age=VISITS_COOKIE_MAX_AGE,
+        samesite='Lax',
+        httponly=True,
+    )
+    return response
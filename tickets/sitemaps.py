@@ -81,9 +81,9 @@ class CourseSitemap(Sitemap):
     priority = 0.6
     
     def items(self):
-        # Solo cursos que tienen token público
+        # Solo cursos que tienen token público (UUID: no puede estar vacío)
         from .models import Course
-        return Course.objects.exclude(public_token__isnull=True).exclude(public_token='').order_by('-created_at')
+        return Course.objects.exclude(public_token__isnull=True).order_by('-created_at')
     
     def lastmod(self, obj):
         return obj.updated_at if obj.updated_at else obj.created_at
@@ -98,15 +98,15 @@ class DocumentSitemap(Sitemap):
     priority = 0.5
     
     def items(self):
-        # Solo documentos que tienen token público
+        # Solo documentos compartidos públicamente
         from .models import Document
-        return Document.objects.exclude(public_token__isnull=True).exclude(public_token='').order_by('-created_at')
+        return Document.objects.filter(is_public=True).order_by('-created_at')
     
     def lastmod(self, obj):
         return obj.updated_at if obj.updated_at else obj.created_at
     
     def location(self, obj):
-        return reverse('document_public', kwargs={'token': obj.public_token})
+        return reverse('document_public', kwargs={'token': obj.public_share_token})
 
 
 # Diccionario de todos los sitemaps
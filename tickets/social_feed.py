@@ -0,0 +1,133 @@
+"""
+Consultas del feed de la red social interna.
+
+``feed_posts`` construye el queryset del feed (visibilidad, favoritos,
+"me encantan" y búsqueda) con lo que pinta la plantilla ya resuelto: los
+contadores de reacciones y la reacción del usuario como subconsultas, y los
+comentarios activos con su autor y sus contadores en un único ``Prefetch``.
+Una página cuesta siempre el mismo número de consultas, tenga las
+reacciones y comentarios que tenga.
+
+``feed_page`` pagina por clave (``created_at``, ``id``) en lugar de OFFSET:
+el scroll infinito pide la página siguiente con el cursor de la última
+publicación recibida, y una página profunda cuesta lo mismo que la primera.
+"""
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.dateparse import parse_datetime
+
+from .models import SocialPost, SocialPostComment, SocialPostFavorite, SocialPostLike
+
+PAGE_SIZE = 10
+
+
+def _reaction_count(reaction_type):
+    """Subconsulta con el número de reacciones ``reaction_type`` de la publicación"""
+    reactions = (
+        SocialPostLike.objects.filter(post=OuterRef('pk'), reaction_type=reaction_type)
+        .order_by().values('post').annotate(total=Count('pk')).values('total')
+    )
+    return Coalesce(Subquery(reactions, output_field=IntegerField()), Value(0))
+
+
+def _comment_reaction_count(reaction_type):
+    return Count('comment_reactions', filter=Q(comment_reactions__reaction_type=reaction_type))
+
+
+def feed_posts(user, is_agent, search_query='', show_favorites=False, show_loved=False):
+    """
+    Publicaciones visibles para ``user`` en el feed, de la más reciente a la
+    más antigua. Cada publicación trae ``likes_count``, ``loves_count``,
+    ``dislikes_count``, ``user_reaction`` (la reacción del usuario o
+    ``None``) y ``active_comments`` (con ``likes_count``, ``loves_count`` y
+    ``dislikes_count`` en cada comentario).
+    """
+    posts = SocialPost.objects.filter(is_active=True)
+
+    if show_favorites:
+        posts = posts.filter(id__in=SocialPostFavorite.objects.filter(user=user).values('post_id'))
+    if show_loved:
+        posts = posts.filter(
+            id__in=SocialPostLike.objects.filter(user=user, reaction_type='love').values('post_id')
+        )
+
+    # Filtros de privacidad y empresa
+    posts = posts.filter(Q(is_private=False) | Q(user=user))
+    if not is_agent:
+        user_company = user.profile.company if hasattr(user, 'profile') else None
+        if user_company:
+            posts = posts.filter(Q(company_only=False) | Q(user__profile__company=user_company))
+        else:
+            # Si el usuario no tiene empresa, solo ve publicaciones no restringidas por empresa
+            posts = posts.filter(company_only=False)
+
+    if search_query:
+        posts = posts.filter(
+            Q(content__icontains=search_query) |
+            Q(user__username__icontains=search_query) |
+            Q(user__first_name__icontains=search_query) |
+            Q(user__last_name__icontains=search_query)
+        )
+
+    comments = (
+        SocialPostComment.objects.filter(is_active=True)
+        .select_related('user')
+        .annotate(
+            likes_count=_comment_reaction_count('like'),
+            loves_count=_comment_reaction_count('love'),
+            dislikes_count=_comment_reaction_count('dislike'),
+        )
+        .order_by('created_at', 'id')
+    )
+    own_reaction = SocialPostLike.objects.filter(post=OuterRef('pk'), user=user).values('reaction_type')[:1]
+
+    return (
+        posts.select_related('user', 'user__profile', 'user__profile__company')
+        .annotate(
+            likes_count=_reaction_count('like'),
+            loves_count=_reaction_count('love'),
+            dislikes_count=_reaction_count('dislike'),
+            user_reaction=Subquery(own_reaction),
+        )
+        .prefetch_related(Prefetch('comments', queryset=comments, to_attr='active_comments'))
+        .order_by('-created_at', '-id')
+    )
+
+
+def encode_cursor(post):
+    return f'{post.created_at.isoformat()}_{post.pk}'
+
+
+def decode_cursor(value):
+    """``(created_at, id)`` del cursor, o ``None`` si no es válido"""
+    created_at, _, pk = (value or '').rpartition('_')
+    try:
+        created_at = parse_datetime(created_at)
+        pk = int(pk)
+    except ValueError:
+        return None
+    return (created_at, pk) if created_at else None
+
+
+def feed_page(posts, cursor=None, size=PAGE_SIZE):
+    """
+    ``(publicaciones, cursor_siguiente)``: la página de ``posts`` que sigue
+    a ``cursor`` (la primera si no hay cursor). ``cursor_siguiente`` es
+    ``None`` en la última página.
+    """
+    position = decode_cursor(cursor) if cursor else None
+    if position:
+        created_at, pk = position
+        posts = posts.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+    page = list(posts[:size + 1])
+    if len(page) > size:
+        return page[:size], encode_cursor(page[size - 1])
+    return page, None
+
+
+def favorite_post_ids(user, posts):
+    """Ids de las publicaciones de la página que el usuario tiene en favoritos"""
+    return set(
+        SocialPostFavorite.objects.filter(user=user, post_id__in=[post.pk for post in posts])
+        .values_list('post_id', flat=True)
+    )
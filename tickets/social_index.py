@@ -0,0 +1,303 @@
+"""
+Índice de hashtags y menciones de la red social interna.
+
+Al guardar una ``SocialPost`` se extraen sus hashtags (``#tag``) y menciones
+(``@usuario``) a las tablas ``SocialHashtag`` y ``SocialMention``, y se
+actualizan los contadores ``SocialTagCounter`` de su ámbito de visibilidad:
+
+- ``public``: publicaciones no privadas y no restringidas a la empresa;
+- ``company:<id>``: solo para la empresa del autor (``company:0`` si el autor
+  no tiene empresa: solo la ven los agentes);
+- ``user:<id>``: publicaciones privadas, solo para su autor.
+
+Los hashtags populares y las menciones son una consulta ``GROUP BY`` sobre los
+contadores de los ámbitos que ve el usuario, sin recorrer las publicaciones.
+Las publicaciones inactivas (eliminadas) no cuentan.
+
+Para (re)construir el índice: ``python manage.py rebuild_social_index``.
+"""
+import logging
+import re
+from collections import Counter
+
+from django.contrib.auth.models import User
+from django.db import DatabaseError, transaction
+from django.db.models import F, Q, Sum
+from django.db.models.functions import Lower
+
+from .models import SocialHashtag, SocialMention, SocialPost, SocialTagCounter, UserProfile
+
+logger = logging.getLogger(__name__)
+
+HASHTAG_RE = re.compile(r'#(\w+)')
+MENTION_RE = re.compile(r'@(\w+)')
+
+TAG_MAX_LENGTH = SocialHashtag._meta.get_field('tag').max_length
+
+PUBLIC_SCOPE = 'public'
+
+# Campos de SocialPost que cambian los hashtags, las menciones o su ámbito
+INDEXED_FIELDS = {'content', 'is_active', 'is_private', 'company_only', 'user'}
+
+# Hashtags y menciones que se devuelven en el panel lateral del feed
+TOP_LIMIT = 15
+
+
+# ------------------------------------------------------------------ ámbitos
+
+def post_scope(post, company_id):
+    """Ámbito de visibilidad de la publicación (``None`` si está inactiva)"""
+    if not post.is_active:
+        return None
+    if post.is_private:
+        return f'user:{post.user_id}'
+    if post.company_only:
+        return f'company:{company_id or 0}'
+    return PUBLIC_SCOPE
+
+
+def _author_company_id(user_id):
+    return UserProfile.objects.filter(user_id=user_id).values_list('company_id', flat=True).first()
+
+
+def visible_scopes(user, is_agent):
+    """Condición sobre ``scope`` con los ámbitos que ve ``user``, igual que el feed"""
+    condition = Q(scope=PUBLIC_SCOPE) | Q(scope=f'user:{user.pk}')
+    if is_agent:
+        return condition | Q(scope__startswith='company:')
+    company_id = getattr(getattr(user, 'profile', None), 'company_id', None)
+    if company_id:
+        condition |= Q(scope=f'company:{company_id}')
+    return condition
+
+
+# --------------------------------------------------------------- extracción
+
+def extract_hashtags(content):
+    """``Counter`` de hashtags en minúsculas del texto"""
+    return Counter(tag.lower()[:TAG_MAX_LENGTH] for tag in HASHTAG_RE.findall(content or ''))
+
+
+def extract_mentions(content):
+    """``Counter`` de nombres de usuario mencionados (en minúsculas) del texto"""
+    return Counter(name.lower() for name in MENTION_RE.findall(content or ''))
+
+
+def resolve_usernames(usernames):
+    """``{username_en_minúsculas: user_id}`` de los usuarios existentes, en una consulta"""
+    if not usernames:
+        return {}
+    return dict(
+        User.objects.annotate(username_lower=Lower('username'))
+        .filter(username_lower__in=set(usernames))
+        .values_list('username_lower', 'pk')
+    )
+
+
+def _post_rows(post, scope, user_ids):
+    """Filas de hashtags y menciones de la publicación"""
+    if scope is None:
+        return [], []
+    hashtags = [
+        SocialHashtag(post=post, tag=tag, occurrences=count, scope=scope)
+        for tag, count in extract_hashtags(post.content).items()
+    ]
+    mentions = [
+        SocialMention(post=post, user_id=user_ids[name], occurrences=count, scope=scope)
+        for name, count in extract_mentions(post.content).items()
+        if name in user_ids
+    ]
+    return hashtags, mentions
+
+
+# ------------------------------------------------------------- contadores
+
+def _counter_deltas(deltas, hashtags, mentions, sign):
+    for row in hashtags:
+        deltas[('hashtag', row.scope, row.tag)] += sign * row.occurrences
+    for row in mentions:
+        deltas[('mention', row.scope, str(row.user_id))] += sign * row.occurrences
+
+
+def _apply_deltas(deltas):
+    """Suma los cambios a los contadores y borra los que quedan a cero"""
+    emptied = []
+    for (kind, scope, key), delta in deltas.items():
+        if not delta:
+            continue
+        counters = SocialTagCounter.objects.filter(kind=kind, scope=scope, key=key)
+        if not counters.update(count=F('count') + delta) and delta > 0:
+            SocialTagCounter.objects.get_or_create(kind=kind, scope=scope, key=key)
+            counters.update(count=F('count') + delta)
+        if delta < 0:
+            emptied.append(Q(kind=kind, scope=scope, key=key))
+    if emptied:
+        condition = emptied.pop()
+        for other in emptied:
+            condition |= other
+        SocialTagCounter.objects.filter(condition, count__lte=0).delete()
+
+
+# --------------------------------------------------------------- indexado
+
+def index_post(post):
+    """Reemplaza los hashtags y menciones de la publicación y ajusta los contadores"""
+    scope = post_scope(post, _author_company_id(post.user_id))
+    user_ids = resolve_usernames(extract_mentions(post.content)) if scope else {}
+    hashtags, mentions = _post_rows(post, scope, user_ids)
+
+    old_hashtags = list(SocialHashtag.objects.filter(post=post))
+    old_mentions = list(SocialMention.objects.filter(post=post))
+    deltas = Counter()
+    _counter_deltas(deltas, old_hashtags, old_mentions, -1)
+    _counter_deltas(deltas, hashtags, mentions, 1)
+    if not any(deltas.values()):
+        # Mismos hashtags y menciones en el mismo ámbito
+        return
+
+    if old_hashtags:
+        SocialHashtag.objects.filter(post=post).delete()
+    if old_mentions:
+        SocialMention.objects.filter(post=post).delete()
+    SocialHashtag.objects.bulk_create(hashtags)
+    SocialMention.objects.bulk_create(mentions)
+    _apply_deltas(deltas)
+
+
+def remove_post(post):
+    """Quita la publicación del índice y descuenta sus hashtags y menciones"""
+    hashtags = list(SocialHashtag.objects.filter(post=post))
+    mentions = list(SocialMention.objects.filter(post=post))
+    deltas = Counter()
+    _counter_deltas(deltas, hashtags, mentions, -1)
+    SocialHashtag.objects.filter(post=post).delete()
+    SocialMention.objects.filter(post=post).delete()
+    _apply_deltas(deltas)
+
+
+def index_posts(posts):
+    """
+    Indexa un lote de publicaciones sin tocar los contadores (reconstrucción
+    completa: después se llama a ``rebuild_counters``). Resuelve todas las
+    menciones del lote en una consulta. Devuelve las filas creadas.
+    """
+    posts = list(posts)
+    company_ids = dict(
+        UserProfile.objects.filter(user_id__in={post.user_id for post in posts})
+        .values_list('user_id', 'company_id')
+    )
+    usernames = set()
+    for post in posts:
+        if post.is_active:
+            usernames.update(extract_mentions(post.content))
+    user_ids = resolve_usernames(usernames)
+
+    hashtags, mentions = [], []
+    for post in posts:
+        post_hashtags, post_mentions = _post_rows(post, post_scope(post, company_ids.get(post.user_id)), user_ids)
+        hashtags += post_hashtags
+        mentions += post_mentions
+    SocialHashtag.objects.bulk_create(hashtags)
+    SocialMention.objects.bulk_create(mentions)
+    return len(hashtags) + len(mentions)
+
+
+def rebuild_counters():
+    """Recalcula todos los contadores a partir de las tablas de hashtags y menciones"""
+    SocialTagCounter.objects.all().delete()
+    counters = [
+        SocialTagCounter(kind='hashtag', scope=row['scope'], key=row['tag'], count=row['total'])
+        for row in SocialHashtag.objects.values('scope', 'tag').annotate(total=Sum('occurrences'))
+    ]
+    counters += [
+        SocialTagCounter(kind='mention', scope=row['scope'], key=str(row['user_id']), count=row['total'])
+        for row in SocialMention.objects.values('scope', 'user_id').annotate(total=Sum('occurrences'))
+    ]
+    SocialTagCounter.objects.bulk_create(counters, batch_size=1000)
+    return len(counters)
+
+
+def sync_author_company(user_id, company_id):
+    """
+    Reindexa las publicaciones "solo mi empresa" del autor si su ámbito ya no
+    coincide con su empresa (el usuario ha cambiado de empresa).
+    """
+    expected = f'company:{company_id or 0}'
+    stale = Q(post__user_id=user_id, scope__startswith='company:') & ~Q(scope=expected)
+    post_ids = set(SocialHashtag.objects.filter(stale).values_list('post_id', flat=True))
+    post_ids.update(SocialMention.objects.filter(stale).values_list('post_id', flat=True))
+    for post in SocialPost.objects.filter(pk__in=post_ids):
+        index_post(post)
+
+
+# ---------------------------------------------------------------- señales
+
+def handle_save(instance, update_fields=None, raw=False):
+    """
+    Receptor de ``post_save`` de ``SocialPost``. Un fallo del índice no debe
+    impedir guardar la publicación, por eso se aísla en un savepoint y solo
+    se registra el error.
+    """
+    if raw or (update_fields is not None and not INDEXED_FIELDS.intersection(update_fields)):
+        return
+    try:
+        with transaction.atomic():
+            index_post(instance)
+    except DatabaseError as e:
+        logger.error(f'Error al indexar los hashtags de la publicación {instance.pk}: {e}')
+
+
+def handle_delete(instance):
+    """Receptor de ``pre_delete`` de ``SocialPost`` (antes de que se borren sus filas en cascada)"""
+    try:
+        with transaction.atomic():
+            remove_post(instance)
+    except DatabaseError as e:
+        logger.error(f'Error al quitar la publicación {instance.pk} del índice de hashtags: {e}')
+
+
+def handle_profile_save(instance, update_fields=None, raw=False):
+    """Receptor de ``post_save`` de ``UserProfile``: mantiene el ámbito de empresa"""
+    if raw or (update_fields is not None and 'company' not in update_fields):
+        return
+    try:
+        with transaction.atomic():
+            sync_author_company(instance.user_id, instance.company_id)
+    except DatabaseError as e:
+        logger.error(f'Error al actualizar el ámbito de las publicaciones del usuario {instance.user_id}: {e}')
+
+
+# ---------------------------------------------------------------- consultas
+
+def top_hashtags(user, is_agent, limit=TOP_LIMIT):
+    """``[{'tag', 'count'}]`` con los hashtags más usados en lo que ve el usuario"""
+    rows = (
+        SocialTagCounter.objects.filter(visible_scopes(user, is_agent), kind='hashtag')
+        .values('key').annotate(total=Sum('count'))
+        .order_by('-total', 'key')[:limit]
+    )
+    return [{'tag': row['key'], 'count': row['total']} for row in rows]
+
+
+def top_mentions(user, is_agent, limit=TOP_LIMIT):
+    """
+    ``(menciones, mis_menciones)``: los usuarios más mencionados en lo que ve
+    el usuario (``[{'username', 'full_name', 'count'}]``, con los usuarios
+    cargados en una consulta) y cuántas veces le mencionan a él.
+    """
+    counters = SocialTagCounter.objects.filter(visible_scopes(user, is_agent), kind='mention')
+    rows = list(
+        counters.values('key').annotate(total=Sum('count')).order_by('-total', 'key')[:limit]
+    )
+    users = User.objects.in_bulk([int(row['key']) for row in rows])
+    mentions = []
+    for row in rows:
+        mentioned = users.get(int(row['key']))
+        if mentioned:
+            mentions.append({
+                'username': mentioned.username,
+                'full_name': mentioned.get_full_name() or mentioned.username,
+                'count': row['total'],
+            })
+    my_count = counters.filter(key=str(user.pk)).aggregate(total=Sum('count'))['total'] or 0
+    return mentions, my_count
@@ -0,0 +1,857 @@
+"""
+Vistas de la red social interna.
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+from django.http import JsonResponse
+from .models import Exam, ExamAttempt, ExamAnswer
+
+
+# =============================================================================
+# VISTAS DE EXÁMENES
+# =============================================================================
+
+@login_required
+def exam_list(request):
+    """Lista de exámenes"""
+    exams = Exam.objects.all().order_by('-created_at')
+    
+    # Agregar información del último intento del usuario para cada examen
+    for exam in exams:
+        exam.user_last_attempt = exam.attempts.filter(
+            user=request.user
+        ).order_by('-completed_at').first()
+    
+    context = {
+        'exams': exams
+    }
+    return render(request, 'tickets/exam_list.html', context)
+
+
+@login_required
+def exam_create(request):
+    """Crear nuevo examen (agentes y profesores)"""
+    from .utils import can_manage_courses
+    
+    if not can_manage_courses(request.user):
+        messages.error(request, 'No tienes permisos para crear exámenes')
+        return redirect('exam_list')
+    
+    if request.method == 'POST':
+        title = request.POST.get('title')
+        description = request.POST.get('description', '')
+        passing_score = request.POST.get('passing_score', 70)
+        time_limit = request.POST.get('time_limit') or None
+        is_public = request.POST.get('is_public') == 'on'
+        
+        exam = Exam.objects.create(
+            title=title,
+            description=description,
+            passing_score=int(passing_score),
+            time_limit=int(time_limit) if time_limit else None,
+            is_public=is_public,
+            created_by=request.user
+        )
+        
+        messages.success(request, f'Examen "{exam.title}" creado exitosamente')
+        return redirect('exam_detail', pk=exam.pk)
+    
+    return render(request, 'tickets/exam_form.html')
+
+
+@login_required
+def exam_detail(request, pk):
+    """Detalle del examen"""
+    from .utils import is_agent
+    
+    exam = get_object_or_404(Exam, pk=pk)
+    questions = exam.questions.all().order_by('order')
+    
+    # Filtrar intentos según el tipo de usuario
+    if is_agent(request.user) or exam.created_by == request.user:
+        # Agentes y creadores ven todos los intentos
+        attempts = exam.attempts.all().order_by('-completed_at')[:10]
+    else:
+        # Usuarios normales solo ven sus propios intentos
+        attempts = exam.attempts.filter(user=request.user).order_by('-completed_at')[:5]
+    
+    # Obtener el último intento del usuario actual
+    user_last_attempt = None
+    if request.user.is_authenticated:
+        user_last_attempt = exam.attempts.filter(
+            user=request.user
+        ).order_by('-completed_at').first()
+    
+    context = {
+        'exam': exam,
+        'questions': questions,
+        'attempts': attempts,
+        'user_last_attempt': user_last_attempt,
+        'can_edit': is_agent(request.user) or exam.created_by == request.user
+    }
+    return render(request, 'tickets/exam_detail.html', context)
+
+
+@login_required
+def exam_edit(request, pk):
+    """Editar examen"""
+    from .utils import can_manage_courses
+    
+    exam = get_object_or_404(Exam, pk=pk)
+    
+    if not (can_manage_courses(request.user) or exam.created_by == request.user):
+        messages.error(request, 'No tienes permisos para editar este examen')
+        return redirect('exam_detail', pk=exam.pk)
+    
+    if request.method == 'POST':
+        exam.title = request.POST.get('title')
+        exam.description = request.POST.get('description', '')
+        exam.passing_score = int(request.POST.get('passing_score', 70))
+        exam.time_limit = int(request.POST.get('time_limit')) if request.POST.get('time_limit') else None
+        exam.is_public = request.POST.get('is_public') == 'on'
+        exam.save()
+        
+        messages.success(request, 'Examen actualizado exitosamente')
+        return redirect('exam_detail', pk=exam.pk)
+    
+    context = {'exam': exam}
+    return render(request, 'tickets/exam_form.html', context)
+
+
+@login_required
+def exam_delete(request, pk):
+    """Eliminar examen"""
+    from .utils import can_manage_courses
+    
+    exam = get_object_or_404(Exam, pk=pk)
+    
+    if not (can_manage_courses(request.user) or exam.created_by == request.user):
+        messages.error(request, 'No tienes permisos para eliminar este examen')
+        return redirect('exam_detail', pk=exam.pk)
+    
+    if request.method == 'POST':
+        exam_title = exam.title
+        exam.delete()
+        messages.success(request, f'Examen "{exam_title}" eliminado exitosamente')
+        return redirect('exam_list')
+    
+    context = {'exam': exam}
+    return render(request, 'tickets/exam_delete.html', context)
+
+
+@login_required
+def exam_take_authenticated(request, pk):
+    """Tomar examen autenticado"""
+    exam = get_object_or_404(Exam, pk=pk)
+    questions = exam.questions.all().order_by('order')
+    
+    if request.method == 'POST':
+        # Procesar respuestas
+        from django.utils import timezone
+        
+        started_at = timezone.now() - timezone.timedelta(
+            seconds=int(request.POST.get('time_taken', 0))
+        )
+        completed_at = timezone.now()
+        time_taken = int(request.POST.get('time_taken', 0))
+        
+        # Crear intento de examen
+        attempt = ExamAttempt.objects.create(
+            exam=exam,
+            user=request.user,
+            participant_name=f"{request.user.first_name} {request.user.last_name}".strip() or request.user.username,
+            participant_email=request.user.email,
+            total_questions=questions.count(),
+            started_at=started_at,
+            completed_at=completed_at,
+            time_taken=time_taken,
+            score=0,
+            correct_answers=0
+        )
+        
+        # Procesar respuestas
+        correct_count = 0
+        for question in questions:
+            selected_option = request.POST.get(f'question_{question.id}')
+            if selected_option:
+                is_correct = selected_option == question.correct_option
+                if is_correct:
+                    correct_count += 1
+                
+                ExamAnswer.objects.create(
+                    attempt=attempt,
+                    question=question,
+                    selected_option=selected_option,
+                    is_correct=is_correct
+                )
+        
+        # Calcular puntuación
+        score = (correct_count / questions.count()) * 100 if questions.count() > 0 else 0
+        attempt.correct_answers = correct_count
+        attempt.score = score
+        attempt.passed = score >= exam.passing_score
+        attempt.save()
+        
+        return redirect('exam_results', attempt_id=attempt.id)
+    
+    context = {
+        'exam': exam,
+        'questions': questions
+    }
+    return render(request, 'tickets/exam_take.html', context)
+
+
+@login_required
+def exam_attempts_list(request):
+    """Listado de todos los intentos de exámenes (solo para agentes)"""
+    from .utils import is_agent
+    
+    if not is_agent(request.user):
+        messages.error(request, 'No tienes permisos para acceder a esta sección')
+        return redirect('dashboard')
+    
+    # Obtener parámetros de filtrado
+    exam_filter = request.GET.get('exam', '')
+    status_filter = request.GET.get('status', '')
+    date_from = request.GET.get('date_from', '')
+    date_to = request.GET.get('date_to', '')
+    search = request.GET.get('search', '')
+    
+    # Filtrar intentos
+    attempts = ExamAttempt.objects.select_related('exam', 'user').filter(
+        completed_at__isnull=False
+    ).order_by('-completed_at')
+    
+    # Aplicar filtros
+    if exam_filter:
+        attempts = attempts.filter(exam_id=exam_filter)
+    
+    if status_filter == 'passed':
+        attempts = attempts.filter(passed=True)
+    elif status_filter == 'failed':
+        attempts = attempts.filter(passed=False)
+    
+    if date_from:
+        try:
+            from datetime import datetime
+            date_from_obj = datetime.strptime(date_from, '%Y-%m-%d')
+            attempts = attempts.filter(completed_at__date__gte=date_from_obj.date())
+        except ValueError:
+            pass
+    
+    if date_to:
+        try:
+            from datetime import datetime
+            date_to_obj = datetime.strptime(date_to, '%Y-%m-%d')
+            attempts = attempts.filter(completed_at__date__lte=date_to_obj.date())
+        except ValueError:
+            pass
+    
+    if search:
+        from django.db.models import Q
+        attempts = attempts.filter(
+            Q(participant_name__icontains=search) |
+            Q(participant_email__icontains=search) |
+            Q(exam__title__icontains=search)
+        )
+    
+    # Paginación
+    from django.core.paginator import Paginator
+    paginator = Paginator(attempts, 25)  # 25 intentos por página
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    # Obtener lista de exámenes para el filtro
+    exams = Exam.objects.all().order_by('title')
+    
+    # Estadísticas generales
+    total_attempts = attempts.count()
+    passed_attempts = attempts.filter(passed=True).count()
+    failed_attempts = attempts.filter(passed=False).count()
+    pass_rate = (passed_attempts / total_attempts * 100) if total_attempts > 0 else 0
+    
+    context = {
+        'page_obj': page_obj,
+        'attempts': page_obj,
+        'exams': exams,
+        'current_filters': {
+            'exam': exam_filter,
+            'status': status_filter,
+            'date_from': date_from,
+            'date_to': date_to,
+            'search': search,
+        },
+        'stats': {
+            'total_attempts': total_attempts,
+            'passed_attempts': passed_attempts,
+            'failed_attempts': failed_attempts,
+            'pass_rate': pass_rate,
+        }
+    }
+    
+    return render(request, 'tickets/exam_attempts_list.html', context)
+
+
+# ============================================================================
+# VISTAS DE RED SOCIAL INTERNA
+# ============================================================================
+
+@login_required
+def social_feed(request):
+    """Vista principal del feed social"""
+    from .social_feed import favorite_post_ids, feed_page, feed_posts
+    
+    # Verificar si el usuario es agente
+    is_agent = request.user.groups.filter(name='Agentes').exists()
+    
+    # Parámetros de búsqueda, favoritos y "me encantan"
+    search_query = request.GET.get('q', '').strip()
+    show_favorites = request.GET.get('favorites') == '1'
+    show_loved = request.GET.get('loved') == '1'
+    
+    posts = feed_posts(request.user, is_agent, search_query, show_favorites, show_loved)
+    page, next_cursor = feed_page(posts)
+    
+    context = {
+        'posts': page,
+        'search_query': search_query,
+        'is_agent': is_agent,
+        'user_favorites': favorite_post_ids(request.user, page),
+        'show_favorites': show_favorites,
+        'show_loved': show_loved,
+        'has_next': next_cursor is not None,
+        'next_cursor': next_cursor,
+    }
+    
+    return render(request, 'tickets/social_feed.html', context)
+
+
+@login_required
+def social_feed_load_more(request):
+    """Endpoint AJAX para cargar más posts con scroll infinito"""
+    from django.http import JsonResponse
+    from django.template.loader import render_to_string
+    from .social_feed import favorite_post_ids, feed_page, feed_posts
+    
+    # Verificar si el usuario es agente
+    is_agent = request.user.groups.filter(name='Agentes').exists()
+    
+    # Parámetros de filtro
+    search_query = request.GET.get('q', '').strip()
+    show_favorites = request.GET.get('favorites') == '1'
+    show_loved = request.GET.get('loved') == '1'
+    
+    # Página siguiente a la última publicación recibida
+    posts = feed_posts(request.user, is_agent, search_query, show_favorites, show_loved)
+    page, next_cursor = feed_page(posts, request.GET.get('cursor'))
+    
+    # Renderizar HTML de los posts
+    html = render_to_string('tickets/social_post_items.html', {
+        'posts': page,
+        'is_agent': is_agent,
+        'user_favorites': favorite_post_ids(request.user, page),
+        'user': request.user
+    })
+    
+    return JsonResponse({
+        'html': html,
+        'has_next': next_cursor is not None,
+        'next_cursor': next_cursor
+    })
+
+
+@login_required
+def social_get_hashtags(request):
+    """Obtener hashtags populares de las publicaciones"""
+    from django.http import JsonResponse
+    from .social_index import top_hashtags
+    
+    # Verificar si el usuario es agente
+    is_agent = request.user.groups.filter(name='Agentes').exists()
+    
+    # Top 15 de los contadores de los ámbitos que ve el usuario
+    return JsonResponse({
+        'hashtags': top_hashtags(request.user, is_agent)
+    })
+
+
+@login_required
+def social_get_mentions(request):
+    """Obtener usuarios mencionados en las publicaciones"""
+    from django.http import JsonResponse
+    from .social_index import top_mentions
+    
+    # Verificar si el usuario es agente
+    is_agent = request.user.groups.filter(name='Agentes').exists()
+    
+    # Top 15 de usuarios mencionados y menciones del usuario actual
+    mentioned_users, current_user_mentions = top_mentions(request.user, is_agent)
+    
+    return JsonResponse({
+        'mentions': mentioned_users,
+        'my_mentions_count': current_user_mentions
+    })
+
+@login_required
+def social_search_users(request):
+    """Buscar usuarios para autocompletado de menciones"""
+    from django.http import JsonResponse
+    from django.contrib.auth.models import User
+    from django.db.models import Q
+    
+    query = request.GET.get('q', '').strip()
+    
+    if not query or len(query) < 2:
+        return JsonResponse({'users': []})
+    
+    # Buscar usuarios por username, first_name o last_name
+    users = User.objects.filter(
+        Q(username__icontains=query) |
+        Q(first_name__icontains=query) |
+        Q(last_name__icontains=query)
+    ).values('id', 'username', 'first_name', 'last_name')[:10]
+    
+    users_list = [
+        {
+            'id': user['id'],
+            'username': user['username'],
+            'full_name': f"{user['first_name']} {user['last_name']}".strip() or user['username']
+        }
+        for user in users
+    ]
+    
+    return JsonResponse({'users': users_list})
+
+
+@login_required
+def social_post_create(request):
+    """Crear nueva publicación"""
+    from .models import SocialPost
+    
+    if request.method == 'POST':
+        content = request.POST.get('content', '').strip()
+        image = request.FILES.get('image')
+        youtube_url = request.POST.get('youtube_url', '').strip()
+        is_private = request.POST.get('is_private') == 'true'
+        company_only = request.POST.get('company_only', 'true') == 'true'
+        
+        if not content and not image and not youtube_url:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Debes escribir algo, subir una imagen o agregar un video'
+            }, status=400)
+        
+        post = SocialPost.objects.create(
+            user=request.user,
+            content=content,
+            image=image,
+            youtube_url=youtube_url if youtube_url else None,
+            is_private=is_private,
+            company_only=company_only
+        )
+        
+        return JsonResponse({
+            'status': 'success',
+            'message': 'Publicación creada exitosamente',
+            'post_id': post.id
+        })
+    
+    return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+
+
+@login_required
+def social_post_delete(request, post_id):
+    """Eliminar publicación (autor o agentes)"""
+    from .models import SocialPost
+    
+    if request.method == 'POST':
+        # Verificar si el usuario es agente
+        is_agent = request.user.groups.filter(name='Agentes').exists()
+        
+        # Obtener post - si es agente puede eliminar cualquiera, si no, solo el propio
+        if is_agent:
+            post = get_object_or_404(SocialPost, id=post_id)
+        else:
+            post = get_object_or_404(SocialPost, id=post_id, user=request.user)
+        
+        post.is_active = False
+        post.save()
+        
+        return JsonResponse({
+            'status': 'success',
+            'message': 'Publicación eliminada'
+        })
+    
+    return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+
+
+@login_required
+def social_post_get_data(request, post_id):
+    """Obtener datos de una publicación para editar"""
+    from .models import SocialPost
+    
+    if request.method == 'GET':
+        # Verificar si el usuario es agente
+        is_agent = request.user.groups.filter(name='Agentes').exists()
+        
+        # Obtener post - si es agente puede ver cualquiera, si no, solo el propio
+        if is_agent:
+            post = get_object_or_404(SocialPost, id=post_id, is_active=True)
+        else:
+            post = get_object_or_404(SocialPost, id=post_id, user=request.user, is_active=True)
+        
+        return JsonResponse({
+            'status': 'success',
+            'post': {
+                'id': post.id,
+                'content': post.content,
+                'youtube_url': post.youtube_url or '',
+                'is_private': post.is_private,
+                'company_only': post.company_only,
+                'image_url': post.image.url if post.image else None
+            }
+        })
+    
+    return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+
+
+@login_required
+def social_post_edit(request, post_id):
+    """Editar publicación (autor o agentes)"""
+    from .models import SocialPost
+    
+    if request.method == 'POST':
+        # Verificar si el usuario es agente
+        is_agent = request.user.groups.filter(name='Agentes').exists()
+        
+        # Obtener post - si es agente puede editar cualquiera, si no, solo el propio
+        if is_agent:
+            post = get_object_or_404(SocialPost, id=post_id, is_active=True)
+        else:
+            post = get_object_or_404(SocialPost, id=post_id, user=request.user, is_active=True)
+        
+        # Actualizar campos
+        content = request.POST.get('content', '').strip()
+        youtube_url = request.POST.get('youtube_url', '').strip()
+        is_private = request.POST.get('is_private') == 'true'
+        company_only = request.POST.get('company_only', 'true') == 'true'
+        
+        # Si se sube nueva imagen
+        if 'image' in request.FILES:
+            post.image = request.FILES['image']
+        
+        # Validar que hay contenido
+        if not content and not post.image and not youtube_url:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'La publicación debe tener al menos contenido, imagen o video'
+            }, status=400)
+        
+        post.content = content
+        post.youtube_url = youtube_url if youtube_url else None
+        post.is_private = is_private
+        post.company_only = company_only
+        post.save()
+        
+        return JsonResponse({
+            'status': 'success',
+            'message': 'Publicación actualizada exitosamente',
+            'content': post.content,
+            'youtube_url': post.youtube_url or '',
+            'youtube_embed': post.get_youtube_embed_url() if post.youtube_url else '',
+            'is_private': post.is_private,
+            'company_only': post.company_only,
+            'has_image': bool(post.image)
+        })
+    
+    return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+
+
+@login_required
+def social_post_like(request, post_id):
+    """Dar o cambiar reacción a una publicación"""
+    from .models import SocialPost, SocialPostLike
+    
+    if request.method == 'POST':
+        post = get_object_or_404(SocialPost, id=post_id, is_active=True)
+        reaction_type = request.POST.get('reaction_type', 'like')
+        
+        # Validar tipo de reacción
+        if reaction_type not in ['like', 'love', 'dislike']:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Tipo de reacción no válido'
+            }, status=400)
+        
+        # Buscar si ya existe una reacción del usuario
+        existing_reaction = SocialPostLike.objects.filter(
+            post=post,
+            user=request.user
+        ).first()
+        
+        if existing_reaction:
+            if existing_reaction.reaction_type == reaction_type:
+                # Si es la misma reacción, eliminarla
+                existing_reaction.delete()
+                reaction = None
+            else:
+                # Si es diferente, actualizarla
+                existing_reaction.reaction_type = reaction_type
+                existing_reaction.save()
+                reaction = reaction_type
+        else:
+            # Crear nueva reacción
+            SocialPostLike.objects.create(
+                post=post,
+                user=request.user,
+                reaction_type=reaction_type
+            )
+            reaction = reaction_type
+        
+        return JsonResponse({
+            'status': 'success',
+            'reaction': reaction,
+            'likes_count': post.get_likes_count(),
+            'loves_count': post.get_loves_count(),
+            'dislikes_count': post.get_dislikes_count()
+        })
+    
+    return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+
+
+@login_required
+def social_post_comment(request, post_id):
+    """Agregar comentario a una publicación"""
+    from .models import SocialPost, SocialPostComment
+    
+    if request.method == 'POST':
+        post = get_object_or_404(SocialPost, id=post_id, is_active=True)
+        content = request.POST.get('content', '').strip()
+        
+        if not content:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'El comentario no puede estar vacío'
+            }, status=400)
+        
+        comment = SocialPostComment.objects.create(
+            post=post,
+            user=request.user,
+            content=content
+        )
+        
+        return JsonResponse({
+            'status': 'success',
+            'message': 'Comentario agregado',
+            'comment': {
+                'id': comment.id,
+                'user': comment.user.get_full_name() or comment.user.username,
+                'content': comment.content,
+                'created_at': comment.created_at.strftime('%d/%m/%Y %H:%M')
+            }
+        })
+    
+    return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+
+
+@login_required
+def social_comment_delete(request, comment_id):
+    """Eliminar comentario (solo el autor)"""
+    from .models import SocialPostComment
+    
+    if request.method == 'POST':
+        comment = get_object_or_404(SocialPostComment, id=comment_id, user=request.user)
+        comment.is_active = False
+        comment.save()
+        
+        return JsonResponse({
+            'status': 'success',
+            'message': 'Comentario eliminado'
+        })
+    
+    return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+
+
+@login_required
+def social_post_toggle_privacy(request, post_id):
+    """Cambiar privacidad de una publicación"""
+    from .models import SocialPost
+    
+    if request.method == 'POST':
+        post = get_object_or_404(SocialPost, id=post_id, user=request.user)
+        post.is_private = not post.is_private
+        post.save()
+        
+        return JsonResponse({
+            'status': 'success',
+            'is_private': post.is_private,
+            'message': 'Privacidad actualizada'
+        })
+    
+    return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+
+
+@login_required
+def social_post_share(request, post_id):
+    """Generar token para compartir públicamente"""
+    from .models import SocialPost
+    
+    post = get_object_or_404(SocialPost, id=post_id, user=request.user, is_active=True)
+    
+    if not post.share_token:
+        post.generate_share_token()
+    
+    share_url = request.build_absolute_uri(post.get_public_share_url())
+    
+    return JsonResponse({
+        'status': 'success',
+        'share_url': share_url,
+        'token': post.share_token
+    })
+
+
+def social_post_public(request, token):
+    """Vista pública de una publicación compartida"""
+    from .models import SocialPost
+    from django.db.models import F
+    
+    post = get_object_or_404(SocialPost, share_token=token, is_active=True)
+    
+    # Incrementar contador de vistas públicas
+    SocialPost.objects.filter(id=post.id).update(public_views_count=F('public_views_count') + 1)
+    post.refresh_from_db()
+    
+    context = {
+        'post': post,
+    }
+    
+    return render(request, 'tickets/social_post_public.html', context)
+
+
+def social_post_public_comment(request, token):
+    """Agregar comentario público (sin autenticación)"""
+    from .models import SocialPost, SocialPostComment
+    
+    if request.method == 'POST':
+        post = get_object_or_404(SocialPost, share_token=token, is_active=True)
+        content = request.POST.get('content', '').strip()
+        guest_name = request.POST.get('guest_name', '').strip()
+        guest_email = request.POST.get('guest_email', '').strip()
+        
+        if not content:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'El comentario no puede estar vacío'
+            }, status=400)
+        
+        if not guest_name:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Debes proporcionar tu nombre'
+            }, status=400)
+        
+        if not guest_email:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Debes proporcionar tu email'
+            }, status=400)
+        
+        comment = SocialPostComment.objects.create(
+            post=post,
+            content=content,
+            guest_name=guest_name,
+            guest_email=guest_email
+        )
+        
+        return JsonResponse({
+            'status': 'success',
+            'message': 'Comentario agregado',
+            'comment': {
+                'id': comment.id,
+                'user': guest_name,
+                'content': comment.content,
+                'created_at': comment.created_at.strftime('%d/%m/%Y %H:%M')
+            }
+        })
+    
+    return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+
+
+@login_required
+def social_comment_react(request, comment_id):
+    """Dar o cambiar reacción a un comentario"""
+    from .models import SocialPostComment, SocialCommentReaction
+    
+    if request.method == 'POST':
+        comment = get_object_or_404(SocialPostComment, id=comment_id, is_active=True)
+        reaction_type = request.POST.get('reaction_type', 'like')
+        
+        # Validar tipo de reacción
+        if reaction_type not in ['like', 'love', 'dislike']:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Tipo de reacción no válido'
+            }, status=400)
+        
+        # Buscar si ya existe una reacción del usuario
+        existing_reaction = SocialCommentReaction.objects.filter(
+            comment=comment,
+            user=request.user
+        ).first()
+        
+        if existing_reaction:
+            if existing_reaction.reaction_type == reaction_type:
+                # Si es la misma reacción, eliminarla
+                existing_reaction.delete()
+                reaction = None
+            else:
+                # Si es diferente, actualizarla
+                existing_reaction.reaction_type = reaction_type
+                existing_reaction.save()
+                reaction = reaction_type
+        else:
+            # Crear nueva reacción
+            SocialCommentReaction.objects.create(
+                comment=comment,
+                user=request.user,
+                reaction_type=reaction_type
+            )
+            reaction = reaction_type
+        
+        return JsonResponse({
+            'status': 'success',
+            'reaction': reaction,
+            'likes_count': comment.get_likes_count(),
+            'loves_count': comment.get_loves_count(),
+            'dislikes_count': comment.get_dislikes_count()
+        })
+    
+    return JsonResponse({'status': 'error', 'message': 'Método no permitido'}, status=405)
+
+
+@login_required
+def social_post_favorite(request, post_id):
+    """Toggle favorito en una publicación"""
+    from .models import SocialPost, SocialPostFavorite
+    
+    if request.method == 'POST':
+        post = get_object_or_404(SocialPost, id=post_id, is_active=True)
+        
+        # Buscar si ya existe el favorito
+        favorite = SocialPostFavorite.objects.filter(
+            post=post,
+            user=request.user
+        ).first()
+        
+        if favorite:
+            # Si existe, eliminarlo
+            favorite.delete()
+            favorited = False
+        else:
+            # Si no existe, crearlo
+            SocialPostFavorite.objects.create(
+                post=post,
+                user=request.user
+            )
+            favorited = True
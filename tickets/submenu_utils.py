@@ -2,26 +2,14 @@
 Utilidades para generar submenús contextuales en el dashboard estilo Odoo
 """
 from django.urls import reverse
-from tickets.utils import is_agent
 
 
 def get_crm_submenu(request, active_item=None):
     """Genera el submenú para el módulo CRM"""
-    from tickets.models import Contact, Company, Opportunity
+    from tickets.nav_counters import crm_submenu_counts
     
-    user = request.user
-    
-    # Contar registros según permisos
-    if is_agent(user):
-        contacts_count = Contact.objects.count()
-        companies_count = Company.objects.count()
-        opportunities_count = Opportunity.objects.count()
-    else:
-        contacts_count = Contact.objects.filter(created_by=user).count()
-        companies_count = Company.objects.filter(created_by=user).count()
-        opportunities_count = Opportunity.objects.filter(
-            created_by=user
-        ).count() + Opportunity.objects.filter(assigned_to=user).count()
+    # Contar registros según permisos (una vez por petición, desde la caché)
+    contacts_count, companies_count, opportunities_count = crm_submenu_counts(request)
     
     submenu = [
         {
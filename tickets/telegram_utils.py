@@ -2,51 +2,105 @@
 Utilidades para integración con Telegram
 """
 import requests
+from requests.adapters import HTTPAdapter
 import logging
+import threading
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
-def send_telegram_message(bot_token, chat_id, message, parse_mode='HTML'):
+# Longitud máxima de un mensaje de Telegram
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class TelegramError(Exception):
+    """Error al enviar un mensaje; ``retry_after`` viene de las respuestas 429 de Telegram"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def get_telegram_session():
     """
-    Envía un mensaje a un chat de Telegram
-    
-    Args:
-        bot_token (str): Token del bot de Telegram
-        chat_id (str): ID del chat o grupo
-        message (str): Mensaje a enviar
-        parse_mode (str): Modo de parsing ('HTML' o 'Markdown')
+    Sesión HTTP compartida para la API de Telegram.
+
+    Reutiliza la conexión TLS con api.telegram.org entre mensajes en lugar
+    de abrir una nueva en cada ``requests.post``.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
+
+
+def post_telegram_message(bot_token, chat_id, message, parse_mode='HTML'):
+    """
+    Envía un mensaje a un chat de Telegram y lanza ``TelegramError`` si falla
     
-    Returns:
-        bool: True si el mensaje se envió correctamente, False en caso contrario
+    La usa el despachador de notificaciones, que necesita el motivo del fallo
+    para decidir cuándo reintentar.
     """
     if not bot_token or not chat_id:
-        logger.warning("Token del bot o chat_id no configurados para Telegram")
-        return False
+        raise TelegramError("Token del bot o chat_id no configurados para Telegram")
     
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
     
     payload = {
         'chat_id': chat_id,
         'text': message,
-        'parse_mode': parse_mode,
         'disable_web_page_preview': True
     }
+    if parse_mode:
+        payload['parse_mode'] = parse_mode
     
     try:
-        response = requests.post(url, json=payload, timeout=10)
-        response.raise_for_status()
-        
-        result = response.json()
-        if result.get('ok'):
-            logger.info(f"Mensaje enviado a Telegram correctamente: {chat_id}")
-            return True
-        else:
-            logger.error(f"Error en respuesta de Telegram: {result}")
-            return False
-            
+        response = get_telegram_session().post(url, json=payload, timeout=10)
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error al enviar mensaje a Telegram: {e}")
+        raise TelegramError(f"Error al enviar mensaje a Telegram: {e}")
+    
+    try:
+        result = response.json()
+    except ValueError:
+        result = {}
+    
+    if response.status_code == 200 and result.get('ok'):
+        logger.info(f"Mensaje enviado a Telegram correctamente: {chat_id}")
+        return result
+    
+    retry_after = (result.get('parameters') or {}).get('retry_after')
+    raise TelegramError(
+        f"Error en respuesta de Telegram ({response.status_code}): {result.get('description') or response.text[:200]}",
+        retry_after=retry_after,
+    )
+
+
+def send_telegram_message(bot_token, chat_id, message, parse_mode='HTML'):
+    """
+    Envía un mensaje a un chat de Telegram
+    
+    Args:
+        bot_token (str): Token del bot de Telegram
+        chat_id (str): ID del chat o grupo
+        message (str): Mensaje a enviar
+        parse_mode (str): Modo de parsing ('HTML' o 'Markdown')
+    
+    Returns:
+        bool: True si el mensaje se envió correctamente, False en caso contrario
+    """
+    try:
+        post_telegram_message(bot_token, chat_id, message, parse_mode)
+        return True
+    except TelegramError as e:
+        logger.error(str(e))
         return False
     except Exception as e:
         logger.error(f"Error inesperado al enviar mensaje a Telegram: {e}")
@@ -132,25 +186,25 @@ def test_telegram_connection(bot_token, chat_id):
 
 def notify_ticket_created(ticket):
     """
-    Envía una notificación a Telegram cuando se crea un nuevo ticket
+    Encola una notificación a Telegram cuando se crea un nuevo ticket
+    
+    El envío lo hace el despachador de notificaciones en segundo plano, así la
+    creación del ticket no espera a la API de Telegram.
     
     Args:
         ticket: Instancia del modelo Ticket
     
     Returns:
-        bool: True si se envió la notificación, False en caso contrario
+        bool: True si se encoló la notificación, False en caso contrario
     """
     try:
-        logger.info(f"Iniciando notificación de Telegram para ticket {ticket.ticket_number}")
-        
         # Obtener configuración global del sistema
         from .models import SystemConfiguration
+        from .notification_utils import queue_telegram
         config = SystemConfiguration.get_config()
         
-        logger.info(f"Configuración obtenida: telegram_enabled={config.enable_telegram_notifications}")
-        
         if not config.enable_telegram_notifications:
-            logger.info("Notificaciones de Telegram deshabilitadas")
+            logger.debug("Notificaciones de Telegram deshabilitadas")
             return False
         
         if not config.telegram_bot_token or not config.telegram_chat_id:
@@ -159,22 +213,55 @@ def notify_ticket_created(ticket):
             logger.warning(f"Chat ID presente: {bool(config.telegram_chat_id)}")
             return False
         
-        logger.info("Formateando mensaje de notificación")
         message = format_ticket_notification(ticket)
-        logger.info(f"Mensaje formateado: {message[:100]}...")
-        
-        logger.info("Enviando mensaje a Telegram")
-        result = send_telegram_message(
-            config.telegram_bot_token,
-            config.telegram_chat_id,
-            message
-        )
-        
-        logger.info(f"Resultado del envío: {result}")
-        return result
+        queue_telegram(config.telegram_bot_token, config.telegram_chat_id, message)
+        logger.info(f"Notificación de Telegram encolada para ticket {ticket.ticket_number}")
+        return True
         
     except Exception as e:
         logger.error(f"Error al notificar creación de ticket a Telegram: {e}")
         import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
-        return False
\ No newline at end of file
+        return False
+
+
+def notify_tickets_imported(user, tickets):
+    """
+    Encola una única notificación a Telegram para una importación masiva de tickets
+    
+    Args:
+        user: Usuario que hizo la importación
+        tickets: Tickets creados
+    
+    Returns:
+        bool: True si se encoló la notificación, False en caso contrario
+    """
+    try:
+        from .models import SystemConfiguration
+        from .notification_utils import queue_telegram
+        config = SystemConfiguration.get_config()
+        
+        if not config.enable_telegram_notifications:
+            return False
+        
+        if not config.telegram_bot_token or not config.telegram_chat_id:
+            logger.warning("Configuración de Telegram incompleta en la configuración del sistema")
+            return False
+        
+        if not tickets:
+            return False
+        
+        creator = user.get_full_name() or user.username
+        numbers = [ticket.ticket_number for ticket in tickets]
+        message = f"""📥 <b>Importación de Tickets</b>
+
+👤 <b>Importados por:</b> {creator}
+🎫 <b>Tickets creados:</b> {len(tickets)}
+📋 <b>Números:</b> #{numbers[0]}""" + (f" … #{numbers[-1]}" if len(numbers) > 1 else "")
+        
+        queue_telegram(config.telegram_bot_token, config.telegram_chat_id, message)
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error al notificar importación de tickets a Telegram: {e}")
+        return False
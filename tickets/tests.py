@@ -1,3 +1,629 @@
-from django.test import TestCase
+import datetime
+import json
+import os
+import socket
+import socketserver
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import AnonymousUser, Group, User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.template import engines
+from django.db import OperationalError, connection, transaction
+from django.test import (
+    RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature,
+)
+from django.urls import reverse
+
+from django.utils import timezone
+
+from tickets import (
+    chatbot_pipeline, keyword_matcher, notification_utils, scheduler_utils, search, utils, web_counter_ingest, web_tracker_utils,
+)
+from tickets.models import (
+    Chatbot, ChatbotMessage, ChatbotQuestion, Company, Contact, KnowledgeBase, LandingPage, LandingPageSubmission, Opportunity,
+    OpportunityActivity, OpportunityStatus, OutboundNotification, SearchDocument, SystemConfiguration, Ticket,
+)
+from tickets.submenu_utils import get_crm_submenu
+
+
+class ImportTimeTests(SimpleTestCase):
+    """Presupuesto de arranque en frío (el mismo que ``benchmark_import_time``)"""
+
+    def test_cold_start_is_within_budget(self):
+        # Falla si se supera el presupuesto o se cargan módulos diferidos (tickets.views...)
+        call_command('benchmark_import_time', runs=3, stdout=StringIO())
+
+    def test_domain_views_do_not_load_the_main_views_module(self):
+        modules = sorted(f'tickets.{path.stem}' for path in Path(__file__).parent.glob('*_views.py'))
+        code = (
+            'import django, importlib, sys; django.setup(); '
+            f'[importlib.import_module(name) for name in {modules!r}]; '
+            "print('tickets.views' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+
+class GlobalContextProcessorTests(TestCase):
+    """El context processor global solo consulta lo que la plantilla lee"""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.agent = User.objects.create_user('agente', password='agente')
+        self.agent.groups.add(Group.objects.get_or_create(name='Agentes')[0])
+
+    def render(self, template_code, user):
+        request = self.factory.get('/')
+        request.user = user
+        request.session = {}
+        return engines['django'].from_string(template_code).render({}, request)
+
+    def test_simple_page_runs_no_queries(self):
+        for user in (AnonymousUser(), self.agent):
+            with self.assertNumQueries(0):
+                self.render('<p>{{ request.path }}</p>', user)
+
+    def test_crm_counters_are_cached_until_a_counted_model_changes(self):
+        template = '{{ crm_counters.contacts }}|{{ crm_counters.pending_activities }}'
+        self.assertEqual(self.render(template, self.agent), '0|0')
+
+        # Solo la comprobación de grupo del agente: los contadores salen de la caché
+        with self.assertNumQueries(1):
+            self.assertEqual(self.render(template, self.agent), '0|0')
+
+        Contact.objects.create(name='Cliente', created_by=self.agent)
+        self.assertEqual(self.render(template, self.agent), '1|0')
+
+    def test_each_value_is_computed_once_per_render(self):
+        template = '{% if is_working %}a{% endif %}{% if can_start_work %}b{% endif %}{{ can_end_work }}'
+        # Grupo del agente y registro de tiempo activo, una vez cada uno
+        with self.assertNumQueries(2):
+            self.assertEqual(self.render(template, self.agent), 'bFalse')
+
+
+class NavCountersTests(TestCase):
+    """Contadores de los submenús: una vez por petición y sin contar dos veces"""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user('cliente', password='cliente')
+
+    def request(self):
+        request = self.factory.get('/')
+        request.user = self.user
+        return request
+
+    def counts(self, submenu):
+        return [item['count'] for item in submenu if item['count'] is not None]
+
+    def test_own_opportunity_assigned_to_self_counts_once(self):
+        Opportunity.objects.create(
+            name='Renovación',
+            value=1000,
+            company=Company.objects.create(name='Cliente SL'),
+            status=OpportunityStatus.objects.create(name='Nueva', order=0),
+            created_by=self.user,
+            assigned_to=self.user,
+            expected_close_date=timezone.localdate(),
+        )
+        self.assertEqual(self.counts(get_crm_submenu(self.request())), [0, 0, 1])
+
+    def test_submenu_reuses_counters_within_a_request(self):
+        request = self.request()
+        get_crm_submenu(request)
+        with self.assertNumQueries(0):
+            get_crm_submenu(request, 'contacts')
+
+
+class ContactActivitySummaryTests(TestCase):
+    """Resumen de actividades del contacto (activity_count / next_activity_date)"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('agente', password='agente')
+        self.contacts = [Contact.objects.create(name=f'Cliente {i}', created_by=self.user) for i in range(3)]
+
+    def add_activity(self, contact, scheduled_date):
+        return OpportunityActivity.objects.create(
+            contact=contact, title='Llamada', scheduled_date=scheduled_date,
+            assigned_to=self.user, created_by=self.user,
+        )
+
+    def test_refresh_next_activity_is_a_single_update(self):
+        now = timezone.now()
+        self.add_activity(self.contacts[0], now + datetime.timedelta(days=2))
+        self.add_activity(self.contacts[0], now + datetime.timedelta(days=1))
+        self.add_activity(self.contacts[1], now - datetime.timedelta(days=1))
+        Contact.objects.update(next_activity_date=now - datetime.timedelta(hours=1))
+
+        with self.assertNumQueries(1):
+            Contact.refresh_next_activity([contact.pk for contact in self.contacts])
+
+        next_dates = dict(Contact.objects.values_list('pk', 'next_activity_date'))
+        self.assertEqual(next_dates[self.contacts[0].pk], now + datetime.timedelta(days=1))
+        self.assertIsNone(next_dates[self.contacts[1].pk])
+        self.assertIsNone(next_dates[self.contacts[2].pk])
+
+    def test_stage_update_keeps_activity_summary(self):
+        contact = self.contacts[0]
+        self.add_activity(contact, timezone.now() + datetime.timedelta(days=1))
+        self.client.force_login(self.user)
+        response = self.client.post(reverse('contact_update_stage', args=[contact.pk]), {'stage': 'stage_2'})
+        self.assertEqual(response.status_code, 200)
+        contact.refresh_from_db()
+        self.assertEqual((contact.stage, contact.activity_count), ('stage_2', 1))
+
+    def test_contact_whose_row_was_deleted_can_be_saved_again(self):
+        contact = self.contacts[0]
+        Contact.objects.filter(pk=contact.pk).delete()
+        contact.save()
+        self.assertTrue(Contact.objects.filter(pk=contact.pk).exists())
+
+
+@skipUnlessDBFeature('has_select_for_update')
+class TicketNumberConcurrencyTests(TransactionTestCase):
+    """
+    Tickets creados a la vez desde varios hilos: ningún número repetido ni
+    saltado. Necesita bloqueo de filas (PostgreSQL); SQLite serializa las
+    escrituras y no lo soporta.
+    """
+
+    THREADS = 8
+    PER_THREAD = 10
+
+    def setUp(self):
+        self.users = [User.objects.create_user(f'creador{i}') for i in range(2)]
+
+    def create_tickets(self, user, bulk):
+        try:
+            for offset in range(0, self.PER_THREAD, bulk):
+                tickets = [Ticket(title=f'Ticket {offset + i}', description='-', created_by=user)
+                           for i in range(min(bulk, self.PER_THREAD - offset))]
+                with transaction.atomic():
+                    Ticket.assign_ticket_numbers(tickets)
+                    Ticket.objects.bulk_create(tickets)
+        finally:
+            connection.close()
+
+    def assert_numbers_are_consecutive(self):
+        for user in self.users:
+            numbers = Ticket.objects.filter(created_by=user).values_list('ticket_number', flat=True)
+            sequences = sorted(int(number.split('-', 1)[1]) for number in numbers)
+            expected = self.THREADS // len(self.users) * self.PER_THREAD
+            self.assertEqual(sequences, list(range(1, expected + 1)))
+
+    def run_threads(self, bulk):
+        jobs = [(self.users[i % len(self.users)], bulk) for i in range(self.THREADS)]
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            list(executor.map(lambda job: self.create_tickets(*job), jobs))
+
+    def test_single_allocations_have_no_duplicates_or_gaps(self):
+        self.run_threads(bulk=1)
+        self.assert_numbers_are_consecutive()
+
+    def test_bulk_allocations_have_no_duplicates_or_gaps(self):
+        self.run_threads(bulk=4)
+        self.assert_numbers_are_consecutive()
+
+
+class ChatbotPipelineTests(TestCase):
+    """Respuestas del chatbot generadas en segundo plano"""
+
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user('propietario', password='propietario')
+        self.chatbot = Chatbot.objects.create(
+            title='Asistente', description='Pruebas', created_by=owner, use_ai=True,
+        )
+
+    def post(self, name, data):
+        return self.client.post(
+            reverse(name, args=[self.chatbot.script_token]), json.dumps(data), content_type='application/json',
+        )
+
+    @mock.patch.object(chatbot_pipeline, 'geo_data', return_value={'country': '', 'city': ''})
+    @mock.patch.object(chatbot_pipeline, 'ai_response', return_value=None)
+    def test_fallback_reply_is_delivered_once(self, ai_response, geo_data):
+        sent = self.post('chatbot_chat', {'message': 'Una pregunta sin respuesta', 'session_id': 's1'}).json()
+        self.assertTrue(sent['pending'])
+
+        chatbot_pipeline.process_message(chatbot_pipeline.claim_next_message())
+        ai_response.assert_called_once()
+
+        polled = self.post('chatbot_get_new_messages', {
+            'session_id': 's1', 'last_message_id': 0, 'reply_to': sent['message_id'],
+        }).json()
+        self.assertEqual(polled['reply']['message'], chatbot_pipeline.DEFAULT_RESPONSE)
+        # La respuesta por defecto no es un mensaje del administrador
+        self.assertEqual(polled['messages'], [])
+        self.assertEqual(polled['last_message_id'], 0)
+        self.assertEqual(
+            ChatbotMessage.objects.get(pk=sent['message_id']).pipeline_status, 'done',
+        )
+
+
+class KeywordMatcherCacheTests(TestCase):
+    """El matcher de cada proceso se recompila cuando cambian sus filas, las cambie quien las cambie"""
+
+    def setUp(self):
+        owner = User.objects.create_user('propietario', password='propietario')
+        self.chatbot = Chatbot.objects.create(title='Asistente', description='Pruebas', created_by=owner)
+        self.question = ChatbotQuestion.objects.create(
+            chatbot=self.chatbot, question='¿Horario?', keywords='horario', answer='De 9 a 18',
+        )
+
+    def match(self, text):
+        return keyword_matcher.match_chatbot(self.chatbot.pk, text)
+
+    def test_edit_from_another_process_is_picked_up(self):
+        self.assertEqual(self.match('¿Qué horario tenéis?'), (self.question.pk, 'De 9 a 18'))
+        # Un UPDATE sin señales, como el que haría otro worker
+        ChatbotQuestion.objects.filter(pk=self.question.pk).update(
+            answer='De 8 a 15', updated_at=timezone.now() + datetime.timedelta(seconds=1),
+        )
+        self.assertEqual(self.match('¿Qué horario tenéis?'), (self.question.pk, 'De 8 a 15'))
+
+    def test_deleted_and_added_questions_are_picked_up(self):
+        self.assertIsNotNone(self.match('horario'))
+        ChatbotQuestion.objects.filter(pk=self.question.pk).delete()
+        self.assertIsNone(self.match('horario'))
+        added = ChatbotQuestion.objects.create(
+            chatbot=self.chatbot, question='¿Precio?', keywords='precio', answer='Gratis',
+        )
+        self.assertEqual(self.match('¿Qué precio tiene?'), (added.pk, 'Gratis'))
+
+    def test_unchanged_rows_reuse_the_compiled_matcher(self):
+        self.match('horario')
+        with mock.patch.object(keyword_matcher, 'KeywordMatcher') as build:
+            self.match('horario')
+        build.assert_not_called()
+
+
+class LandingPageNotificationTests(TestCase):
+    """Los avisos de las landing pages se encolan con su plantilla HTML"""
+
+    def setUp(self):
+        config = SystemConfiguration.get_config()
+        config.enable_email_notifications = True
+        config.notification_emails = 'ventas@example.com'
+        config.save()
+        self.landing_page = LandingPage(nombre_producto='Producto X', slug='producto-x')
+
+    def test_submission_notification_uses_the_template(self):
+        submission = LandingPageSubmission(
+            landing_page=self.landing_page, nombre='Ana', apellido='Ruiz', email='ana@example.com',
+        )
+        self.assertTrue(utils.send_landing_page_notification(submission))
+        payload = OutboundNotification.objects.get().payload
+        self.assertEqual(payload['recipients'], ['ventas@example.com'])
+        self.assertIn('<', payload['html_body'])
+        self.assertIn('Ana', payload['body'])
+        self.assertNotIn('<', payload['body'])
+
+    def test_contact_creation_notification_uses_the_template(self):
+        contact = Contact(name='Ana Ruiz', email='ana@example.com')
+        self.assertTrue(utils.send_contact_creation_notification(contact, self.landing_page))
+        payload = OutboundNotification.objects.get().payload
+        self.assertIn('ana@example.com', payload['html_body'])
+        self.assertIn('Producto X', payload['html_body'])
+
+
+class NotificationDispatcherTests(TestCase):
+    """El despachador reserva lotes, agrupa los envíos y reintenta con backoff"""
+
+    def setUp(self):
+        self.dispatcher = notification_utils.NotificationDispatcher()
+        self.smtp = mock.Mock()
+        patcher = mock.patch.object(notification_utils, 'get_email_connection', return_value=self.smtp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_emails_of_a_batch_share_one_connection(self):
+        notification_utils.queue_email('Uno', 'cuerpo', ['a@example.com'])
+        notification_utils.queue_email('Dos', 'cuerpo', ['b@example.com'], html_body='<p>cuerpo</p>')
+        self.assertEqual(self.dispatcher.run_once(), 2)
+        self.assertEqual(self.smtp.open.call_count, 1)
+        self.assertEqual(self.smtp.send_messages.call_count, 2)
+        self.assertEqual(set(OutboundNotification.objects.values_list('status', flat=True)), {'sent'})
+        self.assertEqual(self.dispatcher.run_once(), 0)
+
+    def test_failed_email_is_retried_after_the_backoff(self):
+        notification = notification_utils.queue_email('Uno', 'cuerpo', ['a@example.com'])
+        self.smtp.send_messages.side_effect = OSError('SMTP caído')
+        self.dispatcher.run_once()
+        notification.refresh_from_db()
+        self.assertEqual((notification.status, notification.attempts), ('pending', 1))
+        self.assertIn('SMTP caído', notification.last_error)
+        self.assertGreater(notification.next_attempt_at, timezone.now())
+        # Aún no ha vencido el reintento
+        self.assertEqual(self.dispatcher.run_once(), 0)
+        self.assertGreater(self.dispatcher.seconds_until_next(), 0)
+
+        OutboundNotification.objects.update(next_attempt_at=timezone.now())
+        self.smtp.send_messages.side_effect = None
+        self.assertEqual(self.dispatcher.run_once(), 1)
+        notification.refresh_from_db()
+        self.assertEqual((notification.status, notification.attempts), ('sent', 2))
+
+    def test_abandoned_claims_are_claimed_again(self):
+        notification = notification_utils.queue_email('Uno', 'cuerpo', ['a@example.com'])
+        OutboundNotification.objects.update(
+            status='sending', claim_token='caido',
+            claimed_at=timezone.now() - notification_utils.CLAIM_TIMEOUT - datetime.timedelta(minutes=1),
+        )
+        self.assertEqual([n.pk for n in self.dispatcher.claim()], [notification.pk])
+        self.assertEqual(self.dispatcher.claim(), [])
+
+    @mock.patch.object(notification_utils, 'post_telegram_message')
+    def test_telegram_burst_to_one_chat_is_coalesced(self, post):
+        notification_utils.queue_telegram('token', 42, 'primero')
+        notification_utils.queue_telegram('token', 42, 'segundo')
+        notification_utils.queue_telegram('token', 7, 'otro chat')
+        self.assertEqual(self.dispatcher.run_once(), 3)
+        texts = sorted(call.args[2] for call in post.call_args_list)
+        self.assertEqual(texts, ['otro chat', 'primero' + notification_utils.TELEGRAM_COALESCE_SEPARATOR + 'segundo'])
+        self.assertEqual(OutboundNotification.objects.filter(status='sent').count(), 3)
+
+
+class SearchFallbackTests(TestCase):
+    """Hasta que se construye el índice de un tipo, sus búsquedas no dependen de él"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('agente', password='agente')
+        self.contact = Contact.objects.create(name='Lucía Pérez', email='lucia@example.com', created_by=self.user)
+        # Contacto anterior a la migración: sin documento en el índice
+        SearchDocument.objects.filter(entity='contact').delete()
+        # Guardado tras la migración: la señal ya le crea su documento
+        self.new_contact = Contact.objects.create(name='Lucía Gómez', created_by=self.user)
+
+    def search(self, query):
+        return set(search.filter_queryset(Contact.objects.all(), 'contact', query))
+
+    def test_unbuilt_index_falls_back_to_icontains(self):
+        self.assertFalse(search.is_indexed('contact'))
+        self.assertEqual(self.search('Lucía'), {self.contact, self.new_contact})
+
+    def test_rebuilt_entity_is_searched_in_the_index(self):
+        call_command('rebuild_search_index', entity=['contact'], stdout=StringIO())
+        self.assertTrue(search.is_indexed('contact'))
+        self.assertEqual(self.search('Lucía'), {self.contact, self.new_contact})
+        # Un cambio que no lanza señales no llega al índice
+        Contact.objects.filter(pk=self.contact.pk).update(name='Marta')
+        self.assertEqual(self.search('Marta'), set())
+
+    def test_knowledge_base_search_before_rebuild(self):
+        entry = KnowledgeBase.objects.create(
+            title='Configurar el correo', description='Pasos', category='email', created_by=self.user,
+        )
+        SearchDocument.objects.filter(entity='knowledge_base').delete()
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('knowledge_base_search'), {'q': 'correo'})
+        self.assertEqual([result['id'] for result in response.json()['results']], [entry.pk])
+
+
+class TaskTimeoutTests(SimpleTestCase):
+    """El código de una tarea programada se cancela al superar su timeout"""
+
+    def test_task_result_is_returned(self):
+        status, _, _ = scheduler_utils.run_task_code_with_timeout('x = 1', timeout=30)
+        self.assertEqual(status, 'success')
+
+    def test_task_over_timeout_is_cancelled(self):
+        started = time.monotonic()
+        status, _, _ = scheduler_utils.run_task_code_with_timeout('import time\ntime.sleep(30)', timeout=0.5)
+        self.assertEqual(status, 'timeout')
+        self.assertLess(time.monotonic() - started, 10)
+
+
+class WebCounterFlushTests(SimpleTestCase):
+    """Un lote de visitas que no se pudo guardar vuelve a la cola"""
+
+    def setUp(self):
+        web_counter_ingest._pending[:] = [('visita1', True), ('visita2', False)]
+        web_counter_ingest._retrying.clear()
+        self.addCleanup(web_counter_ingest._pending.clear)
+        self.addCleanup(web_counter_ingest._retrying.clear)
+
+    @mock.patch.object(web_counter_ingest, 'save_visits', side_effect=[OperationalError('caída'), 2])
+    def test_failed_batch_is_retried(self, save_visits):
+        self.assertEqual(web_counter_ingest.flush_pending(), 0)
+        web_counter_ingest._pending.append(('visita3', True))
+        self.assertEqual(web_counter_ingest.flush_pending(), 2)
+        self.assertEqual(save_visits.call_args.args[0], [('visita1', True), ('visita2', False), ('visita3', True)])
+        self.assertEqual(web_counter_ingest._pending, [])
+
+    @mock.patch.object(web_counter_ingest, 'MAX_PENDING', 2)
+    @mock.patch.object(web_counter_ingest, 'save_visits', side_effect=OperationalError('caída'))
+    def test_requeued_visits_are_capped(self, save_visits):
+        web_counter_ingest._pending.append(('visita3', True))
+        web_counter_ingest.flush_pending()
+        self.assertEqual(web_counter_ingest._pending, [('visita2', False), ('visita3', True)])
+
+
+# ------------------------------------------------- rastreador web (stubs)
+
+STUB_PAGE = (
+    b'<html><head><title>Sitio de prueba</title>'
+    b'<meta name="description" content="Descripcion">'
+    b'<link rel="stylesheet" href="/css/bootstrap.min.css">'
+    b'<script src="/js/jquery.js"></script></head><body></body></html>'
+)
+
+
+class StubHTTPHandler(BaseHTTPRequestHandler):
+    """Sirve STUB_PAGE; ``/slow`` tarda medio segundo en responder"""
+
+    def version_string(self):
+        return 'StubServer'
+
+    def do_GET(self):
+        if self.path.startswith('/slow'):
+            time.sleep(0.5)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(STUB_PAGE)))
+        self.end_headers()
+        self.wfile.write(STUB_PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubDNSHandler(socketserver.BaseRequestHandler):
+    """Responde 127.0.0.1 a las consultas A y sin respuestas al resto"""
+
+    def handle(self):
+        import dns.message
+        import dns.rdatatype
+        import dns.rrset
+
+        data, sock = self.request
+        query = dns.message.from_wire(data)
+        self.server.queries.append(query.question[0].rdtype)
+        response = dns.message.make_response(query)
+        question = query.question[0]
+        if question.rdtype == dns.rdatatype.A:
+            response.answer.append(dns.rrset.from_text(question.name, 60, 'IN', 'A', '127.0.0.1'))
+        sock.sendto(response.to_wire(), self.client_address)
+
+
+def _self_signed_certificate(directory):
+    """Certificado autofirmado para ``localhost``; devuelve las rutas del certificado y la clave"""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'localhost')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name).public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=30))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName('localhost')]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, 'cert.pem')
+    key_path = os.path.join(directory, 'key.pem')
+    with open(cert_path, 'wb') as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, 'wb') as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        ))
+    return cert_path, key_path
+
+
+class WebTrackerProbeTests(SimpleTestCase):
+    """Sondas del rastreador web contra servidores locales"""
+
+    def setUp(self):
+        cache.clear()
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+    def serve(self, server):
+        self.servers.append(server)
+        threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        return server.server_address[1]
+
+    def http_url(self, path='/'):
+        port = self.serve(ThreadingHTTPServer(('127.0.0.1', 0), StubHTTPHandler))
+        return f'http://127.0.0.1:{port}{path}'
+
+    def test_track_website_reads_page_and_times_each_probe(self):
+        result = web_tracker_utils.track_website(self.http_url())
+
+        self.assertIsNone(result['error_message'])
+        self.assertEqual(result['ip_address'], '127.0.0.1')
+        self.assertEqual(result['http_status_code'], 200)
+        self.assertEqual(result['server_software'], 'StubServer')
+        self.assertEqual(result['page_title'], 'Sitio de prueba')
+        self.assertEqual(result['technologies'], ['Bootstrap', 'jQuery'])
+        self.assertFalse(result['ssl_valid'])
+        self.assertEqual(
+            set(result['probe_timings']), {'ping', 'dns', 'http', 'ssl', 'cached', 'total'},
+        )
+
+    def test_targets_are_tracked_in_parallel(self):
+        targets = [self.http_url(f'/slow/{i}') for i in range(4)]
+        started = time.monotonic()
+        results = web_tracker_utils.track_websites(targets, max_workers=4)
+        elapsed = time.monotonic() - started
+
+        self.assertEqual([results[target]['http_status_code'] for target in targets], [200] * 4)
+        for target in targets:
+            self.assertGreaterEqual(results[target]['probe_timings']['http'], 500)
+        # En serie serían al menos 2 segundos
+        self.assertLess(elapsed, 1.5)
+
+    def test_dns_records_are_cached(self):
+        server = socketserver.ThreadingUDPServer(('127.0.0.1', 0), StubDNSHandler)
+        server.queries = []
+        port = self.serve(server)
+
+        with override_settings(WEB_TRACKER_DNS_NAMESERVERS=['127.0.0.1'], WEB_TRACKER_DNS_PORT=port):
+            records = web_tracker_utils.get_dns_records('stub.test')
+            self.assertEqual(records['ip'], '127.0.0.1')
+            self.assertEqual(len(server.queries), len(web_tracker_utils.DNS_RECORD_TYPES))
+
+            self.assertEqual(web_tracker_utils.get_dns_records('stub.test'), records)
+            self.assertEqual(len(server.queries), len(web_tracker_utils.DNS_RECORD_TYPES))
+
+    def test_valid_certificates_are_cached(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        cert_path, key_path = _self_signed_certificate(directory.name)
+
+        server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_context.load_cert_chain(cert_path, key_path)
+        listener = socket.create_server(('127.0.0.1', 0))
+        port = listener.getsockname()[1]
+        connections = []
+
+        def accept():
+            while True:
+                try:
+                    conn, _ = listener.accept()
+                except OSError:
+                    return
+                connections.append(conn)
+                try:
+                    with server_context.wrap_socket(conn, server_side=True):
+                        pass
+                except (ssl.SSLError, OSError):
+                    pass
+
+        threading.Thread(target=accept, daemon=True).start()
+        self.addCleanup(listener.close)
+
+        trusted = ssl.create_default_context(cafile=cert_path)
+        with mock.patch.object(web_tracker_utils, 'ssl_context', return_value=trusted):
+            info = web_tracker_utils.get_ssl_info('localhost', port)
+            self.assertTrue(info['valid'])
+            self.assertEqual(info['issuer'], {'commonName': 'localhost'})
+            self.assertGreater(info['expiry_date'], timezone.now())
+
+            self.assertEqual(web_tracker_utils.get_ssl_info('localhost', port), info)
+            self.assertEqual(len(connections), 1)
@@ -0,0 +1,266 @@
+"""
+Importación masiva de tickets desde Excel.
+
+La usan ``ticket_import_view`` y el comando ``import_tickets``. El archivo se
+lee en modo streaming (openpyxl ``read_only``), las empresas, categorías,
+proyectos y usuarios se cargan una sola vez en diccionarios, los números de
+ticket se reservan en bloque y los tickets se insertan con ``bulk_create``
+por lotes. Al terminar se envía una única notificación resumen en lugar de
+una por ticket.
+
+Con ``dry_run`` se validan todas las filas sin crear nada.
+"""
+import logging
+from decimal import Decimal, InvalidOperation
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from .models import Category, Company, Project, Ticket
+from .search import index_objects
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_COLUMNS = ['Título', 'Descripción']
+
+# Columnas opcionales; si una fila no las trae se usan los valores por defecto del formulario
+OPTIONAL_COLUMNS = ['Empresa', 'Categoría', 'Proyecto', 'Prioridad', 'Tipo', 'Asignado a', 'Horas']
+
+DEFAULT_CHUNK_SIZE = 500
+
+TITLE_MAX_LENGTH = Ticket._meta.get_field('title').max_length
+
+
+class TicketImportError(Exception):
+    """El archivo no se puede importar (formato ilegible o faltan columnas)"""
+
+
+class ImportRowError(TicketImportError):
+    """Error de validación de una fila concreta del Excel"""
+
+
+class TicketImportResult:
+    """Resultado de una importación: tickets creados (o válidos en dry-run) y errores por fila"""
+
+    def __init__(self, dry_run=False):
+        self.dry_run = dry_run
+        self.total_rows = 0
+        self.valid_rows = 0
+        self.created = []
+        self.errors = []          # [(número de fila, mensaje)]
+
+    @property
+    def created_count(self):
+        return len(self.created)
+
+    @property
+    def error_count(self):
+        return len(self.errors)
+
+    def add_error(self, row_number, message):
+        self.errors.append((row_number, message))
+
+    def error_lines(self, limit=None):
+        errors = self.errors if limit is None else self.errors[:limit]
+        return [f'Fila {row_number}: {message}' for row_number, message in errors]
+
+
+def _normalize(value):
+    return str(value).strip().lower() if value is not None else ''
+
+
+def _cell_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+class TicketImporter:
+    """
+    Importa tickets desde un Excel.
+
+    ``company``, ``category`` y ``priority`` son los valores por defecto para
+    las filas que no indican los suyos en las columnas opcionales.
+    """
+
+    def __init__(self, user, company=None, category=None, priority='medium',
+                 chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False, notify=True):
+        self.user = user
+        self.company = company
+        self.category = category
+        self.priority = priority
+        self.chunk_size = max(1, chunk_size)
+        self.dry_run = dry_run
+        self.notify = notify
+        self.lookups_loaded = False
+
+    # ------------------------------------------------------------- lookups
+
+    def load_lookups(self):
+        """Carga una sola vez los catálogos que pueden referenciar las filas"""
+        if self.lookups_loaded:
+            return
+        self.companies = {_normalize(name): pk for pk, name in Company.objects.values_list('id', 'name')}
+        self.categories = {_normalize(name): pk for pk, name in Category.objects.values_list('id', 'name')}
+        self.projects = {_normalize(name): pk for pk, name in Project.objects.values_list('id', 'name')}
+
+        self.users = {}
+        for pk, username, email in User.objects.filter(is_active=True).values_list('id', 'username', 'email'):
+            self.users[_normalize(username)] = pk
+            if email:
+                self.users.setdefault(_normalize(email), pk)
+
+        self.priorities = {}
+        for code, label in Ticket.PRIORITY_CHOICES:
+            self.priorities[code] = code
+            self.priorities[_normalize(label)] = code
+        self.ticket_types = {}
+        for code, label in Ticket.TYPE_CHOICES:
+            self.ticket_types[code] = code
+            self.ticket_types[_normalize(label)] = code
+
+        self.lookups_loaded = True
+
+    def resolve(self, catalog, value, label):
+        key = _normalize(value)
+        if key not in catalog:
+            raise ImportRowError(f'{label} "{_cell_text(value)}" no existe')
+        return catalog[key]
+
+    # ---------------------------------------------------------------- rows
+
+    def iter_rows(self, excel_file):
+        """Recorre las filas del Excel en streaming y devuelve (número de fila, {columna: valor})"""
+        import openpyxl
+
+        try:
+            workbook = openpyxl.load_workbook(excel_file, read_only=True, data_only=True)
+        except Exception as e:
+            raise TicketImportError(f'Error al leer el archivo Excel: {str(e)}')
+
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None) or ()
+            columns = [_cell_text(name) for name in header]
+
+            missing_columns = [column for column in REQUIRED_COLUMNS if column not in columns]
+            if missing_columns:
+                raise TicketImportError(f'Faltan las siguientes columnas en el Excel: {", ".join(missing_columns)}')
+
+            indexes = {
+                column: columns.index(column)
+                for column in REQUIRED_COLUMNS + OPTIONAL_COLUMNS if column in columns
+            }
+            for row_number, row in enumerate(rows, start=2):
+                if not row or all(value is None or _cell_text(value) == '' for value in row):
+                    continue
+                yield row_number, {
+                    column: row[index] if index < len(row) else None
+                    for column, index in indexes.items()
+                }
+        finally:
+            workbook.close()
+
+    def build_ticket(self, values):
+        """Valida una fila y devuelve el Ticket (sin guardar) o lanza ImportRowError"""
+        title = _cell_text(values.get('Título'))
+        description = _cell_text(values.get('Descripción'))
+
+        if not title:
+            raise ImportRowError('El título está vacío')
+        if len(title) > TITLE_MAX_LENGTH:
+            raise ImportRowError(f'El título supera los {TITLE_MAX_LENGTH} caracteres')
+        if not description:
+            raise ImportRowError('La descripción está vacía')
+
+        ticket = Ticket(
+            title=title,
+            description=description,
+            company_id=self.company.pk if self.company else None,
+            category_id=self.category.pk if self.category else None,
+            priority=self.priority,
+            status='open',
+            created_by=self.user,
+            assigned_to=None,  # Se puede asignar manualmente después
+        )
+
+        if _cell_text(values.get('Empresa')):
+            ticket.company_id = self.resolve(self.companies, values['Empresa'], 'La empresa')
+        if _cell_text(values.get('Categoría')):
+            ticket.category_id = self.resolve(self.categories, values['Categoría'], 'La categoría')
+        if _cell_text(values.get('Proyecto')):
+            ticket.project_id = self.resolve(self.projects, values['Proyecto'], 'El proyecto')
+        if _cell_text(values.get('Prioridad')):
+            ticket.priority = self.resolve(self.priorities, values['Prioridad'], 'La prioridad')
+        if _cell_text(values.get('Tipo')):
+            ticket.ticket_type = self.resolve(self.ticket_types, values['Tipo'], 'El tipo')
+        if _cell_text(values.get('Asignado a')):
+            ticket.assigned_to_id = self.resolve(self.users, values['Asignado a'], 'El usuario')
+        if _cell_text(values.get('Horas')):
+            try:
+                ticket.hours = Decimal(_cell_text(values['Horas'])).quantize(Decimal('0.01'))
+            except InvalidOperation:
+                raise ImportRowError(f'Las horas "{_cell_text(values["Horas"])}" no son un número válido')
+            if ticket.hours < 0 or ticket.hours >= 10000:
+                raise ImportRowError('Las horas deben estar entre 0 y 9999.99')
+
+        return ticket
+
+    # ----------------------------------------------------------------- run
+
+    def run(self, excel_file):
+        """
+        Importa (o valida, con ``dry_run``) el Excel y devuelve un TicketImportResult.
+
+        Los errores de formato del archivo se lanzan como TicketImportError; los
+        de cada fila se acumulan en el resultado y esa fila se omite.
+        """
+        self.load_lookups()
+        result = TicketImportResult(dry_run=self.dry_run)
+
+        # Todo el archivo en una transacción: si falla la base de datos no
+        # quedan importaciones a medias
+        with transaction.atomic():
+            chunk = []
+            for row_number, values in self.iter_rows(excel_file):
+                result.total_rows += 1
+                try:
+                    chunk.append(self.build_ticket(values))
+                except ImportRowError as e:
+                    result.add_error(row_number, str(e))
+                    continue
+
+                result.valid_rows += 1
+                if len(chunk) >= self.chunk_size:
+                    self.save_chunk(chunk, result)
+                    chunk = []
+            if chunk:
+                self.save_chunk(chunk, result)
+
+        if result.created and self.notify:
+            transaction.on_commit(lambda: self.send_summary(result))
+
+        logger.info(
+            f'Importación de tickets de {self.user.username}: {result.created_count} creados, '
+            f'{result.error_count} errores, {result.total_rows} filas'
+            + (' (solo validación)' if self.dry_run else '')
+        )
+        return result
+
+    def save_chunk(self, tickets, result):
+        if self.dry_run:
+            return
+        Ticket.assign_ticket_numbers(tickets)
+        Ticket.objects.bulk_create(tickets, batch_size=self.chunk_size)
+        # bulk_create no lanza post_save: indexar el lote para la búsqueda
+        index_objects('ticket', tickets)
+        result.created.extend(tickets)
+
+    def send_summary(self, result):
+        try:
+            from .telegram_utils import notify_tickets_imported
+            notify_tickets_imported(self.user, result.created)
+        except Exception as e:
+            logger.error(f'Error al notificar la importación de tickets: {e}')
@@ -1,10 +1,28 @@
 from django.urls import path, include
-from . import views
+from .lazy_views import lazy_views
+
+# Cada módulo de vistas se importa con la primera petición que lo necesita
+views = lazy_views('tickets.views')
+ai_views = lazy_views('tickets.ai_views')
+analytics_views = lazy_views('tickets.analytics_views')
+blog_views = lazy_views('tickets.blog_views')
+chatbot_views = lazy_views('tickets.chatbot_views')
+course_views = lazy_views('tickets.course_views')
+crm_views = lazy_views('tickets.crm_views')
+finance_views = lazy_views('tickets.finance_views')
+hr_views = lazy_views('tickets.hr_views')
+odoo_views = lazy_views('tickets.odoo_views')
+search_views = lazy_views('tickets.search_views')
+social_views = lazy_views('tickets.social_views')
+whatsapp_views = lazy_views('tickets.whatsapp_views')
 
 urlpatterns = [
     path('', views.home_view, name='home'),
     path('dashboard/', views.dashboard_view, name='dashboard'),
     
+    # Búsqueda global (paleta de comandos)
+    path('search/', search_views.global_search, name='global_search'),
+    
     # URLs de tickets
     path('ticket-show-chart/', views.ticket_chart, name='ticket_chart'),
     path('tickets/', views.ticket_list_view, name='ticket_list'),
@@ -30,6 +48,8 @@ urlpatterns = [
     
     # URL para exportación múltiple de tickets a PDF
     path('tickets/export/pdf/', views.tickets_export_pdf, name='tickets_export_pdf'),
+    path('pdf-exports/<int:pk>/', views.pdf_export_job_detail, name='pdf_export_job_detail'),
+    path('pdf-exports/<int:pk>/download/', views.pdf_export_job_download, name='pdf_export_job_download'),
     
     # URL AJAX para obtener IDs de tickets filtrados
     path('tickets/filtered-ids/', views.get_filtered_ticket_ids, name='get_filtered_ticket_ids'),
@@ -44,9 +64,9 @@ urlpatterns = [
     # path('tickets/<int:pk>/todo/generate-ai/', views.ticket_todo_generate_ai, name='ticket_todo_generate_ai'),
     
     # URLs públicas de cursos (sin autenticación) - DEBEN IR ANTES que la ruta genérica de tickets
-    path('public/courses/<uuid:token>/', views.course_public, name='course_public'),
-    path('public/courses/<uuid:token>/approval/', views.course_approval, name='course_approval'),
-    path('public/courses/<uuid:token>/classes/<int:class_id>/', views.course_class_public, name='course_class_public'),
+    path('public/courses/<uuid:token>/', course_views.course_public, name='course_public'),
+    path('public/courses/<uuid:token>/approval/', course_views.course_approval, name='course_approval'),
+    path('public/courses/<uuid:token>/classes/<int:class_id>/', course_views.course_class_public, name='course_class_public'),
     
     # Vista pública de conceptos (sin autenticación requerida)
     path('public/concepts/', views.public_concepts_view, name='public_concepts'),
@@ -159,29 +179,29 @@ urlpatterns = [
     path('api/user-tickets/<int:user_id>/', views.api_user_tickets, name='api_user_tickets'),
     
     # URLs para Control de Horario (solo para agentes)
-    path('time-clock/', views.time_clock_view, name='time_clock'),
-    path('time-clock/start/', views.time_start_work, name='time_start_work'),
-    path('time-clock/end/', views.time_end_work, name='time_end_work'),
-    path('time-entries/', views.time_entries_list, name='time_entries_list'),
-    path('time-entries/export/excel/', views.time_entries_export_excel, name='time_entries_export_excel'),
-    path('time-entries/<int:entry_id>/', views.time_entry_detail, name='time_entry_detail'),
-    path('time-entries/<int:entry_id>/edit/', views.time_entry_edit, name='time_entry_edit'),
-    path('time-entries/<int:entry_id>/audit/', views.time_entry_audit_log, name='time_entry_audit_log'),
+    path('time-clock/', hr_views.time_clock_view, name='time_clock'),
+    path('time-clock/start/', hr_views.time_start_work, name='time_start_work'),
+    path('time-clock/end/', hr_views.time_end_work, name='time_end_work'),
+    path('time-entries/', hr_views.time_entries_list, name='time_entries_list'),
+    path('time-entries/export/excel/', hr_views.time_entries_export_excel, name='time_entries_export_excel'),
+    path('time-entries/<int:entry_id>/', hr_views.time_entry_detail, name='time_entry_detail'),
+    path('time-entries/<int:entry_id>/edit/', hr_views.time_entry_edit, name='time_entry_edit'),
+    path('time-entries/<int:entry_id>/audit/', hr_views.time_entry_audit_log, name='time_entry_audit_log'),
     
     # URLs públicas de control de horario (sin login)
-    path('public-time/<str:token>/', views.public_time_clock, name='public_time_clock'),
+    path('public-time/<str:token>/', hr_views.public_time_clock, name='public_time_clock'),
     
     # Gestión de accesos públicos de horario (solo agentes)
-    path('public-time-access/', views.public_time_access_list, name='public_time_access_list'),
-    path('public-time-access/create/<int:user_id>/', views.public_time_access_create, name='public_time_access_create'),
-    path('public-time-access/<int:access_id>/edit/', views.public_time_access_edit, name='public_time_access_edit'),
-    path('public-time-access/<int:access_id>/delete/', views.public_time_access_delete, name='public_time_access_delete'),
+    path('public-time-access/', hr_views.public_time_access_list, name='public_time_access_list'),
+    path('public-time-access/create/<int:user_id>/', hr_views.public_time_access_create, name='public_time_access_create'),
+    path('public-time-access/<int:access_id>/edit/', hr_views.public_time_access_edit, name='public_time_access_edit'),
+    path('public-time-access/<int:access_id>/delete/', hr_views.public_time_access_delete, name='public_time_access_delete'),
     
     # Control de asistencia general (para agentes)
-    path('attendance/', views.attendance_overview, name='attendance_overview'),
+    path('attendance/', hr_views.attendance_overview, name='attendance_overview'),
     
     # API AJAX para estado de tiempo actual
-    path('api/time-status/', views.ajax_current_time_status, name='ajax_time_status'),
+    path('api/time-status/', hr_views.ajax_current_time_status, name='ajax_time_status'),
     
     # URLs de gestión de empresas (solo para agentes)
     path('companies/', views.company_list_view, name='company_list'),
@@ -202,33 +222,33 @@ urlpatterns = [
     path('documents/<int:document_id>/download/', views.document_download_private_view, name='document_download_private'),
     
     # URLs de Generador de Libros con IA (solo para agentes)
-    path('ai-books/', views.ai_book_list, name='ai_book_list'),
-    path('ai-books/create/', views.ai_book_create, name='ai_book_create'),
-    path('ai-books/<int:pk>/', views.ai_book_detail, name='ai_book_detail'),
-    path('ai-books/<int:pk>/edit/', views.ai_book_edit, name='ai_book_edit'),
-    path('ai-books/<int:pk>/delete/', views.ai_book_delete, name='ai_book_delete'),
-    path('ai-books/<int:pk>/export/', views.ai_book_export, name='ai_book_export'),
-    path('ai-books/<int:pk>/propose-chapters/', views.ai_book_propose_chapters, name='ai_book_propose_chapters'),
-    path('ai-books/<int:pk>/generate-chapters/', views.ai_book_generate_chapters_ai, name='ai_book_generate_chapters_ai'),
-    path('ai-books/<int:pk>/chapters/<int:chapter_id>/', views.ai_book_chapter_detail, name='ai_book_chapter_detail'),
-    path('ai-books/<int:pk>/chapters/<int:chapter_id>/edit-title/', views.ai_book_chapter_edit_title, name='ai_book_chapter_edit_title'),
-    path('ai-books/<int:pk>/chapters/<int:chapter_id>/delete/', views.ai_book_chapter_delete, name='ai_book_chapter_delete'),
-    path('ai-books/<int:pk>/chapters/<int:chapter_id>/generate-summary/', views.ai_book_chapter_generate_summary, name='ai_book_chapter_generate_summary'),
-    path('ai-books/<int:pk>/chapters/<int:chapter_id>/generate-content/', views.ai_book_chapter_generate_content, name='ai_book_chapter_generate_content'),
-    path('ai-books/<int:pk>/chapters/<int:chapter_id>/save-content/', views.ai_book_chapter_save_content, name='ai_book_chapter_save_content'),
-    path('ai-books/<int:pk>/chapters/<int:chapter_id>/save-summary/', views.ai_book_chapter_save_summary, name='ai_book_chapter_save_summary'),
+    path('ai-books/', ai_views.ai_book_list, name='ai_book_list'),
+    path('ai-books/create/', ai_views.ai_book_create, name='ai_book_create'),
+    path('ai-books/<int:pk>/', ai_views.ai_book_detail, name='ai_book_detail'),
+    path('ai-books/<int:pk>/edit/', ai_views.ai_book_edit, name='ai_book_edit'),
+    path('ai-books/<int:pk>/delete/', ai_views.ai_book_delete, name='ai_book_delete'),
+    path('ai-books/<int:pk>/export/', ai_views.ai_book_export, name='ai_book_export'),
+    path('ai-books/<int:pk>/propose-chapters/', ai_views.ai_book_propose_chapters, name='ai_book_propose_chapters'),
+    path('ai-books/<int:pk>/generate-chapters/', ai_views.ai_book_generate_chapters_ai, name='ai_book_generate_chapters_ai'),
+    path('ai-books/<int:pk>/chapters/<int:chapter_id>/', ai_views.ai_book_chapter_detail, name='ai_book_chapter_detail'),
+    path('ai-books/<int:pk>/chapters/<int:chapter_id>/edit-title/', ai_views.ai_book_chapter_edit_title, name='ai_book_chapter_edit_title'),
+    path('ai-books/<int:pk>/chapters/<int:chapter_id>/delete/', ai_views.ai_book_chapter_delete, name='ai_book_chapter_delete'),
+    path('ai-books/<int:pk>/chapters/<int:chapter_id>/generate-summary/', ai_views.ai_book_chapter_generate_summary, name='ai_book_chapter_generate_summary'),
+    path('ai-books/<int:pk>/chapters/<int:chapter_id>/generate-content/', ai_views.ai_book_chapter_generate_content, name='ai_book_chapter_generate_content'),
+    path('ai-books/<int:pk>/chapters/<int:chapter_id>/save-content/', ai_views.ai_book_chapter_save_content, name='ai_book_chapter_save_content'),
+    path('ai-books/<int:pk>/chapters/<int:chapter_id>/save-summary/', ai_views.ai_book_chapter_save_summary, name='ai_book_chapter_save_summary'),
     
     # URLs de Generador de Artículos con IA (solo para agentes)
-    path('ai-articles/', views.ai_article_project_list, name='ai_article_project_list'),
-    path('ai-articles/create/', views.ai_article_project_create, name='ai_article_project_create'),
-    path('ai-articles/<int:pk>/proposals/', views.ai_article_project_proposals, name='ai_article_project_proposals'),
-    path('ai-articles/<int:pk>/edit/', views.ai_article_project_edit, name='ai_article_project_edit'),
-    path('ai-articles/<int:pk>/generate-proposals/', views.ai_article_generate_proposals, name='ai_article_generate_proposals'),
-    path('ai-articles/<int:pk>/delete/', views.ai_article_project_delete, name='ai_article_project_delete'),
-    path('ai-articles/<int:pk>/<int:article_id>/', views.ai_article_detail, name='ai_article_detail'),
-    path('ai-articles/<int:pk>/<int:article_id>/edit-keywords/', views.ai_article_edit_keywords, name='ai_article_edit_keywords'),
-    path('ai-articles/<int:pk>/<int:article_id>/generate-content/', views.ai_article_generate_content, name='ai_article_generate_content'),
-    path('ai-articles/<int:pk>/<int:article_id>/delete/', views.ai_article_delete, name='ai_article_delete'),
+    path('ai-articles/', ai_views.ai_article_project_list, name='ai_article_project_list'),
+    path('ai-articles/create/', ai_views.ai_article_project_create, name='ai_article_project_create'),
+    path('ai-articles/<int:pk>/proposals/', ai_views.ai_article_project_proposals, name='ai_article_project_proposals'),
+    path('ai-articles/<int:pk>/edit/', ai_views.ai_article_project_edit, name='ai_article_project_edit'),
+    path('ai-articles/<int:pk>/generate-proposals/', ai_views.ai_article_generate_proposals, name='ai_article_generate_proposals'),
+    path('ai-articles/<int:pk>/delete/', ai_views.ai_article_project_delete, name='ai_article_project_delete'),
+    path('ai-articles/<int:pk>/<int:article_id>/', ai_views.ai_article_detail, name='ai_article_detail'),
+    path('ai-articles/<int:pk>/<int:article_id>/edit-keywords/', ai_views.ai_article_edit_keywords, name='ai_article_edit_keywords'),
+    path('ai-articles/<int:pk>/<int:article_id>/generate-content/', ai_views.ai_article_generate_content, name='ai_article_generate_content'),
+    path('ai-articles/<int:pk>/<int:article_id>/delete/', ai_views.ai_article_delete, name='ai_article_delete'),
     
     # URLs públicas para compartir documentos (sin autenticación)
     path('document/public/<uuid:token>/', views.document_public_view, name='document_public'),
@@ -301,27 +321,27 @@ urlpatterns = [
     path('tasks/<int:pk>/toggle-status/', views.task_toggle_status_view, name='task_toggle_status'),
     
     # ============= URLs CHATBOTS =============
-    path('chatbots/', views.chatbot_list, name='chatbot_list'),
-    path('chatbots/create/', views.chatbot_create, name='chatbot_create'),
-    path('chatbots/<int:pk>/', views.chatbot_detail, name='chatbot_detail'),
-    path('chatbots/<int:pk>/stats-api/', views.chatbot_stats_api, name='chatbot_stats_api'),
-    path('chatbots/<int:pk>/edit/', views.chatbot_edit, name='chatbot_edit'),
-    path('chatbots/<int:pk>/delete/', views.chatbot_delete, name='chatbot_delete'),
-    path('chatbots/<int:pk>/conversations/', views.chatbot_conversations, name='chatbot_conversations'),
-    path('chatbots/<int:pk>/conversations/<int:conversation_id>/', views.chatbot_conversation_detail, name='chatbot_conversation_detail'),
-    path('chatbots/<int:pk>/conversations/<int:conversation_id>/reply/', views.chatbot_conversation_reply, name='chatbot_conversation_reply'),
-    path('chatbots/<int:pk>/conversations/<int:conversation_id>/delete/', views.chatbot_conversation_delete, name='chatbot_conversation_delete'),
-    path('chatbots/<int:pk>/conversations/<int:conversation_id>/toggle-hide/', views.chatbot_conversation_toggle_hide, name='chatbot_conversation_toggle_hide'),
-    path('chatbots/<int:pk>/conversations/<int:conversation_id>/toggle-reviewed/', views.chatbot_conversation_toggle_reviewed, name='chatbot_conversation_toggle_reviewed'),
-    path('chatbots/<int:pk>/questions/create/', views.chatbot_question_create, name='chatbot_question_create'),
-    path('chatbots/<int:pk>/questions/<int:question_id>/edit/', views.chatbot_question_edit, name='chatbot_question_edit'),
-    path('chatbots/<int:pk>/questions/<int:question_id>/delete/', views.chatbot_question_delete, name='chatbot_question_delete'),
-    path('chatbot/widget/<str:token>/', views.chatbot_widget, name='chatbot_widget'),
-    path('chatbot/script/<str:token>/', views.chatbot_script, name='chatbot_script'),
-    path('chatbot/chat/<str:token>/', views.chatbot_chat, name='chatbot_chat'),
-    path('chatbot/messages/<str:token>/', views.chatbot_get_new_messages, name='chatbot_get_new_messages'),
-    path('chatbot/click/<str:token>/', views.chatbot_register_click, name='chatbot_register_click'),
-    path('api/chatbot/unreviewed/', views.chatbot_unreviewed_conversations, name='chatbot_unreviewed_conversations'),
+    path('chatbots/', chatbot_views.chatbot_list, name='chatbot_list'),
+    path('chatbots/create/', chatbot_views.chatbot_create, name='chatbot_create'),
+    path('chatbots/<int:pk>/', chatbot_views.chatbot_detail, name='chatbot_detail'),
+    path('chatbots/<int:pk>/stats-api/', chatbot_views.chatbot_stats_api, name='chatbot_stats_api'),
+    path('chatbots/<int:pk>/edit/', chatbot_views.chatbot_edit, name='chatbot_edit'),
+    path('chatbots/<int:pk>/delete/', chatbot_views.chatbot_delete, name='chatbot_delete'),
+    path('chatbots/<int:pk>/conversations/', chatbot_views.chatbot_conversations, name='chatbot_conversations'),
+    path('chatbots/<int:pk>/conversations/<int:conversation_id>/', chatbot_views.chatbot_conversation_detail, name='chatbot_conversation_detail'),
+    path('chatbots/<int:pk>/conversations/<int:conversation_id>/reply/', chatbot_views.chatbot_conversation_reply, name='chatbot_conversation_reply'),
+    path('chatbots/<int:pk>/conversations/<int:conversation_id>/delete/', chatbot_views.chatbot_conversation_delete, name='chatbot_conversation_delete'),
+    path('chatbots/<int:pk>/conversations/<int:conversation_id>/toggle-hide/', chatbot_views.chatbot_conversation_toggle_hide, name='chatbot_conversation_toggle_hide'),
+    path('chatbots/<int:pk>/conversations/<int:conversation_id>/toggle-reviewed/', chatbot_views.chatbot_conversation_toggle_reviewed, name='chatbot_conversation_toggle_reviewed'),
+    path('chatbots/<int:pk>/questions/create/', chatbot_views.chatbot_question_create, name='chatbot_question_create'),
+    path('chatbots/<int:pk>/questions/<int:question_id>/edit/', chatbot_views.chatbot_question_edit, name='chatbot_question_edit'),
+    path('chatbots/<int:pk>/questions/<int:question_id>/delete/', chatbot_views.chatbot_question_delete, name='chatbot_question_delete'),
+    path('chatbot/widget/<str:token>/', chatbot_views.chatbot_widget, name='chatbot_widget'),
+    path('chatbot/script/<str:token>/', chatbot_views.chatbot_script, name='chatbot_script'),
+    path('chatbot/chat/<str:token>/', chatbot_views.chatbot_chat, name='chatbot_chat'),
+    path('chatbot/messages/<str:token>/', chatbot_views.chatbot_get_new_messages, name='chatbot_get_new_messages'),
+    path('chatbot/click/<str:token>/', chatbot_views.chatbot_register_click, name='chatbot_register_click'),
+    path('api/chatbot/unreviewed/', chatbot_views.chatbot_unreviewed_conversations, name='chatbot_unreviewed_conversations'),
     
     # URLs de control diario de tareas
     path('task-control/', views.task_control_dashboard, name='task_control_dashboard'),
@@ -371,90 +391,90 @@ urlpatterns = [
     path('company/stats/<str:token>/', views.public_company_stats, name='public_company_stats'),
     
     # ============= URLs DASHBOARD =============
-    path('business-dashboard/', views.business_dashboard, name='business_dashboard'),
-    path('business-dashboard/public/<str:token>/', views.business_dashboard_public, name='business_dashboard_public'),
-    path('business-dashboard/generate-token/', views.generate_dashboard_token, name='generate_dashboard_token'),
+    path('business-dashboard/', crm_views.business_dashboard, name='business_dashboard'),
+    path('business-dashboard/public/<str:token>/', crm_views.business_dashboard_public, name='business_dashboard_public'),
+    path('business-dashboard/generate-token/', crm_views.generate_dashboard_token, name='generate_dashboard_token'),
     
     # ============= URLs CONTACTOS =============
-    path('contacts/', views.contact_list, name='contact_list'),
-    path('contacts/stage-tracking/', views.contact_stage_tracking, name='contact_stage_tracking'),
-    path('contacts/<int:pk>/stage-tracking/', views.contact_individual_stage_tracking, name='contact_individual_stage_tracking'),
-    path('contacts/<int:pk>/update-stage/', views.contact_update_stage, name='contact_update_stage'),
-    path('contacts/<int:pk>/save-stage-comment/', views.contact_save_stage_comment, name='contact_save_stage_comment'),
-    path('contacts/<int:pk>/get-stage-comments/', views.contact_get_stage_comments, name='contact_get_stage_comments'),
-    path('contacts/generate-sales-report/', views.generate_sales_report, name='generate_sales_report'),
-    path('contacts/chart/', views.contact_chart, name='contact_chart'),
-    path('contacts/create/', views.contact_create, name='contact_create'),
-    path('contacts/autocomplete-ai/', views.contact_autocomplete_ai, name='contact_autocomplete_ai'),
-    path('contacts/<int:pk>/', views.contact_detail, name='contact_detail'),
-    path('contacts/<int:pk>/edit/', views.contact_edit, name='contact_edit'),
-    path('contacts/<int:pk>/delete/', views.contact_delete, name='contact_delete'),
-    path('contacts/delete-all/', views.contact_delete_all, name='contact_delete_all'),
-    path('contacts/<int:pk>/convert-to-company/', views.convert_contact_to_company, name='convert_contact_to_company'),
+    path('contacts/', crm_views.contact_list, name='contact_list'),
+    path('contacts/stage-tracking/', crm_views.contact_stage_tracking, name='contact_stage_tracking'),
+    path('contacts/<int:pk>/stage-tracking/', crm_views.contact_individual_stage_tracking, name='contact_individual_stage_tracking'),
+    path('contacts/<int:pk>/update-stage/', crm_views.contact_update_stage, name='contact_update_stage'),
+    path('contacts/<int:pk>/save-stage-comment/', crm_views.contact_save_stage_comment, name='contact_save_stage_comment'),
+    path('contacts/<int:pk>/get-stage-comments/', crm_views.contact_get_stage_comments, name='contact_get_stage_comments'),
+    path('contacts/generate-sales-report/', crm_views.generate_sales_report, name='generate_sales_report'),
+    path('contacts/chart/', crm_views.contact_chart, name='contact_chart'),
+    path('contacts/create/', crm_views.contact_create, name='contact_create'),
+    path('contacts/autocomplete-ai/', crm_views.contact_autocomplete_ai, name='contact_autocomplete_ai'),
+    path('contacts/<int:pk>/', crm_views.contact_detail, name='contact_detail'),
+    path('contacts/<int:pk>/edit/', crm_views.contact_edit, name='contact_edit'),
+    path('contacts/<int:pk>/delete/', crm_views.contact_delete, name='contact_delete'),
+    path('contacts/delete-all/', crm_views.contact_delete_all, name='contact_delete_all'),
+    path('contacts/<int:pk>/convert-to-company/', crm_views.convert_contact_to_company, name='convert_contact_to_company'),
     
     # URLs para comentarios de contactos
-    path('contact-comments/<int:pk>/delete/', views.contact_comment_delete, name='contact_comment_delete'),
+    path('contact-comments/<int:pk>/delete/', crm_views.contact_comment_delete, name='contact_comment_delete'),
     
     # URLs para adjuntos de contactos
-    path('contact-attachments/<int:pk>/delete/', views.contact_attachment_delete, name='contact_attachment_delete'),
-    path('contact-attachments/<int:pk>/download/', views.contact_attachment_download, name='contact_attachment_download'),
+    path('contact-attachments/<int:pk>/delete/', crm_views.contact_attachment_delete, name='contact_attachment_delete'),
+    path('contact-attachments/<int:pk>/download/', crm_views.contact_attachment_download, name='contact_attachment_download'),
     
     # URL para comentarios asistidos por IA
-    path('contacts/<int:pk>/ai-comment/', views.contact_ai_comment, name='contact_ai_comment'),
+    path('contacts/<int:pk>/ai-comment/', crm_views.contact_ai_comment, name='contact_ai_comment'),
     
     # URL para crear actividad desde contacto
-    path('contacts/<int:contact_id>/create-activity/', views.activity_create_from_contact, name='activity_create_from_contact'),
+    path('contacts/<int:contact_id>/create-activity/', crm_views.activity_create_from_contact, name='activity_create_from_contact'),
     
     # URL para crear actividad rápida desde contacto (AJAX)
-    path('contacts/<int:contact_id>/quick-activity/', views.create_quick_activity, name='create_quick_activity'),
+    path('contacts/<int:contact_id>/quick-activity/', crm_views.create_quick_activity, name='create_quick_activity'),
     
     # APIs de etiquetas de contacto
-    path('api/contact-tags/', views.contact_tags_api, name='contact_tags_api'),
-    path('api/contact-tags/create/', views.contact_tag_create_api, name='contact_tag_create_api'),
+    path('api/contact-tags/', crm_views.contact_tags_api, name='contact_tags_api'),
+    path('api/contact-tags/create/', crm_views.contact_tag_create_api, name='contact_tag_create_api'),
     
     # ============= URLs PLAN DE VENTAS =============
-    path('sales-plans/', views.sales_plan_list, name='sales_plan_list'),
-    path('sales-plans/create/', views.sales_plan_create, name='sales_plan_create'),
-    path('sales-plans/<int:pk>/edit/', views.sales_plan_edit, name='sales_plan_edit'),
-    path('sales-plans/<int:pk>/delete/', views.sales_plan_delete, name='sales_plan_delete'),
+    path('sales-plans/', crm_views.sales_plan_list, name='sales_plan_list'),
+    path('sales-plans/create/', crm_views.sales_plan_create, name='sales_plan_create'),
+    path('sales-plans/<int:pk>/edit/', crm_views.sales_plan_edit, name='sales_plan_edit'),
+    path('sales-plans/<int:pk>/delete/', crm_views.sales_plan_delete, name='sales_plan_delete'),
     
     # ============= URLs CRM =============
-    path('crm/', views.crm_dashboard, name='crm_dashboard'),
-    path('crm/opportunities/', views.opportunity_list, name='opportunity_list'),
-    path('crm/opportunities/create/', views.opportunity_create, name='opportunity_create'),
-    path('crm/opportunities/<int:pk>/', views.opportunity_detail, name='opportunity_detail'),
-    path('crm/opportunities/<int:pk>/edit/', views.opportunity_edit, name='opportunity_edit'),
-    path('crm/opportunities/<int:pk>/delete/', views.opportunity_delete, name='opportunity_delete'),
-    path('crm/opportunities/<int:pk>/add-note/', views.opportunity_add_note, name='opportunity_add_note'),
+    path('crm/', crm_views.crm_dashboard, name='crm_dashboard'),
+    path('crm/opportunities/', crm_views.opportunity_list, name='opportunity_list'),
+    path('crm/opportunities/create/', crm_views.opportunity_create, name='opportunity_create'),
+    path('crm/opportunities/<int:pk>/', crm_views.opportunity_detail, name='opportunity_detail'),
+    path('crm/opportunities/<int:pk>/edit/', crm_views.opportunity_edit, name='opportunity_edit'),
+    path('crm/opportunities/<int:pk>/delete/', crm_views.opportunity_delete, name='opportunity_delete'),
+    path('crm/opportunities/<int:pk>/add-note/', crm_views.opportunity_add_note, name='opportunity_add_note'),
     
     # URLs de actividades de oportunidades
-    path('crm/opportunities/<int:opportunity_id>/activities/create/', views.opportunity_activity_create, name='opportunity_activity_create'),
-    path('crm/opportunities/<int:opportunity_id>/activities/', views.opportunity_activity_list, name='opportunity_activity_list'),
-    path('crm/activities/<int:pk>/', views.opportunity_activity_detail, name='opportunity_activity_detail'),
-    path('crm/activities/<int:pk>/edit/', views.opportunity_activity_edit, name='opportunity_activity_edit'),
-    path('crm/activities/<int:pk>/complete/', views.opportunity_activity_complete, name='opportunity_activity_complete'),
-    path('crm/activities/<int:pk>/delete/', views.opportunity_activity_delete, name='opportunity_activity_delete'),
-    path('crm/my-activities/', views.my_activities_dashboard, name='my_activities_dashboard'),
-    path('crm/activities/create/', views.activity_create_standalone, name='activity_create_standalone'),
+    path('crm/opportunities/<int:opportunity_id>/activities/create/', crm_views.opportunity_activity_create, name='opportunity_activity_create'),
+    path('crm/opportunities/<int:opportunity_id>/activities/', crm_views.opportunity_activity_list, name='opportunity_activity_list'),
+    path('crm/activities/<int:pk>/', crm_views.opportunity_activity_detail, name='opportunity_activity_detail'),
+    path('crm/activities/<int:pk>/edit/', crm_views.opportunity_activity_edit, name='opportunity_activity_edit'),
+    path('crm/activities/<int:pk>/complete/', crm_views.opportunity_activity_complete, name='opportunity_activity_complete'),
+    path('crm/activities/<int:pk>/delete/', crm_views.opportunity_activity_delete, name='opportunity_activity_delete'),
+    path('crm/my-activities/', crm_views.my_activities_dashboard, name='my_activities_dashboard'),
+    path('crm/activities/create/', crm_views.activity_create_standalone, name='activity_create_standalone'),
     
     # API para actividades pendientes
-    path('api/user-activities/pending/', views.api_user_activities_pending, name='api_user_activities_pending'),
+    path('api/user-activities/pending/', crm_views.api_user_activities_pending, name='api_user_activities_pending'),
     
     # API para calendario de actividades
-    path('api/activities/calendar/', views.api_activities_calendar, name='api_activities_calendar'),
+    path('api/activities/calendar/', crm_views.api_activities_calendar, name='api_activities_calendar'),
     
     # URLs de gestión de estados CRM (solo para agentes)
-    path('crm/status/', views.opportunity_status_list, name='opportunity_status_list'),
-    path('crm/status/create/', views.opportunity_status_create, name='opportunity_status_create'),
-    path('crm/status/<int:pk>/edit/', views.opportunity_status_edit, name='opportunity_status_edit'),
-    path('crm/status/<int:pk>/delete/', views.opportunity_status_delete, name='opportunity_status_delete'),
+    path('crm/status/', crm_views.opportunity_status_list, name='opportunity_status_list'),
+    path('crm/status/create/', crm_views.opportunity_status_create, name='opportunity_status_create'),
+    path('crm/status/<int:pk>/edit/', crm_views.opportunity_status_edit, name='opportunity_status_edit'),
+    path('crm/status/<int:pk>/delete/', crm_views.opportunity_status_delete, name='opportunity_status_delete'),
     
     # URLs de Preguntas CRM
-    path('crm/questions/', views.crm_questions_list, name='crm_questions_list'),
-    path('crm/questions/create/', views.crm_question_create, name='crm_question_create'),
-    path('crm/questions/<int:pk>/', views.crm_question_detail, name='crm_question_detail'),
-    path('crm/questions/<int:pk>/edit/', views.crm_question_edit, name='crm_question_edit'),
-    path('crm/questions/<int:pk>/delete/', views.crm_question_delete, name='crm_question_delete'),
+    path('crm/questions/', crm_views.crm_questions_list, name='crm_questions_list'),
+    path('crm/questions/create/', crm_views.crm_question_create, name='crm_question_create'),
+    path('crm/questions/<int:pk>/', crm_views.crm_question_detail, name='crm_question_detail'),
+    path('crm/questions/<int:pk>/edit/', crm_views.crm_question_edit, name='crm_question_edit'),
+    path('crm/questions/<int:pk>/delete/', crm_views.crm_question_delete, name='crm_question_delete'),
 
     # URLs de Levantamiento de Procesos
     path('crm/process-surveys/', views.process_survey_list, name='process_survey_list'),
@@ -512,39 +532,39 @@ urlpatterns = [
     path('crm/project-info/line/attach/<int:pk>/delete/', views.pi_line_attachment_delete, name='pi_line_attachment_delete'),
 
     # URLs de Reuniones
-    path('meetings/', views.meeting_list_view, name='meeting_list'),
-    path('meetings/create/', views.meeting_create_view, name='meeting_create'),
-    path('meetings/<int:pk>/', views.meeting_detail_view, name='meeting_detail'),
-    path('meetings/<int:pk>/edit/', views.meeting_edit_view, name='meeting_edit'),
-    path('meetings/<int:pk>/delete/', views.meeting_delete_view, name='meeting_delete'),
-    path('meetings/<int:pk>/print/', views.meeting_print_view, name='meeting_print'),
-    path('meetings/<int:pk>/pdf/', views.meeting_pdf_download_view, name='meeting_pdf_download'),
-    path('meetings/<int:pk>/questions/', views.meeting_questions_view, name='meeting_questions'),
-    path('meetings/<int:pk>/attendees/', views.meeting_attendees_view, name='meeting_attendees'),
-    path('meetings/<int:pk>/add-link/', views.meeting_add_link_view, name='meeting_add_link'),
-    path('meetings/link/<int:link_id>/delete/', views.meeting_delete_link_view, name='meeting_delete_link'),
+    path('meetings/', crm_views.meeting_list_view, name='meeting_list'),
+    path('meetings/create/', crm_views.meeting_create_view, name='meeting_create'),
+    path('meetings/<int:pk>/', crm_views.meeting_detail_view, name='meeting_detail'),
+    path('meetings/<int:pk>/edit/', crm_views.meeting_edit_view, name='meeting_edit'),
+    path('meetings/<int:pk>/delete/', crm_views.meeting_delete_view, name='meeting_delete'),
+    path('meetings/<int:pk>/print/', crm_views.meeting_print_view, name='meeting_print'),
+    path('meetings/<int:pk>/pdf/', crm_views.meeting_pdf_download_view, name='meeting_pdf_download'),
+    path('meetings/<int:pk>/questions/', crm_views.meeting_questions_view, name='meeting_questions'),
+    path('meetings/<int:pk>/attendees/', crm_views.meeting_attendees_view, name='meeting_attendees'),
+    path('meetings/<int:pk>/add-link/', crm_views.meeting_add_link_view, name='meeting_add_link'),
+    path('meetings/link/<int:link_id>/delete/', crm_views.meeting_delete_link_view, name='meeting_delete_link'),
     
     # URLs de Reuniones Soporte
-    path('support-meetings/', views.support_meeting_list, name='support_meeting_list'),
-    path('support-meetings/create/', views.support_meeting_create, name='support_meeting_create'),
-    path('support-meetings/<int:pk>/', views.support_meeting_detail, name='support_meeting_detail'),
-    path('support-meetings/<int:pk>/edit/', views.support_meeting_edit, name='support_meeting_edit'),
-    path('support-meetings/<int:pk>/delete/', views.support_meeting_delete, name='support_meeting_delete'),
-    path('support-meetings/<int:pk>/create-tickets/', views.support_meeting_create_tickets, name='support_meeting_create_tickets'),
-    path('support-meetings/<int:pk>/generate-link/', views.support_meeting_generate_public_link, name='support_meeting_generate_link'),
-    path('support-meetings/<int:pk>/disable-link/', views.support_meeting_disable_public_link, name='support_meeting_disable_link'),
-    path('support-meetings/<int:meeting_pk>/points/<int:point_pk>/edit/', views.support_meeting_point_edit, name='support_meeting_point_edit'),
-    path('support-meetings/<int:meeting_pk>/points/<int:point_pk>/delete/', views.support_meeting_point_delete, name='support_meeting_point_delete'),
+    path('support-meetings/', crm_views.support_meeting_list, name='support_meeting_list'),
+    path('support-meetings/create/', crm_views.support_meeting_create, name='support_meeting_create'),
+    path('support-meetings/<int:pk>/', crm_views.support_meeting_detail, name='support_meeting_detail'),
+    path('support-meetings/<int:pk>/edit/', crm_views.support_meeting_edit, name='support_meeting_edit'),
+    path('support-meetings/<int:pk>/delete/', crm_views.support_meeting_delete, name='support_meeting_delete'),
+    path('support-meetings/<int:pk>/create-tickets/', crm_views.support_meeting_create_tickets, name='support_meeting_create_tickets'),
+    path('support-meetings/<int:pk>/generate-link/', crm_views.support_meeting_generate_public_link, name='support_meeting_generate_link'),
+    path('support-meetings/<int:pk>/disable-link/', crm_views.support_meeting_disable_public_link, name='support_meeting_disable_link'),
+    path('support-meetings/<int:meeting_pk>/points/<int:point_pk>/edit/', crm_views.support_meeting_point_edit, name='support_meeting_point_edit'),
+    path('support-meetings/<int:meeting_pk>/points/<int:point_pk>/delete/', crm_views.support_meeting_point_delete, name='support_meeting_point_delete'),
     
     # URLs públicas de reuniones de soporte (sin autenticación)
-    path('support/meeting/<str:token>/', views.support_meeting_public, name='support_meeting_public'),
+    path('support/meeting/<str:token>/', crm_views.support_meeting_public, name='support_meeting_public'),
     
     # ============= URLs PLANTILLAS DE CORREO =============
-    path('email-templates/', views.email_template_list, name='email_template_list'),
-    path('email-templates/create/', views.email_template_create, name='email_template_create'),
-    path('email-templates/<int:pk>/', views.email_template_detail, name='email_template_detail'),
-    path('email-templates/<int:pk>/edit/', views.email_template_edit, name='email_template_edit'),
-    path('email-templates/<int:pk>/delete/', views.email_template_delete, name='email_template_delete'),
+    path('email-templates/', crm_views.email_template_list, name='email_template_list'),
+    path('email-templates/create/', crm_views.email_template_create, name='email_template_create'),
+    path('email-templates/<int:pk>/', crm_views.email_template_detail, name='email_template_detail'),
+    path('email-templates/<int:pk>/edit/', crm_views.email_template_edit, name='email_template_edit'),
+    path('email-templates/<int:pk>/delete/', crm_views.email_template_delete, name='email_template_delete'),
     
     # URLs de Contadores
     path('counters/', views.counter_list, name='counter_list'),
@@ -554,183 +574,183 @@ urlpatterns = [
     path('counters/<int:pk>/delete/', views.counter_delete, name='counter_delete'),
     
     # URLs de Facturas OCR
-    path('ocr-invoices/', views.ocr_invoice_list, name='ocr_invoice_list'),
-    path('ocr-invoices/create/', views.ocr_invoice_create, name='ocr_invoice_create'),
-    path('ocr-invoices/generate-api-token/', views.ocr_invoice_generate_api_token, name='ocr_invoice_generate_api_token'),
-    path('ocr-invoices/<int:pk>/', views.ocr_invoice_detail, name='ocr_invoice_detail'),
-    path('ocr-invoices/<int:pk>/edit/', views.ocr_invoice_edit, name='ocr_invoice_edit'),
-    path('ocr-invoices/<int:pk>/delete/', views.ocr_invoice_delete, name='ocr_invoice_delete'),
-    path('ocr-invoices/<int:pk>/process/', views.ocr_invoice_process, name='ocr_invoice_process'),
+    path('ocr-invoices/', finance_views.ocr_invoice_list, name='ocr_invoice_list'),
+    path('ocr-invoices/create/', finance_views.ocr_invoice_create, name='ocr_invoice_create'),
+    path('ocr-invoices/generate-api-token/', finance_views.ocr_invoice_generate_api_token, name='ocr_invoice_generate_api_token'),
+    path('ocr-invoices/<int:pk>/', finance_views.ocr_invoice_detail, name='ocr_invoice_detail'),
+    path('ocr-invoices/<int:pk>/edit/', finance_views.ocr_invoice_edit, name='ocr_invoice_edit'),
+    path('ocr-invoices/<int:pk>/delete/', finance_views.ocr_invoice_delete, name='ocr_invoice_delete'),
+    path('ocr-invoices/<int:pk>/process/', finance_views.ocr_invoice_process, name='ocr_invoice_process'),
     
     # URLs públicas de facturas OCR (sin autenticación)
-    path('ocr/upload/', views.ocr_invoice_public_new, name='ocr_invoice_public_new'),
-    path('ocr/upload/<str:token>/', views.ocr_invoice_public_new, name='ocr_invoice_public_new_with_token'),
-    path('ocr/upload/invoice/<str:token>/', views.ocr_invoice_public_upload, name='ocr_invoice_public_upload'),
+    path('ocr/upload/', finance_views.ocr_invoice_public_new, name='ocr_invoice_public_new'),
+    path('ocr/upload/<str:token>/', finance_views.ocr_invoice_public_new, name='ocr_invoice_public_new_with_token'),
+    path('ocr/upload/invoice/<str:token>/', finance_views.ocr_invoice_public_upload, name='ocr_invoice_public_upload'),
     
     # URLs públicas de reuniones (sin autenticación)
-    path('meetings/public/<str:token>/', views.meeting_public_view, name='meeting_public'),
-    path('meetings/public/<str:token>/register/', views.meeting_register_view, name='meeting_register'),
-    path('meetings/public/<str:token>/questions/', views.meeting_questions_public_view, name='meeting_questions_public'),
+    path('meetings/public/<str:token>/', crm_views.meeting_public_view, name='meeting_public'),
+    path('meetings/public/<str:token>/register/', crm_views.meeting_register_view, name='meeting_register'),
+    path('meetings/public/<str:token>/questions/', crm_views.meeting_questions_public_view, name='meeting_questions_public'),
     
     # URLs de Cotizaciones
-    path('quotations/', views.quotation_list_view, name='quotation_list'),
-    path('quotations/create/', views.quotation_create_view, name='quotation_create'),
-    path('quotations/<int:quotation_id>/', views.quotation_detail_view, name='quotation_detail'),
-    path('quotations/<int:quotation_id>/edit/', views.quotation_edit_view, name='quotation_edit'),
-    path('quotations/<int:quotation_id>/duplicate/', views.quotation_duplicate_view, name='quotation_duplicate'),
-    path('quotations/<int:quotation_id>/delete/', views.quotation_delete_view, name='quotation_delete'),
-    path('quotations/<int:quotation_id>/pdf/', views.quotation_pdf_view, name='quotation_pdf'),
-    path('quotations/<int:quotation_id>/share/', views.quotation_share_view, name='quotation_share'),
+    path('quotations/', crm_views.quotation_list_view, name='quotation_list'),
+    path('quotations/create/', crm_views.quotation_create_view, name='quotation_create'),
+    path('quotations/<int:quotation_id>/', crm_views.quotation_detail_view, name='quotation_detail'),
+    path('quotations/<int:quotation_id>/edit/', crm_views.quotation_edit_view, name='quotation_edit'),
+    path('quotations/<int:quotation_id>/duplicate/', crm_views.quotation_duplicate_view, name='quotation_duplicate'),
+    path('quotations/<int:quotation_id>/delete/', crm_views.quotation_delete_view, name='quotation_delete'),
+    path('quotations/<int:quotation_id>/pdf/', crm_views.quotation_pdf_view, name='quotation_pdf'),
+    path('quotations/<int:quotation_id>/share/', crm_views.quotation_share_view, name='quotation_share'),
     
     # URLs públicas para cotizaciones (sin autenticación)
-    path('quotations/public/<str:token>/', views.quotation_public_view, name='quotation_public_view'),
-    path('quotations/public/<str:token>/respond/', views.quotation_public_respond_view, name='quotation_public_respond'),
+    path('quotations/public/<str:token>/', crm_views.quotation_public_view, name='quotation_public_view'),
+    path('quotations/public/<str:token>/respond/', crm_views.quotation_public_respond_view, name='quotation_public_respond'),
     
     # URLs para plantillas de cotización
-    path('quotations/templates/', views.quotation_template_list_view, name='quotation_template_list'),
-    path('quotations/templates/new/', views.quotation_template_create_new_view, name='quotation_template_create_new'),
-    path('quotations/templates/requests/', views.quotation_template_requests_view, name='quotation_template_requests'),
-    path('quotations/templates/<int:template_id>/', views.quotation_template_detail_view, name='quotation_template_detail'),
-    path('quotations/templates/<int:template_id>/edit/', views.quotation_template_edit_view, name='quotation_template_edit'),
-    path('quotations/templates/<int:template_id>/delete/', views.quotation_template_delete_view, name='quotation_template_delete'),
-    path('quotations/templates/<int:template_id>/toggle/', views.quotation_template_toggle_active_view, name='quotation_template_toggle_active'),
-    path('quotations/<int:quotation_id>/create-template/', views.quotation_template_create_view, name='quotation_template_create'),
+    path('quotations/templates/', crm_views.quotation_template_list_view, name='quotation_template_list'),
+    path('quotations/templates/new/', crm_views.quotation_template_create_new_view, name='quotation_template_create_new'),
+    path('quotations/templates/requests/', crm_views.quotation_template_requests_view, name='quotation_template_requests'),
+    path('quotations/templates/<int:template_id>/', crm_views.quotation_template_detail_view, name='quotation_template_detail'),
+    path('quotations/templates/<int:template_id>/edit/', crm_views.quotation_template_edit_view, name='quotation_template_edit'),
+    path('quotations/templates/<int:template_id>/delete/', crm_views.quotation_template_delete_view, name='quotation_template_delete'),
+    path('quotations/templates/<int:template_id>/toggle/', crm_views.quotation_template_toggle_active_view, name='quotation_template_toggle_active'),
+    path('quotations/<int:quotation_id>/create-template/', crm_views.quotation_template_create_view, name='quotation_template_create'),
     
     # URL pública para formulario de plantilla (sin autenticación)
-    path('quotations/template/<str:token>/', views.quotation_template_public_form_view, name='quotation_template_public_form'),
+    path('quotations/template/<str:token>/', crm_views.quotation_template_public_form_view, name='quotation_template_public_form'),
     
     # URLs AJAX para líneas de cotización
-    path('quotations/<int:quotation_id>/add-line/', views.quotation_add_line_view, name='quotation_add_line'),
-    path('quotations/<int:quotation_id>/remove-line/<int:line_id>/', views.quotation_remove_line_view, name='quotation_remove_line'),
-    path('quotations/<int:quotation_id>/edit-line/<int:line_id>/', views.quotation_edit_line_view, name='quotation_edit_line'),
-    path('quotations/<int:quotation_id>/lines/', views.quotation_get_lines_view, name='quotation_get_lines'),
-    path('ajax/products/', views.get_products_ajax_view, name='get_products_ajax'),
-    path('meetings/public/<str:token>/ask/', views.meeting_ask_question_view, name='meeting_ask_question'),
-    path('meetings/public/<str:token>/respond/', views.meeting_respond_view, name='meeting_respond'),
-    path('meetings/public/<str:token>/rate/', views.meeting_rate_view, name='meeting_rate'),
+    path('quotations/<int:quotation_id>/add-line/', crm_views.quotation_add_line_view, name='quotation_add_line'),
+    path('quotations/<int:quotation_id>/remove-line/<int:line_id>/', crm_views.quotation_remove_line_view, name='quotation_remove_line'),
+    path('quotations/<int:quotation_id>/edit-line/<int:line_id>/', crm_views.quotation_edit_line_view, name='quotation_edit_line'),
+    path('quotations/<int:quotation_id>/lines/', crm_views.quotation_get_lines_view, name='quotation_get_lines'),
+    path('ajax/products/', crm_views.get_products_ajax_view, name='get_products_ajax'),
+    path('meetings/public/<str:token>/ask/', crm_views.meeting_ask_question_view, name='meeting_ask_question'),
+    path('meetings/public/<str:token>/respond/', crm_views.meeting_respond_view, name='meeting_respond'),
+    path('meetings/public/<str:token>/rate/', crm_views.meeting_rate_view, name='meeting_rate'),
     
     # AJAX para reuniones
-    path('meetings/<int:pk>/questions/<int:question_id>/answer/', views.meeting_answer_question_view, name='meeting_answer_question'),
+    path('meetings/<int:pk>/questions/<int:question_id>/answer/', crm_views.meeting_answer_question_view, name='meeting_answer_question'),
     
     # URLs de Solicitudes al Cliente
-    path('client-requests/', views.client_request_list, name='client_request_list'),
-    path('client-requests/create/', views.client_request_create, name='client_request_create'),
-    path('client-requests/<int:pk>/', views.client_request_detail, name='client_request_detail'),
-    path('client-requests/<int:pk>/edit/', views.client_request_edit, name='client_request_edit'),
-    path('client-requests/<int:pk>/delete/', views.client_request_delete, name='client_request_delete'),
-    path('client-requests/<int:pk>/pdf/', views.client_request_pdf, name='client_request_pdf'),
+    path('client-requests/', crm_views.client_request_list, name='client_request_list'),
+    path('client-requests/create/', crm_views.client_request_create, name='client_request_create'),
+    path('client-requests/<int:pk>/', crm_views.client_request_detail, name='client_request_detail'),
+    path('client-requests/<int:pk>/edit/', crm_views.client_request_edit, name='client_request_edit'),
+    path('client-requests/<int:pk>/delete/', crm_views.client_request_delete, name='client_request_delete'),
+    path('client-requests/<int:pk>/pdf/', crm_views.client_request_pdf, name='client_request_pdf'),
     
     # URLs Públicas de Solicitudes al Cliente
-    path('public/requests/<uuid:token>/', views.public_client_requests, name='public_client_requests'),
-    path('public/requests/<uuid:token>/<int:pk>/', views.public_client_request_detail, name='public_client_request_detail'),
+    path('public/requests/<uuid:token>/', crm_views.public_client_requests, name='public_client_requests'),
+    path('public/requests/<uuid:token>/<int:pk>/', crm_views.public_client_request_detail, name='public_client_request_detail'),
     
     # URLs de Plantillas de Solicitudes
-    path('client-request-templates/', views.client_request_template_list, name='client_request_template_list'),
-    path('client-request-templates/create/', views.client_request_template_create, name='client_request_template_create'),
-    path('client-request-templates/<int:pk>/', views.client_request_template_detail, name='client_request_template_detail'),
-    path('client-request-templates/<int:pk>/edit/', views.client_request_template_edit, name='client_request_template_edit'),
-    path('client-request-templates/<int:pk>/delete/', views.client_request_template_delete, name='client_request_template_delete'),
-    path('client-request-templates/<int:pk>/execute/', views.client_request_template_execute, name='client_request_template_execute'),
-    path('client-request-templates/<int:template_pk>/items/create/', views.client_request_template_item_create, name='client_request_template_item_create'),
-    path('client-request-template-items/<int:pk>/edit/', views.client_request_template_item_edit, name='client_request_template_item_edit'),
-    path('client-request-template-items/<int:pk>/delete/', views.client_request_template_item_delete, name='client_request_template_item_delete'),
+    path('client-request-templates/', crm_views.client_request_template_list, name='client_request_template_list'),
+    path('client-request-templates/create/', crm_views.client_request_template_create, name='client_request_template_create'),
+    path('client-request-templates/<int:pk>/', crm_views.client_request_template_detail, name='client_request_template_detail'),
+    path('client-request-templates/<int:pk>/edit/', crm_views.client_request_template_edit, name='client_request_template_edit'),
+    path('client-request-templates/<int:pk>/delete/', crm_views.client_request_template_delete, name='client_request_template_delete'),
+    path('client-request-templates/<int:pk>/execute/', crm_views.client_request_template_execute, name='client_request_template_execute'),
+    path('client-request-templates/<int:template_pk>/items/create/', crm_views.client_request_template_item_create, name='client_request_template_item_create'),
+    path('client-request-template-items/<int:pk>/edit/', crm_views.client_request_template_item_edit, name='client_request_template_item_edit'),
+    path('client-request-template-items/<int:pk>/delete/', crm_views.client_request_template_item_delete, name='client_request_template_item_delete'),
     
     # URLs de Capacitación (Cursos y Clases)
-    path('courses/', views.course_list, name='course_list'),
-    path('courses/create/', views.course_create, name='course_create'),
-    path('courses/<int:pk>/', views.course_detail, name='course_detail'),
-    path('courses/<int:pk>/edit/', views.course_edit, name='course_edit'),
-    path('courses/<int:pk>/delete/', views.course_delete, name='course_delete'),
-    path('courses/<int:pk>/generate-public-token/', views.course_generate_public_token, name='course_generate_public_token'),
-    path('courses/<int:pk>/disable-public-access/', views.course_disable_public_access, name='course_disable_public_access'),
-    path('course-comments/<int:comment_id>/resolve/', views.course_comment_resolve, name='course_comment_resolve'),
+    path('courses/', course_views.course_list, name='course_list'),
+    path('courses/create/', course_views.course_create, name='course_create'),
+    path('courses/<int:pk>/', course_views.course_detail, name='course_detail'),
+    path('courses/<int:pk>/edit/', course_views.course_edit, name='course_edit'),
+    path('courses/<int:pk>/delete/', course_views.course_delete, name='course_delete'),
+    path('courses/<int:pk>/generate-public-token/', course_views.course_generate_public_token, name='course_generate_public_token'),
+    path('courses/<int:pk>/disable-public-access/', course_views.course_disable_public_access, name='course_disable_public_access'),
+    path('course-comments/<int:comment_id>/resolve/', course_views.course_comment_resolve, name='course_comment_resolve'),
     
     # URLs de Clases de Curso
-    path('courses/<int:course_id>/classes/create/', views.course_class_create, name='course_class_create'),
-    path('courses/<int:course_id>/classes/<int:pk>/', views.course_class_detail, name='course_class_detail'),
-    path('courses/<int:course_id>/classes/<int:pk>/edit/', views.course_class_edit, name='course_class_edit'),
-    path('courses/<int:course_id>/classes/<int:pk>/delete/', views.course_class_delete, name='course_class_delete'),
+    path('courses/<int:course_id>/classes/create/', course_views.course_class_create, name='course_class_create'),
+    path('courses/<int:course_id>/classes/<int:pk>/', course_views.course_class_detail, name='course_class_detail'),
+    path('courses/<int:course_id>/classes/<int:pk>/edit/', course_views.course_class_edit, name='course_class_edit'),
+    path('courses/<int:course_id>/classes/<int:pk>/delete/', course_views.course_class_delete, name='course_class_delete'),
     
     # AJAX para marcar clases como vistas
-    path('courses/<int:course_id>/classes/<int:class_id>/mark-viewed/', views.mark_class_as_viewed, name='mark_class_as_viewed'),
+    path('courses/<int:course_id>/classes/<int:class_id>/mark-viewed/', course_views.mark_class_as_viewed, name='mark_class_as_viewed'),
     
     # URLs de Registro Público de Cursos
-    path('courses/<int:pk>/generate-registration-token/', views.course_generate_registration_token, name='course_generate_registration_token'),
-    path('courses/<int:pk>/registration-tokens/', views.course_registration_tokens_list, name='course_registration_tokens_list'),
-    path('courses/<int:pk>/registration-tokens/<int:token_id>/disable/', views.course_disable_registration_token, name='course_disable_registration_token'),
-    path('course-register/<uuid:token>/', views.course_public_register, name='course_public_register'),
+    path('courses/<int:pk>/generate-registration-token/', course_views.course_generate_registration_token, name='course_generate_registration_token'),
+    path('courses/<int:pk>/registration-tokens/', course_views.course_registration_tokens_list, name='course_registration_tokens_list'),
+    path('courses/<int:pk>/registration-tokens/<int:token_id>/disable/', course_views.course_disable_registration_token, name='course_disable_registration_token'),
+    path('course-register/<uuid:token>/', course_views.course_public_register, name='course_public_register'),
     
     # URL de debug para cursos
-    path('debug/user-access/', views.debug_user_access, name='debug_user_access'),
+    path('debug/user-access/', course_views.debug_user_access, name='debug_user_access'),
     
     # URLs del Blog
     # URLs públicas del blog (sin autenticación)
-    path('blog/', views.blog_list, name='blog_list'),
-    path('blog/<slug:slug>/', views.blog_post_detail, name='blog_post_detail'),
+    path('blog/', blog_views.blog_list, name='blog_list'),
+    path('blog/<slug:slug>/', blog_views.blog_post_detail, name='blog_post_detail'),
     
     # URLs de administración del blog (con autenticación)
-    path('blog-admin/', views.blog_post_list_admin, name='blog_post_list_admin'),
-    path('blog-admin/post/create/', views.blog_post_create, name='blog_post_create'),
-    path('blog-admin/post/<int:pk>/', views.blog_post_detail_admin, name='blog_post_detail_admin'),
-    path('blog-admin/post/<int:pk>/edit/', views.blog_post_edit, name='blog_post_edit'),
-    path('blog-admin/post/<int:pk>/toggle-status/', views.blog_post_toggle_status, name='blog_post_toggle_status'),
-    path('blog-admin/post/<int:pk>/delete/', views.blog_post_delete, name='blog_post_delete'),
+    path('blog-admin/', blog_views.blog_post_list_admin, name='blog_post_list_admin'),
+    path('blog-admin/post/create/', blog_views.blog_post_create, name='blog_post_create'),
+    path('blog-admin/post/<int:pk>/', blog_views.blog_post_detail_admin, name='blog_post_detail_admin'),
+    path('blog-admin/post/<int:pk>/edit/', blog_views.blog_post_edit, name='blog_post_edit'),
+    path('blog-admin/post/<int:pk>/toggle-status/', blog_views.blog_post_toggle_status, name='blog_post_toggle_status'),
+    path('blog-admin/post/<int:pk>/delete/', blog_views.blog_post_delete, name='blog_post_delete'),
     
     # URLs de categorías de blog (con autenticación)
-    path('blog-admin/categories/', views.blog_category_list, name='blog_category_list'),
-    path('blog-admin/categories/create/', views.blog_category_create, name='blog_category_create'),
+    path('blog-admin/categories/', blog_views.blog_category_list, name='blog_category_list'),
+    path('blog-admin/categories/create/', blog_views.blog_category_create, name='blog_category_create'),
     
     # URLs de comentarios de blog (con autenticación)
-    path('blog-admin/comments/<int:pk>/approve/', views.blog_comment_approve, name='blog_comment_approve'),
-    path('blog-admin/comments/<int:pk>/delete/', views.blog_comment_delete, name='blog_comment_delete'),
+    path('blog-admin/comments/<int:pk>/approve/', blog_views.blog_comment_approve, name='blog_comment_approve'),
+    path('blog-admin/comments/<int:pk>/delete/', blog_views.blog_comment_delete, name='blog_comment_delete'),
     
     # URLs de IA para Blog (con autenticación)
-    path('blog-admin/post/<int:pk>/ai/improve-content/', views.blog_ai_improve_content, name='blog_ai_improve_content'),
-    path('blog-admin/post/<int:pk>/ai/improve-complete/', views.blog_ai_improve_complete_article, name='blog_ai_improve_complete_article'),
-    path('blog-admin/post/<int:pk>/ai/generate-meta/', views.blog_ai_generate_meta_description, name='blog_ai_generate_meta_description'),
-    path('blog-admin/post/<int:pk>/ai/suggest-titles/', views.blog_ai_suggest_titles, name='blog_ai_suggest_titles'),
-    path('blog-admin/post/<int:pk>/ai/generate-tags/', views.blog_ai_generate_tags, name='blog_ai_generate_tags'),
-    path('blog-admin/post/<int:pk>/ai/analyze-readability/', views.blog_ai_analyze_readability, name='blog_ai_analyze_readability'),
-    path('blog-admin/post/<int:pk>/ai/generate-image/', views.blog_ai_generate_image, name='blog_ai_generate_image'),
-    path('blog-admin/post/<int:pk>/ai/apply-improvements/', views.blog_ai_apply_improvements, name='blog_ai_apply_improvements'),
-    path('blog-admin/ai/test-connection/', views.blog_ai_test_connection, name='blog_ai_test_connection'),
+    path('blog-admin/post/<int:pk>/ai/improve-content/', blog_views.blog_ai_improve_content, name='blog_ai_improve_content'),
+    path('blog-admin/post/<int:pk>/ai/improve-complete/', blog_views.blog_ai_improve_complete_article, name='blog_ai_improve_complete_article'),
+    path('blog-admin/post/<int:pk>/ai/generate-meta/', blog_views.blog_ai_generate_meta_description, name='blog_ai_generate_meta_description'),
+    path('blog-admin/post/<int:pk>/ai/suggest-titles/', blog_views.blog_ai_suggest_titles, name='blog_ai_suggest_titles'),
+    path('blog-admin/post/<int:pk>/ai/generate-tags/', blog_views.blog_ai_generate_tags, name='blog_ai_generate_tags'),
+    path('blog-admin/post/<int:pk>/ai/analyze-readability/', blog_views.blog_ai_analyze_readability, name='blog_ai_analyze_readability'),
+    path('blog-admin/post/<int:pk>/ai/generate-image/', blog_views.blog_ai_generate_image, name='blog_ai_generate_image'),
+    path('blog-admin/post/<int:pk>/ai/apply-improvements/', blog_views.blog_ai_apply_improvements, name='blog_ai_apply_improvements'),
+    path('blog-admin/ai/test-connection/', blog_views.blog_ai_test_connection, name='blog_ai_test_connection'),
     
     # URLs de Chat con IA
-    path('ai-chat/', views.ai_chat_list_view, name='ai_chat_list'),
-    path('ai-chat/get-session/', views.get_or_create_user_chat_session, name='get_user_chat_session'),
-    path('ai-chat/<int:session_id>/', views.ai_chat_session_view, name='ai_chat_session'),
-    path('ai-chat/<int:session_id>/delete/', views.ai_chat_delete_session_view, name='ai_chat_delete_session'),
-    path('ai-chat-debug/<int:session_id>/', views.ai_chat_debug_view, name='ai_chat_debug'),
-    path('ai-chat-simple/<int:session_id>/', views.ai_chat_simple_view, name='ai_chat_simple'),
-    path('ai-chat-live/<int:session_id>/', views.ai_chat_live_view, name='ai_chat_live'),
-    path('ai-chat-modern/<int:session_id>/', views.ai_chat_modern_view, name='ai_chat_modern'),
+    path('ai-chat/', ai_views.ai_chat_list_view, name='ai_chat_list'),
+    path('ai-chat/get-session/', ai_views.get_or_create_user_chat_session, name='get_user_chat_session'),
+    path('ai-chat/<int:session_id>/', ai_views.ai_chat_session_view, name='ai_chat_session'),
+    path('ai-chat/<int:session_id>/delete/', ai_views.ai_chat_delete_session_view, name='ai_chat_delete_session'),
+    path('ai-chat-debug/<int:session_id>/', ai_views.ai_chat_debug_view, name='ai_chat_debug'),
+    path('ai-chat-simple/<int:session_id>/', ai_views.ai_chat_simple_view, name='ai_chat_simple'),
+    path('ai-chat-live/<int:session_id>/', ai_views.ai_chat_live_view, name='ai_chat_live'),
+    path('ai-chat-modern/<int:session_id>/', ai_views.ai_chat_modern_view, name='ai_chat_modern'),
     
     # AJAX para Chat IA
-    path('ai-chat/<int:session_id>/send/', views.ai_chat_ajax_send_message, name='ai_chat_ajax_send'),
-    path('api/ai-chat/<int:session_id>/messages/', views.ai_chat_get_messages, name='ai_chat_get_messages'),
-    path('ai-chat/message/<int:message_id>/share/', views.share_ai_chat_message, name='share_ai_chat_message'),
-    path('ai-chat/message/<int:message_id>/unshare/', views.unshare_ai_chat_message, name='unshare_ai_chat_message'),
-    path('ai-chat/<int:session_id>/share/', views.share_ai_chat_session, name='share_ai_chat_session'),
-    path('shared-chat/<str:share_token>/', views.shared_ai_chat_view, name='shared_ai_chat_view'),
-    path('shared/ai-message/<str:token>/', views.shared_ai_message_view, name='shared_ai_message_view'),
+    path('ai-chat/<int:session_id>/send/', ai_views.ai_chat_ajax_send_message, name='ai_chat_ajax_send'),
+    path('api/ai-chat/<int:session_id>/messages/', ai_views.ai_chat_get_messages, name='ai_chat_get_messages'),
+    path('ai-chat/message/<int:message_id>/share/', ai_views.share_ai_chat_message, name='share_ai_chat_message'),
+    path('ai-chat/message/<int:message_id>/unshare/', ai_views.unshare_ai_chat_message, name='unshare_ai_chat_message'),
+    path('ai-chat/<int:session_id>/share/', ai_views.share_ai_chat_session, name='share_ai_chat_session'),
+    path('shared-chat/<str:share_token>/', ai_views.shared_ai_chat_view, name='shared_ai_chat_view'),
+    path('shared/ai-message/<str:token>/', ai_views.shared_ai_message_view, name='shared_ai_message_view'),
     
     # AJAX para mejorar tickets con IA
-    path('tickets/<int:ticket_id>/improve-ai/', views.improve_ticket_with_ai, name='improve_ticket_with_ai'),
+    path('tickets/<int:ticket_id>/improve-ai/', ai_views.improve_ticket_with_ai, name='improve_ticket_with_ai'),
     
     # AJAX para mejorar texto de ticket durante creación (sin ticket existente)
-    path('tickets/improve-text-ai/', views.improve_ticket_text_with_ai, name='improve_ticket_text_with_ai'),
+    path('tickets/improve-text-ai/', ai_views.improve_ticket_text_with_ai, name='improve_ticket_text_with_ai'),
     
     # AJAX para mejorar texto de alcance con IA
-    path('alcances/improve-text-ai/', views.improve_alcance_text_with_ai, name='improve_alcance_text_with_ai'),
+    path('alcances/improve-text-ai/', ai_views.improve_alcance_text_with_ai, name='improve_alcance_text_with_ai'),
     
     # AJAX para buscar información de empresa con IA
-    path('companies/<int:company_id>/search-ai/', views.search_company_info_with_ai, name='search_company_info_with_ai'),
+    path('companies/<int:company_id>/search-ai/', ai_views.search_company_info_with_ai, name='search_company_info_with_ai'),
     
     # AJAX para buscar información de empresa con IA (sin requerir ID)
-    path('companies/search-ai/', views.search_company_info_general, name='search_company_info_general'),
+    path('companies/search-ai/', ai_views.search_company_info_general, name='search_company_info_general'),
     
     # AJAX para mejorar contactos con IA
-    path('contacts/<int:contact_id>/enhance-ai/', views.enhance_contact_with_ai, name='enhance_contact_with_ai'),
+    path('contacts/<int:contact_id>/enhance-ai/', ai_views.enhance_contact_with_ai, name='enhance_contact_with_ai'),
     
     # URLs de conceptos
     path('concepts/', views.concept_list_view, name='concept_list'),
@@ -741,32 +761,32 @@ urlpatterns = [
     
     # URLs de Exámenes
     # URLs de Red Social Interna
-    path('social/', views.social_feed, name='social_feed'),
-    path('social/load-more/', views.social_feed_load_more, name='social_feed_load_more'),
-    path('social/hashtags/', views.social_get_hashtags, name='social_get_hashtags'),
-    path('social/mentions/', views.social_get_mentions, name='social_get_mentions'),
-    path('social/search-users/', views.social_search_users, name='social_search_users'),
-    path('social/post/create/', views.social_post_create, name='social_post_create'),
-    path('social/post/<int:post_id>/get-data/', views.social_post_get_data, name='social_post_get_data'),
-    path('social/post/<int:post_id>/edit/', views.social_post_edit, name='social_post_edit'),
-    path('social/post/<int:post_id>/delete/', views.social_post_delete, name='social_post_delete'),
-    path('social/post/<int:post_id>/like/', views.social_post_like, name='social_post_like'),
-    path('social/post/<int:post_id>/comment/', views.social_post_comment, name='social_post_comment'),
-    path('social/post/<int:post_id>/toggle-privacy/', views.social_post_toggle_privacy, name='social_post_toggle_privacy'),
-    path('social/post/<int:post_id>/share/', views.social_post_share, name='social_post_share'),
-    path('social/post/<int:post_id>/favorite/', views.social_post_favorite, name='social_post_favorite'),
-    path('social/comment/<int:comment_id>/delete/', views.social_comment_delete, name='social_comment_delete'),
-    path('social/comment/<int:comment_id>/react/', views.social_comment_react, name='social_comment_react'),
-    path('p/<str:token>/', views.social_post_public, name='social_post_public'),
-    path('p/<str:token>/comment/', views.social_post_public_comment, name='social_post_public_comment'),
-    
-    path('exams/', views.exam_list, name='exam_list'),
-    path('exams/create/', views.exam_create, name='exam_create'),
-    path('exams/<int:pk>/', views.exam_detail, name='exam_detail'),
-    path('exams/<int:pk>/edit/', views.exam_edit, name='exam_edit'),
-    path('exams/<int:pk>/delete/', views.exam_delete, name='exam_delete'),
-    path('exams/<int:pk>/take/', views.exam_take_authenticated, name='exam_take_authenticated'),
-    path('exams/attempts/', views.exam_attempts_list, name='exam_attempts_list'),
+    path('social/', social_views.social_feed, name='social_feed'),
+    path('social/load-more/', social_views.social_feed_load_more, name='social_feed_load_more'),
+    path('social/hashtags/', social_views.social_get_hashtags, name='social_get_hashtags'),
+    path('social/mentions/', social_views.social_get_mentions, name='social_get_mentions'),
+    path('social/search-users/', social_views.social_search_users, name='social_search_users'),
+    path('social/post/create/', social_views.social_post_create, name='social_post_create'),
+    path('social/post/<int:post_id>/get-data/', social_views.social_post_get_data, name='social_post_get_data'),
+    path('social/post/<int:post_id>/edit/', social_views.social_post_edit, name='social_post_edit'),
+    path('social/post/<int:post_id>/delete/', social_views.social_post_delete, name='social_post_delete'),
+    path('social/post/<int:post_id>/like/', social_views.social_post_like, name='social_post_like'),
+    path('social/post/<int:post_id>/comment/', social_views.social_post_comment, name='social_post_comment'),
+    path('social/post/<int:post_id>/toggle-privacy/', social_views.social_post_toggle_privacy, name='social_post_toggle_privacy'),
+    path('social/post/<int:post_id>/share/', social_views.social_post_share, name='social_post_share'),
+    path('social/post/<int:post_id>/favorite/', social_views.social_post_favorite, name='social_post_favorite'),
+    path('social/comment/<int:comment_id>/delete/', social_views.social_comment_delete, name='social_comment_delete'),
+    path('social/comment/<int:comment_id>/react/', social_views.social_comment_react, name='social_comment_react'),
+    path('p/<str:token>/', social_views.social_post_public, name='social_post_public'),
+    path('p/<str:token>/comment/', social_views.social_post_public_comment, name='social_post_public_comment'),
+    
+    path('exams/', social_views.exam_list, name='exam_list'),
+    path('exams/create/', social_views.exam_create, name='exam_create'),
+    path('exams/<int:pk>/', social_views.exam_detail, name='exam_detail'),
+    path('exams/<int:pk>/edit/', social_views.exam_edit, name='exam_edit'),
+    path('exams/<int:pk>/delete/', social_views.exam_delete, name='exam_delete'),
+    path('exams/<int:pk>/take/', social_views.exam_take_authenticated, name='exam_take_authenticated'),
+    path('exams/attempts/', social_views.exam_attempts_list, name='exam_attempts_list'),
     
     # URLs de manuales
     path('manuals/', views.manual_list, name='manual_list'),
@@ -797,32 +817,32 @@ urlpatterns = [
     path('mis-rfi/', views.rfi_my_list, name='rfi_my_list'),
 
     # URLs de Capacitaciones
-    path('capacitaciones/', views.capacitacion_list, name='capacitacion_list'),
-    path('capacitaciones/crear/', views.capacitacion_create, name='capacitacion_create'),
-    path('capacitaciones/<int:pk>/', views.capacitacion_detail, name='capacitacion_detail'),
-    path('capacitaciones/<int:pk>/editar/', views.capacitacion_edit, name='capacitacion_edit'),
-    path('capacitaciones/<int:pk>/eliminar/', views.capacitacion_delete, name='capacitacion_delete'),
-    path('capacitaciones/<int:pk>/lineas/<int:linea_id>/eliminar/', views.capacitacion_linea_delete, name='capacitacion_linea_delete'),
-    path('capacitaciones/<int:pk>/respuestas/<int:respuesta_id>/eliminar/', views.capacitacion_respuesta_delete, name='capacitacion_respuesta_delete'),
-    path('public/capacitaciones/<uuid:token>/', views.capacitacion_public, name='capacitacion_public'),
+    path('capacitaciones/', course_views.capacitacion_list, name='capacitacion_list'),
+    path('capacitaciones/crear/', course_views.capacitacion_create, name='capacitacion_create'),
+    path('capacitaciones/<int:pk>/', course_views.capacitacion_detail, name='capacitacion_detail'),
+    path('capacitaciones/<int:pk>/editar/', course_views.capacitacion_edit, name='capacitacion_edit'),
+    path('capacitaciones/<int:pk>/eliminar/', course_views.capacitacion_delete, name='capacitacion_delete'),
+    path('capacitaciones/<int:pk>/lineas/<int:linea_id>/eliminar/', course_views.capacitacion_linea_delete, name='capacitacion_linea_delete'),
+    path('capacitaciones/<int:pk>/respuestas/<int:respuesta_id>/eliminar/', course_views.capacitacion_respuesta_delete, name='capacitacion_respuesta_delete'),
+    path('public/capacitaciones/<uuid:token>/', course_views.capacitacion_public, name='capacitacion_public'),
 
     # URLs públicas de exámenes (sin autenticación)
-    path('exam/<str:token>/', views.exam_take_public, name='exam_take_public'),
-    path('exam/<str:token>/start/', views.exam_take_questions, name='exam_take_questions'),
-    path('exam/results/<int:attempt_id>/', views.exam_results, name='exam_results'),
-    path('certificate/download/<int:attempt_id>/', views.download_certificate, name='download_certificate'),
-    path('certificate/verify/<str:token>/', views.verify_certificate, name='verify_certificate'),
+    path('exam/<str:token>/', course_views.exam_take_public, name='exam_take_public'),
+    path('exam/<str:token>/start/', course_views.exam_take_questions, name='exam_take_questions'),
+    path('exam/results/<int:attempt_id>/', course_views.exam_results, name='exam_results'),
+    path('certificate/download/<int:attempt_id>/', course_views.download_certificate, name='download_certificate'),
+    path('certificate/verify/<str:token>/', course_views.verify_certificate, name='verify_certificate'),
     
     # URLs de preguntas de exámenes
-    path('exams/<int:exam_pk>/questions/create/', views.question_create, name='question_create'),
-    path('questions/<int:pk>/edit/', views.question_edit, name='question_edit'),
-    path('questions/<int:pk>/delete/', views.question_delete, name='question_delete'),
+    path('exams/<int:exam_pk>/questions/create/', course_views.question_create, name='question_create'),
+    path('questions/<int:pk>/edit/', course_views.question_edit, name='question_edit'),
+    path('questions/<int:pk>/delete/', course_views.question_delete, name='question_delete'),
     
     # URLs de contacto web público
-    path('contacto/', views.contacto_web, name='contacto_web'),
-    path('contactos-web/', views.contactos_web_list, name='contactos_web_list'),
-    path('contactos-web/<int:pk>/', views.contacto_web_detail, name='contacto_web_detail'),
-    path('quien-eres/', views.quien_eres_wizard, name='quien_eres_wizard'),
+    path('contacto/', crm_views.contacto_web, name='contacto_web'),
+    path('contactos-web/', crm_views.contactos_web_list, name='contactos_web_list'),
+    path('contactos-web/<int:pk>/', crm_views.contacto_web_detail, name='contacto_web_detail'),
+    path('quien-eres/', crm_views.quien_eres_wizard, name='quien_eres_wizard'),
     
     # URLs públicas de subida de documentos
     path('public-uploads/', views.public_upload_url_list, name='public_upload_url_list'),
@@ -846,81 +866,81 @@ urlpatterns = [
     path('upload/<uuid:token>/', views.public_document_upload, name='public_document_upload'),
     
     # URLs de gestión de empleados (en Herramientas) - Mantener compatibilidad
-    path('employees/', views.employee_list, name='employee_list'),
-    path('employees/<int:pk>/', views.employee_detail, name='employee_detail'),
-    path('employees/<int:pk>/change-status/', views.employee_change_status, name='employee_change_status'),
-    path('employees/<int:pk>/edit-hiring-opinion/', views.employee_edit_hiring_opinion, name='employee_edit_hiring_opinion'),
+    path('employees/', hr_views.employee_list, name='employee_list'),
+    path('employees/<int:pk>/', hr_views.employee_detail, name='employee_detail'),
+    path('employees/<int:pk>/change-status/', hr_views.employee_change_status, name='employee_change_status'),
+    path('employees/<int:pk>/edit-hiring-opinion/', hr_views.employee_edit_hiring_opinion, name='employee_edit_hiring_opinion'),
     
     # URLs de nóminas de empleados
-    path('employees/<int:pk>/payrolls/', views.employee_payroll_list, name='employee_payroll_list'),
-    path('employees/<int:pk>/payrolls/create/', views.employee_payroll_create, name='employee_payroll_create'),
-    path('employees/<int:employee_pk>/payrolls/<int:payroll_pk>/', views.employee_payroll_detail, name='employee_payroll_detail'),
-    path('employees/<int:employee_pk>/payrolls/<int:payroll_pk>/edit/', views.employee_payroll_edit, name='employee_payroll_edit'),
-    path('employees/<int:employee_pk>/payrolls/<int:payroll_pk>/delete/', views.employee_payroll_delete, name='employee_payroll_delete'),
+    path('employees/<int:pk>/payrolls/', hr_views.employee_payroll_list, name='employee_payroll_list'),
+    path('employees/<int:pk>/payrolls/create/', hr_views.employee_payroll_create, name='employee_payroll_create'),
+    path('employees/<int:employee_pk>/payrolls/<int:payroll_pk>/', hr_views.employee_payroll_detail, name='employee_payroll_detail'),
+    path('employees/<int:employee_pk>/payrolls/<int:payroll_pk>/edit/', hr_views.employee_payroll_edit, name='employee_payroll_edit'),
+    path('employees/<int:employee_pk>/payrolls/<int:payroll_pk>/delete/', hr_views.employee_payroll_delete, name='employee_payroll_delete'),
     
     # URLs separadas para Candidatos y Empleados
-    path('candidates/', views.candidate_list, name='candidate_list'),
-    path('candidates/<int:pk>/', views.candidate_detail, name='candidate_detail'),
-    path('active-employees/', views.active_employee_list, name='active_employee_list'),
-    path('active-employees/<int:pk>/', views.active_employee_detail, name='active_employee_detail'),
+    path('candidates/', hr_views.candidate_list, name='candidate_list'),
+    path('candidates/<int:pk>/', hr_views.candidate_detail, name='candidate_detail'),
+    path('active-employees/', hr_views.active_employee_list, name='active_employee_list'),
+    path('active-employees/<int:pk>/', hr_views.active_employee_detail, name='active_employee_detail'),
     
     # URLs de gestión de enlaces de aplicación de empleo
-    path('job-applications/', views.job_application_token_list, name='job_application_token_list'),
-    path('job-applications/create/', views.job_application_token_create, name='job_application_token_create'),
-    path('job-applications/<int:pk>/', views.job_application_token_detail, name='job_application_token_detail'),
+    path('job-applications/', hr_views.job_application_token_list, name='job_application_token_list'),
+    path('job-applications/create/', hr_views.job_application_token_create, name='job_application_token_create'),
+    path('job-applications/<int:pk>/', hr_views.job_application_token_detail, name='job_application_token_detail'),
     
     # URL pública para aplicar a empleos (sin autenticación)
-    path('job-apply/<uuid:token>/', views.public_job_application, name='public_job_application'),
+    path('job-apply/<uuid:token>/', hr_views.public_job_application, name='public_job_application'),
 
     # URLs de Acuerdos/Contratos (solo para agentes)
-    path('agreements/', views.agreement_list, name='agreement_list'),
-    path('agreements/create/', views.agreement_create, name='agreement_create'),
-    path('agreements/<int:pk>/', views.agreement_detail, name='agreement_detail'),
-    path('agreements/<int:pk>/edit/', views.agreement_edit, name='agreement_edit'),
-    path('agreements/<int:pk>/delete/', views.agreement_delete, name='agreement_delete'),
-    path('agreements/<int:pk>/publish/', views.agreement_publish, name='agreement_publish'),
+    path('agreements/', hr_views.agreement_list, name='agreement_list'),
+    path('agreements/create/', hr_views.agreement_create, name='agreement_create'),
+    path('agreements/<int:pk>/', hr_views.agreement_detail, name='agreement_detail'),
+    path('agreements/<int:pk>/edit/', hr_views.agreement_edit, name='agreement_edit'),
+    path('agreements/<int:pk>/delete/', hr_views.agreement_delete, name='agreement_delete'),
+    path('agreements/<int:pk>/publish/', hr_views.agreement_publish, name='agreement_publish'),
     
     # URLs públicas de Acuerdos (sin autenticación)
-    path('sign/<str:token>/', views.public_agreement_sign, name='public_agreement_sign'),
-    path('sign/<str:token>/success/<int:signature_id>/', views.public_agreement_success, name='public_agreement_success'),
-    path('agreement/<str:agreement_token>/download/<int:signature_id>/', views.download_signed_agreement, name='download_signed_agreement'),
+    path('sign/<str:token>/', hr_views.public_agreement_sign, name='public_agreement_sign'),
+    path('sign/<str:token>/success/<int:signature_id>/', hr_views.public_agreement_success, name='public_agreement_success'),
+    path('agreement/<str:agreement_token>/download/<int:signature_id>/', hr_views.download_signed_agreement, name='download_signed_agreement'),
 
     # ============= URLs LANDING PAGES =============
     # URLs de gestión de landing pages (solo para agentes)
-    path('landing-pages/', views.landing_page_list, name='landing_page_list'),
-    path('landing-pages/create/', views.landing_page_create, name='landing_page_create'),
-    path('landing-pages/<int:pk>/', views.landing_page_detail, name='landing_page_detail'),
-    path('landing-pages/<int:pk>/edit/', views.landing_page_edit, name='landing_page_edit'),
-    path('landing-pages/<int:pk>/delete/', views.landing_page_delete, name='landing_page_delete'),
-    path('landing-pages/<int:pk>/submissions/', views.landing_page_submissions, name='landing_page_submissions'),
-    path('landing-pages/submissions/<int:submission_id>/', views.landing_page_submission_detail, name='landing_page_submission_detail'),
-    path('landing-pages/submissions/<int:submission_id>/toggle-processed/', views.toggle_submission_processed, name='toggle_submission_processed'),
-    path('landing-pages/submissions/<int:submission_id>/update-contact-tracking/', views.update_contact_tracking, name='update_contact_tracking'),
-    path('landing-pages/contacts/', views.landing_page_contacts, name='landing_page_contacts'),
-    path('landing-pages/submissions/<int:submission_id>/create-contact/', views.create_contact_from_submission_view, name='create_contact_from_submission'),
+    path('landing-pages/', crm_views.landing_page_list, name='landing_page_list'),
+    path('landing-pages/create/', crm_views.landing_page_create, name='landing_page_create'),
+    path('landing-pages/<int:pk>/', crm_views.landing_page_detail, name='landing_page_detail'),
+    path('landing-pages/<int:pk>/edit/', crm_views.landing_page_edit, name='landing_page_edit'),
+    path('landing-pages/<int:pk>/delete/', crm_views.landing_page_delete, name='landing_page_delete'),
+    path('landing-pages/<int:pk>/submissions/', crm_views.landing_page_submissions, name='landing_page_submissions'),
+    path('landing-pages/submissions/<int:submission_id>/', crm_views.landing_page_submission_detail, name='landing_page_submission_detail'),
+    path('landing-pages/submissions/<int:submission_id>/toggle-processed/', crm_views.toggle_submission_processed, name='toggle_submission_processed'),
+    path('landing-pages/submissions/<int:submission_id>/update-contact-tracking/', crm_views.update_contact_tracking, name='update_contact_tracking'),
+    path('landing-pages/contacts/', crm_views.landing_page_contacts, name='landing_page_contacts'),
+    path('landing-pages/submissions/<int:submission_id>/create-contact/', crm_views.create_contact_from_submission_view, name='create_contact_from_submission'),
     
     # URLs AJAX para landing pages
-    path('ajax/landing-pages/submissions/<int:submission_id>/create-contact/', views.ajax_create_contact_from_submission, name='ajax_create_contact_from_submission'),
-    path('ajax/landing-pages/submissions/create-contacts-batch/', views.ajax_create_contacts_batch, name='ajax_create_contacts_batch'),
-    path('ajax/landing-pages/submissions/<int:submission_id>/details/', views.ajax_submission_details, name='ajax_submission_details'),
-    path('ajax/landing-pages/submissions/<int:submission_id>/delete/', views.ajax_landing_submission_delete, name='ajax_landing_submission_delete'),
+    path('ajax/landing-pages/submissions/<int:submission_id>/create-contact/', crm_views.ajax_create_contact_from_submission, name='ajax_create_contact_from_submission'),
+    path('ajax/landing-pages/submissions/create-contacts-batch/', crm_views.ajax_create_contacts_batch, name='ajax_create_contacts_batch'),
+    path('ajax/landing-pages/submissions/<int:submission_id>/details/', crm_views.ajax_submission_details, name='ajax_submission_details'),
+    path('ajax/landing-pages/submissions/<int:submission_id>/delete/', crm_views.ajax_landing_submission_delete, name='ajax_landing_submission_delete'),
     
     # API pública para enviar datos a una landing page (JSON)
-    path('api/landing-pages/<int:pk>/submit/', views.landing_page_api_submit, name='landing_page_api_submit'),
+    path('api/landing-pages/<int:pk>/submit/', crm_views.landing_page_api_submit, name='landing_page_api_submit'),
     
     # URLs para evaluación IA de landing pages
-    path('ai/landing-submissions/', views.landing_submissions_list_view, name='landing_submissions_list'),
-    path('ai/landing-submissions/<int:submission_id>/', views.landing_submission_detail_view, name='landing_submission_detail'),
-    path('ai/landing-submissions/<int:submission_id>/delete/', views.landing_submission_delete_view, name='landing_submission_delete'),
-    path('ai/landing-submissions/<int:submission_id>/evaluate/', views.evaluate_submission_ai_view, name='evaluate_submission_ai'),
-    path('ai/landing-submissions/batch-evaluate/', views.batch_evaluate_submissions_view, name='batch_evaluate_submissions'),
-    path('ai/dashboard/', views.ai_evaluation_dashboard_view, name='ai_evaluation_dashboard'),
+    path('ai/landing-submissions/', crm_views.landing_submissions_list_view, name='landing_submissions_list'),
+    path('ai/landing-submissions/<int:submission_id>/', crm_views.landing_submission_detail_view, name='landing_submission_detail'),
+    path('ai/landing-submissions/<int:submission_id>/delete/', crm_views.landing_submission_delete_view, name='landing_submission_delete'),
+    path('ai/landing-submissions/<int:submission_id>/evaluate/', crm_views.evaluate_submission_ai_view, name='evaluate_submission_ai'),
+    path('ai/landing-submissions/batch-evaluate/', crm_views.batch_evaluate_submissions_view, name='batch_evaluate_submissions'),
+    path('ai/dashboard/', crm_views.ai_evaluation_dashboard_view, name='ai_evaluation_dashboard'),
     
     # URL pública de landing page (sin autenticación)
-    path('lp/<slug:slug>/', views.landing_page_public, name='landing_page_public'),
+    path('lp/<slug:slug>/', crm_views.landing_page_public, name='landing_page_public'),
     
     # URL pública para crear tickets desde empresa (sin autenticación)
-    path('public/company/<uuid:public_token>/create-ticket/', views.public_company_ticket_create, name='public_company_ticket_create'),
+    path('public/company/<uuid:public_token>/create-ticket/', crm_views.public_company_ticket_create, name='public_company_ticket_create'),
     
     # URLs de archivos compartidos
     path('shared-files/', views.shared_files_list_view, name='shared_files_list'),
@@ -947,22 +967,22 @@ urlpatterns = [
     path('public/upload-recording/', views.public_recording_upload_view, name='public_recording_upload'),
     
     # URLs de comandos de voz IA
-    path('voice-commands/', views.voice_command_interface_view, name='voice_command_interface'),
-    path('voice-commands/create-ticket/', views.voice_command_create_ticket_view, name='voice_command_create_ticket'),
+    path('voice-commands/', ai_views.voice_command_interface_view, name='voice_command_interface'),
+    path('voice-commands/create-ticket/', ai_views.voice_command_create_ticket_view, name='voice_command_create_ticket'),
     
     # URLs de Analytics de Páginas Públicas
-    path('analytics/page-visits/', views.page_visits_analytics_view, name='page_visits_analytics'),
-    path('analytics/page-visits/detail/', views.page_visits_detail_view, name='page_visits_detail'),
-    path('analytics/page-visits/export/', views.page_visits_export_view, name='page_visits_export'),
+    path('analytics/page-visits/', analytics_views.page_visits_analytics_view, name='page_visits_analytics'),
+    path('analytics/page-visits/detail/', analytics_views.page_visits_detail_view, name='page_visits_detail'),
+    path('analytics/page-visits/export/', analytics_views.page_visits_export_view, name='page_visits_export'),
     
     # URLs de Configurador de IA para Blog
-    path('ai-blog-configurators/', views.ai_blog_configurators_list_view, name='ai_blog_configurators_list'),
-    path('ai-blog-configurators/create/', views.ai_blog_configurator_create_view, name='ai_blog_configurator_create'),
-    path('ai-blog-configurators/<int:pk>/edit/', views.ai_blog_configurator_edit_view, name='ai_blog_configurator_edit'),
-    path('ai-blog-configurators/<int:pk>/delete/', views.ai_blog_configurator_delete_view, name='ai_blog_configurator_delete'),
-    path('ai-blog-configurators/<int:pk>/toggle/', views.ai_blog_configurator_toggle_view, name='ai_blog_configurator_toggle'),
-    path('ai-blog-configurators/<int:pk>/run-now/', views.ai_blog_configurator_run_now_view, name='ai_blog_configurator_run_now'),
-    path('ai-blog-configurators/<int:pk>/logs/', views.ai_blog_generation_logs_view, name='ai_blog_generation_logs'),
+    path('ai-blog-configurators/', blog_views.ai_blog_configurators_list_view, name='ai_blog_configurators_list'),
+    path('ai-blog-configurators/create/', blog_views.ai_blog_configurator_create_view, name='ai_blog_configurator_create'),
+    path('ai-blog-configurators/<int:pk>/edit/', blog_views.ai_blog_configurator_edit_view, name='ai_blog_configurator_edit'),
+    path('ai-blog-configurators/<int:pk>/delete/', blog_views.ai_blog_configurator_delete_view, name='ai_blog_configurator_delete'),
+    path('ai-blog-configurators/<int:pk>/toggle/', blog_views.ai_blog_configurator_toggle_view, name='ai_blog_configurator_toggle'),
+    path('ai-blog-configurators/<int:pk>/run-now/', blog_views.ai_blog_configurator_run_now_view, name='ai_blog_configurator_run_now'),
+    path('ai-blog-configurators/<int:pk>/logs/', blog_views.ai_blog_generation_logs_view, name='ai_blog_generation_logs'),
 
     # ============= URLs DOCUMENTACIÓN MÚLTIPLE =============
     # URLs de gestión de documentación múltiple (solo para agentes)
@@ -1007,23 +1027,23 @@ urlpatterns = [
 
     # ============= URLs ACCIONES FINANCIERAS =============
     # URLs de gestión de acciones financieras (solo para agentes)
-    path('financial-actions/', views.financial_actions_list_view, name='financial_actions_list'),
-    path('financial-actions/create/', views.financial_action_create_view, name='financial_action_create'),
-    path('financial-actions/<int:pk>/edit/', views.financial_action_edit_view, name='financial_action_edit'),
-    path('financial-actions/<int:pk>/delete/', views.financial_action_delete_view, name='financial_action_delete'),
-    path('financial-actions/<int:pk>/toggle/', views.financial_action_toggle_view, name='financial_action_toggle'),
+    path('financial-actions/', finance_views.financial_actions_list_view, name='financial_actions_list'),
+    path('financial-actions/create/', finance_views.financial_action_create_view, name='financial_action_create'),
+    path('financial-actions/<int:pk>/edit/', finance_views.financial_action_edit_view, name='financial_action_edit'),
+    path('financial-actions/<int:pk>/delete/', finance_views.financial_action_delete_view, name='financial_action_delete'),
+    path('financial-actions/<int:pk>/toggle/', finance_views.financial_action_toggle_view, name='financial_action_toggle'),
     
     # API para el ticker
-    path('api/financial-actions/ticker-data/', views.financial_actions_ticker_data_view, name='financial_actions_ticker_data'),
+    path('api/financial-actions/ticker-data/', finance_views.financial_actions_ticker_data_view, name='financial_actions_ticker_data'),
     
     # API para actualizar precios desde APIs externas
-    path('api/financial-actions/update-prices/', views.financial_actions_update_prices_view, name='financial_actions_update_prices'),
-    path('api/financial-actions/<int:pk>/update-price/', views.financial_action_update_single_price_view, name='financial_action_update_single_price'),
+    path('api/financial-actions/update-prices/', finance_views.financial_actions_update_prices_view, name='financial_actions_update_prices'),
+    path('api/financial-actions/<int:pk>/update-price/', finance_views.financial_action_update_single_price_view, name='financial_action_update_single_price'),
     
     # API para recomendaciones de IA en reuniones
-    path('api/meetings/ai-recommendations/', views.meeting_ai_recommendations_view, name='meeting_ai_recommendations'),
-    path('api/meetings/generate-spin/', views.generate_spin_methodology_view, name='generate_spin_methodology'),
-    path('api/meetings/improve-description/', views.improve_meeting_description_view, name='improve_meeting_description'),
+    path('api/meetings/ai-recommendations/', finance_views.meeting_ai_recommendations_view, name='meeting_ai_recommendations'),
+    path('api/meetings/generate-spin/', finance_views.generate_spin_methodology_view, name='generate_spin_methodology'),
+    path('api/meetings/improve-description/', finance_views.improve_meeting_description_view, name='improve_meeting_description'),
 
     # ============= URLs TABLAS DINÁMICAS API =============
     # URLs de gestión de tablas dinámicas (solo para agentes)
@@ -1077,17 +1097,17 @@ urlpatterns = [
     
     # ============= URLs ACORTADOR DE URLS =============
     # URLs de gestión del acortador (solo para agentes)
-    path('short-urls/', views.short_url_list, name='short_url_list'),
-    path('short-urls/create/', views.short_url_create, name='short_url_create'),
-    path('short-urls/<int:pk>/edit/', views.short_url_edit, name='short_url_edit'),
-    path('short-urls/<int:pk>/delete/', views.short_url_delete, name='short_url_delete'),
-    path('short-urls/<int:pk>/stats/', views.short_url_stats, name='short_url_stats'),
+    path('short-urls/', analytics_views.short_url_list, name='short_url_list'),
+    path('short-urls/create/', analytics_views.short_url_create, name='short_url_create'),
+    path('short-urls/<int:pk>/edit/', analytics_views.short_url_edit, name='short_url_edit'),
+    path('short-urls/<int:pk>/delete/', analytics_views.short_url_delete, name='short_url_delete'),
+    path('short-urls/<int:pk>/stats/', analytics_views.short_url_stats, name='short_url_stats'),
 
 ]
 
 # URL pública para redirección (debe estar fuera del include de tickets)
 urlpatterns += [
-    path('s/<str:short_code>/', views.short_url_redirect, name='short_url_redirect'),
+    path('s/<str:short_code>/', analytics_views.short_url_redirect, name='short_url_redirect'),
     
     # ============= URLs CONJUNTOS DE PRODUCTOS =============
     # URLs de gestión de conjuntos de productos (solo para agentes)
@@ -1147,21 +1167,21 @@ urlpatterns += [
     
     # ============= URLs PARA GENERADORES DE CONTACTOS =============
     # URLs privadas (requieren autenticación)
-    path('generadores-contacto/', views.contact_generator_list, name='contact_generator_list'),
-    path('generadores-contacto/crear/', views.contact_generator_create, name='contact_generator_create'),
-    path('generadores-contacto/<int:pk>/', views.contact_generator_detail, name='contact_generator_detail'),
-    path('generadores-contacto/<int:pk>/editar/', views.contact_generator_edit, name='contact_generator_edit'),
-    path('generadores-contacto/<int:pk>/eliminar/', views.contact_generator_delete, name='contact_generator_delete'),
-    path('generadores-contacto/<int:pk>/toggle-active/', views.contact_generator_toggle_active, name='contact_generator_toggle_active'),
+    path('generadores-contacto/', crm_views.contact_generator_list, name='contact_generator_list'),
+    path('generadores-contacto/crear/', crm_views.contact_generator_create, name='contact_generator_create'),
+    path('generadores-contacto/<int:pk>/', crm_views.contact_generator_detail, name='contact_generator_detail'),
+    path('generadores-contacto/<int:pk>/editar/', crm_views.contact_generator_edit, name='contact_generator_edit'),
+    path('generadores-contacto/<int:pk>/eliminar/', crm_views.contact_generator_delete, name='contact_generator_delete'),
+    path('generadores-contacto/<int:pk>/toggle-active/', crm_views.contact_generator_toggle_active, name='contact_generator_toggle_active'),
     
     # URL pública para capturar contactos (sin autenticación)
-    path('contacto/<str:token>/', views.contact_generator_public, name='contact_generator_public'),
+    path('contacto/<str:token>/', crm_views.contact_generator_public, name='contact_generator_public'),
     
     # URL pública para mostrar último ticket y solicitudes
-    path('public/dashboard/', views.public_tickets_and_requests_view, name='public_tickets_and_requests'),
+    path('public/dashboard/', crm_views.public_tickets_and_requests_view, name='public_tickets_and_requests'),
     
     # URL AJAX para actualizar estado de solicitudes
-    path('ajax/update-request-status/<int:request_id>/', views.update_company_request_status, name='update_company_request_status'),
+    path('ajax/update-request-status/<int:request_id>/', crm_views.update_company_request_status, name='update_company_request_status'),
     
     # ============= URLs PARA SISTEMA DE FORMULARIOS =============
     # URLs privadas (requieren autenticación)
@@ -1225,55 +1245,55 @@ urlpatterns += [
     path('activos/<int:pk>/mantenimiento/', views.asset_maintenance, name='asset_maintenance'),
     
     # ============= URLs PARA WHATSAPP =============
-    path('whatsapp/', views.whatsapp_dashboard, name='whatsapp_dashboard'),
-    path('whatsapp/connect/', views.whatsapp_connect, name='whatsapp_connect'),
-    path('whatsapp/disconnect/', views.whatsapp_disconnect, name='whatsapp_disconnect'),
-    path('whatsapp/status/', views.whatsapp_status, name='whatsapp_status'),
-    path('whatsapp/simulate-connection/', views.whatsapp_simulate_connection, name='whatsapp_simulate_connection'),
-    path('whatsapp/keywords/create/', views.whatsapp_keyword_create, name='whatsapp_keyword_create'),
-    path('whatsapp/keywords/<int:pk>/edit/', views.whatsapp_keyword_edit, name='whatsapp_keyword_edit'),
-    path('whatsapp/keywords/<int:pk>/delete/', views.whatsapp_keyword_delete, name='whatsapp_keyword_delete'),
-    path('whatsapp/messages/', views.whatsapp_messages, name='whatsapp_messages'),
+    path('whatsapp/', whatsapp_views.whatsapp_dashboard, name='whatsapp_dashboard'),
+    path('whatsapp/connect/', whatsapp_views.whatsapp_connect, name='whatsapp_connect'),
+    path('whatsapp/disconnect/', whatsapp_views.whatsapp_disconnect, name='whatsapp_disconnect'),
+    path('whatsapp/status/', whatsapp_views.whatsapp_status, name='whatsapp_status'),
+    path('whatsapp/simulate-connection/', whatsapp_views.whatsapp_simulate_connection, name='whatsapp_simulate_connection'),
+    path('whatsapp/keywords/create/', whatsapp_views.whatsapp_keyword_create, name='whatsapp_keyword_create'),
+    path('whatsapp/keywords/<int:pk>/edit/', whatsapp_views.whatsapp_keyword_edit, name='whatsapp_keyword_edit'),
+    path('whatsapp/keywords/<int:pk>/delete/', whatsapp_views.whatsapp_keyword_delete, name='whatsapp_keyword_delete'),
+    path('whatsapp/messages/', whatsapp_views.whatsapp_messages, name='whatsapp_messages'),
     
     # URLs de Image to Prompt
-    path('image-prompts/', views.image_prompt_list, name='image_prompt_list'),
-    path('image-prompts/create/', views.image_prompt_create, name='image_prompt_create'),
-    path('image-prompts/<int:pk>/', views.image_prompt_detail, name='image_prompt_detail'),
-    path('image-prompts/<int:pk>/edit/', views.image_prompt_edit, name='image_prompt_edit'),
-    path('image-prompts/<int:pk>/delete/', views.image_prompt_delete, name='image_prompt_delete'),
+    path('image-prompts/', ai_views.image_prompt_list, name='image_prompt_list'),
+    path('image-prompts/create/', ai_views.image_prompt_create, name='image_prompt_create'),
+    path('image-prompts/<int:pk>/', ai_views.image_prompt_detail, name='image_prompt_detail'),
+    path('image-prompts/<int:pk>/edit/', ai_views.image_prompt_edit, name='image_prompt_edit'),
+    path('image-prompts/<int:pk>/delete/', ai_views.image_prompt_delete, name='image_prompt_delete'),
     
     # Prompts públicos
-    path('prompts/', views.public_image_prompts, name='public_image_prompts'),
-    path('prompts/<int:pk>/', views.public_image_prompt_detail, name='public_image_prompt_detail'),
+    path('prompts/', ai_views.public_image_prompts, name='public_image_prompts'),
+    path('prompts/<int:pk>/', ai_views.public_image_prompt_detail, name='public_image_prompt_detail'),
     
     # Company AI Dashboard
-    path('company-ai-dashboard/', views.company_ai_dashboard_list, name='company_ai_dashboard_list'),
-    path('company-ai-dashboard/<int:pk>/', views.company_ai_dashboard_detail, name='company_ai_dashboard_detail'),
-    path('company-ai-dashboard/<int:pk>/generate-summary/', views.company_ai_generate_summary, name='company_ai_generate_summary'),
-    path('company-ai-summary/<int:pk>/', views.company_ai_summary_detail, name='company_ai_summary_detail'),
+    path('company-ai-dashboard/', ai_views.company_ai_dashboard_list, name='company_ai_dashboard_list'),
+    path('company-ai-dashboard/<int:pk>/', ai_views.company_ai_dashboard_detail, name='company_ai_dashboard_detail'),
+    path('company-ai-dashboard/<int:pk>/generate-summary/', ai_views.company_ai_generate_summary, name='company_ai_generate_summary'),
+    path('company-ai-summary/<int:pk>/', ai_views.company_ai_summary_detail, name='company_ai_summary_detail'),
     
     # Dashboard de Desempeño de Usuarios IA
-    path('user-ai-performance/', views.user_ai_performance_dashboard, name='user_ai_performance_dashboard'),
-    path('user-ai-performance/<int:user_id>/', views.user_ai_performance_detail, name='user_ai_performance_detail'),
-    path('user-ai-performance/<int:user_id>/generate/', views.user_ai_performance_generate, name='user_ai_performance_generate'),
+    path('user-ai-performance/', ai_views.user_ai_performance_dashboard, name='user_ai_performance_dashboard'),
+    path('user-ai-performance/<int:user_id>/', ai_views.user_ai_performance_detail, name='user_ai_performance_detail'),
+    path('user-ai-performance/<int:user_id>/generate/', ai_views.user_ai_performance_generate, name='user_ai_performance_generate'),
     
     # Gerentes IA
-    path('ai-managers/', views.ai_manager_list, name='ai_manager_list'),
-    path('ai-managers/create/', views.ai_manager_create, name='ai_manager_create'),
-    path('ai-managers/<int:pk>/', views.ai_manager_detail, name='ai_manager_detail'),
-    path('ai-managers/<int:pk>/edit/', views.ai_manager_edit, name='ai_manager_edit'),
-    path('ai-managers/<int:pk>/delete/', views.ai_manager_delete, name='ai_manager_delete'),
-    path('ai-managers/<int:pk>/meeting/', views.ai_manager_meeting_create, name='ai_manager_meeting_create'),
-    path('ai-managers/<int:pk>/meetings/', views.ai_manager_meetings, name='ai_manager_meetings'),
-    path('ai-managers/<int:pk>/summary/generate/', views.ai_manager_generate_summary, name='ai_manager_generate_summary'),
-    path('ai-manager-meeting/<int:pk>/', views.ai_manager_meeting_detail, name='ai_manager_meeting_detail'),
-    path('ai-manager-summary/<int:pk>/', views.ai_manager_summary_detail, name='ai_manager_summary_detail'),
+    path('ai-managers/', ai_views.ai_manager_list, name='ai_manager_list'),
+    path('ai-managers/create/', ai_views.ai_manager_create, name='ai_manager_create'),
+    path('ai-managers/<int:pk>/', ai_views.ai_manager_detail, name='ai_manager_detail'),
+    path('ai-managers/<int:pk>/edit/', ai_views.ai_manager_edit, name='ai_manager_edit'),
+    path('ai-managers/<int:pk>/delete/', ai_views.ai_manager_delete, name='ai_manager_delete'),
+    path('ai-managers/<int:pk>/meeting/', ai_views.ai_manager_meeting_create, name='ai_manager_meeting_create'),
+    path('ai-managers/<int:pk>/meetings/', ai_views.ai_manager_meetings, name='ai_manager_meetings'),
+    path('ai-managers/<int:pk>/summary/generate/', ai_views.ai_manager_generate_summary, name='ai_manager_generate_summary'),
+    path('ai-manager-meeting/<int:pk>/', ai_views.ai_manager_meeting_detail, name='ai_manager_meeting_detail'),
+    path('ai-manager-summary/<int:pk>/', ai_views.ai_manager_summary_detail, name='ai_manager_summary_detail'),
     
     # Rastreador Web
-    path('web-tracker/', views.website_tracker_list, name='website_tracker_list'),
-    path('web-tracker/create/', views.website_tracker_create, name='website_tracker_create'),
-    path('web-tracker/<int:pk>/', views.website_tracker_detail, name='website_tracker_detail'),
-    path('web-tracker/<int:pk>/delete/', views.website_tracker_delete, name='website_tracker_delete'),
+    path('web-tracker/', analytics_views.website_tracker_list, name='website_tracker_list'),
+    path('web-tracker/create/', analytics_views.website_tracker_create, name='website_tracker_create'),
+    path('web-tracker/<int:pk>/', analytics_views.website_tracker_detail, name='website_tracker_detail'),
+    path('web-tracker/<int:pk>/delete/', analytics_views.website_tracker_delete, name='website_tracker_delete'),
     
     # Generador de Contratos Legales
     path('legal-contracts/', views.legal_contract_list, name='legal_contract_list'),
@@ -1301,109 +1321,109 @@ urlpatterns += [
     path('supplier-contracts/<int:pk>/download-pdf/', views.supplier_contract_review_download_pdf, name='supplier_contract_review_download_pdf'),
     
     # Enlaces de pago PayPal
-    path('paypal-links/', views.paypal_link_list, name='paypal_link_list'),
-    path('paypal-links/create/', views.paypal_link_create, name='paypal_link_create'),
-    path('paypal-links/debug/', views.paypal_debug_config, name='paypal_debug_config'),
-    path('paypal-links/generate-catalog-token/', views.paypal_generate_public_catalog_token, name='paypal_generate_public_catalog_token'),
-    path('paypal-links/<int:pk>/', views.paypal_link_detail, name='paypal_link_detail'),
-    path('paypal-links/<int:pk>/edit/', views.paypal_link_edit, name='paypal_link_edit'),
-    path('paypal-links/<int:pk>/delete/', views.paypal_link_delete, name='paypal_link_delete'),
-    path('paypal-links/<int:pk>/cancel/', views.paypal_link_cancel, name='paypal_link_cancel'),
+    path('paypal-links/', finance_views.paypal_link_list, name='paypal_link_list'),
+    path('paypal-links/create/', finance_views.paypal_link_create, name='paypal_link_create'),
+    path('paypal-links/debug/', finance_views.paypal_debug_config, name='paypal_debug_config'),
+    path('paypal-links/generate-catalog-token/', finance_views.paypal_generate_public_catalog_token, name='paypal_generate_public_catalog_token'),
+    path('paypal-links/<int:pk>/', finance_views.paypal_link_detail, name='paypal_link_detail'),
+    path('paypal-links/<int:pk>/edit/', finance_views.paypal_link_edit, name='paypal_link_edit'),
+    path('paypal-links/<int:pk>/delete/', finance_views.paypal_link_delete, name='paypal_link_delete'),
+    path('paypal-links/<int:pk>/cancel/', finance_views.paypal_link_cancel, name='paypal_link_cancel'),
     
     # URLs públicas de PayPal (sin autenticación)
-    path('public/products/<uuid:token>/', views.public_products_catalog, name='public_products_catalog'),
-    path('public/products/<uuid:token>/buy/<int:product_id>/', views.create_payment_from_product, name='create_payment_from_product'),
-    path('paypal-payment/<uuid:token>/', views.paypal_payment_page, name='paypal_payment_page'),
-    path('paypal-link-orders/<uuid:token>/', views.paypal_link_orders, name='paypal_link_orders'),  # Ver todas las órdenes de un link
-    path('paypal-order/<uuid:token>/', views.paypal_order_summary, name='paypal_order_summary'),  # Legacy - redirige a paypal_link_orders
-    path('paypal-download/<uuid:token>/', views.paypal_file_download, name='paypal_file_download'),  # Legacy
-    path('order/<uuid:token>/', views.paypal_order_detail, name='paypal_order_detail'),  # Detalle de orden individual
-    path('order-download/<uuid:token>/', views.paypal_order_download, name='paypal_order_download'),  # Descarga por orden
+    path('public/products/<uuid:token>/', finance_views.public_products_catalog, name='public_products_catalog'),
+    path('public/products/<uuid:token>/buy/<int:product_id>/', finance_views.create_payment_from_product, name='create_payment_from_product'),
+    path('paypal-payment/<uuid:token>/', finance_views.paypal_payment_page, name='paypal_payment_page'),
+    path('paypal-link-orders/<uuid:token>/', finance_views.paypal_link_orders, name='paypal_link_orders'),  # Ver todas las órdenes de un link
+    path('paypal-order/<uuid:token>/', finance_views.paypal_order_summary, name='paypal_order_summary'),  # Legacy - redirige a paypal_link_orders
+    path('paypal-download/<uuid:token>/', finance_views.paypal_file_download, name='paypal_file_download'),  # Legacy
+    path('order/<uuid:token>/', finance_views.paypal_order_detail, name='paypal_order_detail'),  # Detalle de orden individual
+    path('order-download/<uuid:token>/', finance_views.paypal_order_download, name='paypal_order_download'),  # Descarga por orden
     
     # API/Webhooks de PayPal
-    path('paypal/webhook/', views.paypal_webhook, name='paypal_webhook'),
-    path('paypal/create-order/', views.paypal_create_order, name='paypal_create_order'),
-    path('paypal/capture-order/', views.paypal_capture_order, name='paypal_capture_order'),
+    path('paypal/webhook/', finance_views.paypal_webhook, name='paypal_webhook'),
+    path('paypal/create-order/', finance_views.paypal_create_order, name='paypal_create_order'),
+    path('paypal/capture-order/', finance_views.paypal_capture_order, name='paypal_capture_order'),
     
     # URLs de API para contadores de landing pages
-    path('api/landing-pages/<slug:slug>/meeting-click/', views.landing_page_meeting_click, name='api_landing_meeting_click'),
-    path('api/landing-pages/<slug:slug>/contact-click/', views.landing_page_contact_click, name='api_landing_contact_click'),
+    path('api/landing-pages/<slug:slug>/meeting-click/', crm_views.landing_page_meeting_click, name='api_landing_meeting_click'),
+    path('api/landing-pages/<slug:slug>/contact-click/', crm_views.landing_page_contact_click, name='api_landing_contact_click'),
     
     # URLs de solicitudes de empleados
-    path('employee-dashboard/', views.employee_dashboard, name='employee_dashboard'),
-    path('employee-requests/', views.employee_request_list, name='employee_request_list'),
-    path('employee-requests/create/', views.employee_request_create, name='employee_request_create'),
-    path('employee-requests/<int:pk>/', views.employee_request_detail, name='employee_request_detail'),
-    path('employee-requests/<int:pk>/edit/', views.employee_request_edit, name='employee_request_edit'),
-    path('employee-requests/<int:pk>/delete/', views.employee_request_delete, name='employee_request_delete'),
+    path('employee-dashboard/', hr_views.employee_dashboard, name='employee_dashboard'),
+    path('employee-requests/', hr_views.employee_request_list, name='employee_request_list'),
+    path('employee-requests/create/', hr_views.employee_request_create, name='employee_request_create'),
+    path('employee-requests/<int:pk>/', hr_views.employee_request_detail, name='employee_request_detail'),
+    path('employee-requests/<int:pk>/edit/', hr_views.employee_request_edit, name='employee_request_edit'),
+    path('employee-requests/<int:pk>/delete/', hr_views.employee_request_delete, name='employee_request_delete'),
     
     # URLs de acuerdos internos
-    path('internal-agreements/', views.internal_agreement_list, name='internal_agreement_list'),
-    path('internal-agreements/create/', views.internal_agreement_create, name='internal_agreement_create'),
-    path('internal-agreements/<int:pk>/', views.internal_agreement_detail, name='internal_agreement_detail'),
-    path('internal-agreements/<int:pk>/edit/', views.internal_agreement_edit, name='internal_agreement_edit'),
-    path('internal-agreements/<int:pk>/delete/', views.internal_agreement_delete, name='internal_agreement_delete'),
-    path('internal-agreements/<int:pk>/sign/', views.internal_agreement_sign, name='internal_agreement_sign'),
+    path('internal-agreements/', hr_views.internal_agreement_list, name='internal_agreement_list'),
+    path('internal-agreements/create/', hr_views.internal_agreement_create, name='internal_agreement_create'),
+    path('internal-agreements/<int:pk>/', hr_views.internal_agreement_detail, name='internal_agreement_detail'),
+    path('internal-agreements/<int:pk>/edit/', hr_views.internal_agreement_edit, name='internal_agreement_edit'),
+    path('internal-agreements/<int:pk>/delete/', hr_views.internal_agreement_delete, name='internal_agreement_delete'),
+    path('internal-agreements/<int:pk>/sign/', hr_views.internal_agreement_sign, name='internal_agreement_sign'),
     
     # URLs de planes de capacitación
-    path('training-plans/', views.training_plan_list, name='training_plan_list'),
-    path('training-plans/create/', views.training_plan_create, name='training_plan_create'),
-    path('training-plans/<int:pk>/', views.training_plan_detail, name='training_plan_detail'),
-    path('training-plans/<int:pk>/edit/', views.training_plan_edit, name='training_plan_edit'),
+    path('training-plans/', hr_views.training_plan_list, name='training_plan_list'),
+    path('training-plans/create/', hr_views.training_plan_create, name='training_plan_create'),
+    path('training-plans/<int:pk>/', hr_views.training_plan_detail, name='training_plan_detail'),
+    path('training-plans/<int:pk>/edit/', hr_views.training_plan_edit, name='training_plan_edit'),
     
     # URLs de enlaces de capacitación
-    path('training-plans/<int:plan_pk>/links/create/', views.training_link_create, name='training_link_create'),
-    path('training-links/<int:pk>/edit/', views.training_link_edit, name='training_link_edit'),
-    path('training-links/<int:pk>/delete/', views.training_link_delete, name='training_link_delete'),
-    path('training-links/<int:pk>/complete/', views.training_link_complete, name='training_link_complete'),
-    path('training-links/<int:pk>/uncomplete/', views.training_link_uncomplete, name='training_link_uncomplete'),
+    path('training-plans/<int:plan_pk>/links/create/', hr_views.training_link_create, name='training_link_create'),
+    path('training-links/<int:pk>/edit/', hr_views.training_link_edit, name='training_link_edit'),
+    path('training-links/<int:pk>/delete/', hr_views.training_link_delete, name='training_link_delete'),
+    path('training-links/<int:pk>/complete/', hr_views.training_link_complete, name='training_link_complete'),
+    path('training-links/<int:pk>/uncomplete/', hr_views.training_link_uncomplete, name='training_link_uncomplete'),
     
     # Mi progreso de capacitación
-    path('my-training-progress/', views.my_training_progress, name='my_training_progress'),
+    path('my-training-progress/', hr_views.my_training_progress, name='my_training_progress'),
     
     # URLs de recomendaciones IA
-    path('ai-recommendations/', views.ai_recommendation_list, name='ai_recommendation_list'),
-    path('ai-recommendations/create/', views.ai_recommendation_create, name='ai_recommendation_create'),
-    path('ai-recommendations/<int:pk>/', views.ai_recommendation_detail, name='ai_recommendation_detail'),
-    path('ai-recommendations/<int:pk>/edit/', views.ai_recommendation_edit, name='ai_recommendation_edit'),
-    path('ai-recommendations/<int:pk>/delete/', views.ai_recommendation_delete, name='ai_recommendation_delete'),
+    path('ai-recommendations/', hr_views.ai_recommendation_list, name='ai_recommendation_list'),
+    path('ai-recommendations/create/', hr_views.ai_recommendation_create, name='ai_recommendation_create'),
+    path('ai-recommendations/<int:pk>/', hr_views.ai_recommendation_detail, name='ai_recommendation_detail'),
+    path('ai-recommendations/<int:pk>/edit/', hr_views.ai_recommendation_edit, name='ai_recommendation_edit'),
+    path('ai-recommendations/<int:pk>/delete/', hr_views.ai_recommendation_delete, name='ai_recommendation_delete'),
     
     # URLs de ausencias de empleados
-    path('employee-absences/', views.employee_absence_list, name='employee_absence_list'),
-    path('employee-absences/create/', views.employee_absence_create, name='employee_absence_create'),
-    path('employee-absences/<int:pk>/', views.employee_absence_detail, name='employee_absence_detail'),
-    path('employee-absences/<int:pk>/edit/', views.employee_absence_edit, name='employee_absence_edit'),
-    path('employee-absences/<int:pk>/approve/', views.employee_absence_approve, name='employee_absence_approve'),
-    path('employee-absences/<int:pk>/delete/', views.employee_absence_delete, name='employee_absence_delete'),
-    path('employee-absences/calendar/', views.employee_absence_calendar, name='employee_absence_calendar'),
-    path('employee-absences/report/pdf/', views.employee_absence_report_pdf, name='employee_absence_report_pdf'),
+    path('employee-absences/', hr_views.employee_absence_list, name='employee_absence_list'),
+    path('employee-absences/create/', hr_views.employee_absence_create, name='employee_absence_create'),
+    path('employee-absences/<int:pk>/', hr_views.employee_absence_detail, name='employee_absence_detail'),
+    path('employee-absences/<int:pk>/edit/', hr_views.employee_absence_edit, name='employee_absence_edit'),
+    path('employee-absences/<int:pk>/approve/', hr_views.employee_absence_approve, name='employee_absence_approve'),
+    path('employee-absences/<int:pk>/delete/', hr_views.employee_absence_delete, name='employee_absence_delete'),
+    path('employee-absences/calendar/', hr_views.employee_absence_calendar, name='employee_absence_calendar'),
+    path('employee-absences/report/pdf/', hr_views.employee_absence_report_pdf, name='employee_absence_report_pdf'),
     
     # URLs de tipos de ausencias
-    path('absence-types/', views.absence_type_list, name='absence_type_list'),
-    path('absence-types/create/', views.absence_type_create, name='absence_type_create'),
-    path('absence-types/<int:pk>/edit/', views.absence_type_edit, name='absence_type_edit'),
-    path('absence-types/<int:pk>/delete/', views.absence_type_delete, name='absence_type_delete'),
-    path('absence-types/<int:pk>/toggle-active/', views.absence_type_toggle_active, name='absence_type_toggle_active'),
+    path('absence-types/', hr_views.absence_type_list, name='absence_type_list'),
+    path('absence-types/create/', hr_views.absence_type_create, name='absence_type_create'),
+    path('absence-types/<int:pk>/edit/', hr_views.absence_type_edit, name='absence_type_edit'),
+    path('absence-types/<int:pk>/delete/', hr_views.absence_type_delete, name='absence_type_delete'),
+    path('absence-types/<int:pk>/toggle-active/', hr_views.absence_type_toggle_active, name='absence_type_toggle_active'),
     
     # URLs de protocolos de empresa
-    path('company-protocols/', views.company_protocol_list, name='company_protocol_list'),
-    path('company-protocols/create/', views.company_protocol_create, name='company_protocol_create'),
-    path('company-protocols/<int:pk>/', views.company_protocol_detail, name='company_protocol_detail'),
-    path('company-protocols/<int:pk>/edit/', views.company_protocol_edit, name='company_protocol_edit'),
-    path('company-protocols/<int:pk>/delete/', views.company_protocol_delete, name='company_protocol_delete'),
-    path('company-protocols/<int:pk>/print-pdf/', views.company_protocol_print_pdf, name='company_protocol_print_pdf'),
+    path('company-protocols/', hr_views.company_protocol_list, name='company_protocol_list'),
+    path('company-protocols/create/', hr_views.company_protocol_create, name='company_protocol_create'),
+    path('company-protocols/<int:pk>/', hr_views.company_protocol_detail, name='company_protocol_detail'),
+    path('company-protocols/<int:pk>/edit/', hr_views.company_protocol_edit, name='company_protocol_edit'),
+    path('company-protocols/<int:pk>/delete/', hr_views.company_protocol_delete, name='company_protocol_delete'),
+    path('company-protocols/<int:pk>/print-pdf/', hr_views.company_protocol_print_pdf, name='company_protocol_print_pdf'),
     
     # URLs API de IA para protocolos
-    path('company-protocols/<int:pk>/ai/generate-content/', views.company_protocol_ai_generate_content, name='company_protocol_ai_generate_content'),
-    path('company-protocols/<int:pk>/ai/analyze-readability/', views.company_protocol_ai_analyze_readability, name='company_protocol_ai_analyze_readability'),
-    path('company-protocols/<int:pk>/ai/get-suggestions/', views.company_protocol_ai_get_suggestions, name='company_protocol_ai_get_suggestions'),
-    path('company-protocols/<int:pk>/ai/generate-summary/', views.company_protocol_ai_generate_summary, name='company_protocol_ai_generate_summary'),
-    path('company-protocols/<int:pk>/ai/improve-content/', views.company_protocol_ai_improve_content, name='company_protocol_ai_improve_content'),
+    path('company-protocols/<int:pk>/ai/generate-content/', hr_views.company_protocol_ai_generate_content, name='company_protocol_ai_generate_content'),
+    path('company-protocols/<int:pk>/ai/analyze-readability/', hr_views.company_protocol_ai_analyze_readability, name='company_protocol_ai_analyze_readability'),
+    path('company-protocols/<int:pk>/ai/get-suggestions/', hr_views.company_protocol_ai_get_suggestions, name='company_protocol_ai_get_suggestions'),
+    path('company-protocols/<int:pk>/ai/generate-summary/', hr_views.company_protocol_ai_generate_summary, name='company_protocol_ai_generate_summary'),
+    path('company-protocols/<int:pk>/ai/improve-content/', hr_views.company_protocol_ai_improve_content, name='company_protocol_ai_improve_content'),
     
     # URLs públicas de protocolos
-    path('company-protocols/<int:pk>/toggle-public/', views.company_protocol_toggle_public, name='company_protocol_toggle_public'),
-    path('public/protocols/<uuid:uuid>/', views.company_protocol_public_view, name='company_protocol_public_view'),
-    path('api/company-protocols/stats/', views.company_protocol_stats_api, name='company_protocol_stats_api'),
+    path('company-protocols/<int:pk>/toggle-public/', hr_views.company_protocol_toggle_public, name='company_protocol_toggle_public'),
+    path('public/protocols/<uuid:uuid>/', hr_views.company_protocol_public_view, name='company_protocol_public_view'),
+    path('api/company-protocols/stats/', hr_views.company_protocol_stats_api, name='company_protocol_stats_api'),
     
     # URLs de QA - Quejas y Sugerencias
     path('qa/', views.qa_dashboard, name='qa_dashboard'),
@@ -1439,74 +1459,74 @@ urlpatterns += [
     path('privacy/<slug:slug>/', views.public_privacy_policy, name='public_privacy_policy'),
     
     # URLs de Cumplimiento Mensual
-    path('qa/cumplimiento/', views.monthly_cumplimiento_list, name='monthly_cumplimiento_list'),
-    path('qa/cumplimiento/create/', views.monthly_cumplimiento_create, name='monthly_cumplimiento_create'),
-    path('qa/cumplimiento/<int:pk>/', views.monthly_cumplimiento_detail, name='monthly_cumplimiento_detail'),
-    path('qa/cumplimiento/<int:pk>/edit/', views.monthly_cumplimiento_edit, name='monthly_cumplimiento_edit'),
-    path('qa/cumplimiento/<int:pk>/delete/', views.monthly_cumplimiento_delete, name='monthly_cumplimiento_delete'),
-    path('qa/cumplimiento/<int:pk>/toggle/', views.monthly_cumplimiento_toggle, name='monthly_cumplimiento_toggle'),
+    path('qa/cumplimiento/', hr_views.monthly_cumplimiento_list, name='monthly_cumplimiento_list'),
+    path('qa/cumplimiento/create/', hr_views.monthly_cumplimiento_create, name='monthly_cumplimiento_create'),
+    path('qa/cumplimiento/<int:pk>/', hr_views.monthly_cumplimiento_detail, name='monthly_cumplimiento_detail'),
+    path('qa/cumplimiento/<int:pk>/edit/', hr_views.monthly_cumplimiento_edit, name='monthly_cumplimiento_edit'),
+    path('qa/cumplimiento/<int:pk>/delete/', hr_views.monthly_cumplimiento_delete, name='monthly_cumplimiento_delete'),
+    path('qa/cumplimiento/<int:pk>/toggle/', hr_views.monthly_cumplimiento_toggle, name='monthly_cumplimiento_toggle'),
     
     # URL pública para cumplimiento mensual (móvil)
-    path('cumplimiento/<uuid:uuid>/', views.monthly_cumplimiento_public, name='monthly_cumplimiento_public'),
+    path('cumplimiento/<uuid:uuid>/', hr_views.monthly_cumplimiento_public, name='monthly_cumplimiento_public'),
     
     # URL para menú de cumplimientos de usuario
-    path('cumplimientos/<uuid:uuid>/', views.user_cumplimientos_menu, name='user_cumplimientos_menu'),
+    path('cumplimientos/<uuid:uuid>/', hr_views.user_cumplimientos_menu, name='user_cumplimientos_menu'),
     
     # URLs del Tutor IA
-    path('ai-tutor/', views.ai_tutor_list, name='ai_tutor_list'),
-    path('ai-tutor/create/', views.ai_tutor_create, name='ai_tutor_create'),
-    path('ai-tutor/<int:pk>/', views.ai_tutor_detail, name='ai_tutor_detail'),
-    path('ai-tutor/<int:pk>/edit/', views.ai_tutor_edit, name='ai_tutor_edit'),
-    path('ai-tutor/<int:pk>/delete/', views.ai_tutor_delete, name='ai_tutor_delete'),
-    path('ai-tutor/<int:pk>/progress/', views.ai_tutor_progress_report, name='ai_tutor_progress_report'),
-    path('ai-tutor/<int:pk>/upload/', views.ai_tutor_upload_attachment, name='ai_tutor_upload_attachment'),
-    path('ai-tutor/feedback/<int:pk>/generate/', views.ai_tutor_generate_feedback_ajax, name='ai_tutor_generate_feedback_ajax'),
-    path('ai-tutor/optimize-config/', views.ai_tutor_optimize_config, name='ai_tutor_optimize_config'),
+    path('ai-tutor/', ai_views.ai_tutor_list, name='ai_tutor_list'),
+    path('ai-tutor/create/', ai_views.ai_tutor_create, name='ai_tutor_create'),
+    path('ai-tutor/<int:pk>/', ai_views.ai_tutor_detail, name='ai_tutor_detail'),
+    path('ai-tutor/<int:pk>/edit/', ai_views.ai_tutor_edit, name='ai_tutor_edit'),
+    path('ai-tutor/<int:pk>/delete/', ai_views.ai_tutor_delete, name='ai_tutor_delete'),
+    path('ai-tutor/<int:pk>/progress/', ai_views.ai_tutor_progress_report, name='ai_tutor_progress_report'),
+    path('ai-tutor/<int:pk>/upload/', ai_views.ai_tutor_upload_attachment, name='ai_tutor_upload_attachment'),
+    path('ai-tutor/feedback/<int:pk>/generate/', ai_views.ai_tutor_generate_feedback_ajax, name='ai_tutor_generate_feedback_ajax'),
+    path('ai-tutor/optimize-config/', ai_views.ai_tutor_optimize_config, name='ai_tutor_optimize_config'),
     
     # URLs de Rendición de Gastos
-    path('expense-reports/', views.expense_report_list, name='expense_report_list'),
-    path('expense-reports/create/', views.expense_report_create, name='expense_report_create'),
-    path('expense-reports/<int:pk>/', views.expense_report_detail, name='expense_report_detail'),
-    path('expense-reports/<int:pk>/edit/', views.expense_report_edit, name='expense_report_edit'),
-    path('expense-reports/<int:pk>/delete/', views.expense_report_delete, name='expense_report_delete'),
-    path('expense-reports/<int:pk>/submit/', views.expense_report_submit, name='expense_report_submit'),
-    path('expense-reports/<int:pk>/approve/', views.expense_report_approve, name='expense_report_approve'),
-    path('expense-reports/<int:pk>/reject/', views.expense_report_reject, name='expense_report_reject'),
-    path('expense-reports/<int:pk>/mark-paid/', views.expense_report_mark_paid, name='expense_report_mark_paid'),
+    path('expense-reports/', hr_views.expense_report_list, name='expense_report_list'),
+    path('expense-reports/create/', hr_views.expense_report_create, name='expense_report_create'),
+    path('expense-reports/<int:pk>/', hr_views.expense_report_detail, name='expense_report_detail'),
+    path('expense-reports/<int:pk>/edit/', hr_views.expense_report_edit, name='expense_report_edit'),
+    path('expense-reports/<int:pk>/delete/', hr_views.expense_report_delete, name='expense_report_delete'),
+    path('expense-reports/<int:pk>/submit/', hr_views.expense_report_submit, name='expense_report_submit'),
+    path('expense-reports/<int:pk>/approve/', hr_views.expense_report_approve, name='expense_report_approve'),
+    path('expense-reports/<int:pk>/reject/', hr_views.expense_report_reject, name='expense_report_reject'),
+    path('expense-reports/<int:pk>/mark-paid/', hr_views.expense_report_mark_paid, name='expense_report_mark_paid'),
     
     # URLs de Items de Gastos
-    path('expense-reports/<int:report_pk>/items/create/', views.expense_item_create, name='expense_item_create'),
-    path('expense-items/<int:pk>/edit/', views.expense_item_edit, name='expense_item_edit'),
-    path('expense-items/<int:pk>/delete/', views.expense_item_delete, name='expense_item_delete'),
+    path('expense-reports/<int:report_pk>/items/create/', hr_views.expense_item_create, name='expense_item_create'),
+    path('expense-items/<int:pk>/edit/', hr_views.expense_item_edit, name='expense_item_edit'),
+    path('expense-items/<int:pk>/delete/', hr_views.expense_item_delete, name='expense_item_delete'),
     
     # URLs de Comentarios de Gastos
-    path('expense-reports/<int:report_pk>/comments/create/', views.expense_comment_create, name='expense_comment_create'),
+    path('expense-reports/<int:report_pk>/comments/create/', hr_views.expense_comment_create, name='expense_comment_create'),
 
     # URLs de Fondos de Gastos
-    path('expense-reports/<int:report_pk>/funds/create/', views.expense_fund_create, name='expense_fund_create'),
-    path('expense-funds/<int:pk>/edit/', views.expense_fund_edit, name='expense_fund_edit'),
-    path('expense-funds/<int:pk>/delete/', views.expense_fund_delete, name='expense_fund_delete'),
+    path('expense-reports/<int:report_pk>/funds/create/', hr_views.expense_fund_create, name='expense_fund_create'),
+    path('expense-funds/<int:pk>/edit/', hr_views.expense_fund_edit, name='expense_fund_edit'),
+    path('expense-funds/<int:pk>/delete/', hr_views.expense_fund_delete, name='expense_fund_delete'),
 
     # URLs de Reuniones de Video
-    path('video-meetings/', views.video_meeting_list, name='video_meeting_list'),
-    path('video-meetings/create/', views.video_meeting_create, name='video_meeting_create'),
-    path('video-meetings/<int:pk>/', views.video_meeting_detail, name='video_meeting_detail'),
-    path('video-meetings/<int:pk>/edit/', views.video_meeting_edit, name='video_meeting_edit'),
-    path('video-meetings/<int:pk>/delete/', views.video_meeting_delete, name='video_meeting_delete'),
-    path('video-meetings/<int:pk>/transcription/', views.video_meeting_transcription, name='video_meeting_transcription_edit'),
-    path('video-meetings/<int:pk>/transcribe/', views.video_meeting_transcribe, name='video_meeting_transcribe'),
-    path('video-meetings/<int:pk>/transcription-status/', views.video_meeting_transcription_status, name='video_meeting_transcription_status'),
-    path('video-meetings/<int:pk>/download-transcription/', views.video_meeting_download_transcription, name='video_meeting_download_transcription'),
+    path('video-meetings/', crm_views.video_meeting_list, name='video_meeting_list'),
+    path('video-meetings/create/', crm_views.video_meeting_create, name='video_meeting_create'),
+    path('video-meetings/<int:pk>/', crm_views.video_meeting_detail, name='video_meeting_detail'),
+    path('video-meetings/<int:pk>/edit/', crm_views.video_meeting_edit, name='video_meeting_edit'),
+    path('video-meetings/<int:pk>/delete/', crm_views.video_meeting_delete, name='video_meeting_delete'),
+    path('video-meetings/<int:pk>/transcription/', crm_views.video_meeting_transcription, name='video_meeting_transcription_edit'),
+    path('video-meetings/<int:pk>/transcribe/', crm_views.video_meeting_transcribe, name='video_meeting_transcribe'),
+    path('video-meetings/<int:pk>/transcription-status/', crm_views.video_meeting_transcription_status, name='video_meeting_transcription_status'),
+    path('video-meetings/<int:pk>/download-transcription/', crm_views.video_meeting_download_transcription, name='video_meeting_download_transcription'),
     
     # URLs de Notas de Reunión
-    path('video-meetings/<int:meeting_pk>/notes/<int:note_pk>/delete/', views.meeting_note_delete, name='meeting_note_delete'),
+    path('video-meetings/<int:meeting_pk>/notes/<int:note_pk>/delete/', crm_views.meeting_note_delete, name='meeting_note_delete'),
     
     # URLs de Generador de Citas IA
-    path('quote-generator/', views.quote_generator_list, name='quote_generator_list'),
-    path('quote-generator/create/', views.quote_generator_create, name='quote_generator_create'),
-    path('quote-generator/<int:pk>/', views.quote_generator_detail, name='quote_generator_detail'),
-    path('quote-generator/<int:pk>/edit/', views.quote_generator_edit, name='quote_generator_edit'),
-    path('quote-generator/<int:pk>/regenerate/', views.quote_generator_regenerate, name='quote_generator_regenerate'),
+    path('quote-generator/', ai_views.quote_generator_list, name='quote_generator_list'),
+    path('quote-generator/create/', ai_views.quote_generator_create, name='quote_generator_create'),
+    path('quote-generator/<int:pk>/', ai_views.quote_generator_detail, name='quote_generator_detail'),
+    path('quote-generator/<int:pk>/edit/', ai_views.quote_generator_edit, name='quote_generator_edit'),
+    path('quote-generator/<int:pk>/regenerate/', ai_views.quote_generator_regenerate, name='quote_generator_regenerate'),
     
     # URLs para cuentas regresivas
     path('countdown-timer/', views.countdown_timer_list, name='countdown_timer_list'),
@@ -1549,8 +1569,8 @@ urlpatterns += [
     path('database/backup/delete/<str:filename>/', views.delete_backup, name='delete_backup'),
     
     # URLs Públicas de CRM Questions (sin autenticación)
-    path('public/company/<uuid:company_uuid>/questions/', views.public_crm_questions, name='public_crm_questions'),
-    path('public/company/<uuid:company_uuid>/questions/ask/', views.public_crm_question_create, name='public_crm_question_create'),
+    path('public/company/<uuid:company_uuid>/questions/', crm_views.public_crm_questions, name='public_crm_questions'),
+    path('public/company/<uuid:company_uuid>/questions/ask/', crm_views.public_crm_question_create, name='public_crm_question_create'),
     
     # URLs de Tareas Programadas
     path('scheduled-tasks/', views.scheduled_task_list, name='scheduled_task_list'),
@@ -1618,22 +1638,22 @@ urlpatterns += [
     path('trips/public/<uuid:token>/', views.trip_public, name='trip_public'),
     
     # URLs de Contadores Web
-    path('web-counters/', views.web_counter_list, name='web_counter_list'),
-    path('web-counters/create/', views.web_counter_create, name='web_counter_create'),
-    path('web-counters/<int:pk>/', views.web_counter_detail, name='web_counter_detail'),
-    path('web-counters/<int:pk>/edit/', views.web_counter_edit, name='web_counter_edit'),
-    path('web-counters/<int:pk>/delete/', views.web_counter_delete, name='web_counter_delete'),
-    path('web-counters/test/<str:token>/', views.web_counter_test_page, name='web_counter_test_page'),
+    path('web-counters/', analytics_views.web_counter_list, name='web_counter_list'),
+    path('web-counters/create/', analytics_views.web_counter_create, name='web_counter_create'),
+    path('web-counters/<int:pk>/', analytics_views.web_counter_detail, name='web_counter_detail'),
+    path('web-counters/<int:pk>/edit/', analytics_views.web_counter_edit, name='web_counter_edit'),
+    path('web-counters/<int:pk>/delete/', analytics_views.web_counter_delete, name='web_counter_delete'),
+    path('web-counters/test/<str:token>/', analytics_views.web_counter_test_page, name='web_counter_test_page'),
     
     # Cotizaciones Rápidas
-    path('quick-quotes/', views.quick_quote_list, name='quick_quote_list'),
-    path('quick-quotes/create/', views.quick_quote_create, name='quick_quote_create'),
-    path('quick-quotes/<int:pk>/', views.quick_quote_detail, name='quick_quote_detail'),
-    path('quick-quotes/<int:pk>/edit/', views.quick_quote_edit, name='quick_quote_edit'),
-    path('quick-quotes/<int:pk>/delete/', views.quick_quote_delete, name='quick_quote_delete'),
-    path('quick-quotes/<int:pk>/duplicate/', views.quick_quote_duplicate, name='quick_quote_duplicate'),
-    path('quote/<str:token>/', views.quick_quote_public, name='quick_quote_public'),
-    path('quotes/client/<str:client_name>/', views.quick_quote_public_list, name='quick_quote_public_list'),
+    path('quick-quotes/', crm_views.quick_quote_list, name='quick_quote_list'),
+    path('quick-quotes/create/', crm_views.quick_quote_create, name='quick_quote_create'),
+    path('quick-quotes/<int:pk>/', crm_views.quick_quote_detail, name='quick_quote_detail'),
+    path('quick-quotes/<int:pk>/edit/', crm_views.quick_quote_edit, name='quick_quote_edit'),
+    path('quick-quotes/<int:pk>/delete/', crm_views.quick_quote_delete, name='quick_quote_delete'),
+    path('quick-quotes/<int:pk>/duplicate/', crm_views.quick_quote_duplicate, name='quick_quote_duplicate'),
+    path('quote/<str:token>/', crm_views.quick_quote_public, name='quick_quote_public'),
+    path('quotes/client/<str:client_name>/', crm_views.quick_quote_public_list, name='quick_quote_public_list'),
     
     # URLs de Contratos de Soporte
     path('support-contracts/', views.support_contract_list, name='support_contract_list'),
@@ -1658,19 +1678,19 @@ urlpatterns += [
     path('measurement-chart/<str:token>/', views.multi_measurement_public_chart, name='multi_measurement_public_chart'),
     
     # Presupuesto Personal
-    path('budgets/', views.budget_list, name='budget_list'),
-    path('budgets/create/', views.budget_create, name='budget_create'),
-    path('budgets/<int:pk>/', views.budget_detail, name='budget_detail'),
-    path('budgets/<int:pk>/edit/', views.budget_edit, name='budget_edit'),
-    path('budgets/<int:pk>/delete/', views.budget_delete, name='budget_delete'),
-    path('budgets/<int:budget_pk>/income/create/', views.budget_income_item_create, name='budget_income_item_create'),
-    path('budgets/<int:budget_pk>/expense/create/', views.budget_expense_item_create, name='budget_expense_item_create'),
-    path('budgets/<int:budget_pk>/income/<int:item_pk>/edit/', views.budget_income_item_edit, name='budget_income_item_edit'),
-    path('budgets/<int:budget_pk>/expense/<int:item_pk>/edit/', views.budget_expense_item_edit, name='budget_expense_item_edit'),
-    path('budgets/<int:budget_pk>/income/<int:item_pk>/delete/', views.budget_income_item_delete, name='budget_income_item_delete'),
-    path('budgets/<int:budget_pk>/expense/<int:item_pk>/delete/', views.budget_expense_item_delete, name='budget_expense_item_delete'),
-    path('budgets/<int:budget_pk>/transaction/create/', views.budget_transaction_create, name='budget_transaction_create'),
-    path('budgets/<int:budget_pk>/transaction/<int:trans_pk>/delete/', views.budget_transaction_delete, name='budget_transaction_delete'),
+    path('budgets/', finance_views.budget_list, name='budget_list'),
+    path('budgets/create/', finance_views.budget_create, name='budget_create'),
+    path('budgets/<int:pk>/', finance_views.budget_detail, name='budget_detail'),
+    path('budgets/<int:pk>/edit/', finance_views.budget_edit, name='budget_edit'),
+    path('budgets/<int:pk>/delete/', finance_views.budget_delete, name='budget_delete'),
+    path('budgets/<int:budget_pk>/income/create/', finance_views.budget_income_item_create, name='budget_income_item_create'),
+    path('budgets/<int:budget_pk>/expense/create/', finance_views.budget_expense_item_create, name='budget_expense_item_create'),
+    path('budgets/<int:budget_pk>/income/<int:item_pk>/edit/', finance_views.budget_income_item_edit, name='budget_income_item_edit'),
+    path('budgets/<int:budget_pk>/expense/<int:item_pk>/edit/', finance_views.budget_expense_item_edit, name='budget_expense_item_edit'),
+    path('budgets/<int:budget_pk>/income/<int:item_pk>/delete/', finance_views.budget_income_item_delete, name='budget_income_item_delete'),
+    path('budgets/<int:budget_pk>/expense/<int:item_pk>/delete/', finance_views.budget_expense_item_delete, name='budget_expense_item_delete'),
+    path('budgets/<int:budget_pk>/transaction/create/', finance_views.budget_transaction_create, name='budget_transaction_create'),
+    path('budgets/<int:budget_pk>/transaction/<int:trans_pk>/delete/', finance_views.budget_transaction_delete, name='budget_transaction_delete'),
     
     # URLs de Documentos de Requerimientos Funcionales (DRF)
     path('frd/', views.frd_list_view, name='frd_list'),
@@ -1747,11 +1767,11 @@ urlpatterns += [
     path('checklist/<str:token>/item/<int:item_pk>/toggle/', views.checklist_item_toggle_public, name='checklist_item_toggle_public'),
     
     # URLs de transacciones
-    path('transactions/', views.transaction_list, name='transaction_list'),
-    path('transactions/create/', views.transaction_create, name='transaction_create'),
-    path('transactions/<int:pk>/edit/', views.transaction_edit, name='transaction_edit'),
-    path('transactions/<int:pk>/delete/', views.transaction_delete, name='transaction_delete'),
-    path('transactions/search/', views.transaction_search, name='transaction_search'),
+    path('transactions/', finance_views.transaction_list, name='transaction_list'),
+    path('transactions/create/', finance_views.transaction_create, name='transaction_create'),
+    path('transactions/<int:pk>/edit/', finance_views.transaction_edit, name='transaction_edit'),
+    path('transactions/<int:pk>/delete/', finance_views.transaction_delete, name='transaction_delete'),
+    path('transactions/search/', finance_views.transaction_search, name='transaction_search'),
     
     # Base de Conocimientos
     path('knowledge-base/', views.knowledge_base_list, name='knowledge_base_list'),
@@ -1782,92 +1802,92 @@ urlpatterns += [
     path('sql-queries/<int:pk>/toggle-favorite/', views.sql_query_toggle_favorite, name='sql_query_toggle_favorite'),
     
     # Odoo RPC - Connections
-    path('odoo-rpc/connections/', views.odoo_connection_list, name='odoo_connection_list'),
-    path('odoo-rpc/connections/create/', views.odoo_connection_create, name='odoo_connection_create'),
-    path('odoo-rpc/connections/<int:pk>/edit/', views.odoo_connection_edit, name='odoo_connection_edit'),
-    path('odoo-rpc/connections/<int:pk>/delete/', views.odoo_connection_delete, name='odoo_connection_delete'),
-    path('odoo-rpc/connections/<int:pk>/test/', views.odoo_connection_test, name='odoo_connection_test'),
-    path('odoo-rpc/connections/<int:pk>/backup/', views.odoo_connection_backup, name='odoo_connection_backup'),
+    path('odoo-rpc/connections/', odoo_views.odoo_connection_list, name='odoo_connection_list'),
+    path('odoo-rpc/connections/create/', odoo_views.odoo_connection_create, name='odoo_connection_create'),
+    path('odoo-rpc/connections/<int:pk>/edit/', odoo_views.odoo_connection_edit, name='odoo_connection_edit'),
+    path('odoo-rpc/connections/<int:pk>/delete/', odoo_views.odoo_connection_delete, name='odoo_connection_delete'),
+    path('odoo-rpc/connections/<int:pk>/test/', odoo_views.odoo_connection_test, name='odoo_connection_test'),
+    path('odoo-rpc/connections/<int:pk>/backup/', odoo_views.odoo_connection_backup, name='odoo_connection_backup'),
     
     # Odoo RPC - Operations Portal
-    path('odoo-rpc/connections/<int:connection_id>/operations/', views.odoo_rpc_operations_portal, name='odoo_rpc_operations_portal'),
-    path('odoo-rpc/connections/<int:connection_id>/share-status/', views.odoo_rpc_share_status, name='odoo_rpc_share_status'),
-    path('odoo-rpc/connections/<int:connection_id>/generate-share-url/', views.odoo_rpc_generate_share_url, name='odoo_rpc_generate_share_url'),
-    path('odoo-rpc/connections/<int:connection_id>/search-records/', views.odoo_rpc_search_records, name='odoo_rpc_search_records'),
-    path('odoo-rpc/connections/<int:connection_id>/create-record/', views.odoo_rpc_create_record, name='odoo_rpc_create_record'),
-    path('odoo-rpc/connections/<int:connection_id>/update-record/', views.odoo_rpc_update_record, name='odoo_rpc_update_record'),
-    path('odoo-rpc/connections/<int:connection_id>/delete-record/', views.odoo_rpc_delete_record, name='odoo_rpc_delete_record'),
-    path('odoo-rpc/connections/<int:connection_id>/bulk-update/', views.odoo_rpc_bulk_update, name='odoo_rpc_bulk_update'),
+    path('odoo-rpc/connections/<int:connection_id>/operations/', odoo_views.odoo_rpc_operations_portal, name='odoo_rpc_operations_portal'),
+    path('odoo-rpc/connections/<int:connection_id>/share-status/', odoo_views.odoo_rpc_share_status, name='odoo_rpc_share_status'),
+    path('odoo-rpc/connections/<int:connection_id>/generate-share-url/', odoo_views.odoo_rpc_generate_share_url, name='odoo_rpc_generate_share_url'),
+    path('odoo-rpc/connections/<int:connection_id>/search-records/', odoo_views.odoo_rpc_search_records, name='odoo_rpc_search_records'),
+    path('odoo-rpc/connections/<int:connection_id>/create-record/', odoo_views.odoo_rpc_create_record, name='odoo_rpc_create_record'),
+    path('odoo-rpc/connections/<int:connection_id>/update-record/', odoo_views.odoo_rpc_update_record, name='odoo_rpc_update_record'),
+    path('odoo-rpc/connections/<int:connection_id>/delete-record/', odoo_views.odoo_rpc_delete_record, name='odoo_rpc_delete_record'),
+    path('odoo-rpc/connections/<int:connection_id>/bulk-update/', odoo_views.odoo_rpc_bulk_update, name='odoo_rpc_bulk_update'),
     
     # Odoo RPC - Public Portal
-    path('public/odoo-operations/<str:token>/', views.odoo_rpc_public_operations, name='odoo_rpc_public_operations'),
-    path('public/odoo-operations/<str:token>/search-records/', views.odoo_rpc_public_search_records, name='odoo_rpc_public_search_records'),
-    path('public/odoo-operations/<str:token>/create-record/', views.odoo_rpc_public_create_record, name='odoo_rpc_public_create_record'),
-    path('public/odoo-operations/<str:token>/update-record/', views.odoo_rpc_public_update_record, name='odoo_rpc_public_update_record'),
-    path('public/odoo-operations/<str:token>/delete-record/', views.odoo_rpc_public_delete_record, name='odoo_rpc_public_delete_record'),
-    path('public/odoo-operations/<str:token>/bulk-update/', views.odoo_rpc_public_bulk_update, name='odoo_rpc_public_bulk_update'),
+    path('public/odoo-operations/<str:token>/', odoo_views.odoo_rpc_public_operations, name='odoo_rpc_public_operations'),
+    path('public/odoo-operations/<str:token>/search-records/', odoo_views.odoo_rpc_public_search_records, name='odoo_rpc_public_search_records'),
+    path('public/odoo-operations/<str:token>/create-record/', odoo_views.odoo_rpc_public_create_record, name='odoo_rpc_public_create_record'),
+    path('public/odoo-operations/<str:token>/update-record/', odoo_views.odoo_rpc_public_update_record, name='odoo_rpc_public_update_record'),
+    path('public/odoo-operations/<str:token>/delete-record/', odoo_views.odoo_rpc_public_delete_record, name='odoo_rpc_public_delete_record'),
+    path('public/odoo-operations/<str:token>/bulk-update/', odoo_views.odoo_rpc_public_bulk_update, name='odoo_rpc_public_bulk_update'),
     
     # Odoo RPC - Tables
-    path('odoo-rpc/connections/<int:connection_id>/tables/', views.odoo_rpc_table_list, name='odoo_rpc_table_list'),
-    path('odoo-rpc/connections/<int:connection_id>/tables/create/', views.odoo_rpc_table_create, name='odoo_rpc_table_create'),
-    path('odoo-rpc/connections/<int:connection_id>/get-available-models/', views.odoo_rpc_get_available_models, name='odoo_rpc_get_available_models'),
-    path('odoo-rpc/tables/<int:pk>/', views.odoo_rpc_table_detail, name='odoo_rpc_table_detail'),
-    path('odoo-rpc/tables/<int:pk>/edit/', views.odoo_rpc_table_edit, name='odoo_rpc_table_edit'),
-    path('odoo-rpc/tables/<int:pk>/delete/', views.odoo_rpc_table_delete, name='odoo_rpc_table_delete'),
-    path('odoo-rpc/tables/<int:table_id>/export-template/', views.odoo_rpc_table_export_template, name='odoo_rpc_table_export_template'),
-    path('odoo-rpc/tables/<int:table_id>/import-data/', views.odoo_rpc_table_import_data, name='odoo_rpc_table_import_data'),
-    path('odoo-rpc/tables/<int:table_id>/execute/', views.odoo_rpc_data_execute, name='odoo_rpc_data_execute'),
-    path('odoo-rpc/tables/<int:table_id>/data/', views.odoo_rpc_data_list, name='odoo_rpc_data_list'),
+    path('odoo-rpc/connections/<int:connection_id>/tables/', odoo_views.odoo_rpc_table_list, name='odoo_rpc_table_list'),
+    path('odoo-rpc/connections/<int:connection_id>/tables/create/', odoo_views.odoo_rpc_table_create, name='odoo_rpc_table_create'),
+    path('odoo-rpc/connections/<int:connection_id>/get-available-models/', odoo_views.odoo_rpc_get_available_models, name='odoo_rpc_get_available_models'),
+    path('odoo-rpc/tables/<int:pk>/', odoo_views.odoo_rpc_table_detail, name='odoo_rpc_table_detail'),
+    path('odoo-rpc/tables/<int:pk>/edit/', odoo_views.odoo_rpc_table_edit, name='odoo_rpc_table_edit'),
+    path('odoo-rpc/tables/<int:pk>/delete/', odoo_views.odoo_rpc_table_delete, name='odoo_rpc_table_delete'),
+    path('odoo-rpc/tables/<int:table_id>/export-template/', odoo_views.odoo_rpc_table_export_template, name='odoo_rpc_table_export_template'),
+    path('odoo-rpc/tables/<int:table_id>/import-data/', odoo_views.odoo_rpc_table_import_data, name='odoo_rpc_table_import_data'),
+    path('odoo-rpc/tables/<int:table_id>/execute/', odoo_views.odoo_rpc_data_execute, name='odoo_rpc_data_execute'),
+    path('odoo-rpc/tables/<int:table_id>/data/', odoo_views.odoo_rpc_data_list, name='odoo_rpc_data_list'),
     
     # Odoo RPC - Fields
-    path('odoo-rpc/tables/<int:table_id>/fields/create/', views.odoo_rpc_field_create, name='odoo_rpc_field_create'),
-    path('odoo-rpc/fields/<int:pk>/edit/', views.odoo_rpc_field_edit, name='odoo_rpc_field_edit'),
-    path('odoo-rpc/fields/<int:pk>/delete/', views.odoo_rpc_field_delete, name='odoo_rpc_field_delete'),
+    path('odoo-rpc/tables/<int:table_id>/fields/create/', odoo_views.odoo_rpc_field_create, name='odoo_rpc_field_create'),
+    path('odoo-rpc/fields/<int:pk>/edit/', odoo_views.odoo_rpc_field_edit, name='odoo_rpc_field_edit'),
+    path('odoo-rpc/fields/<int:pk>/delete/', odoo_views.odoo_rpc_field_delete, name='odoo_rpc_field_delete'),
     
     # Odoo RPC - Search and Export from Odoo
-    path('odoo-rpc/tables/<int:table_id>/search-odoo/', views.odoo_rpc_search_odoo, name='odoo_rpc_search_odoo'),
-    path('odoo-rpc/tables/<int:table_id>/search-results/', views.odoo_rpc_search_results, name='odoo_rpc_search_results'),
-    path('odoo-rpc/tables/<int:table_id>/export-odoo-data/', views.odoo_rpc_export_odoo_data, name='odoo_rpc_export_odoo_data'),
+    path('odoo-rpc/tables/<int:table_id>/search-odoo/', odoo_views.odoo_rpc_search_odoo, name='odoo_rpc_search_odoo'),
+    path('odoo-rpc/tables/<int:table_id>/search-results/', odoo_views.odoo_rpc_search_results, name='odoo_rpc_search_results'),
+    path('odoo-rpc/tables/<int:table_id>/export-odoo-data/', odoo_views.odoo_rpc_export_odoo_data, name='odoo_rpc_export_odoo_data'),
     
     # Odoo RPC - Local Data Management
-    path('odoo-rpc/tables/<int:table_id>/data/', views.odoo_rpc_data_list, name='odoo_rpc_data_list'),
-    path('odoo-rpc/tables/<int:table_id>/data/export-all/', views.odoo_rpc_data_export_all, name='odoo_rpc_data_export_all'),
-    path('odoo-rpc/tables/<int:table_id>/import-files/', views.odoo_rpc_import_files_list, name='odoo_rpc_import_files_list'),
+    path('odoo-rpc/tables/<int:table_id>/data/', odoo_views.odoo_rpc_data_list, name='odoo_rpc_data_list'),
+    path('odoo-rpc/tables/<int:table_id>/data/export-all/', odoo_views.odoo_rpc_data_export_all, name='odoo_rpc_data_export_all'),
+    path('odoo-rpc/tables/<int:table_id>/import-files/', odoo_views.odoo_rpc_import_files_list, name='odoo_rpc_import_files_list'),
     
     # Odoo RPC - Public URL Management
-    path('odoo-rpc/tables/<int:table_id>/public-url/', views.odoo_rpc_manage_public_url, name='odoo_rpc_manage_public_url'),
+    path('odoo-rpc/tables/<int:table_id>/public-url/', odoo_views.odoo_rpc_manage_public_url, name='odoo_rpc_manage_public_url'),
     
     # Odoo RPC - Public Form Management
-    path('odoo-rpc/tables/<int:table_id>/form-status/', views.odoo_rpc_form_status, name='odoo_rpc_form_status'),
-    path('odoo-rpc/tables/<int:table_id>/generate-form-url/', views.odoo_rpc_generate_form_url, name='odoo_rpc_generate_form_url'),
+    path('odoo-rpc/tables/<int:table_id>/form-status/', odoo_views.odoo_rpc_form_status, name='odoo_rpc_form_status'),
+    path('odoo-rpc/tables/<int:table_id>/generate-form-url/', odoo_views.odoo_rpc_generate_form_url, name='odoo_rpc_generate_form_url'),
     
     # Odoo RPC - Public Portal Management (conexión completa)
-    path('odoo-rpc/connections/<int:connection_id>/public-portal/', views.odoo_connection_manage_portal, name='odoo_connection_manage_portal'),
+    path('odoo-rpc/connections/<int:connection_id>/public-portal/', odoo_views.odoo_connection_manage_portal, name='odoo_connection_manage_portal'),
     
     # Odoo RPC - Public Import (sin login requerido)
-    path('public/odoo-import/<str:token>/', views.odoo_rpc_public_import, name='odoo_rpc_public_import'),
+    path('public/odoo-import/<str:token>/', odoo_views.odoo_rpc_public_import, name='odoo_rpc_public_import'),
     
     # Odoo RPC - Public Form (sin login requerido)
-    path('public/odoo-form/<str:token>/', views.odoo_rpc_public_form, name='odoo_rpc_public_form'),
+    path('public/odoo-form/<str:token>/', odoo_views.odoo_rpc_public_form, name='odoo_rpc_public_form'),
     
     # Odoo RPC - Public Portal (sin login requerido)
-    path('public/odoo-portal/<str:token>/', views.odoo_rpc_public_portal, name='odoo_rpc_public_portal'),
-    path('public/odoo-portal/<str:token>/table/<int:table_id>/', views.odoo_rpc_public_portal_table, name='odoo_rpc_public_portal_table'),
+    path('public/odoo-portal/<str:token>/', odoo_views.odoo_rpc_public_portal, name='odoo_rpc_public_portal'),
+    path('public/odoo-portal/<str:token>/table/<int:table_id>/', odoo_views.odoo_rpc_public_portal_table, name='odoo_rpc_public_portal_table'),
     
     # Public Work Order Creation
-    path('users/<int:pk>/public-workorder-token/', views.user_public_workorder_token, name='user_public_workorder_token'),
-    path('public/workorder/<uuid:token>/', views.public_workorder_create, name='public_workorder_create'),
+    path('users/<int:pk>/public-workorder-token/', odoo_views.user_public_workorder_token, name='user_public_workorder_token'),
+    path('public/workorder/<uuid:token>/', odoo_views.public_workorder_create, name='public_workorder_create'),
     
     # ==================== ERP3 - FACTURAS DE 3ROS ====================
-    path('invoices/', views.invoice_list, name='invoice_list'),
-    path('invoices/create/', views.invoice_create, name='invoice_create'),
-    path('invoices/<int:pk>/', views.invoice_detail, name='invoice_detail'),
-    path('invoices/<int:pk>/edit/', views.invoice_update, name='invoice_update'),
-    path('invoices/<int:pk>/delete/', views.invoice_delete, name='invoice_delete'),
-    path('invoices/<int:pk>/pdf/', views.invoice_pdf, name='invoice_pdf'),
-    path('invoices/<int:pk>/duplicate/', views.invoice_duplicate, name='invoice_duplicate'),
-    path('invoices/<int:pk>/add-message/', views.invoice_add_message, name='invoice_add_message'),
-    path('invoices/config/sequence/', views.invoice_sequence_config, name='invoice_sequence_config'),
+    path('invoices/', finance_views.invoice_list, name='invoice_list'),
+    path('invoices/create/', finance_views.invoice_create, name='invoice_create'),
+    path('invoices/<int:pk>/', finance_views.invoice_detail, name='invoice_detail'),
+    path('invoices/<int:pk>/edit/', finance_views.invoice_update, name='invoice_update'),
+    path('invoices/<int:pk>/delete/', finance_views.invoice_delete, name='invoice_delete'),
+    path('invoices/<int:pk>/pdf/', finance_views.invoice_pdf, name='invoice_pdf'),
+    path('invoices/<int:pk>/duplicate/', finance_views.invoice_duplicate, name='invoice_duplicate'),
+    path('invoices/<int:pk>/add-message/', finance_views.invoice_add_message, name='invoice_add_message'),
+    path('invoices/config/sequence/', finance_views.invoice_sequence_config, name='invoice_sequence_config'),
 
     # ==================== RFI ====================
     path('rfi/', views.rfi_list, name='rfi_list'),
@@ -1882,16 +1902,16 @@ urlpatterns += [
     path('public/rfi/<uuid:token>/', views.rfi_public, name='rfi_public'),
 
     # ==================== CAPACITACIONES ====================
-    path('capacitaciones/', views.capacitacion_list, name='capacitacion_list'),
-    path('capacitaciones/crear/', views.capacitacion_create, name='capacitacion_create'),
-    path('capacitaciones/<int:pk>/', views.capacitacion_detail, name='capacitacion_detail'),
-    path('capacitaciones/<int:pk>/editar/', views.capacitacion_edit, name='capacitacion_edit'),
-    path('capacitaciones/<int:pk>/eliminar/', views.capacitacion_delete, name='capacitacion_delete'),
-    path('capacitaciones/<int:pk>/lineas/<int:linea_id>/eliminar/', views.capacitacion_linea_delete, name='capacitacion_linea_delete'),
-    path('capacitaciones/<int:pk>/respuestas/<int:respuesta_id>/eliminar/', views.capacitacion_respuesta_delete, name='capacitacion_respuesta_delete'),
-    path('public/capacitaciones/<uuid:token>/', views.capacitacion_public, name='capacitacion_public'),
+    path('capacitaciones/', course_views.capacitacion_list, name='capacitacion_list'),
+    path('capacitaciones/crear/', course_views.capacitacion_create, name='capacitacion_create'),
+    path('capacitaciones/<int:pk>/', course_views.capacitacion_detail, name='capacitacion_detail'),
+    path('capacitaciones/<int:pk>/editar/', course_views.capacitacion_edit, name='capacitacion_edit'),
+    path('capacitaciones/<int:pk>/eliminar/', course_views.capacitacion_delete, name='capacitacion_delete'),
+    path('capacitaciones/<int:pk>/lineas/<int:linea_id>/eliminar/', course_views.capacitacion_linea_delete, name='capacitacion_linea_delete'),
+    path('capacitaciones/<int:pk>/respuestas/<int:respuesta_id>/eliminar/', course_views.capacitacion_respuesta_delete, name='capacitacion_respuesta_delete'),
+    path('public/capacitaciones/<uuid:token>/', course_views.capacitacion_public, name='capacitacion_public'),
 
-    path('tickets/<int:pk>/commit/', views.ticket_update_commit, name='ticket_update_commit'),
-    path('tickets/<int:pk>/rating/', views.ticket_update_rating, name='ticket_update_rating'),
+    path('tickets/<int:pk>/commit/', course_views.ticket_update_commit, name='ticket_update_commit'),
+    path('tickets/<int:pk>/rating/', course_views.ticket_update_rating, name='ticket_update_rating'),
 ]
 
@@ -1,8 +1,6 @@
 from django.contrib.auth.models import Group
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
-from django.conf import settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,6 +13,14 @@ def is_agent(user):
         return False
     return user.groups.filter(name='Agentes').exists()
 
+def is_agent_or_superuser(user):
+    """
+    Verifica si un usuario es agente o superusuario
+    """
+    if not user.is_authenticated:
+        return False
+    return user.is_superuser or is_agent(user)
+
 def is_regular_user(user):
     """
     Verifica si un usuario pertenece al grupo de Usuarios
@@ -67,12 +73,27 @@ def assign_user_to_group(user, group_name):
         return False
 
 
-def send_contact_notification(contacto_web):
+def get_notification_recipients(config):
+    """
+    Lista de emails válidos configurados para recibir notificaciones
+    """
+    return [
+        email.strip() for email in config.notification_emails.split('\n')
+        if email.strip() and '@' in email.strip()
+    ]
+
+
+def send_contact_notification(contacto_web, send_immediately=False):
     """
-    Envía notificación por email cuando se recibe un nuevo contacto web
+    Encola una notificación por email cuando se recibe un nuevo contacto web
+    
+    El envío lo hace el despachador de notificaciones en segundo plano. Con
+    ``send_immediately`` se envía en el momento y se devuelve si llegó a
+    enviarse (lo usan las pruebas de configuración).
     """
     try:
         from tickets.models import SystemConfiguration
+        from tickets.notification_utils import queue_email, send_now
         
         # Obtener configuración del sistema
         config = SystemConfiguration.get_config()
@@ -87,25 +108,8 @@ def send_contact_notification(contacto_web):
             logger.warning("No hay emails de notificación configurados")
             return False
         
-        # Actualizar configuración de Django con los valores de la base de datos
-        if config.email_host:
-            settings.EMAIL_HOST = config.email_host
-        if config.email_port:
-            settings.EMAIL_PORT = config.email_port
-        if config.email_host_user:
-            settings.EMAIL_HOST_USER = config.email_host_user
-        if config.email_host_password:
-            settings.EMAIL_HOST_PASSWORD = config.email_host_password
-        settings.EMAIL_USE_TLS = config.email_use_tls
-        settings.EMAIL_USE_SSL = config.email_use_ssl
-        if config.email_from:
-            settings.DEFAULT_FROM_EMAIL = config.email_from
-        
         # Preparar lista de destinatarios
-        recipient_emails = [
-            email.strip() for email in config.notification_emails.split('\n') 
-            if email.strip() and '@' in email.strip()
-        ]
+        recipient_emails = get_notification_recipients(config)
         
         if not recipient_emails:
             logger.warning("No hay emails de notificación válidos configurados")
@@ -122,40 +126,41 @@ def send_contact_notification(contacto_web):
         # Crear versión de texto plano
         plain_message = strip_tags(html_message)
         
-        # Enviar el email
-        send_mail(
+        notification = queue_email(
             subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=recipient_emails,
-            html_message=html_message,
-            fail_silently=False
+            body=plain_message,
+            recipients=recipient_emails,
+            html_body=html_message,
+            from_email=config.email_from,
         )
         
-        logger.info(f"Notificación de contacto web enviada a {len(recipient_emails)} destinatarios")
+        if send_immediately:
+            return send_now(notification)
+        
+        logger.info(f"Notificación de contacto web encolada para {len(recipient_emails)} destinatarios")
         return True
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error enviando notificación por email: {str(e)}")
         return False
 
 
 def send_landing_page_notification(submission):
     """
-    Envía notificación por email cuando se recibe un envío de landing page
+    Encola una notificación por email cuando se recibe un envío de landing page
     """
     try:
-        from django.core.mail import send_mail
-        from django.template.loader import render_to_string
-        from django.utils.html import strip_tags
         from .models import SystemConfiguration
+        from .notification_utils import queue_email
         
         # Obtener configuración del sistema
-        config = SystemConfiguration.get_instance()
+        config = SystemConfiguration.get_config()
         
-        if not config or not config.email_notifications_enabled:
+        if not config.enable_email_notifications:
+            return True
+        
+        recipient_emails = get_notification_recipients(config)
+        if not recipient_emails:
             return True
         
         # Preparar datos para el template
@@ -170,39 +175,37 @@ def send_landing_page_notification(submission):
         
         subject = f'Nueva solicitud de {submission.landing_page.nombre_producto} - {submission.nombre} {submission.apellido}'
         
-        # Enviar email
-        send_mail(
+        queue_email(
             subject=subject,
-            message=plain_message,
-            from_email=config.smtp_from_email,
-            recipient_list=[config.notification_email],
-            html_message=html_message,
-            fail_silently=False,
+            body=plain_message,
+            recipients=recipient_emails,
+            html_body=html_message,
+            from_email=config.email_from,
         )
         
         return True
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error enviando notificación de landing page: {str(e)}")
         return False
 
 
 def send_contact_creation_notification(contact, landing_page):
     """
-    Envía notificación por email cuando se crea un contacto desde una landing page
+    Encola una notificación por email cuando se crea un contacto desde una landing page
     """
     try:
-        from django.core.mail import send_mail
-        from django.template.loader import render_to_string
-        from django.utils.html import strip_tags
         from .models import SystemConfiguration
+        from .notification_utils import queue_email
         
         # Obtener configuración del sistema
-        config = SystemConfiguration.get_instance()
+        config = SystemConfiguration.get_config()
+        
+        if not config.enable_email_notifications:
+            return True
         
-        if not config or not config.email_notifications_enabled:
+        recipient_emails = get_notification_recipients(config)
+        if not recipient_emails:
             return True
         
         # Preparar datos para el template
@@ -217,35 +220,30 @@ def send_contact_creation_notification(contact, landing_page):
         
         subject = f'Nuevo contacto generado: {contact.name} - {landing_page.nombre_producto}'
         
-        # Enviar email
-        send_mail(
+        queue_email(
             subject=subject,
-            message=plain_message,
-            from_email=config.smtp_from_email,
-            recipient_list=[config.notification_email],
-            html_message=html_message,
-            fail_silently=False,
+            body=plain_message,
+            recipients=recipient_emails,
+            html_body=html_message,
+            from_email=config.email_from,
         )
         
         return True
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error enviando notificación de creación de contacto: {str(e)}")
         return False
 
 
 def send_telegram_notification(landing_page, submission):
     """
-    Envía notificación por Telegram cuando se recibe un nuevo envío de formulario
+    Encola una notificación por Telegram cuando se recibe un nuevo envío de formulario
     """
     if not landing_page.telegram_bot_token or not landing_page.telegram_chat_id:
         return False
     
     try:
-        import requests
-        import json
+        from .notification_utils import queue_telegram
         
         # Preparar mensaje
         mensaje = f"🎯 *Nuevo Lead desde Landing Page*\n\n"
@@ -273,27 +271,15 @@ def send_telegram_notification(landing_page, submission):
         mensaje += f"⏰ *Fecha:* {submission.created_at.strftime('%d/%m/%Y %H:%M')}\n"
         mensaje += f"🌐 *IP:* {submission.ip_address or 'N/A'}"
         
-        # Enviar mensaje
-        url = f"https://api.telegram.org/bot{landing_page.telegram_bot_token}/sendMessage"
-        data = {
-            'chat_id': landing_page.telegram_chat_id,
-            'text': mensaje,
-            'parse_mode': 'Markdown'
-        }
-        
-        response = requests.post(url, data=data, timeout=10)
-        
-        if response.status_code == 200:
-            return True
-        else:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error enviando mensaje de Telegram: {response.status_code} - {response.text}")
-            return False
+        queue_telegram(
+            landing_page.telegram_bot_token,
+            landing_page.telegram_chat_id,
+            mensaje,
+            parse_mode='Markdown',
+        )
+        return True
             
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error enviando notificación de Telegram: {str(e)}")
         return False
 
@@ -304,7 +290,6 @@ def get_weather_info(city='Valencia', country_code='ES'):
     """
     try:
         import requests
-        from django.conf import settings
         
         # API Key de OpenWeatherMap (usa una API gratuita)
         # Para desarrollo, usaremos una API que no requiere clave
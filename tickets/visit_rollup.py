@@ -0,0 +1,331 @@
+"""
+Agregados de las visitas a páginas públicas para la página de analytics.
+
+Cada ``PageVisit`` se suma, al guardarse, a tres tablas pequeñas:
+
+- ``PageVisitRollup``: visitas por día y hora, tipo de página, país,
+  navegador, dispositivo, bot y ``utm_source``. De aquí salen el total, las
+  visitas por día y por página, países, navegadores, móvil/escritorio y las
+  fuentes UTM de las landing pages.
+- ``PageVisitSketch``: un boceto HyperLogLog de las IPs por día, tipo de
+  página, país y bot. Los bocetos se combinan para estimar las IPs únicas de
+  cualquier rango (error típico del 3%, exacto en la práctica con pocas IPs).
+- ``PageVisitUrlRollup``: visitas por día y URL visitada o de referencia,
+  para las landing pages y las fuentes de tráfico más visitadas.
+
+``analytics`` responde la página de analytics con un número fijo de
+consultas agrupadas sobre estas tablas, sea cual sea el rango de fechas.
+
+Para (re)construir los agregados a partir de las visitas:
+``python manage.py rebuild_page_visit_rollup``.
+"""
+import hashlib
+import logging
+import math
+from collections import Counter
+from datetime import datetime, time, timedelta
+
+from django.db import DatabaseError, transaction
+from django.db.models import F, Max, Sum
+from django.utils import timezone
+
+from .models import PageVisit, PageVisitRollup, PageVisitSketch, PageVisitUrlRollup
+
+logger = logging.getLogger(__name__)
+
+URL_MAX_LENGTH = PageVisitUrlRollup._meta.get_field('url').max_length
+TITLE_MAX_LENGTH = PageVisitUrlRollup._meta.get_field('title').max_length
+
+
+# -------------------------------------------------------------- HyperLogLog
+
+class HyperLogLog:
+    """
+    Boceto HyperLogLog de ``2 ** PRECISION`` registros de un byte.
+
+    Se serializa en formato disperso (``S`` + pares índice/valor) mientras
+    tiene pocos registros ocupados y en formato denso (``D`` + registros)
+    cuando ocupa menos así. Un boceto vacío se serializa como ``b''``.
+    """
+
+    PRECISION = 10
+    SIZE = 1 << PRECISION
+    HASH_BITS = 64
+
+    def __init__(self):
+        self.registers = bytearray(self.SIZE)
+
+    @classmethod
+    def from_bytes(cls, data):
+        return cls().merge_bytes(data)
+
+    def to_bytes(self):
+        used = [(index, value) for index, value in enumerate(self.registers) if value]
+        if not used:
+            return b''
+        if 3 * len(used) < self.SIZE:
+            return b'S' + b''.join(index.to_bytes(2, 'big') + bytes((value,)) for index, value in used)
+        return b'D' + bytes(self.registers)
+
+    def add(self, value):
+        """Añade ``value`` al boceto. Devuelve ``True`` si ha cambiado algún registro"""
+        digest = hashlib.blake2b(str(value).encode(), digest_size=8).digest()
+        hashed = int.from_bytes(digest, 'big')
+        index = hashed >> (self.HASH_BITS - self.PRECISION)
+        rest_bits = self.HASH_BITS - self.PRECISION
+        rank = rest_bits - (hashed & ((1 << rest_bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+            return True
+        return False
+
+    def merge_bytes(self, data):
+        """Une a este boceto uno serializado (máximo registro a registro)"""
+        data = bytes(data or b'')
+        registers = self.registers
+        if data[:1] == b'D':
+            self.registers = bytearray(map(max, registers, data[1:self.SIZE + 1]))
+        elif data[:1] == b'S':
+            for offset in range(1, len(data), 3):
+                index = int.from_bytes(data[offset:offset + 2], 'big')
+                if data[offset + 2] > registers[index]:
+                    registers[index] = data[offset + 2]
+        return self
+
+    def count(self):
+        """Estimación del número de valores distintos añadidos"""
+        size = self.SIZE
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -value for value in self.registers)
+        zeros = self.registers.count(0)
+        if zeros and estimate <= 2.5 * size:
+            # Corrección para cardinalidades pequeñas (linear counting)
+            estimate = size * math.log(size / zeros)
+        return int(round(estimate))
+
+
+# ----------------------------------------------------------------- fechas
+
+def day_start(day):
+    """Inicio (con zona horaria) del día ``day`` en la zona horaria actual"""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def day_range(start_date, end_date):
+    """``(desde, hasta)`` para filtrar ``visited_at__gte``/``visited_at__lt`` por días completos"""
+    return day_start(start_date), day_start(end_date + timedelta(days=1))
+
+
+def _bucket(visited_at):
+    local = timezone.localtime(visited_at)
+    return local.date(), local.hour
+
+
+# ----------------------------------------------------------- claves de fila
+
+def _cube_key(visit, day, hour):
+    return {
+        'day': day,
+        'hour': hour,
+        'page_type': visit.page_type,
+        'country_code': visit.country_code or '',
+        'country': visit.country or '',
+        'browser': visit.browser or '',
+        'device_type': visit.device_type or '',
+        'is_mobile': visit.is_mobile,
+        'is_bot': visit.is_bot,
+        'utm_source': visit.utm_source or '',
+    }
+
+
+def _sketch_key(visit, day):
+    return {
+        'day': day,
+        'page_type': visit.page_type,
+        'country_code': visit.country_code or '',
+        'is_bot': visit.is_bot,
+    }
+
+
+def _url_keys(visit, day):
+    """``[(clave, título)]`` de la URL visitada y de la de referencia"""
+    base = {
+        'day': day,
+        'page_type': visit.page_type,
+        'country_code': visit.country_code or '',
+        'is_bot': visit.is_bot,
+    }
+    keys = [(dict(base, kind='page', url=visit.page_url[:URL_MAX_LENGTH]), (visit.page_title or '')[:TITLE_MAX_LENGTH])]
+    if visit.referrer:
+        keys.append((dict(base, kind='referrer', url=visit.referrer[:URL_MAX_LENGTH]), ''))
+    return keys
+
+
+# -------------------------------------------------------- mantenimiento
+
+def _increment(model, key, **updates):
+    rows = model.objects.filter(**key)
+    if not rows.update(visits=F('visits') + 1, **updates):
+        model.objects.get_or_create(**key)
+        rows.update(visits=F('visits') + 1, **updates)
+
+
+def record_visit(visit):
+    """Suma la visita a los agregados de su día y hora"""
+    day, hour = _bucket(visit.visited_at)
+    _increment(PageVisitRollup, _cube_key(visit, day, hour))
+    for key, title in _url_keys(visit, day):
+        _increment(PageVisitUrlRollup, key, **({'title': title} if title else {}))
+
+    sketch_row, _ = PageVisitSketch.objects.select_for_update().get_or_create(**_sketch_key(visit, day))
+    sketch = HyperLogLog.from_bytes(sketch_row.ip_sketch)
+    if sketch.add(visit.ip_address):
+        sketch_row.ip_sketch = sketch.to_bytes()
+        sketch_row.save(update_fields=['ip_sketch'])
+
+
+def handle_save(instance):
+    """
+    Receptor de ``post_save`` de ``PageVisit`` (solo altas). Un fallo de los
+    agregados no debe impedir registrar la visita, por eso se aísla en un
+    savepoint y solo se registra el error.
+    """
+    try:
+        with transaction.atomic():
+            record_visit(instance)
+    except DatabaseError as e:
+        logger.error(f'Error al agregar la visita {instance.pk}: {e}')
+
+
+def rebuild_day(day, batch_size=2000):
+    """
+    Recalcula los agregados del día ``day`` a partir de sus visitas (borra
+    los anteriores). Devuelve el número de visitas agregadas.
+    """
+    start, end = day_range(day, day)
+    cube, urls, titles, sketches = Counter(), Counter(), {}, {}
+    visits = (
+        PageVisit.objects.filter(visited_at__gte=start, visited_at__lt=end)
+        .only(
+            'visited_at', 'page_type', 'page_url', 'page_title', 'ip_address', 'country',
+            'country_code', 'browser', 'device_type', 'is_mobile', 'is_bot', 'referrer', 'utm_source',
+        )
+        .order_by('visited_at', 'pk')
+    )
+    total = 0
+    for visit in visits.iterator(chunk_size=batch_size):
+        visit_day, hour = _bucket(visit.visited_at)
+        cube[tuple(_cube_key(visit, visit_day, hour).items())] += 1
+        for key, title in _url_keys(visit, visit_day):
+            key = tuple(key.items())
+            urls[key] += 1
+            if title:
+                titles[key] = title
+        sketch_key = tuple(_sketch_key(visit, visit_day).items())
+        sketches.setdefault(sketch_key, HyperLogLog()).add(visit.ip_address)
+        total += 1
+
+    PageVisitRollup.objects.filter(day=day).delete()
+    PageVisitUrlRollup.objects.filter(day=day).delete()
+    PageVisitSketch.objects.filter(day=day).delete()
+    PageVisitRollup.objects.bulk_create(
+        [PageVisitRollup(visits=count, **dict(key)) for key, count in cube.items()],
+        batch_size=1000,
+    )
+    PageVisitUrlRollup.objects.bulk_create(
+        [PageVisitUrlRollup(visits=count, title=titles.get(key, ''), **dict(key)) for key, count in urls.items()],
+        batch_size=1000,
+    )
+    PageVisitSketch.objects.bulk_create(
+        [PageVisitSketch(ip_sketch=sketch.to_bytes(), **dict(key)) for key, sketch in sketches.items()],
+        batch_size=1000,
+    )
+    return total
+
+
+# ---------------------------------------------------------------- consultas
+
+def _filtered(queryset, start_date, end_date, page_type=None, country_code=None, exclude_bots=True):
+    queryset = queryset.filter(day__gte=start_date, day__lte=end_date)
+    if page_type:
+        queryset = queryset.filter(page_type=page_type)
+    if country_code:
+        queryset = queryset.filter(country_code=country_code)
+    if exclude_bots:
+        queryset = queryset.filter(is_bot=False)
+    return queryset
+
+
+def _top(queryset, field, limit=None):
+    """``[{field, 'count'}]`` ordenado por visitas (los ``limit`` primeros)"""
+    rows = queryset.values(field).annotate(count=Sum('visits')).order_by('-count', field)
+    return list(rows[:limit] if limit else rows)
+
+
+def _top_urls(queryset, limit, *fields):
+    """``[{'page_url', 'page_title', 'count', *fields}]`` de las URLs con más visitas"""
+    rows = (
+        queryset.values('url', *fields).annotate(count=Sum('visits'), title=Max('title'))
+        .order_by('-count', 'url')[:limit]
+    )
+    return [
+        dict(page_url=row.pop('url'), page_title=row.pop('title'), **row)
+        for row in rows
+    ]
+
+
+def analytics(start_date, end_date, page_type=None, country_code=None, exclude_bots=True):
+    """
+    Estadísticas de la página de analytics para el rango (días incluidos) y
+    los filtros, con las mismas claves que usa la plantilla.
+    """
+    filters = {'page_type': page_type, 'country_code': country_code, 'exclude_bots': exclude_bots}
+    cube = _filtered(PageVisitRollup.objects.all(), start_date, end_date, **filters)
+    urls = _filtered(PageVisitUrlRollup.objects.all(), start_date, end_date, **filters)
+    sketches = _filtered(PageVisitSketch.objects.all(), start_date, end_date, **filters)
+
+    visits_by_page = _top(cube, 'page_type')
+    per_day = dict(cube.values_list('day').annotate(total=Sum('visits')).order_by())
+    visits_by_day = []
+    current_date = start_date
+    while current_date <= end_date:
+        visits_by_day.append({'date': current_date.strftime('%Y-%m-%d'), 'visits': per_day.get(current_date, 0)})
+        current_date += timedelta(days=1)
+
+    countries = list(cube.values('country_code', 'country').annotate(count=Sum('visits')).order_by('-count', 'country'))
+    devices = dict(cube.values_list('is_mobile').annotate(total=Sum('visits')).order_by())
+
+    unique_ips, landing_ips = HyperLogLog(), HyperLogLog()
+    for sketch_page_type, data in sketches.values_list('page_type', 'ip_sketch'):
+        unique_ips.merge_bytes(data)
+        if sketch_page_type == 'landing':
+            landing_ips.merge_bytes(data)
+
+    landing = cube.filter(page_type='landing')
+    return {
+        'total_visits': sum(row['count'] for row in visits_by_page),
+        'unique_ips': unique_ips.count(),
+        'unique_countries': len({row['country_code'] for row in countries if row['country_code']}),
+        'visits_by_page': visits_by_page,
+        'visits_by_day': visits_by_day,
+        'top_countries': [row for row in countries if row['country']][:10],
+        'top_browsers': _top(cube.exclude(browser=''), 'browser', 10),
+        'mobile_visits': devices.get(True, 0),
+        'desktop_visits': devices.get(False, 0),
+        'top_pages': _top_urls(urls.filter(kind='page'), 20, 'page_type'),
+        'landing_pages_stats': _top_urls(urls.filter(kind='page', page_type='landing'), 10),
+        'landing_total_visits': next((row['count'] for row in visits_by_page if row['page_type'] == 'landing'), 0),
+        'landing_unique_visitors': landing_ips.count(),
+        'landing_utm_sources': _top(landing.exclude(utm_source=''), 'utm_source', 5),
+        'referrers': [
+            {'referrer': row['page_url'], 'count': row['count']}
+            for row in _top_urls(urls.filter(kind='referrer'), 10)
+        ],
+        'countries': [
+            {'country_code': code, 'country': name}
+            for code, name in sorted(
+                {(row['country_code'], row['country']) for row in countries if row['country_code']},
+                key=lambda pair: (pair[1], pair[0]),
+            )
+        ],
+    }
@@ -0,0 +1,351 @@
+"""
+Registro de visitas de los contadores web y sus estadísticas diarias.
+
+``web_counter_track`` recibe una petición por cada página vista en los sitios
+de los clientes. Para no tocar la base de datos en cada una:
+
+- el token se resuelve al id del contador desde la caché
+  (``WEB_COUNTER_TOKEN_CACHE_TTL``);
+- la sesión (IP + navegador + contador) se marca en la caché durante
+  ``WEB_COUNTER_SESSION_TIMEOUT`` segundos desde la última página vista: si
+  no estaba marcada, es una visita nueva. Sin Redis cada proceso tiene su
+  propia caché, así que una sesión repartida entre procesos puede contar
+  como más de una visita;
+- el análisis del user agent se memoriza por cadena;
+- la visita se encola y un hilo del proceso la guarda en lote cada
+  ``WEB_COUNTER_FLUSH_INTERVAL`` segundos (o al llegar a
+  ``WEB_COUNTER_BATCH_SIZE`` visitas): ``bulk_create`` de las visitas, un
+  ``UPDATE`` con ``F()`` de los totales de cada contador y la suma a las
+  estadísticas diarias (``WebCounterDailyStat`` y
+  ``WebCounterDailyBreakdown``). Con ``WEB_COUNTER_FLUSH_INTERVAL = 0`` se
+  guarda en la propia petición. Si el lote falla por un error de la base de
+  datos vuelve a la cola (hasta ``WEB_COUNTER_MAX_PENDING`` visitas) y se
+  reintenta en el siguiente intervalo.
+
+Las páginas de estadísticas leen las tablas diarias, no las visitas. Para
+(re)construirlas a partir de las visitas:
+``python manage.py rebuild_web_counter_stats``.
+"""
+import atexit
+import hashlib
+import logging
+import threading
+from collections import Counter, defaultdict
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, InterfaceError, OperationalError, connection, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import WebCounter, WebCounterDailyBreakdown, WebCounterDailyStat, WebCounterVisit
+
+logger = logging.getLogger(__name__)
+
+SESSION_TIMEOUT = getattr(settings, 'WEB_COUNTER_SESSION_TIMEOUT', 30 * 60)
+TOKEN_CACHE_TTL = getattr(settings, 'WEB_COUNTER_TOKEN_CACHE_TTL', 300)
+FLUSH_INTERVAL = getattr(settings, 'WEB_COUNTER_FLUSH_INTERVAL', 2)
+BATCH_SIZE = getattr(settings, 'WEB_COUNTER_BATCH_SIZE', 200)
+# Visitas que se guardan en memoria mientras la base de datos falla; de ahí
+# en adelante se descartan las más antiguas
+MAX_PENDING = getattr(settings, 'WEB_COUNTER_MAX_PENDING', 50 * BATCH_SIZE)
+
+# Dimensiones del desglose diario: campo de WebCounterVisit con el mismo nombre
+DIMENSIONS = [value for value, _ in WebCounterDailyBreakdown.DIMENSION_CHOICES]
+
+VALUE_MAX_LENGTH = WebCounterDailyBreakdown._meta.get_field('value').max_length
+
+
+# ------------------------------------------------------------------ caché
+
+def _token_key(token):
+    return f'web_counter:token:{hashlib.sha1(token.encode()).hexdigest()}'
+
+
+def counter_id_for_token(token):
+    """Id del contador activo con ese token, o ``None``"""
+    key = _token_key(token)
+    counter_id = cache.get(key)
+    if counter_id is None:
+        counter_id = WebCounter.objects.filter(token=token, is_active=True).values_list('pk', flat=True).first() or 0
+        cache.set(key, counter_id, TOKEN_CACHE_TTL)
+    return counter_id or None
+
+
+def forget_token(token):
+    """Receptor de las señales de ``WebCounter``"""
+    if token:
+        cache.delete(_token_key(token))
+
+
+def session_id_for(counter_token, ip_address, user_agent):
+    """Id de sesión de la visita: IP + user agent + contador"""
+    return hashlib.md5(f"{ip_address}_{user_agent}_{counter_token}".encode()).hexdigest()
+
+
+def is_new_session(counter_id, session_id):
+    """
+    ``True`` si la sesión no ha visto ninguna página en los últimos
+    ``SESSION_TIMEOUT`` segundos. Cada página vista alarga la sesión.
+    """
+    key = f'web_counter:session:{counter_id}:{session_id}'
+    if cache.add(key, 1, SESSION_TIMEOUT):
+        return True
+    cache.touch(key, SESSION_TIMEOUT)
+    return False
+
+
+@lru_cache(maxsize=2048)
+def parse_user_agent(user_agent_string):
+    """``(navegador, sistema, tipo de dispositivo)`` del user agent"""
+    from user_agents import parse
+
+    user_agent = parse(user_agent_string)
+    if user_agent.is_mobile:
+        device_type = 'mobile'
+    elif user_agent.is_tablet:
+        device_type = 'tablet'
+    else:
+        device_type = 'desktop'
+    return (
+        f"{user_agent.browser.family} {user_agent.browser.version_string}",
+        f"{user_agent.os.family} {user_agent.os.version_string}",
+        device_type,
+    )
+
+
+# ------------------------------------------------------------- agregados
+
+def _value_hash(value):
+    return hashlib.sha1(value.encode()).hexdigest()
+
+
+def _add(model, key, defaults=None, **deltas):
+    """Suma ``deltas`` a la fila ``key`` (creándola con ``defaults`` si no existe)"""
+    updates = {field: F(field) + delta for field, delta in deltas.items()}
+    rows = model.objects.filter(**key)
+    if not rows.update(**updates):
+        model.objects.get_or_create(defaults=defaults, **key)
+        rows.update(**updates)
+
+
+def _aggregate(entries):
+    """
+    ``(totales, diarios, desgloses)`` de una lista de ``(visita, es_nueva)``:
+    contadores ``{id: [páginas, visitas]}``, ``{(id, día): [páginas, visitas]}``
+    y ``{(id, día, dimensión, valor): páginas}``.
+    """
+    totals = defaultdict(lambda: [0, 0])
+    daily = defaultdict(lambda: [0, 0])
+    breakdowns = Counter()
+    for visit, is_new in entries:
+        day = timezone.localtime(visit.created_at).date()
+        for bucket in (totals[visit.counter_id], daily[(visit.counter_id, day)]):
+            bucket[0] += 1
+            bucket[1] += int(is_new)
+        for dimension in DIMENSIONS:
+            value = (getattr(visit, dimension) or '')[:VALUE_MAX_LENGTH]
+            if value:
+                breakdowns[(visit.counter_id, day, dimension, value)] += 1
+    return totals, daily, breakdowns
+
+
+def save_visits(entries):
+    """
+    Guarda un lote de ``(visita, es_nueva)``: las visitas con ``bulk_create``
+    y los totales y estadísticas diarias con un ``UPDATE`` por fila afectada.
+    Se descartan las visitas de contadores borrados mientras estaban en cola.
+    """
+    existing = set(
+        WebCounter.objects.filter(pk__in={visit.counter_id for visit, _ in entries}).values_list('pk', flat=True)
+    )
+    entries = [(visit, is_new) for visit, is_new in entries if visit.counter_id in existing]
+    if not entries:
+        return 0
+    totals, daily, breakdowns = _aggregate(entries)
+    with transaction.atomic():
+        WebCounterVisit.objects.bulk_create([visit for visit, _ in entries], batch_size=500)
+        for counter_id, (page_views, visits) in totals.items():
+            WebCounter.objects.filter(pk=counter_id).update(
+                total_page_views=F('total_page_views') + page_views,
+                total_visits=F('total_visits') + visits,
+            )
+        for (counter_id, day), (page_views, visits) in daily.items():
+            _add(WebCounterDailyStat, {'counter_id': counter_id, 'day': day}, page_views=page_views, visits=visits)
+        for (counter_id, day, dimension, value), page_views in breakdowns.items():
+            key = {'counter_id': counter_id, 'day': day, 'dimension': dimension, 'value_hash': _value_hash(value)}
+            _add(WebCounterDailyBreakdown, key, defaults={'value': value}, page_views=page_views)
+    return len(entries)
+
+
+# ------------------------------------------------------------------- cola
+
+_pending = []
+_pending_lock = threading.Lock()
+_flush_thread = None
+_wakeup = threading.Event()
+_retrying = threading.Event()
+
+
+def enqueue_visit(visit, is_new):
+    """Encola la visita para guardarla en el próximo lote (o la guarda ya si no hay lotes)"""
+    global _flush_thread
+    if FLUSH_INTERVAL <= 0:
+        save_visits([(visit, is_new)])
+        return
+    with _pending_lock:
+        _pending.append((visit, is_new))
+        # Mientras se reintenta un lote fallido la cola ya está llena: no se
+        # despierta al hilo, que espera al siguiente intervalo
+        full = len(_pending) >= BATCH_SIZE and not _retrying.is_set()
+        if _flush_thread is None:
+            _flush_thread = threading.Thread(target=_flush_loop, name='web-counter-flush', daemon=True)
+            _flush_thread.start()
+    if full:
+        _wakeup.set()
+
+
+def flush_pending():
+    """
+    Guarda las visitas en cola de este proceso. Devuelve cuántas se han guardado.
+
+    Si la base de datos no está disponible el lote vuelve al principio de la
+    cola para reintentarlo; ``save_visits`` es atómico, así que no se cuenta
+    dos veces. Otros errores (datos inválidos) no se arreglan reintentando y
+    el lote se descarta.
+    """
+    with _pending_lock:
+        entries = _pending[:]
+        del _pending[:]
+    if not entries:
+        return 0
+    try:
+        saved = save_visits(entries)
+    except (OperationalError, InterfaceError) as e:
+        _requeue(entries)
+        logger.error(f'Error al guardar {len(entries)} visitas de contadores web, se reintentará: {e}')
+        return 0
+    except DatabaseError as e:
+        _retrying.clear()
+        logger.error(f'Error al guardar {len(entries)} visitas de contadores web: {e}')
+        return 0
+    _retrying.clear()
+    return saved
+
+
+def _requeue(entries):
+    """Devuelve ``entries`` a la cola, descartando las más antiguas por encima de ``MAX_PENDING``"""
+    _retrying.set()
+    with _pending_lock:
+        _pending[:0] = entries
+        dropped = len(_pending) - MAX_PENDING
+        if dropped > 0:
+            del _pending[:dropped]
+    if dropped > 0:
+        logger.error(f'Cola de visitas de contadores web llena: se descartan {dropped} visitas')
+
+
+def _flush_loop():
+    """Bucle del hilo: guarda la cola cada ``FLUSH_INTERVAL`` segundos o al llenarse"""
+    while True:
+        _wakeup.wait(FLUSH_INTERVAL)
+        _wakeup.clear()
+        try:
+            flush_pending()
+        except Exception as e:
+            logger.error(f'Error en el hilo de visitas de contadores web: {e}')
+        finally:
+            connection.close()
+
+
+atexit.register(flush_pending)
+
+
+# ------------------------------------------------------------ reconstrucción
+
+def rebuild_counter(counter, batch_size=2000):
+    """
+    Recalcula las estadísticas diarias y los totales del contador a partir de
+    sus visitas. Una página vista es una visita nueva si su sesión no había
+    visto otra en los ``SESSION_TIMEOUT`` segundos anteriores.
+    """
+    timeout = timedelta(seconds=SESSION_TIMEOUT)
+    last_seen = {}
+    entries = []
+    visits = (
+        counter.visits.only('counter_id', 'created_at', 'session_id', *DIMENSIONS)
+        .order_by('created_at', 'pk')
+    )
+    for visit in visits.iterator(chunk_size=batch_size):
+        previous = last_seen.get(visit.session_id)
+        entries.append((visit, previous is None or visit.created_at - previous > timeout))
+        last_seen[visit.session_id] = visit.created_at
+    totals, daily, breakdowns = _aggregate(entries)
+
+    WebCounterDailyStat.objects.filter(counter=counter).delete()
+    WebCounterDailyBreakdown.objects.filter(counter=counter).delete()
+    WebCounterDailyStat.objects.bulk_create(
+        [
+            WebCounterDailyStat(counter_id=counter_id, day=day, page_views=page_views, visits=visits)
+            for (counter_id, day), (page_views, visits) in daily.items()
+        ],
+        batch_size=1000,
+    )
+    WebCounterDailyBreakdown.objects.bulk_create(
+        [
+            WebCounterDailyBreakdown(
+                counter_id=counter_id, day=day, dimension=dimension,
+                value=value, value_hash=_value_hash(value), page_views=page_views,
+            )
+            for (counter_id, day, dimension, value), page_views in breakdowns.items()
+        ],
+        batch_size=1000,
+    )
+    page_views, visits = totals.get(counter.pk, (0, 0))
+    WebCounter.objects.filter(pk=counter.pk).update(total_page_views=page_views, total_visits=visits)
+    return len(entries)
+
+
+# -------------------------------------------------------------- consultas
+
+def period_page_views(counters, today=None):
+    """
+    ``{id: {'today', 'week', 'month'}}`` con las páginas vistas de hoy, de los
+    últimos 7 días y de los últimos 30 días (hoy incluido) de cada contador.
+    """
+    today = today or timezone.localdate()
+    rows = (
+        WebCounterDailyStat.objects.filter(counter__in=counters, day__gte=today - timedelta(days=29))
+        .values_list('counter_id', 'day', 'page_views')
+    )
+    periods = defaultdict(lambda: {'today': 0, 'week': 0, 'month': 0})
+    for counter_id, day, page_views in rows:
+        period = periods[counter_id]
+        period['month'] += page_views
+        if day >= today - timedelta(days=6):
+            period['week'] += page_views
+        if day == today:
+            period['today'] += page_views
+    return periods
+
+
+def daily_page_views(counter, days=30, today=None):
+    """``[(día, páginas vistas)]`` de los últimos ``days`` días, hoy incluido"""
+    today = today or timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    per_day = dict(counter.daily_stats.filter(day__gte=start).values_list('day', 'page_views'))
+    return [(start + timedelta(days=i), per_day.get(start + timedelta(days=i), 0)) for i in range(days)]
+
+
+def top_values(counter, dimension, limit):
+    """``[{dimension: valor, 'count': páginas vistas}]`` más frecuentes de la dimensión"""
+    rows = (
+        counter.daily_breakdowns.filter(dimension=dimension)
+        .values('value_hash', 'value').annotate(count=Sum('page_views'))
+        .order_by('-count', 'value_hash')
+    )
+    if limit:
+        rows = rows[:limit]
+    return [{dimension: row['value'], 'count': row['count']} for row in rows]
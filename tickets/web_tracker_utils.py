@@ -1,54 +1,124 @@
 """
-Utilidades para el rastreador web
+Utilidades para el rastreador web.
+
+Cada rastreo lanza cuatro sondas sobre el objetivo: ping, DNS, HTTP y SSL.
+Las cuatro se ejecutan a la vez (``track_website``), de modo que una sonda
+lenta no retrasa a las demás, y varios objetivos se rastrean en paralelo
+con un máximo de ``WEB_TRACKER_MAX_WORKERS`` a la vez (``track_websites``).
+
+Los registros DNS y los certificados SSL cambian poco: se guardan en la
+caché de Django durante ``WEB_TRACKER_DNS_CACHE_TTL`` y
+``WEB_TRACKER_SSL_CACHE_TTL`` segundos. El tiempo de cada sonda se devuelve
+en ``probe_timings`` (milisegundos; ``cached`` lista las que salieron de la
+caché). Para refrescar los rastreos guardados:
+``python manage.py refresh_website_trackers``.
 """
-import requests
+import ipaddress
+import logging
+import platform
 import socket
-import dns.resolver
 import ssl
 import subprocess
-import platform
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone as dt_timezone
 from urllib.parse import urlparse
-from datetime import datetime
+
+import dns.exception
+import dns.resolver
+import requests
 from bs4 import BeautifulSoup
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = getattr(settings, 'WEB_TRACKER_MAX_WORKERS', 8)
+DNS_CACHE_TTL = getattr(settings, 'WEB_TRACKER_DNS_CACHE_TTL', 300)
+SSL_CACHE_TTL = getattr(settings, 'WEB_TRACKER_SSL_CACHE_TTL', 3600)
+
+# Tipos de registro DNS que se consultan (todos a la vez)
+DNS_RECORD_TYPES = ['A', 'CNAME', 'TXT', 'MX', 'NS']
 
 
 def extract_domain(target):
     """Extrae el dominio de una URL o valida una IP"""
-    # Si es una URL completa
-    if target.startswith('http://') or target.startswith('https://'):
-        parsed = urlparse(target)
-        return parsed.netloc
-    # Si es solo dominio o IP
-    return target
+    return parse_target(target)[0]
+
+
+def parse_target(target):
+    """``(host, puerto, url)`` del objetivo; el puerto es ``None`` si no se indica"""
+    url = target if target.startswith(('http://', 'https://')) else f'https://{target}'
+    parsed = urlparse(url)
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    return parsed.hostname or target, port, url
+
 
+def is_ip_address(host):
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+# ------------------------------------------------------------------ sondas
 
 def ping_host(host):
     """Hace ping a un host y retorna si está activo y el tiempo de respuesta"""
     param = '-n' if platform.system().lower() == 'windows' else '-c'
     command = ['ping', param, '1', host]
-    
+
     try:
-        start_time = time.time()
+        start_time = time.monotonic()
         result = subprocess.run(
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             timeout=5
         )
-        end_time = time.time()
-        
+        end_time = time.monotonic()
+
         is_active = result.returncode == 0
         response_time = (end_time - start_time) * 1000 if is_active else None
-        
+
         return is_active, response_time
     except Exception as e:
-        print(f"Error en ping: {e}")
+        logger.info(f"Error en ping a {host}: {e}")
         return False, None
 
 
+def _resolver():
+    """Resolvedor DNS; ``WEB_TRACKER_DNS_NAMESERVERS`` sustituye a los del sistema"""
+    nameservers = getattr(settings, 'WEB_TRACKER_DNS_NAMESERVERS', None)
+    resolver = dns.resolver.Resolver(configure=not nameservers)
+    if nameservers:
+        resolver.nameservers = list(nameservers)
+        resolver.port = getattr(settings, 'WEB_TRACKER_DNS_PORT', 53)
+    resolver.lifetime = getattr(settings, 'WEB_TRACKER_DNS_TIMEOUT', 5)
+    return resolver
+
+
+def _format_answer(record_type, answers):
+    if record_type == 'A':
+        return str(answers[0])
+    if record_type == 'CNAME':
+        return [str(rdata.target) for rdata in answers]
+    if record_type == 'MX':
+        return [f"{rdata.preference} {rdata.exchange}" for rdata in answers]
+    return [str(rdata) for rdata in answers]
+
+
 def get_dns_records(domain):
-    """Obtiene registros DNS del dominio"""
+    """Obtiene registros DNS del dominio (en caché ``DNS_CACHE_TTL`` segundos)"""
+    key = f'web_tracker:dns:{domain}'
+    records = cache.get(key)
+    if records is not None:
+        return records
+
     records = {
         'ip': None,
         'cname': [],
@@ -56,46 +126,29 @@ def get_dns_records(domain):
         'mx': [],
         'ns': []
     }
-    
+    if is_ip_address(domain):
+        records['ip'] = domain
+        return records
+
     try:
-        # IP Address (A record)
-        try:
-            answers = dns.resolver.resolve(domain, 'A')
-            records['ip'] = str(answers[0])
-        except:
-            pass
-        
-        # CNAME records
-        try:
-            answers = dns.resolver.resolve(domain, 'CNAME')
-            records['cname'] = [str(rdata.target) for rdata in answers]
-        except:
-            pass
-        
-        # TXT records
-        try:
-            answers = dns.resolver.resolve(domain, 'TXT')
-            records['txt'] = [str(rdata) for rdata in answers]
-        except:
-            pass
-        
-        # MX records
-        try:
-            answers = dns.resolver.resolve(domain, 'MX')
-            records['mx'] = [f"{rdata.preference} {rdata.exchange}" for rdata in answers]
-        except:
-            pass
-        
-        # NS records
+        resolver = _resolver()
+    except dns.exception.DNSException as e:
+        logger.warning(f"Error obteniendo DNS de {domain}: {e}")
+        return records
+
+    def lookup(record_type):
         try:
-            answers = dns.resolver.resolve(domain, 'NS')
-            records['ns'] = [str(rdata) for rdata in answers]
-        except:
-            pass
-        
-    except Exception as e:
-        print(f"Error obteniendo DNS: {e}")
-    
+            return _format_answer(record_type, resolver.resolve(domain, record_type))
+        except dns.exception.DNSException:
+            return None
+
+    with ThreadPoolExecutor(max_workers=len(DNS_RECORD_TYPES)) as pool:
+        answers = dict(zip(DNS_RECORD_TYPES, pool.map(lookup, DNS_RECORD_TYPES)))
+    for record_type, value in answers.items():
+        if value:
+            records['ip' if record_type == 'A' else record_type.lower()] = value
+
+    cache.set(key, records, DNS_CACHE_TTL)
     return records
 
 
@@ -113,48 +166,48 @@ def get_http_info(url):
         'ssl_valid': None,
         'technologies': []
     }
-    
+
     # Asegurar que la URL tenga protocolo
     if not url.startswith('http://') and not url.startswith('https://'):
         url = f'https://{url}'
-    
+
     try:
-        start_time = time.time()
+        start_time = time.monotonic()
         response = requests.get(
             url,
             timeout=10,
             allow_redirects=True,
             verify=True
         )
-        end_time = time.time()
-        
+        end_time = time.monotonic()
+
         info['status_code'] = response.status_code
         info['headers'] = dict(response.headers)
         info['server'] = response.headers.get('Server', '')
         info['page_size'] = len(response.content)
         info['load_time'] = round(end_time - start_time, 2)
         info['ssl_valid'] = url.startswith('https://')
-        
+
         # Si hubo redirección
         if response.history:
             info['redirect_url'] = response.url
-        
+
         # Parsear HTML para obtener título y meta
         if 'text/html' in response.headers.get('Content-Type', ''):
             soup = BeautifulSoup(response.content, 'html.parser')
-            
+
             # Título
-            if soup.title:
-                info['page_title'] = soup.title.string
-            
+            if soup.title and soup.title.string:
+                info['page_title'] = str(soup.title.string).strip()
+
             # Meta description
             meta_desc = soup.find('meta', attrs={'name': 'description'})
             if meta_desc and meta_desc.get('content'):
                 info['meta_description'] = meta_desc.get('content')
-            
+
             # Detectar tecnologías básicas
             technologies = []
-            
+
             # Framework JS
             if soup.find('script', src=lambda x: x and 'react' in x.lower()):
                 technologies.append('React')
@@ -164,7 +217,7 @@ def get_http_info(url):
                 technologies.append('Angular')
             if soup.find('script', src=lambda x: x and 'jquery' in x.lower()):
                 technologies.append('jQuery')
-            
+
             # CMS
             if soup.find('meta', attrs={'name': 'generator', 'content': lambda x: x and 'wordpress' in x.lower()}):
                 technologies.append('WordPress')
@@ -172,15 +225,15 @@ def get_http_info(url):
                 technologies.append('Drupal')
             if soup.find('meta', attrs={'name': 'generator', 'content': lambda x: x and 'joomla' in x.lower()}):
                 technologies.append('Joomla')
-            
+
             # CSS Frameworks
             if soup.find('link', href=lambda x: x and 'bootstrap' in x.lower()):
                 technologies.append('Bootstrap')
             if soup.find('link', href=lambda x: x and 'tailwind' in x.lower()):
                 technologies.append('Tailwind CSS')
-            
-            info['technologies'] = list(set(technologies))
-        
+
+            info['technologies'] = sorted(set(technologies))
+
     except requests.exceptions.SSLError:
         info['ssl_valid'] = False
         # Intentar con HTTP
@@ -190,41 +243,66 @@ def get_http_info(url):
             info['status_code'] = response.status_code
             info['headers'] = dict(response.headers)
             info['server'] = response.headers.get('Server', '')
-        except:
+        except requests.RequestException:
             pass
     except Exception as e:
-        print(f"Error obteniendo HTTP: {e}")
-    
+        logger.info(f"Error obteniendo HTTP de {url}: {e}")
+
     return info
 
 
-def get_ssl_info(domain):
-    """Obtiene información del certificado SSL"""
+def ssl_context():
+    """Contexto con el que se comprueban los certificados"""
+    return ssl.create_default_context()
+
+
+def get_ssl_info(domain, port=443):
+    """
+    Obtiene información del certificado SSL. Los certificados válidos se
+    guardan en caché ``SSL_CACHE_TTL`` segundos.
+    """
+    key = f'web_tracker:ssl:{domain}:{port}'
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
     info = {
         'valid': False,
         'issuer': None,
         'expiry_date': None
     }
-    
+
     try:
-        context = ssl.create_default_context()
-        with socket.create_connection((domain, 443), timeout=5) as sock:
+        context = ssl_context()
+        with socket.create_connection((domain, port), timeout=5) as sock:
             with context.wrap_socket(sock, server_hostname=domain) as ssock:
                 cert = ssock.getpeercert()
-                
+
                 info['valid'] = True
                 info['issuer'] = dict(x[0] for x in cert['issuer'])
-                
+
                 # Fecha de expiración
                 expiry_str = cert['notAfter']
-                info['expiry_date'] = datetime.strptime(expiry_str, '%b %d %H:%M:%S %Y %Z')
-                
+                info['expiry_date'] = datetime.strptime(expiry_str, '%b %d %H:%M:%S %Y %Z').replace(
+                    tzinfo=dt_timezone.utc
+                )
+
     except Exception as e:
-        print(f"Error obteniendo SSL: {e}")
-    
+        logger.info(f"Error obteniendo SSL de {domain}:{port}: {e}")
+        return info
+
+    cache.set(key, info, SSL_CACHE_TTL)
     return info
 
 
+# ----------------------------------------------------------------- rastreo
+
+def _timed(probe, *args):
+    """Ejecuta la sonda y devuelve ``(resultado, milisegundos)``"""
+    started = time.monotonic()
+    return probe(*args), round((time.monotonic() - started) * 1000, 1)
+
+
 def track_website(target):
     """
     Función principal que rastrea un sitio web/IP
@@ -251,28 +329,41 @@ def track_website(target):
         'meta_description': None,
         'page_size': None,
         'load_time': None,
+        'probe_timings': {},
         'error_message': None
     }
-    
+
+    started = time.monotonic()
     try:
-        # Extraer dominio/IP
-        domain = extract_domain(target)
-        
+        domain, port, url = parse_target(target)
+        ssl_port = port if port and url.startswith('https://') else 443
+        cached = [
+            name for name, key in (('dns', f'web_tracker:dns:{domain}'), ('ssl', f'web_tracker:ssl:{domain}:{ssl_port}'))
+            if cache.get(key) is not None
+        ]
+
+        # Las cuatro sondas a la vez
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            ping_future = pool.submit(_timed, ping_host, domain)
+            dns_future = pool.submit(_timed, get_dns_records, domain)
+            http_future = pool.submit(_timed, get_http_info, target)
+            ssl_future = pool.submit(_timed, get_ssl_info, domain, ssl_port)
+
         # 1. Ping
-        is_active, ping_time = ping_host(domain)
+        (is_active, ping_time), ping_ms = ping_future.result()
         result['is_active'] = is_active
         result['ping_response_time'] = ping_time
-        
+
         # 2. DNS Records
-        dns_records = get_dns_records(domain)
+        dns_records, dns_ms = dns_future.result()
         result['ip_address'] = dns_records['ip']
         result['cname_records'] = dns_records['cname']
         result['txt_records'] = dns_records['txt']
         result['mx_records'] = dns_records['mx']
         result['ns_records'] = dns_records['ns']
-        
+
         # 3. HTTP Info
-        http_info = get_http_info(target)
+        http_info, http_ms = http_future.result()
         result['http_status_code'] = http_info['status_code']
         result['http_headers'] = http_info['headers']
         result['redirect_url'] = http_info['redirect_url']
@@ -282,15 +373,57 @@ def track_website(target):
         result['meta_description'] = http_info['meta_description']
         result['page_size'] = http_info['page_size']
         result['load_time'] = http_info['load_time']
-        
+
         # 4. SSL Info
-        ssl_info = get_ssl_info(domain)
+        ssl_info, ssl_ms = ssl_future.result()
         result['ssl_valid'] = ssl_info['valid']
         if ssl_info['issuer']:
             result['ssl_issuer'] = str(ssl_info['issuer'])
         result['ssl_expiry_date'] = ssl_info['expiry_date']
-        
+
+        result['probe_timings'] = {
+            'ping': ping_ms,
+            'dns': dns_ms,
+            'http': http_ms,
+            'ssl': ssl_ms,
+            'cached': cached,
+        }
     except Exception as e:
         result['error_message'] = str(e)
-    
+
+    result['probe_timings']['total'] = round((time.monotonic() - started) * 1000, 1)
     return result
+
+
+def track_websites(targets, max_workers=MAX_WORKERS):
+    """``{objetivo: resultado}`` de los objetivos, con ``max_workers`` rastreos a la vez"""
+    targets = list(dict.fromkeys(targets))
+    if not targets:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as pool:
+        return dict(zip(targets, pool.map(track_website, targets)))
+
+
+# Campos de WebsiteTracker que se rellenan con el resultado de un rastreo
+TRACKER_FIELDS = [
+    'is_active', 'ping_response_time', 'ip_address', 'cname_records', 'txt_records',
+    'mx_records', 'ns_records', 'http_status_code', 'http_headers', 'redirect_url',
+    'server_software', 'technologies', 'ssl_valid', 'ssl_issuer', 'ssl_expiry_date',
+    'page_title', 'meta_description', 'page_size', 'load_time', 'probe_timings', 'error_message',
+]
+
+# Campos de texto que no admiten NULL
+_TEXT_FIELDS = {
+    'ip_address', 'redirect_url', 'server_software', 'ssl_issuer', 'page_title',
+    'meta_description', 'error_message',
+}
+
+
+def apply_result(tracker, result):
+    """Copia el resultado de ``track_website`` al ``WebsiteTracker`` (sin guardarlo)"""
+    for field in TRACKER_FIELDS:
+        value = result[field]
+        if field in _TEXT_FIELDS:
+            value = value or ''
+        setattr(tracker, field, value)
+    return tracker
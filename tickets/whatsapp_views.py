@@ -0,0 +1,293 @@
+"""
+Vistas de WhatsApp: conexiones, palabras clave y mensajes.
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+from django.core.paginator import Paginator
+from .models import WhatsAppConnection, WhatsAppKeyword, WhatsAppMessage
+
+
+# ==================== VISTAS DE WHATSAPP ====================
+
+@login_required
+def whatsapp_dashboard(request):
+    """Dashboard principal de WhatsApp"""
+    connection, created = WhatsAppConnection.objects.get_or_create(
+        user=request.user,
+        defaults={'status': 'disconnected'}
+    )
+    
+    keywords = WhatsAppKeyword.objects.filter(connection=connection).order_by('-priority', 'keyword')
+    recent_messages = WhatsAppMessage.objects.filter(connection=connection).order_by('-timestamp')[:20]
+    
+    # Estadísticas
+    total_messages = WhatsAppMessage.objects.filter(connection=connection).count()
+    auto_replies = WhatsAppMessage.objects.filter(connection=connection, message_type='auto_reply').count()
+    total_keywords = keywords.count()
+    active_keywords = keywords.filter(is_active=True).count()
+    
+    context = {
+        'connection': connection,
+        'keywords': keywords,
+        'recent_messages': recent_messages,
+        'total_messages': total_messages,
+        'auto_replies': auto_replies,
+        'total_keywords': total_keywords,
+        'active_keywords': active_keywords,
+        'page_title': 'WhatsApp - Dashboard'
+    }
+    return render(request, 'tickets/whatsapp_dashboard.html', context)
+
+
+@login_required
+def whatsapp_keyword_create(request):
+    """Crear nueva palabra clave"""
+    connection = WhatsAppConnection.objects.get_or_create(user=request.user)[0]
+    
+    if request.method == 'POST':
+        keyword = request.POST.get('keyword')
+        response = request.POST.get('response')
+        is_exact_match = request.POST.get('is_exact_match') == 'on'
+        is_case_sensitive = request.POST.get('is_case_sensitive') == 'on'
+        priority = int(request.POST.get('priority', 0))
+        
+        WhatsAppKeyword.objects.create(
+            connection=connection,
+            keyword=keyword,
+            response=response,
+            is_exact_match=is_exact_match,
+            is_case_sensitive=is_case_sensitive,
+            priority=priority
+        )
+        
+        messages.success(request, f'Palabra clave "{keyword}" creada exitosamente')
+        return redirect('whatsapp_dashboard')
+    
+    context = {
+        'connection': connection,
+        'page_title': 'Nueva Palabra Clave'
+    }
+    return render(request, 'tickets/whatsapp_keyword_form.html', context)
+
+
+@login_required
+def whatsapp_keyword_edit(request, pk):
+    """Editar palabra clave"""
+    keyword = get_object_or_404(WhatsAppKeyword, pk=pk, connection__user=request.user)
+    
+    if request.method == 'POST':
+        keyword.keyword = request.POST.get('keyword')
+        keyword.response = request.POST.get('response')
+        keyword.is_exact_match = request.POST.get('is_exact_match') == 'on'
+        keyword.is_case_sensitive = request.POST.get('is_case_sensitive') == 'on'
+        keyword.priority = int(request.POST.get('priority', 0))
+        keyword.is_active = request.POST.get('is_active') == 'on'
+        keyword.save()
+        
+        messages.success(request, 'Palabra clave actualizada exitosamente')
+        return redirect('whatsapp_dashboard')
+    
+    context = {
+        'keyword': keyword,
+        'page_title': 'Editar Palabra Clave'
+    }
+    return render(request, 'tickets/whatsapp_keyword_form.html', context)
+
+
+@login_required
+def whatsapp_keyword_delete(request, pk):
+    """Eliminar palabra clave"""
+    keyword = get_object_or_404(WhatsAppKeyword, pk=pk, connection__user=request.user)
+    
+    if request.method == 'POST':
+        keyword.delete()
+        messages.success(request, 'Palabra clave eliminada exitosamente')
+        return redirect('whatsapp_dashboard')
+    
+    context = {
+        'keyword': keyword,
+        'page_title': 'Eliminar Palabra Clave'
+    }
+    return render(request, 'tickets/whatsapp_keyword_delete.html', context)
+
+
+@login_required
+def whatsapp_connect(request):
+    """Iniciar conexión de WhatsApp con servidor Node.js"""
+    import requests
+    
+    connection = WhatsAppConnection.objects.get_or_create(user=request.user)[0]
+    
+    try:
+        # Llamar al servidor Node.js para iniciar conexión
+        response = requests.post('http://localhost:3000/connect', 
+            json={'user_id': request.user.id},
+            timeout=10
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            connection.status = data.get('status', 'connecting')
+            connection.qr_code = data.get('qr', '')
+            connection.save()
+            
+            # Manejar diferentes respuestas del servidor
+            if data.get('already_connected'):
+                messages.success(request, '✅ Ya estás conectado a WhatsApp')
+            elif data.get('already_connecting'):
+                messages.info(request, '⏳ Conexión en proceso. Escanea el código QR para continuar')
+            elif data.get('already_exists'):
+                messages.info(request, f"ℹ️ {data.get('message', 'Cliente existente')}")
+            elif data.get('qr'):
+                messages.success(request, '✅ Escanea el código QR con tu WhatsApp')
+            else:
+                messages.info(request, f"ℹ️ {data.get('message', 'Conexión iniciada')}")
+        else:
+            connection.status = 'error'
+            connection.save()
+            messages.error(request, f'❌ Error al conectar: {response.text}')
+            
+    except requests.exceptions.ConnectionError:
+        connection.status = 'error'
+        connection.save()
+        messages.error(request, '❌ No se pudo conectar al servidor WhatsApp. Asegúrate de que esté ejecutándose en http://localhost:3000')
+    except Exception as e:
+        connection.status = 'error'
+        connection.save()
+        messages.error(request, f'❌ Error inesperado: {str(e)}')
+    
+    return redirect('whatsapp_dashboard')
+
+
+@login_required
+def whatsapp_disconnect(request):
+    """Desconectar WhatsApp del servidor Node.js"""
+    import requests
+    
+    connection = WhatsAppConnection.objects.get_or_create(user=request.user)[0]
+    
+    try:
+        # Llamar al servidor Node.js para desconectar
+        response = requests.post('http://localhost:3000/disconnect',
+            json={'user_id': request.user.id},
+            timeout=10
+        )
+        
+        if response.status_code == 200:
+            connection.status = 'disconnected'
+            connection.qr_code = None
+            connection.phone_number = None
+            connection.save()
+            messages.success(request, '✅ Desconectado de WhatsApp exitosamente')
+        else:
+            messages.error(request, f'❌ Error al desconectar: {response.text}')
+            
+    except requests.exceptions.ConnectionError:
+        # Si el servidor no responde, marcar como desconectado de todas formas
+        connection.status = 'disconnected'
+        connection.qr_code = None
+        connection.phone_number = None
+        connection.save()
+        messages.warning(request, '⚠️ Servidor WhatsApp no disponible. Conexión marcada como desconectada.')
+    except Exception as e:
+        messages.error(request, f'❌ Error inesperado: {str(e)}')
+    
+    return redirect('whatsapp_dashboard')
+
+
+@login_required
+def whatsapp_simulate_connection(request):
+    """Simular conexión exitosa (solo para demostración)"""
+    connection = WhatsAppConnection.objects.get_or_create(user=request.user)[0]
+    connection.status = 'connected'
+    connection.qr_code = None
+    connection.save()
+    
+    # Crear mensaje de demostración
+    WhatsAppMessage.objects.create(
+        connection=connection,
+        sender_number='+1234567890',
+        message_text='Este es un mensaje de demostración del sistema',
+        message_type='received'
+    )
+    
+    messages.success(request, '✅ Conexión simulada exitosamente (modo demostración)')
+    return redirect('whatsapp_dashboard')
+
+
+@login_required
+def whatsapp_status(request):
+    """Obtener estado actual de la conexión (para AJAX polling)"""
+    import requests
+    from django.http import JsonResponse
+    
+    connection = WhatsAppConnection.objects.get_or_create(user=request.user)[0]
+    
+    try:
+        # Consultar estado en el servidor Node.js
+        response = requests.get(f'http://localhost:3000/status/{request.user.id}', timeout=5)
+        
+        if response.status_code == 200:
+            data = response.json()
+            
+            # Actualizar estado en la base de datos
+            connection.status = data.get('status', 'disconnected')
+            connection.qr_code = data.get('qr', '')
+            
+            # Si está conectado, obtener información del usuario
+            if connection.status == 'connected' and not connection.phone_number:
+                try:
+                    info_response = requests.get(f'http://localhost:3000/info/{request.user.id}', timeout=5)
+                    if info_response.status_code == 200:
+                        info_data = info_response.json()
+                        if info_data.get('status') == 'connected' and info_data.get('info'):
+                            connection.phone_number = info_data['info'].get('phone', '')
+                except:
+                    pass
+            
+            connection.save()
+            
+            return JsonResponse({
+                'status': connection.status,
+                'qr_code': connection.qr_code,
+                'phone_number': connection.phone_number,
+                'has_client': data.get('has_client', False)
+            })
+        else:
+            return JsonResponse({
+                'status': 'error',
+                'error': 'Error al consultar servidor'
+            }, status=500)
+            
+    except requests.exceptions.ConnectionError:
+        connection.status = 'error'
+        connection.save()
+        return JsonResponse({
+            'status': 'error',
+            'error': 'Servidor WhatsApp no disponible'
+        }, status=503)
+    except Exception as e:
+        return JsonResponse({
+            'status': 'error',
+            'error': str(e)
+        }, status=500)
+
+
+@login_required
+def whatsapp_messages(request):
+    """Ver historial de mensajes"""
+    connection = WhatsAppConnection.objects.get_or_create(user=request.user)[0]
+    messages_list = WhatsAppMessage.objects.filter(connection=connection).order_by('-timestamp')
+    
+    # Paginación
+    paginator = Paginator(messages_list, 50)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'connection': connection,
+        'page_obj': page_obj,
+        'page_title': 'Mensajes WhatsApp'
+    }
+    return render(request, 'tickets/whatsapp_messages.html', context)